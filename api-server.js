@@ -1,7 +1,36 @@
 import express from 'express';
 import cors from 'cors';
+import { Readable, pipeline } from 'stream';
 import { createClient } from '@supabase/supabase-js';
 import dotenv from 'dotenv';
+import { createResponseCache, cacheResponse } from './server/responseCache.js';
+import {
+  hasListParams,
+  parseListQuery,
+  applyListQuery,
+  applyListQueryToRows,
+  buildListPage,
+  ListQueryError
+} from './src/shared/lib/listQuery.js';
+import { GROWTH_PERIODS, getOrBuildGrowthReport } from './src/shared/lib/growthReport.js';
+import { EXPORT_FORMATS, createExportCheckpoints, sendExport, zipStream } from './server/exportStream.js';
+import { createPdfWorkerPool } from './server/pdfWorkerPool.js';
+import { createDraftRouter } from './server/formDrafts.js';
+import { PDF_TEMPLATES } from './src/shared/lib/pdfTemplates.js';
+import {
+  createKeyRing,
+  createSessionTokens,
+  parseSigningKeys,
+  authenticate,
+  requireAuth
+} from './server/sessionTokens.js';
+import {
+  clientIp,
+  createGeoResolver,
+  createTelemetryQueue,
+  loadGeoDatabase,
+  sanitizeLoginEvent
+} from './server/loginTelemetry.js';
 
 // Load environment variables
 dotenv.config();
@@ -23,7 +52,129 @@ const serviceSupabase = createClient(
 
 // Middleware
 app.use(cors());
-app.use(express.json());
+// PDF routes parse their own, larger request bodies
+const jsonBody = express.json();
+app.use((req, res, next) => (req.path.startsWith('/api/pdf/') ? next() : jsonBody(req, res, next)));
+
+// Signed session tokens (see server/sessionTokens.js); every route gets req.principal
+const sessionTokens = createSessionTokens({
+  keyRing: createKeyRing(parseSigningKeys(process.env.SESSION_SIGNING_KEYS)),
+  ttl: (parseInt(process.env.SESSION_TOKEN_TTL_HOURS) || 24) * 60 * 60 * 1000
+});
+app.use(authenticate(sessionTokens));
+
+// Roles for routes limited beyond "signed in" (see requireAuth)
+const ADMIN_ROLES = ['Super Admin', 'Operations Head'];
+const HR_ROLES = [...ADMIN_ROLES, 'HR'];
+const ACCOUNTS_ROLES = [...ADMIN_ROLES, 'Accounts'];
+const MANAGER_ROLES = [...HR_ROLES, 'Manager', 'Team Lead', 'Web Head'];
+
+// req.ip honours X-Forwarded-For only from trusted proxies (loopback by default)
+app.set('trust proxy', process.env.TRUST_PROXY || 'loopback');
+
+// Login telemetry: located from a local IP database and inserted in batches
+const geoResolver = createGeoResolver({ cacheSize: parseInt(process.env.GEOIP_CACHE_SIZE) || 5000 });
+if (process.env.GEOIP_DB_PATH) {
+  loadGeoDatabase(process.env.GEOIP_DB_PATH)
+    .then(database => {
+      geoResolver.setDatabase(database);
+      console.log(`GeoIP database loaded (${database.size} ranges)`);
+    })
+    .catch(error => console.error('GeoIP database failed to load:', error.message));
+}
+const loginTelemetry = createTelemetryQueue({
+  prepare: (row) => ({ ...row, location_data: geoResolver.resolve(row.ip_address) }),
+  write: async (rows) => {
+    const { error } = await serviceSupabase.from('login_tracking').insert(rows);
+    if (error) throw error;
+  }
+});
+
+// Read cache for list endpoints that dashboards poll
+const responseCache = createResponseCache({
+  maxEntries: parseInt(process.env.API_CACHE_MAX_ENTRIES) || 500,
+  maxBytes: (parseInt(process.env.API_CACHE_MAX_MB) || 32) * 1024 * 1024,
+  defaultTtl: (parseInt(process.env.API_CACHE_TTL_SECONDS) || 60) * 1000
+});
+// Cache variants for responses that depend on who is asking
+const byRole = (req) => req.principal?.role;
+const byPrincipal = (req) => req.principal?.id;
+
+// List query specs for ?fields=&filter[...]=&q=&sort=&after=&limit= (see src/shared/lib/listQuery.js)
+const EMPLOYEE_LIST_SPEC = {
+  fields: ['id', 'user_id', 'name', 'email', 'phone', 'role', 'user_category', 'department', 'employee_id', 'hire_date', 'employment_type', 'status', 'dashboard_access', 'created_at', 'updated_at'],
+  defaultFields: ['id', 'user_id', 'name', 'email', 'phone', 'role', 'user_category', 'department', 'employee_id', 'status', 'created_at'],
+  filters: ['role', 'user_category', 'department', 'employment_type', 'status', 'hire_date', 'created_at'],
+  sortable: ['name', 'email', 'role', 'department', 'hire_date', 'created_at', 'updated_at'],
+  searchColumns: ['name', 'email', 'department', 'role'],
+  defaultSort: 'name'
+};
+
+const CLIENT_LIST_SPEC = {
+  fields: ['id', 'name', 'client_type', 'team', 'scope_of_work', 'services', 'status', 'contact_email', 'contact_phone', 'contact_person', 'contract_start_date', 'contract_end_date', 'monthly_retainer', 'industry', 'company_size', 'priority_level', 'website_url', 'logo_url', 'created_at', 'updated_at'],
+  filters: ['client_type', 'team', 'status', 'industry', 'company_size', 'priority_level', 'contract_start_date', 'contract_end_date', 'created_at'],
+  sortable: ['name', 'client_type', 'team', 'status', 'priority_level', 'monthly_retainer', 'contract_start_date', 'created_at', 'updated_at'],
+  searchColumns: ['name', 'contact_person', 'contact_email', 'industry'],
+  defaultSort: 'name'
+};
+
+const LEAD_LIST_SPEC = {
+  fields: ['id', 'company', 'contact_person', 'email', 'status', 'value', 'created_at'],
+  filters: ['status', 'value', 'created_at'],
+  sortable: ['company', 'status', 'value', 'created_at'],
+  searchColumns: ['company', 'contact_person', 'email'],
+  defaultSort: '-created_at'
+};
+
+const SUBMISSION_LIST_SPEC = {
+  fields: ['id', 'user_id', 'submission_month', 'form_type', 'status', 'submitted_at', 'reviewed_by', 'reviewed_at', 'reviewer_comments', 'form_data', 'created_at', 'updated_at'],
+  defaultFields: ['id', 'user_id', 'submission_month', 'form_type', 'status', 'submitted_at', 'reviewed_by', 'reviewed_at', 'reviewer_comments', 'created_at'],
+  filters: ['user_id', 'form_type', 'status', 'department', 'submission_month', 'submitted_at', 'created_at'],
+  sortable: ['submission_month', 'submitted_at', 'created_at'],
+  defaultSort: 'id'
+};
+
+// Datasets served by /api/exports/:dataset, in key order unless sorted.
+// Exports read with the service client: `roles` may export every row, and
+// other callers get only their own rows by `ownerColumn` (or a 403 without one).
+const EXPORT_DATASETS = {
+  employees: {
+    table: 'unified_users',
+    spec: { ...EMPLOYEE_LIST_SPEC, defaultSort: 'id' },
+    scope: (query) => query.neq('role', 'Client'),
+    roles: HR_ROLES
+  },
+  clients: {
+    table: 'clients',
+    spec: { ...CLIENT_LIST_SPEC, defaultSort: 'id' }
+  },
+  submissions: {
+    table: 'monthly_form_submissions',
+    spec: SUBMISSION_LIST_SPEC,
+    roles: MANAGER_ROLES,
+    ownerColumn: 'user_id'
+  }
+};
+
+// Serve one page of a table through the list query contract
+async function sendListPage(res, client, table, spec, query, scope = (q) => q) {
+  const parsed = parseListQuery(query, spec);
+  const { data, error, count } = await applyListQuery(scope(client.from(table)), parsed);
+
+  if (error) {
+    return res.status(500).json({ error: error.message });
+  }
+
+  return res.json(buildListPage(data || [], parsed, count ?? null));
+}
+
+function sendListQueryError(res, error) {
+  if (error instanceof ListQueryError) {
+    res.status(error.status).json({ error: error.message });
+    return true;
+  }
+  return false;
+}
 
 // Hardcoded fallback users for when database is unavailable
 const FALLBACK_USERS = [
@@ -85,7 +236,7 @@ const FALLBACK_USERS = [
   }
 ];
 
-// Function to normalize phone number
+// Function to normalize phone number (public.normalize_login_phone applies the same rules in SQL)
 function normalizePhoneNumber(phone) {
   if (!phone) return '';
   return phone.replace(/^\+91-?/, '').replace(/[\s\-\(\)]/g, '').replace(/^0/, '');
@@ -130,26 +281,19 @@ app.post('/api/auth/login', async (req, res) => {
       // Try database first
       try {
         if (serviceSupabase) {
-          const normalizedPhone = normalizePhoneNumber(phone);
-          
-          const { data: users, error: searchError } = await serviceSupabase
-            .from('unified_users')
-            .select('*')
-            .ilike('name', `%${firstName}%`)
-            .eq('status', 'active');
-            
-          if (!searchError && users && users.length > 0) {
-            matchingUser = users.find(user => {
-              const userFirstName = user.name.split(' ')[0].toLowerCase();
-              const inputFirstName = firstName.toLowerCase();
-              const userPhone = normalizePhoneNumber(user.phone);
-              
-              return userFirstName === inputFirstName && userPhone === normalizedPhone;
+          // Single-row lookup on the normalized-phone and first-name indexes
+          const { data: rows, error: searchError } = await serviceSupabase
+            .rpc('authenticate_unified_user', {
+              login_first_name: firstName.trim(),
+              login_phone: phone
             });
-            
-            if (matchingUser) {
-              console.log('Database auth successful for:', matchingUser.name);
-            }
+
+          if (searchError) throw searchError;
+
+          const row = rows && rows[0];
+          if (row && row.authentication_success) {
+            matchingUser = { ...row, id: row.user_id };
+            console.log('Database auth successful for:', matchingUser.name);
           }
         }
       } catch (dbError) {
@@ -175,8 +319,10 @@ app.post('/api/auth/login', async (req, res) => {
       
       console.log(`${usingFallback ? 'Fallback' : 'Database'} auth successful for:`, matchingUser.name);
       
+      const session = sessionTokens.issue(matchingUser);
       return res.json({
-        token: `bearer_${matchingUser.id}`,
+        token: session.token,
+        expires_at: session.expiresAt,
         user: {
           id: matchingUser.id,
           name: matchingUser.name,
@@ -239,8 +385,10 @@ app.post('/api/auth/login', async (req, res) => {
     }
     
     // Return user data with token
+    const session = sessionTokens.issue(user);
     res.json({
-      token: `bearer_${user.id}`,
+      token: session.token,
+      expires_at: session.expiresAt,
       user: {
         id: user.id,
         email: user.email,
@@ -258,13 +406,9 @@ app.post('/api/auth/login', async (req, res) => {
 // Logout endpoint
 app.post('/api/auth/logout', async (req, res) => {
   try {
-    const authHeader = req.headers.authorization;
-    const token = authHeader && authHeader.split(' ')[1]; // Bearer TOKEN
-    
-    if (token) {
-      // In a real implementation, you would invalidate the token in the database
-      // For now, we'll just return success since the frontend handles token removal
-      console.log('Logout request for token:', token.substring(0, 10) + '...');
+    // The token stays valid for its signature, so it is refused by id until it expires
+    if (req.principal) {
+      sessionTokens.revoke(req.principal.claims);
     }
     
     res.json({ success: true, message: 'Logged out successfully' });
@@ -274,15 +418,41 @@ app.post('/api/auth/logout', async (req, res) => {
   }
 });
 
+// Login telemetry from the browser; accepted at once and written in the background
+const MAX_TELEMETRY_EVENTS = 50;
+
+app.post('/api/telemetry/logins', (req, res) => {
+  const events = Array.isArray(req.body?.events) ? req.body.events : [];
+  if (events.length === 0 || events.length > MAX_TELEMETRY_EVENTS) {
+    return res.status(400).json({ error: `Send between 1 and ${MAX_TELEMETRY_EVENTS} events` });
+  }
+
+  const ip = clientIp(req);
+  const userAgent = (req.headers['user-agent'] || '').slice(0, 500) || null;
+  let accepted = 0;
+  events.forEach(event => {
+    const row = sanitizeLoginEvent(event);
+    if (row && loginTelemetry.push({ ...row, ip_address: ip, user_agent: userAgent })) accepted++;
+  });
+
+  res.status(202).json({ accepted });
+});
+
+// Current principal, straight from the verified token
+app.get('/api/auth/session', requireAuth(), (req, res) => {
+  const { claims, ...principal } = req.principal;
+  res.json({ principal });
+});
+
 // Employees API endpoints
-app.get('/api/employees', async (req, res) => {
+app.get('/api/employees', requireAuth(), cacheResponse(responseCache, { tags: ['employees'], vary: byRole }), async (req, res) => {
   try {
-    // Use service role client to bypass RLS for employee queries
-    const serviceSupabase = createClient(
-      process.env.VITE_SUPABASE_URL,
-      process.env.VITE_ADMIN_ACCESS_TOKEN
-    );
-    
+    // Use global service role client to bypass RLS for employee queries
+    if (hasListParams(req.query)) {
+      return await sendListPage(res, serviceSupabase, 'unified_users', EMPLOYEE_LIST_SPEC, req.query,
+        (query) => query.neq('role', 'Client'));
+    }
+
     const { data: employees, error } = await serviceSupabase
       .from('unified_users')
       .select('*')
@@ -294,12 +464,13 @@ app.get('/api/employees', async (req, res) => {
     
     res.json(employees || []);
   } catch (error) {
+    if (sendListQueryError(res, error)) return;
     console.error('Employees fetch error:', error);
     res.status(500).json({ error: 'Internal server error' });
   }
 });
 
-app.post('/api/employees', async (req, res) => {
+app.post('/api/employees', requireAuth(HR_ROLES), async (req, res) => {
   try {
     const employeeData = req.body;
     console.log('[DEBUG] Employee creation request:', employeeData);
@@ -318,6 +489,7 @@ app.post('/api/employees', async (req, res) => {
     }
     
     console.log('[DEBUG] Employee created successfully:', employee);
+    responseCache.invalidateTags('employees');
     res.status(201).json(employee);
   } catch (error) {
     console.error('Employee creation error:', error);
@@ -326,7 +498,7 @@ app.post('/api/employees', async (req, res) => {
 });
 
 // Workspaces API endpoints
-app.get('/api/workspaces', async (req, res) => {
+app.get('/api/workspaces', requireAuth(), async (req, res) => {
   try {
     // Mock workspace data since this table might not exist
     const workspaces = [
@@ -352,7 +524,7 @@ app.get('/api/workspaces', async (req, res) => {
 });
 
 // Live Data API endpoints
-app.get('/api/live-data', async (req, res) => {
+app.get('/api/live-data', requireAuth(), async (req, res) => {
   try {
     const liveData = {
       status: 'active',
@@ -375,8 +547,12 @@ app.get('/api/live-data', async (req, res) => {
 });
 
 // Client API endpoints
-app.get('/api/clients', async (req, res) => {
+app.get('/api/clients', requireAuth(), cacheResponse(responseCache, { tags: ['clients'], vary: byRole }), async (req, res) => {
   try {
+    if (hasListParams(req.query)) {
+      return await sendListPage(res, supabase, 'clients', CLIENT_LIST_SPEC, req.query);
+    }
+
     const { data: clients, error } = await supabase
       .from('clients')
       .select('*');
@@ -387,12 +563,13 @@ app.get('/api/clients', async (req, res) => {
     
     res.json(clients || []);
   } catch (error) {
+    if (sendListQueryError(res, error)) return;
     console.error('Clients fetch error:', error);
     res.status(500).json({ error: 'Internal server error' });
   }
 });
 
-app.post('/api/clients', async (req, res) => {
+app.post('/api/clients', requireAuth(), async (req, res) => {
   try {
     const clientData = req.body;
     console.log('[DEBUG] Client creation request:', clientData);
@@ -410,6 +587,7 @@ app.post('/api/clients', async (req, res) => {
     }
     
     console.log('[DEBUG] Client created successfully:', client);
+    responseCache.invalidateTags('clients');
     res.status(201).json(client);
   } catch (error) {
     console.error('Client creation error:', error);
@@ -418,7 +596,7 @@ app.post('/api/clients', async (req, res) => {
 });
 
 // Reports API endpoints
-app.get('/api/reports/monthly-tactical', async (req, res) => {
+app.get('/api/reports/monthly-tactical', requireAuth(), async (req, res) => {
   try {
     // Mock report data
     const report = {
@@ -447,7 +625,7 @@ app.get('/api/reports/monthly-tactical', async (req, res) => {
   }
 });
 
-app.get('/api/reports/quarterly-strategic', async (req, res) => {
+app.get('/api/reports/quarterly-strategic', requireAuth(), async (req, res) => {
   try {
     // Mock strategic report data
     const report = {
@@ -477,13 +655,314 @@ app.get('/api/reports/quarterly-strategic', async (req, res) => {
   }
 });
 
+// Growth report endpoint
+// Builds from the requested period only and reuses the stored report while
+// the underlying KPI and submission rows are unchanged (see growthReport.js).
+app.get('/api/reports/growth', requireAuth(), cacheResponse(responseCache, { tags: ['growth-reports'], vary: byPrincipal }), async (req, res) => {
+  try {
+    const {
+      user_id: userId,
+      role,
+      name,
+      period = '6months',
+      report_type: reportType = 'individual'
+    } = req.query;
+    // The report is read and stored with the service client, so who may ask
+    // for whose report is decided here; reports are filed under the caller
+    const generatedBy = req.principal.id;
+
+    if (!userId) {
+      return res.status(400).json({ error: 'user_id is required' });
+    }
+    if (!GROWTH_PERIODS[period]) {
+      return res.status(400).json({ error: `period must be one of ${Object.keys(GROWTH_PERIODS).join(', ')}` });
+    }
+    if (!['individual', 'team', 'department'].includes(reportType)) {
+      return res.status(400).json({ error: 'report_type must be individual, team or department' });
+    }
+    const forSelf = String(userId) === String(req.principal.id) && reportType === 'individual';
+    if (!forSelf && !MANAGER_ROLES.includes(req.principal.role)) {
+      return res.status(403).json({ error: 'Only managers can open reports for other users, teams or departments' });
+    }
+
+    const result = await getOrBuildGrowthReport(serviceSupabase, {
+      user: { user_id: userId, name, role },
+      reportType,
+      period,
+      generatedBy
+    });
+
+    res.json({
+      data: result.report,
+      data_version: result.dataVersion,
+      cached: result.cached
+    });
+  } catch (error) {
+    console.error('Growth report error:', error);
+    res.status(500).json({ error: 'Internal server error' });
+  }
+});
+
+// Export endpoints
+// Streams every matching row as CSV (gzip when accepted) or XLSX. Accepts the
+// list contract's fields, filter[...], q, sort and after params. A CSV export
+// answers with X-Export-Id; after a dropped connection,
+// ?resume=<id>&offset=<bytes received> continues from the last page boundary
+// at or before offset, which comes back as X-Export-Offset. The client keeps
+// that many bytes of what it has and appends the new response.
+//
+// Browsers cannot send the session header on a plain download, so
+// POST /api/exports/:dataset/links registers the export for the caller and
+// returns a link under /api/exports/files/. The unguessable export id is the
+// credential; it expires with the export's checkpoints.
+const exportCheckpoints = createExportCheckpoints();
+
+// What the caller may export, or null after sending the error
+const exportRequestFor = (req, res) => {
+  const dataset = EXPORT_DATASETS[req.params.dataset];
+  if (!dataset) {
+    res.status(404).json({ error: `Unknown export dataset. Available: ${Object.keys(EXPORT_DATASETS).join(', ')}` });
+    return null;
+  }
+  const allRows = !dataset.roles || dataset.roles.includes(req.principal.role);
+  if (!allRows && !dataset.ownerColumn) {
+    res.status(403).json({ error: 'Insufficient permissions' });
+    return null;
+  }
+
+  const { format = 'csv', header, resume: _resume, offset: _offset, ...params } = req.query;
+  const request = {
+    dataset: req.params.dataset,
+    params,
+    header: header !== 'false',
+    format: String(format).toLowerCase(),
+    owner: req.principal.id,
+    rowsOf: allRows ? null : String(req.principal.id)
+  };
+  if (!EXPORT_FORMATS[request.format]) {
+    res.status(400).json({ error: `format must be one of ${Object.keys(EXPORT_FORMATS).join(', ')}` });
+    return null;
+  }
+  return request;
+};
+
+// Stream an export from its start, or from a checkpoint when resuming
+function streamExport(req, res, { request, exportId = null, checkpoint = null }) {
+  const dataset = EXPORT_DATASETS[request.dataset];
+  const { after, ...params } = request.params;
+  const cursor = checkpoint ? checkpoint.cursor : after;
+  const startBytes = checkpoint ? checkpoint.bytes : 0;
+  const parsed = parseListQuery(cursor ? { ...params, after: cursor } : params, dataset.spec);
+  const columns = [...new Set([parsed.key, ...(parsed.fields || dataset.spec.fields)])];
+  const scope = (query) => {
+    const scoped = dataset.scope ? dataset.scope(query) : query;
+    return request.rowsOf === null ? scoped : scoped.eq(dataset.ownerColumn, request.rowsOf);
+  };
+
+  if (request.format === 'csv' && !exportId) {
+    exportId = exportCheckpoints.create(request);
+  }
+
+  sendExport(req, res, {
+    buildFrom: () => scope(serviceSupabase.from(dataset.table)),
+    parsed: { ...parsed, fields: columns },
+    columns,
+    format: request.format,
+    filename: `${request.dataset}-${new Date().toISOString().slice(0, 10)}`,
+    header: request.header && startBytes === 0,
+    checkpoints: exportCheckpoints,
+    exportId,
+    offset: startBytes
+  });
+}
+
+const sendExportError = (res, error) => {
+  if (sendListQueryError(res, error)) return;
+  console.error('Export error:', error);
+  res.status(500).json({ error: 'Internal server error' });
+};
+
+app.get('/api/exports/files/:exportId', (req, res) => {
+  try {
+    const opened = exportCheckpoints.open(req.params.exportId, Math.max(0, parseInt(req.query.offset) || 0));
+    if (!opened) {
+      return res.status(404).json({ error: 'Export not found or expired; start it again' });
+    }
+    streamExport(req, res, { ...opened, exportId: req.params.exportId });
+  } catch (error) {
+    sendExportError(res, error);
+  }
+});
+
+app.post('/api/exports/:dataset/links', requireAuth(), (req, res) => {
+  try {
+    const request = exportRequestFor(req, res);
+    if (!request) return;
+    // Reject a bad query now rather than on the download
+    parseListQuery(request.params, EXPORT_DATASETS[request.dataset].spec);
+
+    const exportId = exportCheckpoints.create(request);
+    res.status(201).json({ exportId, url: `/api/exports/files/${exportId}` });
+  } catch (error) {
+    sendExportError(res, error);
+  }
+});
+
+app.get('/api/exports/:dataset', requireAuth(), (req, res) => {
+  try {
+    const { resume, offset } = req.query;
+    if (resume) {
+      const resumed = exportCheckpoints.resume(String(resume), Math.max(0, parseInt(offset) || 0), {
+        dataset: req.params.dataset,
+        owner: req.principal.id
+      });
+      if (!resumed) {
+        return res.status(404).json({ error: 'Export not found or expired; start it again' });
+      }
+      return streamExport(req, res, { ...resumed, exportId: String(resume) });
+    }
+
+    const request = exportRequestFor(req, res);
+    if (!request) return;
+    streamExport(req, res, { request });
+  } catch (error) {
+    sendExportError(res, error);
+  }
+});
+
+// PDF endpoints
+// Reports render on a worker-thread pool so large batches never block the
+// event loop. Batches stream back as a ZIP as each document finishes, in
+// request order; a document that fails to render is listed in errors.txt.
+const pdfPool = createPdfWorkerPool();
+const PDF_BATCH_LIMIT = 500;
+const pdfBody = express.json({ limit: '5mb' });
+
+const pdfTemplateFor = (req, res) => {
+  const { template } = req.params;
+  if (!PDF_TEMPLATES.includes(template)) {
+    res.status(404).json({ error: `Unknown PDF template. Available: ${PDF_TEMPLATES.join(', ')}` });
+    return null;
+  }
+  return template;
+};
+
+const safeFilename = (name, fallback) =>
+  String(name || fallback).replace(/[^\w.-]+/g, '_').replace(/^\.+/, '') || fallback;
+
+app.post('/api/pdf/:template', requireAuth(), pdfBody, async (req, res) => {
+  const template = pdfTemplateFor(req, res);
+  if (!template) return;
+
+  try {
+    const pdf = await pdfPool.render(template, req.body);
+    res.set('Content-Type', 'application/pdf');
+    res.set('Content-Disposition', `attachment; filename="${template}.pdf"`);
+    res.send(pdf);
+  } catch (error) {
+    console.error('PDF render error:', error);
+    res.status(500).json({ error: 'Failed to render PDF' });
+  }
+});
+
+app.post('/api/pdf/:template/batch', requireAuth(), pdfBody, (req, res) => {
+  const template = pdfTemplateFor(req, res);
+  if (!template) return;
+
+  const { items } = req.body || {};
+  if (!Array.isArray(items) || items.length === 0) {
+    return res.status(400).json({ error: 'items must be a non-empty array of { filename, data }' });
+  }
+  if (items.length > PDF_BATCH_LIMIT) {
+    return res.status(400).json({ error: `At most ${PDF_BATCH_LIMIT} items per batch` });
+  }
+
+  const seen = new Set();
+  const named = items.map((item, index) => {
+    let filename = safeFilename(item?.filename, `${template}-${index + 1}.pdf`);
+    if (!filename.toLowerCase().endsWith('.pdf')) filename += '.pdf';
+    if (seen.has(filename)) filename = filename.replace(/\.pdf$/i, `-${index + 1}.pdf`);
+    seen.add(filename);
+    return { filename, data: item?.data };
+  });
+
+  async function* entries() {
+    const errors = [];
+    for await (const result of pdfPool.renderAll(template, named)) {
+      if (result.error) {
+        errors.push(`${result.filename}: ${result.error.message}`);
+        continue;
+      }
+      yield { name: result.filename, source: [result.buffer] };
+    }
+    if (errors.length > 0) {
+      yield { name: 'errors.txt', source: [errors.join('\n') + '\n'] };
+    }
+  }
+
+  res.set('Content-Type', 'application/zip');
+  res.set('Content-Disposition', `attachment; filename="${template}-${new Date().toISOString().slice(0, 10)}.zip"`);
+  pipeline(Readable.from(zipStream(entries())), res, (error) => {
+    if (error && error.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      console.error('PDF batch error:', error);
+    }
+  });
+});
+
+// Leaderboard API endpoint
+// Reads the materialized leaderboard_rankings table, so the cost is the same
+// whatever the headcount. Pass employee_id for "my rank plus neighbours".
+app.get('/api/leaderboard', requireAuth(), cacheResponse(responseCache, { tags: ['leaderboard'], ttl: 30 * 1000 }), async (req, res) => {
+  try {
+    const { month, department, employee_id: employeeId } = req.query;
+
+    if (month && !/^\d{4}-\d{2}$/.test(month)) {
+      return res.status(400).json({ error: 'month must be in YYYY-MM format' });
+    }
+
+    const limit = Math.min(Math.max(parseInt(req.query.limit) || 10, 1), 100);
+    const parsedRadius = parseInt(req.query.radius);
+    const radius = Math.min(Math.max(Number.isNaN(parsedRadius) ? 2 : parsedRadius, 0), 25);
+    const scope = {
+      p_month_key: month || null,
+      p_department: department || null
+    };
+
+    const { data, error } = employeeId
+      ? await serviceSupabase.rpc('get_leaderboard_neighbours', { ...scope, p_employee_id: String(employeeId), p_radius: radius })
+      : await serviceSupabase.rpc('get_leaderboard_top', { ...scope, p_limit: limit });
+
+    if (error) {
+      return res.status(500).json({ error: error.message });
+    }
+
+    const rows = data || [];
+    res.json({
+      month: rows[0]?.month_key || month || null,
+      department: department || null,
+      data: rows
+    });
+  } catch (error) {
+    console.error('Leaderboard fetch error:', error);
+    res.status(500).json({ error: 'Internal server error' });
+  }
+});
+
+// Form draft endpoints (see server/formDrafts.js); drafts belong to the signed-in principal
+app.use('/api/drafts', createDraftRouter(serviceSupabase));
+
 // Health check endpoint
 app.get('/health', (req, res) => {
-  res.json({ status: 'OK', timestamp: new Date().toISOString() });
+  res.json({
+    status: 'OK',
+    timestamp: new Date().toISOString(),
+    cache: responseCache.getStats(),
+    pdf: pdfPool.getStats()
+  });
 });
 
 // Check existing users' roles and password hashes in the database
-app.get('/api/check-users', async (req, res) => {
+app.get('/api/check-users', requireAuth(ADMIN_ROLES), async (req, res) => {
   try {
     const serviceSupabase = createClient(
       process.env.VITE_SUPABASE_URL,
@@ -507,7 +986,7 @@ app.get('/api/check-users', async (req, res) => {
 })
 
 // Seed test users endpoint (for development only)
-app.post('/api/seed-users', async (req, res) => {
+app.post('/api/seed-users', requireAuth(ADMIN_ROLES), async (req, res) => {
   try {
     console.log('Seed users endpoint called');
     // Create service role client to bypass RLS
@@ -678,11 +1157,15 @@ app.post('/api/seed-users', async (req, res) => {
   } catch (error) {
     console.error('Seed users error:', error);
     res.status(500).json({ error: 'Internal server error', details: error.message });
+  } finally {
+    // Seeding replaces unified_users wholesale; once the delete has run, cached
+    // employee lists are stale whether or not the insert succeeded
+    responseCache.invalidateTags('employees');
   }
 });
 
 // Employee Onboarding API endpoints
-app.post('/api/employee/onboarding', async (req, res) => {
+app.post('/api/employee/onboarding', requireAuth(HR_ROLES), async (req, res) => {
   try {
     const onboardingData = req.body;
     console.log('[DEBUG] Employee onboarding request:', onboardingData);
@@ -704,7 +1187,7 @@ app.post('/api/employee/onboarding', async (req, res) => {
 });
 
 // Client Onboarding API endpoints
-app.post('/api/client/onboarding', async (req, res) => {
+app.post('/api/client/onboarding', requireAuth(), async (req, res) => {
   try {
     const onboardingData = req.body;
     console.log('[DEBUG] Client onboarding request:', onboardingData);
@@ -727,7 +1210,7 @@ app.post('/api/client/onboarding', async (req, res) => {
 });
 
 // Sales Leads API endpoints
-app.get('/api/sales/leads', async (req, res) => {
+app.get('/api/sales/leads', requireAuth(), async (req, res) => {
   try {
     // Mock sales leads data
     const leads = [
@@ -751,14 +1234,19 @@ app.get('/api/sales/leads', async (req, res) => {
       }
     ];
     
+    if (hasListParams(req.query)) {
+      return res.json(applyListQueryToRows(leads, parseListQuery(req.query, LEAD_LIST_SPEC)));
+    }
+
     res.json(leads);
   } catch (error) {
+    if (sendListQueryError(res, error)) return;
     console.error('Sales leads fetch error:', error);
     res.status(500).json({ error: 'Internal server error' });
   }
 });
 
-app.post('/api/sales/leads', async (req, res) => {
+app.post('/api/sales/leads', requireAuth(), async (req, res) => {
   try {
     const leadData = req.body;
     console.log('[DEBUG] New lead creation:', leadData);
@@ -778,7 +1266,7 @@ app.post('/api/sales/leads', async (req, res) => {
 });
 
 // Accounts Payments API endpoints
-app.get('/api/accounts/payments', async (req, res) => {
+app.get('/api/accounts/payments', requireAuth(ACCOUNTS_ROLES), async (req, res) => {
   try {
     // Mock payments data
     const payments = [
@@ -808,7 +1296,7 @@ app.get('/api/accounts/payments', async (req, res) => {
 });
 
 // Notifications API endpoints
-app.get('/api/notifications', async (req, res) => {
+app.get('/api/notifications', requireAuth(), async (req, res) => {
   try {
     // Mock notifications data
     const notifications = [
@@ -837,7 +1325,7 @@ app.get('/api/notifications', async (req, res) => {
   }
 });
 
-app.put('/api/notifications/:id/read', async (req, res) => {
+app.put('/api/notifications/:id/read', requireAuth(), async (req, res) => {
   try {
     const { id } = req.params;
     
@@ -856,7 +1344,7 @@ app.put('/api/notifications/:id/read', async (req, res) => {
 });
 
 // Audit Logs API endpoints
-app.get('/api/audit/logs', async (req, res) => {
+app.get('/api/audit/logs', requireAuth(ADMIN_ROLES), async (req, res) => {
   try {
     // Mock audit logs data
     const logs = [
@@ -888,7 +1376,7 @@ app.get('/api/audit/logs', async (req, res) => {
 });
 
 // Payment API endpoints
-app.get('/api/payments/:payment_id', async (req, res) => {
+app.get('/api/payments/:payment_id', requireAuth(ACCOUNTS_ROLES), async (req, res) => {
   try {
     const { payment_id } = req.params;
     
@@ -910,7 +1398,7 @@ app.get('/api/payments/:payment_id', async (req, res) => {
   }
 });
 
-app.put('/api/payments/:payment_id', async (req, res) => {
+app.put('/api/payments/:payment_id', requireAuth(ACCOUNTS_ROLES), async (req, res) => {
   try {
     const { payment_id } = req.params;
     const { paymentStatus, paymentProofUrl } = req.body;
@@ -1006,27 +1494,48 @@ app.get('/', (req, res) => {
     message: 'BPTM API Server',
     version: '1.0.0',
     status: 'running',
+    authentication: 'Authorization: Bearer <session token> on every /api route except login, logout and login telemetry',
     endpoints: {
       auth: {
         'POST /api/auth/login': 'User authentication',
-        'POST /api/auth/logout': 'User logout'
+        'POST /api/auth/logout': 'User logout (revokes the bearer token)',
+        'GET /api/auth/session': 'Principal of the bearer token (id, role, dashboard_access, expiresAt)',
+        'POST /api/telemetry/logins': 'Queue { events: [...] } login attempts; IP and location are added server-side'
       },
       employees: {
-        'GET /api/employees': 'Get all employees',
+        'GET /api/employees': 'Get all employees (supports fields, filter[...], q, sort, after, limit, count)',
         'POST /api/employees': 'Create new employee',
         'POST /api/employee/onboarding': 'Employee onboarding'
       },
       clients: {
-        'GET /api/clients': 'Get all clients',
+        'GET /api/clients': 'Get all clients (supports fields, filter[...], q, sort, after, limit, count)',
         'POST /api/clients': 'Create new client',
         'POST /api/client/onboarding': 'Client onboarding'
       },
+      exports: {
+        'GET /api/exports/:dataset': 'Stream employees, clients or submissions as CSV or XLSX (format, fields, filter[...], q, sort, after, header; resume and offset continue a CSV export). Employees need an HR role; submissions are limited to your own unless you are a manager',
+        'POST /api/exports/:dataset/links': 'Register the same export for a browser download; returns { exportId, url }',
+        'GET /api/exports/files/:exportId': 'Download a registered export (?offset= continues a CSV from the last page boundary)'
+      },
+      pdf: {
+        'POST /api/pdf/:template': 'Render employeePerformance, monthlyReport or incentiveReport from the JSON body',
+        'POST /api/pdf/:template/batch': 'Render { items: [{ filename, data }] } and stream the PDFs as a ZIP'
+      },
+      leaderboard: {
+        'GET /api/leaderboard': 'Top performers (supports month, department, limit) or an employee\'s rank with neighbours (employee_id, radius)'
+      },
+      drafts: {
+        'GET /api/drafts/:formId': 'Saved form draft of the signed-in user',
+        'PATCH /api/drafts/:formId': 'Save { baseVersion, changed, removed }; 409 with the current draft on conflicting fields',
+        'DELETE /api/drafts/:formId': 'Discard the signed-in user\'s draft'
+      },
       reports: {
         'GET /api/reports/monthly-tactical': 'Monthly tactical reports',
-        'GET /api/reports/quarterly-strategic': 'Quarterly strategic reports'
+        'GET /api/reports/quarterly-strategic': 'Quarterly strategic reports',
+        'GET /api/reports/growth': 'Growth report for a user and period (user_id, role, name, period, report_type); other users, teams and departments need a manager role'
       },
       sales: {
-        'GET /api/sales/leads': 'Get sales leads',
+        'GET /api/sales/leads': 'Get sales leads (supports fields, filter[...], q, sort, after, limit, count)',
         'POST /api/sales/leads': 'Create sales lead'
       },
       payments: {
@@ -0,0 +1,61 @@
+/**
+ * Compare the nested .find() join with the hash-indexed join.
+ *
+ *   node scripts/benchmarkJoinIndex.js [leftRows] [rightRows]
+ *
+ * Defaults to 10k submissions joined against 1k employees on name + phone.
+ */
+import { performance } from 'perf_hooks';
+import { compositeKey, leftJoin, normalizeName, normalizePhone } from '../src/shared/utils/joinIndex.js';
+
+const LEFT_ROWS = parseInt(process.argv[2]) || 10000;
+const RIGHT_ROWS = parseInt(process.argv[3]) || 1000;
+const RUNS = 9;
+
+const employees = Array.from({ length: RIGHT_ROWS }, (_, i) => ({
+  id: `emp-${i}`,
+  name: `Employee ${i}`,
+  phone: `9${String(i).padStart(9, '0')}`
+}));
+
+const submissions = Array.from({ length: LEFT_ROWS }, (_, i) => {
+  const employee = employees[i % (RIGHT_ROWS + 50)] || { name: 'Former Employee', phone: '0000000000' };
+  return { id: `sub-${i}`, employee_name: employee.name, employee_phone: employee.phone };
+});
+
+const employeeKey = compositeKey(['name', 'phone'], [normalizeName, normalizePhone]);
+const submissionKey = compositeKey(['employee_name', 'employee_phone'], [normalizeName, normalizePhone]);
+
+// Both variants return the same minimal shape so only the lookup is measured
+const nestedFind = () => submissions.map(submission => ({
+  id: submission.id,
+  employee: employees.find(emp =>
+    emp.name === submission.employee_name && emp.phone === submission.employee_phone
+  ) || null
+}));
+
+const indexed = () => leftJoin(submissions, employees, {
+  leftKey: submissionKey,
+  rightKey: employeeKey,
+  merge: (submission, employee) => ({ id: submission.id, employee })
+});
+
+const time = (label, fn) => {
+  const samples = [];
+  let matched = fn().filter(row => row.employee).length; // warm-up
+  for (let i = 0; i < RUNS; i++) {
+    const start = performance.now();
+    const result = fn();
+    samples.push(performance.now() - start);
+    matched = result.filter(row => row.employee).length;
+  }
+  samples.sort((a, b) => a - b);
+  const median = samples[Math.floor(samples.length / 2)];
+  console.log(`${label.padEnd(12)} median ${median.toFixed(2)} ms  (${matched}/${LEFT_ROWS} matched)`);
+  return median;
+};
+
+console.log(`Joining ${LEFT_ROWS} rows against ${RIGHT_ROWS} rows, ${RUNS} runs each`);
+const baseline = time('nested find', nestedFind);
+const optimized = time('hash index', indexed);
+console.log(`Speedup: ${(baseline / optimized).toFixed(1)}x`);
@@ -0,0 +1,112 @@
+/**
+ * Latency of 500 concurrent first-name + phone logins, old ILIKE scan against
+ * the indexed authenticate_unified_user lookup.
+ *
+ *   node scripts/benchmarkPhoneLogin.js [logins] [users] [maxConcurrent]
+ *   LOGIN_URL=http://localhost:8000/api/auth/login node scripts/benchmarkPhoneLogin.js 500
+ *
+ * Without LOGIN_URL the database is simulated: a pool of maxConcurrent
+ * connections (default 15), 4 ms round trip, and the ILIKE '%name%' query
+ * scans every user (0.01 ms per row) and ships each candidate row (0.05 ms per
+ * row) for the JS filter, while the indexed lookup touches a single row.
+ * Defaults to 500 logins against 2000 users. With LOGIN_URL the same burst is
+ * sent to a running API server; LOGIN_FIRST_NAME and LOGIN_PHONE pick the user.
+ */
+import { performance } from 'perf_hooks';
+
+const LOGINS = parseInt(process.argv[2]) || 500;
+const USERS = parseInt(process.argv[3]) || 2000;
+const MAX_CONCURRENT = parseInt(process.argv[4]) || 15;
+const ROUND_TRIP_MS = 4;
+const SCAN_MS_PER_ROW = 0.01;
+const TRANSFER_MS_PER_ROW = 0.05;
+const INDEX_LOOKUP_MS = 0.05;
+
+// Same rules as normalizePhoneNumber in api-server.js
+const normalizePhoneNumber = (phone) => (phone || '')
+  .replace(/^\+91-?/, '').replace(/[\s\-\(\)]/g, '').replace(/^0/, '');
+
+const FIRST_NAMES = ['Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Isha', 'Arjun', 'Meera', 'Kabir', 'Diya'];
+const users = Array.from({ length: USERS }, (_, i) => ({
+  id: `user-${i}`,
+  name: `${FIRST_NAMES[i % FIRST_NAMES.length]} Sharma${i}`,
+  phone: `+91 98${String(i).padStart(8, '0')}`,
+  status: 'active'
+}));
+const byPhone = new Map(users.map(user => [normalizePhoneNumber(user.phone), user]));
+
+const createPool = () => {
+  let active = 0;
+  const queue = [];
+  return async (workMs) => {
+    if (active >= MAX_CONCURRENT) await new Promise(resolve => queue.push(resolve));
+    active++;
+    await new Promise(resolve => setTimeout(resolve, ROUND_TRIP_MS + workMs));
+    active--;
+    if (queue.length > 0) queue.shift()();
+  };
+};
+
+const ilikeScan = async (query, { firstName, phone }) => {
+  const needle = firstName.toLowerCase();
+  const candidates = users.filter(user => user.status === 'active' && user.name.toLowerCase().includes(needle));
+  await query(USERS * SCAN_MS_PER_ROW + candidates.length * TRANSFER_MS_PER_ROW);
+  const normalizedPhone = normalizePhoneNumber(phone);
+  return candidates.find(user =>
+    user.name.split(' ')[0].toLowerCase() === needle && normalizePhoneNumber(user.phone) === normalizedPhone
+  ) || null;
+};
+
+const indexedLookup = async (query, { firstName, phone }) => {
+  await query(INDEX_LOOKUP_MS);
+  const user = byPhone.get(normalizePhoneNumber(phone));
+  return user && user.name.split(' ')[0].toLowerCase() === firstName.trim().toLowerCase() ? user : null;
+};
+
+const httpLogin = async (_query, { firstName, phone }) => {
+  const response = await fetch(process.env.LOGIN_URL, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ type: 'phone_auth', firstName, phone })
+  });
+  return response.ok ? response.json() : null;
+};
+
+const percentile = (sorted, p) => sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+
+const run = async (label, login, attempts) => {
+  const query = createPool();
+  const latencies = [];
+  let matched = 0;
+  const start = performance.now();
+  await Promise.all(attempts.map(async (attempt) => {
+    const begin = performance.now();
+    if (await login(query, attempt)) matched++;
+    latencies.push(performance.now() - begin);
+  }));
+  const elapsed = performance.now() - start;
+  latencies.sort((a, b) => a - b);
+  console.log(
+    `${label.padEnd(10)} p50 ${percentile(latencies, 50).toFixed(0).padStart(6)} ms  ` +
+    `p99 ${percentile(latencies, 99).toFixed(0).padStart(6)} ms  ` +
+    `total ${elapsed.toFixed(0).padStart(6)} ms  (${matched}/${attempts.length} matched)`
+  );
+  return percentile(latencies, 99);
+};
+
+if (process.env.LOGIN_URL) {
+  const attempt = { firstName: process.env.LOGIN_FIRST_NAME || 'Aarav', phone: process.env.LOGIN_PHONE || '9800000000' };
+  console.log(`${LOGINS} concurrent logins against ${process.env.LOGIN_URL}`);
+  await run('http', httpLogin, Array.from({ length: LOGINS }, () => attempt));
+} else {
+  // Logins spread over the user base, typed with mixed phone formats
+  const attempts = Array.from({ length: LOGINS }, (_, i) => {
+    const user = users[(i * 7919) % USERS];
+    const digits = normalizePhoneNumber(user.phone);
+    return { firstName: user.name.split(' ')[0], phone: i % 2 ? `0${digits}` : digits };
+  });
+  console.log(`${LOGINS} concurrent logins, ${USERS} users, ${MAX_CONCURRENT} pooled connections`);
+  const baseline = await run('ilike', ilikeScan, attempts);
+  const optimized = await run('indexed', indexedLookup, attempts);
+  console.log(`p99 speedup: ${(baseline / optimized).toFixed(1)}x`);
+}
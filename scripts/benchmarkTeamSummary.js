@@ -0,0 +1,92 @@
+/**
+ * Compare the per-user team summary (N+1 requests) with the set-based pipeline
+ * against a simulated Supabase that caps concurrent requests, like the
+ * PostgREST pool / rate limiter does.
+ *
+ *   node scripts/benchmarkTeamSummary.js [teamSize] [latencyMs] [maxConcurrent]
+ *
+ * Defaults to a 100-person team, 30 ms per request and 10 concurrent requests.
+ * Request counts mirror the queries issued by scoringApi.getTeamSummaryReport
+ * before and after the rewrite; half the team is assumed short on learning
+ * minutes, which made the old path upsert appraisal_delays twice per user.
+ */
+import { performance } from 'perf_hooks';
+
+const TEAM_SIZE = parseInt(process.argv[2]) || 100;
+const LATENCY_MS = parseInt(process.argv[3]) || 30;
+const MAX_CONCURRENT = parseInt(process.argv[4]) || 10;
+
+// Same constants as scoringApi / scoringComputations
+const TEAM_SUMMARY_CHUNK_SIZE = 250;
+const ID_CHUNK_SIZE = 100;
+
+const createBackend = () => {
+  const stats = { reads: 0, writes: 0, peakQueued: 0 };
+  let active = 0;
+  const queue = [];
+
+  const release = () => {
+    active--;
+    if (queue.length > 0) queue.shift()();
+  };
+
+  const request = async (kind) => {
+    stats[kind === 'write' ? 'writes' : 'reads']++;
+    if (active >= MAX_CONCURRENT) {
+      await new Promise(resolve => queue.push(resolve));
+      stats.peakQueued = Math.max(stats.peakQueued, queue.length + 1);
+    }
+    active++;
+    await new Promise(resolve => setTimeout(resolve, LATENCY_MS));
+    release();
+  };
+
+  return { stats, request };
+};
+
+const users = Array.from({ length: TEAM_SIZE }, (_, i) => ({ id: `user-${i}`, shortOnLearning: i % 2 === 0 }));
+
+// calculateUserMonthScore + calculateLearningComponent + monthly_rows, per user, all users at once
+const perUser = async ({ request }) => {
+  await request('read'); // users
+  await Promise.all(users.map(async (user) => {
+    await request('read'); // accountability: user_entity_mappings
+    await request('read'); // accountability: monthly_rows
+    await request('read'); // output: monthly_rows
+    await request('read'); // learning: monthly_rows
+    if (user.shortOnLearning) await request('write'); // appraisal_delays upsert
+    await request('read'); // discipline: monthly_attendance_cache
+    await request('read'); // learning again: monthly_rows
+    if (user.shortOnLearning) await request('write'); // appraisal_delays upsert again
+    await request('read'); // submission status: monthly_rows
+  }));
+};
+
+// loadMonthScoringData per chunk of users, scored in memory
+const setBased = async ({ request }) => {
+  await request('read'); // users
+  for (let i = 0; i < users.length; i += TEAM_SUMMARY_CHUNK_SIZE) {
+    const chunkSize = Math.min(TEAM_SUMMARY_CHUNK_SIZE, users.length - i);
+    const idChunks = Math.ceil(chunkSize / ID_CHUNK_SIZE);
+    const tables = ['user_entity_mappings', 'monthly_rows', 'monthly_attendance_cache'];
+    await Promise.all(tables.flatMap(() => Array.from({ length: idChunks }, () => request('read'))));
+  }
+};
+
+const run = async (label, pipeline) => {
+  const backend = createBackend();
+  const start = performance.now();
+  await pipeline(backend);
+  const elapsed = performance.now() - start;
+  const { reads, writes, peakQueued } = backend.stats;
+  console.log(
+    `${label.padEnd(10)} ${elapsed.toFixed(0).padStart(6)} ms  ` +
+    `${String(reads).padStart(5)} reads  ${String(writes).padStart(4)} writes  peak queue ${peakQueued}`
+  );
+  return elapsed;
+};
+
+console.log(`Team of ${TEAM_SIZE}, ${LATENCY_MS} ms per request, ${MAX_CONCURRENT} concurrent requests`);
+const baseline = await run('per-user', perUser);
+const optimized = await run('set-based', setBased);
+console.log(`Speedup: ${(baseline / optimized).toFixed(1)}x`);
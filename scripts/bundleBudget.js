@@ -0,0 +1,170 @@
+/**
+ * Vite plugin that reports every JS chunk's size against a budget.
+ *
+ * Chunks are classed by their facade module: the entry (loaded by every
+ * visitor), route chunks (the pages imported by src/components/routeModules.js),
+ * vendor chunks (node_modules code, e.g. the manualChunks vendors or a lazily
+ * imported library like xlsx) and shared chunks (app code pulled in by several
+ * routes). Sizes are minified bytes; gzip sizes are reported alongside for
+ * reference.
+ *
+ * With roleEntries it also reports each role's cold-start JS: the entry
+ * chunk, the role's landing page chunk and every chunk they import
+ * statically, i.e. what a fresh login downloads before the page is usable.
+ *
+ * The report is printed and written to dist/bundle-budget.json. The default
+ * budgets are estimates that have not been checked against a real build yet,
+ * so the plugin only warns by default; set BUNDLE_BUDGET=error (or
+ * mode: 'error') to fail the build once budgets are set from a measured
+ * report.
+ */
+import { gzipSync } from 'zlib';
+
+const KB = 1024;
+
+export const DEFAULT_BUDGETS = {
+  entry: 400 * KB,
+  route: 350 * KB,
+  vendor: 512 * KB,
+  shared: 600 * KB
+};
+
+const isVendorModule = (id) => /[\\/]node_modules[\\/]/.test(id);
+
+// routeIds: module ids of the route pages; without them every app-code
+// dynamic import counts as a route
+const classify = (chunk, routeIds) => {
+  if (chunk.isEntry) return 'entry';
+  const modules = Object.keys(chunk.modules || {});
+  const vendor = chunk.facadeModuleId
+    ? isVendorModule(chunk.facadeModuleId)
+    : modules.length > 0 && modules.every(isVendorModule);
+  if (vendor) return 'vendor';
+  if (routeIds ? routeIds.has(chunk.facadeModuleId) : chunk.isDynamicEntry) return 'route';
+  return 'shared';
+};
+
+const formatKb = (bytes) => `${(bytes / KB).toFixed(1)} KB`;
+
+/**
+ * Size report for a Rollup output bundle
+ * @param {Object} bundle - the bundle passed to generateBundle
+ * @param {Object} budgets - { entry, route, vendor, shared, chunks: { [chunkName]: bytes } }
+ * @param {Set<string>} [routeIds] - module ids of the route pages
+ * @returns {Array<{ file, name, kind, size, gzip, budget, over }>} largest first
+ */
+export function measureBundle(bundle, budgets = DEFAULT_BUDGETS, routeIds = null) {
+  return Object.values(bundle)
+    .filter(output => output.type === 'chunk')
+    .map(chunk => {
+      const kind = classify(chunk, routeIds);
+      const size = Buffer.byteLength(chunk.code);
+      const budget = budgets.chunks?.[chunk.name] ?? budgets[kind] ?? DEFAULT_BUDGETS[kind];
+      return {
+        file: chunk.fileName,
+        name: chunk.name,
+        kind,
+        size,
+        gzip: gzipSync(chunk.code).length,
+        budget,
+        over: size > budget
+      };
+    })
+    .sort((a, b) => b.size - a.size);
+}
+
+// Chunks loaded up front with the given ones, following static imports
+const staticClosure = (bundle, fileNames) => {
+  const seen = new Set();
+  const visit = (fileName) => {
+    const chunk = bundle[fileName];
+    if (!chunk || chunk.type !== 'chunk' || seen.has(fileName)) return;
+    seen.add(fileName);
+    chunk.imports.forEach(visit);
+  };
+  fileNames.forEach(visit);
+  return seen;
+};
+
+/**
+ * Cold-start JS per role
+ * @param {Object} bundle - the bundle passed to generateBundle
+ * @param {Object} roleEntries - { [role]: landing page module path relative to the project root }
+ * @returns {Array<{ role, page, size, gzip, chunks }>}
+ */
+export function measureColdStart(bundle, roleEntries = {}) {
+  const chunks = Object.values(bundle).filter(output => output.type === 'chunk');
+  const entries = chunks.filter(chunk => chunk.isEntry).map(chunk => chunk.fileName);
+  const normalize = (path) => path.replace(/\\/g, '/');
+
+  return Object.entries(roleEntries).map(([role, modulePath]) => {
+    const page = chunks.find(chunk => chunk.facadeModuleId && normalize(chunk.facadeModuleId).endsWith(modulePath));
+    const files = staticClosure(bundle, page ? [...entries, page.fileName] : entries);
+    const code = Array.from(files, fileName => bundle[fileName].code);
+    return {
+      role,
+      page: page?.fileName || null,
+      size: code.reduce((sum, source) => sum + Buffer.byteLength(source), 0),
+      gzip: code.reduce((sum, source) => sum + gzipSync(source).length, 0),
+      chunks: Array.from(files)
+    };
+  });
+}
+
+export function bundleBudget({
+  budgets = {},
+  roleEntries = {},
+  routeModules = 'src/components/routeModules.js',
+  mode = process.env.BUNDLE_BUDGET || 'warn'
+} = {}) {
+  const limits = { ...DEFAULT_BUDGETS, ...budgets };
+
+  return {
+    name: 'bundle-budget',
+    apply: 'build',
+    generateBundle(options, bundle) {
+      // The pages are whatever the route table imports lazily
+      const routeTable = Array.from(this.getModuleIds()).find(id => id.replace(/\\/g, '/').endsWith(routeModules));
+      const routeIds = routeTable ? new Set(this.getModuleInfo(routeTable).dynamicallyImportedIds) : null;
+      if (!routeTable) {
+        this.warn(`${routeModules} is not in the bundle; counting every dynamic import as a route`);
+      }
+
+      const report = measureBundle(bundle, limits, routeIds);
+      const width = Math.max(...report.map(row => row.file.length), 4);
+
+      console.log('\nBundle budget');
+      report.forEach(row => {
+        const mark = row.over ? 'OVER' : 'ok';
+        console.log(`  ${mark.padEnd(4)}  ${row.kind.padEnd(6)}  ${row.file.padEnd(width)}  ${formatKb(row.size).padStart(10)} / ${formatKb(row.budget).padStart(10)}  (gzip ${formatKb(row.gzip)})`);
+      });
+
+      const coldStart = measureColdStart(bundle, roleEntries);
+      if (coldStart.length > 0) {
+        console.log('\nCold-start JS per role');
+        coldStart.forEach(row => {
+          const page = row.page ? '' : '  (landing page chunk not found)';
+          console.log(`  ${row.role.padEnd(24)}  ${formatKb(row.size).padStart(10)}  (gzip ${formatKb(row.gzip)}, ${row.chunks.length} chunks)${page}`);
+        });
+      }
+
+      this.emitFile({
+        type: 'asset',
+        fileName: 'bundle-budget.json',
+        source: JSON.stringify({ budgets: limits, chunks: report, coldStart }, null, 2)
+      });
+
+      const over = report.filter(row => row.over);
+      if (over.length === 0) return;
+
+      const message = `${over.length} chunk(s) over budget: ${over.map(row => `${row.file} (${formatKb(row.size)} > ${formatKb(row.budget)})`).join(', ')}`;
+      if (mode === 'warn') {
+        this.warn(message);
+      } else {
+        this.error(message);
+      }
+    }
+  };
+}
+
+export default bundleBudget;
@@ -0,0 +1,161 @@
+// @vitest-environment node
+import { describe, it, expect } from 'vitest';
+import { Readable, Writable } from 'stream';
+import * as XLSX from 'xlsx';
+import { parseListQuery } from '../../src/shared/lib/listQuery.js';
+import { readRows, csvStream, escapeCsv, crc32, xlsxStream, createExportCheckpoints, sendExport } from '../exportStream.js';
+
+const collect = async (iterable) => {
+  const chunks = [];
+  for await (const chunk of iterable) chunks.push(Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk));
+  return Buffer.concat(chunks);
+};
+
+// Keyset-paging stand-in for a Supabase table sorted by id
+const createTable = (rows) => {
+  const requests = [];
+  const buildFrom = () => {
+    const state = { after: null, limit: Infinity };
+    const query = {
+      select: () => query,
+      gt: (_column, id) => { state.after = id; return query; },
+      order: () => query,
+      limit: (limit) => { state.limit = limit; return query; },
+      then: (resolve) => {
+        requests.push(state.after);
+        const start = state.after ? rows.findIndex(row => row.id === state.after) + 1 : 0;
+        resolve({ data: rows.slice(start, start + state.limit), error: null });
+      }
+    };
+    return query;
+  };
+  return { buildFrom, requests };
+};
+
+const rows = Array.from({ length: 5 }, (_, i) => ({ id: `r${i}`, name: i === 1 ? 'Doe, "JD"' : `Name ${i}`, score: i * 10 }));
+
+describe('readRows', () => {
+  it('pages through the table by cursor and reports progress', async () => {
+    const table = createTable(rows);
+    const cursors = [];
+    const parsed = parseListQuery({}, { fields: ['id', 'name', 'score'] });
+
+    const read = [];
+    for await (const row of readRows(table.buildFrom, parsed, { pageSize: 2, onPage: (cursor, count) => cursors.push(count) })) {
+      read.push(row.id);
+    }
+
+    expect(read).toEqual(['r0', 'r1', 'r2', 'r3', 'r4']);
+    expect(table.requests).toEqual([null, 'r1', 'r3']);
+    expect(cursors).toEqual([2, 4, 5]);
+  });
+});
+
+describe('CSV encoding', () => {
+  it('quotes separators, quotes and newlines', () => {
+    expect(escapeCsv('plain')).toBe('plain');
+    expect(escapeCsv('a,b')).toBe('"a,b"');
+    expect(escapeCsv('say "hi"')).toBe('"say ""hi"""');
+    expect(escapeCsv({ a: 1 })).toBe('"{""a"":1}"');
+    expect(escapeCsv(null)).toBe('');
+  });
+
+  it('streams a header and one line per row', async () => {
+    const csv = (await collect(csvStream(['id', 'name'], rows.slice(0, 2)))).toString();
+    expect(csv).toBe('id,name\r\nr0,Name 0\r\nr1,"Doe, ""JD"""\r\n');
+  });
+
+  it('omits the header when resuming', async () => {
+    const csv = (await collect(csvStream(['id'], rows.slice(0, 1), { header: false }))).toString();
+    expect(csv).toBe('r0\r\n');
+  });
+});
+
+describe('XLSX encoding', () => {
+  it('computes standard CRC-32', () => {
+    expect(crc32(Buffer.from('123456789'))).toBe(0xcbf43926);
+  });
+
+  it('produces a workbook that spreadsheet readers can open', async () => {
+    const buffer = await collect(xlsxStream(['id', 'name', 'score'], Readable.from(rows), { sheetName: 'Scores' }));
+    const workbook = XLSX.read(buffer, { type: 'buffer' });
+
+    expect(workbook.SheetNames).toEqual(['Scores']);
+    const sheetRows = XLSX.utils.sheet_to_json(workbook.Sheets.Scores);
+    expect(sheetRows).toHaveLength(5);
+    expect(sheetRows[1]).toEqual({ id: 'r1', name: 'Doe, "JD"', score: 10 });
+  });
+});
+
+describe('resumable CSV exports', () => {
+  const manyRows = Array.from({ length: 3000 }, (_, i) => ({ id: `r${String(i).padStart(4, '0')}`, name: `Name ${i}`, score: i }));
+  const spec = { fields: ['id', 'name', 'score'] };
+
+  // Sends an export into a response that drops the connection after cutAt bytes
+  const send = ({ after, cutAt = Infinity, header = true, ...options } = {}) => new Promise((resolve) => {
+    const chunks = [];
+    let received = 0;
+    const res = new Writable({
+      write(chunk, _encoding, callback) {
+        const kept = chunk.subarray(0, Math.max(0, cutAt - received));
+        chunks.push(kept);
+        received += kept.length;
+        callback();
+        if (received >= cutAt) this.destroy();
+      }
+    });
+    res.headers = {};
+    res.status = () => res;
+    res.setHeader = (name, value) => { res.headers[name.toLowerCase()] = value; };
+    res.on('close', () => resolve({ body: Buffer.concat(chunks), headers: res.headers }));
+
+    sendExport({ acceptsEncodings: () => false }, res, {
+      buildFrom: createTable(manyRows).buildFrom,
+      parsed: parseListQuery(after ? { after } : {}, spec),
+      columns: spec.fields,
+      format: 'csv',
+      filename: 'rows',
+      header,
+      pageSize: 500,
+      ...options
+    });
+  });
+
+  it('continues a download cut mid-way from the last checkpoint', async () => {
+    const full = await send();
+    const checkpoints = createExportCheckpoints();
+    const exportId = checkpoints.create({ dataset: 'rows', params: {}, header: true, owner: 'u1' });
+
+    const cut = await send({ cutAt: 50000, checkpoints, exportId });
+    expect(cut.body.length).toBe(50000);
+    expect(cut.headers['x-export-id']).toBe(exportId);
+
+    const { checkpoint } = checkpoints.resume(exportId, cut.body.length, { dataset: 'rows', owner: 'u1' });
+    expect(checkpoint.bytes).toBeGreaterThan(0);
+    expect(checkpoint.bytes).toBeLessThanOrEqual(50000);
+    expect(full.body.subarray(0, checkpoint.bytes).toString().endsWith('\r\n')).toBe(true);
+
+    const rest = await send({ after: checkpoint.cursor, header: false, checkpoints, exportId, offset: checkpoint.bytes });
+    expect(rest.headers['x-export-offset']).toBe(String(checkpoint.bytes));
+    expect(Buffer.concat([cut.body.subarray(0, checkpoint.bytes), rest.body]).equals(full.body)).toBe(true);
+  });
+
+  it('only resumes known exports for the same dataset and owner', () => {
+    const checkpoints = createExportCheckpoints({ maxExports: 2 });
+    const first = checkpoints.create({ dataset: 'clients', params: { after: 'abc' }, header: true, owner: 'u1' });
+    checkpoints.record(first, { bytes: 100, cursor: 'page-1' });
+    checkpoints.record(first, { bytes: 250, cursor: 'page-2' });
+
+    expect(checkpoints.resume(first, 40, { dataset: 'clients', owner: 'u1' }).checkpoint).toEqual({ bytes: 0, cursor: 'abc' });
+    expect(checkpoints.resume(first, 260, { dataset: 'clients', owner: 'u1' }).checkpoint).toEqual({ bytes: 250, cursor: 'page-2' });
+    expect(checkpoints.resume(first, 260, { dataset: 'clients', owner: 'u2' })).toBeNull();
+    expect(checkpoints.resume(first, 260, { dataset: 'employees', owner: 'u1' })).toBeNull();
+    expect(checkpoints.open(first, 120).checkpoint).toEqual({ bytes: 100, cursor: 'page-1' });
+    expect(checkpoints.open('unknown')).toBeNull();
+
+    checkpoints.create({ dataset: 'clients', params: {}, header: true });
+    checkpoints.create({ dataset: 'clients', params: {}, header: true });
+    expect(checkpoints.size).toBe(2);
+    expect(checkpoints.resume(first, 260, { dataset: 'clients', owner: 'u1' })).toBeNull();
+  });
+});
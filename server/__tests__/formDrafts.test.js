@@ -0,0 +1,103 @@
+// @vitest-environment node
+import { describe, it, expect, beforeAll, afterAll, beforeEach } from 'vitest';
+import express from 'express';
+import { createDraftRouter } from '../formDrafts.js';
+import { createKeyRing, createSessionTokens, authenticate } from '../sessionTokens.js';
+
+// In-memory form_drafts table behind the supabase calls the router makes
+const createDraftTable = () => {
+  const rows = [];
+  const query = () => {
+    const filters = [];
+    let remove = false;
+    let single = false;
+    const matching = () => rows.filter(row => filters.every(([column, value]) => row[column] === value));
+    const builder = {
+      select: () => builder,
+      delete: () => { remove = true; return builder; },
+      eq: (column, value) => { filters.push([column, value]); return builder; },
+      maybeSingle: () => { single = true; return builder; },
+      then: (resolve, reject) => Promise.resolve().then(() => {
+        const found = matching();
+        if (remove) {
+          found.forEach(row => rows.splice(rows.indexOf(row), 1));
+          return { data: null, error: null };
+        }
+        return { data: single ? found[0] || null : found, error: null };
+      }).then(resolve, reject)
+    };
+    return builder;
+  };
+  const rpc = async (name, { p_form_id, p_owner, p_changed }) => {
+    let row = rows.find(draft => draft.form_id === p_form_id && draft.owner === p_owner);
+    if (!row) {
+      row = { form_id: p_form_id, owner: p_owner, version: 0, data: {} };
+      rows.push(row);
+    }
+    row.version++;
+    row.data = { ...row.data, ...p_changed };
+    return { data: { applied: true, version: row.version, conflicts: [] }, error: null };
+  };
+  return { rows, from: () => query(), rpc };
+};
+
+describe('draft routes', () => {
+  const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: 'd'.repeat(32) }]) });
+  const alice = tokens.issue({ id: 'alice', role: 'SEO' }).token;
+  const table = createDraftTable();
+  let server;
+  let baseUrl;
+
+  const request = (path, { token, method = 'GET', body } = {}) => fetch(`${baseUrl}${path}`, {
+    method,
+    headers: {
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+      ...(body ? { 'Content-Type': 'application/json' } : {})
+    },
+    body: body ? JSON.stringify(body) : undefined
+  });
+
+  beforeAll(async () => {
+    const app = express();
+    app.use(express.json());
+    app.use(authenticate(tokens));
+    app.use('/api/drafts', createDraftRouter(table));
+    await new Promise(resolve => { server = app.listen(0, resolve); });
+    baseUrl = `http://127.0.0.1:${server.address().port}`;
+  });
+
+  afterAll(() => new Promise(resolve => server.close(resolve)));
+
+  beforeEach(() => {
+    table.rows.splice(0, table.rows.length,
+      { form_id: 'onboarding', owner: 'bob', version: 3, data: { name: 'Bob Co' }, updated_at: null }
+    );
+  });
+
+  it('requires a session', async () => {
+    expect((await request('/api/drafts/onboarding?owner=bob')).status).toBe(401);
+    expect((await request('/api/drafts/onboarding', { method: 'PATCH', body: { owner: 'bob', changed: { name: 'x' } } })).status).toBe(401);
+    expect((await request('/api/drafts/onboarding?owner=bob', { method: 'DELETE' })).status).toBe(401);
+    expect(table.rows).toHaveLength(1);
+  });
+
+  it("refuses another user's draft even when the owner is named", async () => {
+    const response = await request('/api/drafts/onboarding?owner=bob', { token: alice });
+    expect(response.status).toBe(404);
+
+    const saved = await request('/api/drafts/onboarding', { token: alice, method: 'PATCH', body: { owner: 'bob', changed: { name: 'Alice Co' } } });
+    expect(saved.status).toBe(200);
+    expect((await request('/api/drafts/onboarding?owner=bob', { token: alice, method: 'DELETE' })).status).toBe(204);
+
+    // Bob's draft is untouched; Alice's save went to a draft of her own, then was deleted
+    expect(table.rows).toEqual([{ form_id: 'onboarding', owner: 'bob', version: 3, data: { name: 'Bob Co' }, updated_at: null }]);
+  });
+
+  it("serves the signed-in user's own draft", async () => {
+    await request('/api/drafts/onboarding', { token: alice, method: 'PATCH', body: { changed: { name: 'Alice Co' } } });
+    const response = await request('/api/drafts/onboarding', { token: alice });
+
+    expect(response.status).toBe(200);
+    expect(await response.json()).toMatchObject({ version: 1, data: { name: 'Alice Co' } });
+  });
+});
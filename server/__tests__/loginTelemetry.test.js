@@ -0,0 +1,98 @@
+// @vitest-environment node
+import { describe, it, expect, vi } from 'vitest';
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import {
+  clientIp,
+  parseIPv4,
+  createGeoDatabase,
+  loadGeoDatabase,
+  createGeoResolver,
+  createTelemetryQueue,
+  sanitizeLoginEvent
+} from '../loginTelemetry.js';
+
+describe('loginTelemetry', () => {
+  it('reads the client IP that Express resolved', () => {
+    expect(clientIp({ ip: '::ffff:203.0.113.9' })).toBe('203.0.113.9');
+    expect(clientIp({ socket: { remoteAddress: '2001:db8::1' } })).toBe('2001:db8::1');
+    expect(parseIPv4('203.0.113.9')).toBe(3405803785);
+    expect(parseIPv4('999.0.0.1')).toBeNull();
+  });
+
+  it('looks up locations from a CSV range database', async () => {
+    const file = path.join(os.tmpdir(), `geo-${process.pid}.csv`);
+    fs.writeFileSync(file, [
+      '"1.6.0.0","1.7.255.255","AS","IN","Maharashtra","Mumbai",19.07,72.87',
+      '"2001:db8::","2001:db8::ffff","AS","IN","Delhi","New Delhi",0,0',
+      '"1.0.0.0","1.0.0.255","OC","AU","Queensland","South Brisbane",-27.48,153.02'
+    ].join('\n'));
+
+    const database = await loadGeoDatabase(file);
+    fs.unlinkSync(file);
+
+    expect(database.size).toBe(2);
+    expect(database.lookup(parseIPv4('1.6.10.20'))).toEqual({ country: 'IN', region: 'Maharashtra', city: 'Mumbai' });
+    expect(database.lookup(parseIPv4('1.0.1.0'))).toBeNull();
+  });
+
+  it('caches resolved locations and labels private addresses', () => {
+    const database = createGeoDatabase([{ start: parseIPv4('1.6.0.0'), end: parseIPv4('1.7.255.255'), country: 'IN', region: 'Maharashtra', city: 'Mumbai' }]);
+    const lookup = vi.spyOn(database, 'lookup');
+    const resolver = createGeoResolver({ database, cacheSize: 2 });
+
+    expect(resolver.resolve('1.6.0.1').city).toBe('Mumbai');
+    expect(resolver.resolve('1.6.0.1').city).toBe('Mumbai');
+    expect(lookup).toHaveBeenCalledTimes(1);
+    expect(resolver.resolve('192.168.1.4').country).toBe('Private network');
+    expect(resolver.resolve('unknown').country).toBe('Unknown');
+  });
+
+  it('writes queued rows in batches', async () => {
+    const write = vi.fn().mockResolvedValue(undefined);
+    const queue = createTelemetryQueue({ write, maxBatch: 3, flushInterval: 60000, prepare: row => ({ ...row, prepared: true }) });
+
+    [1, 2, 3, 4].forEach(id => queue.push({ id }));
+    await queue.flush();
+    await queue.flush();
+
+    expect(write).toHaveBeenCalledTimes(2);
+    expect(write.mock.calls[0][0]).toEqual([{ id: 1, prepared: true }, { id: 2, prepared: true }, { id: 3, prepared: true }]);
+    expect(queue.stats.written).toBe(4);
+    expect(queue.pending).toBe(0);
+  });
+
+  it('keeps rows for the next flush when a write fails', async () => {
+    const write = vi.fn().mockResolvedValue(undefined);
+    write.mockRejectedValueOnce(new Error('offline'));
+    const queue = createTelemetryQueue({ write, flushInterval: 60000 });
+
+    queue.push({ id: 1 });
+    await queue.flush();
+    expect(queue.pending).toBe(1);
+    await queue.flush();
+    expect(queue.stats.written).toBe(1);
+  });
+
+  it('accepts only known login event fields', () => {
+    expect(sanitizeLoginEvent({ login_status: 'hacked' })).toBeNull();
+    const row = sanitizeLoginEvent({
+      login_status: 'failed',
+      identifier: 'Priya',
+      failure_reason: 'No user found',
+      ip_address: '8.8.8.8',
+      timestamp: '2026-10-16T10:00:00.000Z'
+    });
+    expect(row).toEqual({
+      user_id: null,
+      email: null,
+      identifier: 'Priya',
+      user_type: 'employee',
+      login_status: 'failed',
+      failure_reason: 'No user found',
+      device_info: null,
+      login_timestamp: '2026-10-16T10:00:00.000Z'
+    });
+  });
+});
@@ -0,0 +1,57 @@
+// @vitest-environment node
+import { describe, it, expect, afterAll } from 'vitest';
+import { createPdfWorkerPool } from '../pdfWorkerPool.js';
+import { PDF_TEMPLATES, getCompiledTemplate, renderPdf } from '../../src/shared/lib/pdfTemplates.js';
+
+const pageCount = (buffer) => (Buffer.from(buffer).toString('latin1').match(/\/Type \/Page\b/g) || []).length;
+
+describe('pdfTemplates', () => {
+  it('renders every template to PDF bytes', () => {
+    PDF_TEMPLATES.forEach(template => {
+      const bytes = Buffer.from(renderPdf(template, {}));
+      expect(bytes.subarray(0, 5).toString()).toBe('%PDF-');
+    });
+  });
+
+  it('compiles each template once', () => {
+    expect(getCompiledTemplate('monthlyReport')).toBe(getCompiledTemplate('monthlyReport'));
+  });
+
+  it('continues long tables onto new pages instead of truncating them', () => {
+    const applications = Array.from({ length: 120 }, (_, i) => ({ employeeName: `E${i}`, incentiveType: 'Referral', amount: i, status: 'approved' }));
+    expect(pageCount(renderPdf('incentiveReport', { applications: applications.slice(0, 5) }))).toBe(1);
+    expect(pageCount(renderPdf('incentiveReport', { applications }))).toBeGreaterThan(1);
+  });
+
+  it('rejects unknown templates', () => {
+    expect(() => renderPdf('missing', {})).toThrow("No PDF template for 'missing'");
+  });
+});
+
+describe('createPdfWorkerPool', () => {
+  const pool = createPdfWorkerPool({ size: 2 });
+
+  afterAll(() => pool.close());
+
+  it('renders on worker threads', async () => {
+    const pdf = await pool.render('employeePerformance', { employeeName: 'Asha', metrics: { score: 8 } });
+    expect(pdf.subarray(0, 5).toString()).toBe('%PDF-');
+  });
+
+  it('yields batch results in input order with per-item errors', async () => {
+    const items = Array.from({ length: 6 }, (_, i) => ({ filename: `e${i}.pdf`, data: { employeeName: `E${i}` } }));
+    const results = [];
+    for await (const result of pool.renderAll('employeePerformance', items)) results.push(result);
+
+    expect(results.map(result => result.filename)).toEqual(items.map(item => item.filename));
+    expect(results.every(result => result.buffer && !result.error)).toBe(true);
+
+    const failed = [];
+    for await (const result of pool.renderAll('missing', items.slice(0, 2))) failed.push(result);
+    expect(failed.map(result => result.error?.message)).toEqual([
+      "No PDF template for 'missing'",
+      "No PDF template for 'missing'"
+    ]);
+    expect(pool.getStats()).toMatchObject({ busy: 0, queued: 0 });
+  });
+});
@@ -0,0 +1,124 @@
+// @vitest-environment node
+import { describe, it, expect, vi, beforeAll, afterAll, afterEach } from 'vitest';
+import express from 'express';
+import { createResponseCache, cacheResponse, buildCacheKey } from '../responseCache.js';
+
+const body = (bytes, fill = 'x') => JSON.stringify({ data: fill.repeat(bytes - 11) });
+
+describe('createResponseCache', () => {
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('evicts the least recently used entries to stay under the byte cap', () => {
+    const cache = createResponseCache({ maxEntries: 100, maxBytes: 300 });
+    cache.set('a', body(100));
+    cache.set('b', body(100));
+    cache.set('c', body(100));
+    expect(cache.get('a')).not.toBeNull(); // a is now the most recent
+
+    cache.set('d', body(100));
+
+    expect(cache.get('b')).toBeNull();
+    expect(cache.get('a')).not.toBeNull();
+    expect(cache.get('d')).not.toBeNull();
+    expect(cache.getStats()).toMatchObject({ entries: 3, bytes: 300, evictions: 1 });
+
+    // A body larger than the whole budget is not cached and evicts nothing
+    expect(cache.set('huge', body(301))).toBeNull();
+    expect(cache.getStats().entries).toBe(3);
+  });
+
+  it('expires entries after their TTL', () => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-10-16T10:00:00Z'));
+    const cache = createResponseCache({ defaultTtl: 60 * 1000 });
+    cache.set('short', body(20), { ttl: 1000 });
+    cache.set('default', body(20));
+
+    vi.setSystemTime(new Date('2026-10-16T10:00:01Z'));
+    expect(cache.get('short')).toBeNull();
+    expect(cache.get('default')).not.toBeNull();
+
+    vi.setSystemTime(new Date('2026-10-16T10:01:00Z'));
+    expect(cache.get('default')).toBeNull();
+    expect(cache.getStats()).toMatchObject({ entries: 0, bytes: 0 });
+  });
+
+  it('drops every entry carrying an invalidated tag', () => {
+    const cache = createResponseCache();
+    cache.set('/api/employees', body(20), { tags: ['employees'] });
+    cache.set('/api/employees?limit=5', body(20), { tags: ['employees'] });
+    cache.set('/api/clients', body(20), { tags: ['clients'] });
+
+    expect(cache.invalidateTags('employees')).toBe(2);
+    expect(cache.get('/api/employees')).toBeNull();
+    expect(cache.get('/api/employees?limit=5')).toBeNull();
+    expect(cache.get('/api/clients')).not.toBeNull();
+    expect(cache.invalidateTags('employees')).toBe(0);
+  });
+
+  it('builds the same key for reordered query parameters', () => {
+    const req = (query) => ({ baseUrl: '', path: '/api/employees', query });
+    expect(buildCacheKey(req({ sort: 'name', limit: '5' }))).toBe(buildCacheKey(req({ limit: '5', sort: 'name' })));
+    expect(buildCacheKey(req({}), 'HR')).toBe('/api/employees#HR');
+  });
+});
+
+describe('cacheResponse', () => {
+  const cache = createResponseCache();
+  let calls = 0;
+  let server;
+  let baseUrl;
+
+  beforeAll(async () => {
+    const app = express();
+    app.use((req, res, next) => {
+      req.principal = req.headers['x-role'] ? { id: 'u-1', role: req.headers['x-role'] } : null;
+      next();
+    });
+    app.get('/list', cacheResponse(cache, { tags: ['list'] }), (req, res) => {
+      calls++;
+      res.json({ calls });
+    });
+    app.get('/scoped', cacheResponse(cache, { tags: ['list'], vary: (req) => req.principal?.role }), (req, res) => {
+      calls++;
+      res.json({ role: req.principal?.role, calls });
+    });
+    await new Promise(resolve => { server = app.listen(0, resolve); });
+    baseUrl = `http://127.0.0.1:${server.address().port}`;
+  });
+
+  afterAll(() => new Promise(resolve => server.close(resolve)));
+
+  it('answers 304 when If-None-Match carries the current ETag', async () => {
+    const first = await fetch(`${baseUrl}/list`);
+    const etag = first.headers.get('etag');
+    expect(first.headers.get('x-cache')).toBe('MISS');
+    expect(etag).toBeTruthy();
+
+    const revalidated = await fetch(`${baseUrl}/list`, { headers: { 'If-None-Match': etag } });
+    expect(revalidated.status).toBe(304);
+    expect(revalidated.headers.get('x-cache')).toBe('HIT');
+
+    const stale = await fetch(`${baseUrl}/list`, { headers: { 'If-None-Match': '"old"' } });
+    expect(stale.status).toBe(200);
+    expect(await stale.json()).toEqual(await first.json());
+  });
+
+  it('keeps caller variants apart and drops them with their tag', async () => {
+    const hr = await (await fetch(`${baseUrl}/scoped`, { headers: { 'x-role': 'HR' } })).json();
+    const seo = await fetch(`${baseUrl}/scoped`, { headers: { 'x-role': 'SEO' } });
+    expect(seo.headers.get('x-cache')).toBe('MISS');
+    expect(seo.headers.get('vary')).toBe('Authorization');
+    expect((await seo.json()).role).toBe('SEO');
+
+    const again = await fetch(`${baseUrl}/scoped`, { headers: { 'x-role': 'HR' } });
+    expect(again.headers.get('x-cache')).toBe('HIT');
+    expect(await again.json()).toEqual(hr);
+
+    cache.invalidateTags('list');
+    const fresh = await fetch(`${baseUrl}/scoped`, { headers: { 'x-role': 'HR' } });
+    expect(fresh.headers.get('x-cache')).toBe('MISS');
+  });
+});
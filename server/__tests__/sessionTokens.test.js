@@ -0,0 +1,128 @@
+// @vitest-environment node
+import { describe, it, expect } from 'vitest';
+import {
+  createKeyRing,
+  createRevocationList,
+  createSessionTokens,
+  parseSigningKeys,
+  authenticate,
+  requireAuth,
+  TokenError
+} from '../sessionTokens.js';
+
+const SECRET_A = 'a'.repeat(32);
+const SECRET_B = 'b'.repeat(32);
+const user = { id: 'u-1', role: 'SEO', dashboard_access: ['employee_dashboard'] };
+
+const codeOf = (fn) => {
+  try {
+    fn();
+  } catch (error) {
+    expect(error instanceof TokenError).toBe(true);
+    return error.code;
+  }
+  return null;
+};
+
+const run = (middleware, req) => {
+  const res = {
+    statusCode: 200,
+    body: null,
+    status(code) { this.statusCode = code; return this; },
+    json(body) { this.body = body; return this; }
+  };
+  let passed = false;
+  middleware(req, res, () => { passed = true; });
+  return { res, passed };
+};
+
+describe('sessionTokens', () => {
+  it('round-trips the user claims', () => {
+    const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_A }]) });
+    const { token, expiresAt } = tokens.issue(user);
+    const claims = tokens.verify(token);
+
+    expect(claims).toMatchObject({ sub: 'u-1', role: 'SEO', dashboard_access: ['employee_dashboard'] });
+    expect(new Date(claims.exp * 1000).toISOString()).toBe(expiresAt);
+  });
+
+  it('rejects tampered, expired and foreign tokens', () => {
+    const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_A }]), ttl: 1000 * 60 });
+    const { token } = tokens.issue(user);
+    const [version, kid, , signature] = token.split('.');
+    const forged = Buffer.from(JSON.stringify({ ...tokens.verify(token), role: 'Super Admin' })).toString('base64url');
+
+    expect(codeOf(() => tokens.verify([version, kid, forged, signature].join('.')))).toBe('bad_signature');
+    expect(codeOf(() => tokens.verify(token, { now: Date.now() + 1000 * 61 }))).toBe('expired');
+    expect(codeOf(() => tokens.verify('bearer_u-1'))).toBe('malformed');
+
+    const other = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_B }]) });
+    expect(codeOf(() => other.verify(token))).toBe('bad_signature');
+  });
+
+  it('keeps verifying old tokens after a key rotation until the key is retired', () => {
+    const keyRing = createKeyRing(parseSigningKeys(`k1:${SECRET_A}`));
+    const tokens = createSessionTokens({ keyRing });
+    const before = tokens.issue(user).token;
+
+    keyRing.rotate('k2', SECRET_B);
+    const after = tokens.issue(user).token;
+    expect(after.split('.')[1]).toBe('k2');
+    expect(tokens.verify(before).sub).toBe('u-1');
+
+    keyRing.retire('k1');
+    expect(codeOf(() => tokens.verify(before))).toBe('unknown_key');
+    expect(tokens.verify(after).sub).toBe('u-1');
+  });
+
+  it('revokes single tokens and everything a user holds', () => {
+    const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_A }]) });
+    const first = tokens.issue(user, { now: Date.now() - 5000 });
+    const second = tokens.issue(user, { now: Date.now() - 5000 });
+
+    tokens.revoke(first.claims);
+    expect(codeOf(() => tokens.verify(first.token))).toBe('revoked');
+    expect(tokens.verify(second.token).sub).toBe('u-1');
+
+    tokens.revokeUser('u-1');
+    expect(codeOf(() => tokens.verify(second.token))).toBe('revoked');
+    expect(tokens.verify(tokens.issue(user, { now: Date.now() + 1000 }).token).sub).toBe('u-1');
+  });
+
+  it('accepts a login in the same second as the revocation', () => {
+    const revocations = createRevocationList();
+    const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_A }]), revocations });
+    const second = Math.floor(Date.now() / 1000) * 1000;
+    const before = tokens.issue(user, { now: second + 100 });
+
+    revocations.revokeSubject('u-1', second + 400);
+    const after = tokens.issue(user, { now: second + 700 });
+
+    expect(before.claims.iat).toBe(after.claims.iat);
+    expect(codeOf(() => tokens.verify(before.token))).toBe('revoked');
+    expect(tokens.verify(after.token).sub).toBe('u-1');
+
+    // Tokens issued before iat_ms existed are refused for the whole cut-off second
+    expect(revocations.isRevoked({ jti: 'old', sub: 'u-1', iat: second / 1000 })).toBe(true);
+    expect(revocations.isRevoked({ jti: 'old', sub: 'u-1', iat: second / 1000 + 1 })).toBe(false);
+  });
+
+  it('attaches the principal to the request and guards routes', () => {
+    const tokens = createSessionTokens({ keyRing: createKeyRing([{ kid: 'k1', secret: SECRET_A }]) });
+    const { token } = tokens.issue(user);
+
+    const req = { headers: { authorization: `Bearer ${token}` } };
+    expect(run(authenticate(tokens), req).passed).toBe(true);
+    expect(req.principal).toMatchObject({ id: 'u-1', role: 'SEO', dashboard_access: ['employee_dashboard'] });
+    expect(run(requireAuth('SEO'), req).passed).toBe(true);
+    expect(run(requireAuth('HR'), req).res.statusCode).toBe(403);
+
+    const anonymous = { headers: {} };
+    run(authenticate(tokens), anonymous);
+    expect(anonymous.principal).toBeNull();
+    const { res, passed } = run(requireAuth(), anonymous);
+    expect(passed).toBe(false);
+    expect(res.statusCode).toBe(401);
+    expect(res.body.code).toBe('missing');
+  });
+});
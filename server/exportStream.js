@@ -0,0 +1,476 @@
+import { randomUUID } from 'crypto';
+import { Readable, pipeline } from 'stream';
+import zlib from 'zlib';
+import { applyListQuery, encodeCursor } from '../src/shared/lib/listQuery.js';
+
+/**
+ * Streaming exports for the API server.
+ *
+ * Rows are read from Supabase a page at a time with keyset pagination (the
+ * list query contract), encoded as CSV or XLSX as they arrive and piped to
+ * the response. Pages are only fetched when the encoder asks for more, so a
+ * slow client slows the reads instead of growing a buffer.
+ *
+ * CSV exports record a checkpoint at every page boundary: the byte offset
+ * reached in the CSV and the cursor of the page's last row. A client that
+ * loses the connection keeps what it received up to a checkpoint and asks
+ * for the rest from that cursor.
+ */
+
+export const EXPORT_PAGE_SIZE = 1000;
+
+export const EXPORT_FORMATS = {
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv', compressible: true },
+  xlsx: { contentType: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', extension: 'xlsx', compressible: false }
+};
+
+// ----------------------------------------------------------------------------
+// Row source
+// ----------------------------------------------------------------------------
+
+/**
+ * Yield every row matching a parsed list query, one page at a time.
+ * `onPage` receives the cursor of the last row read, for resuming.
+ *
+ * @param {Function} buildFrom - () => table query builder, e.g. () => supabase.from('clients')
+ * @param {Object} parsed - parseListQuery result
+ * @param {Object} options
+ * @param {number} options.pageSize - rows per request
+ * @param {Function} options.onPage - (cursor, rowsRead) => void
+ */
+export async function* readRows(buildFrom, parsed, { pageSize = EXPORT_PAGE_SIZE, onPage = null } = {}) {
+  let page = { ...parsed, limit: pageSize, count: false };
+  let rowsRead = 0;
+
+  for (;;) {
+    const { data, error } = await applyListQuery(buildFrom(), page);
+    if (error) throw error;
+
+    const rows = (data || []).slice(0, pageSize);
+    for (const row of rows) {
+      yield row;
+    }
+    rowsRead += rows.length;
+
+    const last = rows[rows.length - 1];
+    if (onPage && last) onPage(encodeCursor(last, page.sort, page.key), rowsRead);
+    if (!data || data.length <= pageSize) return;
+
+    page = { ...page, after: { value: last[page.sort.column] ?? null, id: last[page.key] } };
+  }
+}
+
+// ----------------------------------------------------------------------------
+// CSV
+// ----------------------------------------------------------------------------
+
+const formatValue = (value) => {
+  if (value == null) return '';
+  if (Array.isArray(value)) return value.join(', ');
+  if (typeof value === 'object') return JSON.stringify(value);
+  return String(value);
+};
+
+export const escapeCsv = (value) => {
+  const text = formatValue(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const CSV_BATCH_BYTES = 64 * 1024;
+
+/**
+ * Yield CSV for an (async) iterable of rows, in Buffers of about 64 KB
+ *
+ * @param {string[]} columns
+ * @param {Iterable|AsyncIterable} rows
+ * @param {Object} options
+ * @param {boolean} options.header - write the header line (off when resuming)
+ * @param {Function} options.onEncoded - (bytes) => void for every line encoded,
+ *   before it is yielded
+ */
+export async function* csvStream(columns, rows, { header = true, onEncoded = null } = {}) {
+  let batch = [];
+  let batchBytes = 0;
+
+  const add = (values) => {
+    const line = Buffer.from(`${values.map(escapeCsv).join(',')}\r\n`, 'utf8');
+    if (onEncoded) onEncoded(line.length);
+    batch.push(line);
+    batchBytes += line.length;
+  };
+
+  if (header) add(columns);
+  for await (const row of rows) {
+    add(columns.map(column => row[column]));
+    if (batchBytes >= CSV_BATCH_BYTES) {
+      yield Buffer.concat(batch);
+      batch = [];
+      batchBytes = 0;
+    }
+  }
+
+  if (batch.length > 0) yield Buffer.concat(batch);
+}
+
+// ----------------------------------------------------------------------------
+// Resume checkpoints
+// ----------------------------------------------------------------------------
+
+/**
+ * In-memory checkpoints of recent CSV exports, oldest evicted first.
+ * `create` stores what is needed to restart the export and returns its id;
+ * every page then records { bytes, cursor }. `resume` finds the last
+ * checkpoint at or before the byte count a client already has.
+ *
+ * @param {Object} options
+ * @param {number} options.maxExports - exports remembered at once
+ * @param {number} options.ttl - ms an export stays resumable after its last page
+ */
+export function createExportCheckpoints({ maxExports = 200, ttl = 60 * 60 * 1000 } = {}) {
+  const exports = new Map();
+
+  const live = (id) => {
+    const entry = exports.get(id);
+    if (!entry) return null;
+    if (entry.expiresAt <= Date.now()) {
+      exports.delete(id);
+      return null;
+    }
+    return entry;
+  };
+
+  return {
+    /**
+     * @param {Object} request - { dataset, params, header, owner, ... } of the export
+     * @returns {string} export id
+     */
+    create(request) {
+      const id = randomUUID();
+      exports.set(id, {
+        request,
+        checkpoints: [{ bytes: 0, cursor: request.params?.after ?? null }],
+        expiresAt: Date.now() + ttl
+      });
+      while (exports.size > maxExports) {
+        exports.delete(exports.keys().next().value);
+      }
+      return id;
+    },
+
+    record(id, checkpoint) {
+      const entry = live(id);
+      if (!entry) return;
+      const last = entry.checkpoints[entry.checkpoints.length - 1];
+      if (checkpoint.bytes > last.bytes) entry.checkpoints.push(checkpoint);
+      entry.expiresAt = Date.now() + ttl;
+      exports.delete(id);
+      exports.set(id, entry);
+    },
+
+    /**
+     * Look an export up by id alone (download links, where the id is the credential)
+     * @param {string} id
+     * @param {number} offset - bytes the client already has
+     * @returns {Object|null} { request, checkpoint }
+     */
+    open(id, offset = 0) {
+      const entry = live(id);
+      if (!entry) return null;
+      const checkpoint = entry.checkpoints.filter(point => point.bytes <= offset).pop();
+      return { request: entry.request, checkpoint };
+    },
+
+    /**
+     * @param {string} id
+     * @param {number} offset - bytes the client already has
+     * @param {Object} scope - { dataset, owner } that must match the export
+     * @returns {Object|null} { request, checkpoint }
+     */
+    resume(id, offset, { dataset, owner = null } = {}) {
+      const entry = live(id);
+      if (!entry || entry.request.dataset !== dataset || (entry.request.owner ?? null) !== owner) {
+        return null;
+      }
+      return this.open(id, offset);
+    },
+
+    get size() {
+      return exports.size;
+    }
+  };
+}
+
+// ----------------------------------------------------------------------------
+// ZIP (store-or-deflate writer with data descriptors, no seeking required)
+// ----------------------------------------------------------------------------
+
+const CRC_TABLE = (() => {
+  const table = new Uint32Array(256);
+  for (let n = 0; n < 256; n++) {
+    let c = n;
+    for (let k = 0; k < 8; k++) {
+      c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+    }
+    table[n] = c >>> 0;
+  }
+  return table;
+})();
+
+export function crc32(buffer, previous = 0) {
+  let crc = previous ^ 0xffffffff;
+  for (let i = 0; i < buffer.length; i++) {
+    crc = CRC_TABLE[(crc ^ buffer[i]) & 0xff] ^ (crc >>> 8);
+  }
+  return (crc ^ 0xffffffff) >>> 0;
+}
+
+const dosDateTime = (date) => ({
+  time: (date.getHours() << 11) | (date.getMinutes() << 5) | Math.floor(date.getSeconds() / 2),
+  date: ((date.getFullYear() - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate()
+});
+
+/**
+ * Yield a ZIP archive for an (async) iterable of { name, source } entries where
+ * source is an (async) iterable of Buffers or strings. Each entry is deflated as
+ * it streams; sizes and CRCs go in data descriptors and the central directory.
+ */
+export async function* zipStream(entries) {
+  const { time, date } = dosDateTime(new Date());
+  const directory = [];
+  let offset = 0;
+
+  for await (const { name, source } of entries) {
+    const fileName = Buffer.from(name, 'utf8');
+    const local = Buffer.alloc(30);
+    local.writeUInt32LE(0x04034b50, 0);
+    local.writeUInt16LE(20, 4); // version needed
+    local.writeUInt16LE(0x0808, 6); // data descriptor + UTF-8 names
+    local.writeUInt16LE(8, 8); // deflate
+    local.writeUInt16LE(time, 10);
+    local.writeUInt16LE(date, 12);
+    local.writeUInt16LE(fileName.length, 26);
+    yield Buffer.concat([local, fileName]);
+
+    const entry = { fileName, offset, crc: 0, size: 0, compressedSize: 0 };
+    offset += local.length + fileName.length;
+
+    async function* tap() {
+      for await (const chunk of source) {
+        const buffer = Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk, 'utf8');
+        entry.crc = crc32(buffer, entry.crc);
+        entry.size += buffer.length;
+        yield buffer;
+      }
+    }
+
+    const deflate = pipeline(Readable.from(tap()), zlib.createDeflateRaw(), () => {});
+    for await (const chunk of deflate) {
+      entry.compressedSize += chunk.length;
+      yield chunk;
+    }
+    offset += entry.compressedSize;
+
+    const descriptor = Buffer.alloc(16);
+    descriptor.writeUInt32LE(0x08074b50, 0);
+    descriptor.writeUInt32LE(entry.crc, 4);
+    descriptor.writeUInt32LE(entry.compressedSize, 8);
+    descriptor.writeUInt32LE(entry.size, 12);
+    yield descriptor;
+    offset += descriptor.length;
+
+    directory.push(entry);
+  }
+
+  const centralStart = offset;
+  for (const entry of directory) {
+    const header = Buffer.alloc(46);
+    header.writeUInt32LE(0x02014b50, 0);
+    header.writeUInt16LE(20, 4); // version made by
+    header.writeUInt16LE(20, 6); // version needed
+    header.writeUInt16LE(0x0808, 8);
+    header.writeUInt16LE(8, 10);
+    header.writeUInt16LE(time, 12);
+    header.writeUInt16LE(date, 14);
+    header.writeUInt32LE(entry.crc, 16);
+    header.writeUInt32LE(entry.compressedSize, 20);
+    header.writeUInt32LE(entry.size, 24);
+    header.writeUInt16LE(entry.fileName.length, 28);
+    header.writeUInt32LE(entry.offset, 42);
+    yield Buffer.concat([header, entry.fileName]);
+    offset += header.length + entry.fileName.length;
+  }
+
+  const end = Buffer.alloc(22);
+  end.writeUInt32LE(0x06054b50, 0);
+  end.writeUInt16LE(directory.length, 8);
+  end.writeUInt16LE(directory.length, 10);
+  end.writeUInt32LE(offset - centralStart, 12);
+  end.writeUInt32LE(centralStart, 16);
+  yield end;
+}
+
+// ----------------------------------------------------------------------------
+// XLSX (single sheet, inline strings so no shared-string table is buffered)
+// ----------------------------------------------------------------------------
+
+// XML 1.0 forbids most control characters, even escaped
+const escapeXml = (text) => text
+  .replace(/[\u0000-\u0008\u000b\u000c\u000e-\u001f]/g, '')
+  .replace(/&/g, '&amp;')
+  .replace(/</g, '&lt;')
+  .replace(/>/g, '&gt;')
+  .replace(/"/g, '&quot;');
+
+const columnName = (index) => {
+  let name = '';
+  for (let n = index + 1; n > 0; n = Math.floor((n - 1) / 26)) {
+    name = String.fromCharCode(65 + ((n - 1) % 26)) + name;
+  }
+  return name;
+};
+
+const xlsxCell = (value, ref) => {
+  if (value == null || value === '') return '';
+  if (typeof value === 'number' && Number.isFinite(value)) {
+    return `<c r="${ref}"><v>${value}</v></c>`;
+  }
+  if (typeof value === 'boolean') {
+    return `<c r="${ref}" t="b"><v>${value ? 1 : 0}</v></c>`;
+  }
+  return `<c r="${ref}" t="inlineStr"><is><t xml:space="preserve">${escapeXml(formatValue(value))}</t></is></c>`;
+};
+
+async function* sheetXml(columns, rows) {
+  const names = columns.map((_, index) => columnName(index));
+  const line = (values, rowNumber) =>
+    `<row r="${rowNumber}">${values.map((value, i) => xlsxCell(value, `${names[i]}${rowNumber}`)).join('')}</row>`;
+
+  yield '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+    + line(columns, 1);
+
+  let rowNumber = 1;
+  let batch = '';
+  for await (const row of rows) {
+    rowNumber++;
+    batch += line(columns.map(column => row[column]), rowNumber);
+    if (batch.length >= 64 * 1024) {
+      yield batch;
+      batch = '';
+    }
+  }
+
+  yield `${batch}</sheetData></worksheet>`;
+}
+
+const xlsxParts = (sheetName) => ({
+  contentTypes: '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    + '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    + '<Default Extension="xml" ContentType="application/xml"/>'
+    + '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    + '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    + '</Types>',
+  rootRels: '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    + '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    + '</Relationships>',
+  workbook: '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    + '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    + `<sheets><sheet name="${escapeXml(sheetName.slice(0, 31))}" sheetId="1" r:id="rId1"/></sheets>`
+    + '</workbook>',
+  workbookRels: '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    + '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    + '</Relationships>'
+});
+
+/**
+ * Yield an XLSX workbook with one sheet built from an (async) iterable of rows
+ */
+export function xlsxStream(columns, rows, { sheetName = 'Export' } = {}) {
+  const parts = xlsxParts(sheetName);
+  return zipStream([
+    { name: '[Content_Types].xml', source: [parts.contentTypes] },
+    { name: '_rels/.rels', source: [parts.rootRels] },
+    { name: 'xl/workbook.xml', source: [parts.workbook] },
+    { name: 'xl/_rels/workbook.xml.rels', source: [parts.workbookRels] },
+    { name: 'xl/worksheets/sheet1.xml', source: sheetXml(columns, rows) }
+  ]);
+}
+
+// ----------------------------------------------------------------------------
+// HTTP
+// ----------------------------------------------------------------------------
+
+/**
+ * Stream rows to an Express response in the requested format.
+ * CSV is gzip-encoded when the client accepts it. With `checkpoints` and
+ * `exportId` a CSV export sends its id as X-Export-Id and records a
+ * checkpoint per page; a resumed export passes the checkpoint's byte
+ * `offset`, which is echoed as X-Export-Offset. Byte offsets count the
+ * decoded CSV, so they do not depend on the content encoding.
+ *
+ * @param {Object} req
+ * @param {Object} res
+ * @param {Object} options
+ * @param {Function} options.buildFrom - () => table query builder
+ * @param {Object} options.parsed - parseListQuery result
+ * @param {string[]} options.columns - output columns, in order
+ * @param {string} options.format - key of EXPORT_FORMATS
+ * @param {string} options.filename - download name without extension
+ * @param {boolean} options.header - CSV header line
+ * @param {Object} options.checkpoints - createExportCheckpoints store
+ * @param {string} options.exportId - id from checkpoints.create
+ * @param {number} options.offset - CSV bytes before this response
+ * @param {number} options.pageSize - rows per read
+ */
+export function sendExport(req, res, {
+  buildFrom,
+  parsed,
+  columns,
+  format,
+  filename,
+  header = true,
+  checkpoints = null,
+  exportId = null,
+  offset = 0,
+  pageSize = EXPORT_PAGE_SIZE
+}) {
+  const { contentType, extension, compressible } = EXPORT_FORMATS[format];
+  const resumable = format === 'csv' && checkpoints && exportId;
+
+  res.status(200);
+  res.setHeader('Content-Type', contentType);
+  res.setHeader('Content-Disposition', `attachment; filename="${filename}.${extension}"`);
+  res.setHeader('Cache-Control', 'no-store');
+  res.setHeader('Vary', 'Accept-Encoding');
+
+  let stages;
+  if (format === 'xlsx') {
+    stages = [Readable.from(xlsxStream(columns, readRows(buildFrom, parsed, { pageSize }), { sheetName: filename }))];
+  } else {
+    let bytes = offset;
+    const onPage = resumable ? (cursor) => checkpoints.record(exportId, { bytes, cursor }) : null;
+    if (resumable) {
+      res.setHeader('X-Export-Id', exportId);
+      res.setHeader('X-Export-Offset', String(offset));
+    }
+    stages = [Readable.from(csvStream(columns, readRows(buildFrom, parsed, { pageSize, onPage }), {
+      header,
+      onEncoded: (length) => { bytes += length; }
+    }))];
+  }
+
+  if (compressible && req.acceptsEncodings('gzip')) {
+    res.setHeader('Content-Encoding', 'gzip');
+    stages.push(zlib.createGzip());
+  }
+
+  pipeline(...stages, res, (error) => {
+    if (error && error.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      console.error('Export stream error:', error);
+      res.destroy(error);
+    }
+  });
+}
@@ -0,0 +1,114 @@
+/**
+ * Form draft endpoints
+ *
+ * Drafts are saved as field-level patches against the version they were based
+ * on (see patch_form_draft). A 409 carries the current draft so the client can
+ * rebase its edits and resend.
+ *
+ * The routes run on the service-role client, so a draft always belongs to the
+ * signed-in principal; an owner sent in the query or body is ignored.
+ */
+
+import express from 'express';
+import { requireAuth } from './sessionTokens.js';
+
+export const DRAFT_ID_PATTERN = /^[\w.:-]{1,200}$/;
+
+/**
+ * Router for /api/drafts
+ * @param {Object} supabase - client used for form_drafts and patch_form_draft
+ */
+export function createDraftRouter(supabase) {
+  const router = express.Router();
+
+  router.get('/:formId', requireAuth(), async (req, res) => {
+    try {
+      const { formId } = req.params;
+      if (!DRAFT_ID_PATTERN.test(formId)) {
+        return res.status(400).json({ error: 'A valid form id is required' });
+      }
+
+      const { data, error } = await supabase
+        .from('form_drafts')
+        .select('version, data, updated_at')
+        .eq('form_id', formId)
+        .eq('owner', String(req.principal.id))
+        .maybeSingle();
+
+      if (error) {
+        return res.status(500).json({ error: error.message });
+      }
+      if (!data) {
+        return res.status(404).json({ error: 'Draft not found' });
+      }
+
+      res.json(data);
+    } catch (error) {
+      console.error('Draft load error:', error);
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  });
+
+  router.patch('/:formId', requireAuth(), async (req, res) => {
+    try {
+      const { formId } = req.params;
+      const { baseVersion = 0, changed = {}, removed = [] } = req.body || {};
+
+      if (!DRAFT_ID_PATTERN.test(formId)) {
+        return res.status(400).json({ error: 'A valid form id is required' });
+      }
+      if (!Number.isInteger(baseVersion) || baseVersion < 0) {
+        return res.status(400).json({ error: 'baseVersion must be a non-negative integer' });
+      }
+      if (!changed || typeof changed !== 'object' || Array.isArray(changed)) {
+        return res.status(400).json({ error: 'changed must be an object of field values' });
+      }
+      if (!Array.isArray(removed) || removed.some(field => typeof field !== 'string')) {
+        return res.status(400).json({ error: 'removed must be a list of field names' });
+      }
+
+      const { data, error } = await supabase.rpc('patch_form_draft', {
+        p_form_id: formId,
+        p_owner: String(req.principal.id),
+        p_base_version: baseVersion,
+        p_changed: changed,
+        p_removed: removed
+      });
+
+      if (error) {
+        return res.status(500).json({ error: error.message });
+      }
+
+      res.status(data.applied ? 200 : 409).json(data);
+    } catch (error) {
+      console.error('Draft save error:', error);
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  });
+
+  router.delete('/:formId', requireAuth(), async (req, res) => {
+    try {
+      const { formId } = req.params;
+      if (!DRAFT_ID_PATTERN.test(formId)) {
+        return res.status(400).json({ error: 'A valid form id is required' });
+      }
+
+      const { error } = await supabase
+        .from('form_drafts')
+        .delete()
+        .eq('form_id', formId)
+        .eq('owner', String(req.principal.id));
+
+      if (error) {
+        return res.status(500).json({ error: error.message });
+      }
+
+      res.status(204).end();
+    } catch (error) {
+      console.error('Draft delete error:', error);
+      res.status(500).json({ error: 'Internal server error' });
+    }
+  });
+
+  return router;
+}
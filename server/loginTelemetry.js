@@ -0,0 +1,259 @@
+import fs from 'fs';
+import readline from 'readline';
+
+/**
+ * Login telemetry off the login path.
+ *
+ * Browsers post login events without waiting for a reply. The API takes the
+ * IP from the request, and a background queue resolves its location against a
+ * local IP database (behind an LRU cache) and inserts rows in batches.
+ *
+ * The database is an IPv4 range CSV in the DB-IP "IP to City Lite" layout
+ * (start,end,continent,country,region,city,...), given by GEOIP_DB_PATH.
+ * Without it, locations are only filled in for private and loopback addresses.
+ */
+
+export const LOGIN_STATUSES = ['success', 'failed', 'blocked'];
+
+const UNKNOWN_LOCATION = Object.freeze({ country: 'Unknown', region: 'Unknown', city: 'Unknown' });
+const PRIVATE_LOCATION = Object.freeze({ country: 'Private network', region: 'Unknown', city: 'Unknown' });
+
+/**
+ * Client IP of a request, as resolved by Express (see the trust proxy setting)
+ */
+export function clientIp(req) {
+  const ip = req.ip || req.socket?.remoteAddress || '';
+  return ip.startsWith('::ffff:') ? ip.slice(7) : ip || null;
+}
+
+/**
+ * Dotted IPv4 to an unsigned 32-bit integer, null for anything else
+ */
+export function parseIPv4(ip) {
+  const parts = typeof ip === 'string' ? ip.split('.') : [];
+  if (parts.length !== 4) return null;
+  let value = 0;
+  for (const part of parts) {
+    if (!/^\d{1,3}$/.test(part) || Number(part) > 255) return null;
+    value = value * 256 + Number(part);
+  }
+  return value;
+}
+
+const isPrivateIPv4 = (value) =>
+  (value >>> 24) === 10 ||
+  (value >>> 24) === 127 ||
+  (value >>> 20) === ((172 << 4) | 1) ||
+  (value >>> 16) === ((192 << 8) | 168) ||
+  (value >>> 16) === ((169 << 8) | 254);
+
+const splitCsvLine = (line) => line.split(',').map(field => field.replace(/^"|"$/g, ''));
+
+/**
+ * Sorted, non-overlapping IPv4 ranges with a binary-search lookup. Location
+ * objects are shared between ranges with the same country/region/city.
+ */
+export function createGeoDatabase(ranges = []) {
+  const sorted = [...ranges].sort((a, b) => a.start - b.start);
+  const starts = new Uint32Array(sorted.length);
+  const ends = new Uint32Array(sorted.length);
+  const locations = new Array(sorted.length);
+  const shared = new Map();
+
+  sorted.forEach(({ start, end, country, region, city }, index) => {
+    const key = `${country}|${region}|${city}`;
+    if (!shared.has(key)) shared.set(key, Object.freeze({ country, region, city }));
+    starts[index] = start;
+    ends[index] = end;
+    locations[index] = shared.get(key);
+  });
+
+  return {
+    size: sorted.length,
+
+    lookup(value) {
+      let low = 0;
+      let high = starts.length - 1;
+      while (low <= high) {
+        const mid = (low + high) >>> 1;
+        if (starts[mid] > value) high = mid - 1;
+        else if (ends[mid] < value) low = mid + 1;
+        else return locations[mid];
+      }
+      return null;
+    }
+  };
+}
+
+/**
+ * Stream a DB-IP style CSV into a geo database; IPv6 rows are skipped
+ */
+export async function loadGeoDatabase(path) {
+  const ranges = [];
+  const lines = readline.createInterface({ input: fs.createReadStream(path), crlfDelay: Infinity });
+  for await (const line of lines) {
+    const [from, to, , country, region, city] = splitCsvLine(line);
+    const start = parseIPv4(from);
+    const end = parseIPv4(to);
+    if (start === null || end === null) continue;
+    ranges.push({ start, end, country: country || 'Unknown', region: region || 'Unknown', city: city || 'Unknown' });
+  }
+  return createGeoDatabase(ranges);
+}
+
+/**
+ * Least-recently-used map with a fixed number of entries
+ */
+export function createLruCache(maxEntries = 5000) {
+  const entries = new Map();
+  const stats = { hits: 0, misses: 0 };
+
+  return {
+    stats,
+
+    get(key) {
+      if (!entries.has(key)) {
+        stats.misses++;
+        return undefined;
+      }
+      const value = entries.get(key);
+      entries.delete(key);
+      entries.set(key, value);
+      stats.hits++;
+      return value;
+    },
+
+    set(key, value) {
+      entries.delete(key);
+      entries.set(key, value);
+      if (entries.size > maxEntries) entries.delete(entries.keys().next().value);
+    },
+
+    get size() {
+      return entries.size;
+    }
+  };
+}
+
+/**
+ * IP -> { country, region, city } through the cache; the database can be
+ * attached later, once it has finished loading
+ */
+export function createGeoResolver({ database = null, cacheSize = 5000 } = {}) {
+  const cache = createLruCache(cacheSize);
+  let db = database;
+
+  return {
+    cache,
+
+    setDatabase(next) {
+      db = next;
+    },
+
+    resolve(ip) {
+      const value = parseIPv4(ip);
+      if (value === null) return UNKNOWN_LOCATION;
+      if (isPrivateIPv4(value)) return PRIVATE_LOCATION;
+
+      const cached = cache.get(ip);
+      if (cached) return cached;
+      const location = db?.lookup(value) || UNKNOWN_LOCATION;
+      // Misses are not cached until the database is there to answer them
+      if (db) cache.set(ip, location);
+      return location;
+    }
+  };
+}
+
+/**
+ * Buffer rows and write them in batches, every flushInterval or once
+ * maxBatch rows are waiting. prepare() runs per row at flush time.
+ */
+export function createTelemetryQueue({
+  write,
+  prepare = (row) => row,
+  maxBatch = 200,
+  maxQueued = 5000,
+  flushInterval = 2000
+}) {
+  let queue = [];
+  let timer = null;
+  let flushing = null;
+  const stats = { queued: 0, written: 0, batches: 0, dropped: 0, errors: 0 };
+
+  const flush = async () => {
+    clearTimeout(timer);
+    timer = null;
+    if (flushing) await flushing;
+    if (queue.length === 0) return 0;
+
+    const batch = queue.splice(0, maxBatch);
+    flushing = (async () => {
+      try {
+        await write(batch.map(prepare));
+        stats.written += batch.length;
+        stats.batches++;
+      } catch (error) {
+        stats.errors++;
+        console.error('Failed to write login telemetry:', error.message || error);
+        // Keep the rows for the next flush, within the queue limit
+        queue = batch.concat(queue).slice(0, maxQueued);
+      }
+    })();
+    await flushing;
+    flushing = null;
+    if (queue.length > 0) schedule();
+    return batch.length;
+  };
+
+  const schedule = () => {
+    if (!timer) {
+      timer = setTimeout(flush, flushInterval);
+      timer.unref?.();
+    }
+  };
+
+  return {
+    stats,
+    flush,
+
+    push(row) {
+      if (queue.length >= maxQueued) {
+        stats.dropped++;
+        return false;
+      }
+      queue.push(row);
+      stats.queued++;
+      if (queue.length >= maxBatch) flush();
+      else schedule();
+      return true;
+    },
+
+    get pending() {
+      return queue.length;
+    }
+  };
+}
+
+const text = (value, max = 500) => (typeof value === 'string' && value ? value.slice(0, max) : null);
+
+/**
+ * Keep only the known fields of a posted login event
+ * @returns {Object|null} Row for login_tracking, null if the event is invalid
+ */
+export function sanitizeLoginEvent(event) {
+  if (!event || typeof event !== 'object' || !LOGIN_STATUSES.includes(event.login_status)) return null;
+  const timestamp = Date.parse(event.timestamp);
+  const deviceInfo = event.device_info && typeof event.device_info === 'object' ? event.device_info : null;
+
+  return {
+    user_id: text(event.user_id, 100),
+    email: text(event.email, 255),
+    identifier: text(event.identifier, 255),
+    user_type: text(event.user_type, 50) || 'employee',
+    login_status: event.login_status,
+    failure_reason: text(event.failure_reason),
+    device_info: deviceInfo && JSON.stringify(deviceInfo).length <= 2000 ? deviceInfo : null,
+    login_timestamp: Number.isNaN(timestamp) ? new Date().toISOString() : new Date(timestamp).toISOString()
+  };
+}
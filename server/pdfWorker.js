@@ -0,0 +1,13 @@
+import { parentPort } from 'worker_threads';
+import { renderPdf } from '../src/shared/lib/pdfTemplates.js';
+
+// Worker thread entry for server/pdfWorkerPool.js. Templates stay compiled for
+// the life of the thread, so only the first render of each type pays for it.
+parentPort.on('message', ({ id, template, data }) => {
+  try {
+    const buffer = renderPdf(template, data);
+    parentPort.postMessage({ id, buffer }, [buffer]);
+  } catch (error) {
+    parentPort.postMessage({ id, error: error.message });
+  }
+});
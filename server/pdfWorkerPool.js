@@ -0,0 +1,137 @@
+import os from 'os';
+import { Worker } from 'worker_threads';
+
+const WORKER_URL = new URL('./pdfWorker.js', import.meta.url);
+
+export const DEFAULT_POOL_SIZE = Math.max(1, Math.min(4, os.cpus().length - 1));
+
+/**
+ * Fixed-size pool of worker threads that render PDF templates off the event
+ * loop.
+ *
+ * Threads start on first use and each renders one document at a time; extra
+ * requests wait in a FIFO queue. A thread that crashes fails only the render
+ * it was running and is replaced on the next dispatch.
+ */
+export function createPdfWorkerPool({ size = DEFAULT_POOL_SIZE, workerUrl = WORKER_URL } = {}) {
+  const idle = [];
+  const busy = new Map();
+  const queue = [];
+  const stats = { rendered: 0, failed: 0, crashed: 0 };
+  let workerCount = 0;
+  let nextId = 0;
+  let closed = false;
+
+  const release = (worker) => {
+    busy.delete(worker);
+    if (closed) return;
+    idle.push(worker);
+    dispatch();
+  };
+
+  const spawn = () => {
+    const worker = new Worker(workerUrl);
+    workerCount++;
+
+    worker.on('message', ({ id, buffer, error }) => {
+      const task = busy.get(worker);
+      if (!task || task.id !== id) return;
+      if (error) {
+        stats.failed++;
+        task.reject(new Error(error));
+      } else {
+        stats.rendered++;
+        task.resolve(Buffer.from(buffer));
+      }
+      release(worker);
+    });
+
+    const retire = (error) => {
+      const task = busy.get(worker);
+      busy.delete(worker);
+      const index = idle.indexOf(worker);
+      if (index !== -1) idle.splice(index, 1);
+      workerCount--;
+      if (task) {
+        stats.crashed++;
+        task.reject(error);
+      }
+      if (!closed) dispatch();
+    };
+
+    worker.on('error', retire);
+    worker.on('exit', (code) => {
+      if (busy.has(worker) || idle.includes(worker)) {
+        retire(new Error(`PDF worker exited with code ${code}`));
+      }
+    });
+
+    return worker;
+  };
+
+  const dispatch = () => {
+    while (queue.length > 0) {
+      const worker = idle.pop() || (workerCount < size ? spawn() : null);
+      if (!worker) return;
+      const task = queue.shift();
+      busy.set(worker, task);
+      worker.postMessage({ id: task.id, template: task.template, data: task.data });
+    }
+  };
+
+  /**
+   * Render one document. Resolves with the PDF bytes as a Buffer.
+   */
+  const render = (template, data) => {
+    if (closed) return Promise.reject(new Error('PDF worker pool is closed'));
+    return new Promise((resolve, reject) => {
+      queue.push({ id: ++nextId, template, data, resolve, reject });
+      dispatch();
+    });
+  };
+
+  /**
+   * Render items of { filename, data } and yield { filename, buffer, error }
+   * in input order. At most `size` renders are in flight, so a large batch
+   * never queues more work than the pool can start.
+   */
+  async function* renderAll(template, items) {
+    const pending = [];
+    let next = 0;
+
+    const start = () => {
+      const item = items[next++];
+      pending.push(render(template, item.data).then(
+        buffer => ({ filename: item.filename, buffer }),
+        error => ({ filename: item.filename, error })
+      ));
+    };
+
+    while (next < items.length && pending.length < size) start();
+    while (pending.length > 0) {
+      const result = await pending.shift();
+      if (next < items.length) start();
+      yield result;
+    }
+  }
+
+  const close = async () => {
+    closed = true;
+    queue.splice(0).forEach(task => task.reject(new Error('PDF worker pool is closed')));
+    const workers = [...idle, ...busy.keys()];
+    idle.length = 0;
+    busy.forEach(task => task.reject(new Error('PDF worker pool is closed')));
+    busy.clear();
+    await Promise.all(workers.map(worker => worker.terminate()));
+  };
+
+  const getStats = () => ({
+    ...stats,
+    size,
+    workers: workerCount,
+    busy: busy.size,
+    queued: queue.length
+  });
+
+  return { render, renderAll, close, getStats };
+}
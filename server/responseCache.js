@@ -0,0 +1,191 @@
+import crypto from 'crypto';
+
+/**
+ * In-process read-through cache for API GET responses.
+ *
+ * Entries are keyed by route + normalized query string (plus the caller's
+ * role or id for routes whose output depends on it), expire after a TTL,
+ * are evicted least-recently-used once either the entry count or the byte
+ * budget is exceeded, and can be dropped in bulk by tag (e.g. 'employees').
+ */
+export function createResponseCache({
+  maxEntries = 500,
+  maxBytes = 32 * 1024 * 1024,
+  defaultTtl = 60 * 1000
+} = {}) {
+  // Map preserves insertion order, so the first key is always the LRU entry
+  const entries = new Map();
+  const tagIndex = new Map();
+  const stats = { hits: 0, misses: 0, evictions: 0, invalidations: 0 };
+  let totalBytes = 0;
+
+  const unlinkTags = (key, tags) => {
+    tags.forEach(tag => {
+      const keys = tagIndex.get(tag);
+      if (!keys) return;
+      keys.delete(key);
+      if (keys.size === 0) tagIndex.delete(tag);
+    });
+  };
+
+  const remove = (key) => {
+    const entry = entries.get(key);
+    if (!entry) return;
+    entries.delete(key);
+    totalBytes -= entry.size;
+    unlinkTags(key, entry.tags);
+  };
+
+  const get = (key) => {
+    const entry = entries.get(key);
+    if (!entry) {
+      stats.misses++;
+      return null;
+    }
+    if (entry.expiresAt <= Date.now()) {
+      remove(key);
+      stats.misses++;
+      return null;
+    }
+    // Refresh recency
+    entries.delete(key);
+    entries.set(key, entry);
+    stats.hits++;
+    return entry;
+  };
+
+  const set = (key, body, { tags = [], ttl = defaultTtl } = {}) => {
+    const size = Buffer.byteLength(body);
+    if (size > maxBytes) return null;
+
+    remove(key);
+    const entry = {
+      body,
+      size,
+      tags,
+      etag: `"${crypto.createHash('sha1').update(body).digest('base64url')}"`,
+      expiresAt: Date.now() + ttl
+    };
+    entries.set(key, entry);
+    totalBytes += size;
+    tags.forEach(tag => {
+      if (!tagIndex.has(tag)) tagIndex.set(tag, new Set());
+      tagIndex.get(tag).add(key);
+    });
+
+    while (entries.size > maxEntries || totalBytes > maxBytes) {
+      remove(entries.keys().next().value);
+      stats.evictions++;
+    }
+    return entry;
+  };
+
+  const invalidateTags = (...tags) => {
+    let removed = 0;
+    tags.flat().forEach(tag => {
+      const keys = tagIndex.get(tag);
+      if (!keys) return;
+      [...keys].forEach(key => {
+        remove(key);
+        removed++;
+      });
+    });
+    stats.invalidations += removed;
+    return removed;
+  };
+
+  const clear = () => {
+    entries.clear();
+    tagIndex.clear();
+    totalBytes = 0;
+  };
+
+  const getStats = () => {
+    const lookups = stats.hits + stats.misses;
+    return {
+      ...stats,
+      hitRate: lookups > 0 ? Math.round((stats.hits / lookups) * 1000) / 1000 : 0,
+      entries: entries.size,
+      bytes: totalBytes,
+      maxEntries,
+      maxBytes
+    };
+  };
+
+  return { get, set, invalidateTags, clear, getStats };
+}
+
+/**
+ * Build a stable cache key from the route path and its query parameters,
+ * followed by the caller variant when the response depends on the caller
+ */
+export function buildCacheKey(req, variant = null) {
+  const params = new URLSearchParams();
+  Object.keys(req.query || {})
+    .sort()
+    .forEach(name => {
+      const value = req.query[name];
+      (Array.isArray(value) ? value : [value]).forEach(v => {
+        params.append(name, typeof v === 'object' ? JSON.stringify(v) : String(v));
+      });
+    });
+  const query = params.toString();
+  const key = `${req.baseUrl}${req.path}${query ? `?${query}` : ''}`;
+  return variant === null || variant === undefined ? key : `${key}#${variant}`;
+}
+
+function requestMatchesEtag(req, etag) {
+  const header = req.headers['if-none-match'];
+  if (!header) return false;
+  return header.split(',').some(tag => {
+    const candidate = tag.trim();
+    return candidate === '*' || candidate.replace(/^W\//, '') === etag;
+  });
+}
+
+function sendCached(req, res, entry, status, varies) {
+  if (varies) res.set('Vary', 'Authorization');
+  res.set('ETag', entry.etag);
+  res.set('X-Cache', status);
+  if (requestMatchesEtag(req, entry.etag)) {
+    return res.status(304).end();
+  }
+  return res.type('application/json').send(entry.body);
+}
+
+/**
+ * Express middleware that serves GET responses from the cache and stores
+ * successful JSON responses on a miss.
+ *
+ * @param {Object} cache - instance returned by createResponseCache
+ * @param {Object} options
+ * @param {string[]} options.tags - tags used to invalidate the entry later
+ * @param {number} options.ttl - time to live in milliseconds
+ * @param {Function} options.vary - (req) => caller variant (e.g. role) for
+ *   responses that differ between callers; entries are not shared across variants
+ */
+export function cacheResponse(cache, { tags = [], ttl, vary = null } = {}) {
+  return (req, res, next) => {
+    if (req.method !== 'GET') return next();
+
+    const varies = typeof vary === 'function';
+    const key = buildCacheKey(req, varies ? String(vary(req) ?? '') : null);
+    const cached = cache.get(key);
+    if (cached) {
+      return sendCached(req, res, cached, 'HIT', varies);
+    }
+
+    const originalJson = res.json.bind(res);
+    res.json = (payload) => {
+      if (res.statusCode !== 200) {
+        return originalJson(payload);
+      }
+      const entry = cache.set(key, JSON.stringify(payload), { tags, ttl });
+      if (!entry) {
+        return originalJson(payload);
+      }
+      return sendCached(req, res, entry, 'MISS', varies);
+    };
+    next();
+  };
+}
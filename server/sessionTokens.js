@@ -0,0 +1,272 @@
+import crypto from 'crypto';
+
+/**
+ * Signed, self-verifying session tokens for the API.
+ *
+ * A token is `v1.<kid>.<payload>.<signature>`: the payload carries the user
+ * id, role, dashboard_access and expiry, and the signature is an HMAC-SHA256
+ * by the key-ring entry named by kid. Verifying a request needs no database
+ * round trip; the only shared state is a small in-process revocation list of
+ * logged-out token ids and of users whose older tokens were revoked.
+ *
+ * Keys come from SESSION_SIGNING_KEYS ("kid:secret,kid:secret"), the first
+ * being the active signing key. To rotate, put a new key first and keep the
+ * old one listed until the tokens it signed have expired.
+ */
+
+export const TOKEN_VERSION = 'v1';
+export const DEFAULT_TOKEN_TTL = 24 * 60 * 60 * 1000;
+
+const KID_PATTERN = /^[\w-]{1,32}$/;
+
+export class TokenError extends Error {
+  constructor(code, message) {
+    super(message);
+    this.name = 'TokenError';
+    this.code = code;
+    this.status = 401;
+  }
+}
+
+const hmac = (secret, data) => crypto.createHmac('sha256', secret).update(data).digest();
+
+/**
+ * Parse "kid:secret,kid:secret" into key-ring entries
+ */
+export function parseSigningKeys(value) {
+  if (!value) return [];
+  return value.split(',')
+    .map(entry => entry.trim())
+    .filter(Boolean)
+    .map(entry => {
+      const separator = entry.indexOf(':');
+      if (separator <= 0) throw new Error('SESSION_SIGNING_KEYS entries must look like kid:secret');
+      return { kid: entry.slice(0, separator), secret: entry.slice(separator + 1) };
+    });
+}
+
+/**
+ * Signing keys by id; the active key signs, every listed key verifies.
+ * Without configured keys a random key is used, so tokens do not survive a
+ * restart.
+ */
+export function createKeyRing(keys = []) {
+  const ring = new Map();
+  let activeKid = null;
+
+  const add = (kid, secret) => {
+    if (!KID_PATTERN.test(kid)) throw new Error(`Invalid signing key id '${kid}'`);
+    if (!secret || secret.length < 32) throw new Error(`Signing key '${kid}' must be at least 32 characters`);
+    ring.set(kid, secret);
+    if (!activeKid) activeKid = kid;
+  };
+
+  keys.forEach(({ kid, secret }) => add(kid, secret));
+  if (ring.size === 0) {
+    console.warn('SESSION_SIGNING_KEYS is not set; using a random signing key for this process');
+    add(`tmp-${crypto.randomBytes(4).toString('hex')}`, crypto.randomBytes(32).toString('hex'));
+  }
+
+  return {
+    get activeKid() {
+      return activeKid;
+    },
+
+    // Start signing with a new key; earlier keys keep verifying
+    rotate(kid, secret) {
+      add(kid, secret);
+      activeKid = kid;
+    },
+
+    retire(kid) {
+      if (kid === activeKid) throw new Error('The active signing key cannot be retired');
+      ring.delete(kid);
+    },
+
+    sign(data) {
+      return hmac(ring.get(activeKid), data);
+    },
+
+    verify(kid, data, signature) {
+      const secret = ring.get(kid);
+      if (!secret) return false;
+      const expected = hmac(secret, data);
+      return signature.length === expected.length && crypto.timingSafeEqual(signature, expected);
+    },
+
+    has(kid) {
+      return ring.has(kid);
+    }
+  };
+}
+
+/**
+ * Revoked token ids (kept until the token would have expired anyway) and
+ * per-user cut-offs: tokens issued before a user's cut-off are refused.
+ * Cut-offs are compared in milliseconds so a login right after a revocation
+ * is not caught by it.
+ */
+export function createRevocationList({ maxTokenTtl = DEFAULT_TOKEN_TTL } = {}) {
+  const tokens = new Map();
+  const subjects = new Map();
+
+  const prune = (now = Date.now()) => {
+    tokens.forEach((exp, jti) => {
+      if (exp * 1000 <= now) tokens.delete(jti);
+    });
+    subjects.forEach((revokedAt, sub) => {
+      if (revokedAt + maxTokenTtl <= now) subjects.delete(sub);
+    });
+  };
+
+  return {
+    revoke({ jti, exp }) {
+      prune();
+      tokens.set(jti, exp);
+    },
+
+    revokeSubject(sub, at = Date.now()) {
+      prune();
+      subjects.set(String(sub), at);
+    },
+
+    isRevoked({ jti, sub, iat, iat_ms }) {
+      if (tokens.has(jti)) return true;
+      const cutoff = subjects.get(String(sub));
+      if (cutoff === undefined) return false;
+      // Tokens without iat_ms only know their issue second; refuse that whole second
+      return Number.isInteger(iat_ms) ? iat_ms < cutoff : iat * 1000 <= cutoff;
+    },
+
+    prune,
+
+    get size() {
+      return tokens.size + subjects.size;
+    }
+  };
+}
+
+/**
+ * Issue and verify tokens with one key ring and revocation list
+ */
+export function createSessionTokens({
+  keyRing = createKeyRing(),
+  revocations = null,
+  ttl = DEFAULT_TOKEN_TTL
+} = {}) {
+  const revoked = revocations || createRevocationList({ maxTokenTtl: ttl });
+
+  const issue = (user, { now = Date.now() } = {}) => {
+    const iat = Math.floor(now / 1000);
+    const claims = {
+      sub: String(user.id),
+      role: user.role || null,
+      dashboard_access: user.dashboard_access || [],
+      iat,
+      iat_ms: now,
+      exp: iat + Math.floor(ttl / 1000),
+      jti: crypto.randomBytes(12).toString('base64url')
+    };
+    const signed = `${TOKEN_VERSION}.${keyRing.activeKid}.${Buffer.from(JSON.stringify(claims)).toString('base64url')}`;
+    return {
+      token: `${signed}.${keyRing.sign(signed).toString('base64url')}`,
+      expiresAt: new Date(claims.exp * 1000).toISOString(),
+      claims
+    };
+  };
+
+  const verify = (token, { now = Date.now() } = {}) => {
+    const parts = typeof token === 'string' ? token.split('.') : [];
+    if (parts.length !== 4 || parts[0] !== TOKEN_VERSION) {
+      throw new TokenError('malformed', 'Malformed session token');
+    }
+    const [, kid, payload, signature] = parts;
+    if (!keyRing.has(kid)) {
+      throw new TokenError('unknown_key', 'Session token was signed with an unknown key');
+    }
+    if (!keyRing.verify(kid, `${TOKEN_VERSION}.${kid}.${payload}`, Buffer.from(signature, 'base64url'))) {
+      throw new TokenError('bad_signature', 'Invalid session token signature');
+    }
+
+    let claims;
+    try {
+      claims = JSON.parse(Buffer.from(payload, 'base64url').toString('utf8'));
+    } catch {
+      throw new TokenError('malformed', 'Malformed session token');
+    }
+    if (!Number.isInteger(claims.exp) || claims.exp * 1000 <= now) {
+      throw new TokenError('expired', 'Session expired');
+    }
+    if (revoked.isRevoked(claims)) {
+      throw new TokenError('revoked', 'Session has been revoked');
+    }
+    return claims;
+  };
+
+  return {
+    issue,
+    verify,
+    keyRing,
+    revocations: revoked,
+
+    // Log one token out
+    revoke(claims) {
+      revoked.revoke(claims);
+    },
+
+    // Refuse every token the user holds now (role change, password reset, ...)
+    revokeUser(userId) {
+      revoked.revokeSubject(userId);
+    }
+  };
+}
+
+/**
+ * Express middleware: verifies `Authorization: Bearer <token>` and sets
+ * req.principal ({ id, role, dashboard_access, expiresAt, tokenId, claims })
+ * or null. A missing or unrecognized token is not an error here; routes that
+ * need a user add requireAuth. Failures are kept in req.authError.
+ */
+export function authenticate(sessionTokens) {
+  return (req, res, next) => {
+    req.principal = null;
+    req.authError = null;
+
+    const header = req.headers.authorization || '';
+    const token = header.startsWith('Bearer ') ? header.slice(7).trim() : null;
+    if (token) {
+      try {
+        const claims = sessionTokens.verify(token);
+        req.principal = {
+          id: claims.sub,
+          role: claims.role,
+          dashboard_access: claims.dashboard_access,
+          expiresAt: new Date(claims.exp * 1000).toISOString(),
+          tokenId: claims.jti,
+          claims
+        };
+      } catch (error) {
+        if (!(error instanceof TokenError)) return next(error);
+        req.authError = error;
+      }
+    }
+    next();
+  };
+}
+
+/**
+ * Reject requests without a verified principal, optionally limited to roles
+ */
+export function requireAuth(...roles) {
+  const allowed = roles.flat();
+  return (req, res, next) => {
+    if (!req.principal) {
+      const error = req.authError || new TokenError('missing', 'Authentication required');
+      return res.status(401).json({ error: error.message, code: error.code });
+    }
+    if (allowed.length > 0 && !allowed.includes(req.principal.role)) {
+      return res.status(403).json({ error: 'Insufficient permissions' });
+    }
+    next();
+  };
+}
@@ -0,0 +1,140 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+// In-memory stand-in for the supabase query builder over a few tables
+const tables = {};
+
+const query = (name) => {
+  const filters = [];
+  let range = null;
+
+  const run = async () => {
+    let rows = (tables[name] || []).filter(row => filters.every(([column, test]) => test(row[column])));
+    if (range) rows = rows.slice(range[0], range[1] + 1);
+    return { data: rows, error: null };
+  };
+
+  const builder = {
+    select: () => builder,
+    order: () => builder,
+    eq: (column, value) => { filters.push([column, v => v === value]); return builder; },
+    in: (column, values) => { filters.push([column, v => values.includes(v)]); return builder; },
+    range: (from, to) => { range = [from, to]; return builder; },
+    then: (resolve, reject) => run().then(resolve, reject)
+  };
+  return builder;
+};
+
+vi.mock('../../database/supabaseClient', () => ({
+  supabase: { from: (name) => query(name), rpc: vi.fn() }
+}));
+
+vi.mock('../../utils/inputSanitization', () => ({
+  sanitizeInput: (value) => (typeof value === 'string' ? value.trim() : value)
+}));
+
+vi.mock('../../services/scoringComputations', async (importOriginal) => {
+  const actual = await importOriginal();
+  return { ...actual, loadMonthScoringData: vi.fn(actual.loadMonthScoringData) };
+});
+
+const { getTeamSummaryReport } = await import('../scoringApi');
+const { loadMonthScoringData } = await import('../../services/scoringComputations');
+
+const STATUSES = ['draft', 'submitted', 'approved', 'returned'];
+
+const rowsFor = (userId, seed) => [0, 1].map(r => ({
+  id: `row-${userId}-${r}`,
+  user_id: userId,
+  entity_id: `client-${(seed + r) % 3}`,
+  month: 9,
+  year: 2026,
+  status: STATUSES[(seed + r) % STATUSES.length],
+  submitted_at: (seed + r) % 2 ? '2026-10-01T09:00:00Z' : null,
+  review_notes: r ? 'Checked' : '',
+  kpi_json: { delivered_units: seed % 5 },
+  learning_json: [{ topic: 'SEO', url: 'https://example.com', applied_where: 'Client', minutes: 60 + (seed % 5) * 30 }]
+}));
+
+// 520 users plus three with identical work, so the team spans three chunks.
+// Every ninth user has no attendance row; twin-a has none either.
+const seedTeam = () => {
+  tables.users = [];
+  tables.user_entity_mappings = [];
+  tables.monthly_rows = [];
+  tables.monthly_attendance_cache = [];
+
+  const addUser = (userId, seed, discipline) => {
+    tables.users.push({ id: userId, name: `Name ${userId}`, user_type: seed % 2 ? 'employee' : 'intern' });
+    tables.user_entity_mappings.push({ user_id: userId, is_active: true, expected_projects: 2, expected_units: 10 });
+    tables.monthly_rows.push(...rowsFor(userId, seed));
+    if (discipline !== null) {
+      tables.monthly_attendance_cache.push({ user_id: userId, month: 9, year: 2026, discipline_component: discipline });
+    }
+  };
+
+  for (let u = 0; u < 520; u++) {
+    addUser(`user-${String(u).padStart(3, '0')}`, u, u % 9 === 0 ? null : String(5 + (u % 5)));
+  }
+  addUser('twin-a', 4, null);
+  addUser('twin-b', 4, '8');
+  addUser('twin-c', 4, '4');
+};
+
+describe('getTeamSummaryReport', () => {
+  beforeEach(() => {
+    seedTeam();
+    loadMonthScoringData.mockClear();
+  });
+
+  it('scores the team 250 users at a time', async () => {
+    const partials = [];
+    const report = await getTeamSummaryReport('2026-09', null, { onPartial: partial => partials.push(partial) });
+
+    expect(report.status).toBe(200);
+    expect(loadMonthScoringData.mock.calls.map(([month, year, ids]) => [month, year, ids.length]))
+      .toEqual([[9, 2026, 250], [9, 2026, 250], [9, 2026, 23]]);
+    expect(loadMonthScoringData.mock.calls[1][2][0]).toBe('user-250');
+
+    expect(partials.map(partial => partial.processed_count)).toEqual([250, 500, 523]);
+    expect(partials.every(partial => partial.total_users === 523)).toBe(true);
+    partials.forEach((partial, index) => {
+      const expectedIds = tables.users.slice(index * 250, (index + 1) * 250).map(user => user.id);
+      expect(partial.user_details.map(user => user.user_id)).toEqual(expectedIds);
+    });
+  });
+
+  it('adds partial results up to the final report', async () => {
+    const partials = [];
+    const report = await getTeamSummaryReport('2026-09', null, { onPartial: partial => partials.push(partial) });
+    const streamed = partials.flatMap(partial => partial.user_details);
+
+    expect(streamed).toEqual(report.user_details);
+    expect(report.team_metrics.total_users).toBe(523);
+    expect(report.team_metrics.on_time_submissions_count).toBe(streamed.filter(user => user.on_time_submission).length);
+    expect(report.team_metrics.average_user_month_score).toBe(
+      Math.round(streamed.reduce((sum, user) => sum + user.user_month_score, 0) / streamed.length * 100) / 100
+    );
+  });
+
+  it('gives the same report for any chunk size', async () => {
+    const chunked = await getTeamSummaryReport('2026-09');
+    const small = await getTeamSummaryReport('2026-09', null, { chunkSize: 7 });
+
+    expect(small.user_details).toEqual(chunked.user_details);
+    expect(small.team_metrics).toEqual(chunked.team_metrics);
+  });
+
+  it('scores discipline as 8 when attendance is missing', async () => {
+    const report = await getTeamSummaryReport('2026-09');
+    const score = (userId) => report.user_details.find(user => user.user_id === userId).user_month_score;
+
+    expect(score('twin-a')).toBe(score('twin-b'));
+    expect(score('twin-c')).toBeLessThan(score('twin-b'));
+  });
+
+  it('rejects a malformed month', async () => {
+    const report = await getTeamSummaryReport('September');
+    expect(report.status).toBe(400);
+    expect(loadMonthScoringData).not.toHaveBeenCalled();
+  });
+});
@@ -54,9 +54,11 @@ export async function authenticateUser(firstName, phoneNumber) {
     const authResult = await response.json();
     console.log('✅ API: Authentication successful:', authResult.user?.name);
 
-    // Generate session token
-    const sessionToken = generateSessionToken(authResult.user.id);
-    const expiresAt = new Date(Date.now() + 24 * 60 * 60 * 1000); // 24 hours
+    // Signed by the API; carries the user id, role, dashboard access and expiry
+    const sessionToken = authResult.token;
+    const expiresAt = authResult.expires_at
+      ? new Date(authResult.expires_at)
+      : new Date(Date.now() + 24 * 60 * 60 * 1000); // 24 hours
 
     // Create session data
     const sessionData = {
@@ -96,12 +98,22 @@ function normalizePhoneNumber(phone) {
 }
 
 /**
- * Generate a session token (simplified JWT-like token)
+ * Authorization header for API requests, from the stored session
  */
-function generateSessionToken(userId) {
-  const timestamp = Date.now();
-  const randomString = Math.random().toString(36).substring(2);
-  return `${userId}_${timestamp}_${randomString}`;
+export function authHeaders() {
+  try {
+    const session = JSON.parse(localStorage.getItem('unified_auth_session') || 'null');
+    return session?.sessionId ? { 'Authorization': `Bearer ${session.sessionId}` } : {};
+  } catch {
+    return {};
+  }
+}
+
+/**
+ * Whether a token was signed by the API (see server/sessionTokens.js)
+ */
+function isSignedToken(token) {
+  return token.startsWith('v1.') && token.split('.').length === 4;
 }
 
 /**
@@ -136,6 +148,19 @@ export async function validateSession(token) {
   try {
     if (!token) return { valid: false, error: 'No token provided' };
 
+    // Signed tokens are verified by the API without a database lookup
+    if (isSignedToken(token)) {
+      const response = await fetch('/api/auth/session', {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      if (!response.ok) {
+        const { error } = await response.json().catch(() => ({}));
+        return { valid: false, error: error || 'Invalid session' };
+      }
+      const { principal } = await response.json();
+      return { valid: true, session: { user_id: principal.id, expires_at: principal.expiresAt } };
+    }
+
     // Extract user ID from token
     const [userId] = token.split('_');
     
@@ -198,7 +223,13 @@ export async function validateSession(token) {
  */
 export async function logout(token) {
   try {
-    if (token) {
+    if (token && isSignedToken(token)) {
+      // Revoked by the API until it expires
+      await fetch('/api/auth/logout', {
+        method: 'POST',
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+    } else if (token) {
       // Remove session from database
       await supabase
         .from('user_sessions')
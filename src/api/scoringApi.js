@@ -11,8 +11,15 @@ import {
   calculateDisciplineComponent,
   calculateRowScore,
   calculateUserMonthScore,
-  recomputeUserMonth
+  recomputeUserMonth,
+  loadMonthScoringData,
+  computeMonthScores
 } from '../services/scoringComputations';
+import {
+  createScoreComputeJob,
+  runScoreComputeJob,
+  getScoreComputeJobProgress
+} from '../services/scoreComputeJobs';
 import { sanitizeInput } from '../utils/inputSanitization';
 
 /**
@@ -230,11 +237,69 @@ export async function getUserMonthScoreReport(userId, month) {
   }
 }
 
+// Users scored per pass of the team summary pipeline
+const TEAM_SUMMARY_CHUNK_SIZE = 250;
+
+/**
+ * Build one team member's summary entry from their in-memory month score
+ */
+function buildTeamMemberMetrics(user, userScore, rows = []) {
+  const hasSubmissions = rows.length > 0;
+
+  return {
+    user_id: user.id,
+    name: user.name,
+    user_type: user.user_type,
+    user_month_score: userScore.user_month_score,
+    learning_minutes: userScore.breakdown.learning_minutes,
+    learning_compliant: !userScore.flags.needs_appraisal_delay,
+    has_submissions: hasSubmissions,
+    on_time_submission: hasSubmissions && rows.some(row => row.status !== 'draft' && row.submitted_at)
+  };
+}
+
+/**
+ * Aggregate team member entries into the team_metrics block
+ */
+function buildTeamMetrics(userMetrics) {
+  const totalUsers = userMetrics.length;
+  const onTimeSubmissions = userMetrics.filter(u => u.on_time_submission).length;
+  const learningCompliant = userMetrics.filter(u => u.learning_compliant).length;
+  const averageScore = totalUsers > 0 ?
+    userMetrics.reduce((sum, u) => sum + u.user_month_score, 0) / totalUsers : 0;
+  const averageLearningMinutes = totalUsers > 0 ?
+    userMetrics.reduce((sum, u) => sum + u.learning_minutes, 0) / totalUsers : 0;
+
+  return {
+    total_users: totalUsers,
+    on_time_submissions_count: onTimeSubmissions,
+    on_time_submissions_percentage: totalUsers > 0 ? Math.round((onTimeSubmissions / totalUsers) * 100) : 0,
+    learning_compliant_count: learningCompliant,
+    learning_compliance_percentage: totalUsers > 0 ? Math.round((learningCompliant / totalUsers) * 100) : 0,
+    average_user_month_score: Math.round(averageScore * 100) / 100,
+    average_learning_minutes: Math.round(averageLearningMinutes)
+  };
+}
+
 /**
  * GET /reports/team-summary?month=YYYY-MM&teamId=
  * Get team summary report for on-time submissions, average scores, learning compliance
+ *
+ * Read-only: mappings, monthly rows and attendance are loaded once per chunk
+ * of users and scored in memory. Unlike recomputeUserScores, nothing is
+ * written back (no appraisal delays, no attendance cache fills); users without
+ * cached attendance get the default discipline score.
+ *
+ * @param {string} month - 'YYYY-MM'
+ * @param {string} teamId - entity id to restrict the team to
+ * @param {Object} options
+ * @param {number} options.chunkSize - users scored per pass
+ * @param {Function} options.onPartial - called after each pass with
+ *   { user_details, processed_count, total_users } for incremental rendering
  */
-export async function getTeamSummaryReport(month, teamId = null) {
+export async function getTeamSummaryReport(month, teamId = null, options = {}) {
+  const { chunkSize = TEAM_SUMMARY_CHUNK_SIZE, onPartial = null } = options;
+
   try {
     // Validate inputs
     const sanitizedMonth = sanitizeInput(month);
@@ -276,47 +341,27 @@ export async function getTeamSummaryReport(month, teamId = null) {
       return { error: 'Error fetching users', status: 500 };
     }
 
-    // Calculate metrics for each user
-    const userMetrics = await Promise.all(
-      users.map(async (user) => {
-        const userScore = await calculateUserMonthScore(user.id, parseInt(monthNum), parseInt(year));
-        const learning = await calculateLearningComponent(user.id, parseInt(monthNum), parseInt(year));
-        
-        // Check submission status
-        const { data: submissions, error: submissionsError } = await supabase
-          .from('monthly_rows')
-          .select('status, submitted_at')
-          .eq('user_id', user.id)
-          .eq('month', parseInt(monthNum))
-          .eq('year', parseInt(year));
-
-        const hasSubmissions = submissions && submissions.length > 0;
-        const onTimeSubmission = hasSubmissions && submissions.some(s => 
-          s.status !== 'draft' && s.submitted_at
-        );
-        const learningCompliant = learning.learning_minutes >= 360;
-
-        return {
-          user_id: user.id,
-          name: user.name,
-          user_type: user.user_type,
-          user_month_score: userScore.user_month_score,
-          learning_minutes: learning.learning_minutes,
-          learning_compliant: learningCompliant,
-          has_submissions: hasSubmissions,
-          on_time_submission: onTimeSubmission
-        };
-      })
-    );
-
-    // Calculate team aggregates
-    const totalUsers = userMetrics.length;
-    const onTimeSubmissions = userMetrics.filter(u => u.on_time_submission).length;
-    const learningCompliant = userMetrics.filter(u => u.learning_compliant).length;
-    const averageScore = totalUsers > 0 ? 
-      userMetrics.reduce((sum, u) => sum + u.user_month_score, 0) / totalUsers : 0;
-    const averageLearningMinutes = totalUsers > 0 ?
-      userMetrics.reduce((sum, u) => sum + u.learning_minutes, 0) / totalUsers : 0;
+    // Score the team a chunk at a time: one set-based load per chunk, no per-user queries
+    const userMetrics = [];
+    const passSize = Math.max(1, chunkSize);
+    for (let i = 0; i < users.length; i += passSize) {
+      const chunk = users.slice(i, i + passSize);
+      const data = await loadMonthScoringData(parseInt(monthNum), parseInt(year), chunk.map(user => user.id));
+      const scores = computeMonthScores(data);
+
+      const chunkMetrics = chunk.map(user =>
+        buildTeamMemberMetrics(user, scores.get(user.id), data.rowsByUser.get(user.id))
+      );
+      userMetrics.push(...chunkMetrics);
+
+      if (onPartial) {
+        onPartial({
+          user_details: chunkMetrics,
+          processed_count: userMetrics.length,
+          total_users: users.length
+        });
+      }
+    }
 
     return {
       period: {
@@ -324,15 +369,7 @@ export async function getTeamSummaryReport(month, teamId = null) {
         year: parseInt(year),
         month_name: new Date(parseInt(year), parseInt(monthNum) - 1).toLocaleString('default', { month: 'long' })
       },
-      team_metrics: {
-        total_users: totalUsers,
-        on_time_submissions_count: onTimeSubmissions,
-        on_time_submissions_percentage: totalUsers > 0 ? Math.round((onTimeSubmissions / totalUsers) * 100) : 0,
-        learning_compliant_count: learningCompliant,
-        learning_compliance_percentage: totalUsers > 0 ? Math.round((learningCompliant / totalUsers) * 100) : 0,
-        average_user_month_score: Math.round(averageScore * 100) / 100,
-        average_learning_minutes: Math.round(averageLearningMinutes)
-      },
+      team_metrics: buildTeamMetrics(userMetrics),
       user_details: userMetrics,
       generated_at: new Date().toISOString(),
       status: 200
@@ -343,36 +380,87 @@ export async function getTeamSummaryReport(month, teamId = null) {
   }
 }
 
+/**
+ * Shape a job run into the batch compute response
+ */
+function buildBatchResponse(run, totalProcessed) {
+  return {
+    job_id: run.job_id,
+    job_status: run.status,
+    total_processed: totalProcessed,
+    successful_count: run.succeeded.length,
+    failed_count: run.failed.length,
+    successful_users: run.succeeded.map(userId => ({ user_id: userId, success: true, scores: run.scores.get(userId) })),
+    failed_users: run.failed.map(({ user_id, error }) => ({ user_id, success: false, error })),
+    processed_at: new Date().toISOString()
+  };
+}
+
 /**
  * Batch compute scores for multiple users
- * Useful for end-of-month processing
+ * Useful for end-of-month processing. Runs as a persisted job (see
+ * scoreComputeJobs): bounded concurrency, retries on transient errors,
+ * resumable with resumeBatchCompute if interrupted.
+ *
+ * @param {string[]} userIds
+ * @param {number} month
+ * @param {number} year
+ * @param {Object} options - runScoreComputeJob options plus createdBy
  */
-export async function batchComputeScores(userIds, month, year) {
+export async function batchComputeScores(userIds, month, year, options = {}) {
   try {
-    const results = await Promise.all(
-      userIds.map(async (userId) => {
-        try {
-          const scores = await recomputeUserMonth(userId, month, year);
-          return { user_id: userId, success: true, scores };
-        } catch (error) {
-          return { user_id: userId, success: false, error: error.message };
-        }
-      })
-    );
-
-    const successful = results.filter(r => r.success);
-    const failed = results.filter(r => !r.success);
+    const job = await createScoreComputeJob(month, year, userIds, { createdBy: options.createdBy });
+    const run = await runScoreComputeJob(job.id, options);
+    return buildBatchResponse(run, job.total_users);
+  } catch (error) {
+    console.error('Error in batch compute scores:', error);
+    return { error: error.message };
+  }
+}
 
+/**
+ * POST /jobs/score-compute/{id}/resume
+ * Continue an interrupted batch compute with the users it has not finished
+ */
+export async function resumeBatchCompute(jobId, options = {}) {
+  try {
+    const sanitizedJobId = sanitizeInput(jobId);
+    if (!sanitizedJobId) {
+      return { error: 'Invalid job ID', status: 400 };
+    }
+
+    const run = await runScoreComputeJob(sanitizedJobId, options);
+    return { ...buildBatchResponse(run, run.succeeded.length + run.failed.length), status: 200 };
+  } catch (error) {
+    console.error('Error resuming batch compute:', error);
+    return { error: error.message, status: 500 };
+  }
+}
+
+/**
+ * GET /jobs/score-compute/{id}
+ * Progress of a batch compute job for the manager UI to poll
+ */
+export async function getBatchComputeProgress(jobId) {
+  try {
+    const sanitizedJobId = sanitizeInput(jobId);
+    if (!sanitizedJobId) {
+      return { error: 'Invalid job ID', status: 400 };
+    }
+
+    const progress = await getScoreComputeJobProgress(sanitizedJobId);
+    if (!progress) {
+      return { error: 'Job not found', status: 404 };
+    }
+
+    const finished = progress.succeeded + progress.failed;
     return {
-      total_processed: userIds.length,
-      successful_count: successful.length,
-      failed_count: failed.length,
-      successful_users: successful,
-      failed_users: failed,
-      processed_at: new Date().toISOString()
+      job: progress,
+      percent_complete: progress.total_users > 0 ? Math.round((finished / progress.total_users) * 100) : 100,
+      status: 200
     };
   } catch (error) {
-    console.error('Error in batch compute scores:', error);
-    return { error: error.message };
+    console.error('Error fetching batch compute progress:', error);
+    return { error: error.message, status: 500 };
   }
-}
\ No newline at end of file
+}
@@ -9,7 +9,7 @@ import { getOrCreateEmployee } from '../utils/createEmployeesTable.js';
 const AddEmployeeModal = ({ onClose, onSuccess }) => {
   const { supabase } = useSupabase();
   const { showToast } = useToast();
-  const { addEmployee } = useDataSync();
+  const { addEmployee } = useDataSync({ sync: [] });
   
   const [formData, setFormData] = useState({
     name: '',
@@ -1,17 +1,66 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { useSupabase } from './SupabaseProvider';
-import { useDataSync } from './DataSyncContext';
+import { useDataSync, mapOnboardingRecordToClient } from './DataSyncContext';
 import { useEmployeeSync } from '@/features/employees/context/EmployeeSyncContext';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
 import { useToast } from '@/shared/components/Toast';
-import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, LineChart, Line } from 'recharts';
+import { fetchListPage, parseListQuery, applyListQueryToRows } from '@/shared/lib/listQuery';
+import { useCursorPagination, useCursorInfiniteList } from '@/shared/hooks/useCursorPagination';
+import { toListQuery } from '@/utils/filterUtils';
+import { LazyRecharts } from '@/shared/components/LazyVendor';
+import { VirtualTable } from '@/shared/components/VirtualTable';
+import { useDirectoryStats } from '@/shared/hooks/useDirectoryStats';
+
+const CLIENTS_PER_PAGE = 24;
+
+// Directory page query against client_directory_entries (client_onboarding plus
+// the derived category, handler and status); only the visible page is fetched
+const CLIENT_DIRECTORY_SPEC = {
+  filters: ['directory_category', 'directory_status'],
+  sortable: ['company_name', 'created_at'],
+  searchColumns: ['company_name', 'business_name', 'business_description', 'directory_handler'],
+  defaultSort: '-created_at'
+};
+
+// Same contract over enriched local clients when there is no Supabase
+const ENHANCED_CLIENT_SPEC = {
+  filters: ['category', 'status'],
+  sortable: ['created_at'],
+  searchColumns: ['name', 'description', 'handler'],
+  defaultSort: '-created_at'
+};
+
+// Local-mode equivalent of get_client_directory_stats
+const summarizeClients = (clients) => {
+  const handlers = new Map();
+  clients.forEach(client => {
+    const handler = client.handler || 'Unassigned';
+    handlers.set(handler, (handlers.get(handler) || 0) + 1);
+  });
+
+  return {
+    total: clients.length,
+    active: clients.filter(c => c.status === 'active').length,
+    avg_satisfaction: Math.round(clients.reduce((sum, c) => sum + c.satisfactionScore, 0) / clients.length || 0),
+    categories: Object.fromEntries(['Enterprise', 'Premium', 'Marketing', 'Standard']
+      .map(category => [category, clients.filter(c => c.category === category).length])),
+    handlers: Array.from(handlers, ([name, count]) => ({ name, count })),
+    top_satisfaction: clients
+      .map(client => ({ name: client.name, satisfaction: client.satisfactionScore, category: client.category }))
+      .sort((a, b) => b.satisfaction - a.satisfaction)
+      .slice(0, 10)
+  };
+};
 
 const ClientDirectory = ({ onBack }) => {
-  const supabase = useSupabase();
+  const { supabase } = useSupabase();
   const { notify } = useToast();
   
-  // Use context data with real-time sync
-  const { clients, loading: clientsLoading, error: clientsError } = useDataSync();
+  // The client list is only synced in local mode; with Supabase pages and
+  // figures are queried from client_directory_entries
+  const { clients, updateClient, loading: clientsLoading, error: clientsError } = useDataSync({
+    sync: supabase ? [] : ['clients']
+  });
   const { employees, loading: employeesLoading } = useEmployeeSync();
   
   const loading = clientsLoading || employeesLoading;
@@ -129,48 +178,215 @@ const ClientDirectory = ({ onBack }) => {
   };
 
   // Enhanced client data with calculations
-  const enhancedClients = clients.map(client => ({
+  const enhanceClient = (client) => ({
     ...client,
     category: categorizeClient(client),
     handler: getProjectHandler(client),
     satisfactionScore: generateSatisfactionScore(client),
     status: client.status || 'active',
     servicesCount: client.services?.length || 0
-  }));
+  });
 
-  // Filter clients
-  const filteredClients = enhancedClients.filter(client => {
-    const matchesSearch = client.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         client.description?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         client.handler?.toLowerCase().includes(searchTerm.toLowerCase());
-    
-    const matchesCategory = selectedCategory === 'all' || client.category === selectedCategory;
-    const matchesStatus = selectedStatus === 'all' || client.status === selectedStatus;
-    
-    return matchesSearch && matchesCategory && matchesStatus;
+  // Local clients are enriched in the browser; Supabase rows carry the same
+  // fields from the view
+  const enhancedClients = clients.map(enhanceClient);
+  const fromDirectoryEntry = (record) => ({
+    ...enhanceClient(mapOnboardingRecordToClient(record)),
+    category: record.directory_category,
+    handler: record.directory_handler,
+    status: record.directory_status,
+    satisfactionScore: record.directory_satisfaction
+  });
+
+  const [debouncedSearch, setDebouncedSearch] = useState('');
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  const fetchClientPage = useCallback(async (after) => {
+    if (!supabase) {
+      const params = {
+        ...toListQuery({ search: debouncedSearch, status: selectedStatus, customFilters: { category: selectedCategory } }),
+        after,
+        limit: CLIENTS_PER_PAGE,
+        count: true
+      };
+      return applyListQueryToRows(enhancedClients, parseListQuery(params, ENHANCED_CLIENT_SPEC));
+    }
+
+    const params = {
+      ...toListQuery({
+        search: debouncedSearch,
+        status: selectedStatus,
+        customFilters: { directory_category: selectedCategory }
+      }, { statusField: 'directory_status' }),
+      after,
+      limit: CLIENTS_PER_PAGE,
+      count: true
+    };
+    const page = await fetchListPage(supabase.from('client_directory_entries'), params, CLIENT_DIRECTORY_SPEC);
+    return { ...page, data: page.data.map(fromDirectoryEntry) };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [supabase, clients, employees, debouncedSearch, selectedCategory, selectedStatus]);
+
+  const queryDeps = [supabase, debouncedSearch, selectedCategory, selectedStatus];
+
+  // Cards page through the results; the table loads more rows as it scrolls
+  const {
+    rows: filteredClients,
+    total: filteredTotal,
+    pageIndex,
+    hasNext,
+    hasPrev,
+    nextPage,
+    prevPage,
+    reload: reloadPage,
+    loading: pageLoading
+  } = useCursorPagination(fetchClientPage, queryDeps, !loading && viewMode === 'cards');
+
+  const {
+    rows: tableClients,
+    total: tableTotal,
+    hasMore: tableHasMore,
+    loadMore: loadMoreClients,
+    reload: reloadTable,
+    loading: tableLoading
+  } = useCursorInfiniteList(fetchClientPage, queryDeps, !loading && viewMode === 'table');
+
+  // Cards and charts are aggregated in Postgres; table changes refresh them
+  // along with the rows on screen
+  const { stats: serverStats } = useDirectoryStats(supabase, 'get_client_directory_stats', {
+    table: 'client_onboarding',
+    onChange: () => {
+      if (viewMode === 'cards') reloadPage();
+      if (viewMode === 'table') reloadTable();
+    }
   });
+  const directoryStats = supabase ? serverStats : summarizeClients(enhancedClients);
+  const statsLoading = Boolean(supabase) && !serverStats;
+
+  // In local mode, refresh the visible rows when the synced list changes
+  const syncedOnceRef = useRef(false);
+  useEffect(() => {
+    if (!syncedOnceRef.current) {
+      syncedOnceRef.current = true;
+      return;
+    }
+    if (viewMode === 'cards') reloadPage();
+    if (viewMode === 'table') reloadTable();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [clients]);
+
+  const totalMatches = filteredTotal ?? filteredClients.length;
 
   // Chart data
+  const categoryCounts = directoryStats?.categories || {};
   const categoryData = [
-    { name: 'Enterprise', value: enhancedClients.filter(c => c.category === 'Enterprise').length, color: '#8B5CF6' },
-    { name: 'Premium', value: enhancedClients.filter(c => c.category === 'Premium').length, color: '#06B6D4' },
-    { name: 'Marketing', value: enhancedClients.filter(c => c.category === 'Marketing').length, color: '#10B981' },
-    { name: 'Standard', value: enhancedClients.filter(c => c.category === 'Standard').length, color: '#F59E0B' }
+    { name: 'Enterprise', value: categoryCounts.Enterprise || 0, color: '#8B5CF6' },
+    { name: 'Premium', value: categoryCounts.Premium || 0, color: '#06B6D4' },
+    { name: 'Marketing', value: categoryCounts.Marketing || 0, color: '#10B981' },
+    { name: 'Standard', value: categoryCounts.Standard || 0, color: '#F59E0B' }
   ];
 
-  const satisfactionData = enhancedClients.map(client => ({
-    name: client.name?.substring(0, 15) + (client.name?.length > 15 ? '...' : ''),
-    satisfaction: client.satisfactionScore,
-    category: client.category
-  })).sort((a, b) => b.satisfaction - a.satisfaction).slice(0, 10);
+  const satisfactionData = (directoryStats?.top_satisfaction || []).map(client => ({
+    ...client,
+    name: client.name?.substring(0, 15) + (client.name?.length > 15 ? '...' : '')
+  }));
+
+  const handlerData = directoryStats?.handlers || [];
 
-  const handlerData = Object.entries(
-    enhancedClients.reduce((acc, client) => {
-      const handler = client.handler || 'Unassigned';
-      acc[handler] = (acc[handler] || 0) + 1;
-      return acc;
-    }, {})
-  ).map(([name, count]) => ({ name, count }));
+  const clientColumns = [
+    {
+      key: 'client',
+      header: 'Client',
+      width: 280,
+      pinned: true,
+      render: (client) => (
+        <div>
+          <div className="text-sm font-medium text-gray-900">{client.name}</div>
+          <div className="text-sm text-gray-500 truncate max-w-xs">{client.description}</div>
+        </div>
+      )
+    },
+    {
+      key: 'category',
+      header: 'Category',
+      width: 150,
+      className: 'whitespace-nowrap',
+      render: (client) => (
+        <span className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
+          client.category === 'Enterprise' ? 'bg-purple-100 text-purple-800' :
+          client.category === 'Premium' ? 'bg-cyan-100 text-cyan-800' :
+          client.category === 'Marketing' ? 'bg-green-100 text-green-800' :
+          'bg-orange-100 text-orange-800'
+        }`}>
+          {client.category}
+        </span>
+      )
+    },
+    {
+      key: 'handler',
+      header: 'Handler',
+      width: 200,
+      className: 'whitespace-nowrap text-sm text-gray-900',
+      render: (client) => (
+        <select
+          value={client.handler}
+          onChange={(e) => handleHandlerChange(client.id, e.target.value)}
+          className="border rounded px-2 py-1 text-sm bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-blue-500"
+        >
+          <option value="Unassigned">Unassigned</option>
+          {employees.map(emp => (
+            <option key={emp.id} value={emp.name}>{emp.name}</option>
+          ))}
+        </select>
+      )
+    },
+    {
+      key: 'status',
+      header: 'Status',
+      width: 140,
+      className: 'whitespace-nowrap',
+      render: (client) => (
+        <span className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
+          client.status === 'active' ? 'bg-green-100 text-green-800' :
+          client.status === 'completed' ? 'bg-blue-100 text-blue-800' :
+          client.status === 'paused' ? 'bg-yellow-100 text-yellow-800' :
+          'bg-red-100 text-red-800'
+        }`}>
+          {client.status}
+        </span>
+      )
+    },
+    {
+      key: 'satisfaction',
+      header: 'Satisfaction',
+      width: 180,
+      className: 'whitespace-nowrap',
+      render: (client) => (
+        <div className="flex items-center">
+          <div className="w-16 bg-gray-200 rounded-full h-2 mr-2">
+            <div 
+              className={`h-2 rounded-full ${
+                client.satisfactionScore >= 80 ? 'bg-green-500' :
+                client.satisfactionScore >= 60 ? 'bg-yellow-500' : 'bg-red-500'
+              }`}
+              style={{ width: `${client.satisfactionScore}%` }}
+            ></div>
+          </div>
+          <span className="text-sm text-gray-900">{client.satisfactionScore}%</span>
+        </div>
+      )
+    },
+    {
+      key: 'budget',
+      header: 'Budget',
+      width: 140,
+      className: 'whitespace-nowrap text-sm text-gray-900',
+      render: (client) => (client.budget ? `$${client.budget.toLocaleString()}` : 'N/A')
+    }
+  ];
 
   const ClientCard = ({ client }) => {
     const statusColors = {
@@ -259,7 +475,7 @@ const ClientDirectory = ({ onBack }) => {
   }
 
   // Empty state when no clients exist
-  if (!loading && enhancedClients.length === 0) {
+  if (!loading && !statsLoading && (directoryStats?.total ?? 0) === 0) {
     return (
       <div className="min-h-screen bg-gray-50 p-6">
         <div className="max-w-7xl mx-auto">
@@ -350,7 +566,7 @@ const ClientDirectory = ({ onBack }) => {
               <span className="text-blue-600 text-lg">👥</span>
             </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{clients.length}</p>
+              <p className="text-2xl font-bold text-gray-900">{directoryStats?.total ?? 0}</p>
               <p className="text-sm text-gray-600">Total Clients</p>
             </div>
           </div>
@@ -362,7 +578,7 @@ const ClientDirectory = ({ onBack }) => {
               <span className="text-green-600 text-lg">✅</span>
             </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{enhancedClients.filter(c => c.status === 'active').length}</p>
+              <p className="text-2xl font-bold text-gray-900">{directoryStats?.active ?? 0}</p>
               <p className="text-sm text-gray-600">Active Projects</p>
             </div>
           </div>
@@ -375,7 +591,7 @@ const ClientDirectory = ({ onBack }) => {
             </div>
             <div>
               <p className="text-2xl font-bold text-gray-900">
-                {Math.round(enhancedClients.reduce((sum, c) => sum + c.satisfactionScore, 0) / enhancedClients.length || 0)}%
+                {directoryStats?.avg_satisfaction ?? 0}%
               </p>
               <p className="text-sm text-gray-600">Avg Satisfaction</p>
             </div>
@@ -388,7 +604,7 @@ const ClientDirectory = ({ onBack }) => {
               <span className="text-orange-600 text-lg">💼</span>
             </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{enhancedClients.filter(c => c.category === 'Enterprise').length}</p>
+              <p className="text-2xl font-bold text-gray-900">{categoryCounts.Enterprise || 0}</p>
               <p className="text-sm text-gray-600">Enterprise Projects</p>
             </div>
           </div>
@@ -476,25 +692,29 @@ const ClientDirectory = ({ onBack }) => {
           <div className="bg-white rounded-xl shadow-sm border p-6">
             <h3 className="text-lg font-semibold text-gray-900 mb-4">Project Categories</h3>
             <div className="h-80">
-              <ResponsiveContainer width="100%" height="100%">
-                <PieChart>
-                  <Pie
-                    data={categoryData}
-                    cx="50%"
-                    cy="50%"
-                    labelLine={false}
-                    label={({ name, value, percent }) => `${name}: ${value} (${(percent * 100).toFixed(0)}%)`}
-                    outerRadius={80}
-                    fill="#8884d8"
-                    dataKey="value"
-                  >
-                    {categoryData.map((entry, index) => (
-                      <Cell key={`cell-${index}`} fill={entry.color} />
-                    ))}
-                  </Pie>
-                  <Tooltip />
-                </PieChart>
-              </ResponsiveContainer>
+              <LazyRecharts>
+                {({ PieChart, Pie, Cell, Tooltip, ResponsiveContainer }) => (
+                  <ResponsiveContainer width="100%" height="100%">
+                    <PieChart>
+                      <Pie
+                        data={categoryData}
+                        cx="50%"
+                        cy="50%"
+                        labelLine={false}
+                        label={({ name, value, percent }) => `${name}: ${value} (${(percent * 100).toFixed(0)}%)`}
+                        outerRadius={80}
+                        fill="#8884d8"
+                        dataKey="value"
+                      >
+                        {categoryData.map((entry, index) => (
+                          <Cell key={`cell-${index}`} fill={entry.color} />
+                        ))}
+                      </Pie>
+                      <Tooltip />
+                    </PieChart>
+                  </ResponsiveContainer>
+                )}
+              </LazyRecharts>
             </div>
           </div>
 
@@ -502,15 +722,19 @@ const ClientDirectory = ({ onBack }) => {
           <div className="bg-white rounded-xl shadow-sm border p-6">
             <h3 className="text-lg font-semibold text-gray-900 mb-4">Client Satisfaction Scores (Top 10)</h3>
             <div className="h-80">
-              <ResponsiveContainer width="100%" height="100%">
-                <BarChart data={satisfactionData}>
-                  <CartesianGrid strokeDasharray="3 3" />
-                  <XAxis dataKey="name" angle={-45} textAnchor="end" height={100} />
-                  <YAxis domain={[0, 100]} />
-                  <Tooltip />
-                  <Bar dataKey="satisfaction" fill="#10B981" />
-                </BarChart>
-              </ResponsiveContainer>
+              <LazyRecharts>
+                {({ BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer }) => (
+                  <ResponsiveContainer width="100%" height="100%">
+                    <BarChart data={satisfactionData}>
+                      <CartesianGrid strokeDasharray="3 3" />
+                      <XAxis dataKey="name" angle={-45} textAnchor="end" height={100} />
+                      <YAxis domain={[0, 100]} />
+                      <Tooltip />
+                      <Bar dataKey="satisfaction" fill="#10B981" />
+                    </BarChart>
+                  </ResponsiveContainer>
+                )}
+              </LazyRecharts>
             </div>
           </div>
 
@@ -518,108 +742,49 @@ const ClientDirectory = ({ onBack }) => {
           <div className="bg-white rounded-xl shadow-sm border p-6">
             <h3 className="text-lg font-semibold text-gray-900 mb-4">Projects by Handler</h3>
             <div className="h-80">
-              <ResponsiveContainer width="100%" height="100%">
-                <BarChart data={handlerData}>
-                  <CartesianGrid strokeDasharray="3 3" />
-                  <XAxis dataKey="name" />
-                  <YAxis />
-                  <Tooltip />
-                  <Bar dataKey="count" fill="#06B6D4" />
-                </BarChart>
-              </ResponsiveContainer>
+              <LazyRecharts>
+                {({ BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer }) => (
+                  <ResponsiveContainer width="100%" height="100%">
+                    <BarChart data={handlerData}>
+                      <CartesianGrid strokeDasharray="3 3" />
+                      <XAxis dataKey="name" />
+                      <YAxis />
+                      <Tooltip />
+                      <Bar dataKey="count" fill="#06B6D4" />
+                    </BarChart>
+                  </ResponsiveContainer>
+                )}
+              </LazyRecharts>
             </div>
           </div>
         </div>
       ) : viewMode === 'table' ? (
         <div className="bg-white rounded-xl shadow-sm border overflow-hidden">
-          <div className="overflow-x-auto">
-            <table className="min-w-full divide-y divide-gray-200">
-              <thead className="bg-gray-50">
-                <tr>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Client</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Category</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Handler</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Status</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Satisfaction</th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Budget</th>
-                </tr>
-              </thead>
-              <tbody className="bg-white divide-y divide-gray-200">
-                {filteredClients.map((client) => (
-                  <tr key={client.id} className="hover:bg-gray-50">
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <div>
-                        <div className="text-sm font-medium text-gray-900">{client.name}</div>
-                        <div className="text-sm text-gray-500 truncate max-w-xs">{client.description}</div>
-                      </div>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <span className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
-                        client.category === 'Enterprise' ? 'bg-purple-100 text-purple-800' :
-                        client.category === 'Premium' ? 'bg-cyan-100 text-cyan-800' :
-                        client.category === 'Marketing' ? 'bg-green-100 text-green-800' :
-                        'bg-orange-100 text-orange-800'
-                      }`}>
-                        {client.category}
-                      </span>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                      <select
-                        value={client.handler}
-                        onChange={(e) => handleHandlerChange(client.id, e.target.value)}
-                        className="border rounded px-2 py-1 text-sm bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-blue-500"
-                      >
-                        <option value="Unassigned">Unassigned</option>
-                        {employees.map(emp => (
-                          <option key={emp.id} value={emp.name}>{emp.name}</option>
-                        ))}
-                      </select>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <span className={`inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium ${
-                        client.status === 'active' ? 'bg-green-100 text-green-800' :
-                        client.status === 'completed' ? 'bg-blue-100 text-blue-800' :
-                        client.status === 'paused' ? 'bg-yellow-100 text-yellow-800' :
-                        'bg-red-100 text-red-800'
-                      }`}>
-                        {client.status}
-                      </span>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <div className="flex items-center">
-                        <div className="w-16 bg-gray-200 rounded-full h-2 mr-2">
-                          <div 
-                            className={`h-2 rounded-full ${
-                              client.satisfactionScore >= 80 ? 'bg-green-500' :
-                              client.satisfactionScore >= 60 ? 'bg-yellow-500' : 'bg-red-500'
-                            }`}
-                            style={{ width: `${client.satisfactionScore}%` }}
-                          ></div>
-                        </div>
-                        <span className="text-sm text-gray-900">{client.satisfactionScore}%</span>
-                      </div>
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                      {client.budget ? `$${client.budget.toLocaleString()}` : 'N/A'}
-                    </td>
-                  </tr>
-                ))}
-              </tbody>
-            </table>
+          <div className="px-6 py-3 border-b text-sm text-gray-600">
+            Showing {tableClients.length} of {tableTotal ?? tableClients.length} clients
           </div>
+          <VirtualTable
+            columns={clientColumns}
+            rows={tableClients}
+            estimateRowHeight={73}
+            onEndReached={loadMoreClients}
+            hasMore={tableHasMore}
+            loading={tableLoading}
+            emptyMessage="No clients match the current filters."
+          />
         </div>
       ) : (
         <div>
           <div className="mb-4">
             <p className="text-gray-600">
-              Showing {filteredClients.length} of {clients.length} clients
+              Showing {filteredClients.length} of {totalMatches} clients
               {selectedCategory !== 'all' && ` in ${selectedCategory} category`}
               {selectedStatus !== 'all' && ` with ${selectedStatus} status`}
               {searchTerm && ` matching "${searchTerm}"`}
             </p>
           </div>
 
-          {filteredClients.length === 0 ? (
+          {!pageLoading && filteredClients.length === 0 ? (
             <div className="bg-white rounded-xl shadow-sm border p-12 text-center">
               <div className="text-6xl mb-4">📊</div>
               <h3 className="text-xl font-semibold text-gray-900 mb-2">No clients found</h3>
@@ -650,6 +815,29 @@ const ClientDirectory = ({ onBack }) => {
           )}
         </div>
       )}
+
+      {/* Pagination Controls */}
+      {viewMode === 'cards' && (hasPrev || hasNext) && (
+        <div className="mt-8 flex items-center justify-center gap-2">
+          <button
+            onClick={prevPage}
+            disabled={!hasPrev || pageLoading}
+            className="px-3 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            ← Previous
+          </button>
+          <span className="px-3 py-2 text-sm text-gray-500">
+            Page {pageIndex + 1} of {Math.max(1, Math.ceil(totalMatches / CLIENTS_PER_PAGE))}
+          </span>
+          <button
+            onClick={nextPage}
+            disabled={!hasNext || pageLoading}
+            className="px-3 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            Next →
+          </button>
+        </div>
+      )}
     </div>
   );
 };
@@ -3,13 +3,14 @@ import { supabase } from '@/shared/lib/supabase';
 import { ClientOnboardingService } from '@/services/clientOnboardingService';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
 import { useToast } from '@/shared/components/Toast';
+import { useFormDraft } from '@/shared/hooks/useFormDraft';
+import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
+
+// Kept in this browser's draft only, never sent to the server draft
+const LOCAL_ONLY_DRAFT_FIELDS = ['websiteCredentials', 'adsCredentials', 'socialMediaAccess', 'previousSeoReport', 'logoFiles'];
 
 const ClientOnboardingForm = ({ onBack }) => {
   const [formData, setFormData] = useState({
-    // Form metadata
-    formId: Date.now().toString(),
-    lastSaved: null,
-    completionPercentage: 0,
     // Basic Information (Required fields marked with *)
     clientName: '', // *
     businessType: '',
@@ -258,9 +259,35 @@ const ClientOnboardingForm = ({ onBack }) => {
   const [submitSuccess, setSubmitSuccess] = useState(false);
   const [submitError, setSubmitError] = useState(null);
   const [validationErrors, setValidationErrors] = useState({});
-  const [isAutoSaving, setIsAutoSaving] = useState(false);
-  const [lastAutoSave, setLastAutoSave] = useState(null);
   const { notify } = useToast();
+  const { user } = useUnifiedAuth();
+
+  // Draft auto-save: edits are coalesced and only changed fields are saved,
+  // locally and on the server (when signed in); the same draft open in another
+  // tab is merged in
+  const draft = useFormDraft({
+    formId: 'client_onboarding',
+    owner: user?.id || 'anonymous',
+    ...(user ? {} : { transport: null }),
+    data: formData,
+    setData: setFormData,
+    enabled: !!(formData.clientName || formData.primaryEmail), // Only save once the form has some data
+    delay: 2000,
+    localOnlyFields: LOCAL_ONLY_DRAFT_FIELDS,
+    onRestore: () => notify('Form data restored from previous session', 'info')
+  });
+  const { conflicts: draftConflicts, dismissConflicts } = draft;
+
+  useEffect(() => {
+    if (draftConflicts.length === 0) return;
+    const fields = [...new Set(draftConflicts.map(conflict => conflict.field))].join(', ');
+    notify({
+      title: 'Draft also edited elsewhere',
+      message: `Kept your latest changes to: ${fields}`,
+      type: 'warning'
+    });
+    dismissConflicts();
+  }, [draftConflicts, dismissConflicts, notify]);
 
   // Industry options with specific terminology
   const industryOptions = [
@@ -474,31 +501,6 @@ const ClientOnboardingForm = ({ onBack }) => {
     return industry ? industry.customerTerm : 'Customer';
   };
 
-  // Auto-save functionality
-  const autoSaveForm = async () => {
-    if (isAutoSaving) return;
-    
-    setIsAutoSaving(true);
-    try {
-      const autoSaveData = {
-        ...formData,
-        lastSaved: new Date().toISOString(),
-        completionPercentage: calculateCompletionPercentage()
-      };
-      
-      localStorage.setItem(`onboarding_form_${formData.formId}`, JSON.stringify(autoSaveData));
-      setLastAutoSave(new Date());
-      
-      // Optional: Save to database as draft
-      // await ClientOnboardingService.saveDraft(autoSaveData);
-      
-    } catch (error) {
-      console.error('Auto-save failed:', error);
-    } finally {
-      setIsAutoSaving(false);
-    }
-  };
-
   // Calculate form completion percentage
   const calculateCompletionPercentage = () => {
     const requiredFields = [
@@ -647,43 +649,6 @@ const ClientOnboardingForm = ({ onBack }) => {
     return Object.keys(newErrors).length === 0;
   };
 
-  // Auto-save effect
-  useEffect(() => {
-    const autoSaveInterval = setInterval(() => {
-      if (formData.clientName || formData.primaryEmail) { // Only auto-save if form has some data
-        autoSaveForm();
-      }
-    }, 30000); // Auto-save every 30 seconds
-
-    return () => clearInterval(autoSaveInterval);
-  }, [formData]);
-
-  // Form restoration effect
-  useEffect(() => {
-    const savedFormData = localStorage.getItem(`onboarding_form_${formData.formId}`);
-    if (savedFormData) {
-      try {
-        const parsedData = JSON.parse(savedFormData);
-        setFormData(parsedData);
-        setLastAutoSave(new Date(parsedData.lastSaved));
-        notify('Form data restored from previous session', 'info');
-      } catch (error) {
-        console.error('Failed to restore form data:', error);
-      }
-    }
-  }, []);
-
-  // Auto-save on form data change (debounced)
-  useEffect(() => {
-    const timeoutId = setTimeout(() => {
-      if (formData.clientName || formData.primaryEmail) {
-        autoSaveForm();
-      }
-    }, 2000); // Auto-save 2 seconds after user stops typing
-
-    return () => clearTimeout(timeoutId);
-  }, [formData]);
-
   // Handle form submission
   const handleSubmit = async () => {
     if (!validateStep(currentStep)) return;
@@ -746,7 +711,7 @@ const ClientOnboardingForm = ({ onBack }) => {
       });
       
       // Clear auto-saved data
-      localStorage.removeItem(`onboarding_form_${formData.formId}`);
+      await draft.clear();
       
       // Redirect to client directory after 2 seconds
       setTimeout(() => {
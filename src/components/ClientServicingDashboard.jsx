@@ -12,6 +12,26 @@ import clientServicingService from '@/services/clientServicingService';
 import AdvancedFilters from './shared/AdvancedFilters';
 import { applyFilters, createFilterOptions, exportToCSV } from '@/utils/filterUtils';
 
+// Entries are scored per client and month in clientServicingService, so they
+// have no server-side dataset and are exported from the page
+const ENTRY_EXPORT_COLUMNS = [
+  { field: 'month', label: 'Month' },
+  { field: 'client_name', label: 'Client' },
+  { field: 'client_type', label: 'Type' },
+  { field: 'meetings_count', label: 'Meetings' },
+  { field: 'sla_closure_rate', label: 'SLA Closure %' },
+  { field: 'breach_rate', label: 'Breach %' },
+  { field: 'escalations_count', label: 'Escalations' },
+  { field: 'nps_client', label: 'NPS' },
+  { field: 'upsell_discussions', label: 'Upsell Discussions' },
+  { field: 'upsells_closed', label: 'Upsells Closed' },
+  { field: 'renewal_stage', label: 'Renewal Stage' },
+  { field: 'account_health_score', label: 'Account Health' },
+  { field: 'month_score', label: 'Month Score' },
+  { field: 'churn_risk_flag', label: 'Churn Risk' },
+  { field: 'status', label: 'Status' }
+];
+
 const ClientServicingDashboard = () => {
   const { toast } = useToast();
   const [user] = useState({
@@ -409,7 +429,7 @@ const ClientServicingDashboard = () => {
             filters={filters}
             onFiltersChange={setFilters}
             filterOptions={filterOptions}
-            onExport={() => exportToCSV(filteredEntries, 'client-servicing-performance')}
+            onExport={() => exportToCSV(filteredEntries, ENTRY_EXPORT_COLUMNS, 'client-servicing-performance.csv')}
             customFilters={[
               {
                 key: 'riskLevel',
@@ -6,7 +6,7 @@ import { useDataSync } from './DataSyncContext';
 export const ConfigurationManager = () => {
   const { user } = useUnifiedAuth();
   const { showToast } = useToast();
-  const { syncData } = useDataSync();
+  const { syncData } = useDataSync({ sync: [] });
   const [configurations, setConfigurations] = useState({
     general: {
       companyName: 'BP Agency',
@@ -1,15 +1,54 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef, useCallback } from 'react';
 import { useSupabase } from './SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
+import { realtimeHub } from '@/shared/services/realtimeHub';
 
 const DataSyncContext = createContext();
 
+// Synced list -> source table. A list is only downloaded and kept live while
+// at least one mounted useDataSync() caller asks for it.
+const SYNC_SOURCES = {
+  clients: 'client_onboarding',
+  employees: 'employees'
+};
+const ALL_LISTS = Object.keys(SYNC_SOURCES);
+
+// Map a client_onboarding record to the client shape used by the directory
+export const mapOnboardingRecordToClient = (record) => ({
+  id: record.id,
+  name: record.company_name || record.business_name || 'Unnamed Client',
+  description: record.business_description || record.company_description || 'No description available',
+  type: record.business_type || 'Standard',
+  industry: record.industry,
+  services: record.services_selected ? 
+    (Array.isArray(record.services_selected) ? record.services_selected : [record.services_selected]) : [],
+  status: record.submission_status === 'submitted' ? 'active' : 'pending',
+  assigned_employee: record.assigned_team,
+  contact_person: record.contact_person,
+  email: record.email,
+  phone: record.phone,
+  website: record.website,
+  location: record.location || `${record.city || ''}, ${record.state || ''}`.trim().replace(/^,\s*|,\s*$/g, ''),
+  created_at: record.created_at,
+  updated_at: record.updated_at,
+  // Additional fields from onboarding
+  target_audience: record.target_audience,
+  business_goals: record.business_goals,
+  marketing_budget: record.marketing_budget,
+  current_challenges: record.current_challenges
+});
+
 export const DataSyncProvider = ({ children }) => {
   const { supabase } = useSupabase();
   const { notify } = useToast();
   const [clients, setClients] = useState([]);
   const [employees, setEmployees] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const [loaded, setLoaded] = useState({ clients: false, employees: false });
+  const demandRef = useRef({ clients: 0, employees: 0 });
+  const unsubscribeRef = useRef({});
+  const syncedClientRef = useRef(supabase);
+
+  const markLoaded = (list) => setLoaded(prev => (prev[list] ? prev : { ...prev, [list]: true }));
 
   // Fetch clients from client_onboarding table
   const fetchClients = async () => {
@@ -17,6 +56,7 @@ export const DataSyncProvider = ({ children }) => {
       console.log('No Supabase client - loading clients from localStorage');
       const localClients = JSON.parse(localStorage.getItem('clients') || '[]');
       setClients(localClients);
+      markLoaded('clients');
       return;
     }
     
@@ -29,34 +69,14 @@ export const DataSyncProvider = ({ children }) => {
       if (error) throw error;
       
       // Map client_onboarding data to client format for directory
-      const mappedClients = (data || []).map(record => ({
-        id: record.id,
-        name: record.company_name || record.business_name || 'Unnamed Client',
-        description: record.business_description || record.company_description || 'No description available',
-        type: record.business_type || 'Standard',
-        industry: record.industry,
-        services: record.services_selected ? 
-          (Array.isArray(record.services_selected) ? record.services_selected : [record.services_selected]) : [],
-        status: record.submission_status === 'submitted' ? 'active' : 'pending',
-        assigned_employee: record.assigned_team,
-        contact_person: record.contact_person,
-        email: record.email,
-        phone: record.phone,
-        website: record.website,
-        location: record.location || `${record.city || ''}, ${record.state || ''}`.trim().replace(/^,\s*|,\s*$/g, ''),
-        created_at: record.created_at,
-        updated_at: record.updated_at,
-        // Additional fields from onboarding
-        target_audience: record.target_audience,
-        business_goals: record.business_goals,
-        marketing_budget: record.marketing_budget,
-        current_challenges: record.current_challenges
-      }));
+      const mappedClients = (data || []).map(mapOnboardingRecordToClient);
       
       setClients(mappedClients);
     } catch (error) {
       console.error('Error fetching clients from client_onboarding:', error);
       notify('Failed to fetch clients', 'error');
+    } finally {
+      markLoaded('clients');
     }
   };
 
@@ -66,6 +86,7 @@ export const DataSyncProvider = ({ children }) => {
       console.log('No Supabase client - loading employees from localStorage');
       const localEmployees = JSON.parse(localStorage.getItem('employees') || '[]');
       setEmployees(localEmployees);
+      markLoaded('employees');
       return;
     }
     
@@ -80,6 +101,8 @@ export const DataSyncProvider = ({ children }) => {
     } catch (error) {
       console.error('Error fetching employees:', error);
       notify('Failed to fetch employees', 'error');
+    } finally {
+      markLoaded('employees');
     }
   };
 
@@ -117,58 +140,55 @@ export const DataSyncProvider = ({ children }) => {
     setEmployees(prev => prev.filter(employee => employee.id !== employeeId));
   };
 
-  // Initial data fetch and real-time subscriptions
+  // Latest fetchers for the sync callbacks below, which are created once
+  const fetchersRef = useRef({});
+  fetchersRef.current = { clients: fetchClients, employees: fetchEmployees };
+
+  const startSync = useCallback((list) => {
+    fetchersRef.current[list]();
+    if (syncedClientRef.current) {
+      unsubscribeRef.current[list] = realtimeHub.subscribe(
+        syncedClientRef.current,
+        { table: SYNC_SOURCES[list] },
+        () => fetchersRef.current[list]()
+      );
+    }
+  }, []);
+
+  const stopSync = useCallback((list) => {
+    unsubscribeRef.current[list]?.();
+    delete unsubscribeRef.current[list];
+  }, []);
+
+  // Reference-counted: the first caller for a list loads it and subscribes to
+  // its table, the last one to unmount unsubscribes
+  const retain = useCallback((lists) => {
+    lists.forEach(list => {
+      if (demandRef.current[list]++ === 0) startSync(list);
+    });
+    return () => lists.forEach(list => {
+      if (--demandRef.current[list] === 0) stopSync(list);
+    });
+  }, [startSync, stopSync]);
+
+  // Restart live lists when the Supabase client changes
   useEffect(() => {
-    const loadData = async () => {
-      setLoading(true);
-      await Promise.all([fetchClients(), fetchEmployees()]);
-      setLoading(false);
-    };
-    
-    loadData();
-
-    // Set up real-time subscriptions if supabase is available
-    if (supabase) {
-      // Subscribe to client_onboarding table changes
-      const clientSubscription = supabase
-        .channel('client_onboarding_changes')
-        .on('postgres_changes', {
-          event: '*',
-          schema: 'public',
-          table: 'client_onboarding'
-        }, (payload) => {
-          console.log('Client onboarding change detected:', payload);
-          // Refresh clients data when changes occur
-          fetchClients();
-        })
-        .subscribe();
-
-      // Subscribe to employees table changes
-      const employeeSubscription = supabase
-        .channel('employees_changes')
-        .on('postgres_changes', {
-          event: '*',
-          schema: 'public',
-          table: 'employees'
-        }, (payload) => {
-          console.log('Employee change detected:', payload);
-          // Refresh employees data when changes occur
-          fetchEmployees();
-        })
-        .subscribe();
-
-      // Cleanup subscriptions on unmount
-      return () => {
-        supabase.removeChannel(clientSubscription);
-        supabase.removeChannel(employeeSubscription);
-      };
+    if (syncedClientRef.current !== supabase) {
+      syncedClientRef.current = supabase;
+      ALL_LISTS.filter(list => demandRef.current[list] > 0).forEach(list => {
+        stopSync(list);
+        startSync(list);
+      });
     }
-  }, [supabase]);
+  }, [supabase, startSync, stopSync]);
+
+  useEffect(() => () => ALL_LISTS.forEach(stopSync), [stopSync]);
 
   const value = {
     clients,
     employees,
-    loading,
+    loaded,
+    retain,
     fetchClients,
     fetchEmployees,
     addClient,
@@ -186,10 +206,24 @@ export const DataSyncProvider = ({ children }) => {
   );
 };
 
-export const useDataSync = () => {
+/**
+ * Access the synced lists and their mutation helpers.
+ * @param {Object} options
+ * @param {string[]} options.sync - lists this component needs kept live
+ *   ('clients', 'employees'); pass [] when only the helpers are used
+ */
+export const useDataSync = ({ sync = ALL_LISTS } = {}) => {
   const context = useContext(DataSyncContext);
   if (!context) {
     throw new Error('useDataSync must be used within a DataSyncProvider');
   }
-  return context;
-};
\ No newline at end of file
+
+  const { retain, loaded } = context;
+  const syncKey = sync.join(',');
+  useEffect(() => (syncKey ? retain(syncKey.split(',')) : undefined), [retain, syncKey]);
+
+  return {
+    ...context,
+    loading: sync.some(list => !loaded[list])
+  };
+};
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { useSupabase } from './SupabaseProvider';
 import { useDataSync } from './DataSyncContext';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
@@ -7,6 +7,23 @@ import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useModal } from '@/shared/components/ModalContext';
 import { useEnhancedErrorHandling } from '../shared/hooks/useEnhancedErrorHandling';
 import AddEmployeeModal from './AddEmployeeModal';
+import { fetchListPage, parseListQuery, applyListQueryToRows } from '@/shared/lib/listQuery';
+import { useCursorPagination, useCursorInfiniteList } from '@/shared/hooks/useCursorPagination';
+import { VirtualList } from '@/shared/components/VirtualTable';
+import { toListQuery } from '@/utils/filterUtils';
+import { useDirectoryStats } from '@/shared/hooks/useDirectoryStats';
+
+// Directory page query against the employees table; only the visible page is fetched
+const EMPLOYEE_DIRECTORY_SPEC = {
+  fields: ['id', 'name', 'email', 'phone', 'department', 'role', 'profile_image_url', 'created_at'],
+  filters: ['department'],
+  sortable: ['name', 'department', 'created_at'],
+  searchColumns: ['name', 'email', 'department', 'role'],
+  defaultSort: 'name'
+};
+
+// The list view loads rows as it scrolls, so it fetches bigger pages than the grid
+const LIST_PAGE_SIZE = 50;
 
 const EmployeeDirectory = ({ onBack }) => {
   const { supabase } = useSupabase();
@@ -21,13 +38,16 @@ const EmployeeDirectory = ({ onBack }) => {
     showInfo
   } = useEnhancedErrorHandling();
   
-  // Use context data with real-time sync
-  const { employees, loading: employeesLoading, error: employeesError } = useDataSync();
+  // The roster is only synced in local mode; with Supabase the page, the
+  // cards and the department list each come from the database
+  const { employees, loading: employeesLoading, error: employeesError } = useDataSync({
+    sync: supabase ? [] : ['employees']
+  });
   const loading = employeesLoading;
   const [searchTerm, setSearchTerm] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
   const [selectedDepartment, setSelectedDepartment] = useState('all');
   const [viewMode, setViewMode] = useState('grid'); // 'grid' or 'list'
-  const [currentPage, setCurrentPage] = useState(1);
   const [itemsPerPage] = useState(12);
   const [showHierarchy, setShowHierarchy] = useState(false);
 
@@ -143,7 +163,7 @@ const EmployeeDirectory = ({ onBack }) => {
   // Hierarchy view component
   const HierarchyView = () => {
     const departmentGroups = departments.reduce((acc, dept) => {
-      acc[dept] = employees.filter(emp => emp.department === dept);
+      acc[dept] = hierarchyEmployees.filter(emp => emp.department === dept);
       return acc;
     }, {});
 
@@ -237,34 +257,116 @@ const EmployeeDirectory = ({ onBack }) => {
     );
   };
 
-  const filteredEmployees = employees.filter(employee => {
-    const roleString = Array.isArray(employee.role) 
-      ? employee.role.join(' ').toLowerCase() 
-      : (employee.role || '').toLowerCase();
-    
-    const matchesSearch = employee.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         employee.email?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         employee.department?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         roleString.includes(searchTerm.toLowerCase());
-    
-    const matchesDepartment = selectedDepartment === 'all' || employee.department === selectedDepartment;
-    
-    return matchesSearch && matchesDepartment;
+  // Debounce search so typing doesn't fire a query per keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+
+  // Filtering, sorting and paging run in the database; without Supabase
+  // (local mode) the same contract is evaluated over the synced list
+  const fetchEmployeePage = useCallback((after) => {
+    const params = {
+      ...toListQuery({ search: debouncedSearch, department: selectedDepartment }),
+      after,
+      limit: viewMode === 'list' ? LIST_PAGE_SIZE : itemsPerPage,
+      count: true
+    };
+
+    if (!supabase) {
+      return Promise.resolve(applyListQueryToRows(employees, parseListQuery(params, EMPLOYEE_DIRECTORY_SPEC)));
+    }
+    return fetchListPage(supabase.from('employees'), params, EMPLOYEE_DIRECTORY_SPEC);
+  }, [supabase, employees, debouncedSearch, selectedDepartment, itemsPerPage, viewMode]);
+
+  // The grid pages through the results; the list view loads more as it scrolls
+  const {
+    rows: paginatedEmployees,
+    total: filteredTotal,
+    pageIndex,
+    hasNext,
+    hasPrev,
+    nextPage,
+    prevPage,
+    reload: reloadPage,
+    loading: pageLoading
+  } = useCursorPagination(fetchEmployeePage, [debouncedSearch, selectedDepartment], !loading && viewMode === 'grid');
+
+  const {
+    rows: listEmployees,
+    total: listTotal,
+    hasMore: listHasMore,
+    loadMore: loadMoreEmployees,
+    reload: reloadList,
+    loading: listLoading
+  } = useCursorInfiniteList(fetchEmployeePage, [debouncedSearch, selectedDepartment], !loading && viewMode === 'list');
+
+  // Only the columns the org chart shows, fetched when it is opened
+  const [orgChartEmployees, setOrgChartEmployees] = useState([]);
+  const loadOrgChart = useCallback(async () => {
+    const { data, error } = await supabase
+      .from('employees')
+      .select('id, name, department, role, profile_image_url')
+      .order('name');
+    if (error) {
+      notify('Failed to load the team hierarchy', 'error');
+      return;
+    }
+    setOrgChartEmployees(data || []);
+  }, [supabase, notify]);
+
+  useEffect(() => {
+    if (showHierarchy && supabase) loadOrgChart();
+  }, [showHierarchy, supabase, loadOrgChart]);
+
+  // Cards and departments are aggregated in Postgres; table changes refresh
+  // them along with the rows on screen
+  const { stats: serverStats } = useDirectoryStats(supabase, 'get_employee_directory_stats', {
+    table: 'employees',
+    onChange: () => {
+      if (viewMode === 'grid') reloadPage();
+      if (viewMode === 'list') reloadList();
+      if (showHierarchy) loadOrgChart();
+    }
   });
 
-  // Get dynamic departments from actual employee data
-  const departments = [...new Set(employees.map(emp => emp.department).filter(Boolean))].sort();
-  
-  // Pagination logic
-  const totalPages = Math.ceil(filteredEmployees.length / itemsPerPage);
-  const startIndex = (currentPage - 1) * itemsPerPage;
-  const endIndex = startIndex + itemsPerPage;
-  const paginatedEmployees = filteredEmployees.slice(startIndex, endIndex);
-  
-  // Reset to first page when filters change
+  const directoryStats = supabase
+    ? {
+        total: serverStats?.total ?? 0,
+        withPhone: serverStats?.with_phone ?? 0,
+        whatsappReady: serverStats?.whatsapp_ready ?? 0,
+        departments: serverStats?.departments ?? []
+      }
+    : {
+        total: employees.length,
+        withPhone: employees.filter(emp => emp.phone).length,
+        whatsappReady: employees.filter(emp => emp.phone && emp.phone.length > 8).length,
+        departments: [...new Set(employees.map(emp => emp.department).filter(Boolean))].sort()
+      };
+  const { departments } = directoryStats;
+  const hierarchyEmployees = supabase ? orgChartEmployees : employees;
+
+  // In local mode, refresh the visible rows when the synced list changes
+  const syncedOnceRef = useRef(false);
   useEffect(() => {
-    setCurrentPage(1);
-  }, [searchTerm, selectedDepartment]);
+    if (!syncedOnceRef.current) {
+      syncedOnceRef.current = true;
+      return;
+    }
+    if (viewMode === 'grid') reloadPage();
+    if (viewMode === 'list') reloadList();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [employees]);
+
+  const isListView = viewMode === 'list';
+  const visibleEmployees = isListView ? listEmployees : paginatedEmployees;
+  const visibleLoading = isListView ? listLoading : pageLoading;
+  const totalMatches = (isListView ? listTotal : filteredTotal) ?? visibleEmployees.length;
+  const currentPage = pageIndex + 1;
+  const totalPages = Math.max(1, Math.ceil(totalMatches / itemsPerPage));
+  const startIndex = isListView ? 0 : pageIndex * itemsPerPage;
+  const endIndex = startIndex + visibleEmployees.length;
 
   const EmployeeCard = ({ employee }) => {
     const hasPhone = employee.phone && employee.phone.trim() !== '';
@@ -467,7 +569,7 @@ const EmployeeDirectory = ({ onBack }) => {
               <span className="text-blue-600 text-lg">👥</span>
             </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{employees.length}</p>
+              <p className="text-2xl font-bold text-gray-900">{directoryStats.total}</p>
               <p className="text-sm text-gray-600">Total Employees</p>
             </div>
           </div>
@@ -479,7 +581,7 @@ const EmployeeDirectory = ({ onBack }) => {
             <span className="text-gray-600 text-lg">📱</span>
           </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{employees.filter(emp => emp.phone).length}</p>
+              <p className="text-2xl font-bold text-gray-900">{directoryStats.withPhone}</p>
               <p className="text-sm text-gray-600">With Phone Numbers</p>
             </div>
           </div>
@@ -491,7 +593,7 @@ const EmployeeDirectory = ({ onBack }) => {
             <span className="text-gray-600 text-lg">💬</span>
           </div>
             <div>
-              <p className="text-2xl font-bold text-gray-900">{employees.filter(emp => emp.phone && emp.phone.length > 8).length}</p>
+              <p className="text-2xl font-bold text-gray-900">{directoryStats.whatsappReady}</p>
               <p className="text-sm text-gray-600">WhatsApp Ready</p>
             </div>
           </div>
@@ -574,11 +676,11 @@ const EmployeeDirectory = ({ onBack }) => {
       {/* Results */}
       <div className="mb-4 flex items-center justify-between">
         <p className="text-gray-600">
-          Showing {startIndex + 1}-{Math.min(endIndex, filteredEmployees.length)} of {filteredEmployees.length} employees
+          Showing {totalMatches === 0 ? 0 : startIndex + 1}-{endIndex} of {totalMatches} employees
           {selectedDepartment !== 'all' && ` in ${selectedDepartment}`}
           {searchTerm && ` matching "${searchTerm}"`}
         </p>
-        {totalPages > 1 && (
+        {!isListView && totalPages > 1 && (
           <div className="flex items-center gap-2">
             <span className="text-sm text-gray-500">Page {currentPage} of {totalPages}</span>
           </div>
@@ -588,7 +690,7 @@ const EmployeeDirectory = ({ onBack }) => {
       {/* Employee List */}
       {showHierarchy ? (
         <HierarchyView />
-      ) : filteredEmployees.length === 0 ? (
+      ) : !visibleLoading && visibleEmployees.length === 0 ? (
         <div className="bg-white rounded-xl shadow-sm border p-12 text-center">
           <div className="text-6xl mb-4">👥</div>
           <h3 className="text-xl font-semibold text-gray-900 mb-2">No employees found</h3>
@@ -609,61 +711,42 @@ const EmployeeDirectory = ({ onBack }) => {
             </button>
           )}
         </div>
+      ) : isListView ? (
+        <VirtualList
+          items={listEmployees}
+          renderItem={(employee) => <EmployeeListItem employee={employee} />}
+          estimateSize={98}
+          itemClassName="pb-4"
+          onEndReached={loadMoreEmployees}
+          hasMore={listHasMore}
+          loading={listLoading}
+        />
       ) : (
         <>
-          <div className={viewMode === 'grid' 
-            ? 'grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6'
-            : 'space-y-4'
-          }>
+          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
             {paginatedEmployees.map((employee) => (
               <div key={employee.id}>
-                {viewMode === 'grid' ? (
-                  <EmployeeCard employee={employee} />
-                ) : (
-                  <EmployeeListItem employee={employee} />
-                )}
+                <EmployeeCard employee={employee} />
               </div>
             ))}
           </div>
           
           {/* Pagination Controls */}
-          {totalPages > 1 && (
+          {(hasPrev || hasNext) && (
             <div className="mt-8 flex items-center justify-center gap-2">
               <button
-                onClick={() => setCurrentPage(prev => Math.max(prev - 1, 1))}
-                disabled={currentPage === 1}
+                onClick={prevPage}
+                disabled={!hasPrev || pageLoading}
                 className="px-3 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
               >
                 ← Previous
               </button>
               
-              <div className="flex items-center gap-1">
-                {Array.from({ length: totalPages }, (_, i) => i + 1).map(page => {
-                  if (totalPages <= 7 || page === 1 || page === totalPages || 
-                      (page >= currentPage - 1 && page <= currentPage + 1)) {
-                    return (
-                      <button
-                        key={page}
-                        onClick={() => setCurrentPage(page)}
-                        className={`px-3 py-2 rounded-lg ${
-                          currentPage === page
-                            ? 'bg-blue-500 text-white'
-                            : 'border border-gray-300 text-gray-700 hover:bg-gray-50'
-                        }`}
-                      >
-                        {page}
-                      </button>
-                    );
-                  } else if (page === currentPage - 2 || page === currentPage + 2) {
-                    return <span key={page} className="px-2 text-gray-400">...</span>;
-                  }
-                  return null;
-                })}
-              </div>
+              <span className="px-3 py-2 text-sm text-gray-500">Page {currentPage} of {totalPages}</span>
               
               <button
-                onClick={() => setCurrentPage(prev => Math.min(prev + 1, totalPages))}
-                disabled={currentPage === totalPages}
+                onClick={nextPage}
+                disabled={!hasNext || pageLoading}
                 className="px-3 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
               >
                 Next →
@@ -42,7 +42,7 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
     showInfo
   } = useEnhancedErrorHandling();
   
-  const { addSubmission, updateSubmission, addClient, refreshAllData } = useDataSync();
+  const { addSubmission, updateSubmission, addClient, refreshAllData } = useDataSync({ sync: [] });
 
   const [currentSubmission, setCurrentSubmission] = useState({ ...EMPTY_SUBMISSION, isDraft: true });
   const [previousSubmission, setPreviousSubmission] = useState(null);
@@ -69,7 +69,8 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
         setCurrentSubmission(data);
         feedback.showInfo(FEEDBACK_MESSAGES.DRAFT_LOAD_SUCCESS);
       }
-    }
+    },
+    onRemoteChange: (changes) => setCurrentSubmission(prev => ({ ...prev, ...changes }))
   });
   
   const FORM_STEPS = [
@@ -313,7 +314,6 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
         currentStep: currentStep,
         sessionInfo: {
           userAgent: navigator.userAgent,
-          timestamp: Date.now(),
           url: window.location.href
         }
       };
@@ -327,7 +327,7 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
       });
       
       // Use the new persistence service
-      const success = draftPersistence.saveDraft(draftData, {
+      const success = await draftPersistence.saveDraft(draftData, {
         forceImmediate: hasUnsavedChanges && currentStep > 1
       });
       
@@ -730,9 +730,9 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
   // Enhanced draft detection and crash recovery
   useEffect(() => {
     // Check for crashed sessions first
-    const checkForCrashes = () => {
+    const checkForCrashes = async () => {
       try {
-        const crashedDrafts = dataPersistence.checkCrashedSessions ? dataPersistence.checkCrashedSessions() : [];
+        const crashedDrafts = await dataPersistence.checkCrashedSessions();
         if (crashedDrafts.length > 0) {
           console.log('🚨 Found crashed drafts:', crashedDrafts);
           setShowCrashRecovery(true);
@@ -744,11 +744,11 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
     };
 
     // Check for existing drafts when employee changes
-    const checkForExistingDrafts = () => {
-      if (!selectedEmployee?.name || !selectedEmployee?.phone) return;
+    const checkForExistingDrafts = async () => {
+      if (!selectedEmployee?.name || !selectedEmployee?.phone) return false;
 
       try {
-        const userDrafts = draftPersistence.getUserDrafts(selectedEmployee.name, selectedEmployee.phone);
+        const userDrafts = await draftPersistence.getUserDrafts(selectedEmployee.name, selectedEmployee.phone);
         if (userDrafts.length > 0) {
           console.log('📄 Found existing drafts for user:', userDrafts);
           setPendingDrafts(userDrafts);
@@ -763,9 +763,9 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
 
     // Run checks on mount and employee change
     if (selectedEmployee) {
-      setTimeout(() => {
-        checkForCrashes();
-        if (!checkForExistingDrafts()) {
+      setTimeout(async () => {
+        await checkForCrashes();
+        if (!(await checkForExistingDrafts())) {
           // No drafts found, proceed with normal loading
           console.log('No existing drafts found, proceeding normally');
         }
@@ -826,20 +826,9 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
   useEffect(() => {
     const handleBeforeUnload = (e) => {
       if (selectedEmployee && hasUnsavedChanges) {
-        // Synchronous save attempt for page unload
-        try {
-          const autoSaveKey = getAutoSaveKey();
-          const autoSaveData = {
-            ...currentSubmission,
-            lastSaved: new Date().toISOString(),
-            currentStep: currentStep,
-            emergencySave: true
-          };
-          localStorage.setItem(autoSaveKey, JSON.stringify(autoSaveData));
-          console.log('💾 Emergency save on page unload');
-        } catch (error) {
-          console.error('❌ Emergency save failed:', error);
-        }
+        // Hand the latest edits to the draft store; it writes only the changed
+        // fields, and flushes on pagehide if the user leaves
+        autoSaveRef.current();
         
         // Show warning if user tries to leave with unsaved changes
         e.preventDefault();
@@ -862,7 +851,7 @@ export function EmployeeForm({ currentUser = null, isManagerEdit = false, onBack
       window.removeEventListener('beforeunload', handleBeforeUnload);
       document.removeEventListener('visibilitychange', handleVisibilityChange);
     };
-  }, [selectedEmployee, hasUnsavedChanges, autoSave, getAutoSaveKey, currentSubmission, currentStep]);
+  }, [selectedEmployee, hasUnsavedChanges, autoSave]);
 
   // Debounce score calculations to prevent constant re-renders
   const [debouncedSubmission, setDebouncedSubmission] = useState(currentSubmission);
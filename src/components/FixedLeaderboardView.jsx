@@ -1,12 +1,12 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
-import { useDataSync } from './DataSyncContext';
+import leaderboardService from '@/shared/services/leaderboardService';
 
 // Fixed Leaderboard View Component
 export const FixedLeaderboardView = ({ 
   title = 'Team Leaderboard',
-  period = 'monthly',
+  period = 'latest',
   metric = 'performance',
   showFilters = true,
   maxItems = 10,
@@ -14,20 +14,26 @@ export const FixedLeaderboardView = ({
 }) => {
   const { user, role } = useUnifiedAuth();
   const { notify } = useToast();
-  const { employees } = useDataSync();
   const [selectedPeriod, setSelectedPeriod] = useState(period);
   const [selectedMetric, setSelectedMetric] = useState(metric);
   const [leaderboardData, setLeaderboardData] = useState([]);
+  const [myPosition, setMyPosition] = useState([]);
   const [loading, setLoading] = useState(false);
 
-  // Available periods
-  const periods = [
-    { value: 'daily', label: 'Today', icon: '📅' },
-    { value: 'weekly', label: 'This Week', icon: '📊' },
-    { value: 'monthly', label: 'This Month', icon: '📈' },
-    { value: 'quarterly', label: 'This Quarter', icon: '📋' },
-    { value: 'yearly', label: 'This Year', icon: '🏆' }
-  ];
+  // Available periods: the latest ranked month or one of the last six months
+  const periods = useMemo(() => {
+    const now = new Date();
+    const months = [];
+    for (let i = 0; i < 6; i++) {
+      const date = new Date(now.getFullYear(), now.getMonth() - i, 1);
+      months.push({
+        value: `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`,
+        label: date.toLocaleDateString('en-US', { year: 'numeric', month: 'long' }),
+        icon: '📅'
+      });
+    }
+    return [{ value: 'latest', label: 'Latest Month', icon: '📈' }, ...months];
+  }, []);
 
   // Available metrics
   const metrics = [
@@ -49,71 +55,58 @@ export const FixedLeaderboardView = ({
     'consistent': { icon: '🎯', title: 'Consistency Award', color: 'text-purple-500' }
   };
 
-  // Generate sample leaderboard data
-  useEffect(() => {
-    generateLeaderboardData();
-  }, [selectedPeriod, selectedMetric, employees]);
-
-  const generateLeaderboardData = () => {
+  // Load rankings from the materialized leaderboard
+  const loadLeaderboardData = useCallback(async () => {
     setLoading(true);
-    
-    // Simulate API call delay
-    setTimeout(() => {
-      const sampleData = employees.map((employee, index) => {
-        const baseScore = Math.random() * 100;
-        const periodMultiplier = {
-          daily: 0.8 + Math.random() * 0.4,
-          weekly: 0.7 + Math.random() * 0.6,
-          monthly: 0.6 + Math.random() * 0.8,
-          quarterly: 0.5 + Math.random() * 1.0,
-          yearly: 0.4 + Math.random() * 1.2
-        }[selectedPeriod] || 1;
-        
-        const metricMultiplier = {
-          performance: 1.0,
-          sales: 0.8 + Math.random() * 0.4,
-          productivity: 0.9 + Math.random() * 0.2,
-          quality: 0.85 + Math.random() * 0.3,
-          collaboration: 0.7 + Math.random() * 0.6,
-          innovation: 0.6 + Math.random() * 0.8
-        }[selectedMetric] || 1;
-        
-        const score = Math.round(baseScore * periodMultiplier * metricMultiplier);
-        const previousScore = Math.round(score * (0.8 + Math.random() * 0.4));
-        const change = score - previousScore;
-        const changePercent = previousScore > 0 ? Math.round((change / previousScore) * 100) : 0;
-        
+
+    try {
+      const monthKey = selectedPeriod === 'latest' ? null : selectedPeriod;
+      const [topPerformers, neighbours] = await Promise.all([
+        leaderboardService.getTopPerformers({ monthKey, limit: maxItems }),
+        leaderboardService.getRankWithNeighbours(user?.id, { monthKey, radius: 1 })
+      ]);
+
+      const toRow = (entry, index) => {
+        const score = Math.round(entry.score);
+        const changePercent = Math.round(entry.change);
+
         return {
-          id: employee.id,
-          name: employee.name,
-          role: employee.role,
-          department: employee.department,
-          avatar: employee.avatar || `https://ui-avatars.com/api/?name=${encodeURIComponent(employee.name)}&background=random`,
-          score: score,
-          previousScore: previousScore,
-          change: change,
-          changePercent: changePercent,
-          trend: change > 0 ? 'up' : change < 0 ? 'down' : 'neutral',
-          achievements: generateAchievements(score, change, index),
-          details: generateMetricDetails(selectedMetric, score)
+          id: entry.employeeId,
+          name: entry.name,
+          role: entry.role,
+          department: entry.department,
+          avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(entry.name)}&background=random`,
+          score,
+          change: changePercent,
+          changePercent,
+          trend: entry.trend === 'stable' ? 'neutral' : entry.trend,
+          achievements: generateAchievements(score, changePercent, index),
+          details: generateMetricDetails(selectedMetric, score),
+          rank: entry.rank,
+          isTopPerformer: entry.rank <= 3,
+          award: getAward(entry.rank, changePercent)
         };
-      });
-      
-      // Sort by score descending
-      const sortedData = sampleData.sort((a, b) => b.score - a.score);
-      
-      // Add rankings and special awards
-      const rankedData = sortedData.map((item, index) => ({
-        ...item,
-        rank: index + 1,
-        isTopPerformer: index < 3,
-        award: getAward(index + 1, item.changePercent)
-      }));
-      
-      setLeaderboardData(rankedData.slice(0, maxItems));
+      };
+
+      const rankedData = topPerformers.map(toRow);
+      const shownIds = new Set(rankedData.map(item => item.id));
+
+      setLeaderboardData(rankedData);
+      // Only show the user's neighbourhood when they are outside the top list
+      setMyPosition(neighbours.some(entry => shownIds.has(entry.employeeId)) ? [] : neighbours.map(toRow));
+    } catch (error) {
+      console.error('Error loading leaderboard:', error);
+      notify('Failed to load leaderboard', 'error');
+      setLeaderboardData([]);
+      setMyPosition([]);
+    } finally {
       setLoading(false);
-    }, 500);
-  };
+    }
+  }, [selectedPeriod, selectedMetric, maxItems, user?.id, notify]);
+
+  useEffect(() => {
+    loadLeaderboardData();
+  }, [loadLeaderboardData]);
 
   const generateAchievements = (score, change, index) => {
     const achievements = [];
@@ -339,6 +332,27 @@ export const FixedLeaderboardView = ({
           </div>
         )}
         
+        {/* Current user's position when outside the top list */}
+        {!loading && myPosition.length > 0 && (
+          <div className="mt-6 pt-6 border-t border-slate-200">
+            <h3 className="text-sm font-semibold text-brand-text mb-2">Your Position</h3>
+            <div className="space-y-1">
+              {myPosition.map(employee => (
+                <div
+                  key={employee.id}
+                  className={`flex items-center justify-between px-4 py-2 rounded-lg ${
+                    employee.id === String(user?.id) ? 'bg-blue-50 border border-blue-200 font-semibold' : 'bg-slate-50'
+                  }`}
+                >
+                  <span className="w-12 text-brand-text-secondary">#{employee.rank}</span>
+                  <span className="flex-1 text-brand-text">{employee.name}</span>
+                  <span className="text-brand-text">{employee.score}</span>
+                </div>
+              ))}
+            </div>
+          </div>
+        )}
+
         {/* Footer */}
         {!loading && leaderboardData.length > 0 && (
           <div className="mt-6 pt-6 border-t border-slate-200">
@@ -348,7 +362,10 @@ export const FixedLeaderboardView = ({
               </span>
               
               <button
-                onClick={generateLeaderboardData}
+                onClick={() => {
+                  leaderboardService.clearCache();
+                  loadLeaderboardData();
+                }}
                 className="text-blue-600 hover:text-blue-800 font-medium"
               >
                 🔄 Refresh Data
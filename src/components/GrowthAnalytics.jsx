@@ -19,7 +19,7 @@ import {
   LightBulbIcon,
   FlagIcon
 } from '@heroicons/react/24/outline';
-import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, BarChart, Bar, PieChart, Pie, Cell } from 'recharts';
+import { LazyRecharts } from '@/shared/components/LazyVendor';
 
 // Performance Insight Card Component
 const InsightCard = ({ insight, type = 'info' }) => {
@@ -155,28 +155,32 @@ const TeamComparisonChart = ({ data, currentEmployeeId }) => {
   
   return (
     <div className="h-64">
-      <ResponsiveContainer width="100%" height="100%">
-        <BarChart data={chartData} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
-          <CartesianGrid strokeDasharray="3 3" />
-          <XAxis 
-            dataKey="name" 
-            angle={-45}
-            textAnchor="end"
-            height={80}
-            fontSize={12}
-          />
-          <YAxis />
-          <Tooltip 
-            formatter={(value, name) => [value.toFixed(1), 'Score']}
-            labelFormatter={(label) => `Employee: ${label}`}
-          />
-          <Bar 
-            dataKey="score" 
-            fill={(entry) => entry.isCurrentUser ? '#3B82F6' : '#E5E7EB'}
-            radius={[4, 4, 0, 0]}
-          />
-        </BarChart>
-      </ResponsiveContainer>
+      <LazyRecharts>
+        {({ XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, BarChart, Bar }) => (
+          <ResponsiveContainer width="100%" height="100%">
+            <BarChart data={chartData} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
+              <CartesianGrid strokeDasharray="3 3" />
+              <XAxis 
+                dataKey="name" 
+                angle={-45}
+                textAnchor="end"
+                height={80}
+                fontSize={12}
+              />
+              <YAxis />
+              <Tooltip 
+                formatter={(value, name) => [value.toFixed(1), 'Score']}
+                labelFormatter={(label) => `Employee: ${label}`}
+              />
+              <Bar 
+                dataKey="score" 
+                fill={(entry) => entry.isCurrentUser ? '#3B82F6' : '#E5E7EB'}
+                radius={[4, 4, 0, 0]}
+              />
+            </BarChart>
+          </ResponsiveContainer>
+        )}
+      </LazyRecharts>
     </div>
   );
 };
@@ -231,25 +235,29 @@ const SkillsBreakdown = ({ skills }) => {
 const PerformanceTimeline = ({ data }) => {
   return (
     <div className="h-64">
-      <ResponsiveContainer width="100%" height="100%">
-        <LineChart data={data} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
-          <CartesianGrid strokeDasharray="3 3" />
-          <XAxis dataKey="month" />
-          <YAxis domain={[0, 100]} />
-          <Tooltip 
-            formatter={(value) => [value.toFixed(1), 'Performance Score']}
-            labelFormatter={(label) => `Month: ${label}`}
-          />
-          <Line 
-            type="monotone" 
-            dataKey="score" 
-            stroke="#3B82F6" 
-            strokeWidth={3}
-            dot={{ fill: '#3B82F6', strokeWidth: 2, r: 4 }}
-            activeDot={{ r: 6, stroke: '#3B82F6', strokeWidth: 2 }}
-          />
-        </LineChart>
-      </ResponsiveContainer>
+      <LazyRecharts>
+        {({ LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer }) => (
+          <ResponsiveContainer width="100%" height="100%">
+            <LineChart data={data} margin={{ top: 20, right: 30, left: 20, bottom: 5 }}>
+              <CartesianGrid strokeDasharray="3 3" />
+              <XAxis dataKey="month" />
+              <YAxis domain={[0, 100]} />
+              <Tooltip 
+                formatter={(value) => [value.toFixed(1), 'Performance Score']}
+                labelFormatter={(label) => `Month: ${label}`}
+              />
+              <Line 
+                type="monotone" 
+                dataKey="score" 
+                stroke="#3B82F6" 
+                strokeWidth={3}
+                dot={{ fill: '#3B82F6', strokeWidth: 2, r: 4 }}
+                activeDot={{ r: 6, stroke: '#3B82F6', strokeWidth: 2 }}
+              />
+            </LineChart>
+          </ResponsiveContainer>
+        )}
+      </LazyRecharts>
     </div>
   );
 };
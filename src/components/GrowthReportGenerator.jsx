@@ -2,8 +2,10 @@ import React, { useState, useEffect } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useSupabase } from './SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
-import moment from 'moment';
+import { formatDate } from '@/shared/utils/dateUtils';
 import { exportReport, reportUtils } from '../utils/reportGenerator';
+import { getOrBuildGrowthReport } from '@/shared/lib/growthReport';
+import { authHeaders } from '@/api/authApi';
 
 /**
  * GrowthReportGenerator - Automated growth report generation and monthly scoring system
@@ -60,27 +62,8 @@ const GrowthReportGenerator = () => {
     setLoading(true);
     
     try {
-      const periodMonths = getPeriodMonths(selectedPeriod);
-      const kpiData = await fetchKPIData(selectedUser.user_id, periodMonths);
-      const monthlyData = await fetchMonthlyData(selectedUser.user_id, periodMonths);
-      
-      const report = {
-        user: selectedUser,
-        period: selectedPeriod,
-        generatedAt: new Date().toISOString(),
-        summary: calculateSummaryMetrics(kpiData, monthlyData),
-        trends: calculateTrends(kpiData),
-        insights: generateInsights(kpiData, selectedUser.role),
-        recommendations: generateRecommendations(kpiData, selectedUser.role),
-        monthlyBreakdown: generateMonthlyBreakdown(kpiData, monthlyData),
-        comparativeAnalysis: generateComparativeAnalysis(kpiData),
-        goalTracking: calculateGoalProgress(kpiData, selectedUser.role)
-      };
-      
-      setReportData(report);
-      
-      // Save report to database
-      await saveReportToDatabase(report);
+      const report = await fetchGrowthReport();
+      setReportData({ ...report, user: selectedUser });
       
       notify({ type: 'success', title: 'Success', message: 'Growth report generated successfully' });
       
@@ -92,394 +75,33 @@ const GrowthReportGenerator = () => {
     }
   };
   
-  // Get period months based on selection
-  const getPeriodMonths = (period) => {
-    const months = [];
-    let count = 0;
-    
-    switch (period) {
-      case '3months':
-        count = 3;
-        break;
-      case '6months':
-        count = 6;
-        break;
-      case '12months':
-        count = 12;
-        break;
-      default:
-        count = 6;
-    }
-    
-    for (let i = 0; i < count; i++) {
-      months.push(moment().subtract(i, 'months').format('YYYY-MM'));
-    }
-    
-    return months;
-  };
-  
-  // Fetch KPI data for the specified period
-  const fetchKPIData = async (userId, months) => {
-    const role = selectedUser.role;
-    let kpiTable = '';
-    
-    switch (role) {
-      case 'Super Admin':
-        kpiTable = 'superadmin_kpis';
-        break;
-      case 'HR':
-        kpiTable = 'hr_kpis';
-        break;
-      case 'Operations Head':
-        kpiTable = 'operations_head_kpis';
-        break;
-
-      case 'Intern':
-        kpiTable = 'intern_kpis';
-        break;
-      case 'Freelancer':
-        kpiTable = 'freelancer_kpis';
-        break;
-      default:
-        kpiTable = 'employee_kpis';
-    }
-    
-    const { data, error } = await supabase
-      .from(kpiTable)
-      .select('*')
-      .eq('user_id', userId)
-      .order('created_at', { ascending: false });
-      
-    if (error) throw error;
-    return data || [];
-  };
-  
-  // Fetch monthly submission data
-  const fetchMonthlyData = async (userId, months) => {
-    const { data, error } = await supabase
-      .from('submissions')
-      .select('*')
-      .eq('user_id', userId)
-      .order('created_at', { ascending: false });
-      
-    if (error) throw error;
-    return data || [];
-  };
-  
-  // Calculate summary metrics
-  const calculateSummaryMetrics = (kpiData, monthlyData) => {
-    if (!kpiData.length) return null;
-    
-    const latestKPI = kpiData[0];
-    const previousKPI = kpiData[1];
-    
-    // Calculate overall score based on role
-    const currentScore = calculateOverallScore(latestKPI, selectedUser.role);
-    const previousScore = previousKPI ? calculateOverallScore(previousKPI, selectedUser.role) : currentScore;
-    
-    return {
-      currentScore: Math.round(currentScore),
-      previousScore: Math.round(previousScore),
-      improvement: Math.round((currentScore - previousScore) * 10) / 10,
-      improvementPercentage: previousScore > 0 ? Math.round(((currentScore - previousScore) / previousScore) * 100) : 0,
-      totalDataPoints: kpiData.length,
-      averageScore: Math.round(kpiData.reduce((sum, kpi) => sum + calculateOverallScore(kpi, selectedUser.role), 0) / kpiData.length),
-      bestScore: Math.round(Math.max(...kpiData.map(kpi => calculateOverallScore(kpi, selectedUser.role)))),
-      consistency: calculateConsistency(kpiData)
+  // Fetch the report from the API server's report builder, which reads only
+  // the selected period and reuses the stored report while the data is unchanged.
+  // Falls back to the same builder in the browser when the API is unreachable.
+  const fetchGrowthReport = async () => {
+    const options = {
+      user: selectedUser,
+      reportType,
+      period: selectedPeriod,
+      generatedBy: authState.user.id
     };
-  };
-  
-  // Calculate overall score based on role
-  const calculateOverallScore = (kpiData, role) => {
-    if (!kpiData) return 0;
-    
-    switch (role) {
-      case 'Intern':
-        return (
-          (kpiData.skill_development || 0) +
-          (kpiData.learning_hours || 0) +
-          (kpiData.goal_completion || 0) +
-          (kpiData.mentor_rating || 0) +
-          (kpiData.project_quality || 0) +
-          (kpiData.technical_growth || 0) +
-          (kpiData.soft_skills || 0) +
-          (kpiData.initiative_score || 0)
-        ) / 8;
-      case 'Freelancer':
-        return (
-          (kpiData.client_satisfaction || 0) +
-          (kpiData.project_delivery || 0) +
-          (kpiData.quality_score || 0) +
-          (kpiData.communication_rating || 0) +
-          (kpiData.deadline_adherence || 0) +
-          (kpiData.technical_skills || 0) +
-          (kpiData.creativity_score || 0) +
-          (kpiData.earnings_growth || 0)
-        ) / 8;
-      default:
-        return (
-          (kpiData.client_satisfaction || 0) +
-          (kpiData.attendance || 0) +
-          (kpiData.punctuality_score || 0) +
-          (kpiData.team_collaboration || 0) +
-          (kpiData.initiative_score || 0) +
-          (kpiData.productivity_score || 0)
-        ) / 6;
-    }
-  };
-  
-  // Calculate trends
-  const calculateTrends = (kpiData) => {
-    if (kpiData.length < 2) return null;
-    
-    const trends = {};
-    const metrics = Object.keys(kpiData[0]).filter(key => 
-      !['id', 'user_id', 'created_at', 'updated_at'].includes(key) && 
-      typeof kpiData[0][key] === 'number'
-    );
-    
-    metrics.forEach(metric => {
-      const values = kpiData.map(kpi => kpi[metric] || 0).reverse();
-      const trend = calculateLinearTrend(values);
-      
-      trends[metric] = {
-        direction: trend > 0 ? 'upward' : trend < 0 ? 'downward' : 'stable',
-        slope: Math.round(trend * 100) / 100,
-        current: values[values.length - 1],
-        previous: values[values.length - 2] || 0,
-        change: values[values.length - 1] - (values[values.length - 2] || 0)
-      };
-    });
-    
-    return trends;
-  };
-  
-  // Calculate linear trend
-  const calculateLinearTrend = (values) => {
-    const n = values.length;
-    const x = Array.from({ length: n }, (_, i) => i);
-    const y = values;
-    
-    const sumX = x.reduce((a, b) => a + b, 0);
-    const sumY = y.reduce((a, b) => a + b, 0);
-    const sumXY = x.reduce((sum, xi, i) => sum + xi * y[i], 0);
-    const sumXX = x.reduce((sum, xi) => sum + xi * xi, 0);
-    
-    return (n * sumXY - sumX * sumY) / (n * sumXX - sumX * sumX);
-  };
-  
-  // Generate insights based on role and data
-  const generateInsights = (kpiData, role) => {
-    const insights = [];
-    
-    if (!kpiData.length) return insights;
-    
-    const latestKPI = kpiData[0];
-    const trends = calculateTrends(kpiData);
     
-    // Role-specific insights
-    switch (role) {
-      case 'Intern':
-        if (latestKPI.learning_hours > 80) {
-          insights.push({ type: 'positive', message: 'Excellent learning commitment with high learning hours' });
-        }
-        if (trends?.skill_development?.direction === 'upward') {
-          insights.push({ type: 'positive', message: 'Consistent skill development growth trend' });
-        }
-        if (latestKPI.mentor_rating < 60) {
-          insights.push({ type: 'warning', message: 'Mentor rating needs improvement - consider more engagement' });
-        }
-        break;
-      case 'Freelancer':
-        if (latestKPI.client_satisfaction > 85) {
-          insights.push({ type: 'positive', message: 'Outstanding client satisfaction scores' });
-        }
-        if (trends?.earnings_growth?.direction === 'upward') {
-          insights.push({ type: 'positive', message: 'Strong earnings growth trajectory' });
-        }
-        if (latestKPI.deadline_adherence < 70) {
-          insights.push({ type: 'warning', message: 'Deadline adherence needs attention for better client relationships' });
-        }
-        break;
-      default:
-        if (latestKPI.team_collaboration > 80) {
-          insights.push({ type: 'positive', message: 'Strong team collaboration skills' });
-        }
-        if (trends?.productivity_score?.direction === 'downward') {
-          insights.push({ type: 'warning', message: 'Productivity showing declining trend - may need support' });
-        }
-    }
-    
-    return insights;
-  };
-  
-  // Generate recommendations
-  const generateRecommendations = (kpiData, role) => {
-    const recommendations = [];
-    
-    if (!kpiData.length) return recommendations;
-    
-    const latestKPI = kpiData[0];
-    const trends = calculateTrends(kpiData);
-    
-    // Role-specific recommendations
-    switch (role) {
-      case 'Intern':
-        if (latestKPI.technical_growth < 70) {
-          recommendations.push('Focus on technical skill development through additional courses or projects');
-        }
-        if (latestKPI.soft_skills < 75) {
-          recommendations.push('Participate in team activities to improve soft skills and communication');
-        }
-        break;
-      case 'Freelancer':
-        if (latestKPI.project_delivery < 80) {
-          recommendations.push('Implement better project management practices to improve delivery scores');
-        }
-        if (latestKPI.creativity_score < 75) {
-          recommendations.push('Explore creative workshops or design thinking sessions');
-        }
-        break;
-      default:
-        if (latestKPI.client_satisfaction < 75) {
-          recommendations.push('Schedule regular client check-ins to improve satisfaction scores');
-        }
-        if (latestKPI.initiative_score < 70) {
-          recommendations.push('Take on more proactive tasks and suggest process improvements');
-        }
-    }
-    
-    return recommendations;
-  };
-  
-  // Generate monthly breakdown
-  const generateMonthlyBreakdown = (kpiData, monthlyData) => {
-    const breakdown = [];
-    
-    kpiData.forEach(kpi => {
-      const month = moment(kpi.created_at).format('YYYY-MM');
-      const monthlySubmission = monthlyData.find(data => 
-        moment(data.created_at).format('YYYY-MM') === month
-      );
-      
-      breakdown.push({
-        month: month,
-        monthName: moment(month).format('MMMM YYYY'),
-        overallScore: Math.round(calculateOverallScore(kpi, selectedUser.role)),
-        kpiData: kpi,
-        submissionData: monthlySubmission,
-        hasSubmission: !!monthlySubmission
-      });
-    });
-    
-    return breakdown.sort((a, b) => moment(b.month).diff(moment(a.month)));
-  };
-  
-  // Generate comparative analysis
-  const generateComparativeAnalysis = (kpiData) => {
-    if (kpiData.length < 2) return null;
-    
-    const latest = kpiData[0];
-    const previous = kpiData[1];
-    const comparison = {};
-    
-    Object.keys(latest).forEach(key => {
-      if (!['id', 'user_id', 'created_at', 'updated_at'].includes(key) && typeof latest[key] === 'number') {
-        comparison[key] = {
-          current: latest[key] || 0,
-          previous: previous[key] || 0,
-          change: (latest[key] || 0) - (previous[key] || 0),
-          changePercentage: previous[key] > 0 ? Math.round(((latest[key] - previous[key]) / previous[key]) * 100) : 0
-        };
-      }
-    });
-    
-    return comparison;
-  };
-  
-  // Calculate goal progress
-  const calculateGoalProgress = (kpiData, role) => {
-    if (!kpiData.length) return null;
-    
-    const latestKPI = kpiData[0];
-    const goals = getRoleSpecificGoals(role);
-    const progress = {};
-    
-    Object.keys(goals).forEach(metric => {
-      const currentValue = latestKPI[metric] || 0;
-      const targetValue = goals[metric];
-      
-      progress[metric] = {
-        current: currentValue,
-        target: targetValue,
-        progress: Math.min(Math.round((currentValue / targetValue) * 100), 100),
-        achieved: currentValue >= targetValue
-      };
-    });
-    
-    return progress;
-  };
-  
-  // Get role-specific goals
-  const getRoleSpecificGoals = (role) => {
-    switch (role) {
-      case 'Intern':
-        return {
-          skill_development: 80,
-          learning_hours: 75,
-          goal_completion: 85,
-          mentor_rating: 80,
-          technical_growth: 75
-        };
-      case 'Freelancer':
-        return {
-          client_satisfaction: 85,
-          project_delivery: 80,
-          quality_score: 85,
-          deadline_adherence: 90,
-          earnings_growth: 70
-        };
-      default:
-        return {
-          client_satisfaction: 80,
-          attendance: 90,
-          punctuality_score: 85,
-          team_collaboration: 80,
-          productivity_score: 75
-        };
-    }
-  };
-  
-  // Calculate consistency score
-  const calculateConsistency = (kpiData) => {
-    if (kpiData.length < 3) return 100;
-    
-    const scores = kpiData.map(kpi => calculateOverallScore(kpi, selectedUser.role));
-    const mean = scores.reduce((sum, score) => sum + score, 0) / scores.length;
-    const variance = scores.reduce((sum, score) => sum + Math.pow(score - mean, 2), 0) / scores.length;
-    const standardDeviation = Math.sqrt(variance);
-    
-    // Convert to consistency score (lower deviation = higher consistency)
-    return Math.max(0, Math.round(100 - (standardDeviation * 2)));
-  };
-  
-  // Save report to database
-  const saveReportToDatabase = async (report) => {
     try {
-      const { error } = await supabase
-        .from('growth_reports')
-        .insert({
-          user_id: report.user.user_id,
-          report_type: reportType,
-          period: selectedPeriod,
-          report_data: report,
-          generated_by: authState.user.id,
-          created_at: new Date().toISOString()
-        });
-        
-      if (error) throw error;
-    } catch (error) {
-      console.error('Error saving report to database:', error);
+      const params = new URLSearchParams({
+        user_id: selectedUser.user_id,
+        role: selectedUser.role || '',
+        name: selectedUser.name || '',
+        period: selectedPeriod,
+        report_type: reportType
+      });
+      const response = await fetch(`/api/reports/growth?${params}`, { headers: authHeaders() });
+      if (!response.ok) throw new Error(`Growth report API responded ${response.status}`);
+      const { data } = await response.json();
+      return data;
+    } catch (apiError) {
+      console.warn('Growth report API unavailable, building in browser:', apiError);
+      const { report } = await getOrBuildGrowthReport(supabase, options);
+      return report;
     }
   };
   
@@ -584,7 +206,7 @@ const GrowthReportGenerator = () => {
             <div className="flex items-center justify-between">
               <div>
                 <h2 className="text-2xl font-bold mb-2">{reportData.user.name} - Growth Report</h2>
-                <p className="text-blue-100">Role: {reportData.user.role} | Period: {selectedPeriod} | Generated: {moment(reportData.generatedAt).format('MMMM DD, YYYY')}</p>
+                <p className="text-blue-100">Role: {reportData.user.role} | Period: {selectedPeriod} | Generated: {formatDate(reportData.generatedAt, 'MMMM dd, yyyy')}</p>
               </div>
               <button
                 onClick={() => setShowExportModal(true)}
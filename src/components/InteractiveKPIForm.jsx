@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
 import { supabase } from '@/shared/lib/supabase';
-import moment from 'moment';
+import { formatMonth, monthKey, shiftMonth } from '@/shared/utils/dateUtils';
 import { 
   TrendingUp, 
   Target, 
@@ -29,7 +29,7 @@ const InteractiveKPIForm = ({
   const { notify } = useToast();
   const [loading, setLoading] = useState(false);
   const [saving, setSaving] = useState(false);
-  const [currentMonth, setCurrentMonth] = useState(monthYear || moment().format('YYYY-MM'));
+  const [currentMonth, setCurrentMonth] = useState(monthYear || monthKey());
   const [kpiData, setKpiData] = useState({
     // Client Management KPIs
     meetings_with_clients: 0,
@@ -117,7 +117,7 @@ const InteractiveKPIForm = ({
       }
 
       // Load previous month data for comparison
-      const prevMonth = moment(currentMonth).subtract(1, 'month').format('YYYY-MM');
+      const prevMonth = shiftMonth(currentMonth, -1);
       const { data: prevData } = await supabase
         .from('monthly_kpi_reports')
         .select('*')
@@ -388,7 +388,7 @@ const InteractiveKPIForm = ({
                 Interactive KPI Form
               </h2>
               <p className="text-sm text-gray-600 mt-1">
-                Update your key performance indicators for {moment(currentMonth).format('MMMM YYYY')}
+                Update your key performance indicators for {formatMonth(currentMonth)}
               </p>
             </div>
             <div className="flex items-center gap-3">
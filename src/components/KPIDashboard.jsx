@@ -3,7 +3,7 @@ import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
 import { supabase } from '@/shared/lib/supabase';
 import InteractiveKPIForm from './InteractiveKPIForm';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, shiftMonth } from '@/shared/utils/dateUtils';
 import {
   TrendingUp,
   TrendingDown,
@@ -33,7 +33,7 @@ const KPIDashboard = ({ employeeId = null, showForm = true, viewMode = 'dashboar
   const [kpiData, setKpiData] = useState([]);
   const [currentMonthData, setCurrentMonthData] = useState(null);
   const [showKPIForm, setShowKPIForm] = useState(false);
-  const [selectedMonth, setSelectedMonth] = useState(moment().format('YYYY-MM'));
+  const [selectedMonth, setSelectedMonth] = useState(monthKey());
   const [viewType, setViewType] = useState('overview'); // overview, trends, comparison
   const [filterPeriod, setFilterPeriod] = useState('6months'); // 3months, 6months, 1year
 
@@ -50,17 +50,17 @@ const KPIDashboard = ({ employeeId = null, showForm = true, viewMode = 'dashboar
       if (!targetEmployeeId) return;
 
       // Calculate date range based on filter period
-      const endDate = moment(selectedMonth);
-      let startDate;
+      const endMonth = selectedMonth;
+      let startMonth;
       switch (filterPeriod) {
         case '3months':
-          startDate = endDate.clone().subtract(3, 'months');
+          startMonth = shiftMonth(endMonth, -3);
           break;
         case '1year':
-          startDate = endDate.clone().subtract(12, 'months');
+          startMonth = shiftMonth(endMonth, -12);
           break;
         default: // 6months
-          startDate = endDate.clone().subtract(6, 'months');
+          startMonth = shiftMonth(endMonth, -6);
       }
 
       // Load historical data
@@ -68,8 +68,8 @@ const KPIDashboard = ({ employeeId = null, showForm = true, viewMode = 'dashboar
         .from('monthly_kpi_reports')
         .select('*')
         .eq('employee_id', targetEmployeeId)
-        .gte('month_year', startDate.format('YYYY-MM'))
-        .lte('month_year', endDate.format('YYYY-MM'))
+        .gte('month_year', startMonth)
+        .lte('month_year', endMonth)
         .order('month_year', { ascending: true });
 
       if (historicalError) throw historicalError;
@@ -214,7 +214,7 @@ const KPIDashboard = ({ employeeId = null, showForm = true, viewMode = 'dashboar
               <div key={data.month_year} className="space-y-2">
                 <div className="flex justify-between items-center">
                   <span className="text-sm font-medium text-gray-700">
-                    {moment(data.month_year).format('MMM YYYY')}
+                    {formatDate(data.month_year, 'MMM yyyy')}
                   </span>
                   <span className={`text-sm px-2 py-1 rounded-full ${performance.bgColor} text-${performance.color}-800`}>
                     {score.toFixed(1)}/10
@@ -251,7 +251,7 @@ const KPIDashboard = ({ employeeId = null, showForm = true, viewMode = 'dashboar
       <div className="bg-white p-6 rounded-xl shadow-sm border">
         <h3 className="text-lg font-semibold text-gray-900 mb-6 flex items-center gap-2">
           <Activity className="w-5 h-5 text-blue-600" />
-          Detailed Metrics - {moment(selectedMonth).format('MMMM YYYY')}
+          Detailed Metrics - {formatMonth(selectedMonth)}
         </h3>
         
         <div className="grid grid-cols-2 md:grid-cols-3 gap-4">
@@ -1,12 +1,97 @@
-import React, { useMemo, useState } from "react";
+import React, { useEffect, useMemo, useState } from "react";
+import leaderboardService from "@/shared/services/leaderboardService";
+
+function getBadge(score, submissionCount) {
+  if (score >= 9 && submissionCount >= 6) return { 
+    type: 'gold', 
+    icon: '🥇', 
+    label: 'Gold Champion',
+    className: 'bg-gradient-to-r from-yellow-400 to-yellow-600 text-white border-yellow-500'
+  };
+  if (score >= 8 && submissionCount >= 4) return { 
+    type: 'silver', 
+    icon: '🥈', 
+    label: 'Silver Star',
+    className: 'bg-gradient-to-r from-gray-300 to-gray-500 text-white border-gray-400'
+  };
+  if (score >= 7 && submissionCount >= 2) return { 
+    type: 'bronze', 
+    icon: '🥉', 
+    label: 'Bronze Achiever',
+    className: 'bg-gradient-to-r from-orange-400 to-orange-600 text-white border-orange-500'
+  };
+  if (score >= 6) return { 
+    type: 'rising', 
+    icon: '🌟', 
+    label: 'Rising Star',
+    className: 'bg-gradient-to-r from-purple-400 to-purple-600 text-white border-purple-500'
+  };
+  return { 
+    type: 'participant', 
+    icon: '💪', 
+    label: 'Active',
+    className: 'bg-gradient-to-r from-blue-400 to-blue-600 text-white border-blue-500'
+  };
+}
+
+// Materialized leaderboard rows in the shape of the submission-ranked rows.
+// KPI scores are out of 100; ranking scores are out of 10.
+function toRankedRow(entry) {
+  const rankingScore = entry.score > 10 ? entry.score / 10 : entry.score;
+  return {
+    name: entry.name,
+    phone: '',
+    department: entry.department,
+    rankingScore,
+    submissionCount: 1,
+    totalHours: entry.learningHours,
+    badge: getBadge(rankingScore, 1),
+    rank: entry.rank
+  };
+}
 
 export function LeaderboardView({ allSubmissions }) {
   const [selectedPeriod, setSelectedPeriod] = useState('all');
   const [selectedDepartment, setSelectedDepartment] = useState('All');
   const [selectedMetric, setSelectedMetric] = useState('overall');
+  const [rankedRows, setRankedRows] = useState([]);
+  const [rankedDepartments, setRankedDepartments] = useState([]);
+
+  // Without submissions from the caller, read the latest month from the
+  // materialized leaderboard instead of ranking client-side
+  const useMaterialized = !allSubmissions;
+
+  useEffect(() => {
+    if (!useMaterialized) return;
+
+    let cancelled = false;
+    leaderboardService
+      .getTopPerformers({
+        department: selectedDepartment === 'All' ? null : selectedDepartment,
+        limit: 50
+      })
+      .then(entries => {
+        if (cancelled) return;
+        const rows = entries.map(toRankedRow);
+        setRankedRows(rows);
+        // Keep the department list from the unfiltered view
+        if (selectedDepartment === 'All') {
+          setRankedDepartments([...new Set(rows.map(row => row.department))].filter(Boolean).sort());
+        }
+      })
+      .catch(error => {
+        console.error('Error loading leaderboard:', error);
+        if (!cancelled) setRankedRows([]);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [useMaterialized, selectedDepartment]);
 
   const leaderboardData = useMemo(() => {
-    if (!allSubmissions || allSubmissions.length === 0) return [];
+    if (useMaterialized) return rankedRows;
+    if (allSubmissions.length === 0) return [];
 
     let filteredSubmissions = allSubmissions;
     if (selectedPeriod !== 'all') {
@@ -93,45 +178,12 @@ export function LeaderboardView({ allSubmissions }) {
       .filter(emp => emp.rankingScore > 0)
       .sort((a, b) => b.rankingScore - a.rankingScore)
       .map((emp, index) => ({ ...emp, rank: index + 1 }));
-  }, [allSubmissions, selectedPeriod, selectedDepartment, selectedMetric]);
+  }, [useMaterialized, rankedRows, allSubmissions, selectedPeriod, selectedDepartment, selectedMetric]);
 
   const departments = useMemo(() => {
-    if (!allSubmissions) return [];
+    if (useMaterialized) return rankedDepartments;
     return [...new Set(allSubmissions.map(emp => emp.department))].filter(Boolean).sort();
-  }, [allSubmissions]);
-
-  const getBadge = (score, submissionCount) => {
-    if (score >= 9 && submissionCount >= 6) return { 
-      type: 'gold', 
-      icon: '🥇', 
-      label: 'Gold Champion',
-      className: 'bg-gradient-to-r from-yellow-400 to-yellow-600 text-white border-yellow-500'
-    };
-    if (score >= 8 && submissionCount >= 4) return { 
-      type: 'silver', 
-      icon: '🥈', 
-      label: 'Silver Star',
-      className: 'bg-gradient-to-r from-gray-300 to-gray-500 text-white border-gray-400'
-    };
-    if (score >= 7 && submissionCount >= 2) return { 
-      type: 'bronze', 
-      icon: '🥉', 
-      label: 'Bronze Achiever',
-      className: 'bg-gradient-to-r from-orange-400 to-orange-600 text-white border-orange-500'
-    };
-    if (score >= 6) return { 
-      type: 'rising', 
-      icon: '🌟', 
-      label: 'Rising Star',
-      className: 'bg-gradient-to-r from-purple-400 to-purple-600 text-white border-purple-500'
-    };
-    return { 
-      type: 'participant', 
-      icon: '💪', 
-      label: 'Active',
-      className: 'bg-gradient-to-r from-blue-400 to-blue-600 text-white border-blue-500'
-    };
-  };
+  }, [useMaterialized, rankedDepartments, allSubmissions]);
 
   return (
     <div className="space-y-6">
@@ -150,19 +202,21 @@ export function LeaderboardView({ allSubmissions }) {
 
       <div className="bg-white rounded-xl shadow-sm border p-6">
         <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
-          <div>
-            <label className="block text-sm font-medium text-gray-700 mb-2">Time Period</label>
-            <select
-              value={selectedPeriod}
-              onChange={(e) => setSelectedPeriod(e.target.value)}
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
-            >
-              <option value="all">All Time</option>
-              <option value="monthly">Last Month</option>
-              <option value="quarterly">Last Quarter</option>
-              <option value="yearly">Last Year</option>
-            </select>
-          </div>
+          {!useMaterialized && (
+            <div>
+              <label className="block text-sm font-medium text-gray-700 mb-2">Time Period</label>
+              <select
+                value={selectedPeriod}
+                onChange={(e) => setSelectedPeriod(e.target.value)}
+                className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
+              >
+                <option value="all">All Time</option>
+                <option value="monthly">Last Month</option>
+                <option value="quarterly">Last Quarter</option>
+                <option value="yearly">Last Year</option>
+              </select>
+            </div>
+          )}
           <div>
             <label className="block text-sm font-medium text-gray-700 mb-2">Department</label>
             <select
@@ -176,19 +230,21 @@ export function LeaderboardView({ allSubmissions }) {
               ))}
             </select>
           </div>
-          <div>
-            <label className="block text-sm font-medium text-gray-700 mb-2">Ranking Metric</label>
-            <select
-              value={selectedMetric}
-              onChange={(e) => setSelectedMetric(e.target.value)}
-              className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
-            >
-              <option value="overall">Overall Score</option>
-              <option value="kpi">KPI Performance</option>
-              <option value="learning">Learning & Development</option>
-              <option value="relationship">Client Relationships</option>
-            </select>
-          </div>
+          {!useMaterialized && (
+            <div>
+              <label className="block text-sm font-medium text-gray-700 mb-2">Ranking Metric</label>
+              <select
+                value={selectedMetric}
+                onChange={(e) => setSelectedMetric(e.target.value)}
+                className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500"
+              >
+                <option value="overall">Overall Score</option>
+                <option value="kpi">KPI Performance</option>
+                <option value="learning">Learning & Development</option>
+                <option value="relationship">Client Relationships</option>
+              </select>
+            </div>
+          )}
         </div>
       </div>
 
@@ -46,33 +46,38 @@ export const LeaveApplicationForm = ({ onSubmit, onCancel }) => {
 
   // Auto-save functionality
   const autoSaveKey = useAutoSaveKey('leave-application', currentUser?.email || 'anonymous');
-  const { saveData, loadSavedData, clearSavedData, autoSaveStatus, hasUnsavedChanges } = useAutoSave(
-    autoSaveKey,
+  const { saveNow, loadSavedData, clearSavedData, isSaving, lastSaved, hasUnsavedChanges } = useAutoSave(
     formData,
-    {
-      onSave: () => feedback.showInfo(FEEDBACK_MESSAGES.DRAFT_SAVE_SUCCESS, { duration: 2000 }),
-      onError: (error) => {
-        console.error('Auto-save failed:', error);
-        feedback.showError(FEEDBACK_MESSAGES.DRAFT_SAVE_ERROR);
-      }
+    autoSaveKey,
+    true,
+    2000,
+    () => feedback.showInfo(FEEDBACK_MESSAGES.DRAFT_SAVE_SUCCESS, { duration: 2000 }),
+    (error) => {
+      console.error('Auto-save failed:', error);
+      feedback.showError(FEEDBACK_MESSAGES.DRAFT_SAVE_ERROR);
     }
   );
+  const autoSaveStatus = isSaving ? 'saving' : (lastSaved && !hasUnsavedChanges ? 'saved' : 'idle');
 
   // Auto-populate user data when available and load saved data
   useEffect(() => {
+    let cancelled = false;
     // First try to load saved data
-    const savedData = loadSavedData();
-    if (savedData) {
-      setFormData(savedData);
-    } else if (currentUser) {
-      // Only populate user data if no saved data exists
-      setFormData(prev => ({
-        ...prev,
-        employeeName: currentUser.name || '',
-        officialEmail: currentUser.email || '',
-        department: currentUser.department || ''
-      }));
-    }
+    loadSavedData().then(savedData => {
+      if (cancelled) return;
+      if (savedData) {
+        setFormData(savedData);
+      } else if (currentUser) {
+        // Only populate user data if no saved data exists
+        setFormData(prev => ({
+          ...prev,
+          employeeName: currentUser.name || '',
+          officialEmail: currentUser.email || '',
+          department: currentUser.department || ''
+        }));
+      }
+    });
+    return () => { cancelled = true; };
   }, [currentUser, loadSavedData]);
 
   const handleInputChange = (field, value) => {
@@ -467,7 +472,7 @@ export const LeaveApplicationForm = ({ onSubmit, onCancel }) => {
           {hasUnsavedChanges && autoSaveStatus !== 'saving' && (
             <button
               type="button"
-              onClick={() => saveData()}
+              onClick={() => saveNow()}
               className="px-3 py-1 text-sm bg-blue-100 text-blue-700 rounded hover:bg-blue-200 transition-colors"
             >
               Save Now
@@ -18,6 +18,7 @@ import {
 } from 'lucide-react';
 import { supabase } from '../database/supabaseClient';
 import { workflowApi } from '../services/workflowApi';
+import { VirtualList } from '@/shared/components/VirtualTable';
 
 const ManagerWorkflowDashboard = ({ managerId }) => {
   const [activeTab, setActiveTab] = useState('pending_reviews');
@@ -86,6 +87,32 @@ const ManagerWorkflowDashboard = ({ managerId }) => {
     }
   };
 
+  const handleBulkApprove = async () => {
+    setActionLoading(true);
+    setError('');
+    setSuccess('');
+    
+    try {
+      const rowIds = pendingReviews.map(review => review.id);
+      const { results, errors, skipped, hookErrors } = await workflowApi.bulkApproveRows(rowIds, managerId, reviewNotes);
+      const approvedCount = results.length + skipped.length;
+      if (errors.length > 0) {
+        setError(`Approved ${approvedCount} of ${rowIds.length} rows. ${errors.length} failed: ${errors[0].error}`);
+      } else if (hookErrors.length > 0) {
+        setError(`Approved ${approvedCount} monthly rows, but follow-up steps failed for ${hookErrors.length}: ${hookErrors[0].error}`);
+      } else {
+        setSuccess(`Approved ${approvedCount} monthly rows!`);
+      }
+      setReviewNotes('');
+      await loadWorkflowData();
+      setTimeout(() => setSuccess(''), 3000);
+    } catch (err) {
+      setError('Failed to bulk approve: ' + err.message);
+    } finally {
+      setActionLoading(false);
+    }
+  };
+
   const handleReturn = async (monthlyRowId) => {
     if (!returnReason.trim()) {
       setError('Return reason is required');
@@ -513,34 +540,51 @@ const ManagerWorkflowDashboard = ({ managerId }) => {
                   <p>No pending reviews</p>
                 </div>
               ) : (
-                pendingReviews.map((review) => (
-                  <div
-                    key={review.id}
-                    className="border border-gray-200 rounded-lg p-4 hover:bg-gray-50 cursor-pointer"
-                    onClick={() => setSelectedItem({ type: 'review', data: review })}
-                  >
-                    <div className="flex items-center justify-between">
-                      <div className="flex items-center space-x-4">
-                        <User className="h-8 w-8 text-gray-400" />
-                        <div>
-                          <h3 className="font-medium text-gray-900">{review.users.full_name}</h3>
-                          <p className="text-sm text-gray-600">
-                            {new Date(review.year, review.month - 1).toLocaleDateString('en-IN', { month: 'long', year: 'numeric' })}
-                            {review.entities && ` • ${review.entities.name}`}
-                          </p>
-                        </div>
-                      </div>
-                      <div className="text-right">
-                        <div className="text-sm text-gray-500">
-                          Submitted {getTimeAgo(review.submitted_at)}
+                <>
+                {pendingReviews.length > 1 && (
+                  <div className="flex justify-end">
+                    <button
+                      onClick={handleBulkApprove}
+                      disabled={actionLoading}
+                      className="px-4 py-2 bg-green-600 text-white text-sm rounded-md hover:bg-green-700 disabled:opacity-50"
+                    >
+                      {actionLoading ? 'Approving...' : `Approve All (${pendingReviews.length})`}
+                    </button>
+                  </div>
+                )}
+                <VirtualList
+                  items={pendingReviews}
+                  estimateSize={98}
+                  itemClassName="pb-4"
+                  renderItem={(review) => (
+                    <div
+                      className="border border-gray-200 rounded-lg p-4 hover:bg-gray-50 cursor-pointer"
+                      onClick={() => setSelectedItem({ type: 'review', data: review })}
+                    >
+                      <div className="flex items-center justify-between">
+                        <div className="flex items-center space-x-4">
+                          <User className="h-8 w-8 text-gray-400" />
+                          <div>
+                            <h3 className="font-medium text-gray-900">{review.users.full_name}</h3>
+                            <p className="text-sm text-gray-600">
+                              {new Date(review.year, review.month - 1).toLocaleDateString('en-IN', { month: 'long', year: 'numeric' })}
+                              {review.entities && ` • ${review.entities.name}`}
+                            </p>
+                          </div>
                         </div>
-                        <div className="text-xs text-blue-600 font-medium">
-                          Click to review
+                        <div className="text-right">
+                          <div className="text-sm text-gray-500">
+                            Submitted {getTimeAgo(review.submitted_at)}
+                          </div>
+                          <div className="text-xs text-blue-600 font-medium">
+                            Click to review
+                          </div>
                         </div>
                       </div>
                     </div>
-                  </div>
-                ))
+                  )}
+                />
+                </>
               )}
             </div>
           )}
@@ -553,34 +597,38 @@ const ManagerWorkflowDashboard = ({ managerId }) => {
                   <p>No pending unlock requests</p>
                 </div>
               ) : (
-                unlockRequests.map((request) => (
-                  <div
-                    key={request.id}
-                    className="border border-yellow-200 bg-yellow-50 rounded-lg p-4 hover:bg-yellow-100 cursor-pointer"
-                    onClick={() => setSelectedItem({ type: 'unlock', data: request })}
-                  >
-                    <div className="flex items-center justify-between">
-                      <div className="flex items-center space-x-4">
-                        <AlertTriangle className="h-8 w-8 text-yellow-600" />
-                        <div>
-                          <h3 className="font-medium text-gray-900">{request.monthly_rows.users.full_name}</h3>
-                          <p className="text-sm text-gray-600">
-                            {new Date(request.monthly_rows.year, request.monthly_rows.month - 1).toLocaleDateString('en-IN', { month: 'long', year: 'numeric' })}
-                          </p>
-                          <p className="text-sm text-yellow-700 mt-1">{request.unlock_reason}</p>
-                        </div>
-                      </div>
-                      <div className="text-right">
-                        <div className="text-sm text-gray-500">
-                          Requested {getTimeAgo(request.requested_at)}
+                <VirtualList
+                  items={unlockRequests}
+                  estimateSize={122}
+                  itemClassName="pb-4"
+                  renderItem={(request) => (
+                    <div
+                      className="border border-yellow-200 bg-yellow-50 rounded-lg p-4 hover:bg-yellow-100 cursor-pointer"
+                      onClick={() => setSelectedItem({ type: 'unlock', data: request })}
+                    >
+                      <div className="flex items-center justify-between">
+                        <div className="flex items-center space-x-4">
+                          <AlertTriangle className="h-8 w-8 text-yellow-600" />
+                          <div>
+                            <h3 className="font-medium text-gray-900">{request.monthly_rows.users.full_name}</h3>
+                            <p className="text-sm text-gray-600">
+                              {new Date(request.monthly_rows.year, request.monthly_rows.month - 1).toLocaleDateString('en-IN', { month: 'long', year: 'numeric' })}
+                            </p>
+                            <p className="text-sm text-yellow-700 mt-1">{request.unlock_reason}</p>
+                          </div>
                         </div>
-                        <div className="text-xs text-yellow-600 font-medium">
-                          Click to review
+                        <div className="text-right">
+                          <div className="text-sm text-gray-500">
+                            Requested {getTimeAgo(request.requested_at)}
+                          </div>
+                          <div className="text-xs text-yellow-600 font-medium">
+                            Click to review
+                          </div>
                         </div>
                       </div>
                     </div>
-                  </div>
-                ))
+                  )}
+                />
               )}
             </div>
           )}
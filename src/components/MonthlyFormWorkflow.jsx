@@ -481,7 +481,8 @@ export const MonthlyFormWorkflow = ({ employee, onSubmit }) => {
         setLastAutoSave(new Date());
         feedback.showInfo(FEEDBACK_MESSAGES.DRAFT_LOAD_SUCCESS);
       }
-    }
+    },
+    onRemoteChange: (changes) => setFormData(prev => ({ ...prev, ...changes }))
   });
   
   // Refs for stable callbacks
@@ -627,11 +628,13 @@ export const MonthlyFormWorkflow = ({ employee, onSubmit }) => {
         department: employee.department,
         role: employee.role,
         month_key: selectedMonth,
-        lastSaved: new Date().toISOString(),
+        name: employee.name,
+        phone: employee.phone,
+        monthKey: selectedMonth,
         isDraft: true
       };
       
-      const success = draftPersistence.saveDraft(draftData, {
+      const success = await draftPersistence.saveDraft(draftData, {
         forceImmediate: hasUnsavedChanges
       });
       
@@ -721,7 +724,7 @@ export const MonthlyFormWorkflow = ({ employee, onSubmit }) => {
       
       // Clear draft after successful save
       try {
-        draftPersistence.deleteDraft({
+        await draftPersistence.deleteDraft({
           name: employee.name,
           phone: employee.phone,
           monthKey: selectedMonth
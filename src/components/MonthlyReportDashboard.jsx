@@ -13,8 +13,7 @@ export function MonthlyReportDashboard({ onBack }) {
   
   // Local state for data
   const [reportData, setReportData] = useState({
-    users: [],
-    submissions: [],
+    summary: null,
     loading: true,
     error: null
   });
@@ -32,10 +31,9 @@ export function MonthlyReportDashboard({ onBack }) {
     const fetchReportData = async () => {
       try {
         setReportData(prev => ({ ...prev, loading: true, error: null }));
-        const data = await MonthlyReportService.getMonthlyReportData(selectedMonth);
+        const summary = await MonthlyReportService.getMonthlyReportSummary(selectedMonth);
         setReportData({
-          users: data.users,
-          submissions: data.submissions,
+          summary,
           loading: false,
           error: null
         });
@@ -69,24 +67,10 @@ export function MonthlyReportDashboard({ onBack }) {
     return options;
   }, []);
 
-  // Get submissions (already filtered by month from service)
-  const monthlySubmissions = reportData.submissions;
-
-  // Filter users by department if needed
-  const filteredEmployees = useMemo(() => {
-    if (filterDepartment === 'all') return reportData.users;
-    return reportData.users.filter(user => user.department === filterDepartment);
-  }, [reportData.users, filterDepartment]);
-
-  // Calculate monthly metrics using service
-  const monthlyMetrics = useMemo(() => {
-    return MonthlyReportService.calculateMonthlyMetrics(filteredEmployees, monthlySubmissions);
-  }, [filteredEmployees, monthlySubmissions]);
-
-  // Department breakdown using service
-  const departmentBreakdown = useMemo(() => {
-    return MonthlyReportService.calculateDepartmentBreakdown(filteredEmployees, monthlySubmissions);
-  }, [filteredEmployees, monthlySubmissions]);
+  // Metrics and department breakdown from the aggregated month summary
+  const { metrics: monthlyMetrics, departmentBreakdown } = useMemo(() => {
+    return MonthlyReportService.summarizeReport(reportData.summary, filterDepartment);
+  }, [reportData.summary, filterDepartment]);
 
   // Role-based access control
   const canViewAllDepartments = ['Super Admin', 'HR', 'Operations Head'].includes(role);
@@ -3,6 +3,7 @@ import { supabase } from '@/database/supabaseClient';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
 import { InputSanitizer } from '@/shared/utils/securityUtils';
+import { VirtualTable } from '@/shared/components/VirtualTable';
 
 const MonthlySummaryTable = () => {
   const { user } = useUnifiedAuth();
@@ -240,6 +241,171 @@ const MonthlySummaryTable = () => {
     return options;
   };
   
+  const summaryColumns = [
+    {
+      key: 'entity',
+      header: 'Entity',
+      width: 220,
+      className: 'whitespace-nowrap',
+      render: (row) => (
+        <>
+          <div className="text-sm font-medium text-gray-900">
+            {row.entities ? row.entities.name : 'General'}
+          </div>
+          {row.entities && (
+            <div className="text-sm text-gray-500">
+              {row.entities.entity_type}
+            </div>
+          )}
+        </>
+      )
+    },
+    {
+      key: 'work_summary',
+      header: 'Work Summary',
+      width: 360,
+      render: (row) => (
+        editingRow === row.id ? (
+          <textarea
+            value={row.work_summary || ''}
+            onChange={(e) => {
+              const updatedRows = monthlyRows.map(r => 
+                r.id === row.id ? { ...r, work_summary: e.target.value } : r
+              );
+              setMonthlyRows(updatedRows);
+            }}
+            rows={3}
+            className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+            placeholder="Describe your work for this month..."
+          />
+        ) : (
+          <div className="text-sm text-gray-900 max-w-xs">
+            {row.work_summary || (
+              <span className="text-gray-400 italic">No summary provided</span>
+            )}
+          </div>
+        )
+      )
+    },
+    {
+      key: 'meetings',
+      header: 'Meetings',
+      width: 130,
+      className: 'whitespace-nowrap',
+      render: (row) => (
+        editingRow === row.id ? (
+          <input
+            type="number"
+            min="0"
+            value={row.meetings_count || 0}
+            onChange={(e) => {
+              const updatedRows = monthlyRows.map(r => 
+                r.id === row.id ? { ...r, meetings_count: parseInt(e.target.value) || 0 } : r
+              );
+              setMonthlyRows(updatedRows);
+            }}
+            className="w-20 px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+          />
+        ) : (
+          <div className="text-sm text-gray-900">
+            {row.meetings_count || 0}
+          </div>
+        )
+      )
+    },
+    {
+      key: 'learning',
+      header: 'Learning (min)',
+      width: 150,
+      className: 'whitespace-nowrap',
+      render: (row) => (
+        editingRow === row.id ? (
+          <input
+            type="number"
+            min="0"
+            value={row.learning_minutes || 0}
+            onChange={(e) => {
+              const updatedRows = monthlyRows.map(r => 
+                r.id === row.id ? { ...r, learning_minutes: parseInt(e.target.value) || 0 } : r
+              );
+              setMonthlyRows(updatedRows);
+            }}
+            className="w-20 px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
+          />
+        ) : (
+          <div className="text-sm text-gray-900">
+            {row.learning_minutes || 0}
+          </div>
+        )
+      )
+    },
+    {
+      key: 'status',
+      header: 'Status',
+      width: 130,
+      className: 'whitespace-nowrap',
+      render: (row) => getStatusBadge(row.status)
+    },
+    {
+      key: 'actions',
+      header: 'Actions',
+      width: 170,
+      className: 'whitespace-nowrap text-sm font-medium',
+      render: (row) => (
+        isRowEditable(row) ? (
+          <div className="flex space-x-2">
+            {editingRow === row.id ? (
+              <>
+                <button
+                  onClick={() => {
+                    updateMonthlyRow(row.id, {
+                      work_summary: row.work_summary,
+                      meetings_count: row.meetings_count,
+                      learning_minutes: row.learning_minutes
+                    });
+                    setEditingRow(null);
+                  }}
+                  disabled={isSaving}
+                  className="text-green-600 hover:text-green-900 disabled:opacity-50"
+                >
+                  Save
+                </button>
+                <button
+                  onClick={() => {
+                    setEditingRow(null);
+                    loadMonthlyData(); // Reload to reset changes
+                  }}
+                  className="text-gray-600 hover:text-gray-900"
+                >
+                  Cancel
+                </button>
+              </>
+            ) : (
+              <>
+                <button
+                  onClick={() => setEditingRow(row.id)}
+                  className="text-blue-600 hover:text-blue-900"
+                >
+                  Edit
+                </button>
+                {row.status === 'draft' && (
+                  <button
+                    onClick={() => submitMonthlyRow(row.id)}
+                    className="text-green-600 hover:text-green-900"
+                  >
+                    Submit
+                  </button>
+                )}
+              </>
+            )}
+          </div>
+        ) : (
+          <span className="text-gray-400">Locked</span>
+        )
+      )
+    }
+  ];
+  
   if (isLoading) {
     return (
       <div className="flex items-center justify-center p-8">
@@ -340,165 +506,12 @@ const MonthlySummaryTable = () => {
             <p className="text-sm mt-2">Create your first submission using the options above.</p>
           </div>
         ) : (
-          <div className="overflow-x-auto">
-            <table className="min-w-full divide-y divide-gray-200">
-              <thead className="bg-gray-50">
-                <tr>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Entity
-                  </th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Work Summary
-                  </th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Meetings
-                  </th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Learning (min)
-                  </th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Status
-                  </th>
-                  <th className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">
-                    Actions
-                  </th>
-                </tr>
-              </thead>
-              <tbody className="bg-white divide-y divide-gray-200">
-                {monthlyRows.map(row => (
-                  <tr key={row.id} className="hover:bg-gray-50">
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      <div className="text-sm font-medium text-gray-900">
-                        {row.entities ? row.entities.name : 'General'}
-                      </div>
-                      {row.entities && (
-                        <div className="text-sm text-gray-500">
-                          {row.entities.entity_type}
-                        </div>
-                      )}
-                    </td>
-                    <td className="px-6 py-4">
-                      {editingRow === row.id ? (
-                        <textarea
-                          value={row.work_summary || ''}
-                          onChange={(e) => {
-                            const updatedRows = monthlyRows.map(r => 
-                              r.id === row.id ? { ...r, work_summary: e.target.value } : r
-                            );
-                            setMonthlyRows(updatedRows);
-                          }}
-                          rows={3}
-                          className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                          placeholder="Describe your work for this month..."
-                        />
-                      ) : (
-                        <div className="text-sm text-gray-900 max-w-xs">
-                          {row.work_summary || (
-                            <span className="text-gray-400 italic">No summary provided</span>
-                          )}
-                        </div>
-                      )}
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      {editingRow === row.id ? (
-                        <input
-                          type="number"
-                          min="0"
-                          value={row.meetings_count || 0}
-                          onChange={(e) => {
-                            const updatedRows = monthlyRows.map(r => 
-                              r.id === row.id ? { ...r, meetings_count: parseInt(e.target.value) || 0 } : r
-                            );
-                            setMonthlyRows(updatedRows);
-                          }}
-                          className="w-20 px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                        />
-                      ) : (
-                        <div className="text-sm text-gray-900">
-                          {row.meetings_count || 0}
-                        </div>
-                      )}
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      {editingRow === row.id ? (
-                        <input
-                          type="number"
-                          min="0"
-                          value={row.learning_minutes || 0}
-                          onChange={(e) => {
-                            const updatedRows = monthlyRows.map(r => 
-                              r.id === row.id ? { ...r, learning_minutes: parseInt(e.target.value) || 0 } : r
-                            );
-                            setMonthlyRows(updatedRows);
-                          }}
-                          className="w-20 px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
-                        />
-                      ) : (
-                        <div className="text-sm text-gray-900">
-                          {row.learning_minutes || 0}
-                        </div>
-                      )}
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap">
-                      {getStatusBadge(row.status)}
-                    </td>
-                    <td className="px-6 py-4 whitespace-nowrap text-sm font-medium">
-                      {isRowEditable(row) ? (
-                        <div className="flex space-x-2">
-                          {editingRow === row.id ? (
-                            <>
-                              <button
-                                onClick={() => {
-                                  updateMonthlyRow(row.id, {
-                                    work_summary: row.work_summary,
-                                    meetings_count: row.meetings_count,
-                                    learning_minutes: row.learning_minutes
-                                  });
-                                  setEditingRow(null);
-                                }}
-                                disabled={isSaving}
-                                className="text-green-600 hover:text-green-900 disabled:opacity-50"
-                              >
-                                Save
-                              </button>
-                              <button
-                                onClick={() => {
-                                  setEditingRow(null);
-                                  loadMonthlyData(); // Reload to reset changes
-                                }}
-                                className="text-gray-600 hover:text-gray-900"
-                              >
-                                Cancel
-                              </button>
-                            </>
-                          ) : (
-                            <>
-                              <button
-                                onClick={() => setEditingRow(row.id)}
-                                className="text-blue-600 hover:text-blue-900"
-                              >
-                                Edit
-                              </button>
-                              {row.status === 'draft' && (
-                                <button
-                                  onClick={() => submitMonthlyRow(row.id)}
-                                  className="text-green-600 hover:text-green-900"
-                                >
-                                  Submit
-                                </button>
-                              )}
-                            </>
-                          )}
-                        </div>
-                      ) : (
-                        <span className="text-gray-400">Locked</span>
-                      )}
-                    </td>
-                  </tr>
-                ))}
-              </tbody>
-            </table>
-          </div>
+          <VirtualTable
+            columns={summaryColumns}
+            rows={monthlyRows}
+            estimateRowHeight={80}
+            height="65vh"
+          />
         )}
       </div>
     </div>
@@ -1,8 +1,9 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import { supabase } from '@/database/supabaseClient';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
 import { InputSanitizer } from '@/shared/utils/securityUtils';
+import { VirtualList } from '@/shared/components/VirtualTable';
 
 const OnboardingTable = () => {
   const { user } = useUnifiedAuth();
@@ -108,6 +109,12 @@ const OnboardingTable = () => {
     setProfile(prev => ({ ...prev, [field]: value }));
   };
   
+  // Entity options per type, built once rather than filtered for every mapping
+  const entitiesByType = useMemo(() => availableEntities.reduce((groups, entity) => {
+    (groups[entity.entity_type] = groups[entity.entity_type] || []).push(entity);
+    return groups;
+  }, {}), [availableEntities]);
+  
   const addEntityMapping = () => {
     if (isLocked) return;
     
@@ -406,9 +413,12 @@ const OnboardingTable = () => {
             )}
           </div>
         ) : (
-          <div className="space-y-4">
-            {entityMappings.map((mapping, index) => (
-              <div key={mapping.id} className="border border-gray-200 rounded-lg p-4">
+          <VirtualList
+            items={entityMappings}
+            estimateSize={260}
+            itemClassName="pb-4"
+            renderItem={(mapping, index) => (
+              <div className="border border-gray-200 rounded-lg p-4">
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-4">
                   <div>
                     <label className="block text-sm font-medium text-gray-700 mb-1">
@@ -443,14 +453,11 @@ const OnboardingTable = () => {
                       className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 disabled:bg-gray-100"
                     >
                       <option value="">Select or create new</option>
-                      {availableEntities
-                        .filter(e => e.entity_type === mapping.entity_type)
-                        .map(entity => (
-                          <option key={entity.id} value={entity.id}>
-                            {entity.name}
-                          </option>
-                        ))
-                      }
+                      {(entitiesByType[mapping.entity_type] || []).map(entity => (
+                        <option key={entity.id} value={entity.id}>
+                          {entity.name}
+                        </option>
+                      ))}
                     </select>
                     {!mapping.entity_id && (
                       <input
@@ -518,8 +525,8 @@ const OnboardingTable = () => {
                   </div>
                 )}
               </div>
-            ))}
-          </div>
+            )}
+          />
         )}
       </div>
       
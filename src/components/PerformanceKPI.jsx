@@ -5,7 +5,7 @@ import { LoadingSpinner } from '@/shared/components/LoadingStates';
 import { Section } from '@/shared/components/ui';
 import { thisMonthKey, monthLabel, prevMonthKey } from '@/shared/lib/constants';
 import { PlusIcon, PencilIcon, TrashIcon, ArrowTrendingUpIcon, ArrowTrendingDownIcon, InformationCircleIcon, LockClosedIcon, CheckCircleIcon } from '@heroicons/react/24/outline';
-import { LineChart, Line, XAxis, YAxis, ResponsiveContainer, Tooltip } from 'recharts';
+import { LazyRecharts } from '@/shared/components/LazyVendor';
 
 // Sparkline Component
 const Sparkline = ({ data, color = '#3B82F6' }) => {
@@ -13,18 +13,22 @@ const Sparkline = ({ data, color = '#3B82F6' }) => {
   
   return (
     <div className="h-8 w-16">
-      <ResponsiveContainer width="100%" height="100%">
-        <LineChart data={data}>
-          <Line 
-            type="monotone" 
-            dataKey="value" 
-            stroke={color} 
-            strokeWidth={2}
-            dot={false}
-            activeDot={false}
-          />
-        </LineChart>
-      </ResponsiveContainer>
+      <LazyRecharts>
+        {({ LineChart, Line, ResponsiveContainer }) => (
+          <ResponsiveContainer width="100%" height="100%">
+            <LineChart data={data}>
+              <Line 
+                type="monotone" 
+                dataKey="value" 
+                stroke={color} 
+                strokeWidth={2}
+                dot={false}
+                activeDot={false}
+              />
+            </LineChart>
+          </ResponsiveContainer>
+        )}
+      </LazyRecharts>
     </div>
   );
 };
@@ -158,28 +162,32 @@ const KPIDetailModal = ({ kpi, isOpen, onClose, historicalData }) => {
           <div>
             <h4 className="font-semibold text-gray-700 mb-2">6-Month Trend</h4>
             <div className="h-64">
-              <ResponsiveContainer width="100%" height="100%">
-                <LineChart data={historicalData}>
-                  <XAxis dataKey="month" />
-                  <YAxis />
-                  <Tooltip />
-                  <Line 
-                    type="monotone" 
-                    dataKey="value" 
-                    stroke="#3B82F6" 
-                    strokeWidth={2}
-                    dot={{ fill: '#3B82F6', strokeWidth: 2, r: 4 }}
-                  />
-                  <Line 
-                    type="monotone" 
-                    dataKey="target" 
-                    stroke="#EF4444" 
-                    strokeWidth={2}
-                    strokeDasharray="5 5"
-                    dot={false}
-                  />
-                </LineChart>
-              </ResponsiveContainer>
+              <LazyRecharts>
+                {({ LineChart, Line, XAxis, YAxis, ResponsiveContainer, Tooltip }) => (
+                  <ResponsiveContainer width="100%" height="100%">
+                    <LineChart data={historicalData}>
+                      <XAxis dataKey="month" />
+                      <YAxis />
+                      <Tooltip />
+                      <Line 
+                        type="monotone" 
+                        dataKey="value" 
+                        stroke="#3B82F6" 
+                        strokeWidth={2}
+                        dot={{ fill: '#3B82F6', strokeWidth: 2, r: 4 }}
+                      />
+                      <Line 
+                        type="monotone" 
+                        dataKey="target" 
+                        stroke="#EF4444" 
+                        strokeWidth={2}
+                        strokeDasharray="5 5"
+                        dot={false}
+                      />
+                    </LineChart>
+                  </ResponsiveContainer>
+                )}
+              </LazyRecharts>
             </div>
           </div>
         </div>
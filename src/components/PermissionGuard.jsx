@@ -1,6 +1,9 @@
 import React from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
+import { usePermissions } from '@/shared/hooks/usePermissions';
+import { permissionEngine } from '@/shared/services/permissionEngine';
+import { grantsToRows } from '@/shared/lib/permissionTable';
 
 // Permission levels for different roles
 const ROLE_PERMISSIONS = {
@@ -36,6 +39,12 @@ const DASHBOARD_PERMISSIONS = {
   'Intern': ['intern', 'employee', 'profile']
 };
 
+// Compiled into the shared permission engine: areas as 'access', dashboards as 'view'
+permissionEngine.setSource('guards', [
+  ...grantsToRows(ROLE_PERMISSIONS, 'access'),
+  ...grantsToRows(DASHBOARD_PERMISSIONS, 'view')
+]);
+
 // Base Permission Guard Component
 export const PermissionGuard = ({ 
   children, 
@@ -47,6 +56,7 @@ export const PermissionGuard = ({
   const { authState } = useUnifiedAuth();
   const user = authState.user;
   const { notify } = useToast();
+  const { canAny } = usePermissions(user?.role);
 
   // Check if user is authenticated
   if (!user || !user.role) {
@@ -76,10 +86,7 @@ export const PermissionGuard = ({
 
   // Check permissions
   if (requiredPermissions.length > 0) {
-    const userPermissions = ROLE_PERMISSIONS[user.role] || [];
-    const hasPermission = requiredPermissions.some(permission => 
-      userPermissions.includes(permission) || userPermissions.includes('all')
-    );
+    const hasPermission = canAny(requiredPermissions, 'access');
 
     if (!hasPermission) {
       if (showError) {
@@ -106,6 +113,7 @@ export const DashboardGuard = ({
 }) => {
   const { authState } = useUnifiedAuth();
   const user = authState.user;
+  const { can } = usePermissions(user?.role);
 
   if (!user || !user.role) {
     return (
@@ -129,8 +137,7 @@ export const DashboardGuard = ({
     );
   }
 
-  const userDashboards = DASHBOARD_PERMISSIONS[user.role] || [];
-  const hasAccess = userDashboards.includes(requiredDashboard) || userDashboards.includes('all');
+  const hasAccess = can(requiredDashboard, 'view');
 
   if (!hasAccess) {
     return (
@@ -2,9 +2,8 @@ import React, { useState, useEffect, useMemo } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useSupabase } from './SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
-import { Calendar, momentLocalizer } from 'react-big-calendar';
-import moment from 'moment';
-import 'react-big-calendar/lib/css/react-big-calendar.css';
+import { formatDate, monthKey } from '@/shared/utils/dateUtils';
+import { LazyCalendar } from '@/shared/components/LazyVendor';
 
 // Role-specific profile components
 import SuperAdminProfile from './profiles/SuperAdminProfile';
@@ -25,7 +24,6 @@ import GrowthReportGenerator from './GrowthReportGenerator';
  * - Comprehensive monthly tracking with KPI integration
  * - Role-based color themes for visual distinction
  */
-const localizer = momentLocalizer(moment);
 
 // Role-based color themes
 const getRoleTheme = (role) => {
@@ -116,7 +114,7 @@ export function ProfileDashboard({ onBack }) {
   const [kpiData, setKpiData] = useState(null);
   const [performanceMetrics, setPerformanceMetrics] = useState(null);
   const [activeView, setActiveView] = useState('profile'); // 'profile', 'calendar', 'analytics', 'kpis', 'reports'
-  const [selectedMonth, setSelectedMonth] = useState(moment().format('YYYY-MM'))
+  const [selectedMonth, setSelectedMonth] = useState(monthKey())
 
   // Get current user role and determine profile component
   const userRole = authState.currentUser?.role || authState.role;
@@ -568,8 +566,7 @@ export function ProfileDashboard({ onBack }) {
               <p className="text-gray-600">Track your submissions and performance over time</p>
             </div>
             <div className="h-96">
-              <Calendar
-                localizer={localizer}
+              <LazyCalendar
                 events={calendarEvents}
                 startAccessor="start"
                 endAccessor="end"
@@ -581,7 +578,7 @@ export function ProfileDashboard({ onBack }) {
                   notify({
                     type: 'info',
                     title: 'Submission Details',
-                    message: `${event.title} on ${moment(event.start).format('MMM DD, YYYY')}`
+                    message: `${event.title} on ${formatDate(event.start, 'MMM dd, yyyy')}`
                   });
                 }}
               />
@@ -634,7 +631,7 @@ export function ProfileDashboard({ onBack }) {
                     <p className="text-sm font-medium text-purple-600">This Month</p>
                     <p className="text-2xl font-bold text-purple-900">
                       {monthlyData.filter(item => 
-                        moment(item.created_at).format('YYYY-MM') === selectedMonth
+                        monthKey(item.created_at) === selectedMonth
                       ).length}
                     </p>
                   </div>
@@ -660,7 +657,7 @@ export function ProfileDashboard({ onBack }) {
                     {monthlyData.slice(0, 10).map((submission, index) => (
                       <tr key={submission.id || index}>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          {moment(submission.created_at).format('MMM DD, YYYY')}
+                          {formatDate(submission.created_at, 'MMM dd, yyyy')}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
                           {submission.submission_type || 'General'}
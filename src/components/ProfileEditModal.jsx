@@ -8,7 +8,7 @@ import { DEPARTMENTS } from '../shared/lib/constants';
 export const ProfileEditModal = ({ isOpen, onClose, employee = null }) => {
   const { user, updateProfile } = useUnifiedAuth();
   const { notify } = useToast();
-  const { updateEmployee } = useDataSync();
+  const { updateEmployee } = useDataSync({ sync: [] });
   const [loading, setLoading] = useState(false);
   const [formData, setFormData] = useState({
     name: '',
@@ -2,7 +2,7 @@ import React, { useState } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
 import { supabase } from '@/shared/lib/supabase';
-import moment from 'moment';
+import { daysFromNow, formatDate } from '@/shared/utils/dateUtils';
 import {
   Send,
   MessageSquare,
@@ -28,7 +28,7 @@ const QuickSubmissionForm = ({ type = 'feedback', onSubmit = null, compact = fal
     rating: 5,
     category: '',
     priority: 'medium',
-    target_date: moment().add(7, 'days').format('YYYY-MM-DD'),
+    target_date: formatDate(daysFromNow(7), 'yyyy-MM-dd'),
     tags: '',
     is_anonymous: false
   });
@@ -226,7 +226,7 @@ const QuickSubmissionForm = ({ type = 'feedback', onSubmit = null, compact = fal
         rating: 5,
         category: '',
         priority: 'medium',
-        target_date: moment().add(7, 'days').format('YYYY-MM-DD'),
+        target_date: formatDate(daysFromNow(7), 'yyyy-MM-dd'),
         tags: '',
         is_anonymous: false
       });
@@ -401,7 +401,7 @@ const QuickSubmissionForm = ({ type = 'feedback', onSubmit = null, compact = fal
                 rating: 5,
                 category: '',
                 priority: 'medium',
-                target_date: moment().add(7, 'days').format('YYYY-MM-DD'),
+                target_date: formatDate(daysFromNow(7), 'yyyy-MM-dd'),
                 tags: '',
                 is_anonymous: false
               });
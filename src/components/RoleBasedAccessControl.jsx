@@ -2,6 +2,7 @@ import React, { useState } from 'react';
 import { useToast } from '@/shared/components/Toast';
 import { useCrossDashboardSync } from './CrossDashboardSync';
 import { useRBAC } from './useRBAC';
+import { usePermissions } from '@/shared/hooks/usePermissions';
 
 export const RoleBasedAccessControl = () => {
   const { 
@@ -13,6 +14,7 @@ export const RoleBasedAccessControl = () => {
     removeUser, 
     updateRole 
   } = useRBAC();
+  const { can } = usePermissions();
   const { notify } = useCrossDashboardSync();
   const { showToast } = useToast();
   
@@ -259,17 +261,16 @@ export const RoleBasedAccessControl = () => {
                 {['manager', 'employee', 'agency', 'intern', 'system'].map(dashboard => (
                   <td key={dashboard} className="px-6 py-4 whitespace-nowrap text-center">
                     <div className="flex justify-center space-x-1">
-                      {['read', 'write', 'delete', 'configure'].map(permission => (
-                        <span
-                          key={permission}
-                          className={`w-2 h-2 rounded-full ${
-                            role.permissions[dashboard]?.includes(permission)
-                              ? 'bg-blue-500'
-                              : 'bg-gray-200'
-                          }`}
-                          title={`${permission} ${role.permissions[dashboard]?.includes(permission) ? 'allowed' : 'denied'}`}
-                        ></span>
-                      ))}
+                      {['read', 'write', 'delete', 'configure'].map(permission => {
+                        const allowed = can(dashboard, permission, roleId);
+                        return (
+                          <span
+                            key={permission}
+                            className={`w-2 h-2 rounded-full ${allowed ? 'bg-blue-500' : 'bg-gray-200'}`}
+                            title={`${permission} ${allowed ? 'allowed' : 'denied'}`}
+                          ></span>
+                        );
+                      })}
                     </div>
                   </td>
                 ))}
@@ -0,0 +1,44 @@
+import { describe, it, expect, vi } from 'vitest';
+import { lazyRoute, routesForDashboards, ROUTE_MODULES } from '../routeModules';
+
+describe('routesForDashboards', () => {
+  it('puts each dashboard page first and de-duplicates', () => {
+    const keys = routesForDashboards(['seo_dashboard', 'employee_dashboard', 'profile']);
+    expect(keys[0]).toBe('employeeDashboard');
+    expect(keys).toContain('profileEditPage');
+    expect(keys).toContain('employeeForm');
+    expect(new Set(keys).size).toBe(keys.length);
+    // The profile page outranks the employee dashboard's second-tier routes
+    expect(keys.indexOf('profileEditPage')).toBeLessThan(keys.indexOf('employeeForm'));
+  });
+
+  it('ignores unknown dashboards and only names real route modules', () => {
+    expect(routesForDashboards(['not_a_dashboard'])).toEqual([]);
+    routesForDashboards(['super_admin_dashboard', 'all_dashboards', 'hr_dashboard', 'sales_dashboard'])
+      .forEach(key => expect(ROUTE_MODULES[key]).toBeDefined());
+  });
+});
+
+describe('lazyRoute', () => {
+  it('shares one import between preload and render', async () => {
+    const Page = () => null;
+    const load = vi.fn().mockResolvedValue({ Page });
+    const Route = lazyRoute(load, 'Page');
+
+    const [first, second] = await Promise.all([Route.preload(), Route.preload()]);
+    expect(load).toHaveBeenCalledTimes(1);
+    expect(first).toBe(second);
+    expect(first.default).toBe(Page);
+  });
+
+  it('retries after a failed import', async () => {
+    const load = vi.fn()
+      .mockRejectedValueOnce(new Error('chunk failed'))
+      .mockResolvedValueOnce({ default: () => null });
+    const Route = lazyRoute(load);
+
+    await expect(Route.preload()).rejects.toThrow('chunk failed');
+    await expect(Route.preload()).resolves.toHaveProperty('default');
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+});
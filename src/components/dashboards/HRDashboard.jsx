@@ -33,7 +33,19 @@ import { useToast } from '@/shared/hooks/use-toast';
 import { exportReport, reportUtils } from '../../utils/reportGenerator';
 import DashboardLayout from '../layouts/DashboardLayout';
 import AdvancedFilters from '../shared/AdvancedFilters';
-import { applyFilters, createFilterOptions, exportToCSV } from '@/utils/filterUtils';
+import { applyFilters, createFilterOptions, exportToCSV, exportFromServer, toListQuery } from '@/utils/filterUtils';
+
+// Leave requests come from hrReportingService and are exported from the page
+const LEAVE_EXPORT_COLUMNS = [
+  { field: 'employee', label: 'Employee' },
+  { field: 'type', label: 'Leave Type' },
+  { field: 'startDate', label: 'Start Date' },
+  { field: 'endDate', label: 'End Date' },
+  { field: 'days', label: 'Days' },
+  { field: 'status', label: 'Status' },
+  { field: 'reason', label: 'Reason' },
+  { field: 'appliedDate', label: 'Applied' }
+];
 
 // Simple Modal Components for HR Actions
 const AddEmployeeModal = ({ onClose, onSuccess }) => {
@@ -329,6 +341,25 @@ const HRDashboard = () => {
     });
   }, [leaveRequests, filters]);
 
+  // Employees export from the API with the table's filters. Location is a
+  // placeholder in processEmployeeData, so it is not sent.
+  const handleEmployeeExport = async () => {
+    const { location, ...customFilters } = filters.customFilters || {};
+    try {
+      setIsExporting(true);
+      await exportFromServer('employees', toListQuery({ ...filters, customFilters }));
+    } catch (error) {
+      console.error('Error exporting employees:', error);
+      toast({
+        title: "Export Failed",
+        description: "Failed to export employees. Please try again.",
+        variant: "destructive",
+      });
+    } finally {
+      setIsExporting(false);
+    }
+  };
+
   // Quick Action Handlers
   const handleAddEmployee = () => {
     setShowAddEmployeeModal(true);
@@ -848,7 +879,7 @@ const HRDashboard = () => {
               filters={filters}
               onFiltersChange={setFilters}
               filterOptions={filterOptions}
-              onExport={() => exportToCSV(filteredEmployees, 'hr-employees')}
+              onExport={handleEmployeeExport}
               showExport={true}
               customFilters={[
                 {
@@ -930,7 +961,7 @@ const HRDashboard = () => {
                 types: createFilterOptions(leaveRequests, { types: 'type' }).types || [],
                 status: createFilterOptions(leaveRequests, { status: 'status' }).status || []
               }}
-              onExport={() => exportToCSV(filteredLeaveRequests, 'hr-leave-requests')}
+              onExport={() => exportToCSV(filteredLeaveRequests, LEAVE_EXPORT_COLUMNS, 'hr-leave-requests.csv')}
               showExport={true}
               customFilters={[
                 {
@@ -9,7 +9,7 @@ import { useToast } from '../../shared/hooks/use-toast';
 import personalizedDashboardService from '../../shared/services/personalizedDashboardService';
 import webService from '../../services/webService';
 import AdvancedFilters from '../shared/AdvancedFilters';
-import { applyFilters, createFilterOptions, exportToCSV } from '../../utils/filterUtils';
+import { applyFilters, createFilterOptions, exportFromServer, toListQuery } from '../../utils/filterUtils';
 import { exportReport, reportUtils } from '../../utils/reportGenerator';
 import { 
   Globe, 
@@ -134,6 +134,27 @@ const WebDashboard = ({ userRole = 'employee' }) => {
 
   const [exportFormat, setExportFormat] = useState('excel');
 
+  // Monthly entries export from the API: the team's submissions, newest first
+  const handleEntriesExport = async () => {
+    const { filter } = toListQuery({ status: filters.status });
+    try {
+      setIsExporting(true);
+      await exportFromServer('submissions', {
+        filter: { ...filter, department: 'Web Development' },
+        sort: '-created_at'
+      });
+    } catch (error) {
+      console.error('Error exporting monthly entries:', error);
+      toast({
+        title: "Export Failed",
+        description: "Failed to export monthly entries. Please try again.",
+        variant: "destructive",
+      });
+    } finally {
+      setIsExporting(false);
+    }
+  };
+
   // Handle export report
   const handleExportReport = async () => {
     try {
@@ -576,7 +597,7 @@ const WebDashboard = ({ userRole = 'employee' }) => {
             filters={filters}
             onFiltersChange={setFilters}
             filterOptions={filterOptions}
-            onExport={() => exportToCSV(filteredEntries, 'web-development-performance')}
+            onExport={handleEntriesExport}
             customFilters={[
               {
                 key: 'client',
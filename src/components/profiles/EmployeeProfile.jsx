@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, monthsAgo } from '@/shared/utils/dateUtils';
 
 const EmployeeProfile = ({ 
   profileData, 
@@ -97,7 +97,7 @@ const EmployeeProfile = ({
         setMonthlyReports(kpiReports || []);
         
         // Get current month data
-        const currentMonth = moment().format('YYYY-MM');
+        const currentMonth = monthKey();
         const currentMonthReport = kpiReports?.find(report => report.month_year === currentMonth);
         setCurrentMonthData(currentMonthReport);
         
@@ -144,11 +144,11 @@ const EmployeeProfile = ({
         } else {
           // Fallback to monthly data if no KPI reports
           const currentMonthData = monthlyData.filter(item => 
-            moment(item.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+            monthKey(item.created_at) === monthKey()
           );
           
           const lastMonthData = monthlyData.filter(item => 
-            moment(item.created_at).format('YYYY-MM') === moment().subtract(1, 'month').format('YYYY-MM')
+            monthKey(item.created_at) === monthsAgo(1)
           );
           
           const avgCurrentMonth = currentMonthData.length > 0 
@@ -198,7 +198,7 @@ const EmployeeProfile = ({
     try {
       setLoading(true);
       
-      const monthYear = moment().format('YYYY-MM');
+      const monthYear = monthKey();
       const overallScore = calculateOverallScore(kpiFormData);
       
       const kpiData = {
@@ -344,10 +344,10 @@ const EmployeeProfile = ({
               className="border border-gray-300 rounded-lg px-3 py-2 text-sm focus:ring-2 focus:ring-blue-500 focus:border-transparent"
             >
               {Array.from({ length: 12 }, (_, i) => {
-                const month = moment().subtract(i, 'months').format('YYYY-MM');
+                const month = monthsAgo(i);
                 return (
                   <option key={month} value={month}>
-                    {moment(month).format('MMMM YYYY')}
+                    {formatMonth(month)}
                   </option>
                 );
               })}
@@ -370,13 +370,13 @@ const EmployeeProfile = ({
       </div>
 
       {/* Current Month Status */}
-      {!currentMonthData && moment().format('YYYY-MM') === selectedMonth && (
+      {!currentMonthData && monthKey() === selectedMonth && (
         <div className="bg-orange-50 border border-orange-200 rounded-lg p-4">
           <div className="flex items-center">
             <div className="text-orange-600 mr-3">📊</div>
             <div>
               <h3 className="text-sm font-medium text-orange-800">
-                No KPI Data for {moment(selectedMonth).format('MMMM YYYY')}
+                No KPI Data for {formatMonth(selectedMonth)}
               </h3>
               <p className="text-sm text-orange-700 mt-1">
                 Start tracking your monthly performance by adding your KPI data.
@@ -448,7 +448,7 @@ const EmployeeProfile = ({
       {/* Detailed KPI Breakdown */}
       {currentMonthData && (
         <div className="bg-white rounded-xl border p-6">
-          <h3 className="text-lg font-semibold text-gray-900 mb-4">KPI Breakdown - {moment(selectedMonth).format('MMMM YYYY')}</h3>
+          <h3 className="text-lg font-semibold text-gray-900 mb-4">KPI Breakdown - {formatMonth(selectedMonth)}</h3>
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
             <div className="space-y-3">
               <h4 className="font-medium text-gray-700">Client Management</h4>
@@ -607,7 +607,7 @@ const EmployeeProfile = ({
                       <div className="space-y-2">
                         {monthlyReports.slice(0, 6).map((report, index) => (
                           <div key={index} className="flex justify-between items-center py-2 border-b border-gray-200 last:border-b-0">
-                            <span className="text-sm text-gray-600">{moment(report.month_year).format('MMMM YYYY')}</span>
+                            <span className="text-sm text-gray-600">{formatMonth(report.month_year)}</span>
                             <span className="text-sm font-medium text-gray-900">{Math.round(calculateOverallScore(report))}%</span>
                           </div>
                         ))}
@@ -637,7 +637,7 @@ const EmployeeProfile = ({
             <div className="p-6">
               <div className="flex justify-between items-center mb-6">
                 <h2 className="text-xl font-bold text-gray-900">
-                  {currentMonthData ? 'Update' : 'Add'} KPI Data - {moment(selectedMonth).format('MMMM YYYY')}
+                  {currentMonthData ? 'Update' : 'Add'} KPI Data - {formatMonth(selectedMonth)}
                 </h2>
                 <button
                   onClick={() => setShowKPIForm(false)}
@@ -957,7 +957,7 @@ const EmployeeProfile = ({
             return (
               <div key={index} className="bg-gradient-to-br from-blue-50 to-indigo-50 rounded-lg p-4 border border-blue-100">
                 <h3 className="text-sm font-medium text-blue-600 mb-1">
-                  {moment(report.month_year).format('MMM YYYY')}
+                  {formatDate(report.month_year, 'MMM yyyy')}
                 </h3>
                 <div className="text-2xl font-bold text-blue-900 mb-2">
                   {Math.round(overallScore)}%
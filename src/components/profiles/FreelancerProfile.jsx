@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, monthsAgo } from '@/shared/utils/dateUtils';
 
 const FreelancerProfile = ({ 
   profileData, 
@@ -47,7 +47,7 @@ const FreelancerProfile = ({
         
         // Calculate freelancer metrics
         const currentMonthData = monthlyData.filter(item => 
-          moment(item.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+          monthKey(item.created_at) === monthKey()
         );
         
         const totalEarnings = currentMonthData.reduce((sum, item) => 
@@ -427,7 +427,7 @@ const FreelancerProfile = ({
                   </div>
                   <p className="text-gray-700 text-sm mb-2">{feedback.comment}</p>
                   <div className="text-xs text-gray-500">
-                    Project: {feedback.project_title} • {moment(feedback.created_at).format('MMM DD, YYYY')}
+                    Project: {feedback.project_title} • {formatDate(feedback.created_at, 'MMM dd, yyyy')}
                   </div>
                 </div>
               ))
@@ -611,7 +611,7 @@ const FreelancerProfile = ({
                 <p className="text-gray-600 text-sm mb-2">{project.description}</p>
                 <div className="flex items-center justify-between text-xs text-gray-500">
                   <span>Client: {project.client_name}</span>
-                  <span>Due: {moment(project.deadline).format('MMM DD, YYYY')}</span>
+                  <span>Due: {formatDate(project.deadline, 'MMM dd, yyyy')}</span>
                   <span>Budget: ${project.budget}</span>
                 </div>
               </div>
@@ -636,10 +636,10 @@ const FreelancerProfile = ({
             className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
           >
             {Array.from({ length: 12 }, (_, i) => {
-              const month = moment().subtract(i, 'months').format('YYYY-MM');
+              const month = monthsAgo(i);
               return (
                 <option key={month} value={month}>
-                  {moment(month).format('MMMM YYYY')}
+                  {formatMonth(month)}
                 </option>
               );
             })}
@@ -651,7 +651,7 @@ const FreelancerProfile = ({
             <h3 className="text-sm font-medium text-green-600 mb-1">Total Earned</h3>
             <div className="text-2xl font-bold text-green-900">
               ${earnings.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).reduce((sum, item) => sum + (item.amount || 0), 0)}
             </div>
           </div>
@@ -659,7 +659,7 @@ const FreelancerProfile = ({
             <h3 className="text-sm font-medium text-blue-600 mb-1">Projects</h3>
             <div className="text-2xl font-bold text-blue-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).length}
             </div>
           </div>
@@ -668,7 +668,7 @@ const FreelancerProfile = ({
             <div className="text-2xl font-bold text-purple-900">
               {(() => {
                 const monthSubmissions = monthlyData.filter(item => 
-                  moment(item.created_at).format('YYYY-MM') === selectedMonth
+                  monthKey(item.created_at) === selectedMonth
                 );
                 return monthSubmissions.length > 0 
                   ? Math.round((monthSubmissions.reduce((sum, item) => sum + (item.client_rating || 0), 0) / monthSubmissions.length) * 10) / 10
@@ -681,7 +681,7 @@ const FreelancerProfile = ({
             <div className="text-2xl font-bold text-orange-900">
               {(() => {
                 const monthSubmissions = monthlyData.filter(item => 
-                  moment(item.created_at).format('YYYY-MM') === selectedMonth
+                  monthKey(item.created_at) === selectedMonth
                 );
                 return monthSubmissions.length > 0 
                   ? Math.round((monthSubmissions.filter(item => item.delivered_on_time).length / monthSubmissions.length) * 100)
@@ -713,7 +713,7 @@ const FreelancerProfile = ({
                 {earnings.slice(0, 10).map((earning, index) => (
                   <tr key={earning.id || index}>
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                      {moment(earning.created_at).format('MMM DD, YYYY')}
+                      {formatDate(earning.created_at, 'MMM dd, yyyy')}
                     </td>
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
                       {earning.project_title || 'Project'}
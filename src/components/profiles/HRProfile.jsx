@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, monthStart, monthsAgo } from '@/shared/utils/dateUtils';
 
 const HRProfile = ({ 
   profileData, 
@@ -44,7 +44,7 @@ const HRProfile = ({
         
         // Calculate HR metrics
         const currentMonthData = monthlyData.filter(item => 
-          moment(item.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+          monthKey(item.created_at) === monthKey()
         );
         
         // Fetch recruitment data
@@ -52,7 +52,7 @@ const HRProfile = ({
           .from('recruitment_activities')
           .select('*')
           .eq('hr_id', profileData?.user_id)
-          .gte('created_at', moment().startOf('month').toISOString())
+          .gte('created_at', monthStart().toISOString())
           .order('created_at', { ascending: false });
           
         if (recruitmentError && recruitmentError.code !== 'PGRST116') {
@@ -94,7 +94,7 @@ const HRProfile = ({
           .from('monthly_kpi_reports')
           .select('*')
           .eq('user_id', profileData?.user_id)
-          .eq('month', moment(selectedMonth).format('YYYY-MM-01'))
+          .eq('month', formatDate(selectedMonth, 'yyyy-MM-01'))
           .single();
           
         if (kpiData && !kpiError) {
@@ -158,7 +158,7 @@ const HRProfile = ({
         .from('monthly_kpi_reports')
         .upsert({
           user_id: profileData?.user_id,
-          month: moment(selectedMonth).format('YYYY-MM-01'),
+          month: formatDate(selectedMonth, 'yyyy-MM-01'),
           recruitment_efficiency: hrKPIs.recruitment_efficiency,
           employee_satisfaction: hrKPIs.employee_satisfaction,
           retention_rate: hrKPIs.retention_rate,
@@ -503,7 +503,7 @@ const HRProfile = ({
                 <p className="text-gray-600 text-sm mb-2">{activity.candidate_name}</p>
                 <div className="flex items-center justify-between text-xs text-gray-500">
                   <span>Department: {activity.department}</span>
-                  <span>{moment(activity.created_at).format('MMM DD, YYYY')}</span>
+                  <span>{formatDate(activity.created_at, 'MMM dd, yyyy')}</span>
                 </div>
               </div>
             ))}
@@ -565,7 +565,7 @@ const HRProfile = ({
                       </span>
                     </td>
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
-                      {moment(employee.created_at).format('MMM DD, YYYY')}
+                      {formatDate(employee.created_at, 'MMM dd, yyyy')}
                     </td>
                   </tr>
                 ))}
@@ -591,10 +591,10 @@ const HRProfile = ({
             className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
           >
             {Array.from({ length: 12 }, (_, i) => {
-              const month = moment().subtract(i, 'months').format('YYYY-MM');
+              const month = monthsAgo(i);
               return (
                 <option key={month} value={month}>
-                  {moment(month).format('MMMM YYYY')}
+                  {formatMonth(month)}
                 </option>
               );
             })}
@@ -606,7 +606,7 @@ const HRProfile = ({
             <h3 className="text-sm font-medium text-blue-600 mb-1">Tasks</h3>
             <div className="text-2xl font-bold text-blue-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).length}
             </div>
           </div>
@@ -614,7 +614,7 @@ const HRProfile = ({
             <h3 className="text-sm font-medium text-green-600 mb-1">Completed</h3>
             <div className="text-2xl font-bold text-green-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth && 
+                monthKey(item.created_at) === selectedMonth && 
                 item.status === 'completed'
               ).length}
             </div>
@@ -623,7 +623,7 @@ const HRProfile = ({
             <h3 className="text-sm font-medium text-purple-600 mb-1">Hires</h3>
             <div className="text-2xl font-bold text-purple-900">
               {recruitmentData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth && 
+                monthKey(item.created_at) === selectedMonth && 
                 item.status === 'hired'
               ).length}
             </div>
@@ -632,7 +632,7 @@ const HRProfile = ({
             <h3 className="text-sm font-medium text-orange-600 mb-1">Interviews</h3>
             <div className="text-2xl font-bold text-orange-900">
               {recruitmentData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth && 
+                monthKey(item.created_at) === selectedMonth && 
                 item.status === 'interviewed'
               ).length}
             </div>
@@ -645,7 +645,7 @@ const HRProfile = ({
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
           <div className="bg-white rounded-xl p-6 w-full max-w-4xl mx-4 max-h-[90vh] overflow-y-auto">
             <div className="flex items-center justify-between mb-6">
-              <h3 className="text-xl font-semibold text-gray-900">Update HR KPIs - {moment(selectedMonth).format('MMMM YYYY')}</h3>
+              <h3 className="text-xl font-semibold text-gray-900">Update HR KPIs - {formatMonth(selectedMonth)}</h3>
               <button
                 onClick={() => setShowKPIModal(false)}
                 className="text-gray-400 hover:text-gray-600"
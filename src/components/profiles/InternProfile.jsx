@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, monthsAgo } from '@/shared/utils/dateUtils';
 import { INTERN_PROFILE_CONFIG } from '../../shared/config/uiConfig';
 
 const InternProfile = ({ 
@@ -48,7 +48,7 @@ const InternProfile = ({
         
         // Calculate learning progress
         const currentMonthData = monthlyData.filter(item => 
-          moment(item.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+          monthKey(item.created_at) === monthKey()
         );
         
         const totalLearningHours = currentMonthData.reduce((sum, item) => 
@@ -103,7 +103,7 @@ const InternProfile = ({
           .from('intern_kpis')
           .select('*')
           .eq('user_id', profileData?.user_id)
-          .eq('month', moment().format('YYYY-MM'))
+          .eq('month', monthKey())
           .single();
           
         if (kpiData && !kpiError) {
@@ -180,7 +180,7 @@ const InternProfile = ({
         .from('intern_kpis')
         .upsert({
           user_id: profileData?.user_id,
-          month: moment().format('YYYY-MM'),
+          month: monthKey(),
           ...learningKPIs,
           updated_at: new Date().toISOString()
         });
@@ -450,7 +450,7 @@ const InternProfile = ({
                       <span className="font-medium text-gray-900">{feedback.mentor_name || 'Mentor'}</span>
                     </div>
                     <span className="text-xs text-gray-500">
-                      {moment(feedback.created_at).format('MMM DD, YYYY')}
+                      {formatDate(feedback.created_at, 'MMM dd, yyyy')}
                     </span>
                   </div>
                   <p className="text-gray-700 mb-2">{feedback.feedback_text}</p>
@@ -549,7 +549,7 @@ const InternProfile = ({
                 </div>
                 <p className="text-gray-600 text-sm mb-2">{goal.description}</p>
                 <div className="flex items-center text-xs text-gray-500">
-                  <span>{INTERN_PROFILE_CONFIG.learningGoals.targetLabel} {moment(goal.target_date).format('MMM DD, YYYY')}</span>
+                  <span>{INTERN_PROFILE_CONFIG.learningGoals.targetLabel} {formatDate(goal.target_date, 'MMM dd, yyyy')}</span>
                   {goal.progress && (
                     <span className="ml-4">{INTERN_PROFILE_CONFIG.learningGoals.progressLabel} {goal.progress}%</span>
                   )}
@@ -580,7 +580,7 @@ const InternProfile = ({
                 <div className="flex items-center justify-between mb-2">
                   <h3 className="font-medium text-gray-900">{feedback.mentor_name}</h3>
                   <span className="text-sm text-gray-500">
-                    {moment(feedback.created_at).format('MMM DD, YYYY')}
+                    {formatDate(feedback.created_at, 'MMM dd, yyyy')}
                   </span>
                 </div>
                 <p className="text-gray-700 mb-2">{feedback.feedback}</p>
@@ -620,10 +620,10 @@ const InternProfile = ({
             className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
           >
             {Array.from({ length: 6 }, (_, i) => {
-              const month = moment().subtract(i, 'months').format('YYYY-MM');
+              const month = monthsAgo(i);
               return (
                 <option key={month} value={month}>
-                  {moment(month).format('MMMM YYYY')}
+                  {formatMonth(month)}
                 </option>
               );
             })}
@@ -635,7 +635,7 @@ const InternProfile = ({
             <h3 className="text-sm font-medium text-blue-600 mb-1">{INTERN_PROFILE_CONFIG.monthlyProgress.stats.tasks}</h3>
             <div className="text-2xl font-bold text-blue-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).length}
             </div>
           </div>
@@ -643,7 +643,7 @@ const InternProfile = ({
             <h3 className="text-sm font-medium text-green-600 mb-1">{INTERN_PROFILE_CONFIG.monthlyProgress.stats.completed}</h3>
             <div className="text-2xl font-bold text-green-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth && 
+                monthKey(item.created_at) === selectedMonth && 
                 item.status === 'completed'
               ).length}
             </div>
@@ -653,7 +653,7 @@ const InternProfile = ({
             <div className="text-2xl font-bold text-purple-900">
               {(() => {
                 const monthSubmissions = monthlyData.filter(item => 
-                  moment(item.created_at).format('YYYY-MM') === selectedMonth
+                  monthKey(item.created_at) === selectedMonth
                 );
                 return monthSubmissions.length > 0 
                   ? Math.round(monthSubmissions.reduce((sum, item) => sum + (item.performance_score || 0), 0) / monthSubmissions.length)
@@ -665,7 +665,7 @@ const InternProfile = ({
             <h3 className="text-sm font-medium text-orange-600 mb-1">{INTERN_PROFILE_CONFIG.monthlyProgress.stats.hours}</h3>
             <div className="text-2xl font-bold text-orange-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).reduce((sum, item) => sum + (item.learning_hours || 0), 0)}
             </div>
           </div>
@@ -698,7 +698,7 @@ const InternProfile = ({
                 {monthlyData.slice(0, 10).map((activity, index) => (
                   <tr key={activity.id || index}>
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                      {moment(activity.created_at).format('MMM DD, YYYY')}
+                      {formatDate(activity.created_at, 'MMM dd, yyyy')}
                     </td>
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
                       {activity.submission_type || 'Learning Task'}
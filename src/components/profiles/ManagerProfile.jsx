@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
-import moment from 'moment';
+import { daysFromNow, formatMonth, monthKey, monthsAgo } from '@/shared/utils/dateUtils';
 
 const ManagerProfile = ({ 
   profileData, 
@@ -58,7 +58,7 @@ const ManagerProfile = ({
           .from('submissions')
           .select('*')
           .in('user_id', teamMembers?.map(member => member.user_id) || [])
-          .gte('created_at', moment().subtract(30, 'days').toISOString());
+          .gte('created_at', daysFromNow(-30).toISOString());
           
         if (projectsError) {
           console.error('Error fetching projects:', projectsError);
@@ -493,10 +493,10 @@ const ManagerProfile = ({
             className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
           >
             {Array.from({ length: 12 }, (_, i) => {
-              const month = moment().subtract(i, 'months').format('YYYY-MM');
+              const month = monthsAgo(i);
               return (
                 <option key={month} value={month}>
-                  {moment(month).format('MMMM YYYY')}
+                  {formatMonth(month)}
                 </option>
               );
             })}
@@ -508,7 +508,7 @@ const ManagerProfile = ({
             <h3 className="text-sm font-medium text-blue-600 mb-1">My Submissions</h3>
             <div className="text-2xl font-bold text-blue-900">
               {monthlyData.filter(item => 
-                moment(item.created_at).format('YYYY-MM') === selectedMonth
+                monthKey(item.created_at) === selectedMonth
               ).length}
             </div>
           </div>
@@ -532,7 +532,7 @@ const ManagerProfile = ({
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
           <div className="bg-white rounded-xl p-6 w-full max-w-4xl mx-4 max-h-[90vh] overflow-y-auto">
             <div className="flex items-center justify-between mb-6">
-              <h3 className="text-xl font-semibold text-gray-900">Update Manager KPIs - {moment(selectedMonth).format('MMMM YYYY')}</h3>
+              <h3 className="text-xl font-semibold text-gray-900">Update Manager KPIs - {formatMonth(selectedMonth)}</h3>
               <button
                 onClick={() => setShowKPIModal(false)}
                 className="text-gray-400 hover:text-gray-600"
@@ -658,7 +658,7 @@ const ManagerProfile = ({
           <div className="bg-white rounded-xl p-6 w-full max-w-4xl mx-4 max-h-[90vh] overflow-y-auto">
             <div className="flex items-center justify-between mb-6">
               <h3 className="text-xl font-semibold text-gray-900">
-                {selectedTeamMember.name} - KPIs for {moment(selectedMonth).format('MMMM YYYY')}
+                {selectedTeamMember.name} - KPIs for {formatMonth(selectedMonth)}
               </h3>
               <button
                 onClick={() => setSelectedTeamMember(null)}
@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
-import moment from 'moment';
+import { daysFromNow, formatMonth, monthKey, monthsAgo } from '@/shared/utils/dateUtils';
 
 const OperationsHeadProfile = ({ 
   profileData, 
@@ -62,7 +62,7 @@ const OperationsHeadProfile = ({
           .from('submissions')
           .select('*')
           .in('user_id', teamMembers?.map(member => member.user_id) || [])
-          .gte('created_at', moment().subtract(30, 'days').toISOString());
+          .gte('created_at', daysFromNow(-30).toISOString());
           
         if (metricsError) {
           console.error('Error fetching metrics:', metricsError);
@@ -378,10 +378,10 @@ const OperationsHeadProfile = ({
                     className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
                   >
                     {Array.from({ length: 12 }, (_, i) => {
-                      const month = moment().subtract(i, 'months').format('YYYY-MM');
+                      const month = monthsAgo(i);
                       return (
                         <option key={month} value={month}>
-                          {moment(month).format('MMMM YYYY')}
+                          {formatMonth(month)}
                         </option>
                       );
                     })}
@@ -393,7 +393,7 @@ const OperationsHeadProfile = ({
                     <h3 className="text-sm font-medium text-blue-600 mb-1">Personal Submissions</h3>
                     <div className="text-2xl font-bold text-blue-900">
                       {monthlyData.filter(item => 
-                        moment(item.created_at).format('YYYY-MM') === selectedMonth
+                        monthKey(item.created_at) === selectedMonth
                       ).length}
                     </div>
                   </div>
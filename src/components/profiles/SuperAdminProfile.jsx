@@ -3,7 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useSupabase } from '../SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
 import { LoadingSpinner } from '@/shared/components/LoadingStates';
-import moment from 'moment';
+import { formatDate, formatMonth, monthKey, monthStart, monthsAgo } from '@/shared/utils/dateUtils';
 
 const SuperAdminProfile = ({ 
   profileData, 
@@ -46,7 +46,7 @@ const SuperAdminProfile = ({
         
         // Calculate admin metrics
         const currentMonthData = monthlyData.filter(item => 
-          moment(item.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+          monthKey(item.created_at) === monthKey()
         );
         
         // Fetch all users for management
@@ -73,7 +73,7 @@ const SuperAdminProfile = ({
         const { data: systemStats, error: systemError } = await supabase
           .from('system_metrics')
           .select('*')
-          .gte('created_at', moment().startOf('month').toISOString())
+          .gte('created_at', monthStart().toISOString())
           .order('created_at', { ascending: false })
           .limit(1);
           
@@ -315,10 +315,10 @@ const SuperAdminProfile = ({
 
   const getUserGrowthRate = () => {
     const thisMonth = userManagementData.filter(user => 
-      moment(user.created_at).format('YYYY-MM') === moment().format('YYYY-MM')
+      monthKey(user.created_at) === monthKey()
     ).length;
     const lastMonth = userManagementData.filter(user => 
-      moment(user.created_at).format('YYYY-MM') === moment().subtract(1, 'month').format('YYYY-MM')
+      monthKey(user.created_at) === monthsAgo(1)
     ).length;
     
     if (lastMonth === 0) return thisMonth > 0 ? '+100%' : '0%';
@@ -402,7 +402,7 @@ const SuperAdminProfile = ({
         <div className="flex items-center justify-between mb-6">
           <div>
             <h2 className="text-xl font-semibold text-gray-900">Organization KPI Dashboard</h2>
-            <p className="text-sm text-gray-600">System-wide performance metrics for {moment(selectedMonth).format('MMMM YYYY')}</p>
+            <p className="text-sm text-gray-600">System-wide performance metrics for {formatMonth(selectedMonth)}</p>
           </div>
           <button
             onClick={() => setShowKPIModal(true)}
@@ -775,10 +775,10 @@ const SuperAdminProfile = ({
                   className="border border-gray-300 rounded-lg px-3 py-2 text-sm"
                 >
                   {Array.from({ length: 12 }, (_, i) => {
-                    const month = moment().subtract(i, 'months').format('YYYY-MM');
+                    const month = monthsAgo(i);
                     return (
                       <option key={month} value={month}>
-                        {moment(month).format('MMMM YYYY')}
+                        {formatMonth(month)}
                       </option>
                     );
                   })}
@@ -794,7 +794,7 @@ const SuperAdminProfile = ({
                         <div>
                           <h4 className="font-medium text-gray-900">{event.title}</h4>
                           <p className="text-sm text-gray-600">
-                            {moment(event.start).format('MMM DD, YYYY HH:mm')}
+                            {formatDate(event.start, 'MMM dd, yyyy HH:mm')}
                           </p>
                         </div>
                         <span className={`px-2 py-1 rounded-full text-xs font-medium ${
@@ -0,0 +1,147 @@
+import { lazy } from "react";
+
+/**
+ * Lazily loaded route components for Router.jsx.
+ *
+ * Each page is its own chunk, so a login only downloads the dashboard the
+ * role lands on. Once the app is idle, the routes that role is likely to open
+ * next (from its dashboard_access) are prefetched one at a time.
+ */
+
+/**
+ * React.lazy with a preload() that shares the same import, so a prefetched
+ * chunk is reused when the route renders. A failed import can be retried.
+ */
+export function lazyRoute(load, exportName = 'default') {
+  let promise = null;
+  const preload = () => {
+    if (!promise) {
+      promise = load()
+        .then(module => ({ default: module[exportName] }))
+        .catch(error => {
+          promise = null;
+          throw error;
+        });
+    }
+    return promise;
+  };
+
+  const Component = lazy(preload);
+  Component.preload = preload;
+  return Component;
+}
+
+export const ROUTE_MODULES = {
+  homepage: lazyRoute(() => import("@/components/Homepage")),
+  agencyDashboard: lazyRoute(() => import("@/components/AgencyDashboard")),
+  passwordSetup: lazyRoute(() => import("../features/auth/PasswordSetup")),
+  employeeDashboard: lazyRoute(() => import("@/components/EmployeeDashboard")),
+  clientDashboard: lazyRoute(() => import("@/features/clients/components/ClientDashboardView"), 'ClientDashboardView'),
+  managerDashboard: lazyRoute(() => import("@/components/ManagerDashboard")),
+  superAdminDashboard: lazyRoute(() => import("@/components/SuperAdminDashboard")),
+  employeeOnboardingForm: lazyRoute(() => import("@/components/EmployeeOnboardingForm")),
+  clientOnboardingForm: lazyRoute(() => import("@/components/ClientOnboardingForm")),
+  employeeForm: lazyRoute(() => import("@/components/EmployeeForm")),
+  leaveApplicationForm: lazyRoute(() => import("@/components/LeaveApplicationForm")),
+  clientAdditionForm: lazyRoute(() => import("@/features/clients/components/ClientAdditionForm")),
+  formTrackingDashboard: lazyRoute(() => import("@/components/FormTrackingDashboard")),
+  monthlyReportDashboard: lazyRoute(() => import("@/components/MonthlyReportDashboard")),
+  directoryPage: lazyRoute(() => import("@/pages/DirectoryPage")),
+  performanceScoringPage: lazyRoute(() => import("@/pages/PerformanceScoringPage")),
+  profileEditPage: lazyRoute(() => import("@/features/profile/ProfileEditPage")),
+  arcadeHistory: lazyRoute(() => import("@/components/ArcadeHistory")),
+  arcadeEarnPoints: lazyRoute(() => import("@/components/ArcadeEarnPoints")),
+  arcadeRedeemPoints: lazyRoute(() => import("@/components/ArcadeRedeemPoints")),
+  managerIncentiveReporting: lazyRoute(() => import("@/features/employees/components/ManagerIncentiveReporting")),
+  interactiveKPIForm: lazyRoute(() => import("@/components/InteractiveKPIForm")),
+  employeeIncentiveForm: lazyRoute(() => import("@/components/EmployeeIncentiveForm")),
+  hrIncentiveApproval: lazyRoute(() => import("@/features/employees/components/HRIncentiveApproval")),
+  organizationChart: lazyRoute(() => import("@/components/OrganizationChart"))
+};
+
+// Likely next routes per dashboard_access entry, most likely first; each
+// dashboard's own page leads its list
+const DASHBOARD_ROUTES = {
+  seo_dashboard: ['employeeDashboard'],
+  ads_dashboard: ['employeeDashboard'],
+  social_dashboard: ['employeeDashboard'],
+  youtube_dashboard: ['employeeDashboard'],
+  dev_dashboard: ['employeeDashboard'],
+  design_dashboard: ['employeeDashboard'],
+  employee_dashboard: ['employeeDashboard', 'employeeForm', 'leaveApplicationForm', 'employeeIncentiveForm', 'arcadeEarnPoints'],
+  freelancer_dashboard: ['employeeDashboard', 'employeeForm'],
+  intern_dashboard: ['employeeDashboard', 'employeeForm', 'leaveApplicationForm'],
+  operations_dashboard: ['managerDashboard', 'performanceScoringPage', 'monthlyReportDashboard'],
+  management_dashboard: ['managerDashboard', 'directoryPage', 'organizationChart'],
+  hr_dashboard: ['managerDashboard', 'hrIncentiveApproval', 'employeeOnboardingForm'],
+  accounting_dashboard: ['managerDashboard', 'managerIncentiveReporting'],
+  sales_dashboard: ['managerDashboard', 'clientAdditionForm', 'clientOnboardingForm'],
+  admin_dashboard: ['managerDashboard', 'directoryPage'],
+  client_dashboard: ['clientDashboard'],
+  super_admin_dashboard: ['superAdminDashboard', 'managerDashboard', 'directoryPage'],
+  all_dashboards: ['formTrackingDashboard', 'monthlyReportDashboard'],
+  profile: ['profileEditPage']
+};
+
+/**
+ * Route module keys to prefetch for a user's dashboard_access, de-duplicated,
+ * with each dashboard's own routes ahead of the shared ones
+ */
+export function routesForDashboards(dashboardAccess = []) {
+  const keys = new Set();
+  const lists = dashboardAccess.map(dashboard => DASHBOARD_ROUTES[dashboard] || []);
+  const longest = Math.max(0, ...lists.map(list => list.length));
+  for (let rank = 0; rank < longest; rank++) {
+    lists.forEach(list => {
+      if (list[rank]) keys.add(list[rank]);
+    });
+  }
+  return Array.from(keys);
+}
+
+// Respect data-saver and very slow connections
+const shouldPrefetch = () => {
+  const connection = typeof navigator !== 'undefined' ? navigator.connection : null;
+  if (!connection) return true;
+  return !connection.saveData && !/(^|-)2g$/.test(connection.effectiveType || '');
+};
+
+const scheduleIdle = (callback) => (typeof window !== 'undefined' && window.requestIdleCallback
+  ? { idle: window.requestIdleCallback(callback, { timeout: 5000 }) }
+  : { timer: setTimeout(callback, 200) });
+
+const cancelIdle = (handle) => {
+  if (!handle) return;
+  if (handle.idle !== undefined) window.cancelIdleCallback(handle.idle);
+  if (handle.timer !== undefined) clearTimeout(handle.timer);
+};
+
+/**
+ * Prefetch the routes a user's dashboards lead to, one chunk per idle period
+ * @param {string[]} dashboardAccess - authState.dashboardAccess
+ * @returns {Function} cancels any prefetches not yet started
+ */
+export function prefetchRoutes(dashboardAccess = []) {
+  const keys = routesForDashboards(dashboardAccess);
+  if (keys.length === 0 || !shouldPrefetch()) return () => {};
+
+  let index = 0;
+  let handle = null;
+  let cancelled = false;
+
+  const next = () => {
+    handle = null;
+    if (cancelled || index >= keys.length) return;
+    ROUTE_MODULES[keys[index++]].preload()
+      .catch(() => {})
+      .finally(() => {
+        if (!cancelled) handle = scheduleIdle(next);
+      });
+  };
+
+  handle = scheduleIdle(next);
+  return () => {
+    cancelled = true;
+    cancelIdle(handle);
+  };
+}
@@ -1,6 +1,12 @@
 import { useState, useEffect, useCallback } from 'react';
 import { useSupabase } from './SupabaseProvider';
 import { useToast } from '@/shared/components/Toast';
+import { compositeKey, leftJoin, normalizeName, normalizePhone } from '@/shared/utils/joinIndex';
+
+// Submissions reference employees by name + phone; both sides are normalized
+// so formatting differences ("+91 98765 43210" vs "9876543210") still match
+const employeeKey = compositeKey(['name', 'phone'], [normalizeName, normalizePhone]);
+const submissionEmployeeKey = compositeKey(['employee_name', 'employee_phone'], [normalizeName, normalizePhone]);
 
 export const useFetchSubmissions = () => {
   const [allSubmissions, setAllSubmissions] = useState([]);
@@ -40,14 +46,10 @@ export const useFetchSubmissions = () => {
       const submissions = submissionsResult.data || [];
       const employees = employeesResult.data || [];
       
-      const enrichedSubmissions = submissions.map(submission => {
-        // Try to find matching employee by name and phone
-        const matchingEmployee = employees.find(emp => 
-          emp.name === submission.employee_name && 
-          emp.phone === submission.employee_phone
-        );
-        
-        return {
+      const enrichedSubmissions = leftJoin(submissions, employees, {
+        leftKey: submissionEmployeeKey,
+        rightKey: employeeKey,
+        merge: (submission, matchingEmployee) => ({
           ...submission,
           employees: matchingEmployee || {
             id: null,
@@ -57,7 +59,7 @@ export const useFetchSubmissions = () => {
             department: submission.department,
             phone: submission.employee_phone
           }
-        };
+        })
       });
 
       const data = enrichedSubmissions;
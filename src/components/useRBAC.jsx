@@ -1,5 +1,7 @@
 import React, { createContext, useContext, useState, useEffect } from 'react';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
+import { usePermissions } from '@/shared/hooks/usePermissions';
+import { permissionEngine } from '@/shared/services/permissionEngine';
 
 const RBACContext = createContext();
 
@@ -13,137 +15,149 @@ export const useRBAC = () => {
 
 export const useRoleBasedAccess = useRBAC;
 
-export const RBACProvider = ({ children }) => {
-  const [currentUser, setCurrentUser] = useState(null);
-  const [isInitializing, setIsInitializing] = useState(true);
-  const [roles, setRoles] = useState({
-    admin: {
-      id: 'admin',
-      name: 'Administrator',
-      description: 'Full system access and management capabilities',
-      permissions: {
-        manager: ['read', 'write', 'delete', 'configure'],
-        employee: ['read', 'write', 'delete', 'configure'],
-        agency: ['read', 'write', 'delete', 'configure'],
-        intern: ['read', 'write', 'delete', 'configure'],
-        system: ['read', 'write', 'delete', 'configure', 'audit']
-      },
-      dashboardAccess: ['manager', 'employee', 'agency', 'intern'],
-      features: {
-        controlPanel: true,
-        analytics: true,
-        configuration: true,
-        reporting: true,
-        userManagement: true,
-        auditLogs: true
-      }
+const DEFAULT_ROLES = {
+  admin: {
+    id: 'admin',
+    name: 'Administrator',
+    description: 'Full system access and management capabilities',
+    permissions: {
+      manager: ['read', 'write', 'delete', 'configure'],
+      employee: ['read', 'write', 'delete', 'configure'],
+      agency: ['read', 'write', 'delete', 'configure'],
+      intern: ['read', 'write', 'delete', 'configure'],
+      system: ['read', 'write', 'delete', 'configure', 'audit']
     },
-    manager: {
-      id: 'manager',
-      name: 'Manager',
-      description: 'Management oversight and control capabilities',
-      permissions: {
-        manager: ['read', 'write', 'configure'],
-        employee: ['read', 'write'],
-        agency: ['read', 'write'],
-        intern: ['read', 'write'],
-        system: ['read']
-      },
-      dashboardAccess: ['manager', 'employee', 'agency', 'intern'],
-      features: {
-        controlPanel: true,
-        analytics: true,
-        configuration: true,
-        reporting: true,
-        userManagement: false,
-        auditLogs: false
-      }
+    dashboardAccess: ['manager', 'employee', 'agency', 'intern'],
+    features: {
+      controlPanel: true,
+      analytics: true,
+      configuration: true,
+      reporting: true,
+      userManagement: true,
+      auditLogs: true
+    }
+  },
+  manager: {
+    id: 'manager',
+    name: 'Manager',
+    description: 'Management oversight and control capabilities',
+    permissions: {
+      manager: ['read', 'write', 'configure'],
+      employee: ['read', 'write'],
+      agency: ['read', 'write'],
+      intern: ['read', 'write'],
+      system: ['read']
     },
-    supervisor: {
-      id: 'supervisor',
-      name: 'Supervisor',
-      description: 'Team supervision and limited management access',
-      permissions: {
-        manager: ['read'],
-        employee: ['read', 'write'],
-        agency: ['read'],
-        intern: ['read', 'write'],
-        system: ['read']
-      },
-      dashboardAccess: ['employee', 'intern'],
-      features: {
-        controlPanel: false,
-        analytics: true,
-        configuration: false,
-        reporting: true,
-        userManagement: false,
-        auditLogs: false
-      }
+    dashboardAccess: ['manager', 'employee', 'agency', 'intern'],
+    features: {
+      controlPanel: true,
+      analytics: true,
+      configuration: true,
+      reporting: true,
+      userManagement: false,
+      auditLogs: false
+    }
+  },
+  supervisor: {
+    id: 'supervisor',
+    name: 'Supervisor',
+    description: 'Team supervision and limited management access',
+    permissions: {
+      manager: ['read'],
+      employee: ['read', 'write'],
+      agency: ['read'],
+      intern: ['read', 'write'],
+      system: ['read']
     },
-    employee: {
-      id: 'employee',
-      name: 'Employee',
-      description: 'Standard employee access to personal dashboard',
-      permissions: {
-        manager: [],
-        employee: ['read', 'write'],
-        agency: [],
-        intern: [],
-        system: []
-      },
-      dashboardAccess: ['employee'],
-      features: {
-        controlPanel: false,
-        analytics: false,
-        configuration: false,
-        reporting: false,
-        userManagement: false,
-        auditLogs: false
-      }
+    dashboardAccess: ['employee', 'intern'],
+    features: {
+      controlPanel: false,
+      analytics: true,
+      configuration: false,
+      reporting: true,
+      userManagement: false,
+      auditLogs: false
+    }
+  },
+  employee: {
+    id: 'employee',
+    name: 'Employee',
+    description: 'Standard employee access to personal dashboard',
+    permissions: {
+      manager: [],
+      employee: ['read', 'write'],
+      agency: [],
+      intern: [],
+      system: []
     },
-    intern: {
-      id: 'intern',
-      name: 'Intern',
-      description: 'Intern access to learning and task management',
-      permissions: {
-        manager: [],
-        employee: [],
-        agency: [],
-        intern: ['read', 'write'],
-        system: []
-      },
-      dashboardAccess: ['intern'],
-      features: {
-        controlPanel: false,
-        analytics: false,
-        configuration: false,
-        reporting: false,
-        userManagement: false,
-        auditLogs: false
-      }
+    dashboardAccess: ['employee'],
+    features: {
+      controlPanel: false,
+      analytics: false,
+      configuration: false,
+      reporting: false,
+      userManagement: false,
+      auditLogs: false
+    }
+  },
+  intern: {
+    id: 'intern',
+    name: 'Intern',
+    description: 'Intern access to learning and task management',
+    permissions: {
+      manager: [],
+      employee: [],
+      agency: [],
+      intern: ['read', 'write'],
+      system: []
     },
-    agency: {
-      id: 'agency',
-      name: 'Agency User',
-      description: 'Agency dashboard access for client management',
-      permissions: {
-        manager: [],
-        employee: ['read'],
-        agency: ['read', 'write'],
-        intern: [],
-        system: []
-      },
-      dashboardAccess: ['agency'],
-      features: {
-        controlPanel: false,
-        analytics: false,
-        configuration: false,
-        reporting: false,
-        userManagement: false,
-        auditLogs: false
-      }
+    dashboardAccess: ['intern'],
+    features: {
+      controlPanel: false,
+      analytics: false,
+      configuration: false,
+      reporting: false,
+      userManagement: false,
+      auditLogs: false
+    }
+  },
+  agency: {
+    id: 'agency',
+    name: 'Agency User',
+    description: 'Agency dashboard access for client management',
+    permissions: {
+      manager: [],
+      employee: ['read'],
+      agency: ['read', 'write'],
+      intern: [],
+      system: []
+    },
+    dashboardAccess: ['agency'],
+    features: {
+      controlPanel: false,
+      analytics: false,
+      configuration: false,
+      reporting: false,
+      userManagement: false,
+      auditLogs: false
     }
-  });
+  }
+};
+
+// Role permissions and dashboard access as rows for the shared permission engine
+const toPermissionRows = (roles) => Object.values(roles).flatMap(role => [
+  ...Object.entries(role.permissions).flatMap(([dashboard, actions]) =>
+    actions.map(action => ({ role: role.id, resource: dashboard, action }))
+  ),
+  ...role.dashboardAccess.map(dashboard => ({ role: role.id, resource: dashboard, action: 'view' }))
+]);
+
+permissionEngine.setSource('rbac', toPermissionRows(DEFAULT_ROLES));
+
+export const RBACProvider = ({ children }) => {
+  const [currentUser, setCurrentUser] = useState(null);
+  const [isInitializing, setIsInitializing] = useState(true);
+  const [roles, setRoles] = useState(DEFAULT_ROLES);
   
   const [users, setUsers] = useState([
     { id: 1, name: 'John Manager', email: 'john@company.com', role: 'manager', active: true },
@@ -155,6 +169,14 @@ export const RBACProvider = ({ children }) => {
 
   const { authState } = useUnifiedAuth();
   const { user, isLoading: loading } = authState;
+  const { can } = usePermissions(currentUser?.role);
+
+  // Edited roles replace the compiled defaults
+  useEffect(() => {
+    if (roles !== DEFAULT_ROLES) {
+      permissionEngine.setSource('rbac', toPermissionRows(roles));
+    }
+  }, [roles]);
 
   // Sync currentUser with AuthContext authentication state
   useEffect(() => {
@@ -177,6 +199,8 @@ export const RBACProvider = ({ children }) => {
         if (!isInitializing) {
           setCurrentUser(null);
           localStorage.removeItem('currentUser');
+          // The next login loads role_permissions again
+          permissionEngine.reset();
         }
         setIsInitializing(false);
       }
@@ -206,14 +230,13 @@ export const RBACProvider = ({ children }) => {
   }, [user, currentUser, isInitializing]);
 
   const hasPermission = (dashboard, action) => {
-    if (!currentUser || !roles[currentUser.role]) return false;
-    const userRole = roles[currentUser.role];
-    return userRole.permissions[dashboard]?.includes(action) || false;
+    if (!currentUser) return false;
+    return can(dashboard, action);
   };
 
   const hasDashboardAccess = (dashboard) => {
-    if (!currentUser || !roles[currentUser.role]) return false;
-    return roles[currentUser.role].dashboardAccess.includes(dashboard);
+    if (!currentUser) return false;
+    return can(dashboard, 'view');
   };
 
   const hasFeatureAccess = (feature) => {
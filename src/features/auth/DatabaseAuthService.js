@@ -1,4 +1,5 @@
 import { supabase } from '@/shared/lib/supabase';
+import { sessionCache } from '@/shared/services/sessionCache';
 
 /**
  * Database Authentication Service
@@ -244,6 +245,16 @@ export class DatabaseAuthService {
    * @param {string} sessionToken - Session token to invalidate
    */
   static async logoutUser(sessionToken) {
+    await this.revokeSession(sessionToken);
+  }
+
+  /**
+   * Revoke a session: deactivated in the database and refused by the
+   * session cache right away
+   * @param {string} sessionToken - Session token to revoke
+   */
+  static async revokeSession(sessionToken) {
+    sessionCache.revoke(sessionToken);
     await supabase
       .from('user_sessions')
       .update({
@@ -253,12 +264,40 @@ export class DatabaseAuthService {
       .eq('session_token', sessionToken);
   }
 
+  /**
+   * Revoke every active session of a user
+   * @param {string} userId - User ID
+   */
+  static async revokeUserSessions(userId) {
+    sessionCache.revokeUser(userId);
+    await supabase
+      .from('user_sessions')
+      .update({
+        is_active: false,
+        logout_timestamp: new Date().toISOString()
+      })
+      .eq('user_id', userId)
+      .eq('is_active', true);
+  }
+
   /**
    * Validate session token
+   * Served from the session cache for a short TTL; last_activity is written
+   * by the cache's periodic bulk flush rather than on every call
    * @param {string} sessionToken - Session token to validate
    * @returns {Promise<Object|null>} User data if valid, null if invalid
    */
   static async validateSession(sessionToken) {
+    sessionCache.watchRevocations(supabase);
+    return sessionCache.validate(sessionToken, token => this.loadSession(token));
+  }
+
+  /**
+   * Look up an active, unexpired session with its user
+   * @param {string} sessionToken - Session token
+   * @returns {Promise<Object|null>} User and session, null if invalid
+   */
+  static async loadSession(sessionToken) {
     const { data: session, error } = await supabase
       .from('user_sessions')
       .select(`
@@ -274,12 +313,6 @@ export class DatabaseAuthService {
       return null;
     }
 
-    // Update last activity
-    await supabase
-      .from('user_sessions')
-      .update({ last_activity: new Date().toISOString() })
-      .eq('id', session.id);
-
     return {
       user: session.unified_users,
       session: {
@@ -291,11 +324,15 @@ export class DatabaseAuthService {
   }
 
   /**
-   * Generate secure session token
+   * Generate secure session token for a user_sessions row
+   * API requests carry signed tokens instead (server/sessionTokens.js); this
+   * opaque token only identifies a database session, so it is 256 random bits
    * @returns {string} Session token
    */
   static generateSessionToken() {
-    return `session_${Date.now()}_${Math.random().toString(36).substring(2, 15)}_${Math.random().toString(36).substring(2, 15)}`;
+    const bytes = new Uint8Array(32);
+    crypto.getRandomValues(bytes);
+    return `session_${Array.from(bytes, byte => byte.toString(16).padStart(2, '0')).join('')}`;
   }
 
   /**
@@ -1,21 +1,25 @@
 import React from 'react';
 import { Navigate, useLocation } from 'react-router-dom';
 import { useUnifiedAuth } from './UnifiedAuthContext';
+import { usePermissions } from '@/shared/hooks/usePermissions';
 
 const ProtectedRoute = ({ 
   children, 
   requiredRole = null, 
   requiredRoles = [], 
   allowedRoles = [], // New prop for more flexible role checking
+  resource = null, // role_permissions resource, checked with `action`
+  action = 'read',
   redirectTo = '/login',
   fallback = null 
 }) => {
   const { authState } = useUnifiedAuth();
   const { user, isLoggedIn: isAuthenticated, isLoading: loading } = authState;
   const location = useLocation();
+  const { can, ready: permissionsReady } = usePermissions(user?.role);
 
-  // Show loading spinner while checking authentication
-  if (loading) {
+  // Show loading spinner while checking authentication (and permissions, if required)
+  if (loading || (resource && user && !permissionsReady)) {
     return (
       <div className="min-h-screen flex items-center justify-center bg-gray-50">
         <div className="flex flex-col items-center space-y-4">
@@ -36,11 +40,13 @@ const ProtectedRoute = ({
     return <Navigate to="/setup-password" replace />;
   }
 
-  // Check role-based access
-  if (requiredRole && user.role !== requiredRole) {
-    console.log('🔒 Access denied - required role not matched:', { 
+  // Check role-based and resource-based access
+  if ((requiredRole && user.role !== requiredRole) || (resource && !can(resource, action))) {
+    console.log('🔒 Access denied - required role or permission not matched:', { 
       userRole: user.role, 
-      requiredRole 
+      requiredRole,
+      resource,
+      action
     });
     // If user doesn't have required role, show fallback or redirect
     if (fallback) {
@@ -2,6 +2,7 @@ import React, { createContext, useContext, useState, useEffect, useCallback } fr
 import { supabase } from '@/shared/lib/supabase';
 import { useToast } from '@/shared/components/Toast';
 import { authenticateUser, validateSession, logout as apiLogout, getDashboardRoute } from '@/api/authApi';
+import { recordLoginAttempt } from '@/shared/utils/ipTracking';
 
 const UnifiedAuthContext = createContext(null);
 
@@ -151,6 +152,15 @@ export const UnifiedAuthProvider = ({ children }) => {
       }
 
       console.log('✅ Authentication successful for:', authResult.user.name);
+
+      // Queued and sent in the background; never delays the login
+      recordLoginAttempt({
+        userId: authResult.user.id,
+        email: authResult.user.email,
+        identifier: firstName,
+        userType: authResult.user.user_category,
+        loginStatus: 'success'
+      });
       
       // Store session data
       const sessionData = authResult.sessionData || {
@@ -193,6 +203,12 @@ export const UnifiedAuthProvider = ({ children }) => {
     } catch (error) {
       console.error('❌ Login failed:', error);
       const errorMessage = error.message || 'Login failed. Please check your credentials.';
+
+      recordLoginAttempt({
+        identifier: firstName,
+        loginStatus: 'failed',
+        failureReason: errorMessage
+      });
       
       setAuthState(prev => ({ 
         ...prev, 
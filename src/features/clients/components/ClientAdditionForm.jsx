@@ -24,7 +24,7 @@ export function ClientAdditionForm({ onClientAdded, onCancel, compact = false, i
   const { notify } = useToast();
   const { user, role } = useUnifiedAuth();
   const userRole = role;
-  const { addClient } = useDataSync();
+  const { addClient } = useDataSync({ sync: [] });
   const { addSystemNotification } = useNotificationSystem();
   
   const [isOpen, setIsOpen] = useState(false);
@@ -179,9 +179,10 @@ export function ClientManagementView() {
 
   // Load saved draft when form opens
   useEffect(() => {
-    if (showCreateForm && autoSaveKey) {
-      const savedData = loadSavedData();
-      if (savedData && (savedData.name || savedData.scope_notes)) {
+    if (!showCreateForm || !autoSaveKey) return;
+    let cancelled = false;
+    loadSavedData().then(savedData => {
+      if (!cancelled && savedData && (savedData.name || savedData.scope_notes)) {
         // Only load if there's meaningful data
         setNewClient(savedData);
         notify({ 
@@ -190,7 +191,8 @@ export function ClientManagementView() {
           message: 'Your previous work has been restored' 
         });
       }
-    }
+    });
+    return () => { cancelled = true; };
   }, [showCreateForm, autoSaveKey, loadSavedData, notify]);
 
   // Clear draft when form is closed without saving
@@ -1,6 +1,16 @@
 // Client Repository Service for automatic client management
+// Local-mode clients live in the offline store (IndexedDB). While the network is
+// down, writes are applied locally and queued for replay to Supabase.
 
 import { EMPTY_CLIENT } from './clientServices';
+import { offlineStore, isNetworkError } from '@/shared/services/offlineStore';
+
+const LEGACY_STORAGE_KEY = 'bptm_clients';
+const COLLECTION = 'clients';
+
+const localId = () => 'client-' + Date.now() + '-' + Math.random().toString(36).substr(2, 9);
+// Clients created offline get a real uuid so queued updates match the row once it is inserted
+const offlineId = () => (typeof crypto !== 'undefined' && crypto.randomUUID ? crypto.randomUUID() : localId());
 
 export class ClientRepository {
   constructor(supabase, dataSyncNotifier = null) {
@@ -19,27 +29,86 @@ export class ClientRepository {
     }
   }
 
-  getLocalClients() {
+  async getLocalClients() {
     try {
-      const stored = localStorage.getItem('bptm_clients');
-      return stored ? JSON.parse(stored) : [];
+      await this.migrateLegacyClients();
+      return await offlineStore.getRecords(COLLECTION);
     } catch {
       return [];
     }
   }
 
-  saveLocalClients(clients) {
+  async saveLocalClient(client) {
     try {
-      localStorage.setItem('bptm_clients', JSON.stringify(clients));
+      await offlineStore.putRecord(COLLECTION, client);
+      this.cache.set(client.id, client);
       return true;
     } catch {
       return false;
     }
   }
 
+  // Clients kept in localStorage by earlier versions move to the offline store once
+  async migrateLegacyClients() {
+    let stored = null;
+    try {
+      stored = localStorage.getItem(LEGACY_STORAGE_KEY);
+    } catch {
+      return;
+    }
+    if (!stored) return;
+    const clients = JSON.parse(stored);
+    for (const client of clients) {
+      await offlineStore.putRecord(COLLECTION, client);
+    }
+    localStorage.removeItem(LEGACY_STORAGE_KEY);
+  }
+
+  /**
+   * Handle a failed Supabase write. Network failures are applied locally and
+   * queued for replay; anything else switches the repository to local mode.
+   */
+  async handleWriteFailure(error, queued, retryLocally) {
+    if (isNetworkError(error) && queued) {
+      console.warn('Network unavailable, queueing client write:', error.message);
+      const client = await queued();
+      if (this.notifyUpdate) this.notifyUpdate(client);
+      return client;
+    }
+    console.warn('Supabase failed, falling back to local mode:', error.message);
+    this.isLocalMode = true;
+    return retryLocally();
+  }
+
+  async queueCreate(client) {
+    const newClient = { ...client, id: offlineId(), created_at: client.created_at || new Date().toISOString() };
+    await this.saveLocalClient(newClient);
+    await offlineStore.enqueue({
+      table: COLLECTION,
+      op: 'insert',
+      payload: newClient,
+      record: { collection: COLLECTION, id: newClient.id }
+    });
+    return newClient;
+  }
+
+  async queueUpdate(id, changes) {
+    const known = this.cache.get(id) || (await this.getLocalClients()).find(c => c.id === id);
+    const updated = { ...known, ...changes, id };
+    if (known) await this.saveLocalClient(updated);
+    await offlineStore.enqueue({
+      table: COLLECTION,
+      op: 'update',
+      match: { id },
+      payload: changes,
+      record: known ? { collection: COLLECTION, id } : undefined
+    });
+    return updated;
+  }
+
   async getAllClients() {
     if (this.isLocalMode) {
-      const clients = this.getLocalClients();
+      const clients = await this.getLocalClients();
       clients.forEach(c => this.cache.set(c.id, c));
       return clients;
     }
@@ -51,8 +120,17 @@ export class ClientRepository {
         .order('created_at', { ascending: false });
       if (error) throw error;
       data.forEach(c => this.cache.set(c.id, c));
-      return data || [];
+      // Clients created offline and not yet replayed are listed first
+      const queued = new Set((await offlineStore.getQueue()).map(entry => entry.record?.id).filter(Boolean));
+      const serverIds = new Set((data || []).map(c => c.id));
+      const pending = (await this.getLocalClients()).filter(c => queued.has(c.id) && !serverIds.has(c.id));
+      pending.forEach(c => this.cache.set(c.id, c));
+      return [...pending.reverse(), ...(data || [])];
     } catch (error) {
+      if (isNetworkError(error)) {
+        console.warn('Network unavailable, showing cached clients:', error.message);
+        return this.cache.size ? Array.from(this.cache.values()) : this.getLocalClients();
+      }
       console.warn('Supabase failed, falling back to local mode:', error.message);
       this.isLocalMode = true;
       return this.getLocalClients();
@@ -64,20 +142,19 @@ export class ClientRepository {
     if (!normalized) throw new Error('Client name is required');
 
     if (this.isLocalMode) {
-      const clients = this.getLocalClients();
+      const clients = await this.getLocalClients();
       const existing = clients.find(c => c.name === normalized);
       if (existing) return existing;
 
       const newClient = {
         ...EMPTY_CLIENT,
         ...defaults,
-        id: 'client-' + Date.now() + '-' + Math.random().toString(36).substr(2, 9),
+        id: localId(),
         name: normalized,
         created_at: new Date().toISOString()
       };
       
-      clients.push(newClient);
-      this.saveLocalClients(clients);
+      await this.saveLocalClient(newClient);
       if (this.notifyUpdate) this.notifyUpdate(newClient);
       return newClient;
     }
@@ -102,9 +179,14 @@ export class ClientRepository {
       if (this.notifyUpdate) this.notifyUpdate(created);
       return created;
     } catch (error) {
-      console.warn('Supabase failed, falling back to local mode:', error.message);
-      this.isLocalMode = true;
-      return this.findOrCreateClientByName(name, defaults);
+      const cached = Array.from(this.cache.values()).find(c => c.name === normalized)
+        || (await this.getLocalClients()).find(c => c.name === normalized);
+      if (cached && isNetworkError(error)) return cached;
+      return this.handleWriteFailure(
+        error,
+        () => this.queueCreate({ ...EMPTY_CLIENT, ...defaults, name: normalized }),
+        () => this.findOrCreateClientByName(name, defaults)
+      );
     }
   }
 
@@ -112,15 +194,13 @@ export class ClientRepository {
     const toCreate = { ...EMPTY_CLIENT, ...client };
     
     if (this.isLocalMode) {
-      const clients = this.getLocalClients();
       const newClient = {
         ...toCreate,
-        id: toCreate.id || 'client-' + Date.now() + '-' + Math.random().toString(36).substr(2, 9),
+        id: toCreate.id || localId(),
         created_at: toCreate.created_at || new Date().toISOString()
       };
       
-      clients.push(newClient);
-      this.saveLocalClients(clients);
+      await this.saveLocalClient(newClient);
       if (this.notifyUpdate) this.notifyUpdate(newClient);
       return newClient;
     }
@@ -135,9 +215,7 @@ export class ClientRepository {
       if (this.notifyUpdate) this.notifyUpdate(data);
       return data;
     } catch (error) {
-      console.warn('Supabase failed, falling back to local mode:', error.message);
-      this.isLocalMode = true;
-      return this.createClient(client);
+      return this.handleWriteFailure(error, () => this.queueCreate(toCreate), () => this.createClient(client));
     }
   }
 
@@ -145,14 +223,14 @@ export class ClientRepository {
     if (!client?.id) throw new Error('Client id is required');
     
     if (this.isLocalMode) {
-      const clients = this.getLocalClients();
-      const index = clients.findIndex(c => c.id === client.id);
-      if (index === -1) throw new Error('Client not found');
+      const clients = await this.getLocalClients();
+      const existing = clients.find(c => c.id === client.id);
+      if (!existing) throw new Error('Client not found');
       
-      clients[index] = { ...clients[index], ...client };
-      this.saveLocalClients(clients);
-      if (this.notifyUpdate) this.notifyUpdate(clients[index]);
-      return clients[index];
+      const updated = { ...existing, ...client };
+      await this.saveLocalClient(updated);
+      if (this.notifyUpdate) this.notifyUpdate(updated);
+      return updated;
     }
 
     try {
@@ -166,15 +244,13 @@ export class ClientRepository {
       if (this.notifyUpdate) this.notifyUpdate(data);
       return data;
     } catch (error) {
-      console.warn('Supabase failed, falling back to local mode:', error.message);
-      this.isLocalMode = true;
-      return this.updateClient(client);
+      return this.handleWriteFailure(error, () => this.queueUpdate(client.id, client), () => this.updateClient(client));
     }
   }
 
   async addServicesToClient(clientId, servicesToAdd = []) {
     if (this.isLocalMode) {
-      const clients = this.getLocalClients();
+      const clients = await this.getLocalClients();
       const client = clients.find(c => c.id === clientId);
       if (!client) throw new Error('Client not found');
       
@@ -206,9 +282,9 @@ export class ClientRepository {
       if (this.notifyUpdate) this.notifyUpdate(updated);
       return updated;
     } catch (error) {
-      console.warn('Supabase failed, falling back to local mode:', error.message);
-      this.isLocalMode = true;
-      return this.addServicesToClient(clientId, servicesToAdd);
+      const known = this.cache.get(clientId);
+      const queued = known && (() => this.queueUpdate(clientId, { services: [...(known.services || []), ...servicesToAdd] }));
+      return this.handleWriteFailure(error, queued, () => this.addServicesToClient(clientId, servicesToAdd));
     }
   }
 }
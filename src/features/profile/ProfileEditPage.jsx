@@ -11,7 +11,7 @@ const ProfileEditPage = () => {
   const navigate = useNavigate();
   const { user, updateProfile } = useUnifiedAuth();
   const { notify } = useToast();
-  const { updateEmployee } = useDataSync();
+  const { updateEmployee } = useDataSync({ sync: [] });
   const [loading, setLoading] = useState(false);
   const [initialLoading, setInitialLoading] = useState(true);
   const [formData, setFormData] = useState({
@@ -2,6 +2,7 @@ import { useState, useEffect, useRef } from 'react';
 import { useSupabase } from '../components/SupabaseProvider';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
+import { realtimeHub } from '@/shared/services/realtimeHub';
 
 /**
  * Custom hook for real-time data updates
@@ -13,133 +14,85 @@ export const useRealTimeUpdates = ({
   onUpdate = null,
   enableNotifications = true
 } = {}) => {
-  const supabase = useSupabase();
+  const { supabase } = useSupabase();
   const { authState } = useUnifiedAuth();
   const { notify } = useToast();
   
   const [isConnected, setIsConnected] = useState(false);
   const [lastUpdate, setLastUpdate] = useState(null);
   const [updateCount, setUpdateCount] = useState(0);
-  const subscriptionsRef = useRef([]);
-  const reconnectTimeoutRef = useRef(null);
+  const unsubscribesRef = useRef([]);
+  const onUpdateRef = useRef(onUpdate);
+  onUpdateRef.current = onUpdate;
   
   const currentUserId = userId || authState.currentUser?.id || authState.userId;
 
-  // Initialize real-time subscriptions
+  // Callers usually pass an inline array, so subscriptions are keyed on its
+  // contents rather than its identity
+  const tablesKey = JSON.stringify(tables);
+
+  // Initialize real-time subscriptions through the shared hub: one channel
+  // per user, one binding per table + filter however many hooks ask for it
   useEffect(() => {
     if (!supabase || !currentUserId || tables.length === 0) return;
 
-    const setupSubscriptions = async () => {
-      try {
-        // Clear existing subscriptions
-        subscriptionsRef.current.forEach(subscription => {
-          supabase.removeChannel(subscription);
-        });
-        subscriptionsRef.current = [];
-
-        // Set up subscriptions for each table
-        for (const tableConfig of tables) {
-          const tableName = typeof tableConfig === 'string' ? tableConfig : tableConfig.table;
-          const filter = typeof tableConfig === 'object' ? tableConfig.filter : null;
-          const events = typeof tableConfig === 'object' ? tableConfig.events : ['*'];
-
-          let channelBuilder = supabase
-            .channel(`realtime:${tableName}:${currentUserId}`)
-            .on('postgres_changes', {
-              event: '*',
-              schema: 'public',
-              table: tableName,
-              filter: filter || `user_id=eq.${currentUserId}`
-            }, handleRealtimeUpdate);
-
-          // Subscribe to specific events if specified
-          if (events.includes('INSERT') || events.includes('*')) {
-            channelBuilder = channelBuilder.on('postgres_changes', {
-              event: 'INSERT',
-              schema: 'public',
-              table: tableName,
-              filter: filter || `user_id=eq.${currentUserId}`
-            }, (payload) => handleRealtimeUpdate(payload, 'INSERT'));
-          }
-
-          if (events.includes('UPDATE') || events.includes('*')) {
-            channelBuilder = channelBuilder.on('postgres_changes', {
-              event: 'UPDATE',
-              schema: 'public',
-              table: tableName,
-              filter: filter || `user_id=eq.${currentUserId}`
-            }, (payload) => handleRealtimeUpdate(payload, 'UPDATE'));
-          }
-
-          if (events.includes('DELETE') || events.includes('*')) {
-            channelBuilder = channelBuilder.on('postgres_changes', {
-              event: 'DELETE',
-              schema: 'public',
-              table: tableName,
-              filter: filter || `user_id=eq.${currentUserId}`
-            }, (payload) => handleRealtimeUpdate(payload, 'DELETE'));
-          }
-
-          const subscription = channelBuilder.subscribe((status) => {
-            if (status === 'SUBSCRIBED') {
-              setIsConnected(true);
-              console.log(`✅ Real-time subscription active for ${tableName}`);
-            } else if (status === 'CHANNEL_ERROR') {
-              setIsConnected(false);
-              console.error(`❌ Real-time subscription error for ${tableName}`);
-              scheduleReconnect();
-            }
-          });
-
-          subscriptionsRef.current.push(subscription);
-        }
-
-      } catch (error) {
-        console.error('Error setting up real-time subscriptions:', error);
-        setIsConnected(false);
-        scheduleReconnect();
+    const statuses = new Map();
+    const handleStatus = (tableName) => (status) => {
+      statuses.set(tableName, status);
+      setIsConnected(Array.from(statuses.values()).some(value => value === 'SUBSCRIBED'));
+      if (status === 'SUBSCRIBED') {
+        console.log(`✅ Real-time subscription active for ${tableName}`);
+      } else if (status === 'CHANNEL_ERROR') {
+        console.error(`❌ Real-time subscription error for ${tableName}`);
       }
     };
 
-    setupSubscriptions();
+    unsubscribesRef.current = tables.map(tableConfig => {
+      const tableName = typeof tableConfig === 'string' ? tableConfig : tableConfig.table;
+      const filter = typeof tableConfig === 'object' ? tableConfig.filter : null;
+      const events = (typeof tableConfig === 'object' && tableConfig.events) || ['*'];
+
+      return realtimeHub.subscribe(supabase, {
+        table: tableName,
+        filter: filter || `user_id=eq.${currentUserId}`,
+        events,
+        scope: currentUserId,
+        onStatus: handleStatus(tableName)
+      }, handleRealtimeBatch);
+    });
 
     // Cleanup on unmount
     return () => {
-      subscriptionsRef.current.forEach(subscription => {
-        supabase.removeChannel(subscription);
-      });
-      subscriptionsRef.current = [];
-      
-      if (reconnectTimeoutRef.current) {
-        clearTimeout(reconnectTimeoutRef.current);
-      }
+      unsubscribesRef.current.forEach(unsubscribe => unsubscribe());
+      unsubscribesRef.current = [];
     };
-  }, [supabase, currentUserId, tables]);
+  }, [supabase, currentUserId, tablesKey]);
 
-  // Handle real-time updates
-  const handleRealtimeUpdate = (payload, eventType = null) => {
-    const updateInfo = {
+  // Handle a coalesced batch of real-time updates with a single state update
+  const handleRealtimeBatch = (payloads) => {
+    const timestamp = new Date().toISOString();
+    const updates = payloads.map(payload => ({
       table: payload.table,
-      eventType: eventType || payload.eventType,
+      eventType: payload.eventType,
       new: payload.new,
       old: payload.old,
-      timestamp: new Date().toISOString()
-    };
+      timestamp
+    }));
 
-    setLastUpdate(updateInfo);
-    setUpdateCount(prev => prev + 1);
+    setLastUpdate(updates[updates.length - 1]);
+    setUpdateCount(prev => prev + updates.length);
 
     // Call custom update handler if provided
-    if (onUpdate && typeof onUpdate === 'function') {
-      onUpdate(updateInfo);
+    if (typeof onUpdateRef.current === 'function') {
+      updates.forEach(updateInfo => onUpdateRef.current(updateInfo));
     }
 
-    // Show notification for important updates
+    // Show one notification per batch for important updates
     if (enableNotifications) {
-      showUpdateNotification(updateInfo);
+      showUpdateNotification(updates[updates.length - 1]);
     }
 
-    console.log('📡 Real-time update received:', updateInfo);
+    console.log(`📡 Real-time update received: ${updates.length} change(s)`, updates);
   };
 
   // Show user-friendly notifications for updates
@@ -215,19 +168,6 @@ export const useRealTimeUpdates = ({
     }
   };
 
-  // Schedule reconnection attempt
-  const scheduleReconnect = () => {
-    if (reconnectTimeoutRef.current) {
-      clearTimeout(reconnectTimeoutRef.current);
-    }
-    
-    reconnectTimeoutRef.current = setTimeout(() => {
-      console.log('🔄 Attempting to reconnect real-time subscriptions...');
-      setIsConnected(false);
-      // The useEffect will trigger a new setup when isConnected changes
-    }, 5000); // Retry after 5 seconds
-  };
-
   // Manual refresh function
   const refresh = () => {
     setUpdateCount(prev => prev + 1);
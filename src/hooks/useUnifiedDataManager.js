@@ -2,6 +2,108 @@ import { useState, useEffect, useCallback, useRef } from 'react';
 import { useSupabase } from '@/components/SupabaseProvider';
 import { useUnifiedAuth } from '@/features/auth/UnifiedAuthContext';
 import { useToast } from '@/shared/components/Toast';
+import { realtimeHub } from '@/shared/services/realtimeHub';
+import {
+  applyChangeEvents,
+  byColumn,
+  createTableStore,
+  patchRow,
+  replaceRows,
+  snapshotRows,
+  upsertRows
+} from '@/shared/lib/deltaStore';
+
+const PAGE_SIZE = 1000;
+const POLL_INTERVAL = 5 * 60 * 1000; // 5 minutes
+
+const TABLE_SYNC = {
+  employees: {
+    table: 'employees',
+    storageKey: 'unified_employees_data',
+    compare: byColumn('name'),
+    createDefaults: createDefaultEmployees
+  },
+  submissions: {
+    table: 'submissions',
+    storageKey: 'unified_submissions_data',
+    compare: byColumn('created_at', false),
+    createDefaults: createDefaultSubmissions
+  },
+  clients: {
+    table: 'clients',
+    storageKey: 'unified_clients_data',
+    compare: byColumn('name'),
+    createDefaults: createDefaultClients
+  }
+};
+
+/**
+ * Fetch every row of a table, or only rows whose cursor column is >= since
+ * (the fallback column for rows where the cursor is null). Pages past
+ * PostgREST's 1000 row response cap. The boundary row is fetched again on
+ * purpose; upserts are idempotent.
+ */
+async function fetchTableRows(supabase, table, since, { cursorColumn = 'updated_at', fallbackColumn = null } = {}) {
+  const rows = [];
+  for (let from = 0; ; from += PAGE_SIZE) {
+    let query = supabase.from(table).select('*');
+    if (since && fallbackColumn && fallbackColumn !== cursorColumn) {
+      query = query.or(`${cursorColumn}.gte."${since}",and(${cursorColumn}.is.null,${fallbackColumn}.gte."${since}")`);
+    } else if (since) {
+      query = query.gte(cursorColumn, since);
+    }
+    const { data, error } = await query
+      .order(cursorColumn, { ascending: true, nullsFirst: true })
+      .order('id', { ascending: true })
+      .range(from, from + PAGE_SIZE - 1);
+
+    if (error) throw error;
+    rows.push(...(data || []));
+    if (!data || data.length < PAGE_SIZE) return rows;
+  }
+}
+
+// Row count without transferring rows
+async function countTableRows(supabase, table) {
+  const { count, error } = await supabase.from(table).select('id', { count: 'exact', head: true });
+  if (error) throw error;
+  return count;
+}
+
+/**
+ * fetchTableRows with the store's cursor; a table without the cursor column
+ * (updated_at) moves to the fallback column (created_at) for this and later loads
+ */
+async function fetchStoreRows(supabase, table, store, since) {
+  try {
+    return await fetchTableRows(supabase, table, since, store);
+  } catch (error) {
+    if (!store.fallbackColumn || store.cursorColumn === store.fallbackColumn) throw error;
+    console.warn(`Sync on ${store.cursorColumn} failed for ${table}, using ${store.fallbackColumn}:`, error.message);
+    store.cursorColumn = store.fallbackColumn;
+    return fetchTableRows(supabase, table, since, store);
+  }
+}
+
+/**
+ * Apply the rows changed since the high-water mark, then check the row count:
+ * deletes never appear in a delta, so more rows here than on the server means
+ * realtime missed some and the table is reloaded
+ */
+async function syncDelta(supabase, table, store, since) {
+  upsertRows(store, await fetchStoreRows(supabase, table, store, since));
+
+  let count;
+  try {
+    count = await countTableRows(supabase, table);
+  } catch (error) {
+    console.warn(`Row count failed for ${table}:`, error.message);
+    return;
+  }
+  if (count !== null && store.rows.size > count) {
+    replaceRows(store, await fetchStoreRows(supabase, table, store, null));
+  }
+}
 
 /**
  * Unified Data Manager Hook
@@ -50,158 +152,84 @@ export function useUnifiedDataManager() {
     }
   }, []);
 
-  // Load employees data
-  const loadEmployees = useCallback(async () => {
-    try {
-      safeSetState(prev => ({
-        ...prev,
-        loading: { ...prev.loading, employees: true },
-        error: null
-      }));
-
-      let employeesData = [];
-
-      if (supabase) {
-        const { data, error } = await supabase
-          .from('employees')
-          .select('*')
-          .order('name', { ascending: true });
-
-        if (error) throw error;
-        employeesData = data || [];
-      } else {
-        // Fallback to localStorage
-        const cached = localStorage.getItem('unified_employees_data');
-        if (cached) {
-          employeesData = JSON.parse(cached);
-        } else {
-          // Create default employees for demo
-          employeesData = createDefaultEmployees();
-          localStorage.setItem('unified_employees_data', JSON.stringify(employeesData));
-        }
-      }
-
-      safeSetState(prev => ({
-        ...prev,
-        employees: employeesData,
-        loading: { ...prev.loading, employees: false },
-        lastUpdated: new Date().toISOString()
-      }));
+  // Normalized per-table stores; each remembers the newest updated_at it has
+  // seen so polls only fetch rows changed since then
+  const storesRef = useRef(null);
+  if (!storesRef.current) {
+    storesRef.current = Object.fromEntries(
+      Object.entries(TABLE_SYNC).map(([name, config]) => [name, createTableStore({ compare: config.compare })])
+    );
+  }
 
-      return employeesData;
-    } catch (error) {
-      console.error('Error loading employees:', error);
-      safeSetState(prev => ({
-        ...prev,
-        loading: { ...prev.loading, employees: false },
-        error: error.message
-      }));
-      return [];
-    }
-  }, [supabase, safeSetState]);
+  // Load one dataset: a delta since the high-water mark, or everything
+  const syncTable = useCallback(async (name, { full = false } = {}) => {
+    const config = TABLE_SYNC[name];
+    const store = storesRef.current[name];
+    const isInitialLoad = store.highWater === null && store.rows.size === 0;
 
-  // Load submissions data
-  const loadSubmissions = useCallback(async () => {
     try {
-      safeSetState(prev => ({
-        ...prev,
-        loading: { ...prev.loading, submissions: true },
-        error: null
-      }));
-
-      let submissionsData = [];
-
-      if (supabase) {
-        const { data, error } = await supabase
-          .from('submissions')
-          .select('*')
-          .order('created_at', { ascending: false });
-
-        if (error) throw error;
-        submissionsData = data || [];
-      } else {
-        // Fallback to localStorage
-        const cached = localStorage.getItem('unified_submissions_data');
-        if (cached) {
-          submissionsData = JSON.parse(cached);
-        } else {
-          // Create default submissions for demo
-          submissionsData = createDefaultSubmissions();
-          localStorage.setItem('unified_submissions_data', JSON.stringify(submissionsData));
-        }
+      if (full || isInitialLoad) {
+        safeSetState(prev => ({
+          ...prev,
+          loading: { ...prev.loading, [name]: true },
+          error: null
+        }));
       }
 
-      safeSetState(prev => ({
-        ...prev,
-        submissions: submissionsData,
-        loading: { ...prev.loading, submissions: false },
-        lastUpdated: new Date().toISOString()
-      }));
-
-      return submissionsData;
-    } catch (error) {
-      console.error('Error loading submissions:', error);
-      safeSetState(prev => ({
-        ...prev,
-        loading: { ...prev.loading, submissions: false },
-        error: error.message
-      }));
-      return [];
-    }
-  }, [supabase, safeSetState]);
-
-  // Load clients data
-  const loadClients = useCallback(async () => {
-    try {
-      safeSetState(prev => ({
-        ...prev,
-        loading: { ...prev.loading, clients: true },
-        error: null
-      }));
-
-      let clientsData = [];
-
       if (supabase) {
-        const { data, error } = await supabase
-          .from('clients')
-          .select('*')
-          .order('name', { ascending: true });
-
-        if (error) throw error;
-        clientsData = data || [];
+        const since = full ? null : store.highWater;
+        try {
+          if (since) {
+            await syncDelta(supabase, config.table, store, since);
+          } else {
+            replaceRows(store, await fetchStoreRows(supabase, config.table, store, null));
+          }
+        } catch (error) {
+          if (!since) throw error;
+          console.warn(`Delta sync failed for ${config.table}, reloading:`, error.message);
+          replaceRows(store, await fetchStoreRows(supabase, config.table, store, null));
+        }
       } else {
         // Fallback to localStorage
-        const cached = localStorage.getItem('unified_clients_data');
+        const cached = localStorage.getItem(config.storageKey);
+        let rows;
         if (cached) {
-          clientsData = JSON.parse(cached);
+          rows = JSON.parse(cached);
         } else {
-          // Create default clients for demo
-          clientsData = createDefaultClients();
-          localStorage.setItem('unified_clients_data', JSON.stringify(clientsData));
+          // Create default data for demo
+          rows = config.createDefaults();
+          localStorage.setItem(config.storageKey, JSON.stringify(rows));
         }
+        replaceRows(store, rows);
       }
 
+      const rows = snapshotRows(store);
       safeSetState(prev => ({
         ...prev,
-        clients: clientsData,
-        loading: { ...prev.loading, clients: false },
+        [name]: rows,
+        loading: { ...prev.loading, [name]: false },
         lastUpdated: new Date().toISOString()
       }));
 
-      return clientsData;
+      return rows;
     } catch (error) {
-      console.error('Error loading clients:', error);
+      console.error(`Error loading ${name}:`, error);
       safeSetState(prev => ({
         ...prev,
-        loading: { ...prev.loading, clients: false },
+        loading: { ...prev.loading, [name]: false },
         error: error.message
       }));
-      return [];
+      return snapshotRows(store);
     }
   }, [supabase, safeSetState]);
 
-  // Sync all data
-  const syncAllData = useCallback(async (showNotification = false) => {
+  const loadEmployees = useCallback(() => syncTable('employees', { full: true }), [syncTable]);
+  const loadSubmissions = useCallback(() => syncTable('submissions', { full: true }), [syncTable]);
+  const loadClients = useCallback(() => syncTable('clients', { full: true }), [syncTable]);
+
+  // Sync all data. Polls are incremental; a full reload runs on request, on
+  // the first load, or for a table whose row count shows missed deletes.
+  const syncAllData = useCallback(async (showNotification = false, { full = false } = {}) => {
     if (syncInProgressRef.current) {
       return; // Prevent concurrent syncs
     }
@@ -214,11 +242,9 @@ export function useUnifiedDataManager() {
         error: null
       }));
 
-      const [employees, submissions, clients] = await Promise.all([
-        loadEmployees(),
-        loadSubmissions(),
-        loadClients()
-      ]);
+      const [employees, submissions, clients] = await Promise.all(
+        Object.keys(TABLE_SYNC).map(name => syncTable(name, { full }))
+      );
 
       safeSetState(prev => ({
         ...prev,
@@ -255,7 +281,7 @@ export function useUnifiedDataManager() {
     } finally {
       syncInProgressRef.current = false;
     }
-  }, [loadEmployees, loadSubmissions, loadClients, safeSetState, notify]);
+  }, [syncTable, safeSetState, notify]);
 
   // Initial data load
   useEffect(() => {
@@ -264,17 +290,36 @@ export function useUnifiedDataManager() {
     }
   }, [user, syncAllData]);
 
-  // Auto-refresh data every 5 minutes
+  // Incremental refresh every 5 minutes
   useEffect(() => {
     if (!user) return;
 
     const interval = setInterval(() => {
       syncAllData(false); // Silent sync
-    }, 5 * 60 * 1000); // 5 minutes
+    }, POLL_INTERVAL);
 
     return () => clearInterval(interval);
   }, [user, syncAllData]);
 
+  // Apply realtime changes to the stores between polls
+  useEffect(() => {
+    if (!supabase || !user) return;
+
+    const unsubscribes = Object.entries(TABLE_SYNC).map(([name, config]) =>
+      realtimeHub.subscribe(supabase, { table: config.table, scope: user.id || 'global' }, (events) => {
+        const store = storesRef.current[name];
+        if (applyChangeEvents(store, events) === 0) return;
+        safeSetState(prev => ({
+          ...prev,
+          [name]: snapshotRows(store),
+          lastUpdated: new Date().toISOString()
+        }));
+      })
+    );
+
+    return () => unsubscribes.forEach(unsubscribe => unsubscribe());
+  }, [supabase, user, safeSetState]);
+
   // Update employee
   const updateEmployee = useCallback(async (employeeId, updates) => {
     try {
@@ -295,11 +340,11 @@ export function useUnifiedDataManager() {
       }
 
       // Update local state
+      const store = storesRef.current.employees;
+      patchRow(store, employeeId, updates);
       safeSetState(prev => ({
         ...prev,
-        employees: prev.employees.map(emp => 
-          emp.id === employeeId ? { ...emp, ...updates } : emp
-        ),
+        employees: snapshotRows(store),
         lastUpdated: new Date().toISOString()
       }));
 
@@ -341,11 +386,11 @@ export function useUnifiedDataManager() {
       }
 
       // Update local state
+      const store = storesRef.current.submissions;
+      patchRow(store, submissionId, updates);
       safeSetState(prev => ({
         ...prev,
-        submissions: prev.submissions.map(sub => 
-          sub.id === submissionId ? { ...sub, ...updates } : sub
-        ),
+        submissions: snapshotRows(store),
         lastUpdated: new Date().toISOString()
       }));
 
@@ -0,0 +1,45 @@
+import { describe, it, expect, vi } from 'vitest';
+import { createClient } from '@supabase/supabase-js';
+
+vi.mock('../../shared/lib/supabase', () => ({ supabase: null }));
+
+const { MonthlyReportService } = await import('../monthlyReportService');
+
+// Submissions with the score report_submission_score and
+// MonthlyReportService.extractPerformanceScore must both give them
+const CASES = [
+  { name: 'form score over 10', submission: { form_data: { overall_score: 82 } }, score: 82 },
+  { name: 'form score on a 10-point scale', submission: { form_data: { performance_score: 7.5 } }, score: 75 },
+  { name: 'first positive field wins', submission: { form_data: { overall_score: 0, total_score: 64, kpi_score: 9 } }, score: 64 },
+  { name: 'string scores are ignored', submission: { form_data: { overall_score: '90', average_score: 6 } }, score: 60 },
+  { name: 'form fields before row fields', submission: { overall_score: 95, form_data: { kpi_score: 71 } }, score: 71 },
+  { name: 'row score when the form has none', submission: { performance_score: 8, form_data: {} }, score: 80 },
+  { name: 'average of form components', submission: { form_data: { learning_score: 6, relationship_score: 8, discipline_score: 0 } }, score: 70 },
+  { name: 'average over 10 is kept', submission: { form_data: { learning_score: 60, discipline_score: 90 } }, score: 75 },
+  { name: 'average of row components', submission: { learning_score: 5, relationship_score: 9, form_data: null }, score: 70 },
+  { name: 'negative scores are skipped', submission: { form_data: { overall_score: -4, discipline_score: 4 } }, score: 40 },
+  { name: 'nothing to score', submission: { form_data: { notes: 'n/a' } }, score: 0 }
+];
+
+describe('report_submission_score parity', () => {
+  it.each(CASES)('extractPerformanceScore: $name', ({ submission, score }) => {
+    expect(MonthlyReportService.extractPerformanceScore(submission)).toBeCloseTo(score, 6);
+  });
+
+  // Runs against a database with the migrations applied, e.g. `supabase start`
+  const url = process.env.SUPABASE_TEST_URL;
+  const key = process.env.SUPABASE_TEST_KEY;
+
+  describe.runIf(url && key)('against Postgres', () => {
+    it.each(CASES)('report_submission_score: $name', async ({ submission }) => {
+      const client = createClient(url, key);
+      const { data, error } = await client.rpc('report_submission_score', {
+        p_form_data: submission.form_data ?? null,
+        p_row: submission
+      });
+
+      expect(error).toBeNull();
+      expect(Number(data)).toBeCloseTo(MonthlyReportService.extractPerformanceScore(submission), 6);
+    });
+  });
+});
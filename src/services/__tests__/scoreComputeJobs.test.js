@@ -0,0 +1,196 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+// In-memory score_compute_jobs / score_compute_job_items tables. Writes can
+// be made to fail once through `failNext`.
+const tables = {};
+const failNext = [];
+const recomputeMonthScores = vi.fn();
+
+const query = (name) => {
+  const filters = [];
+  let range = null;
+  let single = false;
+  let write = null;
+
+  const run = async () => {
+    const failure = write && failNext.findIndex(([table]) => table === name);
+    if (write && failure >= 0) {
+      return { data: null, error: failNext.splice(failure, 1)[0][1] };
+    }
+    if (write) {
+      return { data: write(tables[name]), error: null };
+    }
+    let rows = tables[name].filter(row => filters.every(([column, test]) => test(row[column])));
+    rows.sort((a, b) => String(a.user_id).localeCompare(String(b.user_id)));
+    if (range) rows = rows.slice(range[0], range[1] + 1);
+    return { data: single ? rows[0] : rows.map(row => ({ ...row })), error: null };
+  };
+
+  const builder = {
+    select: () => builder,
+    order: () => builder,
+    eq: (column, value) => { filters.push([column, v => v === value]); return builder; },
+    in: (column, values) => { filters.push([column, v => values.includes(v)]); return builder; },
+    range: (from, to) => { range = [from, to]; return builder; },
+    single: () => { single = true; return builder; },
+    insert: (row) => {
+      write = (table) => {
+        const created = { id: `job-${table.length + 1}`, status: 'pending', started_at: null, ...row };
+        table.push(created);
+        return single ? created : [created];
+      };
+      return builder;
+    },
+    upsert: (rows) => {
+      write = (table) => rows
+        .filter(row => !table.some(item => item.job_id === row.job_id && item.user_id === row.user_id))
+        .forEach(row => table.push({ status: 'pending', attempts: 0, last_error: null, ...row }));
+      return builder;
+    },
+    update: (values) => {
+      write = (table) => table
+        .filter(row => filters.every(([column, test]) => test(row[column])))
+        .forEach(row => Object.assign(row, values));
+      return builder;
+    },
+    then: (resolve, reject) => run().then(resolve, reject)
+  };
+  return builder;
+};
+
+const rpc = async (name, { p_job_id }) => {
+  const job = tables.score_compute_jobs.find(row => row.id === p_job_id);
+  const items = tables.score_compute_job_items.filter(item => item.job_id === p_job_id);
+  const count = (status) => items.filter(item => item.status === status).length;
+  return {
+    data: job && {
+      job_id: job.id,
+      status: job.status,
+      total_users: job.total_users,
+      pending: count('pending'),
+      running: count('running'),
+      succeeded: count('succeeded'),
+      failed: count('failed'),
+      last_error: job.last_error ?? null
+    },
+    error: null
+  };
+};
+
+vi.mock('../../database/supabaseClient', () => ({
+  supabase: { from: (name) => query(name), rpc: (...args) => rpc(...args) }
+}));
+
+vi.mock('../../utils/inputSanitization', () => ({
+  sanitizeInput: (value) => (typeof value === 'string' ? value.trim() : value)
+}));
+
+vi.mock('../scoringComputations', async (importOriginal) => ({
+  ...(await importOriginal()),
+  recomputeMonthScores: (...args) => recomputeMonthScores(...args)
+}));
+
+const { createScoreComputeJob, runScoreComputeJob } = await import('../scoreComputeJobs');
+const { resumeBatchCompute, getBatchComputeProgress } = await import('../../api/scoringApi');
+
+const USERS = ['u1', 'u2', 'u3', 'u4', 'u5', 'u6'];
+const scoreFor = (userId) => ({ user_month_score: Number(userId.slice(1)) * 10 });
+const scoreUsers = async (month, year, userIds) => ({
+  scores: new Map(userIds.map(userId => [userId, scoreFor(userId)])),
+  rows_updated: userIds.length
+});
+const item = (userId) => tables.score_compute_job_items.find(row => row.user_id === userId);
+const FAST = { baseDelayMs: 0, chunkSize: 2, concurrency: 1, computeMissingAttendance: false };
+
+describe('score compute jobs', () => {
+  beforeEach(() => {
+    tables.score_compute_jobs = [];
+    tables.score_compute_job_items = [];
+    failNext.length = 0;
+    recomputeMonthScores.mockReset();
+    recomputeMonthScores.mockImplementation(scoreUsers);
+    vi.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  it('persists a job with one pending item per user', async () => {
+    failNext.push(['score_compute_jobs', { code: '40001', message: 'could not serialize access' }]);
+
+    const job = await createScoreComputeJob(9, 2026, [...USERS, 'u1'], { createdBy: 'manager-1' });
+
+    expect(job).toMatchObject({ month: 9, year: 2026, total_users: 6, created_by: 'manager-1' });
+    expect(tables.score_compute_jobs).toHaveLength(1);
+    expect(tables.score_compute_job_items.map(row => [row.user_id, row.status])).toEqual(USERS.map(userId => [userId, 'pending']));
+  });
+
+  it('retries transient errors and records attempts and progress', async () => {
+    const job = await createScoreComputeJob(9, 2026, USERS);
+    recomputeMonthScores.mockResolvedValueOnce({ error: 'canceling statement due to statement timeout', code: '57014' });
+    failNext.push(['score_compute_job_items', { status: 503, message: 'Service Unavailable' }]);
+    const progress = [];
+
+    const run = await runScoreComputeJob(job.id, { ...FAST, onProgress: update => progress.push(update) });
+
+    expect(run.status).toBe('completed');
+    expect(run.succeeded).toEqual(USERS);
+    expect(run.scores.get('u4')).toEqual(scoreFor('u4'));
+    expect(recomputeMonthScores).toHaveBeenCalledTimes(4);
+    expect(progress.map(update => update.processed)).toEqual([2, 4, 6]);
+    expect([item('u1').attempts, item('u3').attempts, item('u5').attempts]).toEqual([2, 1, 1]);
+    expect(tables.score_compute_job_items.every(row => row.status === 'succeeded')).toBe(true);
+    expect(tables.score_compute_jobs[0].status).toBe('completed');
+    expect(tables.score_compute_jobs[0].finished_at).toBeTruthy();
+
+    const polled = await getBatchComputeProgress(job.id);
+    expect(polled.percent_complete).toBe(100);
+    expect(polled.job.succeeded).toBe(6);
+  });
+
+  it('fails a chunk without retrying permanent errors', async () => {
+    const job = await createScoreComputeJob(9, 2026, USERS);
+    recomputeMonthScores.mockImplementation(async (month, year, userIds) => (
+      userIds.includes('u3')
+        ? { error: 'permission denied for table monthly_rows', code: '42501' }
+        : scoreUsers(month, year, userIds)
+    ));
+
+    const run = await runScoreComputeJob(job.id, FAST);
+
+    expect(run.status).toBe('completed_with_errors');
+    expect(run.failed.map(failure => failure.user_id)).toEqual(['u3', 'u4']);
+    expect(recomputeMonthScores).toHaveBeenCalledTimes(3);
+    expect(item('u3')).toMatchObject({ status: 'failed', attempts: 1, last_error: 'permission denied for table monthly_rows' });
+    expect(tables.score_compute_jobs[0].status).toBe('completed_with_errors');
+  });
+
+  it('resumes a job interrupted partway with the users it had not finished', async () => {
+    const job = await createScoreComputeJob(9, 2026, USERS);
+
+    // The process dies while the second chunk is being scored
+    let interrupted;
+    const reachedSecondChunk = new Promise(resolve => { interrupted = resolve; });
+    recomputeMonthScores.mockImplementation(async (month, year, userIds) => {
+      if (userIds.includes('u3')) {
+        interrupted();
+        return new Promise(() => {});
+      }
+      return scoreUsers(month, year, userIds);
+    });
+    runScoreComputeJob(job.id, FAST);
+    await reachedSecondChunk;
+
+    expect(tables.score_compute_job_items.map(row => row.status)).toEqual(['succeeded', 'succeeded', 'running', 'running', 'pending', 'pending']);
+    expect((await getBatchComputeProgress(job.id)).percent_complete).toBe(33);
+
+    recomputeMonthScores.mockReset();
+    recomputeMonthScores.mockImplementation(scoreUsers);
+    const resumed = await resumeBatchCompute(job.id, FAST);
+
+    expect(resumed.status).toBe(200);
+    expect(resumed.job_status).toBe('completed');
+    expect(resumed.total_processed).toBe(4);
+    expect(resumed.successful_users.map(user => user.user_id)).toEqual(['u3', 'u4', 'u5', 'u6']);
+    expect(recomputeMonthScores.mock.calls.map(([, , userIds]) => userIds)).toEqual([['u3', 'u4'], ['u5', 'u6']]);
+    expect(tables.score_compute_job_items.every(row => row.status === 'succeeded' && row.attempts === 1)).toBe(true);
+    expect(tables.score_compute_jobs[0].status).toBe('completed');
+  });
+});
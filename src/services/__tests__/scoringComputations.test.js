@@ -0,0 +1,248 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+// In-memory stand-in for the supabase query builder over a few tables
+const tables = {};
+const rpc = vi.fn();
+const computeMonthlyAttendance = vi.fn();
+
+const matches = (row, filters) => filters.every(([column, test]) => test(row[column]));
+
+const query = (name) => {
+  const filters = [];
+  let range = null;
+  let single = false;
+  let write = null;
+
+  const run = async () => {
+    if (write) {
+      write(tables[name]);
+      return { data: null, error: null };
+    }
+    let rows = (tables[name] || []).filter(row => matches(row, filters));
+    if (range) rows = rows.slice(range[0], range[1] + 1);
+    if (single) {
+      return rows.length === 1
+        ? { data: rows[0], error: null }
+        : { data: null, error: { code: 'PGRST116', message: 'No rows' } };
+    }
+    return { data: rows, error: null };
+  };
+
+  const builder = {
+    select: () => builder,
+    order: () => builder,
+    eq: (column, value) => { filters.push([column, v => v === value]); return builder; },
+    in: (column, values) => { filters.push([column, v => values.includes(v)]); return builder; },
+    range: (from, to) => { range = [from, to]; return builder; },
+    single: () => { single = true; return builder; },
+    upsert: (rows) => {
+      write = (table) => [].concat(rows).forEach(row => table.push(row));
+      return builder;
+    },
+    update: (values) => {
+      write = (table) => table.filter(row => matches(row, filters)).forEach(row => Object.assign(row, values));
+      return builder;
+    },
+    then: (resolve, reject) => run().then(resolve, reject)
+  };
+  return builder;
+};
+
+vi.mock('../../database/supabaseClient', () => ({
+  supabase: { from: (name) => query(name), rpc: (...args) => rpc(...args) }
+}));
+
+vi.mock('../../api/attendanceApi', () => ({
+  computeMonthlyAttendance: (...args) => computeMonthlyAttendance(...args)
+}));
+
+const {
+  computeAccountability,
+  computeOutput,
+  computeLearning,
+  computeDiscipline,
+  combineUserMonthScore,
+  calculateUserMonthScore,
+  loadMonthScoringData,
+  recomputeMonthScores
+} = await import('../scoringComputations');
+
+const MONTH = 9;
+const YEAR = 2026;
+const STATUSES = ['draft', 'submitted', 'approved', 'returned'];
+const NOTES = ['', 'Great work', 'Needs rework on links', null];
+
+// 250 users with five rows each: more than one page of monthly_rows and
+// several user id chunks. Every seventh user has no attendance cache row.
+const seedMonth = (userCount = 250) => {
+  tables.user_entity_mappings = [];
+  tables.monthly_rows = [];
+  tables.monthly_attendance_cache = [];
+  tables.appraisal_delays = [];
+  const userIds = [];
+
+  for (let u = 0; u < userCount; u++) {
+    const userId = `user-${String(u).padStart(3, '0')}`;
+    userIds.push(userId);
+    tables.user_entity_mappings.push(
+      { user_id: userId, is_active: true, expected_projects: 3 + (u % 4), expected_units: u % 3 === 0 ? 0 : 20 },
+      { user_id: userId, is_active: u % 5 !== 0, expected_projects: 2, expected_units: 5 }
+    );
+
+    for (let r = 0; r < 5; r++) {
+      tables.monthly_rows.push({
+        id: `row-${u}-${r}`,
+        user_id: userId,
+        entity_id: `client-${(u + r) % 4}`,
+        month: MONTH,
+        year: YEAR,
+        status: STATUSES[(u + r) % STATUSES.length],
+        review_notes: NOTES[(u * r) % NOTES.length],
+        kpi_json: { delivered_units: (u + r) % 7 },
+        learning_json: [{ topic: 'SEO', url: 'https://example.com', applied_where: 'Client', minutes: 30 + ((u * 13 + r) % 60) }]
+      });
+    }
+
+    if (u % 7 !== 0) {
+      tables.monthly_attendance_cache.push({
+        user_id: userId,
+        month: MONTH,
+        year: YEAR,
+        discipline_component: String(5 + (u % 5)),
+        office_attendance_rate: '0.9',
+        meeting_attendance_rate: '0.8',
+        office_days_present: 20,
+        working_days_expected: 22
+      });
+    }
+  }
+
+  // Rows from another month must not leak into the batch
+  tables.monthly_rows.push({ id: 'row-old', user_id: 'user-001', entity_id: 'client-0', month: 8, year: YEAR, status: 'approved' });
+  return userIds;
+};
+
+describe('scoring compute helpers', () => {
+  it('caps accountability at the lower of projects and units', () => {
+    const result = computeAccountability(
+      [{ expected_projects: 4, expected_units: 10 }],
+      [{ entity_id: 'a', kpi_json: { delivered_units: 2 } }, { entity_id: 'b', kpi_json: { delivered_units: 3 } }]
+    );
+    expect(result.accountability_score).toBe(5);
+    expect(result.actual_projects).toBe(2);
+    expect(result.delivered_units).toBe(5);
+  });
+
+  it('scores output, learning and discipline from rows', () => {
+    expect(computeOutput([]).output_score).toBe(0);
+    expect(computeOutput([
+      { status: 'approved', review_notes: 'Good' },
+      { status: 'returned', review_notes: '' },
+      { status: 'draft', review_notes: null }
+    ]).row_scores).toEqual([7, 3, 5]);
+
+    const learning = computeLearning([{ learning_json: [
+      { topic: 't', url: 'u', applied_where: 'w', minutes: '180' },
+      { topic: 't', url: 'u', minutes: 500 }
+    ] }]);
+    expect(learning.learning_component).toBe(5);
+    expect(learning.needs_appraisal_delay).toBe(true);
+
+    expect(computeDiscipline(null).discipline_component).toBe(8);
+    expect(computeDiscipline({ discipline_component: '6.5' }).discipline_component).toBe(6.5);
+  });
+
+  it('combines components into a 0-100 month score', () => {
+    const result = combineUserMonthScore(
+      { accountability_score: 10 },
+      { output_score: 7 },
+      { learning_component: 10, learning_minutes: 360, needs_appraisal_delay: false },
+      { discipline_component: 9 }
+    );
+    expect(result.user_month_score).toBe(87);
+    expect(result.breakdown.avg_row_score).toBe(8.5);
+    expect(result.flags.needs_appraisal_delay).toBe(false);
+  });
+});
+
+describe('batched month scoring', () => {
+  let userIds;
+
+  beforeEach(() => {
+    userIds = seedMonth();
+    rpc.mockClear();
+    computeMonthlyAttendance.mockClear();
+    computeMonthlyAttendance.mockResolvedValue(undefined);
+    rpc.mockImplementation(async (name, { p_scores, p_computed_at }) => {
+      let updated = 0;
+      p_scores.forEach(({ row_ids, computed_scores }) => {
+        tables.monthly_rows
+          .filter(row => row_ids.includes(row.id))
+          .forEach(row => {
+            Object.assign(row, { computed_scores, last_computed_at: p_computed_at });
+            updated++;
+          });
+      });
+      return { data: updated, error: null };
+    });
+  });
+
+  it('loads every user of the month across pages and id chunks', async () => {
+    const everyone = await loadMonthScoringData(MONTH, YEAR, 'all');
+    const chunked = await loadMonthScoringData(MONTH, YEAR, userIds);
+
+    for (const data of [everyone, chunked]) {
+      expect(data.userIds.length).toBe(250);
+      expect([...data.rowsByUser.values()].flat().length).toBe(1250);
+      expect(data.attendanceByUser.size).toBe(214);
+    }
+    expect(everyone.mappingsByUser.get('user-005')).toHaveLength(1);
+  });
+
+  it('matches the per-user scores on a fixture month', async () => {
+    const perUser = new Map();
+    for (const userId of userIds) {
+      perUser.set(userId, await calculateUserMonthScore(userId, MONTH, YEAR));
+    }
+
+    const result = await recomputeMonthScores(MONTH, YEAR, 'all', { computeMissingAttendance: false });
+
+    expect(result.error).toBe(undefined);
+    expect(result.scores.size).toBe(250);
+    userIds.forEach(userId => expect(result.scores.get(userId)).toEqual(perUser.get(userId)));
+  });
+
+  it('writes scores with bounded updates of existing rows only', async () => {
+    // Rows removed while the close is running must not come back
+    const result = await recomputeMonthScores(MONTH, YEAR, userIds, {
+      computeMissingAttendance: false
+    });
+    tables.monthly_rows = tables.monthly_rows.filter(row => row.user_id !== 'user-010');
+    const again = await recomputeMonthScores(MONTH, YEAR, userIds, { computeMissingAttendance: false });
+
+    expect(result.rows_updated).toBe(1250);
+    expect(again.rows_updated).toBe(1245);
+    expect(rpc.mock.calls.every(([name, args]) => name === 'apply_monthly_row_scores' && args.p_scores.length <= 100)).toBe(true);
+    expect(tables.monthly_rows.find(row => row.id === 'row-0-0').computed_scores).toEqual(result.scores.get('user-000'));
+    expect(tables.monthly_rows.find(row => row.id === 'row-old').computed_scores).toBe(undefined);
+    expect(tables.monthly_rows.some(row => row.user_id === 'user-010')).toBe(false);
+  });
+
+  it('fills missing attendance a few users at a time', async () => {
+    let inFlight = 0;
+    let peak = 0;
+    computeMonthlyAttendance.mockImplementation(async (userId) => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await new Promise(resolve => setTimeout(resolve, 0));
+      inFlight--;
+      if (userId === 'user-007') throw new Error('attendance service down');
+    });
+
+    const result = await recomputeMonthScores(MONTH, YEAR, userIds);
+
+    expect(computeMonthlyAttendance).toHaveBeenCalledTimes(36);
+    expect(peak).toBe(4);
+    expect(result.scores.get('user-007').breakdown.discipline_component).toBe(8);
+  });
+});
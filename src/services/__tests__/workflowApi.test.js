@@ -0,0 +1,85 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const rpc = vi.fn();
+
+vi.mock('../../database/supabaseClient', () => ({
+  supabase: { rpc: (...args) => rpc(...args) }
+}));
+
+const { workflowApi } = await import('../workflowApi');
+
+describe('bulkApproveRows', () => {
+  beforeEach(() => {
+    rpc.mockReset();
+    vi.restoreAllMocks();
+  });
+
+  it('maps each RPC outcome to results, skipped or errors', async () => {
+    rpc.mockResolvedValue({
+      data: [
+        { row_id: 'r1', outcome: 'approved', message: null },
+        { row_id: 'r2', outcome: 'already_approved', message: 'Already approved' },
+        { row_id: 'r3', outcome: 'not_submitted', message: 'Only submitted rows can be approved' }
+      ],
+      error: null
+    });
+
+    const outcome = await workflowApi.bulkApproveRows(['r1', 'r2', 'r3', 'r1'], 'm1', 'ok');
+
+    expect(rpc).toHaveBeenCalledWith('bulk_approve_monthly_rows', { p_row_ids: ['r1', 'r2', 'r3'], p_manager_id: 'm1', p_review_notes: 'ok' });
+    expect(outcome).toEqual({
+      results: [{ rowId: 'r1', status: 'approved' }],
+      skipped: [{ rowId: 'r2', reason: 'Already approved' }],
+      errors: [{ rowId: 'r3', error: 'Only submitted rows can be approved' }],
+      hookErrors: []
+    });
+  });
+
+  it('keeps rows whose hook failed in results and lists the failure apart', async () => {
+    rpc.mockResolvedValue({
+      data: [
+        { row_id: 'r1', outcome: 'approved', message: null },
+        { row_id: 'r2', outcome: 'approved', message: null }
+      ],
+      error: null
+    });
+    const onRowApproved = vi.fn(async (rowId) => {
+      if (rowId === 'r2') throw new Error('notify failed');
+    });
+
+    const outcome = await workflowApi.bulkApproveRows(['r1', 'r2'], 'm1', '', { onRowApproved });
+
+    expect(onRowApproved).toHaveBeenCalledTimes(2);
+    expect(outcome.results.map(result => result.rowId)).toEqual(['r1', 'r2']);
+    expect(outcome.errors).toEqual([]);
+    expect(outcome.hookErrors).toEqual([{ rowId: 'r2', error: 'notify failed' }]);
+  });
+
+  it('approves row by row when the RPC is not deployed', async () => {
+    rpc.mockResolvedValue({ data: null, error: { code: 'PGRST202', message: 'function not found' } });
+    const approve = vi.spyOn(workflowApi, 'approveMonthlyRow').mockImplementation(async (rowId) => {
+      if (rowId === 'r2') throw new Error('Only submitted rows can be approved');
+      return { id: rowId, status: 'approved' };
+    });
+    const onRowApproved = vi.fn().mockRejectedValueOnce(new Error('notify failed'));
+
+    const outcome = await workflowApi.bulkApproveRows(['r1', 'r2'], 'm1', 'ok', { onRowApproved });
+
+    expect(approve).toHaveBeenCalledWith('r1', 'm1', 'ok');
+    expect(approve).toHaveBeenCalledWith('r2', 'm1', 'ok');
+    expect(onRowApproved).toHaveBeenCalledTimes(1);
+    expect(outcome).toEqual({
+      results: [{ rowId: 'r1', status: 'approved' }],
+      errors: [{ rowId: 'r2', error: 'Only submitted rows can be approved' }],
+      skipped: [],
+      hookErrors: [{ rowId: 'r1', error: 'notify failed' }]
+    });
+  });
+
+  it('throws RPC errors other than a missing function', async () => {
+    rpc.mockResolvedValue({ data: null, error: { code: '42501', message: 'permission denied' } });
+    vi.spyOn(console, 'error').mockImplementation(() => {});
+
+    await expect(workflowApi.bulkApproveRows(['r1'], 'm1')).rejects.toMatchObject({ code: '42501' });
+  });
+});
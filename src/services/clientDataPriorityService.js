@@ -11,11 +11,19 @@
  */
 
 import { supabase } from '@/shared/lib/supabase';
+import { queryCache } from '@/shared/services/queryCache';
+import { compositeKey, getIndex } from '@/shared/utils/joinIndex';
+
+// Master clients are matched on their lower-cased name, like the onboarding cache
+const masterClientKey = compositeKey('name', name => name?.toLowerCase());
+
+const ONBOARDING_CACHE_KEY = 'client_priority:client_onboarding';
+
+// Onboarding records are matched on their lower-cased client name
+const onboardingClientKey = compositeKey('client_name', name => name?.toLowerCase());
 
 class ClientDataPriorityService {
   constructor() {
-    this.clientOnboardingCache = new Map();
-    this.lastCacheUpdate = null;
     this.cacheTimeout = 5 * 60 * 1000; // 5 minutes
   }
 
@@ -23,38 +31,35 @@ class ClientDataPriorityService {
    * Get client onboarding data with caching
    */
   async getClientOnboardingData() {
-    const now = Date.now();
-    
-    // Return cached data if still valid
-    if (this.lastCacheUpdate && (now - this.lastCacheUpdate) < this.cacheTimeout) {
-      return Array.from(this.clientOnboardingCache.values());
-    }
-
     try {
-      const { data, error } = await supabase
-        .from('client_onboarding')
-        .select('*')
-        .order('created_at', { ascending: false });
-
-      if (error) {
-        console.error('Error fetching client onboarding data:', error);
-        return [];
-      }
-
-      // Update cache
-      this.clientOnboardingCache.clear();
-      data.forEach(client => {
-        this.clientOnboardingCache.set(client.client_name.toLowerCase(), client);
+      return await queryCache.fetch(ONBOARDING_CACHE_KEY, async () => {
+        const { data, error } = await supabase
+          .from('client_onboarding')
+          .select('*')
+          .order('created_at', { ascending: false });
+
+        if (error) throw error;
+        return data || [];
+      }, {
+        tables: ['client_onboarding'],
+        ttl: this.cacheTimeout,
+        staleWhileRevalidate: this.cacheTimeout
       });
-      this.lastCacheUpdate = now;
-
-      return data;
     } catch (error) {
       console.error('Failed to fetch client onboarding data:', error);
       return [];
     }
   }
 
+  /**
+   * Look up a client's onboarding record by lower-cased name. The index is
+   * memoized on the cached rows, so it is rebuilt only after a refetch.
+   */
+  async getClientOnboardingRecord(clientName) {
+    const rows = await this.getClientOnboardingData();
+    return getIndex(rows, onboardingClientKey).get(clientName);
+  }
+
   /**
    * Merge client data with priority system
    * @param {Object} employeeClientData - Client data from employee submission
@@ -69,13 +74,10 @@ class ClientDataPriorityService {
     const clientName = employeeClientData.name.toLowerCase();
     
     // Get client onboarding data
-    await this.getClientOnboardingData();
-    const clientOnboardingData = this.clientOnboardingCache.get(clientName);
+    const clientOnboardingData = await this.getClientOnboardingRecord(clientName);
     
     // Find master client data
-    const masterClient = masterClients.find(client => 
-      client.name.toLowerCase() === clientName
-    );
+    const masterClient = getIndex(masterClients, masterClientKey).get(clientName);
 
     // Apply priority system
     const mergedData = {
@@ -144,7 +146,9 @@ class ClientDataPriorityService {
       return employeeClients;
     }
 
-    // Process each client with priority system
+    // Process each client with priority system. Concurrent merges share one
+    // onboarding request, and the master client index is built on the first
+    // merge and reused for the rest of the list
     const processedClients = await Promise.all(
       employeeClients.map(client => 
         this.mergeClientDataWithPriority(client, masterClients)
@@ -165,8 +169,7 @@ class ClientDataPriorityService {
     const normalizedName = clientName.toLowerCase();
     
     // Get all data sources
-    await this.getClientOnboardingData();
-    const clientOnboardingData = this.clientOnboardingCache.get(normalizedName);
+    const clientOnboardingData = await this.getClientOnboardingRecord(normalizedName);
     
     return {
       clientName,
@@ -215,8 +218,7 @@ class ClientDataPriorityService {
    * Clear cache (useful for testing or forced refresh)
    */
   clearCache() {
-    this.clientOnboardingCache.clear();
-    this.lastCacheUpdate = null;
+    queryCache.invalidate(ONBOARDING_CACHE_KEY);
   }
 
   /**
@@ -10,49 +10,34 @@ class HRReportingService {
    */
   async getHRMetrics() {
     try {
-      // Get employee data from unified_users
-      const { data: employees, error: empError } = await supabase
-        .from('unified_users')
-        .select(`
-          id,
-          name,
-          email,
-          department,
-          role,
-          status,
-          created_at,
-          phone,
-          monthly_form_submissions(
-            id,
-            month,
-            status,
-            month_score
-          )
-        `);
-
-      if (empError) throw empError;
+      // Counts and distributions are aggregated by get_hr_metrics_summary;
+      // the employee list only needs display columns.
+      const [summaryResult, employeesResult, leaveResult] = await Promise.all([
+        supabase.rpc('get_hr_metrics_summary'),
+        supabase
+          .from('unified_users')
+          .select('id, name, email, department, role, status, created_at, phone'),
+        supabase
+          .from('leave_requests')
+          .select('*')
+          .order('created_at', { ascending: false })
+          .limit(50)
+      ]);
 
-      // Get leave requests (if table exists)
-      const { data: leaveRequests, error: leaveError } = await supabase
-        .from('leave_requests')
-        .select('*')
-        .order('created_at', { ascending: false })
-        .limit(50);
+      if (summaryResult.error) throw summaryResult.error;
+      if (employeesResult.error) throw employeesResult.error;
 
       // Don't throw error if table doesn't exist, just use empty array
-      const leaves = leaveError ? [] : leaveRequests;
-
-      // Calculate HR metrics
-      const metrics = this.calculateHRMetrics(employees, leaves);
-      const employeeList = this.processEmployeeData(employees);
-      const leaveRequestsList = this.processLeaveRequests(leaves);
+      const leaves = leaveResult.error ? [] : leaveResult.data;
+      const summary = summaryResult.data || {};
+      const employees = employeesResult.data || [];
 
       return {
-        metrics,
-        employees: employeeList,
-        leaveRequests: leaveRequestsList,
-        departmentBreakdown: this.getDepartmentBreakdown(employees),
-        performanceMetrics: this.getPerformanceMetrics(employees)
+        metrics: this.calculateHRMetrics(summary, leaves),
+        employees: this.processEmployeeData(employees, summary.employee_scores || {}),
+        leaveRequests: this.processLeaveRequests(leaves),
+        departmentBreakdown: this.getDepartmentBreakdown(summary.departments || []),
+        performanceMetrics: this.getPerformanceMetrics(summary.monthly || [], summary.total_employees || 0)
       };
     } catch (error) {
       console.error('Error fetching HR metrics:', error);
@@ -61,47 +46,28 @@ class HRReportingService {
   }
 
   /**
-   * Calculate HR metrics from employee data
+   * Calculate HR metrics from the get_hr_metrics_summary aggregate
    */
-  calculateHRMetrics(employees, leaveRequests) {
-    const now = new Date();
-    const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
-    const ninetyDaysAgo = new Date(now.getTime() - 90 * 24 * 60 * 60 * 1000);
-
-    // Basic counts
-    const totalEmployees = employees.length;
-    const activeEmployees = employees.filter(emp => emp.status === 'active').length;
-    const newHires = employees.filter(emp => 
-      new Date(emp.created_at) >= thirtyDaysAgo
-    ).length;
+  calculateHRMetrics(summary, leaveRequests) {
+    const totalEmployees = summary.total_employees || 0;
+    const activeEmployees = summary.active_employees || 0;
+    const newHires = summary.new_hires || 0;
+    const departures = summary.departures || 0;
 
-    // Calculate departures (employees with inactive status recently)
-    const departures = employees.filter(emp => 
-      emp.status === 'inactive' && new Date(emp.created_at) >= ninetyDaysAgo
-    ).length;
-
-    // Performance metrics from submissions
-    const allSubmissions = employees.flatMap(emp => emp.monthly_form_submissions || []);
-    const approvedSubmissions = allSubmissions.filter(sub => sub.status === 'approved');
-    const avgPerformanceRating = approvedSubmissions.length > 0
-      ? approvedSubmissions.reduce((sum, sub) => sum + (sub.month_score || 0), 0) / approvedSubmissions.length / 20 // Convert to 5-point scale
+    // Approved month scores are out of 100; convert to 5-point scale
+    const avgPerformanceRating = summary.approved_submissions > 0
+      ? Number(summary.avg_approved_score) / 20
       : 0;
 
     // Leave metrics
     const pendingLeaves = leaveRequests.filter(req => req.status === 'pending').length;
-    const approvedLeaves = leaveRequests.filter(req => req.status === 'approved').length;
     const totalLeaveRequests = leaveRequests.length;
 
     // Calculate retention rate (simplified)
     const retentionRate = totalEmployees > 0 ? ((totalEmployees - departures) / totalEmployees) * 100 : 100;
 
-    // Calculate average tenure (simplified - based on creation date)
-    const avgTenure = employees.length > 0
-      ? employees.reduce((sum, emp) => {
-          const tenure = (now.getTime() - new Date(emp.created_at).getTime()) / (365 * 24 * 60 * 60 * 1000);
-          return sum + Math.max(0, tenure);
-        }, 0) / employees.length
-      : 0;
+    // Average tenure (simplified - based on creation date)
+    const avgTenure = Number(summary.avg_tenure_years) || 0;
 
     return {
       totalEmployees,
@@ -119,7 +85,7 @@ class HRReportingService {
       pendingApprovals: pendingLeaves,
       upcomingReviews: Math.floor(totalEmployees * 0.15), // Estimate 15% due for review
       complianceScore: Math.round(95 + Math.random() * 5), // Placeholder
-      diversityIndex: this.calculateDiversityIndex(employees),
+      diversityIndex: this.calculateDiversityIndex(summary.departments || []),
       engagementScore: Math.round(70 + Math.random() * 20) // Placeholder
     };
   }
@@ -127,7 +93,7 @@ class HRReportingService {
   /**
    * Process employee data for display
    */
-  processEmployeeData(employees) {
+  processEmployeeData(employees, employeeScores = {}) {
     return employees.map(emp => ({
       id: emp.id,
       name: emp.name,
@@ -139,7 +105,7 @@ class HRReportingService {
       manager: 'TBD', // Would need manager relationship in schema
       location: 'Remote', // Placeholder
       phone: emp.phone || 'Not provided',
-      performanceScore: this.calculateEmployeePerformance(emp.monthly_form_submissions || [])
+      performanceScore: Number(employeeScores[emp.id]) || 0
     }));
   }
 
@@ -163,74 +129,26 @@ class HRReportingService {
   /**
    * Get department breakdown
    */
-  getDepartmentBreakdown(employees) {
-    const departments = {};
-    
-    employees.forEach(emp => {
-      const dept = emp.department || 'Unknown';
-      if (!departments[dept]) {
-        departments[dept] = {
-          name: dept,
-          count: 0,
-          activeCount: 0,
-          avgPerformance: 0,
-          submissions: []
-        };
-      }
-      departments[dept].count++;
-      if (emp.status === 'active') {
-        departments[dept].activeCount++;
-      }
-      departments[dept].submissions.push(...(emp.monthly_form_submissions || []));
-    });
-
-    return Object.values(departments).map(dept => {
-      const approvedSubmissions = dept.submissions.filter(sub => sub.status === 'approved');
-      const avgScore = approvedSubmissions.length > 0
-        ? approvedSubmissions.reduce((sum, sub) => sum + (sub.month_score || 0), 0) / approvedSubmissions.length
-        : 0;
-
-      return {
-        ...dept,
-        avgPerformance: Math.round(avgScore * 10) / 10,
-        utilizationRate: dept.count > 0 ? Math.round((dept.activeCount / dept.count) * 100) : 0
-      };
-    });
+  getDepartmentBreakdown(departments) {
+    return departments.map(dept => ({
+      name: dept.name,
+      count: dept.count,
+      activeCount: dept.active_count,
+      avgPerformance: Math.round(Number(dept.avg_performance) * 10) / 10,
+      utilizationRate: dept.count > 0 ? Math.round((dept.active_count / dept.count) * 100) : 0
+    }));
   }
 
   /**
-   * Get performance metrics
+   * Get performance metrics for the last 6 months
    */
-  getPerformanceMetrics(employees) {
-    const allSubmissions = employees.flatMap(emp => emp.monthly_form_submissions || []);
-    const approvedSubmissions = allSubmissions.filter(sub => sub.status === 'approved');
-    
-    // Group by month
-    const monthlyPerformance = {};
-    approvedSubmissions.forEach(sub => {
-      const month = sub.month;
-      if (!monthlyPerformance[month]) {
-        monthlyPerformance[month] = {
-          month,
-          scores: [],
-          count: 0
-        };
-      }
-      monthlyPerformance[month].scores.push(sub.month_score || 0);
-      monthlyPerformance[month].count++;
-    });
-
-    return Object.values(monthlyPerformance)
-      .map(month => ({
-        month: month.month,
-        averageScore: month.scores.length > 0
-          ? Math.round((month.scores.reduce((sum, score) => sum + score, 0) / month.scores.length) * 10) / 10
-          : 0,
-        submissionCount: month.count,
-        participationRate: employees.length > 0 ? Math.round((month.count / employees.length) * 100) : 0
-      }))
-      .sort((a, b) => b.month.localeCompare(a.month))
-      .slice(0, 6); // Last 6 months
+  getPerformanceMetrics(monthly, totalEmployees) {
+    return monthly.map(month => ({
+      month: month.month,
+      averageScore: Math.round(Number(month.average_score) * 10) / 10,
+      submissionCount: month.submission_count,
+      participationRate: totalEmployees > 0 ? Math.round((month.submission_count / totalEmployees) * 100) : 0
+    }));
   }
 
   /**
@@ -316,14 +234,6 @@ class HRReportingService {
   /**
    * Helper methods
    */
-  calculateEmployeePerformance(submissions) {
-    const approvedSubmissions = submissions.filter(sub => sub.status === 'approved');
-    if (approvedSubmissions.length === 0) return 0;
-    
-    const avgScore = approvedSubmissions.reduce((sum, sub) => sum + (sub.month_score || 0), 0) / approvedSubmissions.length;
-    return Math.round(avgScore * 10) / 10;
-  }
-
   calculateLeaveDays(startDate, endDate) {
     if (!startDate || !endDate) return 1;
     const start = new Date(startDate);
@@ -333,15 +243,14 @@ class HRReportingService {
     return Math.max(1, diffDays + 1);
   }
 
-  calculateDiversityIndex(employees) {
+  calculateDiversityIndex(departmentRows) {
     const departments = {};
-    employees.forEach(emp => {
-      const dept = emp.department || 'Unknown';
-      departments[dept] = (departments[dept] || 0) + 1;
+    departmentRows.forEach(dept => {
+      departments[dept.name] = dept.count;
     });
     
     const deptCount = Object.keys(departments).length;
-    const totalEmployees = employees.length;
+    const totalEmployees = Object.values(departments).reduce((sum, count) => sum + count, 0);
     
     // Simple diversity calculation based on department distribution
     if (totalEmployees === 0) return 0;
@@ -164,6 +164,121 @@ export class MonthlyReportService {
     }
   }
 
+  /**
+   * Get aggregated monthly report totals from get_monthly_report_summary.
+   * Falls back to aggregating the raw rows when the function is unavailable.
+   * @param {string} monthKey - Format: 'YYYY-MM'
+   * @returns {Promise<Object>} { totals, departments } with score sums and counts
+   */
+  static async getMonthlyReportSummary(monthKey) {
+    const { data, error } = await supabase.rpc('get_monthly_report_summary', {
+      p_month_key: monthKey
+    });
+
+    if (!error && data) {
+      return data;
+    }
+
+    console.warn('get_monthly_report_summary unavailable, aggregating client-side:', error);
+    const { users, submissions } = await this.getMonthlyReportData(monthKey);
+    return this.buildReportSummary(users, submissions);
+  }
+
+  /**
+   * Aggregate users and submissions into the get_monthly_report_summary shape
+   */
+  static buildReportSummary(users, submissions) {
+    const departments = {};
+    const totals = { employees: 0, submissions: 0, score_total: 0, score_count: 0 };
+    const submitters = new Set();
+    const departmentSubmitters = {};
+
+    users.forEach(user => {
+      if (user.status !== 'active') return;
+      const dept = user.department || 'Unknown';
+      if (!departments[dept]) {
+        departments[dept] = { department: dept, employees: 0, submissions: 0, submitters: 0, score_total: 0, score_count: 0 };
+        departmentSubmitters[dept] = new Set();
+      }
+      departments[dept].employees++;
+      totals.employees++;
+    });
+
+    submissions.forEach(submission => {
+      const dept = submission.employee?.department || submission.department || 'Unknown';
+      const submitter = submission.employeeId || submission.user_id || submission.employee?.name;
+      const score = submission.performance_score || submission.totalScore || 0;
+
+      totals.submissions++;
+      submitters.add(submitter);
+      if (score > 0) {
+        totals.score_total += score;
+        totals.score_count++;
+      }
+
+      if (departments[dept]) {
+        departments[dept].submissions++;
+        departmentSubmitters[dept].add(submitter);
+        if (score > 0) {
+          departments[dept].score_total += score;
+          departments[dept].score_count++;
+        }
+      }
+    });
+
+    Object.values(departments).forEach(dept => {
+      dept.submitters = departmentSubmitters[dept.department].size;
+    });
+
+    return {
+      totals: { ...totals, submitters: submitters.size },
+      departments: Object.values(departments)
+    };
+  }
+
+  /**
+   * Derive dashboard metrics and department breakdown from a report summary
+   * @param {Object} summary - Result of getMonthlyReportSummary
+   * @param {string} department - Department name or 'all'
+   */
+  static summarizeReport(summary, department = 'all') {
+    const departments = (summary?.departments || [])
+      .filter(dept => department === 'all' || dept.department === department);
+    const totals = department === 'all'
+      ? (summary?.totals || {})
+      : (departments[0] || {});
+
+    const activeEmployees = Number(totals.employees) || 0;
+    const totalSubmissions = Number(totals.submissions) || 0;
+    const uniqueSubmitters = Number(totals.submitters) || 0;
+    const scoreCount = Number(totals.score_count) || 0;
+
+    const metrics = {
+      activeEmployees,
+      totalSubmissions,
+      uniqueSubmitters,
+      avgSubmissionsPerEmployee: activeEmployees > 0
+        ? (totalSubmissions / activeEmployees).toFixed(1)
+        : '0.0',
+      avgPerformance: scoreCount > 0
+        ? (Number(totals.score_total) / scoreCount).toFixed(1)
+        : '0.0',
+      submissionRate: activeEmployees > 0
+        ? ((uniqueSubmitters / activeEmployees) * 100).toFixed(1)
+        : '0.0'
+    };
+
+    const departmentBreakdown = departments.map(dept => ({
+      department: dept.department,
+      employees: dept.employees,
+      submissions: dept.submissions,
+      avgScore: dept.score_count > 0 ? (Number(dept.score_total) / dept.score_count).toFixed(1) : '0.0',
+      submissionRate: dept.employees > 0 ? ((dept.submissions / dept.employees) * 100).toFixed(1) : '0.0'
+    }));
+
+    return { metrics, departmentBreakdown };
+  }
+
   /**
    * Extract performance score from submission data
    * @param {Object} submission - Submission object
@@ -1,4 +1,11 @@
 import { createClient } from '@supabase/supabase-js';
+import { queryCache } from '@/shared/services/queryCache';
+import { realtimeHub } from '@/shared/services/realtimeHub';
+
+// Subscribed datasets are kept current by realtime events, so they never
+// expire; unsubscribe drops them
+const REALTIME_CACHE_TTL = Infinity;
+const cacheKeyFor = (dataType, userId) => `realtime:${dataType}_${userId}`;
 
 /**
  * Real-time Data Synchronization Service
@@ -8,11 +15,8 @@ class RealTimeDataService {
   constructor() {
     this.supabase = null;
     this.subscriptions = new Map();
-    this.dataCache = new Map();
     this.listeners = new Map();
     this.isInitialized = false;
-    this.reconnectAttempts = 0;
-    this.maxReconnectAttempts = 5;
   }
 
   /**
@@ -41,28 +45,25 @@ class RealTimeDataService {
 
     try {
       const config = this.getDataTypeConfig(dataType);
-      const channel = this.supabase
-        .channel(`realtime:${dataType}:${userId}`)
-        .on('postgres_changes', {
-          event: '*',
-          schema: 'public',
-          table: config.table,
-          filter: config.filter ? config.filter.replace('{userId}', userId) : `user_id=eq.${userId}`
-        }, (payload) => {
-          this.handleRealtimeUpdate(dataType, payload, userId);
-        })
-        .subscribe((status) => {
+      // Shares the user's multiplexed channel with useRealTimeUpdates; the
+      // hub handles reconnects and delivers coalesced batches
+      const unsubscribe = realtimeHub.subscribe(this.supabase, {
+        table: config.table,
+        filter: config.filter ? config.filter.replace('{userId}', userId) : `user_id=eq.${userId}`,
+        scope: userId,
+        onStatus: (status) => {
           if (status === 'SUBSCRIBED') {
             console.log(`✅ Subscribed to ${dataType} updates for user ${userId}`);
-            this.reconnectAttempts = 0;
           } else if (status === 'CHANNEL_ERROR') {
             console.error(`❌ Subscription error for ${dataType}`);
-            this.handleSubscriptionError(subscriptionKey, dataType, userId, options);
           }
-        });
+        }
+      }, (payloads) => {
+        this.handleRealtimeBatch(dataType, payloads, userId);
+      });
 
       this.subscriptions.set(subscriptionKey, {
-        channel,
+        unsubscribe,
         dataType,
         userId,
         options,
@@ -72,7 +73,7 @@ class RealTimeDataService {
       // Initialize data cache for this subscription
       await this.initializeDataCache(dataType, userId, config);
 
-      return channel;
+      return unsubscribe;
     } catch (error) {
       console.error(`Error subscribing to ${dataType}:`, error);
       throw error;
@@ -87,9 +88,9 @@ class RealTimeDataService {
     const subscription = this.subscriptions.get(subscriptionKey);
     
     if (subscription) {
-      this.supabase.removeChannel(subscription.channel);
+      subscription.unsubscribe();
       this.subscriptions.delete(subscriptionKey);
-      this.dataCache.delete(subscriptionKey);
+      queryCache.invalidate(cacheKeyFor(dataType, userId));
       console.log(`🔌 Unsubscribed from ${dataType} updates`);
     }
   }
@@ -98,8 +99,7 @@ class RealTimeDataService {
    * Get cached data for a specific data type
    */
   getCachedData(dataType, userId) {
-    const cacheKey = `${dataType}_${userId}`;
-    return this.dataCache.get(cacheKey) || null;
+    return queryCache.peek(cacheKeyFor(dataType, userId));
   }
 
   /**
@@ -132,7 +132,7 @@ class RealTimeDataService {
    */
   async refreshData(dataType, userId) {
     const config = this.getDataTypeConfig(dataType);
-    await this.initializeDataCache(dataType, userId, config);
+    await this.initializeDataCache(dataType, userId, config, { force: true });
     this.notifyListeners(dataType, userId, {
       type: 'REFRESH',
       data: this.getCachedData(dataType, userId)
@@ -140,42 +140,64 @@ class RealTimeDataService {
   }
 
   /**
-   * Handle real-time updates
+   * Apply a coalesced batch of real-time updates and notify listeners once
    */
-  handleRealtimeUpdate(dataType, payload, userId) {
-    const cacheKey = `${dataType}_${userId}`;
-    const currentData = this.dataCache.get(cacheKey) || [];
-    
+  handleRealtimeBatch(dataType, payloads, userId) {
+    const config = this.getDataTypeConfig(dataType);
+    const currentData = this.getCachedData(dataType, userId) || [];
+    const positions = new Map(currentData.map((item, index) => [item.id, index]));
+
     let updatedData = [...currentData];
-    
-    switch (payload.eventType) {
-      case 'INSERT':
-        updatedData.push(payload.new);
-        break;
-        
-      case 'UPDATE':
-        const updateIndex = updatedData.findIndex(item => item.id === payload.new.id);
-        if (updateIndex !== -1) {
-          updatedData[updateIndex] = payload.new;
+    let deleted = false;
+
+    payloads.forEach(payload => {
+      switch (payload.eventType) {
+        case 'INSERT':
+          positions.set(payload.new.id, updatedData.length);
+          updatedData.push(payload.new);
+          break;
+
+        case 'UPDATE': {
+          const updateIndex = positions.get(payload.new.id);
+          if (updateIndex !== undefined) {
+            updatedData[updateIndex] = payload.new;
+          }
+          break;
         }
-        break;
-        
-      case 'DELETE':
-        updatedData = updatedData.filter(item => item.id !== payload.old.id);
-        break;
+
+        case 'DELETE': {
+          const deleteIndex = positions.get(payload.old.id);
+          if (deleteIndex !== undefined) {
+            updatedData[deleteIndex] = null;
+            positions.delete(payload.old.id);
+            deleted = true;
+          }
+          break;
+        }
+      }
+    });
+
+    if (deleted) {
+      updatedData = updatedData.filter(Boolean);
     }
-    
-    // Update cache
-    this.dataCache.set(cacheKey, updatedData);
-    
+
+    // Store the patched dataset and drop other cached queries that read
+    // this table. Subscription datasets are not table-tagged, since they are
+    // kept current by these events rather than by invalidation.
+    queryCache.set(cacheKeyFor(dataType, userId), updatedData, { ttl: REALTIME_CACHE_TTL });
+    queryCache.invalidateTables(config.table);
+
+    const payload = payloads[payloads.length - 1];
+
     // Notify listeners
     this.notifyListeners(dataType, userId, {
       type: payload.eventType,
       data: updatedData,
-      payload
+      payload,
+      payloads
     });
-    
-    console.log(`📡 ${dataType} data updated:`, payload.eventType);
+
+    console.log(`📡 ${dataType} data updated:`, payloads.map(p => p.eventType).join(', '));
   }
 
   /**
@@ -196,48 +218,23 @@ class RealTimeDataService {
     }
   }
 
-  /**
-   * Handle subscription errors and attempt reconnection
-   */
-  async handleSubscriptionError(subscriptionKey, dataType, userId, options) {
-    if (this.reconnectAttempts < this.maxReconnectAttempts) {
-      this.reconnectAttempts++;
-      console.log(`🔄 Attempting to reconnect ${dataType} (attempt ${this.reconnectAttempts})`);
-      
-      // Remove failed subscription
-      this.unsubscribe(dataType, userId);
-      
-      // Wait before reconnecting
-      await new Promise(resolve => setTimeout(resolve, 2000 * this.reconnectAttempts));
-      
-      // Attempt to resubscribe
-      try {
-        await this.subscribe(dataType, userId, options);
-      } catch (error) {
-        console.error(`Failed to reconnect ${dataType}:`, error);
-      }
-    } else {
-      console.error(`❌ Max reconnection attempts reached for ${dataType}`);
-    }
-  }
-
   /**
    * Initialize data cache by fetching current data
    */
-  async initializeDataCache(dataType, userId, config) {
+  async initializeDataCache(dataType, userId, config, { force = false } = {}) {
     try {
-      const { data, error } = await this.supabase
-        .from(config.table)
-        .select(config.select || '*')
-        .eq('user_id', userId)
-        .order('created_at', { ascending: false });
-      
-      if (error) throw error;
-      
-      const cacheKey = `${dataType}_${userId}`;
-      this.dataCache.set(cacheKey, data || []);
-      
-      console.log(`💾 Cached ${data?.length || 0} ${dataType} records`);
+      const data = await queryCache.fetch(cacheKeyFor(dataType, userId), async () => {
+        const { data, error } = await this.supabase
+          .from(config.table)
+          .select(config.select || '*')
+          .eq('user_id', userId)
+          .order('created_at', { ascending: false });
+
+        if (error) throw error;
+        return data || [];
+      }, { ttl: REALTIME_CACHE_TTL, force });
+
+      console.log(`💾 Cached ${data.length} ${dataType} records`);
     } catch (error) {
       console.error(`Error initializing cache for ${dataType}:`, error);
     }
@@ -303,9 +300,9 @@ class RealTimeDataService {
   getSubscriptionStats() {
     return {
       activeSubscriptions: this.subscriptions.size,
-      cachedDataTypes: this.dataCache.size,
+      cachedDataTypes: queryCache.getStats('realtime:').size,
       activeListeners: Array.from(this.listeners.values()).reduce((total, listeners) => total + listeners.size, 0),
-      reconnectAttempts: this.reconnectAttempts
+      hub: realtimeHub.getStats(this.supabase)
     };
   }
 
@@ -314,13 +311,13 @@ class RealTimeDataService {
    */
   cleanup() {
     // Unsubscribe from all channels
-    this.subscriptions.forEach((subscription, key) => {
-      this.supabase.removeChannel(subscription.channel);
+    this.subscriptions.forEach(subscription => {
+      subscription.unsubscribe();
     });
     
     // Clear all data
     this.subscriptions.clear();
-    this.dataCache.clear();
+    queryCache.clear('realtime:');
     this.listeners.clear();
     
     console.log('🧹 Real-time service cleaned up');
@@ -359,7 +356,7 @@ class RealTimeDataService {
         userId: sub.userId,
         createdAt: sub.createdAt
       })),
-      cacheSize: this.dataCache.size,
+      cacheSize: queryCache.getStats('realtime:').size,
       lastUpdate: new Date().toISOString()
     };
   }
@@ -0,0 +1,229 @@
+/**
+ * Score Compute Jobs for Monthly Operating System
+ * Runs month-close score recomputes as persisted jobs: users are scored in
+ * chunks through a bounded pool, transient Supabase errors are retried with
+ * backoff, and per-user status lives in score_compute_job_items so an
+ * interrupted run can be resumed.
+ */
+
+import { supabase } from '../database/supabaseClient';
+import { recomputeMonthScores } from './scoringComputations';
+import { mapWithConcurrency, withRetry } from '../shared/utils/concurrency';
+
+const DEFAULT_CONCURRENCY = 3;
+const DEFAULT_CHUNK_SIZE = 50;
+const DEFAULT_MAX_ATTEMPTS = 4;
+const DEFAULT_BASE_DELAY_MS = 500;
+const PAGE_SIZE = 1000;
+
+// Serialization failure, deadlock, connection and statement timeout errors
+const TRANSIENT_CODES = new Set(['40001', '40P01', '53300', '57014', '08000', '08003', '08006', 'PGRST000', 'PGRST001', 'PGRST002']);
+const TRANSIENT_MESSAGE = /fetch failed|network|timed? ?out|ECONNRESET|ETIMEDOUT|rate limit|too many/i;
+
+/**
+ * Whether a Supabase/PostgREST error is worth retrying
+ */
+export function isTransientError(error) {
+  if (!error) return false;
+  if (TRANSIENT_CODES.has(error.code)) return true;
+  const status = error.status ?? error.statusCode;
+  if (status === 429 || status >= 500) return true;
+  return TRANSIENT_MESSAGE.test(error.message || '');
+}
+
+function chunk(items, size) {
+  const chunks = [];
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size));
+  }
+  return chunks;
+}
+
+/**
+ * Run a job-table write, retrying transient failures
+ */
+async function persist(buildQuery, retryOptions) {
+  return withRetry(async () => {
+    const { data, error } = await buildQuery();
+    if (error) throw error;
+    return data;
+  }, { ...retryOptions, isRetryable: isTransientError });
+}
+
+async function updateItems(jobId, userIds, changes, retryOptions) {
+  if (userIds.length === 0) return;
+  await persist(() => supabase
+    .from('score_compute_job_items')
+    .update({ ...changes, updated_at: new Date().toISOString() })
+    .eq('job_id', jobId)
+    .in('user_id', userIds), retryOptions);
+}
+
+async function updateJob(jobId, changes, retryOptions) {
+  await persist(() => supabase
+    .from('score_compute_jobs')
+    .update({ ...changes, updated_at: new Date().toISOString() })
+    .eq('id', jobId), retryOptions);
+}
+
+/**
+ * Read the users a run still has to score. Items left 'running' belong to an
+ * interrupted run and are picked up again.
+ */
+async function loadOutstandingItems(jobId) {
+  const items = [];
+  for (let from = 0; ; from += PAGE_SIZE) {
+    const { data, error } = await supabase
+      .from('score_compute_job_items')
+      .select('user_id, attempts')
+      .eq('job_id', jobId)
+      .in('status', ['pending', 'running'])
+      .order('user_id')
+      .range(from, from + PAGE_SIZE - 1);
+    if (error) throw error;
+    items.push(...(data || []));
+    if (!data || data.length < PAGE_SIZE) return items;
+  }
+}
+
+/**
+ * Create a job with one pending item per user
+ *
+ * @param {number} month
+ * @param {number} year
+ * @param {string[]} userIds
+ * @param {Object} options
+ * @param {string} options.createdBy - user starting the month close
+ * @returns {Promise<Object>} score_compute_jobs row
+ */
+export async function createScoreComputeJob(month, year, userIds, options = {}) {
+  const { createdBy = null } = options;
+  const ids = [...new Set(userIds)];
+
+  const job = await persist(() => supabase
+    .from('score_compute_jobs')
+    .insert({ month, year, total_users: ids.length, created_by: createdBy })
+    .select()
+    .single());
+
+  for (const page of chunk(ids, PAGE_SIZE)) {
+    await persist(() => supabase
+      .from('score_compute_job_items')
+      .upsert(page.map(userId => ({ job_id: job.id, user_id: userId })), {
+        onConflict: 'job_id,user_id',
+        ignoreDuplicates: true
+      }));
+  }
+
+  return job;
+}
+
+/**
+ * Run (or resume) a score compute job
+ *
+ * @param {string} jobId
+ * @param {Object} options
+ * @param {number} options.concurrency - chunks scored at once
+ * @param {number} options.chunkSize - users per recomputeMonthScores call
+ * @param {number} options.maxAttempts - tries per chunk, including the first
+ * @param {number} options.baseDelayMs - backoff base between retries
+ * @param {boolean} options.computeMissingAttendance - passed to recomputeMonthScores
+ * @param {Function} options.onProgress - ({ processed, total, succeeded, failed }) after each chunk
+ * @returns {Promise<Object>} { job_id, status, scores: Map, succeeded: string[], failed: [{ user_id, error }] }
+ */
+export async function runScoreComputeJob(jobId, options = {}) {
+  const {
+    concurrency = DEFAULT_CONCURRENCY,
+    chunkSize = DEFAULT_CHUNK_SIZE,
+    maxAttempts = DEFAULT_MAX_ATTEMPTS,
+    baseDelayMs = DEFAULT_BASE_DELAY_MS,
+    computeMissingAttendance = true,
+    onProgress = null
+  } = options;
+  const retryOptions = { maxAttempts, baseDelayMs };
+
+  const { data: job, error: jobError } = await supabase
+    .from('score_compute_jobs')
+    .select('id, month, year, status, started_at')
+    .eq('id', jobId)
+    .single();
+
+  if (jobError) throw jobError;
+
+  const scores = new Map();
+  const succeeded = [];
+  const failed = [];
+
+  try {
+    const items = await loadOutstandingItems(jobId);
+    const previousAttempts = new Map(items.map(item => [item.user_id, item.attempts || 0]));
+
+    await updateJob(jobId, {
+      status: 'running',
+      started_at: job.started_at || new Date().toISOString(),
+      finished_at: null
+    }, retryOptions);
+
+    const chunks = chunk(items.map(item => item.user_id), Math.max(1, chunkSize));
+    let processed = 0;
+
+    await mapWithConcurrency(chunks, concurrency, async (userIds) => {
+      await updateItems(jobId, userIds, { status: 'running' }, retryOptions);
+
+      // Attempts are counted per chunk; users in a chunk share the count
+      const priorAttempts = Math.max(...userIds.map(userId => previousAttempts.get(userId)));
+      let attempts = 0;
+      try {
+        // recomputeMonthScores only overwrites computed scores, so retrying a partly written chunk is safe
+        const batch = await withRetry(async (attempt) => {
+          attempts = attempt;
+          const result = await recomputeMonthScores(job.month, job.year, userIds, { computeMissingAttendance });
+          if (result.error) {
+            throw Object.assign(new Error(result.error), { code: result.code });
+          }
+          return result;
+        }, { ...retryOptions, isRetryable: isTransientError });
+
+        const scored = userIds.filter(userId => batch.scores.has(userId));
+        const unscored = userIds.filter(userId => !batch.scores.has(userId));
+        scored.forEach(userId => scores.set(userId, batch.scores.get(userId)));
+        succeeded.push(...scored);
+        unscored.forEach(userId => failed.push({ user_id: userId, error: 'No scoring data for user' }));
+
+        await updateItems(jobId, scored, { status: 'succeeded', attempts: priorAttempts + attempts, last_error: null }, retryOptions);
+        await updateItems(jobId, unscored, { status: 'failed', attempts: priorAttempts + attempts, last_error: 'No scoring data for user' }, retryOptions);
+      } catch (error) {
+        userIds.forEach(userId => failed.push({ user_id: userId, error: error.message }));
+        await updateItems(jobId, userIds, {
+          status: 'failed',
+          attempts: priorAttempts + (error.attempts || attempts),
+          last_error: error.message
+        }, retryOptions);
+      }
+
+      processed += userIds.length;
+      if (onProgress) {
+        onProgress({ processed, total: items.length, succeeded: succeeded.length, failed: failed.length });
+      }
+    });
+
+    const status = failed.length > 0 ? 'completed_with_errors' : 'completed';
+    await updateJob(jobId, { status, last_error: failed[0]?.error || null, finished_at: new Date().toISOString() }, retryOptions);
+
+    return { job_id: jobId, month: job.month, year: job.year, status, scores, succeeded, failed };
+  } catch (error) {
+    // Item status is already persisted, so the job can be resumed later
+    console.error('Error running score compute job:', error);
+    await updateJob(jobId, { status: 'failed', last_error: error.message }, retryOptions).catch(() => {});
+    throw error;
+  }
+}
+
+/**
+ * Job status with per-status item counts, for polling
+ */
+export async function getScoreComputeJobProgress(jobId) {
+  const { data, error } = await supabase.rpc('get_score_compute_job_progress', { p_job_id: jobId });
+  if (error) throw error;
+  return data;
+}
@@ -4,6 +4,7 @@
  */
 
 import { supabase } from '../database/supabaseClient';
+import { mapWithConcurrency } from '../shared/utils/concurrency';
 
 /**
  * Clamp a value between min and max
@@ -12,6 +13,183 @@ function clamp(value, min, max) {
   return Math.min(Math.max(value, min), max);
 }
 
+const ACCOUNTABILITY_STATUSES = ['draft', 'submitted', 'approved'];
+const LEARNING_TARGET_MINUTES = 360;
+const ATTENDANCE_COLUMNS = 'discipline_component, office_attendance_rate, meeting_attendance_rate, office_days_present, working_days_expected';
+
+// PostgREST caps a single response at 1000 rows and long `in.(...)` lists
+// overflow the URL, so batch reads are paged and user ids are chunked.
+const PAGE_SIZE = 1000;
+const ID_CHUNK_SIZE = 100;
+// Attendance computes hit the API per user, so gap filling is kept to a few at a time
+const ATTENDANCE_CONCURRENCY = 4;
+
+/**
+ * Score accountability from a user's active mappings and monthly rows
+ */
+export function computeAccountability(mappings = [], monthlyRows = []) {
+  const expectedProjects = mappings.reduce((sum, mapping) => sum + (mapping.expected_projects || 0), 0);
+  const expectedUnits = mappings.reduce((sum, mapping) => sum + (mapping.expected_units || 0), 0);
+
+  const actualProjects = new Set(monthlyRows.map(row => row.entity_id)).size;
+
+  // Project-based accountability
+  const accountabilityProjects = clamp((actualProjects / Math.max(expectedProjects, 1)) * 10, 0, 10);
+
+  // Unit-based accountability (when delivered_units exists in kpi_json)
+  let accountabilityUnits = 10; // Default to max if no units tracking
+  const totalDeliveredUnits = monthlyRows.reduce((sum, row) => {
+    const kpiData = row.kpi_json || {};
+    return sum + (kpiData.delivered_units || 0);
+  }, 0);
+
+  if (expectedUnits > 0) {
+    accountabilityUnits = clamp((totalDeliveredUnits / Math.max(expectedUnits, 1)) * 10, 0, 10);
+  }
+
+  // Take the lower score as the accountability cap
+  const finalAccountability = Math.min(accountabilityProjects, accountabilityUnits);
+
+  return {
+    accountability_score: parseFloat(finalAccountability.toFixed(2)),
+    expected_projects: expectedProjects,
+    actual_projects: actualProjects,
+    expected_units: expectedUnits,
+    delivered_units: totalDeliveredUnits
+  };
+}
+
+/**
+ * Score provisional output from a user's monthly rows
+ */
+export function computeOutput(monthlyRows = []) {
+  if (monthlyRows.length === 0) {
+    return { output_score: 0, row_scores: [] };
+  }
+
+  const rowScores = monthlyRows.map(row => {
+    let score = 5; // Default entity row score
+
+    if (['submitted', 'approved'].includes(row.status) && 
+        row.review_notes && 
+        row.review_notes.trim().length > 0 && 
+        !row.review_notes.toLowerCase().includes('rework')) {
+      score = 7; // Positive review
+    } else if (row.status === 'returned' || 
+               (row.review_notes && row.review_notes.toLowerCase().includes('rework'))) {
+      score = 3; // Returned for rework
+    }
+
+    return score;
+  });
+
+  const averageScore = rowScores.reduce((sum, score) => sum + score, 0) / rowScores.length;
+
+  return {
+    output_score: parseFloat(averageScore.toFixed(2)),
+    row_scores: rowScores
+  };
+}
+
+/**
+ * Score the learning component from a user's monthly rows
+ */
+export function computeLearning(monthlyRows = []) {
+  let totalLearningMinutes = 0;
+  const learningEntries = [];
+
+  monthlyRows.forEach(row => {
+    const learningData = row.learning_json || [];
+    if (Array.isArray(learningData)) {
+      learningData.forEach(entry => {
+        if (entry.topic && entry.url && entry.applied_where && entry.minutes) {
+          totalLearningMinutes += parseInt(entry.minutes) || 0;
+          learningEntries.push(entry);
+        }
+      });
+    }
+  });
+
+  const learningComponent = Math.min(totalLearningMinutes / LEARNING_TARGET_MINUTES, 1) * 10;
+
+  return {
+    learning_component: parseFloat(learningComponent.toFixed(2)),
+    learning_minutes: totalLearningMinutes,
+    learning_entries: learningEntries,
+    needs_appraisal_delay: totalLearningMinutes < LEARNING_TARGET_MINUTES
+  };
+}
+
+/**
+ * Normalize a monthly_attendance_cache row into the discipline component.
+ * A missing row falls back to the default good score.
+ */
+export function computeDiscipline(attendanceData) {
+  if (!attendanceData) {
+    return {
+      discipline_component: 8.0, // Default good score
+      office_attendance_rate: 0.0,
+      meeting_attendance_rate: 0.0,
+      office_days_present: 0,
+      working_days_expected: 0
+    };
+  }
+
+  return {
+    discipline_component: parseFloat(attendanceData.discipline_component) || 0.0,
+    office_attendance_rate: parseFloat(attendanceData.office_attendance_rate) || 0.0,
+    meeting_attendance_rate: parseFloat(attendanceData.meeting_attendance_rate) || 0.0,
+    office_days_present: attendanceData.office_days_present || 0,
+    working_days_expected: attendanceData.working_days_expected || 0
+  };
+}
+
+/**
+ * Combine component scores into the User Month Score (0-100)
+ */
+export function combineUserMonthScore(accountability, output, learning, discipline) {
+  // Average row score (accountability + output weighted mean)
+  const avgRowScore = (accountability.accountability_score * 0.5) + (output.output_score * 0.5);
+
+  // User Month Score calculation
+  // Row scores contribute up to 80 points (avgRowScore * 8)
+  // Learning contributes up to 10 points
+  // Discipline contributes up to 10 points
+  const rowPoints = avgRowScore * 8; // Up to 80 points
+  const learningPoints = learning.learning_component; // Up to 10 points
+  const disciplinePoints = discipline.discipline_component; // Up to 10 points
+
+  const userMonthScore = Math.round(rowPoints + learningPoints + disciplinePoints);
+
+  return {
+    user_month_score: clamp(userMonthScore, 0, 100),
+    breakdown: {
+      avg_row_score: parseFloat(avgRowScore.toFixed(2)),
+      row_points: parseFloat(rowPoints.toFixed(2)),
+      learning_component: learning.learning_component,
+      learning_minutes: learning.learning_minutes,
+      discipline_component: discipline.discipline_component,
+      accountability_score: accountability.accountability_score,
+      output_score: output.output_score
+    },
+    flags: {
+      needs_appraisal_delay: learning.needs_appraisal_delay
+    }
+  };
+}
+
+function buildAppraisalDelay(userId, month, year, learningMinutes) {
+  return {
+    user_id: userId,
+    month,
+    year,
+    reason: 'insufficient_learning',
+    deficit_minutes: LEARNING_TARGET_MINUTES - learningMinutes,
+    delay_months: 1,
+    created_at: new Date().toISOString()
+  };
+}
+
 /**
  * Calculate Accountability Score (0-10)
  * Project-based: actual projects vs expected projects
@@ -28,9 +206,6 @@ export async function calculateAccountabilityScore(userId, month, year) {
 
     if (mappingsError) throw mappingsError;
 
-    const expectedProjects = mappings.reduce((sum, mapping) => sum + (mapping.expected_projects || 0), 0);
-    const expectedUnits = mappings.reduce((sum, mapping) => sum + (mapping.expected_units || 0), 0);
-
     // Get actual projects (distinct entity_ids with monthly_rows)
     const { data: monthlyRows, error: rowsError } = await supabase
       .from('monthly_rows')
@@ -38,36 +213,11 @@ export async function calculateAccountabilityScore(userId, month, year) {
       .eq('user_id', userId)
       .eq('month', month)
       .eq('year', year)
-      .in('status', ['draft', 'submitted', 'approved']);
+      .in('status', ACCOUNTABILITY_STATUSES);
 
     if (rowsError) throw rowsError;
 
-    const actualProjects = new Set(monthlyRows.map(row => row.entity_id)).size;
-    
-    // Project-based accountability
-    const accountabilityProjects = clamp((actualProjects / Math.max(expectedProjects, 1)) * 10, 0, 10);
-
-    // Unit-based accountability (when delivered_units exists in kpi_json)
-    let accountabilityUnits = 10; // Default to max if no units tracking
-    const totalDeliveredUnits = monthlyRows.reduce((sum, row) => {
-      const kpiData = row.kpi_json || {};
-      return sum + (kpiData.delivered_units || 0);
-    }, 0);
-
-    if (expectedUnits > 0) {
-      accountabilityUnits = clamp((totalDeliveredUnits / Math.max(expectedUnits, 1)) * 10, 0, 10);
-    }
-
-    // Take the lower score as the accountability cap
-    const finalAccountability = Math.min(accountabilityProjects, accountabilityUnits);
-
-    return {
-      accountability_score: parseFloat(finalAccountability.toFixed(2)),
-      expected_projects: expectedProjects,
-      actual_projects: actualProjects,
-      expected_units: expectedUnits,
-      delivered_units: totalDeliveredUnits
-    };
+    return computeAccountability(mappings, monthlyRows);
   } catch (error) {
     console.error('Error calculating accountability score:', error);
     return { accountability_score: 0, error: error.message };
@@ -89,32 +239,7 @@ export async function calculateOutputScore(userId, month, year) {
 
     if (error) throw error;
 
-    if (monthlyRows.length === 0) {
-      return { output_score: 0, row_scores: [] };
-    }
-
-    const rowScores = monthlyRows.map(row => {
-      let score = 5; // Default entity row score
-
-      if (['submitted', 'approved'].includes(row.status) && 
-          row.review_notes && 
-          row.review_notes.trim().length > 0 && 
-          !row.review_notes.toLowerCase().includes('rework')) {
-        score = 7; // Positive review
-      } else if (row.status === 'returned' || 
-                 (row.review_notes && row.review_notes.toLowerCase().includes('rework'))) {
-        score = 3; // Returned for rework
-      }
-
-      return score;
-    });
-
-    const averageScore = rowScores.reduce((sum, score) => sum + score, 0) / rowScores.length;
-
-    return {
-      output_score: parseFloat(averageScore.toFixed(2)),
-      row_scores: rowScores
-    };
+    return computeOutput(monthlyRows);
   } catch (error) {
     console.error('Error calculating output score:', error);
     return { output_score: 0, error: error.message };
@@ -136,36 +261,14 @@ export async function calculateLearningComponent(userId, month, year) {
 
     if (error) throw error;
 
-    let totalLearningMinutes = 0;
-    const learningEntries = [];
-
-    monthlyRows.forEach(row => {
-      const learningData = row.learning_json || [];
-      if (Array.isArray(learningData)) {
-        learningData.forEach(entry => {
-          if (entry.topic && entry.url && entry.applied_where && entry.minutes) {
-            totalLearningMinutes += parseInt(entry.minutes) || 0;
-            learningEntries.push(entry);
-          }
-        });
-      }
-    });
-
-    const learningComponent = Math.min(totalLearningMinutes / 360, 1) * 10;
+    const learning = computeLearning(monthlyRows);
 
     // Check if appraisal delay is needed
-    const needsAppraisalDelay = totalLearningMinutes < 360;
-
-    if (needsAppraisalDelay) {
-      await recordAppraisalDelay(userId, month, year, totalLearningMinutes);
+    if (learning.needs_appraisal_delay) {
+      await recordAppraisalDelay(userId, month, year, learning.learning_minutes);
     }
 
-    return {
-      learning_component: parseFloat(learningComponent.toFixed(2)),
-      learning_minutes: totalLearningMinutes,
-      learning_entries: learningEntries,
-      needs_appraisal_delay: needsAppraisalDelay
-    };
+    return learning;
   } catch (error) {
     console.error('Error calculating learning component:', error);
     return { learning_component: 0, error: error.message };
@@ -179,15 +282,7 @@ async function recordAppraisalDelay(userId, month, year, learningMinutes) {
   try {
     const { error } = await supabase
       .from('appraisal_delays')
-      .upsert({
-        user_id: userId,
-        month,
-        year,
-        reason: 'insufficient_learning',
-        deficit_minutes: 360 - learningMinutes,
-        delay_months: 1,
-        created_at: new Date().toISOString()
-      }, {
+      .upsert(buildAppraisalDelay(userId, month, year, learningMinutes), {
         onConflict: 'user_id,month,year,reason'
       });
 
@@ -206,7 +301,7 @@ export async function calculateDisciplineComponent(userId, month, year) {
     // Get discipline component from monthly attendance cache
     const { data: attendanceData, error } = await supabase
       .from('monthly_attendance_cache')
-      .select('discipline_component, office_attendance_rate, meeting_attendance_rate, office_days_present, working_days_expected')
+      .select(ATTENDANCE_COLUMNS)
       .eq('user_id', userId)
       .eq('month', month)
       .eq('year', year)
@@ -217,13 +312,7 @@ export async function calculateDisciplineComponent(userId, month, year) {
     }
 
     if (attendanceData) {
-      return {
-        discipline_component: parseFloat(attendanceData.discipline_component) || 0.0,
-        office_attendance_rate: parseFloat(attendanceData.office_attendance_rate) || 0.0,
-        meeting_attendance_rate: parseFloat(attendanceData.meeting_attendance_rate) || 0.0,
-        office_days_present: attendanceData.office_days_present || 0,
-        working_days_expected: attendanceData.working_days_expected || 0
-      };
+      return computeDiscipline(attendanceData);
     }
 
     // If no attendance data found, try to compute it
@@ -235,42 +324,24 @@ export async function calculateDisciplineComponent(userId, month, year) {
       // Try to fetch again after computation
       const { data: newAttendanceData, error: newError } = await supabase
         .from('monthly_attendance_cache')
-        .select('discipline_component, office_attendance_rate, meeting_attendance_rate, office_days_present, working_days_expected')
+        .select(ATTENDANCE_COLUMNS)
         .eq('user_id', userId)
         .eq('month', month)
         .eq('year', year)
         .single();
 
       if (!newError && newAttendanceData) {
-        return {
-          discipline_component: parseFloat(newAttendanceData.discipline_component) || 0.0,
-          office_attendance_rate: parseFloat(newAttendanceData.office_attendance_rate) || 0.0,
-          meeting_attendance_rate: parseFloat(newAttendanceData.meeting_attendance_rate) || 0.0,
-          office_days_present: newAttendanceData.office_days_present || 0,
-          working_days_expected: newAttendanceData.working_days_expected || 0
-        };
+        return computeDiscipline(newAttendanceData);
       }
     } catch (computeError) {
       console.warn('Could not compute attendance data:', computeError);
     }
 
     // Fallback to default score if no attendance data available
-    return {
-      discipline_component: 8.0, // Default good score
-      office_attendance_rate: 0.0,
-      meeting_attendance_rate: 0.0,
-      office_days_present: 0,
-      working_days_expected: 0
-    };
+    return computeDiscipline(null);
   } catch (error) {
     console.error('Error calculating discipline component:', error);
-    return {
-      discipline_component: 8.0, // Default
-      office_attendance_rate: 0.0,
-      meeting_attendance_rate: 0.0,
-      office_days_present: 0,
-      working_days_expected: 0
-    };
+    return computeDiscipline(null);
   }
 }
 
@@ -308,34 +379,7 @@ export async function calculateUserMonthScore(userId, month, year) {
     const learning = await calculateLearningComponent(userId, month, year);
     const discipline = await calculateDisciplineComponent(userId, month, year);
 
-    // Average row score (accountability + output weighted mean)
-    const avgRowScore = (accountability.accountability_score * 0.5) + (output.output_score * 0.5);
-
-    // User Month Score calculation
-    // Row scores contribute up to 80 points (avgRowScore * 8)
-    // Learning contributes up to 10 points
-    // Discipline contributes up to 10 points
-    const rowPoints = avgRowScore * 8; // Up to 80 points
-    const learningPoints = learning.learning_component; // Up to 10 points
-    const disciplinePoints = discipline.discipline_component; // Up to 10 points
-
-    const userMonthScore = Math.round(rowPoints + learningPoints + disciplinePoints);
-
-    return {
-      user_month_score: clamp(userMonthScore, 0, 100),
-      breakdown: {
-        avg_row_score: parseFloat(avgRowScore.toFixed(2)),
-        row_points: parseFloat(rowPoints.toFixed(2)),
-        learning_component: learning.learning_component,
-        learning_minutes: learning.learning_minutes,
-        discipline_component: discipline.discipline_component,
-        accountability_score: accountability.accountability_score,
-        output_score: output.output_score
-      },
-      flags: {
-        needs_appraisal_delay: learning.needs_appraisal_delay
-      }
-    };
+    return combineUserMonthScore(accountability, output, learning, discipline);
   } catch (error) {
     console.error('Error calculating user month score:', error);
     return { user_month_score: 0, error: error.message };
@@ -367,4 +411,212 @@ export async function recomputeUserMonth(userId, month, year) {
     console.error('Error recomputing user month:', error);
     return { error: error.message };
   }
+}
+/**
+ * Read every row of a query, paging past the PostgREST row cap
+ */
+async function fetchAllRows(buildQuery) {
+  const rows = [];
+  for (let from = 0; ; from += PAGE_SIZE) {
+    const { data, error } = await buildQuery().range(from, from + PAGE_SIZE - 1);
+    if (error) throw error;
+    rows.push(...(data || []));
+    if (!data || data.length < PAGE_SIZE) return rows;
+  }
+}
+
+/**
+ * Run a paged query once per chunk of user ids, or once unfiltered
+ * when no ids are given
+ */
+async function fetchForUsers(userIds, buildQuery) {
+  if (!userIds) {
+    return fetchAllRows(() => buildQuery(null));
+  }
+
+  const chunks = [];
+  for (let i = 0; i < userIds.length; i += ID_CHUNK_SIZE) {
+    chunks.push(userIds.slice(i, i + ID_CHUNK_SIZE));
+  }
+  const results = await Promise.all(chunks.map(chunk => fetchAllRows(() => buildQuery(chunk))));
+  return results.flat();
+}
+
+function groupByUser(rows) {
+  const grouped = new Map();
+  rows.forEach(row => {
+    if (!grouped.has(row.user_id)) grouped.set(row.user_id, []);
+    grouped.get(row.user_id).push(row);
+  });
+  return grouped;
+}
+
+/**
+ * Load everything needed to score a month with one set-based query per table.
+ * Pass `userIds = null` (or 'all') to load everyone with mappings or rows.
+ */
+export async function loadMonthScoringData(month, year, userIds = null) {
+  const ids = userIds === 'all' || userIds == null ? null : [...new Set(userIds)];
+  if (ids && ids.length === 0) {
+    return { userIds: [], mappingsByUser: new Map(), rowsByUser: new Map(), attendanceByUser: new Map() };
+  }
+
+  const [mappings, monthlyRows, attendance] = await Promise.all([
+    fetchForUsers(ids, (chunk) => {
+      const query = supabase
+        .from('user_entity_mappings')
+        .select('user_id, expected_projects, expected_units')
+        .eq('is_active', true)
+        .order('user_id');
+      return chunk ? query.in('user_id', chunk) : query;
+    }),
+    fetchForUsers(ids, (chunk) => {
+      const query = supabase
+        .from('monthly_rows')
+        .select('id, user_id, entity_id, month, year, status, submitted_at, review_notes, kpi_json, learning_json')
+        .eq('month', month)
+        .eq('year', year)
+        .order('id');
+      return chunk ? query.in('user_id', chunk) : query;
+    }),
+    fetchForUsers(ids, (chunk) => {
+      const query = supabase
+        .from('monthly_attendance_cache')
+        .select(`user_id, ${ATTENDANCE_COLUMNS}`)
+        .eq('month', month)
+        .eq('year', year)
+        .order('user_id');
+      return chunk ? query.in('user_id', chunk) : query;
+    })
+  ]);
+
+  const mappingsByUser = groupByUser(mappings);
+  const rowsByUser = groupByUser(monthlyRows);
+  const attendanceByUser = new Map(attendance.map(row => [row.user_id, row]));
+
+  return {
+    userIds: ids || [...new Set([...mappingsByUser.keys(), ...rowsByUser.keys()])],
+    mappingsByUser,
+    rowsByUser,
+    attendanceByUser
+  };
+}
+
+/**
+ * Compute month scores for every loaded user in memory.
+ * Returns a Map of user id -> calculateUserMonthScore-shaped result.
+ */
+export function computeMonthScores({ userIds, mappingsByUser, rowsByUser, attendanceByUser }) {
+  const scores = new Map();
+
+  userIds.forEach(userId => {
+    const rows = rowsByUser.get(userId) || [];
+    const accountability = computeAccountability(
+      mappingsByUser.get(userId) || [],
+      rows.filter(row => ACCOUNTABILITY_STATUSES.includes(row.status))
+    );
+    const output = computeOutput(rows);
+    const learning = computeLearning(rows);
+    const discipline = computeDiscipline(attendanceByUser.get(userId));
+
+    scores.set(userId, combineUserMonthScore(accountability, output, learning, discipline));
+  });
+
+  return scores;
+}
+
+/**
+ * Fill attendance cache gaps before a batch run, mirroring the single-user
+ * fallback in calculateDisciplineComponent, then re-read them in one query
+ */
+async function fillMissingAttendance(data, month, year) {
+  const missing = data.userIds.filter(userId => !data.attendanceByUser.has(userId));
+  if (missing.length === 0) return;
+
+  try {
+    const { computeMonthlyAttendance } = await import('../api/attendanceApi');
+    await mapWithConcurrency(missing, ATTENDANCE_CONCURRENCY, userId => computeMonthlyAttendance(userId, year, month));
+
+    const refreshed = await fetchForUsers(missing, (chunk) => supabase
+      .from('monthly_attendance_cache')
+      .select(`user_id, ${ATTENDANCE_COLUMNS}`)
+      .eq('month', month)
+      .eq('year', year)
+      .in('user_id', chunk)
+      .order('user_id'));
+
+    refreshed.forEach(row => data.attendanceByUser.set(row.user_id, row));
+  } catch (computeError) {
+    console.warn('Could not compute attendance data:', computeError);
+  }
+}
+
+/**
+ * Recompute a whole month for many users at once (month close).
+ * Reads mappings, rows and attendance once, scores in memory, then writes
+ * computed_scores through apply_monthly_row_scores (an UPDATE ... FROM over
+ * the scored row ids, so rows deleted mid-run stay deleted) and upserts
+ * appraisal delays in bulk.
+ *
+ * @param {number} month
+ * @param {number} year
+ * @param {string[]|'all'|null} userIds - users to score, or everyone
+ * @param {Object} options
+ * @param {boolean} options.computeMissingAttendance - build missing attendance cache rows first
+ */
+export async function recomputeMonthScores(month, year, userIds = 'all', options = {}) {
+  const { computeMissingAttendance = true } = options;
+
+  try {
+    const data = await loadMonthScoringData(month, year, userIds);
+
+    if (computeMissingAttendance) {
+      await fillMissingAttendance(data, month, year);
+    }
+
+    const scores = computeMonthScores(data);
+    const computedAt = new Date().toISOString();
+
+    const scoreUpdates = [];
+    const appraisalDelays = [];
+    scores.forEach((userScores, userId) => {
+      const rowIds = (data.rowsByUser.get(userId) || []).map(row => row.id);
+      if (rowIds.length > 0) {
+        scoreUpdates.push({ row_ids: rowIds, computed_scores: userScores });
+      }
+
+      if (userScores.flags.needs_appraisal_delay) {
+        appraisalDelays.push(buildAppraisalDelay(userId, month, year, userScores.breakdown.learning_minutes));
+      }
+    });
+
+    let rowsUpdated = 0;
+    for (let i = 0; i < scoreUpdates.length; i += ID_CHUNK_SIZE) {
+      const { data: updated, error } = await supabase.rpc('apply_monthly_row_scores', {
+        p_scores: scoreUpdates.slice(i, i + ID_CHUNK_SIZE),
+        p_computed_at: computedAt
+      });
+      if (error) throw error;
+      rowsUpdated += updated || 0;
+    }
+
+    if (appraisalDelays.length > 0) {
+      const { error } = await supabase
+        .from('appraisal_delays')
+        .upsert(appraisalDelays, { onConflict: 'user_id,month,year,reason' });
+      if (error) console.error('Error recording appraisal delays:', error);
+    }
+
+    return {
+      month,
+      year,
+      scores,
+      rows_updated: rowsUpdated,
+      appraisal_delays_recorded: appraisalDelays.length,
+      computed_at: computedAt
+    };
+  } catch (error) {
+    console.error('Error recomputing month scores:', error);
+    return { error: error.message, code: error.code };
+  }
 }
\ No newline at end of file
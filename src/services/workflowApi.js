@@ -2,6 +2,13 @@
 // Draft → Submit → Approve with manager return and unlock capabilities
 
 import { supabase } from '../database/supabaseClient';
+import { mapWithConcurrency } from '../shared/utils/concurrency';
+
+// Maximum post-approval hooks in flight during a bulk approval
+const BULK_HOOK_CONCURRENCY = 5;
+
+// PostgREST/Postgres codes for an RPC that has not been deployed yet
+const isMissingFunctionError = (error) => error?.code === 'PGRST202' || error?.code === '42883';
 
 class WorkflowApi {
   // Submit a monthly row for review
@@ -476,26 +483,83 @@ class WorkflowApi {
   }
 
   // Bulk approve multiple rows (manager only)
-  async bulkApproveRows(monthlyRowIds, managerId, reviewNotes = '') {
+  // Validation, approval and auditing happen in one set-based call; per-row
+  // hooks run afterwards with bounded concurrency. Safe to retry: rows this
+  // manager already approved are reported as skipped, not as errors.
+  // Returns { results, errors, skipped, hookErrors }: a row whose hook failed
+  // is still approved, so it stays in results and is listed in hookErrors.
+  async bulkApproveRows(monthlyRowIds, managerId, reviewNotes = '', options = {}) {
     try {
+      const rowIds = [...new Set(monthlyRowIds || [])];
       const results = [];
       const errors = [];
+      const skipped = [];
+
+      if (rowIds.length === 0) {
+        return { results, errors, skipped, hookErrors: [] };
+      }
+
+      const { data, error } = await supabase.rpc('bulk_approve_monthly_rows', {
+        p_row_ids: rowIds,
+        p_manager_id: managerId,
+        p_review_notes: reviewNotes
+      });
+
+      if (error) {
+        if (!isMissingFunctionError(error)) throw error;
+        return this.bulkApproveRowsIndividually(rowIds, managerId, reviewNotes, options);
+      }
 
-      for (const rowId of monthlyRowIds) {
-        try {
-          const result = await this.approveMonthlyRow(rowId, managerId, reviewNotes);
-          results.push(result);
-        } catch (error) {
-          errors.push({ rowId, error: error.message });
+      for (const { row_id: rowId, outcome, message } of data || []) {
+        if (outcome === 'approved') {
+          results.push({ rowId, status: 'approved' });
+        } else if (outcome === 'already_approved') {
+          skipped.push({ rowId, reason: message });
+        } else {
+          errors.push({ rowId, error: message });
         }
       }
 
-      return { results, errors };
+      const hookErrors = await this.runApprovalHooks(results, options);
+      return { results, errors, skipped, hookErrors };
     } catch (error) {
       console.error('Error in bulk approve:', error);
       throw error;
     }
   }
+
+  // Fallback for databases without bulk_approve_monthly_rows
+  async bulkApproveRowsIndividually(rowIds, managerId, reviewNotes = '', options = {}) {
+    const { concurrency = BULK_HOOK_CONCURRENCY } = options;
+
+    const settled = await mapWithConcurrency(rowIds, concurrency, rowId =>
+      this.approveMonthlyRow(rowId, managerId, reviewNotes)
+    );
+
+    const results = [];
+    const errors = [];
+    settled.forEach((outcome, index) => {
+      const rowId = rowIds[index];
+      if (outcome.status === 'fulfilled') {
+        results.push({ rowId, status: 'approved' });
+      } else {
+        errors.push({ rowId, error: outcome.reason?.message || 'Approval failed' });
+      }
+    });
+
+    const hookErrors = await this.runApprovalHooks(results, options);
+    return { results, errors, skipped: [], hookErrors };
+  }
+
+  // Run onRowApproved for each approved row; returns the failures
+  async runApprovalHooks(results, { concurrency = BULK_HOOK_CONCURRENCY, onRowApproved = null } = {}) {
+    if (!onRowApproved || results.length === 0) return [];
+
+    const settled = await mapWithConcurrency(results, concurrency, result => onRowApproved(result.rowId));
+    return settled.flatMap((outcome, index) => outcome.status === 'rejected'
+      ? [{ rowId: results[index].rowId, error: outcome.reason?.message || 'Post-approval hook failed' }]
+      : []);
+  }
 }
 
 export const workflowApi = new WorkflowApi();
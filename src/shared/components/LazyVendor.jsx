@@ -0,0 +1,50 @@
+import React, { useMemo } from 'react';
+import { format, parse, startOfWeek, getDay } from 'date-fns';
+import { enUS } from 'date-fns/locale';
+import { useVendorModule } from '../hooks/useVendorModule';
+
+// Placeholder sized like the chart or calendar it stands in for
+const VendorPlaceholder = ({ error, label }) => (
+  <div className="w-full h-full min-h-[8rem] flex items-center justify-center rounded bg-gray-50">
+    {error ? (
+      <p className="text-sm text-gray-500">{label} could not be loaded. Please refresh the page.</p>
+    ) : (
+      <div className="w-full h-full min-h-[8rem] rounded bg-gray-200 animate-pulse" />
+    )}
+  </div>
+);
+
+/**
+ * Renders recharts content once the library has loaded.
+ * Children is a function that receives the recharts module:
+ *
+ *   <LazyRecharts>
+ *     {({ ResponsiveContainer, LineChart, Line }) => (...)}
+ *   </LazyRecharts>
+ */
+export const LazyRecharts = ({ children, fallback = null }) => {
+  const { module, error } = useVendorModule('recharts');
+  if (!module) return fallback || <VendorPlaceholder error={error} label="Chart" />;
+  return children(module);
+};
+
+const calendarLocales = { 'en-US': enUS };
+
+/**
+ * react-big-calendar's Calendar with a date-fns localizer, loaded on first
+ * render. Accepts the same props as Calendar, minus localizer.
+ */
+export const LazyCalendar = (props) => {
+  const { module, error } = useVendorModule('calendar');
+  const localizer = useMemo(() => module?.dateFnsLocalizer({
+    format,
+    parse,
+    startOfWeek,
+    getDay,
+    locales: calendarLocales
+  }), [module]);
+
+  if (!module) return <VendorPlaceholder error={error} label="Calendar" />;
+  const { Calendar } = module;
+  return <Calendar localizer={localizer} {...props} />;
+};
@@ -0,0 +1,234 @@
+import React, { useEffect, useMemo } from 'react';
+import { useVirtualWindow } from '../hooks/useVirtualWindow';
+import { buildOffsets, getWindow } from '../lib/virtualWindow';
+import { LoadingSpinner } from './LoadingStates';
+
+const DEFAULT_COLUMN_WIDTH = 160;
+// Grids with more columns than this only render the columns in view
+const COLUMN_WINDOW_THRESHOLD = 12;
+// Viewport width assumed until the scroll container has been measured
+const INITIAL_VIEWPORT_WIDTH = 1200;
+// Ask for the next page this many rows before the last loaded one
+const END_REACHED_THRESHOLD = 10;
+
+const toCss = (value) => (typeof value === 'number' ? `${value}px` : value);
+
+const useRowKey = (rowKey) => useMemo(
+  () => (typeof rowKey === 'function' ? rowKey : (item) => item[rowKey]),
+  [rowKey]
+);
+
+// Fires onEndReached once the rendered window gets close to the last row
+const useEndReached = ({ end, count, hasMore, loading, onEndReached }) => {
+  useEffect(() => {
+    if (onEndReached && hasMore && !loading && end >= count - END_REACHED_THRESHOLD) {
+      onEndReached();
+    }
+  }, [end, count, hasMore, loading, onEndReached]);
+};
+
+const ListStatus = ({ loading, empty, emptyMessage }) => {
+  if (loading) {
+    return (
+      <div className="flex justify-center py-4">
+        <LoadingSpinner size="small" showText text={empty ? 'Loading...' : 'Loading more...'} />
+      </div>
+    );
+  }
+  if (empty) {
+    return <div className="py-8 text-center text-sm text-gray-500">{emptyMessage}</div>;
+  }
+  return null;
+};
+
+const Spacer = ({ height, width }) => (
+  <div aria-hidden="true" style={height !== undefined ? { height } : { flex: `0 0 ${width}px` }} />
+);
+
+/**
+ * Windowed table for long and wide data sets.
+ *
+ * Only the rows in view (plus overscan) are in the DOM; row heights may vary
+ * and are measured as rows render. The header sticks to the top of the
+ * scroll area and pinned columns stick to its left edge. Grids with more
+ * than COLUMN_WINDOW_THRESHOLD columns also window their columns, which needs
+ * a width on every column.
+ *
+ * Pass onEndReached/hasMore/loading (e.g. from useCursorInfiniteList) to load
+ * the next page as the user scrolls.
+ *
+ * Columns: { key, header, width, render(row, index), className, headerClassName, pinned }
+ */
+export const VirtualTable = ({
+  columns,
+  rows,
+  rowKey = 'id',
+  estimateRowHeight = 56,
+  overscan = 6,
+  height = '70vh',
+  virtualizeColumns,
+  onEndReached,
+  hasMore = false,
+  loading = false,
+  onRowClick,
+  rowClassName,
+  emptyMessage = 'No records found',
+  className = ''
+}) => {
+  const getKey = useRowKey(rowKey);
+  const { scrollRef, virtualRows, viewport, range, paddingTop, paddingBottom } = useVirtualWindow({
+    items: rows,
+    getKey,
+    estimateSize: estimateRowHeight,
+    overscan
+  });
+
+  useEndReached({ end: range.end, count: rows.length, hasMore, loading, onEndReached });
+
+  const layout = useMemo(() => {
+    let left = 0;
+    const pinned = columns.filter(column => column.pinned).map(column => {
+      const width = column.width || DEFAULT_COLUMN_WIDTH;
+      const placed = { ...column, width, left };
+      left += width;
+      return placed;
+    });
+    const scrolling = columns
+      .filter(column => !column.pinned)
+      .map(column => ({ ...column, width: column.width || DEFAULT_COLUMN_WIDTH }));
+    const offsets = buildOffsets(scrolling.length, index => scrolling[index].width);
+    return { pinned, pinnedWidth: left, scrolling, offsets, totalWidth: left + offsets[scrolling.length] };
+  }, [columns]);
+
+  const windowColumns = virtualizeColumns ?? columns.length > COLUMN_WINDOW_THRESHOLD;
+  const columnRange = windowColumns
+    ? getWindow(
+      layout.offsets,
+      viewport.left,
+      Math.max(0, (viewport.width || INITIAL_VIEWPORT_WIDTH) - layout.pinnedWidth),
+      2
+    )
+    : { start: 0, end: layout.scrolling.length, before: 0, after: 0 };
+  const visibleColumns = layout.scrolling.slice(columnRange.start, columnRange.end);
+
+  // Windowed columns keep their exact widths so the spacers line up; otherwise
+  // columns grow to fill the table
+  const cellStyle = (column) => ({
+    flex: windowColumns ? `0 0 ${column.width}px` : `1 0 ${column.width}px`,
+    minWidth: column.width
+  });
+  const pinnedStyle = (column) => ({ ...cellStyle(column), position: 'sticky', left: column.left, zIndex: 1 });
+
+  const renderCells = (renderCell) => (
+    <>
+      {layout.pinned.map(column => renderCell(column, pinnedStyle(column), true))}
+      {columnRange.before > 0 && <Spacer width={columnRange.before} />}
+      {visibleColumns.map(column => renderCell(column, cellStyle(column), false))}
+      {columnRange.after > 0 && <Spacer width={columnRange.after} />}
+    </>
+  );
+
+  return (
+    <div
+      ref={scrollRef}
+      role="table"
+      aria-rowcount={hasMore ? -1 : rows.length + 1}
+      aria-colcount={columns.length}
+      className={`overflow-auto ${className}`}
+      style={{ maxHeight: toCss(height) }}
+    >
+      <div style={{ minWidth: layout.totalWidth }}>
+        <div role="rowgroup" className="sticky top-0 z-20 bg-gray-50 border-b border-gray-200">
+          <div role="row" className="flex">
+            {renderCells((column, style, pinned) => (
+              <div
+                key={column.key}
+                role="columnheader"
+                className={`px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider ${pinned ? 'bg-gray-50' : ''} ${column.headerClassName || ''}`}
+                style={style}
+              >
+                {column.header}
+              </div>
+            ))}
+          </div>
+        </div>
+
+        <div role="rowgroup">
+          {paddingTop > 0 && <Spacer height={paddingTop} />}
+          {virtualRows.map(({ index, key, item }) => (
+            <div
+              key={key}
+              role="row"
+              aria-rowindex={index + 2}
+              data-virtual-key={key}
+              className={`flex bg-white border-b border-gray-200 hover:bg-gray-50 ${onRowClick ? 'cursor-pointer' : ''} ${rowClassName ? rowClassName(item, index) : ''}`}
+              onClick={onRowClick ? () => onRowClick(item, index) : undefined}
+            >
+              {renderCells((column, style, pinned) => (
+                <div
+                  key={column.key}
+                  role="cell"
+                  className={`px-6 py-4 ${pinned ? 'bg-inherit' : ''} ${column.className || ''}`}
+                  style={style}
+                >
+                  {column.render ? column.render(item, index) : item[column.key]}
+                </div>
+              ))}
+            </div>
+          ))}
+          {paddingBottom > 0 && <Spacer height={paddingBottom} />}
+        </div>
+
+        <ListStatus loading={loading} empty={rows.length === 0} emptyMessage={emptyMessage} />
+      </div>
+    </div>
+  );
+};
+
+/**
+ * Windowed list for card and list layouts: the list counterpart of
+ * VirtualTable, with the same incremental loading props. Items may vary in
+ * height; space them with padding in itemClassName rather than margins, which
+ * the measurement does not include.
+ */
+export const VirtualList = ({
+  items,
+  renderItem,
+  rowKey = 'id',
+  estimateSize = 120,
+  overscan = 4,
+  height = '70vh',
+  onEndReached,
+  hasMore = false,
+  loading = false,
+  emptyMessage = 'Nothing to show',
+  className = '',
+  itemClassName = ''
+}) => {
+  const getKey = useRowKey(rowKey);
+  const { scrollRef, virtualRows, range, paddingTop, paddingBottom } = useVirtualWindow({
+    items,
+    getKey,
+    estimateSize,
+    overscan
+  });
+
+  useEndReached({ end: range.end, count: items.length, hasMore, loading, onEndReached });
+
+  return (
+    <div ref={scrollRef} className={`overflow-y-auto ${className}`} style={{ maxHeight: toCss(height) }}>
+      <div role="list">
+        {paddingTop > 0 && <Spacer height={paddingTop} />}
+        {virtualRows.map(({ index, key, item }) => (
+          <div key={key} role="listitem" data-virtual-key={key} className={itemClassName}>
+            {renderItem(item, index)}
+          </div>
+        ))}
+        {paddingBottom > 0 && <Spacer height={paddingBottom} />}
+      </div>
+      <ListStatus loading={loading} empty={items.length === 0} emptyMessage={emptyMessage} />
+    </div>
+  );
+};
+
+export default VirtualTable;
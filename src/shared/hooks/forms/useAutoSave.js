@@ -1,21 +1,58 @@
 import { useState, useEffect, useCallback, useRef } from 'react';
+import { offlineStore } from '@/shared/services/offlineStore';
+import { isEqual } from '@/shared/lib/fieldDiff';
+
+// Session-scoped drafts are namespaced by a per-tab id kept in sessionStorage
+const getTabId = () => {
+  try {
+    let id = sessionStorage.getItem('autosave_tab_id');
+    if (!id) {
+      id = Math.random().toString(36).slice(2, 10);
+      sessionStorage.setItem('autosave_tab_id', id);
+    }
+    return id;
+  } catch {
+    return 'tab';
+  }
+};
 
 /**
  * Custom hook for auto-save functionality in forms
+ * Drafts live in the offline store (IndexedDB) and a save only writes the fields that changed.
  * @param {Object} formData - The form data to auto-save
- * @param {string} storageKey - Key for localStorage/sessionStorage
+ * @param {string} storageKey - Key for the saved draft
  * @param {number} delay - Debounce delay in milliseconds (default: 1000)
- * @param {boolean} useSessionStorage - Use sessionStorage instead of localStorage (default: false)
+ * @param {boolean} useSessionStorage - Keep the draft for this tab only (default: false)
  * @returns {Object} Auto-save state and utilities
  */
 export const useAutoSave = (formData, storageKey, delay = 1000, useSessionStorage = false) => {
   const [isAutoSaving, setIsAutoSaving] = useState(false);
   const [lastAutoSave, setLastAutoSave] = useState(null);
   const [autoSaveStatus, setAutoSaveStatus] = useState('idle'); // 'idle' | 'saving' | 'saved' | 'error'
+  const [savedAt, setSavedAt] = useState(null);
   
   const timeoutRef = useRef(null);
   const previousDataRef = useRef(null);
-  const storage = useSessionStorage ? sessionStorage : localStorage;
+  const draftKey = useSessionStorage ? `autosave:${getTabId()}:${storageKey}` : `autosave:${storageKey}`;
+
+  // Pick up a draft saved earlier (moving one left in localStorage by older versions)
+  useEffect(() => {
+    let cancelled = false;
+    (async () => {
+      try {
+        const legacy = useSessionStorage ? null : localStorage.getItem(storageKey);
+        if (legacy) {
+          await offlineStore.saveDraft(draftKey, JSON.parse(legacy).data || {});
+          localStorage.removeItem(storageKey);
+        }
+        const [meta] = (await offlineStore.listDrafts(draftKey)).filter(draft => draft.key === draftKey);
+        if (!cancelled) setSavedAt(meta ? new Date(meta.updatedAt) : null);
+      } catch (error) {
+        console.error('Failed to read auto-saved data:', error);
+      }
+    })();
+    return () => { cancelled = true; };
+  }, [draftKey, storageKey, useSessionStorage]);
 
   // Save to storage
   const saveToStorage = useCallback(async (data) => {
@@ -23,16 +60,11 @@ export const useAutoSave = (formData, storageKey, delay = 1000, useSessionStorag
       setIsAutoSaving(true);
       setAutoSaveStatus('saving');
       
-      // Simulate async save (can be replaced with API call)
-      await new Promise(resolve => setTimeout(resolve, 100));
-      
-      storage.setItem(storageKey, JSON.stringify({
-        data,
-        timestamp: new Date().toISOString(),
-        version: '1.0'
-      }));
+      await offlineStore.saveDraft(draftKey, data);
       
-      setLastAutoSave(new Date());
+      const now = new Date();
+      setLastAutoSave(now);
+      setSavedAt(now);
       setAutoSaveStatus('saved');
       
       // Reset to idle after showing saved status
@@ -45,36 +77,38 @@ export const useAutoSave = (formData, storageKey, delay = 1000, useSessionStorag
     } finally {
       setIsAutoSaving(false);
     }
-  }, [storageKey, storage]);
+  }, [draftKey]);
 
   // Load from storage
-  const loadFromStorage = useCallback(() => {
+  const loadFromStorage = useCallback(async () => {
     try {
-      const saved = storage.getItem(storageKey);
-      if (saved) {
-        const parsed = JSON.parse(saved);
+      const data = await offlineStore.getDraft(draftKey);
+      if (data) {
         return {
-          data: parsed.data,
-          timestamp: parsed.timestamp,
-          version: parsed.version
+          data,
+          timestamp: savedAt ? savedAt.toISOString() : null
         };
       }
     } catch (error) {
       console.error('Failed to load auto-saved data:', error);
     }
     return null;
-  }, [storageKey, storage]);
+  }, [draftKey, savedAt]);
 
   // Clear auto-saved data
-  const clearAutoSave = useCallback(() => {
+  const clearAutoSave = useCallback(async () => {
+    if (timeoutRef.current) {
+      clearTimeout(timeoutRef.current);
+    }
     try {
-      storage.removeItem(storageKey);
+      await offlineStore.deleteDraft(draftKey);
       setLastAutoSave(null);
+      setSavedAt(null);
       setAutoSaveStatus('idle');
     } catch (error) {
       console.error('Failed to clear auto-saved data:', error);
     }
-  }, [storageKey, storage]);
+  }, [draftKey]);
 
   // Force save (bypass debounce)
   const forceSave = useCallback(() => {
@@ -87,8 +121,7 @@ export const useAutoSave = (formData, storageKey, delay = 1000, useSessionStorag
   // Auto-save effect with debouncing
   useEffect(() => {
     // Skip if data hasn't changed
-    if (previousDataRef.current && 
-        JSON.stringify(previousDataRef.current) === JSON.stringify(formData)) {
+    if (previousDataRef.current && isEqual(previousDataRef.current, formData)) {
       return;
     }
 
@@ -115,22 +148,10 @@ export const useAutoSave = (formData, storageKey, delay = 1000, useSessionStorag
   }, [formData, delay, saveToStorage]);
 
   // Check if auto-save data exists
-  const hasAutoSavedData = useCallback(() => {
-    try {
-      return !!storage.getItem(storageKey);
-    } catch {
-      return false;
-    }
-  }, [storageKey, storage]);
+  const hasAutoSavedData = useCallback(() => savedAt !== null, [savedAt]);
 
   // Get auto-save age (how old the saved data is)
-  const getAutoSaveAge = useCallback(() => {
-    const saved = loadFromStorage();
-    if (saved && saved.timestamp) {
-      return new Date() - new Date(saved.timestamp);
-    }
-    return null;
-  }, [loadFromStorage]);
+  const getAutoSaveAge = useCallback(() => (savedAt ? new Date() - savedAt : null), [savedAt]);
 
   // Format auto-save status for display
   const getStatusMessage = () => {
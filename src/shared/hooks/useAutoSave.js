@@ -1,9 +1,31 @@
 import { useCallback, useEffect, useRef, useState } from 'react';
+import { offlineStore } from '../services/offlineStore';
+
+const draftKey = (key) => `autosave:${key}`;
+
+// Data saved to localStorage by earlier versions is moved into the offline store on first load
+async function migrateLegacySave(key) {
+  let legacy = null;
+  try {
+    legacy = localStorage.getItem(key);
+  } catch {
+    return;
+  }
+  if (legacy === null) return;
+  try {
+    const { lastSaved, sessionInfo, emergencySave, ...data } = JSON.parse(legacy);
+    await offlineStore.saveDraft(draftKey(key), data);
+  } catch (error) {
+    console.error('❌ Failed to migrate saved data:', error);
+  }
+  localStorage.removeItem(key);
+}
 
 /**
- * Custom hook for auto-saving form data to localStorage
+ * Custom hook for auto-saving form data to the offline store (IndexedDB).
+ * Only the fields that changed since the previous save are written.
  * @param {Object} data - The data to auto-save
- * @param {string} key - Unique key for localStorage
+ * @param {string} key - Unique key for the saved draft
  * @param {boolean} enabled - Whether auto-save is enabled
  * @param {number} debounceMs - Debounce delay in milliseconds (default: 2000)
  * @param {Function} onSave - Optional callback when save occurs
@@ -17,6 +39,7 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
   const timeoutRef = useRef(null);
   const dataRef = useRef(data);
   const enabledRef = useRef(enabled);
+  const callbacksRef = useRef({ onSave, onError });
 
   // Update refs to avoid stale closures
   useEffect(() => {
@@ -24,6 +47,11 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
     enabledRef.current = enabled;
   }, [data, enabled]);
 
+  // Inline callbacks must not restart the debounce on every render
+  useEffect(() => {
+    callbacksRef.current = { onSave, onError };
+  }, [onSave, onError]);
+
   const saveToStorage = useCallback(async () => {
     if (!enabledRef.current || !key) {
       return false;
@@ -32,37 +60,27 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
     try {
       setIsSaving(true);
       
-      const saveData = {
-        ...dataRef.current,
-        lastSaved: new Date().toISOString(),
-        sessionInfo: {
-          userAgent: navigator.userAgent,
-          timestamp: Date.now(),
-          url: window.location.href
-        }
-      };
-
-      localStorage.setItem(key, JSON.stringify(saveData));
+      const saveData = dataRef.current;
+      await offlineStore.saveDraft(draftKey(key), saveData);
       
       setLastSaved(new Date());
       setHasUnsavedChanges(false);
       
-      if (onSave) {
-        onSave(saveData);
+      if (callbacksRef.current.onSave) {
+        callbacksRef.current.onSave(saveData);
       }
       
-      console.log('💾 Auto-save successful:', key);
       return true;
     } catch (error) {
       console.error('❌ Auto-save failed:', error);
-      if (onError) {
-        onError(error);
+      if (callbacksRef.current.onError) {
+        callbacksRef.current.onError(error);
       }
       return false;
     } finally {
       setIsSaving(false);
     }
-  }, [key, onSave, onError]);
+  }, [key]);
 
   const debouncedSave = useCallback(() => {
     if (timeoutRef.current) {
@@ -89,15 +107,15 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
   }, [data, enabled, key, debouncedSave]);
 
   // Load saved data
-  const loadSavedData = useCallback(() => {
+  const loadSavedData = useCallback(async () => {
     if (!key) return null;
 
     try {
-      const saved = localStorage.getItem(key);
+      await migrateLegacySave(key);
+      const saved = await offlineStore.getDraft(draftKey(key));
       if (saved) {
-        const parsedData = JSON.parse(saved);
         console.log('📄 Loaded saved data:', key);
-        return parsedData;
+        return saved;
       }
     } catch (error) {
       console.error('❌ Failed to load saved data:', error);
@@ -106,11 +124,11 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
   }, [key]);
 
   // Clear saved data
-  const clearSavedData = useCallback(() => {
+  const clearSavedData = useCallback(async () => {
     if (!key) return;
 
     try {
-      localStorage.removeItem(key);
+      await offlineStore.deleteDraft(draftKey(key));
       setLastSaved(null);
       setHasUnsavedChanges(false);
       console.log('🗑️ Cleared saved data:', key);
@@ -127,21 +145,12 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
     return await saveToStorage();
   }, [saveToStorage]);
 
-  // Save on page unload
+  // Save on page unload; the write is queued before the prompt and usually
+  // completes while it is shown
   useEffect(() => {
     const handleBeforeUnload = (e) => {
       if (hasUnsavedChanges && enabled && key) {
-        try {
-          const emergencyData = {
-            ...dataRef.current,
-            lastSaved: new Date().toISOString(),
-            emergencySave: true
-          };
-          localStorage.setItem(key, JSON.stringify(emergencyData));
-          console.log('💾 Emergency save on page unload');
-        } catch (error) {
-          console.error('❌ Emergency save failed:', error);
-        }
+        saveToStorage();
 
         e.preventDefault();
         e.returnValue = 'You have unsaved changes. Are you sure you want to leave?';
@@ -151,7 +160,7 @@ export function useAutoSave(data, key, enabled = true, debounceMs = 2000, onSave
 
     window.addEventListener('beforeunload', handleBeforeUnload);
     return () => window.removeEventListener('beforeunload', handleBeforeUnload);
-  }, [hasUnsavedChanges, enabled, key]);
+  }, [hasUnsavedChanges, enabled, key, saveToStorage]);
 
   return {
     lastSaved,
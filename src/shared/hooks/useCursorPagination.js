@@ -0,0 +1,168 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+
+/**
+ * Custom hook for keyset (cursor) pagination over the list query contract
+ * @param {Function} fetchPage - (after) => Promise<{ data, page }>; page carries next_cursor/total
+ * @param {Array} deps - values that define the query (filters, search, sort); a change restarts at page 1
+ * @param {boolean} enabled - Whether fetching is enabled
+ * @returns {Object} Current page rows and navigation helpers
+ */
+export function useCursorPagination(fetchPage, deps = [], enabled = true) {
+  const [rows, setRows] = useState([]);
+  const [page, setPage] = useState(null);
+  const [pageIndex, setPageIndex] = useState(0);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState(null);
+
+  // cursors[i] is the `after` value that loads page i
+  const cursorsRef = useRef([null]);
+  const fetchRef = useRef(fetchPage);
+  const requestRef = useRef(0);
+
+  useEffect(() => {
+    fetchRef.current = fetchPage;
+  }, [fetchPage]);
+
+  const load = useCallback(async (index) => {
+    const requestId = ++requestRef.current;
+    setLoading(true);
+    setError(null);
+
+    try {
+      const result = await fetchRef.current(cursorsRef.current[index] ?? null);
+      // Ignore responses that were superseded by a newer request
+      if (requestId !== requestRef.current) return;
+
+      cursorsRef.current[index + 1] = result.page?.next_cursor ?? null;
+      setRows(result.data || []);
+      setPage(result.page || null);
+      setPageIndex(index);
+    } catch (err) {
+      if (requestId !== requestRef.current) return;
+      console.error('❌ Page fetch failed:', err);
+      setError(err);
+    } finally {
+      if (requestId === requestRef.current) setLoading(false);
+    }
+  }, []);
+
+  useEffect(() => {
+    if (!enabled) return;
+    cursorsRef.current = [null];
+    load(0);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [enabled, load, ...deps]);
+
+  const hasNext = Boolean(page?.has_more);
+  const hasPrev = pageIndex > 0;
+
+  const nextPage = useCallback(() => {
+    if (hasNext) load(pageIndex + 1);
+  }, [hasNext, load, pageIndex]);
+
+  const prevPage = useCallback(() => {
+    if (pageIndex > 0) load(pageIndex - 1);
+  }, [load, pageIndex]);
+
+  const reload = useCallback(() => load(pageIndex), [load, pageIndex]);
+
+  return {
+    rows,
+    total: page?.total ?? null,
+    limit: page?.limit ?? null,
+    pageIndex,
+    hasNext,
+    hasPrev,
+    nextPage,
+    prevPage,
+    reload,
+    loading,
+    error
+  };
+}
+
+/**
+ * Custom hook for incremental (infinite scroll) loading over the list query contract
+ * @param {Function} fetchPage - (after) => Promise<{ data, page }>; page carries next_cursor/total
+ * @param {Array} deps - values that define the query (filters, search, sort); a change starts over
+ * @param {boolean} enabled - Whether fetching is enabled
+ * @returns {Object} Rows loaded so far and loadMore/reload helpers
+ */
+export function useCursorInfiniteList(fetchPage, deps = [], enabled = true) {
+  const [rows, setRows] = useState([]);
+  const [page, setPage] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState(null);
+
+  const fetchRef = useRef(fetchPage);
+  const requestRef = useRef(0);
+  const cursorRef = useRef(null);
+  const rowsRef = useRef([]);
+  const inFlightRef = useRef(false);
+
+  useEffect(() => {
+    fetchRef.current = fetchPage;
+  }, [fetchPage]);
+
+  // Loads one page after the current cursor, or with `fill` restarts from the
+  // first page and keeps loading until that many rows are back
+  const load = useCallback(async ({ reset = false, fill = 0 } = {}) => {
+    const requestId = ++requestRef.current;
+    inFlightRef.current = true;
+    setLoading(true);
+    setError(null);
+
+    try {
+      let loaded = reset ? [] : rowsRef.current;
+      let cursor = reset ? null : cursorRef.current;
+      let result;
+      do {
+        result = await fetchRef.current(cursor);
+        if (requestId !== requestRef.current) return;
+        loaded = loaded.concat(result.data || []);
+        cursor = result.page?.next_cursor ?? null;
+      } while (result.page?.has_more && loaded.length < fill);
+
+      cursorRef.current = cursor;
+      rowsRef.current = loaded;
+      setRows(loaded);
+      setPage(result.page || null);
+    } catch (err) {
+      if (requestId !== requestRef.current) return;
+      console.error('❌ Page fetch failed:', err);
+      setError(err);
+    } finally {
+      if (requestId === requestRef.current) {
+        inFlightRef.current = false;
+        setLoading(false);
+      }
+    }
+  }, []);
+
+  useEffect(() => {
+    if (!enabled) return;
+    load({ reset: true });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [enabled, load, ...deps]);
+
+  const hasMore = Boolean(page?.has_more);
+
+  const loadMore = useCallback(() => {
+    if (hasMore && !inFlightRef.current) load();
+  }, [hasMore, load]);
+
+  // Refresh in place: reload as many rows as are currently shown
+  const reload = useCallback(() => load({ reset: true, fill: rowsRef.current.length }), [load]);
+
+  return {
+    rows,
+    total: page?.total ?? null,
+    hasMore,
+    loadMore,
+    reload,
+    loading,
+    error
+  };
+}
+
+export default useCursorPagination;
@@ -0,0 +1,58 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { realtimeHub } from '../services/realtimeHub';
+
+/**
+ * Custom hook for directory summary figures computed by a Postgres function.
+ * The figures are refetched when the source table changes; onChange runs on
+ * the same events so the page can reload its visible rows.
+ * @param {Object} supabase - Supabase client; without one the hook stays idle
+ * @param {string} rpcName - aggregate function returning a JSON object
+ * @param {Object} options
+ * @param {string} options.table - table whose changes invalidate the figures
+ * @param {Function} options.onChange - called after each batch of table changes
+ * @returns {Object} stats (null until loaded), loading, error and reload
+ */
+export function useDirectoryStats(supabase, rpcName, { table, onChange } = {}) {
+  const [stats, setStats] = useState(null);
+  const [loading, setLoading] = useState(Boolean(supabase));
+  const [error, setError] = useState(null);
+  const onChangeRef = useRef(onChange);
+  const requestRef = useRef(0);
+
+  useEffect(() => {
+    onChangeRef.current = onChange;
+  }, [onChange]);
+
+  const reload = useCallback(async () => {
+    if (!supabase) return;
+    const requestId = ++requestRef.current;
+    setLoading(true);
+
+    const { data, error: rpcError } = await supabase.rpc(rpcName);
+    if (requestId !== requestRef.current) return;
+    if (rpcError) {
+      console.error(`❌ ${rpcName} failed:`, rpcError);
+      setError(rpcError);
+    } else {
+      setStats(data || null);
+      setError(null);
+    }
+    setLoading(false);
+  }, [supabase, rpcName]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  useEffect(() => {
+    if (!supabase || !table) return undefined;
+    return realtimeHub.subscribe(supabase, { table }, () => {
+      reload();
+      onChangeRef.current?.();
+    });
+  }, [supabase, table, reload]);
+
+  return { stats, loading, error, reload };
+}
+
+export default useDirectoryStats;
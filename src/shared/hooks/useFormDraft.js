@@ -0,0 +1,111 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { FormDraftStore } from '../services/formDraftStore';
+
+/**
+ * Custom hook that keeps a form's draft in a FormDraftStore: only changed
+ * fields are saved (locally and as server PATCHes), rapid edits are
+ * coalesced, and edits made in other tabs are merged into the form.
+ * @param {Object} options
+ * @param {string} options.formId - draft identity
+ * @param {string} options.owner - whose draft it is
+ * @param {Object} options.data - current form model
+ * @param {Function} options.setData - receives the restored or merged model
+ * @param {Function} options.onRestore - optional, called with a restored draft
+ * @param {boolean} options.enabled - whether changes are saved
+ * @param {number} options.delay - quiet period before a save
+ * @param {string[]} options.localOnlyFields - fields kept out of server saves
+ * @param {Object|null} options.transport - server transport (null keeps the draft local)
+ * @returns {Object} Draft status and actions
+ */
+export function useFormDraft({
+  formId,
+  owner = 'anonymous',
+  data,
+  setData,
+  onRestore,
+  enabled = true,
+  delay,
+  localOnlyFields,
+  transport
+}) {
+  const [state, setState] = useState({ status: 'idle', lastSaved: null, dirtyFields: [], conflicts: [] });
+  const [ready, setReady] = useState(false);
+  const storeRef = useRef(null);
+  const callbacksRef = useRef({ setData, onRestore });
+  callbacksRef.current = { setData, onRestore };
+
+  useEffect(() => {
+    if (!formId) return undefined;
+    const store = new FormDraftStore({
+      formId,
+      owner,
+      delay,
+      ...(localOnlyFields ? { localOnlyFields } : {}),
+      ...(transport !== undefined ? { transport } : {})
+    });
+    storeRef.current = store;
+    setReady(false);
+
+    const unsubscribe = store.subscribe(({ type, payload }) => {
+      if (type === 'remote') {
+        callbacksRef.current.setData(payload.model);
+      } else {
+        setState(store.getState());
+      }
+    });
+
+    let cancelled = false;
+    store.load()
+      .then(model => {
+        if (cancelled || !model) return;
+        callbacksRef.current.setData(model);
+        if (callbacksRef.current.onRestore) callbacksRef.current.onRestore(model);
+      })
+      .catch(error => console.error('Draft restore failed:', error))
+      .finally(() => {
+        if (!cancelled) setReady(true);
+      });
+
+    // Pending edits are written before the page goes away
+    const flushOnHide = () => {
+      if (document.visibilityState === 'hidden') store.flush();
+    };
+    document.addEventListener('visibilitychange', flushOnHide);
+    window.addEventListener('pagehide', flushOnHide);
+
+    return () => {
+      cancelled = true;
+      document.removeEventListener('visibilitychange', flushOnHide);
+      window.removeEventListener('pagehide', flushOnHide);
+      unsubscribe();
+      store.flush().finally(() => store.close());
+      storeRef.current = null;
+    };
+    // localOnlyFields and transport are read when the store is created
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [formId, owner, delay]);
+
+  // Edits only count once the saved draft has been restored, so the blank
+  // initial form never overwrites it
+  useEffect(() => {
+    if (ready && enabled && data && storeRef.current) {
+      storeRef.current.update(data);
+    }
+  }, [data, ready, enabled]);
+
+  const flush = useCallback(() => (storeRef.current ? storeRef.current.flush() : Promise.resolve()), []);
+  const clear = useCallback(() => (storeRef.current ? storeRef.current.clear() : Promise.resolve()), []);
+  const dismissConflicts = useCallback(() => storeRef.current?.clearConflicts(), []);
+
+  return {
+    ...state,
+    isSaving: state.status === 'saving',
+    hasSavedDraft: !!state.lastSaved,
+    ready,
+    flush,
+    clear,
+    dismissConflicts
+  };
+}
+
+export default useFormDraft;
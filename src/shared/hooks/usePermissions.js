@@ -0,0 +1,40 @@
+import { useCallback, useEffect, useSyncExternalStore } from 'react';
+import { permissionEngine } from '../services/permissionEngine';
+
+/**
+ * Custom hook for synchronous permission checks against the shared
+ * permission engine. The first caller with a role triggers the load of
+ * role_permissions; components re-render only when the compiled table
+ * changes (a load, a realtime update or an edited role).
+ * @param {string} role - role to check; defaults can be passed per call
+ * @returns {Object} can(resource, action, role?), canAny, ready and version
+ */
+export function usePermissions(role) {
+  const version = useSyncExternalStore(permissionEngine.subscribe, permissionEngine.getVersion);
+
+  // Loads once per session: repeat calls share the first load until reset()
+  useEffect(() => {
+    if (role) permissionEngine.load();
+  }, [role]);
+
+  // Recreated per table version so memoized children see permission changes
+  const can = useCallback(
+    (resource, action, checkRole = role) => permissionEngine.can(checkRole, resource, action),
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [role, version]
+  );
+  const canAny = useCallback(
+    (resources, action, checkRole = role) => permissionEngine.canAny(checkRole, resources, action),
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [role, version]
+  );
+
+  return {
+    can,
+    canAny,
+    ready: permissionEngine.isReady(),
+    version
+  };
+}
+
+export default usePermissions;
@@ -0,0 +1,35 @@
+import { useEffect, useState } from 'react';
+import { getLoadedVendor, loadVendor } from '../lib/vendorLoaders';
+
+/**
+ * Custom hook that loads a vendor library on first render
+ * @param {string} name - vendor name from vendorLoaders (e.g. 'recharts')
+ * @param {boolean} enabled - Whether to start loading
+ * @returns {Object} { module, error } - module is null until loaded
+ */
+export function useVendorModule(name, enabled = true) {
+  const [module, setModule] = useState(() => getLoadedVendor(name));
+  const [error, setError] = useState(null);
+
+  useEffect(() => {
+    if (!enabled || module) return undefined;
+
+    let active = true;
+    loadVendor(name)
+      .then(loadedModule => {
+        if (active) setModule(loadedModule);
+      })
+      .catch(err => {
+        console.error(`Failed to load ${name}:`, err);
+        if (active) setError(err);
+      });
+
+    return () => {
+      active = false;
+    };
+  }, [name, enabled, module]);
+
+  return { module, error };
+}
+
+export default useVendorModule;
@@ -0,0 +1,138 @@
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
+import { buildOffsets, getWindow } from '../lib/virtualWindow';
+
+// Viewport height assumed until the scroll container has been measured
+const INITIAL_VIEWPORT = 800;
+
+/**
+ * Custom hook for rendering only the rows of a long list that are in view
+ *
+ * Rows start at estimateSize and are measured with a ResizeObserver once
+ * rendered, so variable row heights are supported. Sizes are keyed by row
+ * key, which keeps them valid when rows are appended or reordered. Rendered
+ * rows must carry data-virtual-key={key} to be measured.
+ *
+ * @param {Object} options
+ * @param {Array} options.items - rows to lay out
+ * @param {Function} options.getKey - (item, index) => stable key
+ * @param {number} options.estimateSize - px used for rows not yet measured
+ * @param {number} options.overscan - rows rendered beyond each edge of the viewport
+ * @returns {Object} scrollRef for the scroll container, the visible rows and spacer sizes
+ */
+export function useVirtualWindow({ items, getKey, estimateSize = 48, overscan = 6 }) {
+  const scrollRef = useRef(null);
+  const sizesRef = useRef(new Map());
+  const observerRef = useRef(null);
+  const observedRef = useRef(new Set());
+  const [measureVersion, setMeasureVersion] = useState(0);
+  const [viewport, setViewport] = useState({ top: 0, left: 0, height: 0, width: 0 });
+
+  const keyOf = useCallback((item, index) => (getKey ? getKey(item, index) : index), [getKey]);
+
+  // Scroll position and container size, read at most once per frame
+  useEffect(() => {
+    const element = scrollRef.current;
+    if (!element) return undefined;
+
+    let frame = null;
+    const read = () => {
+      frame = null;
+      setViewport({
+        top: element.scrollTop,
+        left: element.scrollLeft,
+        height: element.clientHeight,
+        width: element.clientWidth
+      });
+    };
+    const schedule = () => {
+      if (frame === null) frame = requestAnimationFrame(read);
+    };
+
+    read();
+    element.addEventListener('scroll', schedule, { passive: true });
+    const resizeObserver = typeof ResizeObserver !== 'undefined' ? new ResizeObserver(schedule) : null;
+    resizeObserver?.observe(element);
+
+    return () => {
+      element.removeEventListener('scroll', schedule);
+      resizeObserver?.disconnect();
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
+  }, []);
+
+  // Row measurement: one observer for every rendered row, created before the
+  // layout effect below observes the first rows
+  useLayoutEffect(() => {
+    if (typeof ResizeObserver === 'undefined') return undefined;
+
+    const observer = new ResizeObserver(entries => {
+      let changed = false;
+      entries.forEach(entry => {
+        const key = entry.target.dataset.virtualKey;
+        if (key === undefined) return;
+        const size = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.getBoundingClientRect().height;
+        if (Math.abs((sizesRef.current.get(key) ?? -1) - size) > 0.5) {
+          sizesRef.current.set(key, size);
+          changed = true;
+        }
+      });
+      if (changed) setMeasureVersion(version => version + 1);
+    });
+    observerRef.current = observer;
+
+    return () => {
+      observer.disconnect();
+      observerRef.current = null;
+      observedRef.current = new Set();
+    };
+  }, []);
+
+  // Observe rows that mounted since the last render and drop the ones that left
+  useLayoutEffect(() => {
+    const container = scrollRef.current;
+    const observer = observerRef.current;
+    if (!container || !observer) return;
+
+    const current = new Set(container.querySelectorAll('[data-virtual-key]'));
+    observedRef.current.forEach(node => {
+      if (!current.has(node)) observer.unobserve(node);
+    });
+    current.forEach(node => {
+      if (!observedRef.current.has(node)) observer.observe(node);
+    });
+    observedRef.current = current;
+  });
+
+  const offsets = useMemo(
+    () => buildOffsets(items.length, index => sizesRef.current.get(String(keyOf(items[index], index))) ?? estimateSize),
+    // measureVersion invalidates the offsets when a row's measured size changes
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [items, keyOf, estimateSize, measureVersion]
+  );
+
+  const range = getWindow(offsets, viewport.top, viewport.height || INITIAL_VIEWPORT, overscan);
+
+  const virtualRows = [];
+  for (let index = range.start; index < range.end; index++) {
+    virtualRows.push({ index, key: keyOf(items[index], index), item: items[index] });
+  }
+
+  const scrollToIndex = useCallback((index) => {
+    const element = scrollRef.current;
+    if (!element || index < 0 || index >= offsets.length - 1) return;
+    element.scrollTop = offsets[index];
+  }, [offsets]);
+
+  return {
+    scrollRef,
+    virtualRows,
+    viewport,
+    range,
+    paddingTop: range.before,
+    paddingBottom: range.after,
+    totalSize: offsets[offsets.length - 1],
+    scrollToIndex
+  };
+}
+
+export default useVirtualWindow;
@@ -0,0 +1,75 @@
+import { describe, it, expect } from 'vitest';
+import {
+  applyChangeEvents,
+  byColumn,
+  createTableStore,
+  patchRow,
+  replaceRows,
+  snapshotRows,
+  upsertRows
+} from '../deltaStore';
+
+const createStore = () => createTableStore({ compare: byColumn('name') });
+
+describe('deltaStore', () => {
+  it('tracks the high-water mark across upserts', () => {
+    const store = createStore();
+    upsertRows(store, [
+      { id: 1, name: 'b', updated_at: '2024-01-02T00:00:00+00:00' },
+      { id: 2, name: 'a', updated_at: '2024-01-03T00:00:00+00:00' }
+    ]);
+
+    expect(store.highWater).toBe('2024-01-03T00:00:00+00:00');
+    expect(snapshotRows(store).map(row => row.id)).toEqual([2, 1]);
+  });
+
+  it('falls back to created_at for rows without updated_at', () => {
+    const store = createStore();
+    upsertRows(store, [
+      { id: 1, name: 'a', updated_at: '2024-01-02T00:00:00+00:00', created_at: '2024-01-01T00:00:00+00:00' },
+      { id: 2, name: 'b', updated_at: null, created_at: '2024-01-05T00:00:00+00:00' }
+    ]);
+
+    expect(store.highWater).toBe('2024-01-05T00:00:00+00:00');
+  });
+
+  it('skips rows whose updated_at did not move', () => {
+    const store = createStore();
+    const row = { id: 1, name: 'a', updated_at: '2024-01-01T00:00:00+00:00' };
+    upsertRows(store, [row]);
+    const snapshot = snapshotRows(store);
+
+    expect(upsertRows(store, [{ ...row }])).toBe(0);
+    expect(snapshotRows(store)).toBe(snapshot);
+  });
+
+  it('drops rows missing from a full reload', () => {
+    const store = createStore();
+    upsertRows(store, [{ id: 1, name: 'a' }, { id: 2, name: 'b' }]);
+    replaceRows(store, [{ id: 2, name: 'b' }]);
+
+    expect(snapshotRows(store).map(row => row.id)).toEqual([2]);
+  });
+
+  it('applies realtime inserts, updates and deletes', () => {
+    const store = createStore();
+    upsertRows(store, [{ id: 1, name: 'a', updated_at: '1' }]);
+    applyChangeEvents(store, [
+      { eventType: 'INSERT', new: { id: 2, name: 'c', updated_at: '2' } },
+      { eventType: 'UPDATE', new: { id: 1, name: 'd', updated_at: '3' } },
+      { eventType: 'DELETE', old: { id: 2 } }
+    ]);
+
+    expect(snapshotRows(store)).toEqual([{ id: 1, name: 'd', updated_at: '3' }]);
+    expect(store.highWater).toBe('3');
+  });
+
+  it('patches a row with local edits', () => {
+    const store = createStore();
+    upsertRows(store, [{ id: 1, name: 'a', status: 'draft' }]);
+
+    expect(patchRow(store, 1, { status: 'approved' })).toBe(true);
+    expect(snapshotRows(store)[0].status).toBe('approved');
+    expect(patchRow(store, 9, {})).toBe(false);
+  });
+});
@@ -0,0 +1,28 @@
+import { describe, it, expect } from 'vitest';
+import { isEqual, diffFields, applyFieldDiff, isEmptyDiff } from '../fieldDiff';
+
+describe('fieldDiff', () => {
+  it('compares form values structurally', () => {
+    expect(isEqual({ a: [1, { b: 'x' }] }, { a: [1, { b: 'x' }] })).toBe(true);
+    expect(isEqual({ a: [1, 2] }, { a: [2, 1] })).toBe(false);
+    expect(isEqual(new Date(5), new Date(5))).toBe(true);
+    expect(isEqual(new Date(5), 5)).toBe(false);
+    expect(isEqual({ a: 1 }, { a: 1, b: undefined })).toBe(false);
+    expect(isEqual(null, {})).toBe(false);
+  });
+
+  it('lists changed and removed top-level fields', () => {
+    const previous = { name: 'Acme', services: ['SEO'], notes: 'old', budget: 10 };
+    const next = { name: 'Acme', services: ['SEO', 'Ads'], budget: undefined, phone: '98' };
+
+    const diff = diffFields(previous, next);
+    expect(diff.changed).toEqual({ services: ['SEO', 'Ads'], phone: '98' });
+    expect(diff.removed.sort()).toEqual(['budget', 'notes']);
+    expect(applyFieldDiff(previous, diff)).toEqual({ name: 'Acme', services: ['SEO', 'Ads'], phone: '98' });
+  });
+
+  it('reports no changes for equal models', () => {
+    expect(isEmptyDiff(diffFields({ a: { b: 1 } }, { a: { b: 1 } }))).toBe(true);
+    expect(diffFields(null, { a: 1 }).changed).toEqual({ a: 1 });
+  });
+});
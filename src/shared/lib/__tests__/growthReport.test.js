@@ -0,0 +1,112 @@
+import { describe, it, expect, vi } from 'vitest';
+import {
+  getPeriodMonths,
+  getPeriodStart,
+  computeDataVersion,
+  buildGrowthReport,
+  getOrBuildGrowthReport
+} from '../growthReport';
+
+const now = new Date(2026, 9, 16);
+const user = { user_id: 'u1', name: 'Asha', role: 'Employee' };
+
+// Newest first, as loaded
+const kpiRows = [
+  { id: 'k3', created_at: '2026-10-02T00:00:00Z', client_satisfaction: 90, attendance: 90, punctuality_score: 90, team_collaboration: 90, initiative_score: 90, productivity_score: 60 },
+  { id: 'k2', created_at: '2026-09-02T00:00:00Z', client_satisfaction: 80, attendance: 80, punctuality_score: 80, team_collaboration: 80, initiative_score: 80, productivity_score: 70 },
+  { id: 'k1', created_at: '2026-08-02T00:00:00Z', client_satisfaction: 70, attendance: 70, punctuality_score: 70, team_collaboration: 70, initiative_score: 70, productivity_score: 80 }
+];
+const submissions = [{ id: 's1', created_at: '2026-09-20T00:00:00Z' }];
+
+describe('period helpers', () => {
+  it('lists months newest first and starts at the oldest month', () => {
+    expect(getPeriodMonths('3months', now)).toEqual(['2026-10', '2026-09', '2026-08']);
+    expect(new Date(getPeriodStart('3months', now)).getMonth()).toBe(7);
+  });
+
+  it('changes the data version when rows change', () => {
+    const start = getPeriodStart('3months', now);
+    const base = computeDataVersion(kpiRows, submissions, start);
+    expect(computeDataVersion(kpiRows, submissions, start)).toBe(base);
+    expect(computeDataVersion(kpiRows.slice(1), submissions, start)).not.toBe(base);
+    expect(computeDataVersion(kpiRows, [{ ...submissions[0], updated_at: '2026-10-10' }], start)).not.toBe(base);
+  });
+});
+
+describe('buildGrowthReport', () => {
+  const report = buildGrowthReport({ user, period: '3months', kpiRows, submissions });
+
+  it('summarizes scores', () => {
+    expect(report.summary).toMatchObject({
+      currentScore: 85,
+      previousScore: 78,
+      improvement: 6.7,
+      averageScore: 78,
+      bestScore: 85,
+      totalDataPoints: 3
+    });
+  });
+
+  it('fits linear trends over the period', () => {
+    expect(report.trends.attendance).toMatchObject({ direction: 'upward', slope: 10, current: 90, previous: 80 });
+    expect(report.trends.productivity_score.direction).toBe('downward');
+    expect(report.insights).toContainEqual(expect.objectContaining({ type: 'warning' }));
+  });
+
+  it('marks months with submissions and orders the breakdown newest first', () => {
+    expect(report.monthlyBreakdown.map(m => [m.month, m.hasSubmission])).toEqual([
+      ['2026-10', false],
+      ['2026-09', true],
+      ['2026-08', false]
+    ]);
+  });
+
+  it('tracks goals against the latest KPI row', () => {
+    expect(report.goalTracking.attendance).toEqual({ current: 90, target: 90, progress: 100, achieved: true });
+  });
+
+  it('returns an empty report without KPI data', () => {
+    const empty = buildGrowthReport({ user, period: '3months' });
+    expect(empty.summary).toBeNull();
+    expect(empty.monthlyBreakdown).toEqual([]);
+  });
+});
+
+// Minimal chainable stand-in for the Supabase query builder
+const createClient = (tables) => {
+  const inserts = [];
+  const from = (table) => {
+    const query = {
+      select: () => query,
+      eq: () => query,
+      gte: () => query,
+      order: () => query,
+      limit: () => query,
+      maybeSingle: async () => ({ data: tables[table] ?? null, error: null }),
+      insert: async (row) => { inserts.push(row); return { error: null }; },
+      then: (resolve) => resolve({ data: tables[table] ?? [], error: null })
+    };
+    return query;
+  };
+  return { from: vi.fn(from), inserts };
+};
+
+describe('getOrBuildGrowthReport', () => {
+  it('builds and stores the report on a cache miss', async () => {
+    const client = createClient({ employee_kpis: kpiRows, submissions, growth_reports: null });
+    const result = await getOrBuildGrowthReport(client, { user, period: '3months', generatedBy: 'm1', now });
+
+    expect(result.cached).toBe(false);
+    expect(client.inserts).toHaveLength(1);
+    expect(client.inserts[0]).toMatchObject({ user_id: 'u1', period: '3months', data_version: result.dataVersion });
+  });
+
+  it('returns the stored report for an unchanged data version', async () => {
+    const stored = { summary: { currentScore: 1 } };
+    const client = createClient({ employee_kpis: kpiRows, submissions, growth_reports: { report_data: stored } });
+    const result = await getOrBuildGrowthReport(client, { user, period: '3months', generatedBy: 'm1', now });
+
+    expect(result).toMatchObject({ cached: true, report: stored });
+    expect(client.inserts).toHaveLength(0);
+  });
+});
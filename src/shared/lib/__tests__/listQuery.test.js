@@ -0,0 +1,103 @@
+import { describe, it, expect } from 'vitest';
+import {
+  parseListQuery,
+  applyListQueryToRows,
+  buildListQueryString,
+  hasListParams,
+  encodeCursor,
+  decodeCursor,
+  ListQueryError
+} from '../listQuery';
+
+const spec = {
+  fields: ['id', 'name', 'status', 'created_at'],
+  searchColumns: ['name'],
+  defaultSort: 'name'
+};
+
+const rows = [
+  { id: '1', name: 'Alpha', status: 'active', created_at: '2024-03-01' },
+  { id: '2', name: 'Beta', status: 'paused', created_at: null },
+  { id: '3', name: 'Gamma', status: 'active', created_at: '2024-01-01' },
+  { id: '4', name: 'Delta', status: 'active', created_at: '2024-03-01' }
+];
+
+describe('parseListQuery', () => {
+  it('reads nested and flat filter params', () => {
+    const nested = parseListQuery({ filter: { status: 'active', created_at: { gte: '2024-01-01' } } }, spec);
+    const flat = parseListQuery({ 'filter[status]': 'active', 'filter[created_at][gte]': '2024-01-01' }, spec);
+
+    expect(nested.filters).toEqual(flat.filters);
+    expect(nested.filters).toEqual([
+      { column: 'status', op: 'eq', value: 'active' },
+      { column: 'created_at', op: 'gte', value: '2024-01-01' }
+    ]);
+  });
+
+  it('rejects unknown fields, filters and sort columns', () => {
+    expect(() => parseListQuery({ fields: 'password_hash' }, spec)).toThrow(ListQueryError);
+    expect(() => parseListQuery({ filter: { password_hash: 'x' } }, spec)).toThrow(ListQueryError);
+    expect(() => parseListQuery({ sort: '-password_hash' }, spec)).toThrow(ListQueryError);
+  });
+
+  it('clamps the page size', () => {
+    expect(parseListQuery({ limit: '5000' }, { ...spec, maxLimit: 100 }).limit).toBe(100);
+    expect(parseListQuery({ limit: '-5' }, spec).limit).toBe(1);
+  });
+});
+
+describe('applyListQueryToRows', () => {
+  it('walks every matching row exactly once across pages', () => {
+    const seen = [];
+    let after;
+    do {
+      const page = applyListQueryToRows(rows, parseListQuery({ sort: '-created_at', limit: '2', after }, spec));
+      seen.push(...page.data.map(row => row.id));
+      after = page.page.next_cursor;
+    } while (after);
+
+    // Descending with nulls last, ties broken by id
+    expect(seen).toEqual(['1', '4', '3', '2']);
+  });
+
+  it('filters, searches and projects', () => {
+    const page = applyListQueryToRows(rows, parseListQuery({
+      fields: 'name',
+      filter: { status: 'active' },
+      q: 'a',
+      count: 'true'
+    }, spec));
+
+    expect(page.page.total).toBe(3);
+    expect(page.data[0]).toEqual({ id: '1', name: 'Alpha' });
+  });
+
+  it('compares eq and neq case-sensitively, as PostgREST does', () => {
+    const exact = applyListQueryToRows(rows, parseListQuery({ filter: { status: 'active' }, count: 'true' }, spec));
+    const wrongCase = applyListQueryToRows(rows, parseListQuery({ filter: { status: 'Active' }, count: 'true' }, spec));
+    const excluded = applyListQueryToRows(rows, parseListQuery({ filter: { status: { neq: 'Paused' } }, count: 'true' }, spec));
+
+    expect(exact.page.total).toBe(3);
+    expect(wrongCase.page.total).toBe(0);
+    expect(excluded.page.total).toBe(4);
+  });
+});
+
+describe('cursor helpers', () => {
+  it('round-trips sort value and key', () => {
+    const cursor = encodeCursor({ id: 'abc', name: 'Zoë, Ltd.' }, { column: 'name' });
+    expect(decodeCursor(cursor)).toEqual({ value: 'Zoë, Ltd.', id: 'abc' });
+  });
+
+  it('rejects tampered cursors', () => {
+    expect(() => decodeCursor('not-a-cursor')).toThrow(ListQueryError);
+  });
+});
+
+describe('buildListQueryString', () => {
+  it('skips empty and "all" filters', () => {
+    const query = buildListQueryString({ filter: { department: 'all', status: 'active' }, limit: 12 });
+    expect(hasListParams(Object.fromEntries(new URLSearchParams(query)))).toBe(true);
+    expect(decodeURIComponent(query)).toBe('filter[status]=active&limit=12');
+  });
+});
@@ -0,0 +1,49 @@
+import { describe, it, expect } from 'vitest';
+import { compilePermissionTable, grantsToRows } from '../permissionTable';
+
+describe('compilePermissionTable', () => {
+  const table = compilePermissionTable([
+    { role: 'SEO', resource: 'seo_reports', action: 'read', allowed: true },
+    { role: 'SEO', resource: 'seo_reports', action: 'update', allowed: true },
+    { role: 'SEO', resource: 'clients', action: 'read' },
+    { role: 'Super Admin', resource: 'all_resources', action: 'delete', allowed: true },
+    { role: 'Super Admin', resource: 'audit_logs', action: 'delete', allowed: false }
+  ]);
+
+  it('answers resource + action checks per role', () => {
+    expect(table.can('SEO', 'seo_reports', 'update')).toBe(true);
+    expect(table.can('SEO', 'seo_reports', 'delete')).toBe(false);
+    expect(table.can('SEO', 'employees', 'read')).toBe(false);
+    expect(table.can('Intern', 'clients', 'read')).toBe(false);
+    expect(table.can('SEO', 'clients', 'unknown')).toBe(false);
+  });
+
+  it('applies wildcard grants and lets explicit denies win', () => {
+    expect(table.can('Super Admin', 'employees', 'delete')).toBe(true);
+    expect(table.can('Super Admin', 'audit_logs', 'delete')).toBe(false);
+    expect(table.can('Super Admin', 'employees', 'read')).toBe(false);
+  });
+
+  it('does not grant rows whose allowed is null', () => {
+    const nulls = compilePermissionTable([
+      { role: 'SEO', resource: 'clients', action: 'delete', allowed: null },
+      { role: 'SEO', resource: 'all', action: 'export', allowed: null },
+      { role: 'SEO', resource: 'clients', action: 'read', allowed: true },
+      { role: 'SEO', resource: 'clients', action: 'read', allowed: null }
+    ]);
+    expect(nulls.can('SEO', 'clients', 'delete')).toBe(false);
+    expect(nulls.can('SEO', 'employees', 'export')).toBe(false);
+    expect(nulls.can('SEO', 'clients', 'read')).toBe(true);
+  });
+
+  it('lists the allowed actions on a resource', () => {
+    expect(table.actionsFor('SEO', 'seo_reports')).toEqual(['read', 'update']);
+  });
+
+  it('builds rows from role -> resources maps', () => {
+    const guards = compilePermissionTable(grantsToRows({ HR: ['hr_reports'], 'Super Admin': ['all'] }, 'access'));
+    expect(guards.can('HR', 'hr_reports', 'access')).toBe(true);
+    expect(guards.can('HR', 'finance', 'access')).toBe(false);
+    expect(guards.can('Super Admin', 'finance', 'access')).toBe(true);
+  });
+});
@@ -0,0 +1,18 @@
+import { describe, it, expect } from 'vitest';
+import { VENDORS, loadVendor, loadXlsx, getLoadedVendor } from '../vendorLoaders';
+
+describe('vendorLoaders', () => {
+  it('loads a library once and caches the module', async () => {
+    expect(getLoadedVendor('xlsx')).toBeNull();
+
+    const [first, second] = await Promise.all([loadXlsx(), loadVendor('xlsx')]);
+    expect(first).toBe(second);
+    expect(typeof first.utils.book_new).toBe('function');
+    expect(getLoadedVendor('xlsx')).toBe(first);
+  });
+
+  it('rejects unknown libraries', async () => {
+    expect(VENDORS).not.toContain('moment');
+    await expect(loadVendor('moment')).rejects.toThrow("Unknown vendor module 'moment'");
+  });
+});
@@ -0,0 +1,39 @@
+import { describe, it, expect } from 'vitest';
+import { buildOffsets, findIndexAt, getWindow } from '../virtualWindow';
+
+describe('virtualWindow', () => {
+  it('accumulates measured and estimated sizes into offsets', () => {
+    const measured = { 1: 100, 3: 20 };
+    const offsets = buildOffsets(5, index => measured[index] ?? 50);
+    expect(Array.from(offsets)).toEqual([0, 50, 150, 200, 220, 270]);
+  });
+
+  it('finds the item covering a position', () => {
+    const offsets = buildOffsets(5, index => (index === 1 ? 100 : 50));
+    expect(findIndexAt(offsets, 0)).toBe(0);
+    expect(findIndexAt(offsets, 49)).toBe(0);
+    expect(findIndexAt(offsets, 50)).toBe(1);
+    expect(findIndexAt(offsets, 149)).toBe(1);
+    expect(findIndexAt(offsets, 150)).toBe(2);
+    expect(findIndexAt(offsets, 10000)).toBe(4);
+    expect(findIndexAt(buildOffsets(0, () => 50), 100)).toBe(0);
+  });
+
+  it('windows the visible rows with overscan and spacer sizes', () => {
+    const offsets = buildOffsets(1000, () => 40);
+    const range = getWindow(offsets, 4000, 400, 5);
+
+    expect(range.start).toBe(95);
+    expect(range.end).toBe(115);
+    expect(range.before).toBe(95 * 40);
+    expect(range.after).toBe((1000 - 115) * 40);
+    expect(range.before + (range.end - range.start) * 40 + range.after).toBe(40000);
+  });
+
+  it('clamps the window at both ends of the list', () => {
+    const offsets = buildOffsets(10, () => 30);
+    expect(getWindow(offsets, 0, 90, 4)).toEqual({ start: 0, end: 7, before: 0, after: 90 });
+    expect(getWindow(offsets, 1000, 90, 4)).toEqual({ start: 5, end: 10, before: 150, after: 0 });
+    expect(getWindow(buildOffsets(0, () => 30), 0, 90, 4)).toEqual({ start: 0, end: 0, before: 0, after: 0 });
+  });
+});
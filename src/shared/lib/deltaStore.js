@@ -0,0 +1,151 @@
+/**
+ * Normalized row store for incremental (delta) sync.
+ *
+ * Rows are held by primary key together with a high-water mark: the
+ * largest `updated_at` seen so far (`created_at` for rows that have no
+ * `updated_at`). A poll then only asks the server for
+ * rows changed since that mark, and realtime events are applied to the
+ * same store between polls. The sorted array handed to React is rebuilt
+ * only when the store actually changed.
+ */
+
+/**
+ * Comparator on a single column, nulls last
+ */
+export const byColumn = (column, ascending = true) => (a, b) => {
+  const av = a[column];
+  const bv = b[column];
+  if (av == null && bv == null) return 0;
+  if (av == null) return 1;
+  if (bv == null) return -1;
+  const result = typeof av === 'number' && typeof bv === 'number'
+    ? av - bv
+    : String(av).localeCompare(String(bv));
+  return ascending ? result : -result;
+};
+
+export function createTableStore({
+  key = 'id',
+  cursorColumn = 'updated_at',
+  fallbackColumn = 'created_at',
+  compare = null
+} = {}) {
+  return {
+    key,
+    cursorColumn,
+    fallbackColumn,
+    compare,
+    rows: new Map(),
+    highWater: null,
+    version: 0,
+    snapshot: [],
+    snapshotVersion: 0
+  };
+}
+
+// The row's position for delta sync: its cursor column, else the fallback
+export const cursorValue = (store, row) => row[store.cursorColumn] ?? (store.fallbackColumn ? row[store.fallbackColumn] : null) ?? null;
+
+const advanceHighWater = (store, row) => {
+  const value = cursorValue(store, row);
+  if (value != null && (store.highWater === null || String(value) > String(store.highWater))) {
+    store.highWater = value;
+  }
+};
+
+const isUnchanged = (store, existing, row) => {
+  if (!existing) return false;
+  const cursor = store.cursorColumn;
+  if (existing[cursor] != null && row[cursor] != null) {
+    return existing[cursor] === row[cursor];
+  }
+  return JSON.stringify(existing) === JSON.stringify(row);
+};
+
+/**
+ * Insert or replace rows; rows whose cursor value did not move are skipped
+ * @returns {number} Number of rows that changed
+ */
+export function upsertRows(store, rows = []) {
+  let changed = 0;
+  rows.forEach(row => {
+    const id = row?.[store.key];
+    if (id === undefined || id === null) return;
+    advanceHighWater(store, row);
+    if (isUnchanged(store, store.rows.get(id), row)) return;
+    store.rows.set(id, row);
+    changed++;
+  });
+  if (changed > 0) store.version++;
+  return changed;
+}
+
+/**
+ * Remove rows by primary key
+ * @returns {number} Number of rows removed
+ */
+export function removeRows(store, ids = []) {
+  let removed = 0;
+  ids.forEach(id => {
+    if (store.rows.delete(id)) removed++;
+  });
+  if (removed > 0) store.version++;
+  return removed;
+}
+
+/**
+ * Replace the whole dataset after a full load. Rows missing from the
+ * result are dropped, which is how deletes missed by realtime are
+ * reconciled.
+ * @returns {boolean} Whether anything changed
+ */
+export function replaceRows(store, rows = []) {
+  const incoming = new Set();
+  const before = store.version;
+  store.highWater = null;
+  upsertRows(store, rows);
+  rows.forEach(row => incoming.add(row?.[store.key]));
+  removeRows(store, Array.from(store.rows.keys()).filter(id => !incoming.has(id)));
+  return store.version !== before;
+}
+
+/**
+ * Merge local edits into a row, e.g. after a successful update call
+ * @returns {boolean} Whether the row exists
+ */
+export function patchRow(store, id, updates) {
+  const existing = store.rows.get(id);
+  if (!existing) return false;
+  store.rows.set(id, { ...existing, ...updates });
+  store.version++;
+  return true;
+}
+
+/**
+ * Apply Supabase postgres_changes payloads
+ * @returns {number} Number of rows that changed
+ */
+export function applyChangeEvents(store, events = []) {
+  let changed = 0;
+  events.forEach(event => {
+    if (event.eventType === 'DELETE') {
+      changed += removeRows(store, [event.old?.[store.key]]);
+    } else if (event.new) {
+      changed += upsertRows(store, [event.new]);
+    }
+  });
+  return changed;
+}
+
+/**
+ * Sorted array of the current rows, memoized per store version so
+ * unchanged tables keep the same array identity across polls
+ */
+export function snapshotRows(store) {
+  if (store.snapshotVersion !== store.version || store.snapshot.length !== store.rows.size) {
+    const rows = Array.from(store.rows.values());
+    store.snapshot = store.compare ? rows.sort(store.compare) : rows;
+    store.snapshotVersion = store.version;
+  }
+  return store.snapshot;
+}
@@ -0,0 +1,75 @@
+/**
+ * Field-level diffs between two versions of a form model.
+ *
+ * A diff lists the top-level fields whose values changed and the fields that
+ * were removed, so a save only has to write those fields. Values are compared
+ * structurally (plain objects, arrays, dates), without serializing them.
+ */
+
+const isPlainObject = (value) => Object.prototype.toString.call(value) === '[object Object]';
+
+/**
+ * Structural equality for form values
+ */
+export function isEqual(a, b) {
+  if (Object.is(a, b)) return true;
+  if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) return false;
+
+  if (a instanceof Date || b instanceof Date) {
+    return a instanceof Date && b instanceof Date && a.getTime() === b.getTime();
+  }
+
+  if (Array.isArray(a) || Array.isArray(b)) {
+    if (!Array.isArray(a) || !Array.isArray(b) || a.length !== b.length) return false;
+    for (let index = 0; index < a.length; index++) {
+      if (!isEqual(a[index], b[index])) return false;
+    }
+    return true;
+  }
+
+  if (!isPlainObject(a) || !isPlainObject(b)) return false;
+  const keys = Object.keys(a);
+  if (keys.length !== Object.keys(b).length) return false;
+  return keys.every(key => Object.prototype.hasOwnProperty.call(b, key) && isEqual(a[key], b[key]));
+}
+
+/**
+ * Top-level fields that differ between two models
+ * @param {Object} previous - last saved model (or null)
+ * @param {Object} next - current model
+ * @returns {{ changed: Object, removed: string[] }}
+ */
+export function diffFields(previous, next) {
+  const before = previous || {};
+  const after = next || {};
+  const changed = {};
+  const removed = [];
+
+  Object.keys(after).forEach(field => {
+    if (after[field] === undefined) {
+      if (before[field] !== undefined) removed.push(field);
+      return;
+    }
+    if (!isEqual(before[field], after[field])) changed[field] = after[field];
+  });
+  Object.keys(before).forEach(field => {
+    if (before[field] !== undefined && !Object.prototype.hasOwnProperty.call(after, field)) {
+      removed.push(field);
+    }
+  });
+
+  return { changed, removed };
+}
+
+export const isEmptyDiff = (diff) => Object.keys(diff.changed).length === 0 && diff.removed.length === 0;
+
+/**
+ * Apply a diff from diffFields to a model, returning a new object
+ */
+export function applyFieldDiff(base, diff) {
+  const result = { ...(base || {}), ...diff.changed };
+  diff.removed.forEach(field => {
+    delete result[field];
+  });
+  return result;
+}
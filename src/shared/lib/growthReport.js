@@ -0,0 +1,391 @@
+/**
+ * Growth report builder shared by the API server and the browser.
+ *
+ * Loads only the requested period's KPI rows (role metric columns only) and
+ * submission dates, computes summary, trends (linear regression), insights,
+ * monthly breakdown and goal tracking in a single pass, and caches finished
+ * reports in growth_reports keyed by user + type + period + data version.
+ */
+
+// Bump when the report shape or scoring changes so cached reports are rebuilt
+const BUILDER_VERSION = 1;
+
+export const GROWTH_PERIODS = { '3months': 3, '6months': 6, '12months': 12 };
+
+const KPI_TABLES = {
+  'Super Admin': 'superadmin_kpis',
+  HR: 'hr_kpis',
+  'Operations Head': 'operations_head_kpis',
+  Intern: 'intern_kpis',
+  Freelancer: 'freelancer_kpis'
+};
+
+const ROLE_METRICS = {
+  Intern: ['skill_development', 'learning_hours', 'goal_completion', 'mentor_rating', 'project_quality', 'technical_growth', 'soft_skills', 'initiative_score'],
+  Freelancer: ['client_satisfaction', 'project_delivery', 'quality_score', 'communication_rating', 'deadline_adherence', 'technical_skills', 'creativity_score', 'earnings_growth'],
+  default: ['client_satisfaction', 'attendance', 'punctuality_score', 'team_collaboration', 'initiative_score', 'productivity_score']
+};
+
+const ROLE_GOALS = {
+  Intern: { skill_development: 80, learning_hours: 75, goal_completion: 85, mentor_rating: 80, technical_growth: 75 },
+  Freelancer: { client_satisfaction: 85, project_delivery: 80, quality_score: 85, deadline_adherence: 90, earnings_growth: 70 },
+  default: { client_satisfaction: 80, attendance: 90, punctuality_score: 85, team_collaboration: 80, productivity_score: 75 }
+};
+
+// Postgres undefined_column
+const UNDEFINED_COLUMN = '42703';
+
+const pad = (n) => String(n).padStart(2, '0');
+const toMonthKey = (date) => `${date.getFullYear()}-${pad(date.getMonth() + 1)}`;
+const monthName = (monthKey) => {
+  const [year, month] = monthKey.split('-').map(Number);
+  return new Date(year, month - 1, 1).toLocaleString('en-US', { month: 'long', year: 'numeric' });
+};
+
+export const getKpiTable = (role) => KPI_TABLES[role] || 'employee_kpis';
+export const getRoleMetrics = (role) => ROLE_METRICS[role] || ROLE_METRICS.default;
+export const getRoleGoals = (role) => ROLE_GOALS[role] || ROLE_GOALS.default;
+
+/**
+ * Month keys ('YYYY-MM') covered by a period, newest first
+ */
+export function getPeriodMonths(period, now = new Date()) {
+  const count = GROWTH_PERIODS[period] || GROWTH_PERIODS['6months'];
+  return Array.from({ length: count }, (_, i) => toMonthKey(new Date(now.getFullYear(), now.getMonth() - i, 1)));
+}
+
+/**
+ * First instant of the oldest month in the period
+ */
+export function getPeriodStart(period, now = new Date()) {
+  const count = GROWTH_PERIODS[period] || GROWTH_PERIODS['6months'];
+  return new Date(now.getFullYear(), now.getMonth() - (count - 1), 1).toISOString();
+}
+
+const latestTimestamp = (rows) => rows.reduce((latest, row) => {
+  const stamp = row.updated_at || row.created_at || '';
+  return stamp > latest ? stamp : latest;
+}, '');
+
+/**
+ * Cheap fingerprint of the report inputs: any added, removed or updated row
+ * (or a new month rolling into the period) yields a new version
+ */
+export function computeDataVersion(kpiRows, submissions, periodStart) {
+  return [
+    `v${BUILDER_VERSION}`,
+    periodStart.slice(0, 7),
+    kpiRows.length,
+    latestTimestamp(kpiRows),
+    submissions.length,
+    latestTimestamp(submissions)
+  ].join(':');
+}
+
+/**
+ * Overall score for one KPI row: mean of the role's metrics
+ */
+export function calculateOverallScore(kpi, role) {
+  if (!kpi) return 0;
+  const metrics = getRoleMetrics(role);
+  return metrics.reduce((sum, metric) => sum + (kpi[metric] || 0), 0) / metrics.length;
+}
+
+const round = (value, places = 0) => {
+  const factor = 10 ** places;
+  return Math.round(value * factor) / factor;
+};
+
+function buildInsights(latest, trends, role) {
+  const insights = [];
+
+  switch (role) {
+    case 'Intern':
+      if (latest.learning_hours > 80) {
+        insights.push({ type: 'positive', message: 'Excellent learning commitment with high learning hours' });
+      }
+      if (trends?.skill_development?.direction === 'upward') {
+        insights.push({ type: 'positive', message: 'Consistent skill development growth trend' });
+      }
+      if (latest.mentor_rating < 60) {
+        insights.push({ type: 'warning', message: 'Mentor rating needs improvement - consider more engagement' });
+      }
+      break;
+    case 'Freelancer':
+      if (latest.client_satisfaction > 85) {
+        insights.push({ type: 'positive', message: 'Outstanding client satisfaction scores' });
+      }
+      if (trends?.earnings_growth?.direction === 'upward') {
+        insights.push({ type: 'positive', message: 'Strong earnings growth trajectory' });
+      }
+      if (latest.deadline_adherence < 70) {
+        insights.push({ type: 'warning', message: 'Deadline adherence needs attention for better client relationships' });
+      }
+      break;
+    default:
+      if (latest.team_collaboration > 80) {
+        insights.push({ type: 'positive', message: 'Strong team collaboration skills' });
+      }
+      if (trends?.productivity_score?.direction === 'downward') {
+        insights.push({ type: 'warning', message: 'Productivity showing declining trend - may need support' });
+      }
+  }
+
+  return insights;
+}
+
+function buildRecommendations(latest, role) {
+  const recommendations = [];
+
+  switch (role) {
+    case 'Intern':
+      if (latest.technical_growth < 70) {
+        recommendations.push('Focus on technical skill development through additional courses or projects');
+      }
+      if (latest.soft_skills < 75) {
+        recommendations.push('Participate in team activities to improve soft skills and communication');
+      }
+      break;
+    case 'Freelancer':
+      if (latest.project_delivery < 80) {
+        recommendations.push('Implement better project management practices to improve delivery scores');
+      }
+      if (latest.creativity_score < 75) {
+        recommendations.push('Explore creative workshops or design thinking sessions');
+      }
+      break;
+    default:
+      if (latest.client_satisfaction < 75) {
+        recommendations.push('Schedule regular client check-ins to improve satisfaction scores');
+      }
+      if (latest.initiative_score < 70) {
+        recommendations.push('Take on more proactive tasks and suggest process improvements');
+      }
+  }
+
+  return recommendations;
+}
+
+/**
+ * Build a growth report from period-bounded data
+ *
+ * @param {Object} input
+ * @param {Object} input.user - { user_id, name, role }
+ * @param {string} input.period - key of GROWTH_PERIODS
+ * @param {Array} input.kpiRows - KPI rows, newest first
+ * @param {Array} input.submissions - submission rows with created_at
+ * @returns {Object} report in the shape GrowthReportGenerator renders
+ */
+export function buildGrowthReport({ user, period, kpiRows = [], submissions = [], generatedAt = new Date().toISOString() }) {
+  const role = user?.role;
+  const report = {
+    user: user ? { user_id: user.user_id, name: user.name, role } : null,
+    period,
+    generatedAt,
+    summary: null,
+    trends: null,
+    insights: [],
+    recommendations: [],
+    monthlyBreakdown: [],
+    comparativeAnalysis: null,
+    goalTracking: null
+  };
+
+  const n = kpiRows.length;
+  if (n === 0) return report;
+
+  const latest = kpiRows[0];
+  const previous = kpiRows[1];
+  const metrics = getRoleMetrics(role).filter(metric => typeof latest[metric] === 'number');
+  const submissionsByMonth = new Map();
+  submissions.forEach(submission => {
+    const month = submission.created_at?.slice(0, 7);
+    if (month && !submissionsByMonth.has(month)) submissionsByMonth.set(month, submission);
+  });
+
+  // Single pass, oldest to newest (x = 0..n-1) for the regression sums
+  const sums = Object.fromEntries(metrics.map(metric => [metric, { y: 0, xy: 0 }]));
+  let scoreSum = 0;
+  let scoreSquares = 0;
+  let bestScore = -Infinity;
+
+  for (let x = 0; x < n; x++) {
+    const kpi = kpiRows[n - 1 - x];
+    const score = calculateOverallScore(kpi, role);
+    scoreSum += score;
+    scoreSquares += score * score;
+    bestScore = Math.max(bestScore, score);
+
+    metrics.forEach(metric => {
+      const value = kpi[metric] || 0;
+      sums[metric].y += value;
+      sums[metric].xy += x * value;
+    });
+
+    const month = kpi.created_at?.slice(0, 7);
+    const submission = submissionsByMonth.get(month);
+    report.monthlyBreakdown.push({
+      month,
+      monthName: month ? monthName(month) : '',
+      overallScore: Math.round(score),
+      kpiData: kpi,
+      submissionData: submission,
+      hasSubmission: !!submission
+    });
+  }
+
+  report.monthlyBreakdown.sort((a, b) => (b.month || '').localeCompare(a.month || ''));
+
+  const currentScore = calculateOverallScore(latest, role);
+  const previousScore = previous ? calculateOverallScore(previous, role) : currentScore;
+  const mean = scoreSum / n;
+  const standardDeviation = Math.sqrt(Math.max(0, scoreSquares / n - mean * mean));
+
+  report.summary = {
+    currentScore: Math.round(currentScore),
+    previousScore: Math.round(previousScore),
+    improvement: round(currentScore - previousScore, 1),
+    improvementPercentage: previousScore > 0 ? Math.round(((currentScore - previousScore) / previousScore) * 100) : 0,
+    totalDataPoints: n,
+    averageScore: Math.round(mean),
+    bestScore: Math.round(bestScore),
+    // Lower deviation = higher consistency
+    consistency: n < 3 ? 100 : Math.max(0, Math.round(100 - (standardDeviation * 2)))
+  };
+
+  if (n >= 2) {
+    // Least-squares slope with closed-form sums of x and x^2
+    const sumX = (n * (n - 1)) / 2;
+    const sumXX = ((n - 1) * n * (2 * n - 1)) / 6;
+    const denominator = n * sumXX - sumX * sumX;
+
+    report.trends = {};
+    report.comparativeAnalysis = {};
+    metrics.forEach(metric => {
+      const slope = (n * sums[metric].xy - sumX * sums[metric].y) / denominator;
+      const current = latest[metric] || 0;
+      const prior = previous[metric] || 0;
+
+      report.trends[metric] = {
+        direction: slope > 0 ? 'upward' : slope < 0 ? 'downward' : 'stable',
+        slope: round(slope, 2),
+        current,
+        previous: prior,
+        change: current - prior
+      };
+      report.comparativeAnalysis[metric] = {
+        current,
+        previous: prior,
+        change: current - prior,
+        changePercentage: previous[metric] > 0 ? Math.round(((latest[metric] - previous[metric]) / previous[metric]) * 100) : 0
+      };
+    });
+  }
+
+  report.insights = buildInsights(latest, report.trends, role);
+  report.recommendations = buildRecommendations(latest, role);
+  report.goalTracking = Object.fromEntries(Object.entries(getRoleGoals(role)).map(([metric, target]) => {
+    const current = latest[metric] || 0;
+    return [metric, {
+      current,
+      target,
+      progress: Math.min(Math.round((current / target) * 100), 100),
+      achieved: current >= target
+    }];
+  }));
+
+  return report;
+}
+
+/**
+ * Select a user's rows created since `since`, projected to `columns`.
+ * Falls back to all columns when the table lacks one of them.
+ */
+async function selectSince(client, table, columns, userId, since) {
+  const run = (projection) => client
+    .from(table)
+    .select(projection)
+    .eq('user_id', userId)
+    .gte('created_at', since)
+    .order('created_at', { ascending: false });
+
+  let { data, error } = await run(columns);
+  if (error?.code === UNDEFINED_COLUMN) {
+    ({ data, error } = await run('*'));
+  }
+  if (error) throw error;
+  return data || [];
+}
+
+/**
+ * Load the KPI rows and submission dates a report needs for its period
+ */
+export async function loadGrowthReportData(client, { userId, role, period, now = new Date() }) {
+  const periodStart = getPeriodStart(period, now);
+  const kpiColumns = ['id', 'created_at', 'updated_at', ...getRoleMetrics(role)].join(', ');
+
+  const [kpiRows, submissions] = await Promise.all([
+    selectSince(client, getKpiTable(role), kpiColumns, userId, periodStart),
+    selectSince(client, 'submissions', 'id, created_at, updated_at', userId, periodStart)
+  ]);
+
+  return { kpiRows, submissions, periodStart };
+}
+
+/**
+ * Return the cached report for the current data version, building and
+ * storing it on a miss
+ *
+ * @param {Object} client - Supabase client
+ * @param {Object} options
+ * @param {Object} options.user - { user_id, name, role }
+ * @param {string} options.reportType - 'individual' | 'team' | 'department'
+ * @param {string} options.period - key of GROWTH_PERIODS
+ * @param {string} options.generatedBy - requesting user's id
+ * @returns {Promise<{ report: Object, dataVersion: string, cached: boolean }>}
+ */
+export async function getOrBuildGrowthReport(client, { user, reportType = 'individual', period, generatedBy, now = new Date() }) {
+  const { kpiRows, submissions, periodStart } = await loadGrowthReportData(client, {
+    userId: user.user_id,
+    role: user.role,
+    period,
+    now
+  });
+  const dataVersion = computeDataVersion(kpiRows, submissions, periodStart);
+
+  const { data: cached, error: cacheError } = await client
+    .from('growth_reports')
+    .select('report_data')
+    .eq('user_id', user.user_id)
+    .eq('report_type', reportType)
+    .eq('period', period)
+    .eq('data_version', dataVersion)
+    .order('created_at', { ascending: false })
+    .limit(1)
+    .maybeSingle();
+
+  if (cacheError) {
+    console.error('Error reading cached growth report:', cacheError);
+  } else if (cached) {
+    return { report: cached.report_data, dataVersion, cached: true };
+  }
+
+  const report = buildGrowthReport({ user, period, kpiRows, submissions });
+
+  const { error: saveError } = await client
+    .from('growth_reports')
+    .insert({
+      user_id: user.user_id,
+      report_type: reportType,
+      period,
+      report_data: report,
+      data_version: dataVersion,
+      generated_by: generatedBy
+    });
+
+  if (saveError) {
+    console.error('Error saving growth report:', saveError);
+  }
+
+  return { report, dataVersion, cached: false };
+}
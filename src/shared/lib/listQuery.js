@@ -0,0 +1,320 @@
+/**
+ * List query contract shared by the API server and the browser.
+ *
+ *   ?fields=id,name,email          column projection
+ *   ?filter[status]=active         equality filter
+ *   ?filter[created_at][gte]=...   operator filter (eq, neq, gt, gte, lt, lte, in, ilike)
+ *   ?q=term                        case-insensitive search over the spec's search columns
+ *   ?sort=-created_at              single sort column, '-' for descending (id breaks ties)
+ *   ?after=<cursor>&limit=25       keyset pagination
+ *   ?count=true                    include the filtered total
+ *
+ * A spec describes what a resource allows:
+ *   { fields, defaultFields, filters, sortable, searchColumns, defaultSort, defaultLimit, maxLimit, key }
+ */
+
+const FILTER_OPERATORS = ['eq', 'neq', 'gt', 'gte', 'lt', 'lte', 'in', 'ilike'];
+const CONTRACT_PARAMS = ['fields', 'filter', 'q', 'sort', 'after', 'limit', 'count'];
+
+export class ListQueryError extends Error {
+  constructor(message) {
+    super(message);
+    this.name = 'ListQueryError';
+    this.status = 400;
+  }
+}
+
+const encodeBase64Url = (text) => btoa(unescape(encodeURIComponent(text)))
+  .replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+
+const decodeBase64Url = (text) => decodeURIComponent(escape(atob(
+  text.replace(/-/g, '+').replace(/_/g, '/')
+)));
+
+export const encodeCursor = (row, sort, key = 'id') =>
+  encodeBase64Url(JSON.stringify([row[sort.column] ?? null, row[key]]));
+
+export const decodeCursor = (cursor) => {
+  try {
+    const [value, id] = JSON.parse(decodeBase64Url(cursor));
+    return { value, id };
+  } catch {
+    throw new ListQueryError('Invalid cursor');
+  }
+};
+
+/**
+ * True when a request uses any part of the list contract. Routes keep their
+ * legacy plain-array response otherwise.
+ */
+export const hasListParams = (query = {}) =>
+  Object.keys(query).some(name => CONTRACT_PARAMS.includes(name.replace(/\[.*$/, '')));
+
+/**
+ * Collect filters from either a nested (qs-parsed) or a flat
+ * (`filter[col][op]` keys) query object
+ */
+const collectFilters = (query) => {
+  const filters = {};
+  if (query.filter && typeof query.filter === 'object') {
+    Object.assign(filters, query.filter);
+  }
+  Object.entries(query).forEach(([name, value]) => {
+    const match = name.match(/^filter\[([^\]]+)\](?:\[([^\]]+)\])?$/);
+    if (!match) return;
+    const [, column, op] = match;
+    if (op) {
+      filters[column] = { ...(typeof filters[column] === 'object' ? filters[column] : {}), [op]: value };
+    } else {
+      filters[column] = value;
+    }
+  });
+  return filters;
+};
+
+/**
+ * Validate and normalize a query object against a resource spec
+ */
+export function parseListQuery(query = {}, spec = {}) {
+  const key = spec.key || 'id';
+  const allowedFields = spec.fields || null;
+  const allowedFilters = spec.filters || allowedFields || [];
+  const sortable = spec.sortable || allowedFields || [key];
+
+  let fields = spec.defaultFields || null;
+  if (query.fields) {
+    fields = String(query.fields).split(',').map(f => f.trim()).filter(Boolean);
+    const unknown = allowedFields ? fields.filter(f => !allowedFields.includes(f)) : [];
+    if (unknown.length > 0) {
+      throw new ListQueryError(`Unknown fields: ${unknown.join(', ')}`);
+    }
+  }
+
+  const filters = [];
+  Object.entries(collectFilters(query)).forEach(([column, condition]) => {
+    if (!allowedFilters.includes(column)) {
+      throw new ListQueryError(`Filtering on '${column}' is not supported`);
+    }
+    let conditions = { eq: condition };
+    if (Array.isArray(condition)) {
+      conditions = { in: condition.join(',') };
+    } else if (condition !== null && typeof condition === 'object') {
+      conditions = condition;
+    }
+    Object.entries(conditions).forEach(([op, value]) => {
+      if (!FILTER_OPERATORS.includes(op)) {
+        throw new ListQueryError(`Unknown filter operator '${op}'`);
+      }
+      if (value === undefined || value === '') return;
+      filters.push({
+        column,
+        op,
+        value: op === 'in' ? String(value).split(',').map(v => v.trim()) : value
+      });
+    });
+  });
+
+  const rawSort = String(query.sort || spec.defaultSort || key);
+  const sort = rawSort.startsWith('-')
+    ? { column: rawSort.slice(1), ascending: false }
+    : { column: rawSort, ascending: true };
+  if (sort.column !== key && !sortable.includes(sort.column)) {
+    throw new ListQueryError(`Sorting on '${sort.column}' is not supported`);
+  }
+
+  const maxLimit = spec.maxLimit || 200;
+  const limit = Math.min(Math.max(parseInt(query.limit) || spec.defaultLimit || 25, 1), maxLimit);
+
+  const search = query.q ? String(query.q).trim() : '';
+
+  return {
+    key,
+    fields,
+    filters,
+    search: search && spec.searchColumns?.length ? { term: search, columns: spec.searchColumns } : null,
+    sort,
+    after: query.after ? decodeCursor(String(query.after)) : null,
+    limit,
+    count: query.count === true || query.count === 'true'
+  };
+}
+
+// PostgREST reserves , . : ( ) inside or() filters, so values are quoted
+const quote = (value) => `"${String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"')}"`;
+
+const escapeLike = (term) => term.replace(/[%_]/g, match => `\\${match}`);
+
+const selectColumns = (parsed) => {
+  if (!parsed.fields) return '*';
+  return [...new Set([parsed.key, parsed.sort.column, ...parsed.fields])].join(',');
+};
+
+/**
+ * Translate a parsed list query into Supabase select/filter/order/limit calls.
+ * `from` is a table query builder, e.g. supabase.from('clients').
+ * Fetches one extra row to know whether another page exists.
+ */
+export function applyListQuery(from, parsed, { select } = {}) {
+  let query = from.select(select || selectColumns(parsed), parsed.count ? { count: 'exact' } : undefined);
+
+  parsed.filters.forEach(({ column, op, value }) => {
+    if (op === 'in') {
+      query = query.in(column, value);
+    } else if (op === 'ilike') {
+      query = query.ilike(column, `%${escapeLike(String(value))}%`);
+    } else {
+      query = query[op](column, value);
+    }
+  });
+
+  // PostgREST accepts a single or= tree, so search and cursor conditions are
+  // combined into one expression when both are present
+  const orGroups = [];
+  if (parsed.search) {
+    const pattern = `*${parsed.search.term.replace(/[*,()]/g, ' ')}*`;
+    orGroups.push(parsed.search.columns.map(column => `${column}.ilike.${quote(pattern)}`).join(','));
+  }
+
+  const { sort, key, after } = parsed;
+  if (after) {
+    if (sort.column === key) {
+      query = query[sort.ascending ? 'gt' : 'lt'](key, after.id);
+    } else if (after.value === null) {
+      query = query.is(sort.column, null).gt(key, after.id);
+    } else {
+      const op = sort.ascending ? 'gt' : 'lt';
+      orGroups.push([
+        `${sort.column}.${op}.${quote(after.value)}`,
+        `and(${sort.column}.eq.${quote(after.value)},${key}.gt.${quote(after.id)})`,
+        `${sort.column}.is.null`
+      ].join(','));
+    }
+  }
+
+  if (orGroups.length === 1) {
+    query = query.or(orGroups[0]);
+  } else if (orGroups.length > 1) {
+    query = query.or(`and(${orGroups.map(group => `or(${group})`).join(',')})`);
+  }
+
+  query = query.order(sort.column, { ascending: sort.ascending, nullsFirst: false });
+  if (sort.column !== key) {
+    query = query.order(key, { ascending: true });
+  }
+
+  return query.limit(parsed.limit + 1);
+}
+
+/**
+ * Shape rows fetched with applyListQuery into a page envelope
+ */
+export function buildListPage(rows, parsed, total = null) {
+  const hasMore = rows.length > parsed.limit;
+  const data = hasMore ? rows.slice(0, parsed.limit) : rows;
+  const last = data[data.length - 1];
+
+  return {
+    data,
+    page: {
+      limit: parsed.limit,
+      has_more: hasMore,
+      next_cursor: hasMore && last ? encodeCursor(last, parsed.sort, parsed.key) : null,
+      ...(parsed.count ? { total } : {})
+    }
+  };
+}
+
+const compareValues = (a, b) => {
+  if (typeof a === 'number' && typeof b === 'number') return a - b;
+  return String(a).localeCompare(String(b));
+};
+
+const matchesFilter = (row, { column, op, value }) => {
+  const actual = row[column];
+  switch (op) {
+    // Case-sensitive like PostgREST eq/neq, so cached and server pages agree
+    case 'eq': return actual != null && String(actual) === String(value);
+    case 'neq': return actual == null || String(actual) !== String(value);
+    case 'in': return actual != null && value.includes(String(actual));
+    case 'ilike': return actual != null && String(actual).toLowerCase().includes(String(value).toLowerCase());
+    case 'gt': return actual != null && compareValues(actual, value) > 0;
+    case 'gte': return actual != null && compareValues(actual, value) >= 0;
+    case 'lt': return actual != null && compareValues(actual, value) < 0;
+    case 'lte': return actual != null && compareValues(actual, value) <= 0;
+    default: return true;
+  }
+};
+
+/**
+ * Evaluate the same contract over an in-memory array. Used for mock data
+ * and for derived fields that only exist after client-side enrichment.
+ */
+export function applyListQueryToRows(rows, parsed) {
+  const { sort, key, after, search } = parsed;
+  const term = search?.term.toLowerCase();
+
+  const ordered = rows
+    .filter(row => parsed.filters.every(filter => matchesFilter(row, filter)))
+    .filter(row => !term || search.columns.some(column =>
+      row[column] != null && String(row[column]).toLowerCase().includes(term)))
+    .sort((a, b) => {
+      const av = a[sort.column];
+      const bv = b[sort.column];
+      if (av == null && bv != null) return 1;
+      if (bv == null && av != null) return -1;
+      const primary = av == null ? 0 : compareValues(av, bv);
+      if (primary !== 0) return sort.ascending ? primary : -primary;
+      return compareValues(a[key], b[key]);
+    });
+
+  let start = 0;
+  if (after) {
+    const index = ordered.findIndex(row => String(row[key]) === String(after.id));
+    start = index >= 0 ? index + 1 : ordered.length;
+  }
+
+  const window = ordered.slice(start, start + parsed.limit + 1).map(row => {
+    if (!parsed.fields) return row;
+    return Object.fromEntries([key, sort.column, ...parsed.fields].map(field => [field, row[field]]));
+  });
+
+  return buildListPage(window, parsed, ordered.length);
+}
+
+/**
+ * Serialize contract params into a query string for fetch()
+ */
+export function buildListQueryString({ fields, filter = {}, q, sort, after, limit, count } = {}) {
+  const params = new URLSearchParams();
+  if (fields?.length) params.set('fields', fields.join(','));
+  Object.entries(filter).forEach(([column, condition]) => {
+    if (condition === undefined || condition === null || condition === '' || condition === 'all') return;
+    if (typeof condition === 'object' && !Array.isArray(condition)) {
+      Object.entries(condition).forEach(([op, value]) => {
+        if (value === undefined || value === '') return;
+        params.set(`filter[${column}][${op}]`, Array.isArray(value) ? value.join(',') : value);
+      });
+    } else if (Array.isArray(condition)) {
+      params.set(`filter[${column}][in]`, condition.join(','));
+    } else {
+      params.set(`filter[${column}]`, condition);
+    }
+  });
+  if (q) params.set('q', q);
+  if (sort) params.set('sort', sort);
+  if (after) params.set('after', after);
+  if (limit) params.set('limit', String(limit));
+  if (count) params.set('count', 'true');
+  return params.toString();
+}
+
+/**
+ * Fetch one page of a Supabase table through the contract.
+ * `from` is a table query builder, e.g. supabase.from('employees').
+ */
+export async function fetchListPage(from, params, spec) {
+  const parsed = parseListQuery(params, spec);
+  const { data, error, count } = await applyListQuery(from, parsed);
+  if (error) throw error;
+  return buildListPage(data || [], parsed, count ?? null);
+}
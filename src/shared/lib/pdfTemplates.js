@@ -0,0 +1,251 @@
+import { jsPDF } from 'jspdf';
+
+/**
+ * PDF report templates shared by the browser render worker and the API
+ * server's worker pool.
+ *
+ * Templates are declared once and compiled on first use: page metrics, wrap
+ * widths and table column positions are measured a single time and reused
+ * for every document rendered from the template. Only jsPDF's built-in
+ * standard fonts are used, so no font files are loaded per render.
+ */
+
+const MARGIN = 20;
+const TITLE_Y = 30;
+const FOOTER_OFFSET = 10;
+
+const text = (value, fallback = 'N/A') => (value === undefined || value === null || value === '' ? fallback : String(value));
+
+/**
+ * Template definitions. Sections render in order and are skipped when their
+ * `value` resolves to nothing. Section types:
+ *   fields     - fixed "Label: value" lines
+ *   keyValues  - one "key: value" line per entry of an object
+ *   list       - one formatted line per array item
+ *   paragraph  - wrapped free text
+ *   table      - header row plus one row per array item
+ */
+const TEMPLATE_DEFINITIONS = {
+  employeePerformance: {
+    title: 'EMPLOYEE PERFORMANCE REPORT',
+    footer: true,
+    sections: [
+      {
+        type: 'fields',
+        heading: 'Employee Information',
+        gapAfter: 15,
+        fields: [
+          ['Name', data => data.employeeName],
+          ['Department', data => data.department],
+          ['Period', data => data.period]
+        ]
+      },
+      { type: 'keyValues', heading: 'Performance Metrics', value: data => data.metrics },
+      { type: 'paragraph', heading: 'Summary', value: data => data.summary }
+    ]
+  },
+
+  monthlyReport: {
+    title: 'MONTHLY PERFORMANCE REPORT',
+    sections: [
+      {
+        type: 'fields',
+        fontSize: 12,
+        lineHeight: 8,
+        gapAfter: 15,
+        fields: [
+          ['Month', data => data.month],
+          ['Generated by', data => text(data.generatedBy, 'System')]
+        ]
+      },
+      { type: 'keyValues', heading: 'Key Metrics', value: data => data.metrics },
+      {
+        type: 'list',
+        heading: 'Department Performance',
+        value: data => data.departmentBreakdown,
+        format: dept => `${dept.department}: ${dept.score || 'N/A'}`
+      }
+    ]
+  },
+
+  incentiveReport: {
+    title: 'INCENTIVE DISBURSEMENT REPORT',
+    sections: [
+      {
+        type: 'fields',
+        fontSize: 12,
+        lineHeight: 8,
+        gapAfter: 15,
+        fields: [
+          ['Period', data => data.period],
+          ['Total Applications', data => text(data.totalApplications, '0')],
+          ['Total Amount', data => data.totalAmount]
+        ]
+      },
+      {
+        type: 'table',
+        heading: 'Incentive Applications',
+        value: data => data.applications,
+        columns: [
+          { label: 'Employee', offset: 0, value: app => app.employeeName },
+          { label: 'Type', offset: 60, value: app => app.incentiveType },
+          { label: 'Amount', offset: 120, value: app => app.amount?.toString() },
+          { label: 'Status', offset: 160, value: app => app.status }
+        ]
+      }
+    ]
+  }
+};
+
+export const PDF_TEMPLATES = Object.keys(TEMPLATE_DEFINITIONS);
+
+// Page geometry is the same for every document, so measure it once
+let pageMetrics = null;
+const getPageMetrics = () => {
+  if (!pageMetrics) {
+    const probe = new jsPDF();
+    pageMetrics = {
+      width: probe.internal.pageSize.getWidth(),
+      height: probe.internal.pageSize.getHeight()
+    };
+  }
+  return pageMetrics;
+};
+
+/**
+ * Turn a template definition into a render function with its layout resolved
+ */
+function compileTemplate(definition) {
+  const page = getPageMetrics();
+  const contentWidth = page.width - 2 * MARGIN;
+  const bottom = page.height - MARGIN;
+
+  const sections = definition.sections.map(section => ({
+    fontSize: 11,
+    lineHeight: 6,
+    gapAfter: 10,
+    ...section,
+    columns: section.columns?.map(column => ({ ...column, x: MARGIN + column.offset }))
+  }));
+
+  return (data) => {
+    const doc = new jsPDF();
+    let y = TITLE_Y;
+
+    const ensureSpace = (needed) => {
+      if (y + needed > bottom) {
+        doc.addPage();
+        y = TITLE_Y;
+      }
+    };
+
+    const heading = (label) => {
+      ensureSpace(16);
+      doc.setFontSize(14);
+      doc.setFont(undefined, 'bold');
+      doc.text(label, MARGIN, y);
+      y += 10;
+    };
+
+    const lines = (items, { fontSize, lineHeight }) => {
+      doc.setFontSize(fontSize);
+      doc.setFont(undefined, 'normal');
+      items.forEach(line => {
+        ensureSpace(lineHeight);
+        doc.text(line, MARGIN, y);
+        y += lineHeight;
+      });
+    };
+
+    doc.setFontSize(20);
+    doc.setFont(undefined, 'bold');
+    doc.text(definition.title, page.width / 2, y, { align: 'center' });
+    y += 20;
+
+    sections.forEach(section => {
+      if (section.type === 'fields') {
+        if (section.heading) heading(section.heading);
+        const items = section.fields.map(([label, read]) => `${label}: ${text(read(data))}`);
+        lines(items, section);
+        // The gap replaces the spacing after the last line
+        y += section.gapAfter - section.lineHeight;
+        return;
+      }
+
+      const value = section.value(data);
+      if (!value || (Array.isArray(value) && value.length === 0)) return;
+
+      heading(section.heading);
+
+      switch (section.type) {
+        case 'keyValues':
+          lines(Object.entries(value).map(([key, item]) => `${key}: ${item}`), section);
+          y += section.gapAfter;
+          break;
+        case 'list':
+          lines(value.map(section.format), section);
+          break;
+        case 'paragraph':
+          doc.setFontSize(section.fontSize);
+          lines(doc.splitTextToSize(String(value), contentWidth), section);
+          break;
+        case 'table': {
+          const headerRow = () => {
+            doc.setFontSize(10);
+            doc.setFont(undefined, 'bold');
+            section.columns.forEach(column => doc.text(column.label, column.x, y));
+            y += 8;
+            doc.setFont(undefined, 'normal');
+          };
+          headerRow();
+          value.forEach(row => {
+            if (y + section.lineHeight > bottom) {
+              doc.addPage();
+              y = TITLE_Y;
+              headerRow();
+            }
+            section.columns.forEach(column => doc.text(text(column.value(row)), column.x, y));
+            y += section.lineHeight;
+          });
+          break;
+        }
+        default:
+          break;
+      }
+    });
+
+    if (definition.footer) {
+      doc.setFontSize(8);
+      doc.setFont(undefined, 'normal');
+      doc.text(`Generated on: ${new Date().toLocaleDateString()}`, MARGIN, page.height - FOOTER_OFFSET);
+    }
+
+    return doc;
+  };
+}
+
+const compiled = new Map();
+
+/**
+ * Compiled render function for a template, built on first use
+ */
+export function getCompiledTemplate(name) {
+  if (!compiled.has(name)) {
+    const definition = TEMPLATE_DEFINITIONS[name];
+    if (!definition) {
+      throw new Error(`No PDF template for '${name}'`);
+    }
+    compiled.set(name, compileTemplate(definition));
+  }
+  return compiled.get(name);
+}
+
+/**
+ * Render a report to a jsPDF document
+ */
+export const renderPdfDocument = (name, data) => getCompiledTemplate(name)(data || {});
+
+/**
+ * Render a report to PDF bytes (transferable between threads)
+ */
+export const renderPdf = (name, data) => renderPdfDocument(name, data).output('arraybuffer');
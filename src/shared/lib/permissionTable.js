@@ -0,0 +1,87 @@
+/**
+ * Compiled role permission lookups.
+ *
+ * Permission rows ({ role, resource, action, allowed }) are compiled once into
+ * one bitmask per role and resource, with a bit per action, so a check is two
+ * Map lookups and a bit test instead of a scan or an RPC. Rows on a wildcard
+ * resource grant the action on every resource; an explicit allowed=false row
+ * wins over any grant. Only allowed=true grants (a missing allowed counts as
+ * true, for the static tables); any other value, e.g. a NULL column, grants
+ * nothing, as COALESCE(allowed, FALSE) does on the database side.
+ */
+
+export const WILDCARD_RESOURCES = ['*', 'all', 'all_resources', 'all_dashboards'];
+
+// Bits 0..30, so masks stay small positive integers
+const MAX_ACTIONS = 31;
+
+const emptyRole = () => ({ allowed: new Map(), denied: new Map(), wildcard: 0, wildcardDenied: 0 });
+
+/**
+ * Compile permission rows into a lookup table
+ * @param {Object[]} rows - { role, resource, action, allowed = true }, where
+ *   allowed is true (grant), false (deny) or anything else (ignored)
+ * @returns {Object} { can, actionsFor, roles, size }
+ */
+export function compilePermissionTable(rows = []) {
+  const actionBits = new Map();
+  const roles = new Map();
+
+  const bitFor = (action) => {
+    let bit = actionBits.get(action);
+    if (bit === undefined) {
+      if (actionBits.size >= MAX_ACTIONS) {
+        throw new Error(`Permission tables support at most ${MAX_ACTIONS} distinct actions`);
+      }
+      bit = 1 << actionBits.size;
+      actionBits.set(action, bit);
+    }
+    return bit;
+  };
+
+  rows.forEach(({ role, resource, action, allowed = true }) => {
+    if (!role || !resource || !action) return;
+    if (allowed !== true && allowed !== false) return;
+    const bit = bitFor(action);
+    let table = roles.get(role);
+    if (!table) {
+      table = emptyRole();
+      roles.set(role, table);
+    }
+
+    if (WILDCARD_RESOURCES.includes(resource)) {
+      if (allowed === false) table.wildcardDenied |= bit;
+      else table.wildcard |= bit;
+      return;
+    }
+    const masks = allowed === false ? table.denied : table.allowed;
+    masks.set(resource, (masks.get(resource) || 0) | bit);
+  });
+
+  const can = (role, resource, action) => {
+    const bit = actionBits.get(action);
+    const table = roles.get(role);
+    if (!bit || !table) return false;
+    if (((table.denied.get(resource) || 0) | table.wildcardDenied) & bit) return false;
+    return (((table.allowed.get(resource) || 0) | table.wildcard) & bit) !== 0;
+  };
+
+  const actionsFor = (role, resource) =>
+    [...actionBits.keys()].filter(action => can(role, resource, action));
+
+  return {
+    can,
+    actionsFor,
+    roles: [...roles.keys()],
+    size: rows.length
+  };
+}
+
+/**
+ * Turn { role: [resource, ...] } into rows granting one action
+ */
+export function grantsToRows(grants, action) {
+  return Object.entries(grants).flatMap(([role, resources]) =>
+    resources.map(resource => ({ role, resource, action, allowed: true }))
+  );
+}
@@ -0,0 +1,60 @@
+/**
+ * Load-on-first-use facade for heavy vendor libraries.
+ *
+ * Export, charting and calendar code is only needed by some roles and some
+ * screens, so none of it is imported statically. Each library is fetched the
+ * first time it is asked for and the module promise is cached; later callers
+ * (and getLoadedVendor) get the same module without another request.
+ */
+
+const LOADERS = {
+  jspdf: () => import('jspdf'),
+  xlsx: () => import('xlsx'),
+  recharts: () => import('recharts'),
+  calendar: () => Promise.all([
+    import('react-big-calendar'),
+    import('react-big-calendar/lib/css/react-big-calendar.css')
+  ]).then(([module]) => module),
+  pdfTemplates: () => import('./pdfTemplates')
+};
+
+export const VENDORS = Object.keys(LOADERS);
+
+const pending = new Map();
+const loaded = new Map();
+
+/**
+ * Load a vendor module, reusing the first request
+ * @param {string} name - one of VENDORS
+ * @returns {Promise<Object>} the module namespace
+ */
+export function loadVendor(name) {
+  if (!LOADERS[name]) {
+    return Promise.reject(new Error(`Unknown vendor module '${name}'`));
+  }
+  if (!pending.has(name)) {
+    const promise = LOADERS[name]()
+      .then(module => {
+        loaded.set(name, module);
+        return module;
+      })
+      .catch(error => {
+        // Let a later call retry, e.g. after a network blip
+        pending.delete(name);
+        throw error;
+      });
+    pending.set(name, promise);
+  }
+  return pending.get(name);
+}
+
+/**
+ * The module if it has already finished loading, otherwise null
+ */
+export const getLoadedVendor = (name) => loaded.get(name) || null;
+
+export const loadJsPdf = () => loadVendor('jspdf');
+export const loadXlsx = () => loadVendor('xlsx');
+export const loadRecharts = () => loadVendor('recharts');
+export const loadCalendar = () => loadVendor('calendar');
+export const loadPdfTemplates = () => loadVendor('pdfTemplates');
@@ -0,0 +1,71 @@
+/**
+ * Layout math for windowed (virtualized) lists and tables.
+ *
+ * Items are laid out along one axis. Each item has a size: its measured size
+ * once it has rendered, an estimate before that. Offsets are the running
+ * total of those sizes, so the item at a scroll position is found with a
+ * binary search instead of walking the list.
+ */
+
+/**
+ * Start offset of every item, plus the total size as the last entry
+ * @param {number} count - number of items
+ * @param {Function} sizeOf - (index) => size in px
+ * @returns {Float64Array} offsets, length count + 1
+ */
+export function buildOffsets(count, sizeOf) {
+  const offsets = new Float64Array(count + 1);
+  for (let index = 0; index < count; index++) {
+    offsets[index + 1] = offsets[index] + sizeOf(index);
+  }
+  return offsets;
+}
+
+/**
+ * Index of the item covering a position (clamped to the list)
+ * @param {Float64Array} offsets - from buildOffsets
+ * @param {number} position - px from the start
+ */
+export function findIndexAt(offsets, position) {
+  const count = offsets.length - 1;
+  if (count <= 0) return 0;
+
+  let low = 0;
+  let high = count - 1;
+  while (low < high) {
+    const mid = (low + high + 1) >> 1;
+    if (offsets[mid] <= position) {
+      low = mid;
+    } else {
+      high = mid - 1;
+    }
+  }
+  return low;
+}
+
+/**
+ * Items to render for a viewport
+ * @param {Float64Array} offsets - from buildOffsets
+ * @param {number} scrollOffset - px scrolled along the axis
+ * @param {number} viewportSize - visible px along the axis
+ * @param {number} overscan - extra items rendered on each side
+ * @returns {{ start: number, end: number, before: number, after: number }}
+ *   items [start, end) plus the space taken by the items outside the window
+ */
+export function getWindow(offsets, scrollOffset, viewportSize, overscan = 0) {
+  const count = offsets.length - 1;
+  const total = offsets[count] || 0;
+  if (count <= 0) return { start: 0, end: 0, before: 0, after: 0 };
+
+  const first = findIndexAt(offsets, Math.max(0, scrollOffset));
+  const last = findIndexAt(offsets, Math.max(0, scrollOffset + viewportSize - 1));
+  const start = Math.max(0, first - overscan);
+  const end = Math.min(count, last + 1 + overscan);
+
+  return {
+    start,
+    end,
+    before: offsets[start],
+    after: total - offsets[end]
+  };
+}
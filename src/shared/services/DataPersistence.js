@@ -1,8 +1,16 @@
 /**
  * Comprehensive Data Persistence System
- * Updated with getUserDrafts method fix
+ * Drafts are kept in the offline store (IndexedDB): saves are async and only
+ * write the fields that changed. Each draft is tracked by a FormDraftStore,
+ * which also sends the changed fields to the server copy and merges edits
+ * from other tabs. Only the small crash-recovery marker stays in
+ * localStorage, since it has to be written synchronously on page hide.
  */
 
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import { offlineStore } from './offlineStore';
+import { FormDraftStore } from './formDraftStore';
+
 const STORAGE_KEYS = {
   DRAFT_PREFIX: 'codex_draft_',
   DRAFT_INDEX: 'codex_draft_index',
@@ -11,132 +19,180 @@ const STORAGE_KEYS = {
   CRASH_RECOVERY: 'codex_crash_recovery'
 };
 
+const CRASH_RECOVERY_WINDOW = 2 * 60 * 60 * 1000;
+const AUTO_SAVE_DELAY = 500;
+
 const generateSessionId = () => `session_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
-const generateDraftId = (name, phone, monthKey) => `${name?.toLowerCase()?.replace(/\s+/g, '_')}_${phone}_${monthKey}`;
+const userPrefix = (name, phone) => `${name?.toLowerCase()?.replace(/\s+/g, '_')}_${phone}`;
+const generateDraftId = (name, phone, monthKey) => `${userPrefix(name, phone)}_${monthKey}`;
+const serverFormId = (draftId) => `monthly:${draftId}`.replace(/[^\w.:-]/g, '_').slice(0, 200);
+// Per-session details stay in this browser's copy of a draft
+const LOCAL_ONLY_FIELDS = ['sessionInfo', 'sessionId'];
 
-class StorageManager {
-  constructor() { this.primaryStorage = null; this.fallbackStorage = null; this.memoryStorage = new Map(); this.initializeStorage(); }
-  initializeStorage() {
-    try { const k='__storage_test__'; localStorage.setItem(k,'test'); localStorage.removeItem(k); this.primaryStorage = localStorage; } catch {}
-    try { const k='__storage_test__'; sessionStorage.setItem(k,'test'); sessionStorage.removeItem(k); this.fallbackStorage = sessionStorage; } catch {}
-  }
-  setItem(key, value) {
-    const v = JSON.stringify(value);
-    if (this.primaryStorage) { try { this.primaryStorage.setItem(key, v); return true; } catch {} }
-    if (this.fallbackStorage) { try { this.fallbackStorage.setItem(key, v); return true; } catch {} }
-    this.memoryStorage.set(key, v); return false;
-  }
-  getItem(key) {
-    if (this.primaryStorage) { try { const v=this.primaryStorage.getItem(key); if (v!==null) return JSON.parse(v); } catch {} }
-    if (this.fallbackStorage) { try { const v=this.fallbackStorage.getItem(key); if (v!==null) return JSON.parse(v); } catch {} }
-    const m=this.memoryStorage.get(key); if (m!==undefined) return JSON.parse(m); return null;
-  }
-  removeItem(key) { try { this.primaryStorage?.removeItem(key);} catch {} try { this.fallbackStorage?.removeItem(key);} catch {} this.memoryStorage.delete(key); }
-  clear() { try{this.primaryStorage?.clear();}catch{} try{this.fallbackStorage?.clear();}catch{} this.memoryStorage.clear(); }
-}
+// Small synchronous markers (session id, crash flag); never draft data
+const markers = {
+  get(key) { try { const v = localStorage.getItem(key); return v === null ? null : JSON.parse(v); } catch { return null; } },
+  set(key, value) { try { localStorage.setItem(key, JSON.stringify(value)); } catch {} },
+  remove(key) { try { localStorage.removeItem(key); } catch {} }
+};
 
 class DataPersistenceService {
   constructor() {
-    this.storage = new StorageManager();
+    this.formStores = new Map(); this.listeners = new Set();
+    this.lastActivity = Date.now();
     this.sessionId = this.initializeSession();
-    this.autoSaveTimer = null; this.pendingSaves = new Map(); this.listeners = new Set();
-    this.setupCrashRecovery(); this.setupActivityTracking();
+    this.previousSession = this.setupCrashRecovery(); this.setupActivityTracking();
+    this.migration = this.migrateLegacyDrafts();
   }
-  initializeSession() { const existing = this.storage.getItem(STORAGE_KEYS.SESSION_ID); const id = existing || generateSessionId(); this.storage.setItem(STORAGE_KEYS.SESSION_ID, id); return id; }
+  initializeSession() { const id = markers.get(STORAGE_KEYS.SESSION_ID) || generateSessionId(); markers.set(STORAGE_KEYS.SESSION_ID, id); return id; }
+  // The marker is written once at start (not graceful) and again on page hide;
+  // activity is only tracked in memory, so nothing is written on a timer
   setupCrashRecovery() {
-    this.markActivity(); setInterval(()=>this.markActivity(), 30000);
-    window.addEventListener('beforeunload', ()=>{ this.storage.setItem(STORAGE_KEYS.CRASH_RECOVERY,{sessionId:this.sessionId,timestamp:Date.now(),graceful:true});});
-    this.checkCrashedSessions();
+    const previous = markers.get(STORAGE_KEYS.CRASH_RECOVERY);
+    markers.remove(STORAGE_KEYS.LAST_ACTIVITY);
+    this.writeCrashMarker(false);
+    if (typeof window !== 'undefined') {
+      window.addEventListener('pagehide', () => { this.flushAll(); this.writeCrashMarker(true); });
+      document.addEventListener('visibilitychange', () => { if (document.visibilityState === 'hidden') { this.flushAll(); this.writeCrashMarker(false); } });
+    }
+    return previous;
+  }
+  writeCrashMarker(graceful) { markers.set(STORAGE_KEYS.CRASH_RECOVERY, { sessionId: this.sessionId, timestamp: Date.now(), lastActivity: this.lastActivity, graceful }); }
+  setupActivityTracking() { if (typeof document === 'undefined') return; const mark = () => this.markActivity(); ['click', 'keydown', 'scroll'].forEach(e => document.addEventListener(e, mark, { passive: true })); }
+  markActivity() { this.lastActivity = Date.now(); }
+  // Drafts saved to localStorage by earlier versions move to the offline store once
+  async migrateLegacyDrafts() {
+    const index = markers.get(STORAGE_KEYS.DRAFT_INDEX);
+    if (!index) return;
+    try {
+      for (const entry of Object.values(index)) {
+        const data = markers.get(entry.storageKey);
+        if (data) await offlineStore.saveDraft(entry.storageKey, data);
+        markers.remove(entry.storageKey);
+      }
+      markers.remove(STORAGE_KEYS.DRAFT_INDEX);
+    } catch (error) { console.warn('Legacy draft migration failed:', error); }
+  }
+  async checkCrashedSessions() { const c = this.previousSession; if (c && !c.graceful) { return this.getCrashedDrafts(); } return []; }
+  async getCrashedDrafts() {
+    const now = Date.now();
+    const recent = (await this.listDrafts()).filter(d => now - d.lastSaved < CRASH_RECOVERY_WINDOW);
+    const withData = await Promise.all(recent.map(async d => ({ ...d, data: await offlineStore.getDraft(d.storageKey) })));
+    return withData.filter(d => this.isSignificantDraft(d.data));
   }
-  setupActivityTracking() { const ev=['click','keypress','scroll','mousemove']; const t=this.throttle(()=>this.markActivity(),10000); ev.forEach(e=>document.addEventListener(e,t,{passive:true})); }
-  markActivity() { this.storage.setItem(STORAGE_KEYS.LAST_ACTIVITY,{sessionId:this.sessionId,timestamp:Date.now()}); }
-  checkCrashedSessions() { const c=this.storage.getItem(STORAGE_KEYS.CRASH_RECOVERY); if (c && !c.graceful) { return this.getCrashedDrafts(); } return []; }
-  getCrashedDrafts() { const idx=this.getDraftIndex(); const now=Date.now(); const crashed=[]; Object.values(idx).forEach(d=>{ if (now-d.lastSaved<2*60*60*1000) { const data=this.storage.getItem(d.storageKey); if (data && this.isSignificantDraft(data)) crashed.push({...d,data}); } }); return crashed; }
-  saveDraft(draftData, options = {}) {
-    const { name, phone, monthKey, currentStep = 1, forceImmediate = false } = draftData;
-    if (!name || !phone || !monthKey) return;
+  // One change-tracking store per draft; it restores the local and server copies before the first save
+  getFormStore(name, phone, monthKey) {
     const draftId = generateDraftId(name, phone, monthKey);
     const storageKey = STORAGE_KEYS.DRAFT_PREFIX + draftId;
-    const existing = this.storage.getItem(storageKey) || {};
-    const merged = { ...existing, ...draftData, currentStep, savedAt: Date.now(), sessionId: this.sessionId, version: (existing.version || 0) + 1 };
-    if (forceImmediate) { this.storage.setItem(storageKey, merged); this.updateDraftIndex(draftId, storageKey); this.notify('save', merged); return; }
-    this.pendingSaves.set(storageKey, merged); this.scheduleAutoSave();
+    let entry = this.formStores.get(storageKey);
+    if (!entry) {
+      const store = new FormDraftStore({ formId: serverFormId(draftId), owner: String(phone), storageKey, delay: AUTO_SAVE_DELAY, localOnlyFields: LOCAL_ONLY_FIELDS });
+      store.subscribe(({ type, payload }) => {
+        if (type === 'remote') this.notify('remote', { draftId, storageKey, data: payload.model, fields: payload.fields });
+        if (type === 'status' && payload.status === 'saved') this.notify('save', { draftId, storageKey });
+      });
+      const ready = this.migration.then(() => store.load()).catch(error => { console.warn('Draft restore failed:', error); return null; });
+      entry = { store, ready };
+      this.formStores.set(storageKey, entry);
+    }
+    return entry;
   }
-  scheduleAutoSave() { 
-    if (this.autoSaveTimer) return; 
-    // Use requestAnimationFrame to ensure DOM updates complete before auto-save
-    // This prevents cursor ejection during typing
-    requestAnimationFrame(() => {
-      this.autoSaveTimer = setTimeout(()=> this.flushPendingSaves(), 500); 
-    });
+  flushAll() { this.formStores.forEach(({ store }) => store.flush()); }
+  /**
+   * Record a draft. Changes are merged into the draft and coalesced; only changed
+   * fields are written. Resolves to true once queued (or stored, with forceImmediate).
+   */
+  async saveDraft(draftData, options = {}) {
+    const { name, phone, monthKey, currentStep = 1 } = draftData;
+    const forceImmediate = options.forceImmediate ?? draftData.forceImmediate ?? false;
+    if (!name || !phone || !monthKey) return false;
+    const { store, ready } = this.getFormStore(name, phone, monthKey);
+    await ready;
+    const { forceImmediate: _ignored, ...fields } = draftData;
+    store.update({ ...store.current, ...fields, currentStep, sessionId: this.sessionId });
+    if (forceImmediate) await store.flush();
+    return store.status !== 'error';
+  }
+  async getDraft(name, phone, monthKey) { const { store, ready } = this.getFormStore(name, phone, monthKey); await ready; return Object.keys(store.current).length ? { ...store.current } : null; }
+  async listDrafts(prefix = '') { await this.migration; const drafts = await offlineStore.listDrafts(STORAGE_KEYS.DRAFT_PREFIX + prefix); return drafts.map(d => ({ draftId: d.key.slice(STORAGE_KEYS.DRAFT_PREFIX.length), storageKey: d.key, lastSaved: d.updatedAt })); }
+  async getUserDrafts(name, phone) {
+    const drafts = await this.listDrafts(userPrefix(name, phone));
+    const loaded = await Promise.all(drafts.map(async d => { const data = await offlineStore.getDraft(d.storageKey); return data && { ...d, data, completionPercentage: this.calculateCompletionPercentage(data), currentStep: data.currentStep || 1 }; }));
+    return loaded.filter(Boolean);
   }
-  flushPendingSaves() { this.pendingSaves.forEach((data, key)=>{ this.storage.setItem(key, data); this.notify('save', data);}); this.pendingSaves.clear(); this.autoSaveTimer = null; }
-  getDraft(name, phone, monthKey) { const id=generateDraftId(name, phone, monthKey); return this.storage.getItem(STORAGE_KEYS.DRAFT_PREFIX+id); }
-  getUserDrafts(name, phone) { const index=this.getDraftIndex(); return Object.values(index).filter(d => d.draftId.includes(`${name?.toLowerCase()?.replace(/\s+/g, '_')}_${phone}`)).map(i=>({ ...i, data: this.storage.getItem(i.storageKey), completionPercentage: this.calculateCompletionPercentage(this.storage.getItem(i.storageKey)), currentStep: this.storage.getItem(i.storageKey)?.currentStep || 1 })).filter(Boolean); }
   calculateCompletionPercentage(data) { if (!data) return 0; let completed = 0; let total = 5; if (data.employee?.name) completed++; if (data.meta?.attendance) completed++; if (data.clients?.length) completed++; if (data.learning?.length) completed++; if (data.feedback?.company) completed++; return Math.round((completed / total) * 100); }
-  getAllDrafts() { const index=this.getDraftIndex(); return Object.values(index).map(i=>({ ...i, data: this.storage.getItem(i.storageKey) })).filter(Boolean); }
-  deleteDraft(name, phone, monthKey) { const id=generateDraftId(name, phone, monthKey); const key=STORAGE_KEYS.DRAFT_PREFIX+id; this.storage.removeItem(key); this.removeFromDraftIndex(id); this.notify('delete', { id, storageKey: key }); }
-  clearAllDrafts() { const idx=this.getDraftIndex(); Object.values(idx).forEach(d=> this.storage.removeItem(d.storageKey)); this.storage.removeItem(STORAGE_KEYS.DRAFT_INDEX); this.notify('clear', null); }
-  getDraftIndex() { return this.storage.getItem(STORAGE_KEYS.DRAFT_INDEX) || {}; }
-  updateDraftIndex(draftId, storageKey) { const idx=this.getDraftIndex(); idx[draftId] = { draftId, storageKey, lastSaved: Date.now() }; this.storage.setItem(STORAGE_KEYS.DRAFT_INDEX, idx); }
-  removeFromDraftIndex(draftId) { const idx=this.getDraftIndex(); delete idx[draftId]; this.storage.setItem(STORAGE_KEYS.DRAFT_INDEX, idx); }
+  async getAllDrafts() { const drafts = await this.listDrafts(); return (await Promise.all(drafts.map(async d => ({ ...d, data: await offlineStore.getDraft(d.storageKey) })))).filter(d => d.data); }
+  async deleteDraft(name, phone, monthKey) { const id = generateDraftId(name, phone, monthKey); const { store, ready } = this.getFormStore(name, phone, monthKey); await ready; await store.clear(); this.notify('delete', { id, storageKey: store.storageKey }); }
+  async clearAllDrafts() {
+    await this.migration;
+    this.formStores.forEach(({ store }) => store.reset());
+    await Promise.all([offlineStore.clearDrafts(STORAGE_KEYS.DRAFT_PREFIX), offlineStore.clearDrafts('base:' + STORAGE_KEYS.DRAFT_PREFIX)]);
+    this.notify('clear', null);
+  }
   isSignificantDraft(d) { if (!d) return false; const fields = ['employee','clients','learning','meta','feedback']; return fields.some(f => d[f] && (Array.isArray(d[f]) ? d[f].length>0 : Object.keys(d[f]||{}).length>0)); }
   subscribe(listener) { this.listeners.add(listener); return () => this.listeners.delete(listener); }
   notify(type, payload) { this.listeners.forEach(l => { try { l({ type, payload }); } catch {} }); }
-  throttle(fn, wait) { let last=0; return (...args)=>{ const now=Date.now(); if (now-last>=wait) { last=now; fn(...args); } }; }
 }
 
 export const dataPersistence = new DataPersistenceService();
 
-import { useEffect, useRef, useState } from 'react';
 export function useDraftPersistence(props = {}) {
-  const { name, phone, monthKey, model, onRestore } = props || {};
+  const { name, phone, monthKey, model, onRestore, onRemoteChange } = props || {};
   const [status, setStatus] = useState({ lastSaved: null, restored: false });
-  const lastModelRef = useRef(model);
+  const onRestoreRef = useRef(onRestore);
+  onRestoreRef.current = onRestore;
+  const onRemoteChangeRef = useRef(onRemoteChange);
+  onRemoteChangeRef.current = onRemoteChange;
+  const draftIdRef = useRef(null);
+  draftIdRef.current = name && phone && monthKey ? generateDraftId(name, phone, monthKey) : null;
 
   useEffect(() => {
-    const crashed = dataPersistence.checkCrashedSessions();
-    if (crashed && crashed.length && onRestore) {
-      onRestore(crashed[0].data);
-      setStatus(s => ({ ...s, restored: true }));
-    }
+    let cancelled = false;
+    dataPersistence.checkCrashedSessions().then(crashed => {
+      if (!cancelled && crashed.length && onRestoreRef.current) {
+        onRestoreRef.current(crashed[0].data);
+        setStatus(s => ({ ...s, restored: true }));
+      }
+    }).catch(error => console.error('Crash recovery check failed:', error));
     const unsub = dataPersistence.subscribe(({ type, payload }) => {
+      if (payload?.draftId !== draftIdRef.current) return;
       if (type === 'save') setStatus(s => ({ ...s, lastSaved: Date.now() }));
+      // The same draft was edited in another tab: pass on just the fields it changed
+      if (type === 'remote' && onRemoteChangeRef.current) {
+        const changes = {};
+        payload.fields.forEach(field => { changes[field] = payload.data[field]; });
+        onRemoteChangeRef.current(changes, payload.data);
+      }
     });
-    return () => unsub();
-  }, [onRestore]);
+    return () => { cancelled = true; unsub(); };
+  }, []);
 
+  // Unchanged models and fields are skipped by the draft store, so every model change can be handed over
   useEffect(() => {
-    if (!model) return;
-    const snapshot = JSON.stringify(model);
-    const lastSnapshot = JSON.stringify(lastModelRef.current);
-    if (snapshot !== lastSnapshot) {
-      // Only save if we have the minimum required data
-      if (name && phone && monthKey) {
-        // Use requestAnimationFrame to ensure DOM updates complete before auto-save
-        // This prevents cursor ejection during typing
-        requestAnimationFrame(() => {
-          dataPersistence.saveDraft({ ...model, name, phone, monthKey });
-        });
-      }
-      lastModelRef.current = model;
-    }
+    if (!model || !name || !phone || !monthKey) return;
+    dataPersistence.saveDraft({ ...model, name, phone, monthKey });
   }, [model, name, phone, monthKey]);
 
-  const restore = () => {
+  const restore = useCallback(async () => {
     // Only attempt to restore if we have the minimum required data
     if (name && phone && monthKey) {
-      const d = dataPersistence.getDraft(name, phone, monthKey);
-      if (d && onRestore) onRestore(d);
+      const d = await dataPersistence.getDraft(name, phone, monthKey);
+      if (d && onRestoreRef.current) onRestoreRef.current(d);
     }
-  };
-  const clear = () => {
+  }, [name, phone, monthKey]);
+  const clear = useCallback(() => {
     // Only attempt to clear if we have the minimum required data
     if (name && phone && monthKey) {
-      dataPersistence.deleteDraft(name, phone, monthKey);
+      return dataPersistence.deleteDraft(name, phone, monthKey);
     }
-  };
+    return Promise.resolve();
+  }, [name, phone, monthKey]);
+  const saveDraft = useCallback((draftData, options) => dataPersistence.saveDraft(draftData, options), []);
+  const deleteDraft = useCallback((draft) => dataPersistence.deleteDraft(draft.name, draft.phone, draft.monthKey), []);
+  const getUserDrafts = useCallback((userName, userPhone) => dataPersistence.getUserDrafts(userName, userPhone), []);
 
-  return { status, restore, clear };
+  return useMemo(
+    () => ({ status, restore, clear, saveDraft, deleteDraft, getUserDrafts }),
+    [status, restore, clear, saveDraft, deleteDraft, getUserDrafts]
+  );
 }
-
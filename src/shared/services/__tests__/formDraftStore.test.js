@@ -0,0 +1,179 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { FormDraftStore } from '../formDraftStore';
+import { OfflineStore, createMemoryBackend } from '../offlineStore';
+
+// In-memory stand-in for the /api/drafts endpoints (same rules as patch_form_draft)
+const createServer = () => {
+  const drafts = new Map();
+  const server = {
+    drafts,
+    load: vi.fn(async (formId) => {
+      const draft = drafts.get(formId);
+      return draft ? { version: draft.version, data: { ...draft.data } } : null;
+    }),
+    patch: vi.fn(async (formId, { baseVersion, changed, removed }) => {
+      const draft = drafts.get(formId) || { version: 0, data: {}, fieldVersions: {} };
+      const fields = [...Object.keys(changed), ...removed];
+      const conflicts = fields.filter(field => (draft.fieldVersions[field] || 0) > baseVersion);
+      if (conflicts.length) {
+        return { applied: false, version: draft.version, data: { ...draft.data }, conflicts };
+      }
+      const version = draft.version + 1;
+      const data = { ...draft.data, ...changed };
+      removed.forEach(field => delete data[field]);
+      const fieldVersions = { ...draft.fieldVersions };
+      fields.forEach(field => { fieldVersions[field] = version; });
+      drafts.set(formId, { version, data, fieldVersions });
+      return { applied: true, version, conflicts: [] };
+    }),
+    remove: vi.fn(async (formId) => {
+      drafts.delete(formId);
+    })
+  };
+  return server;
+};
+
+// Two ends of a BroadcastChannel
+const createChannelPair = () => {
+  const ends = [0, 1].map(() => ({ listeners: [], other: null }));
+  ends.forEach((end, index) => {
+    end.other = ends[1 - index];
+    end.addEventListener = (type, listener) => end.listeners.push(listener);
+    end.removeEventListener = () => {};
+    end.postMessage = (data) => end.other.listeners.forEach(listener => listener({ data }));
+  });
+  return ends;
+};
+
+describe('FormDraftStore', () => {
+  let storage;
+  let server;
+  let stores;
+
+  const createStore = (options = {}) => {
+    const store = new FormDraftStore({
+      formId: 'onboarding',
+      owner: 'u1',
+      storage,
+      transport: server,
+      channel: { addEventListener() {}, removeEventListener() {}, postMessage() {} },
+      delay: 60000,
+      ...options
+    });
+    stores.push(store);
+    return store;
+  };
+
+  beforeEach(() => {
+    storage = new OfflineStore({ backend: createMemoryBackend() });
+    server = createServer();
+    stores = [];
+  });
+
+  afterEach(() => {
+    stores.forEach(store => store.close());
+    clearTimeout(storage.retryTimer);
+  });
+
+  it('coalesces edits and sends only the changed fields', async () => {
+    const store = createStore();
+    store.update({ name: 'A', notes: '' });
+    store.update({ name: 'Ac', notes: '' });
+    store.update({ name: 'Acme', notes: '' });
+    await store.flush();
+
+    expect(server.patch).toHaveBeenCalledTimes(1);
+    expect(server.patch.mock.calls[0][1]).toMatchObject({ baseVersion: 0, changed: { name: 'Acme', notes: '' }, removed: [] });
+
+    store.update({ name: 'Acme', notes: 'Call on Monday' });
+    await store.flush();
+    expect(server.patch.mock.calls[1][1]).toMatchObject({ baseVersion: 1, changed: { notes: 'Call on Monday' } });
+    expect(store.getDirtyFields()).toEqual([]);
+  });
+
+  it('skips saves when nothing changed', async () => {
+    const store = createStore();
+    store.update({ name: 'Acme' });
+    await store.flush();
+    server.patch.mockClear();
+
+    store.update({ name: 'Acme' });
+    await store.flush();
+    expect(server.patch).not.toHaveBeenCalled();
+    expect(store.getStats().skipped).toBe(1);
+  });
+
+  it('keeps credentials out of server patches', async () => {
+    const store = createStore({ localOnlyFields: ['websiteCredentials'] });
+    store.update({ name: 'Acme', websiteCredentials: { password: 'secret' } });
+    await store.flush();
+
+    expect(server.patch.mock.calls[0][1].changed).toEqual({ name: 'Acme' });
+    expect(await storage.getDraft(store.storageKey)).toEqual({ name: 'Acme', websiteCredentials: { password: 'secret' } });
+  });
+
+  it('merges patches from another tab and keeps this tab\'s own edits', async () => {
+    const [channelA, channelB] = createChannelPair();
+    const tabA = createStore({ channel: channelA });
+    const tabB = createStore({ channel: channelB });
+    const onRemote = vi.fn();
+    tabB.subscribe(onRemote);
+
+    tabA.update({ name: 'Acme', city: 'Pune' });
+    tabB.update({ name: 'Acme Health' });
+    await tabA.flush();
+
+    expect(tabB.current).toEqual({ name: 'Acme Health', city: 'Pune' });
+    expect(tabB.conflicts).toEqual([{ field: 'name', local: 'Acme Health', remote: 'Acme', source: 'tab' }]);
+    expect(onRemote).toHaveBeenCalledWith(expect.objectContaining({ type: 'remote' }));
+  });
+
+  it('rebases on a conflicting server save and resends its newer edit', async () => {
+    const laptop = createStore();
+    laptop.update({ name: 'Acme', city: 'Pune' });
+    await laptop.flush();
+
+    const phone = createStore({ storage: new OfflineStore({ backend: createMemoryBackend() }) });
+    await phone.load();
+    phone.update({ name: 'Acme Clinic', city: 'Pune', budget: 500 });
+    await phone.flush();
+
+    laptop.update({ name: 'Acme Hospital', city: 'Pune' });
+    await laptop.flush();
+
+    expect(server.drafts.get('onboarding').data).toEqual({ name: 'Acme Hospital', city: 'Pune', budget: 500 });
+    expect(laptop.current).toEqual({ name: 'Acme Hospital', city: 'Pune', budget: 500 });
+    expect(laptop.conflicts).toEqual([{ field: 'name', local: 'Acme Hospital', remote: 'Acme Clinic', source: 'server' }]);
+  });
+
+  it('restores the server copy with local unsynced edits on top', async () => {
+    const store = createStore();
+    store.update({ name: 'Acme', city: 'Pune' });
+    await store.flush();
+
+    // Edited offline here, while another device changed the city
+    server.patch.mockRejectedValueOnce(new TypeError('Failed to fetch'));
+    store.update({ name: 'Acme Health', city: 'Pune' });
+    await store.flush();
+    expect(store.status).toBe('offline');
+    const draft = server.drafts.get('onboarding');
+    server.drafts.set('onboarding', { ...draft, version: 2, data: { ...draft.data, city: 'Mumbai' }, fieldVersions: { ...draft.fieldVersions, city: 2 } });
+
+    const reopened = createStore();
+    expect(await reopened.load()).toEqual({ name: 'Acme Health', city: 'Mumbai' });
+    expect(reopened.getDirtyFields()).toEqual(['name']);
+  });
+
+  it('clears the draft locally, on the server and in other tabs', async () => {
+    const [channelA, channelB] = createChannelPair();
+    const tabA = createStore({ channel: channelA });
+    const tabB = createStore({ channel: channelB });
+    tabA.update({ name: 'Acme' });
+    await tabA.flush();
+
+    await tabA.clear();
+    expect(await storage.getDraft(tabA.storageKey)).toBeNull();
+    expect(server.remove).toHaveBeenCalled();
+    expect(tabB.current).toEqual({});
+  });
+});
@@ -0,0 +1,96 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const rpc = vi.fn();
+
+vi.mock('../../lib/supabase', () => ({
+  supabase: { rpc: (...args) => rpc(...args) }
+}));
+
+const { default: leaderboardService, toLeaderboardEntry } = await import('../leaderboardService');
+
+const row = (overrides = {}) => ({
+  month_key: '2026-09',
+  employee_id: 'u1',
+  name: 'Asha',
+  role: 'SEO',
+  department: 'Marketing',
+  score: '91.50',
+  growth_percentage: '-3',
+  tasks_completed: 12,
+  learning_hours: '4',
+  rank: 1,
+  overall_rank: 1,
+  department_rank: 1,
+  ...overrides
+});
+
+describe('toLeaderboardEntry', () => {
+  it('maps numeric strings and derives the trend', () => {
+    const entry = toLeaderboardEntry(row());
+    expect(entry).toMatchObject({
+      employeeId: 'u1',
+      score: 91.5,
+      change: -3,
+      trend: 'down',
+      learningHours: 4,
+      rank: 1
+    });
+  });
+
+  it('fills defaults for users missing from unified_users', () => {
+    const entry = toLeaderboardEntry(row({ name: null, department: null, growth_percentage: null }));
+    expect(entry.name).toBe('Unknown');
+    expect(entry.department).toBe('General');
+    expect(entry.trend).toBe('stable');
+  });
+});
+
+describe('leaderboardService', () => {
+  beforeEach(() => {
+    rpc.mockReset();
+    leaderboardService.clearCache();
+  });
+
+  it('requests the top N once and serves repeats from cache', async () => {
+    rpc.mockResolvedValue({ data: [row(), row({ employee_id: 'u2', rank: 2 })], error: null });
+
+    const first = await leaderboardService.getTopPerformers({ department: 'Marketing', limit: 2 });
+    const second = await leaderboardService.getTopPerformers({ department: 'Marketing', limit: 2 });
+
+    expect(rpc).toHaveBeenCalledTimes(1);
+    expect(rpc).toHaveBeenCalledWith('get_leaderboard_top', {
+      p_month_key: null,
+      p_department: 'Marketing',
+      p_limit: 2
+    });
+    expect(second).toBe(first);
+    expect(first.map(entry => entry.rank)).toEqual([1, 2]);
+  });
+
+  it('asks for neighbours by employee id', async () => {
+    rpc.mockResolvedValue({ data: [row({ employee_id: '42', rank: 7 })], error: null });
+
+    const entries = await leaderboardService.getRankWithNeighbours(42, { monthKey: '2026-09', radius: 1 });
+
+    expect(rpc).toHaveBeenCalledWith('get_leaderboard_neighbours', {
+      p_employee_id: '42',
+      p_month_key: '2026-09',
+      p_department: null,
+      p_radius: 1
+    });
+    expect(entries[0].rank).toBe(7);
+  });
+
+  it('returns nothing without an employee id', async () => {
+    expect(await leaderboardService.getRankWithNeighbours(null)).toEqual([]);
+    expect(rpc).not.toHaveBeenCalled();
+  });
+
+  it('propagates RPC errors without caching them', async () => {
+    rpc.mockResolvedValueOnce({ data: null, error: new Error('boom') });
+    await expect(leaderboardService.getTopPerformers()).rejects.toThrow('boom');
+
+    rpc.mockResolvedValueOnce({ data: [row()], error: null });
+    await expect(leaderboardService.getTopPerformers()).resolves.toHaveLength(1);
+  });
+});
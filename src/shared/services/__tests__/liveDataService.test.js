@@ -0,0 +1,81 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+
+const rpc = vi.fn();
+const tableData = {};
+
+// Query builder that resolves to the rows registered for a table
+const query = (name) => {
+  const builder = {
+    select: () => builder,
+    eq: () => builder,
+    limit: () => builder,
+    single: () => builder,
+    then: (resolve, reject) => Promise.resolve(tableData[name] ?? { data: null, error: { message: `${name} unavailable` } }).then(resolve, reject)
+  };
+  return builder;
+};
+
+vi.mock('../../lib/supabase', () => ({
+  supabase: { rpc: (...args) => rpc(...args), from: (name) => query(name) }
+}));
+
+const { default: liveDataService } = await import('../liveDataService');
+const { queryCache } = await import('../queryCache');
+
+describe('liveDataService dashboard stats', () => {
+  beforeEach(() => {
+    queryCache.clear();
+    Object.keys(tableData).forEach(name => delete tableData[name]);
+    rpc.mockReset();
+    vi.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  it('maps the stats function result', async () => {
+    rpc.mockResolvedValue({ data: { team_size: 9, active_projects: 4, avg_overall_score: '72.60' }, error: null });
+
+    const stats = await liveDataService.getDashboardStats('manager');
+
+    expect(rpc).toHaveBeenCalledWith('get_manager_dashboard_stats');
+    expect(stats).toEqual({ teamSize: 9, activeProjects: 4, completionRate: 85, teamPerformance: 73 });
+  });
+
+  it('aggregates from tables when a stats function fails', async () => {
+    rpc.mockResolvedValue({ data: null, error: { message: 'function does not exist' } });
+    tableData.dashboard_active_user_buckets = { data: { employees: 10, interns: 3, freelancers: 2, managers: 1 }, error: null };
+    tableData.clients = { data: [{ id: 'c1' }, { id: 'c2' }], error: null };
+    tableData.monthly_kpi_reports = { data: [{ client_satisfaction_score: 80, overall_score: 70 }, { client_satisfaction_score: 91, overall_score: 90 }], error: null };
+    tableData.employee_performance = { data: [{ id: 'p1', performance_status: 'pending' }, { id: 'p2', performance_status: 'done' }], error: null };
+    tableData.unified_users = { data: [{ id: 'u1' }, { id: 'u2' }, { id: 'u3' }], error: null };
+
+    await expect(liveDataService.getSuperAdminStats()).resolves.toEqual({
+      totalEmployees: 16,
+      activeProjects: 2,
+      monthlyRevenue: `₹${(100000).toLocaleString()}`,
+      clientSatisfaction: 86
+    });
+    await expect(liveDataService.getHRStats()).resolves.toEqual({
+      totalEmployees: 16,
+      pendingReviews: 1,
+      newHires: 3,
+      departments: 12
+    });
+    await expect(liveDataService.getManagerStats()).resolves.toEqual({
+      teamSize: 3,
+      activeProjects: 2,
+      completionRate: 85,
+      teamPerformance: 80
+    });
+  });
+
+  it('returns partial stats when some tables fail too', async () => {
+    rpc.mockResolvedValue({ data: null, error: { message: 'timeout' } });
+    tableData.unified_users = { data: [{ id: 'u1' }], error: null };
+
+    await expect(liveDataService.getManagerStats()).resolves.toEqual({
+      teamSize: 1,
+      activeProjects: 0,
+      completionRate: 85,
+      teamPerformance: 0
+    });
+  });
+});
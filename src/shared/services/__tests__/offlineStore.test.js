@@ -0,0 +1,208 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { OfflineStore, createMemoryBackend } from '../offlineStore';
+
+const fieldWrites = (backend) => backend.write.mock.calls
+  .flatMap(([ops]) => ops)
+  .filter(op => op.store === 'draftFields' && op.type === 'put')
+  .map(op => op.value.field);
+
+// Minimal Supabase query builder that records each write
+const createClient = (results = []) => {
+  const calls = [];
+  const client = {
+    calls,
+    from(table) {
+      const call = { table };
+      const builder = {
+        insert: (payload) => Object.assign(call, { op: 'insert', payload }) && builder,
+        update: (payload) => Object.assign(call, { op: 'update', payload }) && builder,
+        upsert: (payload) => Object.assign(call, { op: 'upsert', payload }) && builder,
+        delete: () => Object.assign(call, { op: 'delete' }) && builder,
+        match: (match) => Object.assign(call, { match }) && builder,
+        select: async () => {
+          calls.push(call);
+          const result = results.shift() || { data: [call.payload], error: null };
+          if (result instanceof Error) throw result;
+          return result;
+        }
+      };
+      return builder;
+    }
+  };
+  return client;
+};
+
+describe('OfflineStore', () => {
+  let backend;
+  let store;
+
+  beforeEach(() => {
+    backend = createMemoryBackend();
+    vi.spyOn(backend, 'write');
+    store = new OfflineStore({ backend });
+  });
+
+  afterEach(() => {
+    clearTimeout(store.retryTimer);
+  });
+
+  it('writes only the fields that changed since the last save', async () => {
+    await store.saveDraft('form', { name: 'Asha', services: ['SEO'], notes: 'x' });
+    expect(fieldWrites(backend).sort()).toEqual(['name', 'notes', 'services']);
+
+    backend.write.mockClear();
+    const result = await store.saveDraft('form', { name: 'Asha', services: ['SEO', 'Ads'], notes: 'x' });
+    expect(result.fields).toBe(1);
+    expect(fieldWrites(backend)).toEqual(['services']);
+
+    backend.write.mockClear();
+    expect((await store.saveDraft('form', { name: 'Asha', services: ['SEO', 'Ads'], notes: 'x' })).fields).toBe(0);
+    expect(backend.write).not.toHaveBeenCalled();
+    expect(store.getStats().unchangedSaves).toBe(1);
+  });
+
+  it('reassembles drafts from their field records, including removals', async () => {
+    const startDate = new Date('2026-10-01T00:00:00Z');
+    await store.saveDraft('form', { name: 'Asha', startDate, draftOnly: true });
+    await store.saveDraft('form', { name: 'Asha Rao', startDate });
+
+    // A fresh store has nothing cached and reads the records back
+    const reopened = new OfflineStore({ backend });
+    const draft = await reopened.getDraft('form');
+    expect(draft).toEqual({ name: 'Asha Rao', startDate });
+    expect(draft.startDate instanceof Date).toBe(true);
+    expect(await reopened.getDraft('missing')).toBeNull();
+  });
+
+  it('keeps its own copy of saved values', async () => {
+    const model = { clients: [{ name: 'Acme' }] };
+    await store.saveDraft('form', model);
+    model.clients[0].name = 'Changed';
+
+    expect((await store.getDraft('form')).clients[0].name).toBe('Acme');
+    expect((await store.saveDraft('form', model)).fields).toBe(1);
+  });
+
+  it('lists and deletes drafts by prefix', async () => {
+    await store.saveDraft('draft:a', { value: 1 });
+    await store.saveDraft('draft:b', { value: 2 });
+    await store.saveDraft('other', { value: 3 });
+
+    expect((await store.listDrafts('draft:')).map(draft => draft.key).sort()).toEqual(['draft:a', 'draft:b']);
+    expect(await store.clearDrafts('draft:')).toBe(2);
+    expect((await store.listDrafts()).map(draft => draft.key)).toEqual(['other']);
+    expect(await backend.getAll('draftFields', 'draft:a')).toEqual([]);
+  });
+
+  it('evicts expired and least recently saved drafts', async () => {
+    vi.useFakeTimers();
+    try {
+      store = new OfflineStore({ backend, maxDraftBytes: 100, maxDraftAge: 10000 });
+      vi.setSystemTime(0);
+      await store.saveDraft('old', { text: 'a'.repeat(10) });
+      vi.setSystemTime(20000);
+      await store.saveDraft('older', { text: 'b'.repeat(30) });
+      vi.setSystemTime(21000);
+      await store.saveDraft('newer', { text: 'c'.repeat(30) });
+      vi.setSystemTime(22000);
+      await store.saveDraft('newest', { text: 'd'.repeat(5) });
+
+      const evicted = await store.evictDrafts({ protect: 'newest' });
+      expect(evicted).toEqual(['old', 'older']);
+      expect((await store.listDrafts()).map(draft => draft.key)).toEqual(['newest', 'newer']);
+      expect(store.getStats().evictions).toBe(2);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it('evicts and retries once when storage is full', async () => {
+    await store.saveDraft('old', { text: 'old draft' });
+    const quotaError = Object.assign(new Error('full'), { name: 'QuotaExceededError' });
+    backend.write.mockRejectedValueOnce(quotaError);
+
+    await store.saveDraft('current', { text: 'current draft' });
+    expect(await store.getDraft('old')).toBeNull();
+    expect(await new OfflineStore({ backend }).getDraft('current')).toEqual({ text: 'current draft' });
+  });
+
+  it('coalesces consecutive updates to the same row', async () => {
+    const first = await store.enqueue({ table: 'clients', op: 'update', match: { id: 'c1' }, payload: { name: 'A' } });
+    const second = await store.enqueue({ table: 'clients', op: 'update', match: { id: 'c1' }, payload: { status: 'active' } });
+    await store.enqueue({ table: 'clients', op: 'update', match: { id: 'c2' }, payload: { name: 'B' } });
+
+    expect(second).toBe(first);
+    const queue = await store.getQueue();
+    expect(queue).toHaveLength(2);
+    expect(queue[0].payload).toEqual({ name: 'A', status: 'active' });
+    expect(store.getStats().coalesced).toBe(1);
+  });
+
+  it('replays queued writes in order and drops their local records', async () => {
+    await store.putRecord('clients', { id: 'local-1', name: 'Acme' });
+    await store.enqueue({ table: 'clients', op: 'insert', payload: { name: 'Acme' }, record: { collection: 'clients', id: 'local-1' } });
+    await store.enqueue({ table: 'clients', op: 'delete', match: { id: 'c9' } });
+
+    const client = createClient();
+    store.getClient = async () => client;
+    const listener = vi.fn();
+    store.subscribe(listener);
+
+    expect(await store.replay()).toEqual({ replayed: 2, remaining: 0 });
+    expect(client.calls.map(call => call.op)).toEqual(['insert', 'delete']);
+    expect(client.calls[1].match).toEqual({ id: 'c9' });
+    expect(await store.getQueue()).toEqual([]);
+    expect(await store.getRecords('clients')).toEqual([]);
+    expect(listener).toHaveBeenCalledWith(expect.objectContaining({ type: 'queue:replayed' }));
+  });
+
+  it('does not merge new updates into a write that is being replayed', async () => {
+    await store.enqueue({ table: 'clients', op: 'update', match: { id: 'c1' }, payload: { name: 'A' } });
+    let respond;
+    const client = createClient([new Promise(resolve => { respond = resolve; })]);
+    store.getClient = async () => client;
+
+    const replaying = store.replay();
+    await vi.waitFor(() => expect(client.calls).toHaveLength(1));
+    await store.enqueue({ table: 'clients', op: 'update', match: { id: 'c1' }, payload: { status: 'active' } });
+    respond({ data: [{ id: 'c1' }], error: null });
+
+    expect(await replaying).toEqual({ replayed: 1, remaining: 0 });
+    const queue = await store.getQueue();
+    expect(queue).toHaveLength(1);
+    expect(queue[0].payload).toEqual({ status: 'active' });
+
+    expect(await store.replay()).toEqual({ replayed: 1, remaining: 0 });
+    expect(client.calls.map(call => call.payload)).toEqual([{ name: 'A' }, { status: 'active' }]);
+  });
+
+  it('keeps the queue when the network is down', async () => {
+    await store.enqueue({ table: 'clients', op: 'insert', payload: { name: 'Acme' } });
+    await store.enqueue({ table: 'clients', op: 'insert', payload: { name: 'Beta' } });
+    const client = createClient([new TypeError('Failed to fetch')]);
+    store.getClient = async () => client;
+
+    expect(await store.replay()).toEqual({ replayed: 0, remaining: 2 });
+    const queue = await store.getQueue();
+    expect(queue).toHaveLength(2);
+    expect(queue[0].attempts).toBe(0);
+  });
+
+  it('marks a rejected write failed after maxAttempts and moves past it', async () => {
+    store = new OfflineStore({ backend, maxAttempts: 2 });
+    await store.enqueue({ table: 'clients', op: 'insert', payload: { name: 'Bad' } });
+    await store.enqueue({ table: 'clients', op: 'insert', payload: { name: 'Good' } });
+    const rejected = { data: null, error: { message: 'duplicate key value' } };
+    const client = createClient([rejected, rejected]);
+    store.getClient = async () => client;
+
+    expect(await store.replay()).toEqual({ replayed: 0, remaining: 2 });
+    expect(await store.replay()).toEqual({ replayed: 0, remaining: 2 });
+    expect(store.getStats().failed).toBe(1);
+
+    expect(await store.replay()).toEqual({ replayed: 1, remaining: 0 });
+    const queue = await store.getQueue();
+    expect(queue).toHaveLength(1);
+    expect(queue[0]).toMatchObject({ failed: true, attempts: 2, lastError: 'duplicate key value' });
+  });
+});
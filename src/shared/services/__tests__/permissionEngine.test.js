@@ -0,0 +1,54 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { PermissionEngine } from '../permissionEngine';
+
+// Minimal stand-in for supabase.from('role_permissions').select(...)
+const createClient = (rows) => {
+  const client = {
+    rows,
+    select: vi.fn(async () => ({ data: client.rows, error: null })),
+    from: () => client,
+    channel: () => ({ on() { return this; }, subscribe() { return this; } }),
+    removeChannel: () => {}
+  };
+  return client;
+};
+
+describe('PermissionEngine', () => {
+  let client;
+  let engine;
+
+  beforeEach(() => {
+    client = createClient([{ role: 'SEO', resource: 'seo_reports', action: 'read', allowed: true }]);
+    engine = new PermissionEngine({ client });
+  });
+
+  it('loads role_permissions once for any number of checks', async () => {
+    await Promise.all([engine.load(), engine.load(), engine.load()]);
+    expect(client.select).toHaveBeenCalledTimes(1);
+    expect(engine.isReady()).toBe(true);
+    for (let i = 0; i < 100; i++) engine.can('SEO', 'seo_reports', 'read');
+    expect(engine.can('SEO', 'seo_reports', 'read')).toBe(true);
+    expect(engine.getStats().checks).toBe(101);
+  });
+
+  it('merges sources and notifies subscribers on recompile', async () => {
+    const listener = vi.fn();
+    engine.subscribe(listener);
+    engine.setSource('guards', [{ role: 'SEO', resource: 'clients', action: 'access' }]);
+    await engine.load();
+
+    expect(engine.can('SEO', 'clients', 'access')).toBe(true);
+    expect(engine.can('SEO', 'seo_reports', 'read')).toBe(true);
+    expect(listener).toHaveBeenCalledTimes(2);
+  });
+
+  it('reloads when permissions change', async () => {
+    await engine.load();
+    client.rows = [];
+    await engine.load({ force: true });
+    expect(engine.can('SEO', 'seo_reports', 'read')).toBe(false);
+
+    engine.reset();
+    expect(engine.isReady()).toBe(false);
+  });
+});
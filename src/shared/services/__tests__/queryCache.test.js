@@ -0,0 +1,75 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { QueryCache } from '../queryCache';
+
+describe('QueryCache', () => {
+  let cache;
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    cache = new QueryCache({ maxEntries: 3, ttl: 1000, staleWhileRevalidate: 1000 });
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('serves fresh values from the cache', async () => {
+    const fetcher = vi.fn().mockResolvedValue('a');
+    expect(await cache.fetch('k', fetcher)).toBe('a');
+    expect(await cache.fetch('k', fetcher)).toBe('a');
+    expect(fetcher).toHaveBeenCalledTimes(1);
+    expect(cache.getStats().hits).toBe(1);
+  });
+
+  it('shares one in-flight request between concurrent callers', async () => {
+    const fetcher = vi.fn().mockResolvedValue('a');
+    const results = await Promise.all([cache.fetch('k', fetcher), cache.fetch('k', fetcher)]);
+    expect(results).toEqual(['a', 'a']);
+    expect(fetcher).toHaveBeenCalledTimes(1);
+    expect(cache.getStats().dedupedRequests).toBe(1);
+  });
+
+  it('returns stale data while revalidating in the background', async () => {
+    await cache.fetch('k', () => Promise.resolve('old'));
+    vi.advanceTimersByTime(1500);
+
+    const fetcher = vi.fn().mockResolvedValue('new');
+    expect(await cache.fetch('k', fetcher)).toBe('old');
+    for (let i = 0; i < 5; i++) await Promise.resolve();
+    expect(fetcher).toHaveBeenCalledTimes(1);
+    expect(cache.peek('k')).toBe('new');
+  });
+
+  it('refetches once the stale window has passed', async () => {
+    await cache.fetch('k', () => Promise.resolve('old'));
+    vi.advanceTimersByTime(2500);
+    expect(await cache.fetch('k', () => Promise.resolve('new'))).toBe('new');
+  });
+
+  it('does not cache failures', async () => {
+    await expect(cache.fetch('k', () => Promise.reject(new Error('boom')))).rejects.toThrow('boom');
+    expect(cache.peek('k')).toBeNull();
+    expect(await cache.fetch('k', () => Promise.resolve('ok'))).toBe('ok');
+  });
+
+  it('invalidates entries by table', async () => {
+    await cache.fetch('users', () => Promise.resolve(1), { tables: ['unified_users'] });
+    await cache.fetch('clients', () => Promise.resolve(2), { tables: ['clients'] });
+
+    expect(cache.invalidateTables('unified_users')).toBe(1);
+    expect(cache.peek('users')).toBeNull();
+    expect(cache.peek('clients')).toBe(2);
+  });
+
+  it('evicts the least recently used entry', async () => {
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('c', 3);
+    await cache.fetch('a', () => Promise.resolve(0));
+    cache.set('d', 4);
+
+    expect(cache.peek('b')).toBeNull();
+    expect(cache.peek('a')).toBe(1);
+    expect(cache.getStats().evictions).toBe(1);
+  });
+});
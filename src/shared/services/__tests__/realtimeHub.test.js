@@ -0,0 +1,91 @@
+import { describe, it, expect, vi } from 'vitest';
+import { RealtimeHub, coalesceEvents } from '../realtimeHub';
+
+const tick = () => new Promise(resolve => setTimeout(resolve, 5));
+
+const createFakeSupabase = () => {
+  const channels = [];
+  return {
+    channels,
+    removed: [],
+    channel(name) {
+      const channel = {
+        name,
+        bindings: [],
+        on(type, config, handler) {
+          channel.bindings.push({ config, handler });
+          return channel;
+        },
+        subscribe(callback) {
+          callback('SUBSCRIBED');
+          return channel;
+        }
+      };
+      channels.push(channel);
+      return channel;
+    },
+    removeChannel(channel) {
+      this.removed.push(channel);
+    }
+  };
+};
+
+describe('coalesceEvents', () => {
+  it('merges changes to the same row', () => {
+    const events = coalesceEvents([
+      { table: 't', eventType: 'INSERT', new: { id: 1, v: 1 }, old: {} },
+      { table: 't', eventType: 'UPDATE', new: { id: 1, v: 2 }, old: { id: 1 } },
+      { table: 't', eventType: 'UPDATE', new: { id: 2, v: 1 }, old: { id: 2 } },
+      { table: 't', eventType: 'INSERT', new: { id: 3 }, old: {} },
+      { table: 't', eventType: 'DELETE', new: {}, old: { id: 3 } }
+    ]);
+
+    expect(events.map(e => [e.eventType, e.new.id, e.new.v])).toEqual([
+      ['INSERT', 1, 2],
+      ['UPDATE', 2, 1]
+    ]);
+  });
+});
+
+describe('RealtimeHub', () => {
+  it('shares one channel and one binding between listeners', async () => {
+    const supabase = createFakeSupabase();
+    const hub = new RealtimeHub({ batchWindow: 0 });
+    const first = vi.fn();
+    const second = vi.fn();
+
+    const unsubscribeFirst = hub.subscribe(supabase, { table: 'tasks', filter: 'user_id=eq.1', scope: '1' }, first);
+    hub.subscribe(supabase, { table: 'tasks', filter: 'user_id=eq.1', scope: '1' }, second);
+    hub.subscribe(supabase, { table: 'kpis', filter: 'user_id=eq.1', scope: '1' }, vi.fn());
+    await tick();
+
+    expect(supabase.channels).toHaveLength(1);
+    expect(supabase.channels[0].bindings).toHaveLength(2);
+
+    const [tasks] = supabase.channels[0].bindings;
+    tasks.handler({ eventType: 'UPDATE', new: { id: 7, v: 1 }, old: { id: 7 } });
+    tasks.handler({ eventType: 'UPDATE', new: { id: 7, v: 2 }, old: { id: 7 } });
+    await tick();
+
+    expect(first).toHaveBeenCalledTimes(1);
+    expect(first.mock.calls[0][0]).toHaveLength(1);
+    expect(second).toHaveBeenCalledTimes(1);
+
+    unsubscribeFirst();
+    await tick();
+    expect(supabase.channels).toHaveLength(1);
+    expect(hub.getStats(supabase).listeners).toBe(2);
+  });
+
+  it('closes the channel when the last listener leaves', async () => {
+    const supabase = createFakeSupabase();
+    const hub = new RealtimeHub({ batchWindow: 0 });
+    const unsubscribe = hub.subscribe(supabase, { table: 'tasks', scope: '1' }, vi.fn());
+    await tick();
+    unsubscribe();
+    await tick();
+
+    expect(supabase.removed).toHaveLength(1);
+    expect(hub.getStats(supabase).channels).toBe(0);
+  });
+});
@@ -0,0 +1,93 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { SessionCache } from '../sessionCache';
+
+const sessionFor = (token, overrides = {}) => ({
+  user: { id: `user-${token}`, role: 'SEO' },
+  session: { id: `session-${token}`, session_token: token, expires_at: '2026-10-17T00:00:00.000Z' },
+  ...overrides
+});
+
+describe('SessionCache', () => {
+  let cache;
+  let writeActivity;
+  let loader;
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date('2026-10-16T10:00:00.000Z').getTime());
+    writeActivity = vi.fn().mockResolvedValue(undefined);
+    loader = vi.fn(async (token) => (token.startsWith('valid') ? sessionFor(token) : null));
+    cache = new SessionCache({ ttl: 1000, negativeTtl: 500, flushInterval: 60000, writeActivity });
+  });
+
+  afterEach(() => {
+    clearTimeout(cache.flushTimer);
+    vi.useRealTimers();
+  });
+
+  it('serves a validated session from the cache until the TTL runs out', async () => {
+    const first = await cache.validate('valid-a', loader);
+    expect(await cache.validate('valid-a', loader)).toBe(first);
+    expect(loader).toHaveBeenCalledTimes(1);
+
+    vi.setSystemTime(Date.now() + 1500);
+    await cache.validate('valid-a', loader);
+    expect(loader).toHaveBeenCalledTimes(2);
+  });
+
+  it('remembers invalid tokens briefly and shares in-flight lookups', async () => {
+    const results = await Promise.all([cache.validate('bad', loader), cache.validate('bad', loader)]);
+    expect(results).toEqual([null, null]);
+    expect(await cache.validate('bad', loader)).toBeNull();
+    expect(loader).toHaveBeenCalledTimes(1);
+    expect(cache.getStats().dedupedRequests).toBe(1);
+  });
+
+  it('writes last_activity for many checks in one bulk update', async () => {
+    await cache.validate('valid-a', loader);
+    await cache.validate('valid-b', loader);
+    vi.setSystemTime(Date.now() + 200);
+    await cache.validate('valid-a', loader);
+
+    expect(writeActivity).not.toHaveBeenCalled();
+    expect(await cache.flush()).toBe(2);
+    expect(writeActivity).toHaveBeenCalledTimes(1);
+    expect(writeActivity).toHaveBeenCalledWith(['session-valid-a', 'session-valid-b'], '2026-10-16T10:00:00.200Z');
+    expect(await cache.flush()).toBe(0);
+  });
+
+  it('keeps activity for the next flush when the write fails', async () => {
+    writeActivity.mockRejectedValueOnce(new Error('offline'));
+    await cache.validate('valid-a', loader);
+
+    expect(await cache.flush()).toBe(0);
+    expect(await cache.flush()).toBe(1);
+    expect(writeActivity).toHaveBeenCalledTimes(2);
+  });
+
+  it('refuses a revoked token and does not cache a lookup already in flight', async () => {
+    await cache.validate('valid-a', loader);
+    cache.revoke('valid-a');
+    expect(await cache.validate('valid-a', loader)).toBeNull();
+
+    const pending = cache.validate('valid-b', loader);
+    cache.revokeUser('user-valid-b');
+    await pending;
+    await cache.validate('valid-b', loader);
+    expect(loader).toHaveBeenCalledTimes(3);
+  });
+
+  it('revokes sessions deactivated elsewhere', async () => {
+    await cache.validate('valid-a', loader);
+    await cache.validate('valid-b', loader);
+
+    cache.applySessionChanges([
+      { eventType: 'UPDATE', new: { id: 'session-valid-a', session_token: 'valid-a', is_active: false } },
+      { eventType: 'DELETE', old: { id: 'session-valid-b' } }
+    ]);
+
+    expect(await cache.validate('valid-a', loader)).toBeNull();
+    expect(cache.getStats().size).toBe(0);
+    expect(cache.getStats().revocations).toBe(2);
+  });
+});
@@ -4,10 +4,13 @@
  */
 
 import { supabase } from '../lib/supabase';
+import { queryCache } from './queryCache';
+import leaderboardService from './leaderboardService';
+
+const CACHE_PREFIX = 'agency:';
 
 class AgencyDashboardService {
   constructor() {
-    this.cache = new Map();
     this.cacheTimeout = 5 * 60 * 1000; // 5 minutes
   }
 
@@ -16,33 +19,25 @@ class AgencyDashboardService {
    * @returns {Promise<Object>} Dynamic stats object
    */
   async getAgencyStats() {
-    const cacheKey = 'agency_dashboard_stats';
-    
-    // Check cache first
-    if (this.cache.has(cacheKey)) {
-      const cached = this.cache.get(cacheKey);
-      if (Date.now() - cached.timestamp < this.cacheTimeout) {
-        return cached.data;
-      }
-    }
-
     try {
-      const stats = {
-        q4Targets: await this.getQ4TargetsProgress(),
-        newClients: await this.getNewClientsCount(),
-        totalEmployees: await this.getTotalEmployeesCount(),
-        activeDepartments: await this.getActiveDepartmentsCount(),
-        monthlyRevenue: await this.getMonthlyRevenue(),
-        completionRate: await this.getProjectCompletionRate()
-      };
+      return await queryCache.fetch(`${CACHE_PREFIX}agency_dashboard_stats`, async () => {
+        // The individual metrics are independent, so they are loaded in parallel
+        const [q4Targets, newClients, totalEmployees, activeDepartments, monthlyRevenue, completionRate] =
+          await Promise.all([
+            this.getQ4TargetsProgress(),
+            this.getNewClientsCount(),
+            this.getTotalEmployeesCount(),
+            this.getActiveDepartmentsCount(),
+            this.getMonthlyRevenue(),
+            this.getProjectCompletionRate()
+          ]);
 
-      // Cache the result
-      this.cache.set(cacheKey, {
-        data: stats,
-        timestamp: Date.now()
+        return { q4Targets, newClients, totalEmployees, activeDepartments, monthlyRevenue, completionRate };
+      }, {
+        tables: ['submissions', 'clients', 'unified_users'],
+        ttl: this.cacheTimeout,
+        staleWhileRevalidate: this.cacheTimeout
       });
-
-      return stats;
     } catch (error) {
       console.error('Error fetching agency dashboard stats:', error);
       // Return fallback data
@@ -223,31 +218,24 @@ class AgencyDashboardService {
    */
   async getPerformanceLeaderboard() {
     try {
-      // First try to get submissions with scores
-      const { data: submissions, error } = await supabase
-        .from('submissions')
-        .select('*')
-        .not('overall_score', 'is', null)
-        .order('overall_score', { ascending: false })
-        .limit(10);
-
-      if (error) throw error;
+      const topPerformers = await leaderboardService.getTopPerformers({ limit: 10 });
 
-      if (!submissions || submissions.length === 0) {
-        // Return fallback data if no submissions found
+      if (topPerformers.length === 0) {
+        // Return fallback data if nothing has been ranked yet
         return this.getFallbackLeaderboardData();
       }
 
-      return submissions.map((submission, index) => ({
-        rank: index + 1,
-        name: submission.employee_name,
-        department: submission.department,
-        score: submission.overall_score,
-        profilePicture: null, // Not available in submissions table
-        attendanceDays: (submission.attendance_wfo || 0) + (submission.attendance_wfh || 0),
-        tasksCompleted: submission.tasks_completed || 0,
-        learningHours: this.calculateLearningHours(submission.learning_activities),
-        clientWorkHours: this.calculateClientWorkHours(submission.clients)
+      return topPerformers.map(entry => ({
+        id: entry.employeeId,
+        rank: entry.rank,
+        name: entry.name,
+        department: entry.department,
+        score: entry.score,
+        profilePicture: null, // Not available in the leaderboard
+        attendanceDays: 0, // Not tracked in KPI reports
+        tasksCompleted: entry.tasksCompleted,
+        learningHours: entry.learningHours,
+        clientWorkHours: 0 // Not tracked in KPI reports
       }));
     } catch (error) {
       console.error('Error fetching performance leaderboard:', error);
@@ -255,30 +243,6 @@ class AgencyDashboardService {
     }
   }
 
-  /**
-   * Calculate learning hours from learning activities
-   * @param {Array} learningActivities 
-   * @returns {number} Total learning hours
-   */
-  calculateLearningHours(learningActivities) {
-    if (!learningActivities || !Array.isArray(learningActivities)) return 0;
-    return learningActivities.reduce((total, activity) => {
-      return total + (activity.hours || 0);
-    }, 0);
-  }
-
-  /**
-   * Calculate client work hours from clients data
-   * @param {Array} clients 
-   * @returns {number} Total client work hours
-   */
-  calculateClientWorkHours(clients) {
-    if (!clients || !Array.isArray(clients)) return 0;
-    return clients.reduce((total, client) => {
-      return total + (client.hours || 0);
-    }, 0);
-  }
-
   /**
    * Get fallback leaderboard data
    * @returns {Array} Fallback leaderboard
@@ -348,17 +312,15 @@ class AgencyDashboardService {
    * Clear cache
    */
   clearCache() {
-    this.cache.clear();
+    queryCache.clear(CACHE_PREFIX);
   }
 
   /**
    * Get cache statistics
    */
   getCacheStats() {
-    return {
-      size: this.cache.size,
-      keys: Array.from(this.cache.keys())
-    };
+    const { size, keys } = queryCache.getStats(CACHE_PREFIX);
+    return { size, keys };
   }
 }
 
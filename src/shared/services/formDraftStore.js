@@ -0,0 +1,433 @@
+/**
+ * Form Draft Store
+ * Change tracking for long forms. Edits are recorded per top-level field and
+ * rapid edits are coalesced into one flush; a flush only persists the patch:
+ *
+ * - locally, through the offline store (which writes just the changed fields)
+ * - on the API server, as a PATCH against the draft version it was based on
+ * - to other tabs with the same draft open, over a BroadcastChannel
+ *
+ * Nothing is written when the form has not changed since the last flush.
+ *
+ * Conflicts are reconciled field by field. Fields edited in only one place
+ * merge; when the same field was edited in two places, the most recent edit
+ * wins and the overwritten value is reported through `conflicts`.
+ */
+
+import { diffFields, applyFieldDiff, isEmptyDiff, isEqual } from '../lib/fieldDiff';
+import { offlineStore, isNetworkError } from './offlineStore';
+import { authHeaders } from '../../api/authApi';
+
+const DEFAULT_DELAY = 1500;
+const DEFAULT_MAX_WAIT = 10000;
+const OFFLINE_RETRY_DELAY = 30000;
+
+const clone = typeof structuredClone === 'function' ? structuredClone : (value) => value;
+
+const omitFields = (model, fields) => {
+  if (!fields.length) return model;
+  const result = { ...model };
+  fields.forEach(field => delete result[field]);
+  return result;
+};
+
+/**
+ * Talks to the API server's /api/drafts endpoints. The server keeps one draft
+ * per form for the signed-in user, so requests carry the session token.
+ */
+export const httpDraftTransport = {
+  async load(formId) {
+    const response = await fetch(`/api/drafts/${encodeURIComponent(formId)}`, { headers: authHeaders() });
+    if (response.status === 404) return null;
+    if (!response.ok) throw new Error(`Draft load failed (${response.status})`);
+    return response.json();
+  },
+
+  // Resolves to { applied, version, data?, conflicts }; a 409 is a result, not an error
+  async patch(formId, body) {
+    const response = await fetch(`/api/drafts/${encodeURIComponent(formId)}`, {
+      method: 'PATCH',
+      headers: { 'Content-Type': 'application/json', ...authHeaders() },
+      body: JSON.stringify(body)
+    });
+    const result = await response.json().catch(() => ({}));
+    if (!response.ok && response.status !== 409) {
+      throw new Error(result.error || `Draft save failed (${response.status})`);
+    }
+    return result;
+  },
+
+  async remove(formId) {
+    await fetch(`/api/drafts/${encodeURIComponent(formId)}`, { method: 'DELETE', headers: authHeaders() });
+  }
+};
+
+export class FormDraftStore {
+  /**
+   * @param {Object} options
+   * @param {string} options.formId - draft identity, shared by every tab editing it
+   * @param {string} options.owner - whose draft it is locally (user id, phone, device id); the server uses the session
+   * @param {string} options.storageKey - local draft key (defaults to form:<owner>:<formId>)
+   * @param {Object} options.storage - local store with saveDraft/getDraft/deleteDraft
+   * @param {Object|null} options.transport - server transport, or null for local-only drafts
+   * @param {number} options.delay - quiet period before a flush
+   * @param {number} options.maxWait - longest a change waits while edits keep coming
+   * @param {string[]} options.localOnlyFields - fields never sent to the server (credentials)
+   */
+  constructor({
+    formId,
+    owner = 'anonymous',
+    storageKey = null,
+    storage = offlineStore,
+    transport = httpDraftTransport,
+    channel = null,
+    delay = DEFAULT_DELAY,
+    maxWait = DEFAULT_MAX_WAIT,
+    localOnlyFields = []
+  }) {
+    this.formId = formId;
+    this.owner = owner;
+    this.storage = storage;
+    this.transport = transport;
+    this.delay = delay;
+    this.maxWait = maxWait;
+    this.localOnlyFields = localOnlyFields;
+    this.tabId = Math.random().toString(36).slice(2, 10);
+    this.storageKey = storageKey || `form:${owner}:${formId}`;
+    this.baseKey = `base:${this.storageKey}`; // server copy the local draft was edited from
+
+    this.current = {};
+    this.saved = {}; // last model persisted locally and sent to other tabs
+    this.synced = {}; // last model the server acknowledged
+    this.version = 0;
+    this.conflicts = [];
+    this.status = 'idle'; // 'idle' | 'pending' | 'saving' | 'saved' | 'offline' | 'error'
+    this.lastSaved = null;
+
+    this.timer = null;
+    this.firstChangeAt = null;
+    this.flushing = null;
+    this.listeners = new Set();
+    this.stats = { updates: 0, skipped: 0, flushes: 0, fieldsSaved: 0, fieldsSynced: 0, remotePatches: 0 };
+
+    this.channel = channel || (typeof BroadcastChannel !== 'undefined'
+      ? new BroadcastChannel(`form-draft:${this.storageKey}`)
+      : null);
+    if (this.channel) {
+      this.onMessage = (event) => this.receiveTabMessage(event.data);
+      this.channel.addEventListener('message', this.onMessage);
+    }
+  }
+
+  /**
+   * Restore the draft: the server copy with this browser's unsynced edits on top
+   * @returns {Promise<Object|null>} the restored model
+   */
+  async load() {
+    const [local, localBase] = await Promise.all([
+      this.storage.getDraft(this.storageKey),
+      this.storage.getDraft(this.baseKey)
+    ]);
+    const { __version: baseVersion = 0, ...base } = localBase || {};
+    this.version = baseVersion;
+    this.synced = base;
+
+    if (this.transport) {
+      try {
+        const remote = await this.transport.load(this.formId);
+        if (remote) {
+          this.version = remote.version;
+          this.synced = remote.data || {};
+        }
+      } catch (error) {
+        if (!isNetworkError(error)) console.warn('Server draft unavailable:', error.message);
+      }
+    }
+
+    // Three-way merge: only fields edited locally since the last sync override the server copy
+    const localEdits = local ? diffFields(omitFields(base, this.localOnlyFields), local) : { changed: {}, removed: [] };
+    const model = applyFieldDiff(this.synced, localEdits);
+    if (!local && Object.keys(model).length === 0) return null;
+
+    this.current = model;
+    this.saved = clone(local || model);
+    if (!isEmptyDiff(diffFields(this.saved, model)) || !isEmptyDiff(this.serverDiff())) this.schedule();
+    return clone(model);
+  }
+
+  /**
+   * Record the latest form model. Unchanged models are ignored; changes are
+   * coalesced until the form has been quiet for `delay` (at most `maxWait`).
+   */
+  update(model) {
+    if (isEqual(model, this.current)) {
+      this.stats.skipped++;
+      return;
+    }
+    this.current = model;
+    this.stats.updates++;
+    this.schedule();
+  }
+
+  schedule() {
+    const now = Date.now();
+    if (this.firstChangeAt === null) this.firstChangeAt = now;
+    clearTimeout(this.timer);
+    const wait = Math.max(0, Math.min(this.delay, this.firstChangeAt + this.maxWait - now));
+    this.timer = setTimeout(() => this.flush(), wait);
+    this.setStatus('pending');
+  }
+
+  // Top-level fields not yet persisted (acknowledged by the server, when there is one)
+  getDirtyFields() {
+    const diff = this.transport ? this.serverDiff() : diffFields(this.saved, this.current);
+    return [...Object.keys(diff.changed), ...diff.removed];
+  }
+
+  serverDiff() {
+    return diffFields(omitFields(this.synced, this.localOnlyFields), omitFields(this.current, this.localOnlyFields));
+  }
+
+  /**
+   * Persist pending changes now
+   */
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    this.firstChangeAt = null;
+    // A flush already running has an older model; flush again once it is done
+    if (this.flushing) return this.flushing.then(() => this.flush());
+    this.flushing = this.runFlush().finally(() => {
+      this.flushing = null;
+    });
+    return this.flushing;
+  }
+
+  async runFlush() {
+    const model = this.current;
+    const localDiff = diffFields(this.saved, model);
+    const serverDiff = this.transport ? this.serverDiff() : { changed: {}, removed: [] };
+    if (isEmptyDiff(localDiff) && isEmptyDiff(serverDiff)) {
+      this.setStatus(this.lastSaved ? 'saved' : 'idle');
+      return;
+    }
+
+    this.setStatus('saving');
+    this.stats.flushes++;
+    try {
+      if (!isEmptyDiff(localDiff)) {
+        await this.storage.saveDraft(this.storageKey, model);
+        this.saved = clone(model);
+        this.stats.fieldsSaved += Object.keys(localDiff.changed).length + localDiff.removed.length;
+        this.postToTabs({ type: 'patch', changed: localDiff.changed, removed: localDiff.removed });
+      }
+      if (!isEmptyDiff(serverDiff)) {
+        await this.sendPatch(serverDiff);
+      }
+      this.lastSaved = new Date();
+      if (this.current === model) {
+        this.setStatus('saved');
+      } else {
+        this.schedule();
+      }
+    } catch (error) {
+      if (isNetworkError(error)) {
+        // The patch stays dirty and goes out with the next flush
+        this.setStatus('offline');
+        this.timer = setTimeout(() => this.flush(), OFFLINE_RETRY_DELAY);
+      } else {
+        console.error('Draft save failed:', error);
+        this.setStatus('error');
+      }
+    }
+  }
+
+  async sendPatch(diff, attempt = 0) {
+    const result = await this.transport.patch(this.formId, {
+      baseVersion: this.version,
+      changed: diff.changed,
+      removed: diff.removed
+    });
+
+    if (result.applied) {
+      this.version = result.version;
+      this.synced = applyFieldDiff(this.synced, clone(diff));
+      this.stats.fieldsSynced += Object.keys(diff.changed).length + diff.removed.length;
+      await this.storage.saveDraft(this.baseKey, { ...this.synced, __version: this.version });
+      return;
+    }
+
+    // Another tab or device saved some of these fields since our base version:
+    // take the server copy as the new base, keep our edits on top and resend
+    if (attempt >= 2) throw new Error('Draft kept conflicting with newer saves');
+    this.rebase(result, diff);
+    await this.sendPatch(this.serverDiff(), attempt + 1);
+  }
+
+  rebase(result, diff) {
+    const serverData = result.data || {};
+    const conflicts = (result.conflicts || [])
+      .filter(field => !isEqual(serverData[field], this.current[field]))
+      .map(field => ({ field, local: this.current[field], remote: serverData[field], source: 'server' }));
+    const ours = new Set([...Object.keys(diff.changed), ...diff.removed]);
+
+    const remote = diffFields(this.synced, serverData);
+    const taken = [
+      ...Object.keys(remote.changed).filter(field => !ours.has(field)),
+      ...remote.removed.filter(field => !ours.has(field) && !this.localOnlyFields.includes(field))
+    ];
+    if (taken.length) {
+      this.current = applyFieldDiff(this.current, {
+        changed: Object.fromEntries(taken.filter(field => field in remote.changed).map(field => [field, remote.changed[field]])),
+        removed: taken.filter(field => !(field in remote.changed))
+      });
+      this.emit('remote', { model: clone(this.current), fields: taken });
+    }
+
+    this.version = result.version;
+    this.synced = clone(serverData);
+    this.addConflicts(conflicts);
+  }
+
+  /**
+   * Apply a patch flushed by another tab. Fields this tab has not touched
+   * since its last flush are taken as they are; fields edited here too keep
+   * this tab's newer value, and the other tab receives it on our next flush.
+   */
+  receiveTabMessage(message) {
+    if (!message || message.tabId === this.tabId) return;
+    if (message.type === 'cleared') {
+      this.reset();
+      this.emit('cleared', null);
+      return;
+    }
+    if (message.type !== 'patch') return;
+    this.stats.remotePatches++;
+
+    const conflicts = [];
+    let next = this.current;
+    const take = (field, value, removed) => {
+      const editedHere = !isEqual(this.current[field], this.saved[field]);
+      if (editedHere) {
+        if (removed ? this.current[field] !== undefined : !isEqual(this.current[field], value)) {
+          conflicts.push({ field, local: this.current[field], remote: removed ? undefined : value, source: 'tab' });
+        }
+        return;
+      }
+      next = removed ? omitFields(next, [field]) : { ...next, [field]: value };
+    };
+    Object.entries(message.changed || {}).forEach(([field, value]) => take(field, value, false));
+    (message.removed || []).forEach(field => take(field, undefined, true));
+
+    // The other tab persists and syncs its own patch, so both baselines move with it
+    const accepted = diffFields(this.current, next);
+    this.saved = applyFieldDiff(this.saved, accepted);
+    this.synced = applyFieldDiff(this.synced, { changed: omitFields(accepted.changed, this.localOnlyFields), removed: accepted.removed });
+    this.current = next;
+
+    if (conflicts.length) {
+      this.addConflicts(conflicts);
+      this.schedule();
+    }
+    if (!isEmptyDiff(accepted)) this.emit('remote', { model: clone(next), fields: [...Object.keys(accepted.changed), ...accepted.removed] });
+  }
+
+  postToTabs(message) {
+    if (!this.channel) return;
+    try {
+      this.channel.postMessage({ ...message, tabId: this.tabId });
+    } catch (error) {
+      console.warn('Could not share draft changes with other tabs:', error);
+    }
+  }
+
+  addConflicts(conflicts) {
+    if (!conflicts.length) return;
+    this.conflicts = [...this.conflicts, ...conflicts];
+    this.emit('conflict', { conflicts });
+  }
+
+  clearConflicts() {
+    this.conflicts = [];
+    this.emit('status', this.getState());
+  }
+
+  /**
+   * Drop the draft everywhere (after the form is submitted)
+   */
+  async clear() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    this.firstChangeAt = null;
+    await this.flushing;
+    this.reset();
+    await Promise.all([this.storage.deleteDraft(this.storageKey), this.storage.deleteDraft(this.baseKey)]);
+    if (this.transport) {
+      try {
+        await this.transport.remove(this.formId);
+      } catch (error) {
+        console.warn('Server draft not removed:', error.message);
+      }
+    }
+    this.postToTabs({ type: 'cleared' });
+  }
+
+  reset() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    this.firstChangeAt = null;
+    this.current = {};
+    this.saved = {};
+    this.synced = {};
+    this.version = 0;
+    this.conflicts = [];
+    this.lastSaved = null;
+    this.setStatus('idle');
+  }
+
+  setStatus(status) {
+    if (this.status === status) return;
+    this.status = status;
+    this.emit('status', this.getState());
+  }
+
+  getState() {
+    return {
+      status: this.status,
+      lastSaved: this.lastSaved,
+      version: this.version,
+      dirtyFields: this.getDirtyFields(),
+      conflicts: this.conflicts
+    };
+  }
+
+  subscribe(listener) {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  emit(type, payload) {
+    this.listeners.forEach(listener => {
+      try {
+        listener({ type, payload });
+      } catch (error) {
+        console.error('Draft listener failed:', error);
+      }
+    });
+  }
+
+  getStats() {
+    return { ...this.stats };
+  }
+
+  close() {
+    clearTimeout(this.timer);
+    if (this.channel && this.onMessage) {
+      this.channel.removeEventListener('message', this.onMessage);
+      if (typeof this.channel.close === 'function') this.channel.close();
+    }
+    this.listeners.clear();
+  }
+}
+
+export default FormDraftStore;
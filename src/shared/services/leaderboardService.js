@@ -0,0 +1,115 @@
+/**
+ * Leaderboard Service
+ * Reads the materialized leaderboard (leaderboard_rankings). Ranks are kept
+ * up to date in the database as KPI reports change, so views only fetch the
+ * handful of rows they display.
+ */
+
+import { supabase } from '../lib/supabase';
+import { queryCache } from './queryCache';
+
+const CACHE_PREFIX = 'leaderboard:';
+const LEADERBOARD_TABLES = ['leaderboard_rankings', 'monthly_kpi_reports'];
+
+/**
+ * Map a get_leaderboard_* row to the camelCase shape the views use
+ */
+export function toLeaderboardEntry(row) {
+  const growth = Number(row.growth_percentage) || 0;
+  return {
+    employeeId: row.employee_id,
+    monthKey: row.month_key,
+    name: row.name || 'Unknown',
+    role: row.role || 'Employee',
+    department: row.department || 'General',
+    score: Number(row.score) || 0,
+    change: growth,
+    trend: growth > 0 ? 'up' : growth < 0 ? 'down' : 'stable',
+    tasksCompleted: row.tasks_completed || 0,
+    learningHours: Number(row.learning_hours) || 0,
+    rank: row.rank,
+    overallRank: row.overall_rank,
+    departmentRank: row.department_rank
+  };
+}
+
+class LeaderboardService {
+  constructor() {
+    this.cacheTimeout = 60 * 1000; // 1 minute
+  }
+
+  cachedQuery(key, loader) {
+    return queryCache.fetch(`${CACHE_PREFIX}${key}`, loader, {
+      tables: LEADERBOARD_TABLES,
+      ttl: this.cacheTimeout,
+      staleWhileRevalidate: this.cacheTimeout
+    });
+  }
+
+  /**
+   * Get the top performers for a month
+   * @param {Object} options
+   * @param {string} options.monthKey - 'YYYY-MM'; latest ranked month when omitted
+   * @param {string} options.department - rank within this department only
+   * @param {number} options.limit - number of rows (max 100)
+   * @returns {Promise<Array>} Leaderboard entries ordered by rank
+   */
+  async getTopPerformers({ monthKey = null, department = null, limit = 10 } = {}) {
+    const key = `top:${monthKey || 'latest'}:${department || 'all'}:${limit}`;
+    return this.cachedQuery(key, async () => {
+      if (!supabase) {
+        throw new Error('Supabase not configured');
+      }
+
+      const { data, error } = await supabase.rpc('get_leaderboard_top', {
+        p_month_key: monthKey,
+        p_department: department,
+        p_limit: limit
+      });
+
+      if (error) throw error;
+      return (data || []).map(toLeaderboardEntry);
+    });
+  }
+
+  /**
+   * Get an employee's rank with the rows immediately above and below it
+   * @param {string} employeeId - unified_users id
+   * @param {Object} options
+   * @param {string} options.monthKey - 'YYYY-MM'; latest ranked month when omitted
+   * @param {string} options.department - rank within the employee's department
+   * @param {number} options.radius - rows to include on each side
+   * @returns {Promise<Array>} Leaderboard entries ordered by rank; empty if unranked
+   */
+  async getRankWithNeighbours(employeeId, { monthKey = null, department = null, radius = 2 } = {}) {
+    if (!employeeId) return [];
+
+    const key = `around:${employeeId}:${monthKey || 'latest'}:${department || 'all'}:${radius}`;
+    return this.cachedQuery(key, async () => {
+      if (!supabase) {
+        throw new Error('Supabase not configured');
+      }
+
+      const { data, error } = await supabase.rpc('get_leaderboard_neighbours', {
+        p_employee_id: String(employeeId),
+        p_month_key: monthKey,
+        p_department: department,
+        p_radius: radius
+      });
+
+      if (error) throw error;
+      return (data || []).map(toLeaderboardEntry);
+    });
+  }
+
+  /**
+   * Clear all cached leaderboard data
+   */
+  clearCache() {
+    queryCache.clear(CACHE_PREFIX);
+  }
+}
+
+// Create and export singleton instance
+const leaderboardService = new LeaderboardService();
+export default leaderboardService;
@@ -5,6 +5,10 @@
  */
 
 import { supabase } from '../lib/supabase.js';
+import { queryCache } from './queryCache.js';
+import leaderboardService from './leaderboardService.js';
+
+const CACHE_PREFIX = 'live:';
 
 /**
  * Live Data Service Class
@@ -12,31 +16,18 @@ import { supabase } from '../lib/supabase.js';
  */
 class LiveDataService {
   constructor() {
-    this.cache = new Map();
     this.cacheTimeout = 2 * 60 * 1000; // 2 minutes cache
   }
 
   /**
-   * Check if data is cached and still valid
-   */
-  getCachedData(key) {
-    if (this.cache.has(key)) {
-      const cached = this.cache.get(key);
-      if (Date.now() - cached.timestamp < this.cacheTimeout) {
-        return cached.data;
-      }
-      this.cache.delete(key);
-    }
-    return null;
-  }
-
-  /**
-   * Cache data with timestamp
+   * Read through the shared query cache. Errors thrown by the loader are
+   * not cached, so each method's fallback data is never stored.
    */
-  setCachedData(key, data) {
-    this.cache.set(key, {
-      data,
-      timestamp: Date.now()
+  cachedQuery(key, tables, loader) {
+    return queryCache.fetch(`${CACHE_PREFIX}${key}`, loader, {
+      tables,
+      ttl: this.cacheTimeout,
+      staleWhileRevalidate: this.cacheTimeout
     });
   }
 
@@ -46,74 +37,72 @@ class LiveDataService {
    */
   async getSystemActivities() {
     const cacheKey = 'system_activities';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
+      return await this.cachedQuery(cacheKey, ['submissions', 'user_sessions'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      // Get recent login activities
-      const { data: loginData, error: loginError } = await supabase
-        .from('user_sessions')
-        .select(`
-          id,
-          created_at,
-          unified_users!inner(name)
-        `)
-        .order('created_at', { ascending: false })
-        .limit(10);
-
-      if (loginError) throw loginError;
-
-      // Get recent submissions
-      const { data: submissionData, error: submissionError } = await supabase
-        .from('submissions')
-        .select(`
-          id,
-          created_at,
-          status,
-          unified_users!inner(name)
-        `)
-        .order('created_at', { ascending: false })
-        .limit(5);
-
-      if (submissionError) throw submissionError;
-
-      // Combine and format activities
-      const activities = [];
-
-      // Add login activities
-      loginData?.forEach(login => {
-        activities.push({
-          id: `login_${login.id}`,
-          activity: 'User Login',
-          user: login.unified_users?.name || 'Unknown User',
-          time: this.formatTimeAgo(login.created_at),
-          status: 'Completed'
+        // Get recent login activities
+        const { data: loginData, error: loginError } = await supabase
+          .from('user_sessions')
+          .select(`
+            id,
+            created_at,
+            unified_users!inner(name)
+          `)
+          .order('created_at', { ascending: false })
+          .limit(10);
+
+        if (loginError) throw loginError;
+
+        // Get recent submissions
+        const { data: submissionData, error: submissionError } = await supabase
+          .from('submissions')
+          .select(`
+            id,
+            created_at,
+            status,
+            unified_users!inner(name)
+          `)
+          .order('created_at', { ascending: false })
+          .limit(5);
+
+        if (submissionError) throw submissionError;
+
+        // Combine and format activities
+        const activities = [];
+
+        // Add login activities
+        loginData?.forEach(login => {
+          activities.push({
+            id: `login_${login.id}`,
+            activity: 'User Login',
+            user: login.unified_users?.name || 'Unknown User',
+            time: this.formatTimeAgo(login.created_at),
+            status: 'Completed'
+          });
         });
-      });
 
-      // Add submission activities
-      submissionData?.forEach(submission => {
-        activities.push({
-          id: `submission_${submission.id}`,
-          activity: 'Form Submission',
-          user: submission.unified_users?.name || 'Unknown User',
-          time: this.formatTimeAgo(submission.created_at),
-          status: submission.status === 'submitted' ? 'Completed' : 'In Progress'
+        // Add submission activities
+        submissionData?.forEach(submission => {
+          activities.push({
+            id: `submission_${submission.id}`,
+            activity: 'Form Submission',
+            user: submission.unified_users?.name || 'Unknown User',
+            time: this.formatTimeAgo(submission.created_at),
+            status: submission.status === 'submitted' ? 'Completed' : 'In Progress'
+          });
         });
-      });
-
-      // Sort by time and limit to 10
-      const sortedActivities = activities
-        .sort((a, b) => new Date(b.time) - new Date(a.time))
-        .slice(0, 10);
 
-      this.setCachedData(cacheKey, sortedActivities);
-      return sortedActivities;
+        // Sort by time and limit to 10
+        const sortedActivities = activities
+          .sort((a, b) => new Date(b.time) - new Date(a.time))
+          .slice(0, 10);
 
+        return sortedActivities;
+      });
     } catch (error) {
       console.error('Error fetching system activities:', error);
       // Return fallback data
@@ -135,65 +124,38 @@ class LiveDataService {
    */
   async getUserMetrics() {
     const cacheKey = 'user_metrics';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
-
-      // Get total active users
-      const { data: totalUsers, error: totalError } = await supabase
-        .from('unified_users')
-        .select('id')
-        .eq('is_active', true);
-
-      if (totalError) throw totalError;
-
-      // Get daily active users (logged in today)
-      const today = new Date();
-      today.setHours(0, 0, 0, 0);
-      
-      const { data: dailyUsers, error: dailyError } = await supabase
-        .from('user_sessions')
-        .select('user_id')
-        .gte('created_at', today.toISOString());
-
-      if (dailyError) throw dailyError;
-
-      // Get weekly active users (logged in this week)
-      const weekAgo = new Date();
-      weekAgo.setDate(weekAgo.getDate() - 7);
-      
-      const { data: weeklyUsers, error: weeklyError } = await supabase
-        .from('user_sessions')
-        .select('user_id')
-        .gte('created_at', weekAgo.toISOString());
+      return await this.cachedQuery(cacheKey, ['unified_users', 'user_sessions'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      if (weeklyError) throw weeklyError;
+        // Session boundaries use the browser's local midnight
+        const today = new Date();
+        today.setHours(0, 0, 0, 0);
+        const weekAgo = new Date();
+        weekAgo.setDate(weekAgo.getDate() - 7);
+        const monthAgo = new Date();
+        monthAgo.setDate(monthAgo.getDate() - 30);
+
+        const { data, error } = await supabase.rpc('get_dashboard_user_activity', {
+          p_day_start: today.toISOString(),
+          p_week_start: weekAgo.toISOString(),
+          p_month_start: monthAgo.toISOString()
+        });
 
-      // Get monthly active users (logged in this month)
-      const monthAgo = new Date();
-      monthAgo.setDate(monthAgo.getDate() - 30);
-      
-      const { data: monthlyUsers, error: monthlyError } = await supabase
-        .from('user_sessions')
-        .select('user_id')
-        .gte('created_at', monthAgo.toISOString());
-
-      if (monthlyError) throw monthlyError;
-
-      const metrics = {
-        dailyActiveUsers: new Set(dailyUsers?.map(u => u.user_id) || []).size,
-        weeklyActiveUsers: new Set(weeklyUsers?.map(u => u.user_id) || []).size,
-        monthlyActiveUsers: new Set(monthlyUsers?.map(u => u.user_id) || []).size,
-        totalUsers: totalUsers?.length || 0
-      };
+        if (error) throw error;
 
-      this.setCachedData(cacheKey, metrics);
-      return metrics;
+        const metrics = {
+          dailyActiveUsers: data?.daily_active_users || 0,
+          weeklyActiveUsers: data?.weekly_active_users || 0,
+          monthlyActiveUsers: data?.monthly_active_users || 0,
+          totalUsers: data?.total_users || 0
+        };
 
+        return metrics;
+      });
     } catch (error) {
       console.error('Error fetching user metrics:', error);
       // Return fallback data
@@ -212,52 +174,29 @@ class LiveDataService {
    */
   async getPerformanceMetrics() {
     const cacheKey = 'performance_metrics';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
-
-      // Get average performance scores from monthly KPI reports
-      const { data: kpiData, error: kpiError } = await supabase
-        .from('monthly_kpi_reports')
-        .select('overall_score, client_satisfaction_score')
-        .not('overall_score', 'is', null)
-        .not('client_satisfaction_score', 'is', null);
-
-      if (kpiError) throw kpiError;
-
-      // Get submission rate (submitted vs total)
-      const { data: submissionStats, error: submissionError } = await supabase
-        .from('submissions')
-        .select('status');
-
-      if (submissionError) throw submissionError;
-
-      // Calculate metrics
-      const avgPerformanceScore = kpiData?.length > 0 
-        ? kpiData.reduce((sum, item) => sum + (item.overall_score || 0), 0) / kpiData.length
-        : 0;
+      return await this.cachedQuery(cacheKey, ['monthly_kpi_reports', 'submissions'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      const avgClientSatisfaction = kpiData?.length > 0
-        ? kpiData.reduce((sum, item) => sum + (item.client_satisfaction_score || 0), 0) / kpiData.length
-        : 0;
+        const { data, error } = await supabase.rpc('get_dashboard_performance_summary');
 
-      const totalSubmissions = submissionStats?.length || 0;
-      const submittedCount = submissionStats?.filter(s => s.status === 'submitted').length || 0;
-      const submissionRate = totalSubmissions > 0 ? (submittedCount / totalSubmissions) * 100 : 0;
+        if (error) throw error;
 
-      const metrics = {
-        averagePerformanceScore: Math.round(avgPerformanceScore * 10) / 10,
-        submissionRate: Math.round(submissionRate),
-        clientSatisfaction: Math.round(avgClientSatisfaction)
-      };
+        const avgPerformanceScore = Number(data?.avg_overall_score) || 0;
+        const avgClientSatisfaction = Number(data?.avg_client_satisfaction) || 0;
+        const submissionRate = Number(data?.submission_rate) || 0;
 
-      this.setCachedData(cacheKey, metrics);
-      return metrics;
+        const metrics = {
+          averagePerformanceScore: Math.round(avgPerformanceScore * 10) / 10,
+          submissionRate: Math.round(submissionRate),
+          clientSatisfaction: Math.round(avgClientSatisfaction)
+        };
 
+        return metrics;
+      });
     } catch (error) {
       console.error('Error fetching performance metrics:', error);
       // Return fallback data
@@ -275,47 +214,30 @@ class LiveDataService {
    */
   async getActiveUsers() {
     const cacheKey = 'active_users';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
+      return await this.cachedQuery(cacheKey, ['unified_users'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      const { data: userData, error } = await supabase
-        .from('unified_users')
-        .select('role, user_category')
-        .eq('is_active', true);
+        // Bucketed server-side by the dashboard_active_user_buckets view
+        const { data, error } = await supabase
+          .from('dashboard_active_user_buckets')
+          .select('employees, interns, freelancers, managers')
+          .single();
 
-      if (error) throw error;
+        if (error) throw error;
 
-      // Count users by category
-      const counts = {
-        employees: 0,
-        interns: 0,
-        freelancers: 0,
-        managers: 0
-      };
+        const counts = {
+          employees: data?.employees || 0,
+          interns: data?.interns || 0,
+          freelancers: data?.freelancers || 0,
+          managers: data?.managers || 0
+        };
 
-      userData?.forEach(user => {
-        const category = user.user_category?.toLowerCase() || '';
-        const role = user.role?.toLowerCase() || '';
-        
-        if (category.includes('intern') || role.includes('intern')) {
-          counts.interns++;
-        } else if (category.includes('freelancer') || role.includes('freelancer')) {
-          counts.freelancers++;
-        } else if (category.includes('manager') || role.includes('manager') || role.includes('head') || role.includes('admin')) {
-          counts.managers++;
-        } else {
-          counts.employees++;
-        }
+        return counts;
       });
-
-      this.setCachedData(cacheKey, counts);
-      return counts;
-
     } catch (error) {
       console.error('Error fetching active users:', error);
       // Return fallback data
@@ -334,70 +256,68 @@ class LiveDataService {
    */
   async getDynamicStats() {
     const cacheKey = 'dynamic_stats';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
+      return await this.cachedQuery(cacheKey, ['clients', 'submissions', 'unified_users'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      // Get client count
-      const { data: clientData, error: clientError } = await supabase
-        .from('clients')
-        .select('id')
-        .eq('status', 'Active');
+        // Get client count
+        const { data: clientData, error: clientError } = await supabase
+          .from('clients')
+          .select('id')
+          .eq('status', 'Active');
 
-      if (clientError) throw clientError;
+        if (clientError) throw clientError;
 
-      // Get employee count by department
-      const { data: employeeData, error: employeeError } = await supabase
-        .from('unified_users')
-        .select('department')
-        .eq('is_active', true);
+        // Get employee count by department
+        const { data: employeeData, error: employeeError } = await supabase
+          .from('unified_users')
+          .select('department')
+          .eq('is_active', true);
 
-      if (employeeError) throw employeeError;
+        if (employeeError) throw employeeError;
 
-      // Count by department
-      const deptCounts = {};
-      employeeData?.forEach(emp => {
-        const dept = emp.department || 'Other';
-        deptCounts[dept] = (deptCounts[dept] || 0) + 1;
-      });
+        // Count by department
+        const deptCounts = {};
+        employeeData?.forEach(emp => {
+          const dept = emp.department || 'Other';
+          deptCounts[dept] = (deptCounts[dept] || 0) + 1;
+        });
 
-      // Get recent submissions for growth calculation
-      const lastMonth = new Date();
-      lastMonth.setMonth(lastMonth.getMonth() - 1);
+        // Get recent submissions for growth calculation
+        const lastMonth = new Date();
+        lastMonth.setMonth(lastMonth.getMonth() - 1);
       
-      const { data: recentSubmissions, error: submissionError } = await supabase
-        .from('submissions')
-        .select('created_at')
-        .gte('created_at', lastMonth.toISOString());
-
-      if (submissionError) throw submissionError;
-
-      const stats = {
-        sales: { 
-          value: `₹${((clientData?.length || 0) * 50000).toLocaleString()}`, 
-          change: "+12%" 
-        },
-        hr: { 
-          value: (employeeData?.length || 0).toString(), 
-          change: "+8" 
-        },
-        finance: { 
-          value: `₹${((recentSubmissions?.length || 0) * 25000).toLocaleString()}`, 
-          change: "+5%" 
-        },
-        intern: { 
-          value: (deptCounts['Intern'] || 15).toString(), 
-          change: "+3" 
-        }
-      };
-
-      this.setCachedData(cacheKey, stats);
-      return stats;
+        const { data: recentSubmissions, error: submissionError } = await supabase
+          .from('submissions')
+          .select('created_at')
+          .gte('created_at', lastMonth.toISOString());
+
+        if (submissionError) throw submissionError;
+
+        const stats = {
+          sales: { 
+            value: `₹${((clientData?.length || 0) * 50000).toLocaleString()}`, 
+            change: "+12%" 
+          },
+          hr: { 
+            value: (employeeData?.length || 0).toString(), 
+            change: "+8" 
+          },
+          finance: { 
+            value: `₹${((recentSubmissions?.length || 0) * 25000).toLocaleString()}`, 
+            change: "+5%" 
+          },
+          intern: { 
+            value: (deptCounts['Intern'] || 15).toString(), 
+            change: "+3" 
+          }
+        };
 
+        return stats;
+      });
     } catch (error) {
       console.error('Error fetching dynamic stats:', error);
       // Return fallback data
@@ -416,55 +336,33 @@ class LiveDataService {
    */
   async getEmployeePerformance() {
     const cacheKey = 'employee_performance';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
-
-      // First get performance data from monthly_kpi_reports
-      const { data: performanceData, error: perfError } = await supabase
-        .from('monthly_kpi_reports')
-        .select('employee_id, overall_score, growth_percentage')
-        .not('overall_score', 'is', null)
-        .order('overall_score', { ascending: false })
-        .limit(10);
-
-      if (perfError) throw perfError;
-
-      if (!performanceData || performanceData.length === 0) {
-        throw new Error('No performance data found');
-      }
+      return await this.cachedQuery(cacheKey, ['leaderboard_rankings', 'monthly_kpi_reports', 'unified_users'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      // Get user details for the employee IDs
-      const employeeIds = performanceData.map(p => p.employee_id);
-      const { data: userData, error: userError } = await supabase
-        .from('unified_users')
-        .select('id, name, role, department')
-        .in('id', employeeIds);
+        // Ranks are maintained in the materialized leaderboard
+        const topPerformers = await leaderboardService.getTopPerformers({ limit: 10 });
 
-      if (userError) throw userError;
+        if (topPerformers.length === 0) {
+          throw new Error('No performance data found');
+        }
 
-      // Combine the data manually
-      const leaderboard = performanceData.map((item, index) => {
-        const user = userData?.find(u => u.id === item.employee_id);
-        return {
+        const leaderboard = topPerformers.map((entry, index) => ({
           id: index + 1,
-          name: user?.name || 'Unknown',
-          role: user?.role || 'Employee',
-          department: user?.department || 'General',
-          score: Math.round(item.overall_score || 0),
-          change: item.growth_percentage || 0,
-          trend: item.growth_percentage > 0 ? 'up' : item.growth_percentage < 0 ? 'down' : 'stable',
-          avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(user?.name || 'User')}&background=random`
-        };
-      }).filter(item => item.name !== 'Unknown'); // Filter out users not found in unified_users
-
-      this.setCachedData(cacheKey, leaderboard);
-      return leaderboard;
-
+          name: entry.name,
+          role: entry.role,
+          department: entry.department,
+          score: Math.round(entry.score),
+          change: entry.change,
+          trend: entry.trend,
+          avatar: `https://ui-avatars.com/api/?name=${encodeURIComponent(entry.name || 'User')}&background=random`
+        })).filter(item => item.name !== 'Unknown'); // Filter out users not found in unified_users
+
+        return leaderboard;
+      });
     } catch (error) {
       console.error('Error fetching employee performance:', error);
       // Return fallback data
@@ -490,34 +388,32 @@ class LiveDataService {
    */
   async getDashboardStats(role) {
     const cacheKey = `dashboard_stats_${role}`;
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
-
-      let stats = {};
-
-      switch (role?.toLowerCase()) {
-        case 'super admin':
-        case 'superadmin':
-          stats = await this.getSuperAdminStats();
-          break;
-        case 'hr':
-          stats = await this.getHRStats();
-          break;
-        case 'manager':
-          stats = await this.getManagerStats();
-          break;
-        default:
-          stats = await this.getGeneralStats();
-      }
+      return await this.cachedQuery(cacheKey, ['unified_users', 'clients', 'monthly_kpi_reports', 'employee_performance'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      this.setCachedData(cacheKey, stats);
-      return stats;
+        let stats = {};
+
+        switch (role?.toLowerCase()) {
+          case 'super admin':
+          case 'superadmin':
+            stats = await this.getSuperAdminStats();
+            break;
+          case 'hr':
+            stats = await this.getHRStats();
+            break;
+          case 'manager':
+            stats = await this.getManagerStats();
+            break;
+          default:
+            stats = await this.getGeneralStats();
+        }
 
+        return stats;
+      });
     } catch (error) {
       console.error('Error fetching dashboard stats:', error);
       // Return fallback data based on role
@@ -531,48 +427,46 @@ class LiveDataService {
    */
   async getDashboardContent() {
     const cacheKey = 'dashboard_content';
-    const cached = this.getCachedData(cacheKey);
-    if (cached) return cached;
 
     try {
-      if (!supabase) {
-        throw new Error('Supabase not configured');
-      }
-
-      // Fetch news from announcements table
-      const { data: announcements, error: newsError } = await supabase
-        .from('announcements')
-        .select('*')
-        .eq('active', true)
-        .order('created_at', { ascending: false })
-        .limit(1);
-
-      // Fetch events from events table
-      const { data: events, error: eventsError } = await supabase
-        .from('events')
-        .select('*')
-        .gte('date', new Date().toISOString().split('T')[0])
-        .order('date', { ascending: true })
-        .limit(5);
-
-      // Fetch updates from system_updates table
-      const { data: updates, error: updatesError } = await supabase
-        .from('system_updates')
-        .select('*')
-        .eq('active', true)
-        .order('created_at', { ascending: false })
-        .limit(3);
-
-      const content = {
-        news: announcements?.[0]?.content || 'Welcome to our agency dashboard! Stay updated with the latest company news and announcements.',
-        events: events?.map(event => `${event.title} - ${new Date(event.date).toLocaleDateString()}`).join('. ') || 'Team meeting every Monday at 10 AM. Monthly all-hands on the first Friday of each month.',
-        updates: updates?.map(update => update.content).join('. ') || 'New project management system launched. Please update your profiles in the employee directory.',
-        tools: []
-      };
+      return await this.cachedQuery(cacheKey, ['announcements', 'events', 'system_updates'], async () => {
+        if (!supabase) {
+          throw new Error('Supabase not configured');
+        }
 
-      this.setCachedData(cacheKey, content);
-      return content;
+        // Fetch news from announcements table
+        const { data: announcements, error: newsError } = await supabase
+          .from('announcements')
+          .select('*')
+          .eq('active', true)
+          .order('created_at', { ascending: false })
+          .limit(1);
+
+        // Fetch events from events table
+        const { data: events, error: eventsError } = await supabase
+          .from('events')
+          .select('*')
+          .gte('date', new Date().toISOString().split('T')[0])
+          .order('date', { ascending: true })
+          .limit(5);
+
+        // Fetch updates from system_updates table
+        const { data: updates, error: updatesError } = await supabase
+          .from('system_updates')
+          .select('*')
+          .eq('active', true)
+          .order('created_at', { ascending: false })
+          .limit(3);
+
+        const content = {
+          news: announcements?.[0]?.content || 'Welcome to our agency dashboard! Stay updated with the latest company news and announcements.',
+          events: events?.map(event => `${event.title} - ${new Date(event.date).toLocaleDateString()}`).join('. ') || 'Team meeting every Monday at 10 AM. Monthly all-hands on the first Friday of each month.',
+          updates: updates?.map(update => update.content).join('. ') || 'New project management system launched. Please update your profiles in the employee directory.',
+          tools: []
+        };
 
+        return content;
+      });
     } catch (error) {
       console.error('Error fetching dashboard content:', error);
       return {
@@ -590,7 +484,7 @@ class LiveDataService {
         .from('announcements')
         .upsert({ content: newContent, active: true }, { onConflict: 'id' });
       if (error) throw error;
-      this.cache.delete('dashboard_content');
+      queryCache.invalidate(`${CACHE_PREFIX}dashboard_content`);
       return data;
     } catch (error) {
       console.error('Error updating news:', error);
@@ -604,7 +498,7 @@ class LiveDataService {
         .from('events')
         .upsert(newEvents);
       if (error) throw error;
-      this.cache.delete('dashboard_content');
+      queryCache.invalidate(`${CACHE_PREFIX}dashboard_content`);
       return data;
     } catch (error) {
       console.error('Error updating events:', error);
@@ -618,7 +512,7 @@ class LiveDataService {
         .from('system_updates')
         .upsert(newUpdates);
       if (error) throw error;
-      this.cache.delete('dashboard_content');
+      queryCache.invalidate(`${CACHE_PREFIX}dashboard_content`);
       return data;
     } catch (error) {
       console.error('Error updating updates:', error);
@@ -630,16 +524,73 @@ class LiveDataService {
    * Get Super Admin specific stats
    */
   async getSuperAdminStats() {
-    const [employees, clients, revenue, satisfaction] = await Promise.all([
+    const { data, error } = await supabase.rpc('get_super_admin_dashboard_stats');
+    if (error) {
+      console.error('Error fetching super admin stats, aggregating from tables:', error);
+      return this.getSuperAdminStatsFromTables();
+    }
+
+    const activeProjects = data?.active_projects || 0;
+
+    return {
+      totalEmployees: data?.total_employees || 0,
+      activeProjects,
+      monthlyRevenue: `₹${(activeProjects * 50000).toLocaleString()}`,
+      clientSatisfaction: Math.round(Number(data?.avg_client_satisfaction) || 0)
+    };
+  }
+
+  /**
+   * Get HR specific stats
+   */
+  async getHRStats() {
+    const { data, error } = await supabase.rpc('get_hr_dashboard_stats');
+    if (error) {
+      console.error('Error fetching HR stats, aggregating from tables:', error);
+      return this.getHRStatsFromTables();
+    }
+
+    return {
+      totalEmployees: data?.total_employees || 0,
+      pendingReviews: data?.pending_reviews || 0,
+      newHires: data?.interns || 0, // Assuming interns are new hires
+      departments: 12 // Static for now
+    };
+  }
+
+  /**
+   * Get Manager specific stats
+   */
+  async getManagerStats() {
+    const { data, error } = await supabase.rpc('get_manager_dashboard_stats');
+    if (error) {
+      console.error('Error fetching manager stats, aggregating from tables:', error);
+      return this.getManagerStatsFromTables();
+    }
+
+    return {
+      teamSize: data?.team_size || 0,
+      activeProjects: data?.active_projects || 0,
+      completionRate: 85, // Static for now
+      teamPerformance: Math.round(Number(data?.avg_overall_score) || 0)
+    };
+  }
+
+  /*
+   * Browser-side aggregation used before the dashboard stats functions, kept
+   * for databases where they are missing or failing. A failed query only
+   * zeroes its own figure, so the dashboard still renders partial stats.
+   */
+  async getSuperAdminStatsFromTables() {
+    const [employees, clients, satisfaction] = await Promise.all([
       this.getActiveUsers(),
       supabase.from('clients').select('id').eq('status', 'Active'),
-      supabase.from('monthly_kpi_reports').select('overall_score'),
       supabase.from('monthly_kpi_reports').select('client_satisfaction_score')
     ]);
 
     const totalEmployees = Object.values(employees).reduce((sum, count) => sum + count, 0);
     const activeProjects = clients.data?.length || 0;
-    const avgSatisfaction = satisfaction.data?.length > 0 
+    const avgSatisfaction = satisfaction.data?.length > 0
       ? satisfaction.data.reduce((sum, item) => sum + (item.client_satisfaction_score || 0), 0) / satisfaction.data.length
       : 0;
 
@@ -651,31 +602,21 @@ class LiveDataService {
     };
   }
 
-  /**
-   * Get HR specific stats
-   */
-  async getHRStats() {
+  async getHRStatsFromTables() {
     const [employees, reviews] = await Promise.all([
       this.getActiveUsers(),
       supabase.from('employee_performance').select('id, performance_status')
     ]);
 
-    const totalEmployees = Object.values(employees).reduce((sum, count) => sum + count, 0);
-    const pendingReviews = reviews.data?.filter(r => r.performance_status === 'pending').length || 0;
-    const newHires = employees.interns || 0; // Assuming interns are new hires
-
     return {
-      totalEmployees,
-      pendingReviews,
-      newHires,
+      totalEmployees: Object.values(employees).reduce((sum, count) => sum + count, 0),
+      pendingReviews: reviews.data?.filter(r => r.performance_status === 'pending').length || 0,
+      newHires: employees.interns || 0, // Assuming interns are new hires
       departments: 12 // Static for now
     };
   }
 
-  /**
-   * Get Manager specific stats
-   */
-  async getManagerStats() {
+  async getManagerStatsFromTables() {
     const [team, projects, performance] = await Promise.all([
       supabase.from('unified_users').select('id').eq('is_active', true).limit(25),
       supabase.from('clients').select('id').eq('status', 'Active').limit(12),
@@ -760,7 +701,7 @@ class LiveDataService {
    * Clear all cached data
    */
   clearCache() {
-    this.cache.clear();
+    queryCache.clear(CACHE_PREFIX);
   }
 }
 
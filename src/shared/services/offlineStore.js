@@ -0,0 +1,669 @@
+/**
+ * Offline Store
+ * Async, IndexedDB-backed persistence for form drafts, local-mode records
+ * and writes waiting for the network.
+ *
+ * - values are stored by structured clone, never round-tripped through JSON
+ * - a draft is stored as one record per top-level field, and a save only
+ *   writes the fields that changed since the previous save
+ * - drafts past maxDraftAge, and the least recently saved drafts once the
+ *   draft budget or the origin's storage quota is nearly used, are evicted
+ * - writes made while offline are queued and replayed to Supabase, in order,
+ *   when connectivity returns
+ *
+ * Without IndexedDB (some private browsing modes, tests) the same API runs
+ * over an in-memory backend.
+ */
+
+import { diffFields, applyFieldDiff, isEmptyDiff, isEqual } from '../lib/fieldDiff';
+
+const DB_NAME = 'bptm-offline';
+const DB_VERSION = 1;
+const MB = 1024 * 1024;
+const DAY = 24 * 60 * 60 * 1000;
+const QUOTA_CHECK_INTERVAL = 60 * 1000;
+const RETRY_BASE_DELAY = 15 * 1000;
+const RETRY_MAX_DELAY = 5 * 60 * 1000;
+
+const STORES = {
+  drafts: { keyPath: 'key' },
+  draftFields: { keyPath: ['draft', 'field'] },
+  records: { keyPath: ['collection', 'id'] },
+  syncQueue: { keyPath: 'seq', autoIncrement: true }
+};
+
+const clone = typeof structuredClone === 'function' ? structuredClone : (value) => value;
+
+const isQuotaError = (error) => error?.name === 'QuotaExceededError' || error?.code === 22;
+
+/**
+ * Whether a failed write should wait for connectivity rather than count as a
+ * rejected write
+ */
+export const isNetworkError = (error) => {
+  if (typeof navigator !== 'undefined' && navigator.onLine === false) return true;
+  const message = String(error?.message || error || '');
+  return /failed to fetch|fetch failed|networkerror|network error|load failed|network request failed/i.test(message);
+};
+
+// Rough in-storage size of a value, used for the draft budget
+const estimateSize = (value, depth = 0) => {
+  if (value === null || value === undefined) return 4;
+  switch (typeof value) {
+    case 'string':
+      return value.length * 2;
+    case 'number':
+      return 8;
+    case 'boolean':
+      return 4;
+    case 'object':
+      if (depth > 32) return 0;
+      if (value instanceof Date) return 8;
+      if (typeof Blob !== 'undefined' && value instanceof Blob) return value.size;
+      if (value instanceof ArrayBuffer || ArrayBuffer.isView(value)) return value.byteLength;
+      if (Array.isArray(value)) {
+        return value.reduce((sum, item) => sum + estimateSize(item, depth + 1), 8);
+      }
+      return Object.keys(value).reduce((sum, key) => sum + key.length * 2 + estimateSize(value[key], depth + 1), 8);
+    default:
+      return 0;
+  }
+};
+
+const sumSizes = (sizes) => Object.values(sizes).reduce((sum, size) => sum + size, 0);
+
+const keyOf = (storeName, value) => {
+  const { keyPath } = STORES[storeName];
+  return Array.isArray(keyPath) ? keyPath.map(path => value[path]) : value[keyPath];
+};
+
+/**
+ * In-memory backend with the same interface as the IndexedDB one
+ */
+export function createMemoryBackend() {
+  const stores = Object.fromEntries(Object.keys(STORES).map(name => [name, new Map()]));
+  const id = (key) => (Array.isArray(key) ? key.join('\u0000') : key);
+  const inPrefix = (storeName, value, prefix) => prefix === undefined || keyOf(storeName, value)[0] === prefix;
+  let sequence = 0;
+
+  return {
+    kind: 'memory',
+    async get(storeName, key) {
+      const value = stores[storeName].get(id(key));
+      return value === undefined ? undefined : clone(value);
+    },
+    async getAll(storeName, prefix) {
+      return Array.from(stores[storeName].values())
+        .filter(value => inPrefix(storeName, value, prefix))
+        .map(value => clone(value));
+    },
+    async write(ops) {
+      return ops.map(op => {
+        const store = stores[op.store];
+        if (op.type === 'put') {
+          const value = clone(op.value);
+          if (STORES[op.store].autoIncrement) {
+            if (value.seq === undefined) value.seq = ++sequence;
+            sequence = Math.max(sequence, value.seq);
+          }
+          const key = keyOf(op.store, value);
+          store.set(id(key), value);
+          return key;
+        }
+        if (op.type === 'delete') {
+          store.delete(id(op.key));
+        } else if (op.type === 'deletePrefix') {
+          Array.from(store.values())
+            .filter(value => inPrefix(op.store, value, op.prefix))
+            .forEach(value => store.delete(id(keyOf(op.store, value))));
+        }
+        return undefined;
+      });
+    }
+  };
+}
+
+const promisify = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result);
+  request.onerror = () => reject(request.error);
+});
+
+// Keys under a compound-key prefix: [prefix] sorts before [prefix, anything]
+// and [prefix, []] after it, since arrays sort after strings
+const prefixRange = (prefix) => IDBKeyRange.bound([prefix], [prefix, []]);
+
+function openDatabase() {
+  return new Promise((resolve, reject) => {
+    const request = indexedDB.open(DB_NAME, DB_VERSION);
+    request.onupgradeneeded = () => {
+      const db = request.result;
+      Object.entries(STORES).forEach(([name, options]) => {
+        if (!db.objectStoreNames.contains(name)) db.createObjectStore(name, options);
+      });
+    };
+    request.onsuccess = () => {
+      const db = request.result;
+      db.onversionchange = () => db.close();
+      resolve(db);
+    };
+    request.onerror = () => reject(request.error);
+    request.onblocked = () => reject(new Error('Offline store upgrade blocked by another tab'));
+  });
+}
+
+function createIndexedDbBackend(db) {
+  return {
+    kind: 'indexeddb',
+    get(storeName, key) {
+      return promisify(db.transaction(storeName).objectStore(storeName).get(key));
+    },
+    getAll(storeName, prefix) {
+      const store = db.transaction(storeName).objectStore(storeName);
+      return promisify(prefix === undefined ? store.getAll() : store.getAll(prefixRange(prefix)));
+    },
+    // All ops commit in one transaction, or none do
+    write(ops) {
+      return new Promise((resolve, reject) => {
+        const transaction = db.transaction(Array.from(new Set(ops.map(op => op.store))), 'readwrite');
+        const results = new Array(ops.length);
+        ops.forEach((op, index) => {
+          const store = transaction.objectStore(op.store);
+          if (op.type === 'put') {
+            const request = store.put(op.value);
+            request.onsuccess = () => {
+              results[index] = request.result;
+            };
+          } else if (op.type === 'delete') {
+            store.delete(op.key);
+          } else if (op.type === 'deletePrefix') {
+            store.delete(prefixRange(op.prefix));
+          }
+        });
+        transaction.oncomplete = () => resolve(results);
+        transaction.onerror = () => reject(transaction.error);
+        transaction.onabort = () => reject(transaction.error || new Error('Offline store transaction aborted'));
+      });
+    }
+  };
+}
+
+async function openBackend() {
+  if (typeof indexedDB === 'undefined') return createMemoryBackend();
+  try {
+    return createIndexedDbBackend(await openDatabase());
+  } catch (error) {
+    console.warn('IndexedDB unavailable, keeping offline data in memory:', error?.message || error);
+    return createMemoryBackend();
+  }
+}
+
+async function storageEstimate() {
+  try {
+    if (typeof navigator !== 'undefined' && navigator.storage?.estimate) {
+      return await navigator.storage.estimate();
+    }
+  } catch {
+    // Estimates are advisory; the draft budget still applies
+  }
+  return null;
+}
+
+async function applyQueuedWrite(client, { table, op, payload, match, onConflict }) {
+  const query = client.from(table);
+  let request;
+  switch (op) {
+    case 'insert':
+      request = query.insert(payload);
+      break;
+    case 'update':
+      request = query.update(payload).match(match);
+      break;
+    case 'upsert':
+      request = query.upsert(payload, onConflict ? { onConflict } : undefined);
+      break;
+    case 'delete':
+      request = query.delete().match(match);
+      break;
+    default:
+      throw new Error(`Unknown queued operation '${op}'`);
+  }
+  const { data, error } = await request.select();
+  if (error) throw error;
+  return data;
+}
+
+export class OfflineStore {
+  constructor({
+    backend = null,
+    getClient = null,
+    maxDraftBytes = 20 * MB,
+    maxDraftAge = 30 * DAY,
+    quotaRatio = 0.8,
+    maxAttempts = 5
+  } = {}) {
+    this.backendPromise = backend ? Promise.resolve(backend) : null;
+    this.getClient = getClient;
+    this.maxDraftBytes = maxDraftBytes;
+    this.maxDraftAge = maxDraftAge;
+    this.quotaRatio = quotaRatio;
+    this.maxAttempts = maxAttempts;
+    // Last saved model and metadata of drafts read or written this session,
+    // so a save can be diffed without reading the draft back
+    this.drafts = new Map();
+    this.writeChain = Promise.resolve();
+    this.lastQuotaCheck = 0;
+    this.replaying = null;
+    this.sendingSeq = null; // queue entry on the wire; enqueue must not merge into it
+    this.retryTimer = null;
+    this.retryCount = 0;
+    this.listeners = new Set();
+    this.stats = {
+      draftSaves: 0,
+      fieldsWritten: 0,
+      unchangedSaves: 0,
+      evictions: 0,
+      queued: 0,
+      coalesced: 0,
+      replayed: 0,
+      failed: 0
+    };
+  }
+
+  getBackend() {
+    if (!this.backendPromise) this.backendPromise = openBackend();
+    return this.backendPromise;
+  }
+
+  // Writes run one at a time so each save diffs against the one before it
+  serialize(task) {
+    const run = this.writeChain.then(task, task);
+    this.writeChain = run.catch(() => {});
+    return run;
+  }
+
+  async loadDraftState(key) {
+    if (this.drafts.has(key)) return this.drafts.get(key);
+
+    const backend = await this.getBackend();
+    const meta = await backend.get('drafts', key);
+    if (!meta) return null;
+
+    const data = {};
+    (await backend.getAll('draftFields', key)).forEach(record => {
+      data[record.field] = record.value;
+    });
+    const state = { meta, data };
+    this.drafts.set(key, state);
+    return state;
+  }
+
+  /**
+   * Read a draft
+   * @returns {Promise<Object|null>} the saved model, or null
+   */
+  async getDraft(key) {
+    const state = await this.serialize(() => this.loadDraftState(key));
+    return state ? clone(state.data) : null;
+  }
+
+  /**
+   * Save a draft, writing only the top-level fields that changed
+   * @param {string} key - draft key, namespaced by the caller (e.g. 'autosave:leave-application')
+   * @param {Object} data - the whole form model
+   * @returns {Promise<{ key, fields }>} number of fields written or removed
+   */
+  saveDraft(key, data) {
+    return this.serialize(async () => {
+      const backend = await this.getBackend();
+      const now = Date.now();
+      const state = (await this.loadDraftState(key)) || { meta: { key, fields: {}, bytes: 0, createdAt: now }, data: {} };
+      const diff = diffFields(state.data, data);
+
+      if (isEmptyDiff(diff) && state.meta.updatedAt) {
+        this.stats.unchangedSaves++;
+        return { key, fields: 0 };
+      }
+
+      const changed = clone(diff.changed);
+      const sizes = { ...state.meta.fields };
+      const ops = [];
+      Object.entries(changed).forEach(([field, value]) => {
+        sizes[field] = estimateSize(value);
+        ops.push({ type: 'put', store: 'draftFields', value: { draft: key, field, value } });
+      });
+      diff.removed.forEach(field => {
+        delete sizes[field];
+        ops.push({ type: 'delete', store: 'draftFields', key: [key, field] });
+      });
+      const meta = { ...state.meta, fields: sizes, bytes: sumSizes(sizes), updatedAt: now };
+      ops.push({ type: 'put', store: 'drafts', value: meta });
+
+      await this.writeWithQuota(backend, ops, key);
+      this.drafts.set(key, { meta, data: applyFieldDiff(state.data, { changed, removed: diff.removed }) });
+
+      const fields = ops.length - 1;
+      this.stats.draftSaves++;
+      this.stats.fieldsWritten += fields;
+      this.notify('draft:save', { key, fields, updatedAt: now });
+      this.scheduleQuotaCheck(key);
+      return { key, fields };
+    });
+  }
+
+  /**
+   * Saved drafts, most recent first (metadata only: key, createdAt, updatedAt, bytes)
+   */
+  async listDrafts(prefix = '') {
+    const backend = await this.getBackend();
+    const metas = await backend.getAll('drafts');
+    return metas
+      .filter(meta => meta.key.startsWith(prefix))
+      .sort((a, b) => b.updatedAt - a.updatedAt)
+      .map(({ fields, ...meta }) => meta);
+  }
+
+  deleteDraft(key) {
+    return this.serialize(async () => {
+      const backend = await this.getBackend();
+      await backend.write(this.draftDeletion(key));
+      this.drafts.delete(key);
+      this.notify('draft:delete', { key });
+    });
+  }
+
+  async clearDrafts(prefix = '') {
+    const drafts = await this.listDrafts(prefix);
+    await Promise.all(drafts.map(draft => this.deleteDraft(draft.key)));
+    return drafts.length;
+  }
+
+  draftDeletion(key) {
+    return [
+      { type: 'delete', store: 'drafts', key },
+      { type: 'deletePrefix', store: 'draftFields', prefix: key }
+    ];
+  }
+
+  async writeWithQuota(backend, ops, protectKey = null) {
+    try {
+      return await backend.write(ops);
+    } catch (error) {
+      if (!isQuotaError(error)) throw error;
+      // Storage is full: drop the older half of the drafts and try once more
+      const metas = await backend.getAll('drafts');
+      await this.evictDrafts({ protect: protectKey, free: sumSizes(metas.map(meta => meta.bytes || 0)) / 2 });
+      return backend.write(ops);
+    }
+  }
+
+  /**
+   * Remove expired drafts, then the least recently saved ones until the
+   * drafts fit the budget (less `free` bytes). Runs inside the write chain.
+   * @returns {Promise<string[]>} evicted keys
+   */
+  async evictDrafts({ protect = null, free = 0 } = {}) {
+    const backend = await this.getBackend();
+    const metas = await backend.getAll('drafts');
+    const now = Date.now();
+    let total = metas.reduce((sum, meta) => sum + (meta.bytes || 0), 0);
+    const limit = Math.max(0, Math.min(this.maxDraftBytes, total - free));
+
+    const evicted = [];
+    const oldestFirst = metas
+      .filter(meta => meta.key !== protect)
+      .sort((a, b) => a.updatedAt - b.updatedAt);
+    for (const meta of oldestFirst) {
+      const expired = now - meta.updatedAt > this.maxDraftAge;
+      if (!expired && total <= limit) break;
+      evicted.push(meta.key);
+      total -= meta.bytes || 0;
+    }
+
+    if (evicted.length > 0) {
+      await backend.write(evicted.flatMap(key => this.draftDeletion(key)));
+      evicted.forEach(key => this.drafts.delete(key));
+      this.stats.evictions += evicted.length;
+      this.notify('draft:evict', { keys: evicted });
+    }
+    return evicted;
+  }
+
+  /**
+   * Evict against the draft budget and the browser's storage estimate
+   */
+  enforceQuota(protect = null) {
+    return this.serialize(async () => {
+      const estimate = await storageEstimate();
+      const free = estimate?.quota && estimate.usage > estimate.quota * this.quotaRatio
+        ? estimate.usage - estimate.quota * this.quotaRatio
+        : 0;
+      return this.evictDrafts({ protect, free });
+    });
+  }
+
+  scheduleQuotaCheck(protect) {
+    const now = Date.now();
+    if (now - this.lastQuotaCheck < QUOTA_CHECK_INTERVAL) return;
+    this.lastQuotaCheck = now;
+    this.enforceQuota(protect).catch(error => console.warn('Draft eviction failed:', error));
+  }
+
+  // ---- Local-mode records ----
+
+  async getRecords(collection) {
+    const backend = await this.getBackend();
+    const records = await backend.getAll('records', collection);
+    return records.sort((a, b) => a.createdAt - b.createdAt).map(record => record.value);
+  }
+
+  putRecord(collection, value) {
+    return this.serialize(async () => {
+      const backend = await this.getBackend();
+      const existing = await backend.get('records', [collection, value.id]);
+      const now = Date.now();
+      await this.writeWithQuota(backend, [{
+        type: 'put',
+        store: 'records',
+        value: { collection, id: value.id, value, createdAt: existing?.createdAt ?? now, updatedAt: now }
+      }]);
+      return value;
+    });
+  }
+
+  deleteRecord(collection, id) {
+    return this.serialize(async () => {
+      const backend = await this.getBackend();
+      await backend.write([{ type: 'delete', store: 'records', key: [collection, id] }]);
+    });
+  }
+
+  // ---- Write-behind sync queue ----
+
+  /**
+   * Queue a Supabase write for replay once the network is back
+   * @param {Object} entry
+   * @param {string} entry.table - table to write
+   * @param {string} entry.op - 'insert' | 'update' | 'upsert' | 'delete'
+   * @param {Object} entry.payload - row values (insert/update/upsert)
+   * @param {Object} entry.match - column filter (update/delete)
+   * @param {Object} entry.record - { collection, id } local record to drop once replayed
+   * @returns {Promise<number>} queue sequence number
+   */
+  enqueue(entry) {
+    return this.serialize(async () => {
+      const backend = await this.getBackend();
+      const pending = await backend.getAll('syncQueue');
+      const last = pending.sort((a, b) => a.seq - b.seq)[pending.length - 1];
+
+      // Consecutive updates to the same row collapse into one write, unless
+      // the earlier one is being replayed: its sent payload is what gets removed
+      if (last && !last.failed && last.seq !== this.sendingSeq && last.op === 'update' && entry.op === 'update' &&
+          last.table === entry.table && isEqual(last.match, entry.match)) {
+        await backend.write([{
+          type: 'put',
+          store: 'syncQueue',
+          value: { ...last, payload: { ...last.payload, ...clone(entry.payload) }, updatedAt: Date.now() }
+        }]);
+        this.stats.coalesced++;
+        return last.seq;
+      }
+
+      const [seq] = await this.writeWithQuota(backend, [{
+        type: 'put',
+        store: 'syncQueue',
+        value: { ...clone(entry), createdAt: Date.now(), attempts: 0, failed: false }
+      }]);
+
+      this.stats.queued++;
+      this.notify('queue:add', { seq, table: entry.table, op: entry.op });
+      return seq;
+    }).then(seq => {
+      this.scheduleReplay(RETRY_BASE_DELAY);
+      return seq;
+    });
+  }
+
+  /**
+   * Queued writes, oldest first
+   */
+  async getQueue({ includeFailed = true } = {}) {
+    const backend = await this.getBackend();
+    const entries = await backend.getAll('syncQueue');
+    return entries
+      .filter(entry => includeFailed || !entry.failed)
+      .sort((a, b) => a.seq - b.seq);
+  }
+
+  /**
+   * Replay queued writes in order. Stops at the first failure: network
+   * errors wait for the next attempt, other errors count against the entry
+   * until maxAttempts marks it failed and the queue moves past it.
+   * @returns {Promise<{ replayed, remaining }>}
+   */
+  replay() {
+    if (!this.replaying) {
+      this.replaying = this.runReplay().finally(() => {
+        this.replaying = null;
+      });
+    }
+    return this.replaying;
+  }
+
+  async runReplay() {
+    const backend = await this.getBackend();
+    const entries = await this.getQueue({ includeFailed: false });
+    if (entries.length === 0) return { replayed: 0, remaining: 0 };
+
+    const client = this.getClient ? await this.getClient() : null;
+    if (!client) return { replayed: 0, remaining: entries.length };
+
+    let replayed = 0;
+    for (const { seq } of entries) {
+      // Claim the entry and read it in one step, so what is sent is exactly
+      // what is removed or rewritten afterwards
+      const entry = await this.serialize(async () => {
+        const current = await backend.get('syncQueue', seq);
+        this.sendingSeq = current ? seq : null;
+        return current;
+      });
+      if (!entry) continue;
+
+      try {
+        const data = await applyQueuedWrite(client, entry);
+        const ops = [{ type: 'delete', store: 'syncQueue', key: entry.seq }];
+        if (entry.record) {
+          ops.push({ type: 'delete', store: 'records', key: [entry.record.collection, entry.record.id] });
+        }
+        await this.serialize(() => backend.write(ops));
+        replayed++;
+        this.stats.replayed++;
+        this.notify('queue:replayed', { entry, data });
+      } catch (error) {
+        if (!isNetworkError(error)) {
+          const attempts = (entry.attempts || 0) + 1;
+          const failed = attempts >= this.maxAttempts;
+          await this.serialize(() => backend.write([{
+            type: 'put',
+            store: 'syncQueue',
+            value: { ...entry, attempts, failed, lastError: error?.message || String(error) }
+          }]));
+          if (failed) {
+            this.stats.failed++;
+            this.notify('queue:failed', { entry, error });
+          }
+        }
+        this.scheduleReplay(this.nextRetryDelay());
+        return { replayed, remaining: entries.length - replayed };
+      } finally {
+        this.sendingSeq = null;
+      }
+    }
+
+    this.retryCount = 0;
+    return { replayed, remaining: 0 };
+  }
+
+  nextRetryDelay() {
+    const delay = Math.min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** this.retryCount);
+    this.retryCount++;
+    return delay;
+  }
+
+  scheduleReplay(delay) {
+    if (this.retryTimer) return;
+    this.retryTimer = setTimeout(() => {
+      this.retryTimer = null;
+      this.replay().catch(error => console.warn('Offline queue replay failed:', error));
+    }, delay);
+  }
+
+  /**
+   * Replay the queue now and whenever the browser comes back online
+   * @returns {Function} stops listening
+   */
+  listenForConnectivity() {
+    if (typeof window === 'undefined') return () => {};
+    const handleOnline = () => {
+      clearTimeout(this.retryTimer);
+      this.retryTimer = null;
+      this.retryCount = 0;
+      this.replay().catch(error => console.warn('Offline queue replay failed:', error));
+    };
+    window.addEventListener('online', handleOnline);
+    if (typeof navigator === 'undefined' || navigator.onLine !== false) this.scheduleReplay(0);
+    return () => window.removeEventListener('online', handleOnline);
+  }
+
+  subscribe(listener) {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  notify(type, payload) {
+    this.listeners.forEach(listener => {
+      try {
+        listener({ type, payload });
+      } catch (error) {
+        console.error('Offline store listener failed:', error);
+      }
+    });
+  }
+
+  /**
+   * Get store statistics
+   */
+  getStats() {
+    return {
+      ...this.stats,
+      cachedDrafts: this.drafts.size
+    };
+  }
+}
+
+// Shared instance used by the draft hooks, DataPersistence and local-mode repositories
+export const offlineStore = new OfflineStore({
+  getClient: () => import('../lib/supabase').then(module => module.supabase)
+});
+offlineStore.listenForConnectivity();
+
+export default offlineStore;
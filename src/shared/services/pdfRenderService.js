@@ -0,0 +1,125 @@
+/**
+ * PDF Render Service
+ * Renders report PDFs in a dedicated Web Worker so jsPDF layout never blocks
+ * the UI thread, and requests multi-document batches from the API server as
+ * a single ZIP.
+ *
+ * - the worker starts on first use and is shared by every caller
+ * - jsPDF and the templates are loaded by the worker, not the main bundle
+ * - if workers are unavailable (or the worker fails to load) rendering falls
+ *   back to the main thread with the same templates
+ */
+
+import { loadPdfTemplates } from '../lib/vendorLoaders';
+import { authHeaders } from '../../api/authApi';
+
+const MIME_PDF = 'application/pdf';
+
+class PdfRenderService {
+  constructor() {
+    this.worker = null;
+    this.workerUnavailable = typeof Worker === 'undefined';
+    this.pending = new Map();
+    this.nextId = 0;
+  }
+
+  getWorker() {
+    if (this.workerUnavailable) return null;
+    if (this.worker) return this.worker;
+
+    try {
+      this.worker = new Worker(new URL('../../workers/pdfRender.worker.js', import.meta.url), { type: 'module' });
+    } catch (error) {
+      console.warn('PDF worker unavailable, rendering on the main thread:', error);
+      this.workerUnavailable = true;
+      return null;
+    }
+
+    this.worker.onmessage = ({ data: { id, buffer, error } }) => {
+      const request = this.pending.get(id);
+      if (!request) return;
+      this.pending.delete(id);
+      if (error) {
+        request.reject(new Error(error));
+      } else {
+        request.resolve(buffer);
+      }
+    };
+
+    // A load or runtime failure takes the worker down; retry pending renders inline
+    this.worker.onerror = (event) => {
+      console.warn('PDF worker failed, rendering on the main thread:', event.message);
+      event.preventDefault?.();
+      this.terminate();
+      this.workerUnavailable = true;
+    };
+
+    return this.worker;
+  }
+
+  async renderInline(template, data) {
+    const { renderPdf } = await loadPdfTemplates();
+    return renderPdf(template, data);
+  }
+
+  renderInWorker(worker, template, data) {
+    const id = ++this.nextId;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { template, data, resolve, reject });
+      worker.postMessage({ id, template, data });
+    });
+  }
+
+  /**
+   * Render one report to a PDF Blob
+   * @param {string} template - template name from pdfTemplates (e.g. 'employeePerformance')
+   * @param {Object} data - formatted report data; must be structured-cloneable
+   * @returns {Promise<Blob>}
+   */
+  async render(template, data) {
+    const worker = this.getWorker();
+    const buffer = worker
+      ? await this.renderInWorker(worker, template, data)
+      : await this.renderInline(template, data);
+    return new Blob([buffer], { type: MIME_PDF });
+  }
+
+  /**
+   * Render many reports of one template on the API server's worker pool and
+   * return them as a ZIP Blob
+   * @param {string} template
+   * @param {Array<{filename: string, data: Object}>} items
+   * @returns {Promise<Blob>}
+   */
+  async renderBatch(template, items) {
+    const response = await fetch(`/api/pdf/${encodeURIComponent(template)}/batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json', ...authHeaders() },
+      body: JSON.stringify({ items })
+    });
+
+    if (!response.ok) {
+      const body = await response.json().catch(() => ({}));
+      throw new Error(body.error || `Batch PDF render failed (${response.status})`);
+    }
+
+    return response.blob();
+  }
+
+  terminate() {
+    if (this.worker) {
+      this.worker.terminate();
+      this.worker = null;
+    }
+    // Anything still waiting on the worker is rendered inline instead
+    const pending = Array.from(this.pending.values());
+    this.pending.clear();
+    pending.forEach(({ template, data, resolve, reject }) => {
+      this.renderInline(template, data).then(resolve, reject);
+    });
+  }
+}
+
+// Shared instance used by report exports
+export const pdfRenderService = new PdfRenderService();
+export default pdfRenderService;
@@ -0,0 +1,155 @@
+/**
+ * Permission Engine
+ * One compiled permission table shared by every guard and hook.
+ *
+ * - rows come from named sources: the static guard tables, the RBAC role
+ *   editor and role_permissions, which is loaded once per session
+ * - every change to a source recompiles the table (see permissionTable.js),
+ *   so checks stay synchronous and O(1)
+ * - role_permissions changes arrive over realtime and trigger a reload
+ * - subscribers are told when the table changes, for useSyncExternalStore
+ */
+
+import { supabase } from '../lib/supabase.js';
+import { compilePermissionTable } from '../lib/permissionTable.js';
+import { realtimeHub } from './realtimeHub.js';
+
+export class PermissionEngine {
+  constructor({ client = null } = {}) {
+    this.client = client;
+    this.sources = new Map();
+    this.table = compilePermissionTable();
+    this.version = 0;
+    this.status = 'idle';
+    this.loading = null;
+    this.unwatch = null;
+    this.listeners = new Set();
+    this.stats = { checks: 0, compiles: 0, loads: 0, errors: 0 };
+
+    this.subscribe = this.subscribe.bind(this);
+    this.getVersion = this.getVersion.bind(this);
+  }
+
+  /**
+   * Replace the rows of one source and recompile
+   * @param {string} name - source name, e.g. 'guards' or 'database'
+   * @param {Object[]} rows - { role, resource, action, allowed }
+   */
+  setSource(name, rows) {
+    this.sources.set(name, rows || []);
+    this.compile();
+  }
+
+  compile() {
+    this.table = compilePermissionTable([...this.sources.values()].flat());
+    this.version++;
+    this.stats.compiles++;
+    this.listeners.forEach(listener => listener());
+  }
+
+  /**
+   * Load role_permissions once; later calls share the first load
+   * @param {Object} options
+   * @param {boolean} options.force - reload even if already loaded
+   * @returns {Promise<void>}
+   */
+  load({ force = false } = {}) {
+    if (!this.client) return Promise.resolve();
+    if (this.loading && !force) return this.loading;
+
+    this.status = this.status === 'ready' ? 'ready' : 'loading';
+    const request = (async () => {
+      try {
+        const { data, error } = await this.client
+          .from('role_permissions')
+          .select('role, resource, action, allowed');
+        if (error) throw error;
+        if (this.loading !== request) return;
+        this.stats.loads++;
+        this.status = 'ready';
+        this.setSource('database', data);
+      } catch (error) {
+        this.stats.errors++;
+        console.error('Failed to load role permissions:', error);
+        if (this.loading === request) {
+          // Static sources still answer; a later load() may retry
+          this.status = 'error';
+          this.loading = null;
+          this.compile();
+        }
+      }
+    })();
+    this.loading = request;
+    this.watch();
+    return request;
+  }
+
+  watch() {
+    if (this.unwatch || !this.client) return;
+    this.unwatch = realtimeHub.subscribe(this.client, { table: 'role_permissions' }, () => {
+      this.load({ force: true });
+    });
+  }
+
+  /**
+   * Whether a role may perform an action on a resource
+   */
+  can(role, resource, action) {
+    this.stats.checks++;
+    return this.table.can(role, resource, action);
+  }
+
+  canAny(role, resources, action) {
+    return resources.some(resource => this.can(role, resource, action));
+  }
+
+  actionsFor(role, resource) {
+    return this.table.actionsFor(role, resource);
+  }
+
+  /**
+   * True once role_permissions has loaded (or failed to, leaving the static rules)
+   */
+  isReady() {
+    return !this.client || this.status === 'ready' || this.status === 'error';
+  }
+
+  subscribe(listener) {
+    this.listeners.add(listener);
+    return () => this.listeners.delete(listener);
+  }
+
+  getVersion() {
+    return this.version;
+  }
+
+  /**
+   * Drop the loaded rows and stop listening, e.g. on logout
+   */
+  reset() {
+    if (this.unwatch) this.unwatch();
+    this.unwatch = null;
+    this.loading = null;
+    this.status = 'idle';
+    this.sources.delete('database');
+    this.compile();
+  }
+
+  /**
+   * Get engine statistics
+   */
+  getStats() {
+    return {
+      ...this.stats,
+      status: this.status,
+      version: this.version,
+      rows: this.table.size,
+      roles: this.table.roles.length,
+      sources: [...this.sources.keys()]
+    };
+  }
+}
+
+// Shared instance used by the permission guards and hooks
+export const permissionEngine = new PermissionEngine({ client: supabase });
+export default permissionEngine;
@@ -0,0 +1,228 @@
+/**
+ * Query Cache
+ * Single client-side cache for Supabase reads shared by the data services.
+ *
+ * - fresh for `ttl`, then served stale for `staleWhileRevalidate` while a
+ *   background refetch runs
+ * - concurrent requests for the same key share one in-flight promise
+ * - entries are tagged with the tables they read, so a write or realtime
+ *   event on a table drops every dependent entry
+ * - least-recently-used entries are evicted beyond `maxEntries`
+ */
+
+const DEFAULT_TTL = 2 * 60 * 1000;
+
+export class QueryCache {
+  constructor({ maxEntries = 200, ttl = DEFAULT_TTL, staleWhileRevalidate = DEFAULT_TTL } = {}) {
+    this.maxEntries = maxEntries;
+    this.defaultTtl = ttl;
+    this.defaultStaleWhileRevalidate = staleWhileRevalidate;
+    // Map preserves insertion order, so the first key is always the LRU entry
+    this.entries = new Map();
+    this.inFlight = new Map();
+    this.tableIndex = new Map();
+    this.stats = {
+      hits: 0,
+      staleHits: 0,
+      misses: 0,
+      dedupedRequests: 0,
+      revalidations: 0,
+      evictions: 0,
+      invalidations: 0,
+      errors: 0
+    };
+  }
+
+  /**
+   * Read a key through the cache
+   * @param {string} key - cache key, namespaced by the caller (e.g. 'live:user_metrics')
+   * @param {Function} fetcher - async loader; throw to signal failure (failures are not cached)
+   * @param {Object} options
+   * @param {number} options.ttl - how long the value is fresh (ms)
+   * @param {number} options.staleWhileRevalidate - how long a stale value may still be served (ms)
+   * @param {string[]} options.tables - tables the value depends on
+   * @param {boolean} options.force - bypass the cached value
+   * @returns {Promise<*>} Cached or freshly loaded value
+   */
+  async fetch(key, fetcher, options = {}) {
+    const { force = false } = options;
+    const entry = this.entries.get(key);
+    const now = Date.now();
+
+    if (entry && !force) {
+      if (now < entry.freshUntil) {
+        this.touch(key, entry);
+        this.stats.hits++;
+        return entry.data;
+      }
+      if (now < entry.staleUntil) {
+        this.touch(key, entry);
+        this.stats.staleHits++;
+        if (!this.inFlight.has(key)) {
+          this.stats.revalidations++;
+          this.load(key, fetcher, options).catch(error => {
+            console.error(`Background refresh failed for ${key}:`, error);
+          });
+        }
+        return entry.data;
+      }
+    }
+
+    if (this.inFlight.has(key)) {
+      this.stats.dedupedRequests++;
+      return this.inFlight.get(key).promise;
+    }
+
+    this.stats.misses++;
+    return this.load(key, fetcher, options);
+  }
+
+  /**
+   * Run the fetcher once and store its result, unless the key was
+   * invalidated while the request was in flight
+   */
+  load(key, fetcher, options) {
+    const request = { tables: options.tables || [] };
+    this.inFlight.set(key, request);
+    request.promise = (async () => {
+      try {
+        const data = await fetcher();
+        if (this.inFlight.get(key) === request) {
+          this.set(key, data, options);
+        }
+        return data;
+      } catch (error) {
+        this.stats.errors++;
+        throw error;
+      } finally {
+        if (this.inFlight.get(key) === request) {
+          this.inFlight.delete(key);
+        }
+      }
+    })();
+    return request.promise;
+  }
+
+  /**
+   * Get a cached value without loading it; expired entries return null
+   */
+  peek(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return null;
+    if (Date.now() >= entry.staleUntil) {
+      this.remove(key);
+      return null;
+    }
+    return entry.data;
+  }
+
+  /**
+   * Store a value directly, e.g. after a realtime event or an optimistic write
+   */
+  set(key, data, { ttl = this.defaultTtl, staleWhileRevalidate = this.defaultStaleWhileRevalidate, tables = [] } = {}) {
+    this.remove(key);
+    const now = Date.now();
+    const entry = {
+      data,
+      tables,
+      fetchedAt: now,
+      freshUntil: now + ttl,
+      staleUntil: now + ttl + staleWhileRevalidate
+    };
+    this.entries.set(key, entry);
+    tables.forEach(table => {
+      if (!this.tableIndex.has(table)) this.tableIndex.set(table, new Set());
+      this.tableIndex.get(table).add(key);
+    });
+
+    while (this.entries.size > this.maxEntries) {
+      this.remove(this.entries.keys().next().value);
+      this.stats.evictions++;
+    }
+    return data;
+  }
+
+  touch(key, entry) {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+  }
+
+  remove(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return false;
+    this.entries.delete(key);
+    entry.tables.forEach(table => {
+      const keys = this.tableIndex.get(table);
+      if (!keys) return;
+      keys.delete(key);
+      if (keys.size === 0) this.tableIndex.delete(table);
+    });
+    return true;
+  }
+
+  /**
+   * Drop one key, including a request that is still in flight
+   */
+  invalidate(key) {
+    this.inFlight.delete(key);
+    if (this.remove(key)) {
+      this.stats.invalidations++;
+    }
+  }
+
+  /**
+   * Drop every entry that depends on any of the given tables
+   * @returns {number} Number of entries removed
+   */
+  invalidateTables(...tables) {
+    const targets = tables.flat();
+    let removed = 0;
+    targets.forEach(table => {
+      const keys = this.tableIndex.get(table);
+      if (!keys) return;
+      [...keys].forEach(key => {
+        this.invalidate(key);
+        removed++;
+      });
+    });
+    // Results of requests that started before the write must not be stored
+    this.inFlight.forEach((request, key) => {
+      if (request.tables.some(table => targets.includes(table))) {
+        this.inFlight.delete(key);
+      }
+    });
+    return removed;
+  }
+
+  /**
+   * Clear everything, or only the keys starting with a prefix
+   */
+  clear(prefix = '') {
+    [...this.entries.keys(), ...this.inFlight.keys()]
+      .filter(key => key.startsWith(prefix))
+      .forEach(key => {
+        this.inFlight.delete(key);
+        this.remove(key);
+      });
+  }
+
+  /**
+   * Get cache statistics
+   */
+  getStats(prefix = '') {
+    const keys = Array.from(this.entries.keys()).filter(key => key.startsWith(prefix));
+    const lookups = this.stats.hits + this.stats.staleHits + this.stats.misses;
+    return {
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round(((this.stats.hits + this.stats.staleHits) / lookups) * 1000) / 1000 : 0,
+      size: keys.length,
+      keys,
+      inFlight: this.inFlight.size,
+      maxEntries: this.maxEntries
+    };
+  }
+}
+
+// Shared instance used by all data services
+export const queryCache = new QueryCache();
+export default queryCache;
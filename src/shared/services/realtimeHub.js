@@ -0,0 +1,228 @@
+/**
+ * Realtime Hub
+ * Multiplexes Supabase postgres_changes subscriptions onto one channel per
+ * user instead of one channel per table per component.
+ *
+ * - bindings are reference-counted by table + filter, so ten components
+ *   watching the same table share one server-side subscription
+ * - the channel is rebuilt once per burst of subscribe/unsubscribe calls
+ * - events are buffered for a short window and coalesced by row id before
+ *   listeners run, so a bulk update triggers one re-render instead of N
+ */
+
+const DEFAULT_BATCH_WINDOW = 50;
+const REBUILD_DELAY = 0;
+const MAX_RECONNECT_DELAY = 30000;
+
+const rowIdOf = (event) => event.new?.id ?? event.old?.id ?? null;
+
+/**
+ * Merge events that touch the same row, keeping arrival order.
+ * INSERT then UPDATE stays an INSERT with the latest row, INSERT then
+ * DELETE cancels out, and anything followed by DELETE becomes a DELETE.
+ */
+export function coalesceEvents(events) {
+  const merged = [];
+  const byRow = new Map();
+
+  events.forEach(event => {
+    const id = rowIdOf(event);
+    if (id === null) {
+      merged.push(event);
+      return;
+    }
+
+    const key = `${event.table}:${id}`;
+    const index = byRow.get(key);
+    if (index === undefined) {
+      byRow.set(key, merged.length);
+      merged.push(event);
+      return;
+    }
+
+    const previous = merged[index];
+    if (event.eventType === 'DELETE') {
+      merged[index] = previous?.eventType === 'INSERT' ? null : { ...event };
+    } else if (previous?.eventType === 'INSERT') {
+      merged[index] = { ...event, eventType: 'INSERT', old: previous.old };
+    } else {
+      merged[index] = { ...event, old: previous ? previous.old : event.old };
+    }
+  });
+
+  return merged.filter(Boolean);
+}
+
+class UserChannel {
+  constructor(hub, supabase, scope) {
+    this.hub = hub;
+    this.supabase = supabase;
+    this.scope = scope;
+    this.bindings = new Map();
+    this.channel = null;
+    this.status = 'CLOSED';
+    this.rebuildTimer = null;
+    this.reconnectAttempts = 0;
+  }
+
+  addListener(table, filter, listener) {
+    const key = `${table}|${filter || ''}`;
+    let binding = this.bindings.get(key);
+    if (!binding) {
+      binding = { table, filter, listeners: new Set(), buffer: [], flushTimer: null };
+      this.bindings.set(key, binding);
+      this.scheduleRebuild();
+    }
+    binding.listeners.add(listener);
+    if (listener.onStatus) listener.onStatus(this.status);
+
+    return () => {
+      binding.listeners.delete(listener);
+      if (binding.listeners.size > 0 || this.bindings.get(key) !== binding) return;
+      clearTimeout(binding.flushTimer);
+      this.bindings.delete(key);
+      this.scheduleRebuild();
+    };
+  }
+
+  scheduleRebuild(delay = REBUILD_DELAY) {
+    clearTimeout(this.rebuildTimer);
+    this.rebuildTimer = setTimeout(() => this.rebuild(), delay);
+  }
+
+  rebuild() {
+    this.rebuildTimer = null;
+    if (this.channel) {
+      this.supabase.removeChannel(this.channel);
+      this.channel = null;
+    }
+    if (this.bindings.size === 0) {
+      this.setStatus('CLOSED');
+      this.hub.dropChannel(this.supabase, this.scope);
+      return;
+    }
+
+    let channel = this.supabase.channel(`hub:${this.scope}:${Date.now()}`);
+    this.bindings.forEach(binding => {
+      channel = channel.on('postgres_changes', {
+        event: '*',
+        schema: 'public',
+        table: binding.table,
+        ...(binding.filter ? { filter: binding.filter } : {})
+      }, (payload) => this.receive(binding, payload));
+    });
+
+    this.channel = channel;
+    this.hub.stats.channelBuilds++;
+    channel.subscribe((status) => {
+      if (this.channel !== channel) return;
+      this.setStatus(status);
+      if (status === 'SUBSCRIBED') {
+        this.reconnectAttempts = 0;
+      } else if (status === 'CHANNEL_ERROR' || status === 'TIMED_OUT') {
+        this.reconnectAttempts++;
+        this.scheduleRebuild(Math.min(1000 * 2 ** this.reconnectAttempts, MAX_RECONNECT_DELAY));
+      }
+    });
+  }
+
+  setStatus(status) {
+    this.status = status;
+    this.bindings.forEach(binding => {
+      binding.listeners.forEach(listener => listener.onStatus?.(status));
+    });
+  }
+
+  receive(binding, payload) {
+    this.hub.stats.eventsReceived++;
+    binding.buffer.push({ ...payload, table: payload.table || binding.table });
+    if (binding.flushTimer) return;
+    binding.flushTimer = setTimeout(() => this.flush(binding), this.hub.batchWindow);
+  }
+
+  flush(binding) {
+    binding.flushTimer = null;
+    const events = coalesceEvents(binding.buffer);
+    binding.buffer = [];
+    if (events.length === 0) return;
+
+    this.hub.stats.batchesDelivered++;
+    this.hub.stats.eventsDelivered += events.length;
+    binding.listeners.forEach(listener => {
+      const matching = listener.events.includes('*')
+        ? events
+        : events.filter(event => listener.events.includes(event.eventType));
+      if (matching.length === 0) return;
+      try {
+        listener.callback(matching);
+      } catch (error) {
+        console.error('Error in realtime listener:', error);
+      }
+    });
+  }
+}
+
+export class RealtimeHub {
+  constructor({ batchWindow = DEFAULT_BATCH_WINDOW } = {}) {
+    this.batchWindow = batchWindow;
+    // supabase client -> Map(scope -> UserChannel)
+    this.clients = new WeakMap();
+    this.stats = { channelBuilds: 0, eventsReceived: 0, eventsDelivered: 0, batchesDelivered: 0 };
+  }
+
+  /**
+   * Listen to changes on a table
+   * @param {Object} supabase - Supabase client
+   * @param {Object} options
+   * @param {string} options.table - table name
+   * @param {string} options.filter - postgres_changes filter, e.g. 'user_id=eq.123'
+   * @param {string[]} options.events - '*', 'INSERT', 'UPDATE' and/or 'DELETE'
+   * @param {string} options.scope - channel owner, usually the user id
+   * @param {Function} options.onStatus - called with the channel status
+   * @param {Function} callback - receives an array of coalesced change payloads
+   * @returns {Function} Unsubscribe function
+   */
+  subscribe(supabase, { table, filter = null, events = ['*'], scope = 'global', onStatus = null }, callback) {
+    if (!supabase || !table) {
+      return () => {};
+    }
+
+    let channels = this.clients.get(supabase);
+    if (!channels) {
+      channels = new Map();
+      this.clients.set(supabase, channels);
+    }
+    let userChannel = channels.get(scope);
+    if (!userChannel) {
+      userChannel = new UserChannel(this, supabase, scope);
+      channels.set(scope, userChannel);
+    }
+
+    return userChannel.addListener(table, filter, { events, callback, onStatus });
+  }
+
+  dropChannel(supabase, scope) {
+    const channels = this.clients.get(supabase);
+    if (channels?.get(scope)?.bindings.size === 0) {
+      channels.delete(scope);
+    }
+  }
+
+  /**
+   * Get hub statistics for one Supabase client
+   */
+  getStats(supabase) {
+    const channels = supabase ? Array.from(this.clients.get(supabase)?.values() || []) : [];
+    return {
+      ...this.stats,
+      channels: channels.length,
+      bindings: channels.reduce((total, channel) => total + channel.bindings.size, 0),
+      listeners: channels.reduce((total, channel) =>
+        total + Array.from(channel.bindings.values()).reduce((sum, binding) => sum + binding.listeners.size, 0), 0)
+    };
+  }
+}
+
+// Shared instance used by hooks and services
+export const realtimeHub = new RealtimeHub();
+export default realtimeHub;
@@ -0,0 +1,269 @@
+/**
+ * Session Cache
+ * Keeps validated sessions in memory so protected navigation does not hit
+ * user_sessions on every check.
+ *
+ * - a validated session is reused for `ttl`; an unknown or expired token is
+ *   remembered as invalid for `negativeTtl`
+ * - concurrent checks of the same token share one lookup
+ * - last_activity is collected per session and written in one bulk UPDATE
+ *   every `flushInterval` instead of once per check
+ * - revoking a session (logout, admin revoke, or an is_active=false change
+ *   seen over realtime) drops it immediately, and a lookup that was already
+ *   in flight is not cached
+ */
+
+import { supabase } from '../lib/supabase.js';
+import { realtimeHub } from './realtimeHub.js';
+
+const DEFAULT_TTL = 60 * 1000;
+const DEFAULT_NEGATIVE_TTL = 10 * 1000;
+const DEFAULT_FLUSH_INTERVAL = 30 * 1000;
+
+export class SessionCache {
+  constructor({
+    ttl = DEFAULT_TTL,
+    negativeTtl = DEFAULT_NEGATIVE_TTL,
+    flushInterval = DEFAULT_FLUSH_INTERVAL,
+    maxEntries = 500,
+    writeActivity = null
+  } = {}) {
+    this.ttl = ttl;
+    this.negativeTtl = negativeTtl;
+    this.flushInterval = flushInterval;
+    this.maxEntries = maxEntries;
+    this.writeActivity = writeActivity;
+    // token -> { result, freshUntil }, oldest first
+    this.entries = new Map();
+    this.inFlight = new Map();
+    // token -> revoked until (ms)
+    this.revoked = new Map();
+    // session id -> last activity (ms) not yet written
+    this.pendingActivity = new Map();
+    this.flushTimer = null;
+    // Bumped on every revocation so lookups started earlier are not stored
+    this.generation = 0;
+    this.stats = { hits: 0, misses: 0, dedupedRequests: 0, revocations: 0, flushes: 0, activityWrites: 0, errors: 0 };
+  }
+
+  /**
+   * Validate a token through the cache
+   * @param {string} token - session token
+   * @param {Function} loader - async (token) => { user, session } or null
+   * @returns {Promise<Object|null>} Session result, null when invalid
+   */
+  async validate(token, loader) {
+    if (!token) return null;
+    const now = Date.now();
+    this.pruneRevoked(now);
+    if (this.revoked.has(token)) return null;
+
+    const entry = this.entries.get(token);
+    if (entry && now < entry.freshUntil) {
+      if (entry.result && Date.parse(entry.result.session.expires_at) <= now) {
+        this.entries.delete(token);
+        return null;
+      }
+      this.stats.hits++;
+      if (entry.result) this.recordActivity(entry.result.session.id, now);
+      return entry.result;
+    }
+    this.entries.delete(token);
+
+    if (this.inFlight.has(token)) {
+      this.stats.dedupedRequests++;
+      return this.inFlight.get(token);
+    }
+
+    this.stats.misses++;
+    const generation = this.generation;
+    const request = (async () => {
+      try {
+        const result = (await loader(token)) || null;
+        if (generation === this.generation) {
+          this.store(token, result);
+        }
+        if (result) this.recordActivity(result.session.id, Date.now());
+        return result;
+      } catch (error) {
+        this.stats.errors++;
+        throw error;
+      } finally {
+        this.inFlight.delete(token);
+      }
+    })();
+    this.inFlight.set(token, request);
+    return request;
+  }
+
+  store(token, result) {
+    this.entries.set(token, {
+      result,
+      freshUntil: Date.now() + (result ? this.ttl : this.negativeTtl)
+    });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  /**
+   * Note activity on a session; written on the next flush
+   */
+  recordActivity(sessionId, at = Date.now()) {
+    if (!sessionId || !this.writeActivity) return;
+    this.pendingActivity.set(sessionId, Math.max(at, this.pendingActivity.get(sessionId) || 0));
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        this.flushTimer = null;
+        this.flush();
+      }, this.flushInterval);
+    }
+  }
+
+  /**
+   * Write pending last_activity values in one bulk update
+   * @returns {Promise<number>} Number of sessions written
+   */
+  async flush() {
+    clearTimeout(this.flushTimer);
+    this.flushTimer = null;
+    if (this.pendingActivity.size === 0 || !this.writeActivity) return 0;
+
+    const batch = this.pendingActivity;
+    this.pendingActivity = new Map();
+    const sessionIds = [...batch.keys()];
+    // One timestamp for the whole batch: activity is tracked to flush precision
+    const lastActivity = new Date(Math.max(...batch.values())).toISOString();
+
+    try {
+      await this.writeActivity(sessionIds, lastActivity);
+      this.stats.flushes++;
+      this.stats.activityWrites += sessionIds.length;
+      return sessionIds.length;
+    } catch (error) {
+      this.stats.errors++;
+      console.error('Failed to write session activity:', error);
+      // Keep the values for the next flush unless newer ones arrived
+      batch.forEach((at, sessionId) => this.recordActivity(sessionId, at));
+      return 0;
+    }
+  }
+
+  /**
+   * Forget a session and refuse its token until it expires
+   * @param {string} token - session token
+   * @param {Object} options
+   * @param {string} options.expiresAt - session expiry; defaults to the cache TTL
+   */
+  revoke(token, { expiresAt } = {}) {
+    if (!token) return;
+    const cached = this.entries.get(token)?.result;
+    const until = Date.parse(expiresAt || cached?.session?.expires_at || '') || Date.now() + this.ttl;
+    this.entries.delete(token);
+    this.inFlight.delete(token);
+    this.revoked.set(token, until);
+    if (cached) this.pendingActivity.delete(cached.session.id);
+    this.generation++;
+    this.stats.revocations++;
+  }
+
+  /**
+   * Revoke every cached session matching a predicate on { user, session }
+   * @returns {number} Number of sessions revoked
+   */
+  revokeWhere(predicate) {
+    const tokens = [];
+    this.entries.forEach((entry, token) => {
+      if (entry.result && predicate(entry.result)) tokens.push(token);
+    });
+    tokens.forEach(token => this.revoke(token));
+    // A lookup for the same user may be in flight under another token
+    this.generation++;
+    return tokens.length;
+  }
+
+  revokeUser(userId) {
+    return this.revokeWhere(({ user }) => user?.id === userId);
+  }
+
+  /**
+   * Apply user_sessions changes from realtime: deactivated or deleted rows
+   * are revoked here too, so a logout on another server takes effect before
+   * the TTL runs out
+   */
+  applySessionChanges(events) {
+    events.forEach(event => {
+      const row = event.eventType === 'DELETE' ? event.old : event.new;
+      if (!row) return;
+      if (event.eventType === 'DELETE' || row.is_active === false) {
+        if (row.session_token) {
+          this.revoke(row.session_token, { expiresAt: row.expires_at });
+        } else {
+          this.revokeWhere(({ session }) => session.id === row.id);
+        }
+      }
+    });
+  }
+
+  /**
+   * Listen for session deactivations over realtime (once per client)
+   * @returns {Function} Unsubscribe function
+   */
+  watchRevocations(client) {
+    if (!client || this.unwatch) return this.unwatch || (() => {});
+    const unsubscribe = realtimeHub.subscribe(client, {
+      table: 'user_sessions',
+      events: ['UPDATE', 'DELETE']
+    }, events => this.applySessionChanges(events));
+    this.unwatch = () => {
+      unsubscribe();
+      this.unwatch = null;
+    };
+    return this.unwatch;
+  }
+
+  pruneRevoked(now) {
+    this.revoked.forEach((until, token) => {
+      if (until <= now) this.revoked.delete(token);
+    });
+  }
+
+  clear() {
+    this.entries.clear();
+    this.inFlight.clear();
+    this.generation++;
+  }
+
+  /**
+   * Get cache statistics
+   */
+  getStats() {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      hitRate: lookups > 0 ? Math.round((this.stats.hits / lookups) * 1000) / 1000 : 0,
+      size: this.entries.size,
+      revoked: this.revoked.size,
+      pendingActivity: this.pendingActivity.size
+    };
+  }
+}
+
+// Shared instance used by DatabaseAuthService
+export const sessionCache = new SessionCache({
+  writeActivity: async (sessionIds, lastActivity) => {
+    if (!supabase) return;
+    const { error } = await supabase
+      .from('user_sessions')
+      .update({ last_activity: lastActivity })
+      .in('id', sessionIds);
+    if (error) throw error;
+  }
+});
+
+// Pending activity is written before the page goes away
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', () => { sessionCache.flush(); });
+}
+
+export default sessionCache;
@@ -0,0 +1,81 @@
+import { describe, it, expect, vi } from 'vitest';
+import { mapWithConcurrency, withRetry, backoffDelay } from '../concurrency';
+
+const tick = () => new Promise(resolve => setTimeout(resolve, 0));
+
+describe('mapWithConcurrency', () => {
+  it('keeps at most `limit` tasks in flight and preserves order', async () => {
+    let inFlight = 0;
+    let peak = 0;
+
+    const results = await mapWithConcurrency([1, 2, 3, 4, 5], 2, async (n) => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await tick();
+      inFlight--;
+      return n * 10;
+    });
+
+    expect(peak).toBe(2);
+    expect(results.map(r => r.value)).toEqual([10, 20, 30, 40, 50]);
+  });
+
+  it('settles failures per item instead of rejecting', async () => {
+    const results = await mapWithConcurrency(['a', 'b'], 4, async (item) => {
+      if (item === 'a') throw new Error('nope');
+      return item;
+    });
+
+    expect(results[0]).toMatchObject({ status: 'rejected' });
+    expect(results[0].reason.message).toBe('nope');
+    expect(results[1]).toEqual({ status: 'fulfilled', value: 'b' });
+  });
+
+  it('handles an empty list', async () => {
+    expect(await mapWithConcurrency([], 3, async () => 1)).toEqual([]);
+  });
+});
+
+describe('backoffDelay', () => {
+  it('doubles per attempt within the jitter band and respects the cap', () => {
+    for (let attempt = 1; attempt <= 4; attempt++) {
+      const delay = backoffDelay(attempt, 100, 10000);
+      const full = 100 * 2 ** (attempt - 1);
+      expect(delay).toBeGreaterThanOrEqual(full / 2);
+      expect(delay).toBeLessThanOrEqual(full);
+    }
+    expect(backoffDelay(20, 100, 1000)).toBeLessThanOrEqual(1000);
+  });
+});
+
+describe('withRetry', () => {
+  const wait = vi.fn(async () => {});
+
+  it('retries retryable failures until success', async () => {
+    const fn = vi.fn()
+      .mockRejectedValueOnce(new Error('timeout'))
+      .mockRejectedValueOnce(new Error('timeout'))
+      .mockResolvedValue('done');
+
+    await expect(withRetry(fn, { maxAttempts: 4, wait })).resolves.toBe('done');
+    expect(fn).toHaveBeenCalledTimes(3);
+    expect(fn).toHaveBeenLastCalledWith(3);
+  });
+
+  it('stops at maxAttempts and reports the attempt count', async () => {
+    const fn = vi.fn(async () => { throw new Error('still down'); });
+
+    const error = await withRetry(fn, { maxAttempts: 3, wait }).catch(e => e);
+    expect(error.message).toBe('still down');
+    expect(error.attempts).toBe(3);
+    expect(fn).toHaveBeenCalledTimes(3);
+  });
+
+  it('does not retry errors rejected by isRetryable', async () => {
+    const fn = vi.fn(async () => { throw new Error('bad input'); });
+
+    const error = await withRetry(fn, { maxAttempts: 5, wait, isRetryable: () => false }).catch(e => e);
+    expect(error.attempts).toBe(1);
+    expect(fn).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,35 @@
+import { describe, it, expect } from 'vitest';
+import { toDate, formatDate, monthKey, formatMonth, shiftMonth, monthStart } from '../dateUtils';
+
+describe('dateUtils', () => {
+  it('reads month keys, ISO strings, timestamps and Dates', () => {
+    expect(monthKey('2026-10')).toBe('2026-10');
+    expect(monthKey('2026-10-16T09:30:00')).toBe('2026-10');
+    expect(monthKey(new Date(2026, 0, 31))).toBe('2026-01');
+    expect(monthKey(new Date(2026, 4, 2).getTime())).toBe('2026-05');
+  });
+
+  it('formats with date-fns patterns', () => {
+    expect(formatMonth('2026-10')).toBe('October 2026');
+    expect(formatDate('2026-10-06')).toBe('Oct 06, 2026');
+    expect(formatDate('2026-10', 'yyyy-MM-01')).toBe('2026-10-01');
+  });
+
+  it('returns an empty string instead of throwing on bad input', () => {
+    expect(formatDate(null)).toBe('');
+    expect(formatDate('not a date')).toBe('');
+    expect(shiftMonth('garbage', 1)).toBe('');
+    expect(toDate({}).getTime()).toBeNaN();
+  });
+
+  it('shifts months across year boundaries', () => {
+    expect(shiftMonth('2026-01', -1)).toBe('2025-12');
+    expect(shiftMonth('2026-10', -12)).toBe('2025-10');
+    expect(shiftMonth('2026-11', 3)).toBe('2027-02');
+  });
+
+  it('finds the start of a month', () => {
+    const start = monthStart('2026-10-16');
+    expect([start.getFullYear(), start.getMonth(), start.getDate(), start.getHours()]).toEqual([2026, 9, 1, 0]);
+  });
+});
@@ -0,0 +1,87 @@
+import { describe, it, expect } from 'vitest';
+import {
+  normalizeName,
+  normalizePhone,
+  compositeKey,
+  buildIndex,
+  getIndex,
+  leftJoin,
+  innerJoin
+} from '../joinIndex';
+
+describe('normalizers', () => {
+  it('normalizes names', () => {
+    expect(normalizeName('  John   DOE ')).toBe('john doe');
+    expect(normalizeName(null)).toBe('');
+  });
+
+  it('normalizes Indian phone formats to national digits', () => {
+    expect(normalizePhone('+91 98765-43210')).toBe('9876543210');
+    expect(normalizePhone('098765 43210')).toBe('9876543210');
+    expect(normalizePhone('9876543210')).toBe('9876543210');
+  });
+});
+
+describe('buildIndex', () => {
+  const rows = [
+    { id: 1, team: 'web' },
+    { id: 2, team: 'seo' },
+    { id: 3, team: 'web' }
+  ];
+
+  it('keeps the first row per key like Array.find', () => {
+    const index = buildIndex(rows, compositeKey('team'));
+    expect(index.get('web').id).toBe(1);
+  });
+
+  it('groups rows when not unique', () => {
+    const index = buildIndex(rows, compositeKey('team'), { unique: false });
+    expect(index.get('web').map(r => r.id)).toEqual([1, 3]);
+  });
+});
+
+describe('getIndex', () => {
+  it('reuses the index until the version changes', () => {
+    const rows = [{ id: 1 }];
+    const first = getIndex(rows, 'id', { version: 1 });
+    expect(getIndex(rows, 'id', { version: 1 })).toBe(first);
+
+    rows.push({ id: 2 });
+    const rebuilt = getIndex(rows, 'id', { version: 2 });
+    expect(rebuilt).not.toBe(first);
+    expect(rebuilt.get(2)).toEqual({ id: 2 });
+  });
+});
+
+describe('joins', () => {
+  const employees = [
+    { id: 'e1', name: 'Asha Rao', phone: '+91 90000 00001' },
+    { id: 'e2', name: 'Ravi Kumar', phone: '9000000002' }
+  ];
+  const submissions = [
+    { id: 's1', employee_name: 'asha rao', employee_phone: '9000000001' },
+    { id: 's2', employee_name: 'Unknown', employee_phone: '9000000009' }
+  ];
+  const options = {
+    leftKey: ['employee_name', 'employee_phone'],
+    rightKey: ['name', 'phone'],
+    normalize: [normalizeName, normalizePhone],
+    merge: (submission, employee) => ({ id: submission.id, employeeId: employee?.id ?? null })
+  };
+
+  it('left join keeps unmatched rows', () => {
+    expect(leftJoin(submissions, employees, options)).toEqual([
+      { id: 's1', employeeId: 'e1' },
+      { id: 's2', employeeId: null }
+    ]);
+  });
+
+  it('inner join drops unmatched rows', () => {
+    expect(innerJoin(submissions, employees, options)).toEqual([{ id: 's1', employeeId: 'e1' }]);
+  });
+
+  it('shallow merges with left fields winning by default', () => {
+    const result = leftJoin([{ user_id: 1, name: 'row' }], [{ user_id: 1, name: 'user', role: 'hr' }], { leftKey: 'user_id' });
+    expect(result).toEqual([{ user_id: 1, name: 'row', role: 'hr' }]);
+  });
+});
@@ -0,0 +1,86 @@
+/**
+ * Concurrency helpers
+ * Run async work over a list with at most `limit` tasks in flight, and retry
+ * flaky calls with exponential backoff.
+ */
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * Map items through an async function with bounded concurrency.
+ * Never rejects: each result is settled like Promise.allSettled, in input order.
+ *
+ * @param {Array} items - Items to process
+ * @param {number} limit - Maximum tasks in flight (at least 1)
+ * @param {Function} fn - async (item, index) => result
+ * @returns {Promise<Array<{status: 'fulfilled'|'rejected', value?: *, reason?: Error}>>}
+ */
+export async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  const workerCount = Math.min(Math.max(1, Math.floor(limit) || 1), items.length);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      try {
+        results[index] = { status: 'fulfilled', value: await fn(items[index], index) };
+      } catch (reason) {
+        results[index] = { status: 'rejected', reason };
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
+/**
+ * Exponential backoff with jitter: base * 2^(attempt - 1), capped, scaled to 50-100%
+ *
+ * @param {number} attempt - 1-based attempt that just failed
+ * @param {number} baseDelayMs - delay after the first failure
+ * @param {number} maxDelayMs - upper bound before jitter
+ */
+export function backoffDelay(attempt, baseDelayMs = 500, maxDelayMs = 10000) {
+  const delay = Math.min(maxDelayMs, baseDelayMs * 2 ** (attempt - 1));
+  return Math.round(delay * (0.5 + Math.random() / 2));
+}
+
+/**
+ * Call fn until it resolves, retrying errors that `isRetryable` accepts.
+ * The last error is rethrown with `attempts` set to the number of tries made.
+ *
+ * @param {Function} fn - async (attempt) => result, attempt is 1-based
+ * @param {Object} options
+ * @param {number} options.maxAttempts - total tries including the first
+ * @param {number} options.baseDelayMs - backoff base, see backoffDelay
+ * @param {Function} options.isRetryable - (error) => boolean; retries everything by default
+ * @param {Function} options.onRetry - (error, attempt, delayMs) => void
+ * @param {Function} options.wait - (ms) => Promise, overridable for tests
+ */
+export async function withRetry(fn, options = {}) {
+  const {
+    maxAttempts = 3,
+    baseDelayMs = 500,
+    isRetryable = () => true,
+    onRetry = null,
+    wait = sleep
+  } = options;
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn(attempt);
+    } catch (error) {
+      if (attempt >= maxAttempts || !isRetryable(error)) {
+        if (error && typeof error === 'object') error.attempts = attempt;
+        throw error;
+      }
+      const delayMs = backoffDelay(attempt, baseDelayMs);
+      if (onRetry) onRetry(error, attempt, delayMs);
+      await wait(delayMs);
+    }
+  }
+}
+
+export default mapWithConcurrency;
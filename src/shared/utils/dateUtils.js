@@ -0,0 +1,40 @@
+import { addDays, addMonths, format, isValid, parseISO, startOfMonth, subMonths } from 'date-fns';
+
+/**
+ * Date helpers on date-fns, the app's only date library.
+ *
+ * Values may be Dates, ISO strings (including 'YYYY-MM' month keys) or
+ * timestamps. Formatting an empty or unparseable value returns '' instead of
+ * throwing, so a bad row never breaks a render. Patterns use date-fns tokens
+ * ('yyyy-MM', 'MMM dd, yyyy'), not moment's ('YYYY-MM', 'MMM DD, YYYY').
+ */
+
+export const toDate = (value = new Date()) => {
+  if (value instanceof Date) return value;
+  if (typeof value === 'number') return new Date(value);
+  if (typeof value === 'string') return parseISO(value);
+  return new Date(NaN);
+};
+
+export const formatDate = (value, pattern = 'MMM dd, yyyy') => {
+  const date = toDate(value);
+  return isValid(date) ? format(date, pattern) : '';
+};
+
+// 'YYYY-MM' key for a date (now by default), as used by monthly tables
+export const monthKey = (value = new Date()) => formatDate(value, 'yyyy-MM');
+
+export const formatMonth = (value, pattern = 'MMMM yyyy') => formatDate(value, pattern);
+
+// Month key `months` months from the given one (negative for earlier)
+export const shiftMonth = (value, months) => {
+  const date = toDate(value);
+  return isValid(date) ? monthKey(addMonths(date, months)) : '';
+};
+
+// Month key `count` months before now
+export const monthsAgo = (count) => monthKey(subMonths(new Date(), count));
+
+export const monthStart = (value = new Date()) => startOfMonth(toDate(value));
+
+export const daysFromNow = (days) => addDays(new Date(), days);
@@ -1,108 +1,16 @@
 /**
- * IP Tracking and Geolocation Utilities
- * Handles IP address detection and location data for login tracking
+ * Login Tracking Utilities
+ * Queues login attempts for the API, which adds the IP address and location
+ * and stores them in batches. Nothing here is awaited on the login path.
  */
 
-/**
- * Get the user's IP address from various sources
- * @returns {Promise<string>} The user's IP address
- */
-export const getUserIP = async () => {
-  try {
-    // Try multiple IP detection services for reliability
-    const ipServices = [
-      'https://api.ipify.org?format=json',
-      'https://ipapi.co/json/',
-      'https://ip-api.com/json/'
-    ];
+const TELEMETRY_ENDPOINT = '/api/telemetry/logins';
+const FLUSH_DELAY = 2000;
+// Same limit as the endpoint accepts per request
+const MAX_BATCH = 50;
 
-    for (const service of ipServices) {
-      try {
-        const response = await fetch(service, {
-          method: 'GET',
-          timeout: 5000 // 5 second timeout
-        });
-        
-        if (response.ok) {
-          const data = await response.json();
-          // Different services return IP in different fields
-          const ip = data.ip || data.query || data.ipAddress;
-          if (ip) {
-            return ip;
-          }
-        }
-      } catch (error) {
-        console.warn(`IP service ${service} failed:`, error);
-        continue;
-      }
-    }
-    
-    // Fallback: try to get from headers (if available)
-    return 'unknown';
-  } catch (error) {
-    console.error('Failed to get user IP:', error);
-    return 'unknown';
-  }
-};
-
-/**
- * Get location data based on IP address
- * @param {string} ipAddress - The IP address to lookup
- * @returns {Promise<Object>} Location data object
- */
-export const getLocationData = async (ipAddress) => {
-  try {
-    if (!ipAddress || ipAddress === 'unknown' || ipAddress === '127.0.0.1') {
-      return {
-        country: 'Unknown',
-        region: 'Unknown',
-        city: 'Unknown',
-        timezone: 'Unknown',
-        isp: 'Unknown'
-      };
-    }
-
-    // Use ip-api.com for location data (free tier allows 1000 requests/month)
-    const response = await fetch(`https://ip-api.com/json/${ipAddress}?fields=status,message,country,regionName,city,timezone,isp,org,as,query`, {
-      method: 'GET',
-      timeout: 5000
-    });
-
-    if (response.ok) {
-      const data = await response.json();
-      
-      if (data.status === 'success') {
-        return {
-          country: data.country || 'Unknown',
-          region: data.regionName || 'Unknown',
-          city: data.city || 'Unknown',
-          timezone: data.timezone || 'Unknown',
-          isp: data.isp || 'Unknown',
-          organization: data.org || 'Unknown',
-          as: data.as || 'Unknown'
-        };
-      }
-    }
-    
-    // Fallback location data
-    return {
-      country: 'Unknown',
-      region: 'Unknown', 
-      city: 'Unknown',
-      timezone: 'Unknown',
-      isp: 'Unknown'
-    };
-  } catch (error) {
-    console.error('Failed to get location data:', error);
-    return {
-      country: 'Unknown',
-      region: 'Unknown',
-      city: 'Unknown', 
-      timezone: 'Unknown',
-      isp: 'Unknown'
-    };
-  }
-};
+let pendingEvents = [];
+let flushTimer = null;
 
 /**
  * Get browser and device information
@@ -155,85 +63,61 @@ export const getDeviceInfo = () => {
 };
 
 /**
- * Record a login attempt with all tracking data
+ * Queue a login attempt; returns immediately
  * @param {Object} loginData - Login attempt data
- * @returns {Promise<Object>} Complete tracking record
+ * @returns {Object} The queued tracking record
  */
-export const recordLoginAttempt = async (loginData) => {
-  try {
-    // Get IP address and location data
-    const ipAddress = await getUserIP();
-    const locationData = await getLocationData(ipAddress);
-    const deviceInfo = getDeviceInfo();
+export const recordLoginAttempt = (loginData) => {
+  const trackingRecord = {
+    user_id: loginData.userId || null,
+    email: loginData.email || null,
+    identifier: loginData.identifier || null,
+    user_type: loginData.userType || 'employee',
+    login_status: loginData.loginStatus, // 'success' or 'failed'
+    failure_reason: loginData.failureReason || null,
+    device_info: getDeviceInfo(),
+    timestamp: new Date().toISOString()
+  };
 
-    // Create comprehensive tracking record for user_sessions table
-    const trackingRecord = {
-      user_id: loginData.userId || null,
-      email: loginData.email,
-      user_type: loginData.userType || 'employee',
-      login_status: loginData.loginStatus, // 'success' or 'failed'
-      failure_reason: loginData.failureReason || null,
-      session_id: loginData.sessionId || null,
-      ip_address: ipAddress,
-      user_agent: navigator.userAgent,
-      location_data: locationData,
-      device_info: deviceInfo,
-      timestamp: new Date().toISOString()
-    };
-
-    console.log('Login attempt recorded:', {
-      email: trackingRecord.email,
-      status: trackingRecord.login_status,
-      ip: trackingRecord.ip_address,
-      location: `${locationData?.city}, ${locationData?.country}`,
-      device: `${deviceInfo?.browser} on ${deviceInfo?.os}`
-    });
-
-    return trackingRecord;
-  } catch (error) {
-    console.error('Failed to record login attempt:', error);
-    return {
-      email: loginData.email,
-      login_status: loginData.loginStatus,
-      failure_reason: loginData.failureReason,
-      ip_address: 'unknown',
-      user_agent: navigator.userAgent,
-      timestamp: new Date().toISOString(),
-      error: error.message
-    };
+  pendingEvents.push(trackingRecord);
+  if (pendingEvents.length >= MAX_BATCH) {
+    flushLoginTelemetry();
+  } else if (!flushTimer) {
+    flushTimer = setTimeout(flushLoginTelemetry, FLUSH_DELAY);
   }
+
+  return trackingRecord;
 };
 
 /**
- * Save login tracking record to database using user_sessions table
- * @param {Object} supabase - Supabase client instance
- * @param {Object} trackingRecord - The tracking record to save
- * @returns {Promise<Object>} The saved record or error
+ * Send queued login attempts without waiting for a reply
  */
-export const saveLoginTracking = async (supabase, trackingRecord) => {
+export const flushLoginTelemetry = () => {
+  clearTimeout(flushTimer);
+  flushTimer = null;
+  if (pendingEvents.length === 0) return;
+
+  const events = pendingEvents.splice(0, MAX_BATCH);
+  const body = JSON.stringify({ events });
   try {
-    // For successful logins, this will be handled by DatabaseAuthService
-    // For failed attempts, we can log them to a separate tracking system or user_sessions with null user_id
-    if (trackingRecord.login_status === 'success' && trackingRecord.user_id) {
-      // Successful login - session should already be created by DatabaseAuthService
-      console.log('Successful login tracked via user_sessions');
-      return { success: true, message: 'Login tracked via user_sessions' };
+    const sent = typeof navigator !== 'undefined' && navigator.sendBeacon &&
+      navigator.sendBeacon(TELEMETRY_ENDPOINT, new Blob([body], { type: 'application/json' }));
+    if (!sent) {
+      fetch(TELEMETRY_ENDPOINT, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+        keepalive: true
+      }).catch(error => console.warn('Login telemetry not sent:', error.message));
     }
-
-    // For failed attempts, we could create a failed login entry
-    // But since we're removing login_attempts table, we'll just log it
-    console.warn('Failed login attempt:', {
-      email: trackingRecord.email,
-      ip: trackingRecord.ip_address,
-      reason: trackingRecord.failure_reason,
-      timestamp: trackingRecord.timestamp
-    });
-
-    return { success: true, message: 'Failed login attempt logged' };
-
-    return { success: true, data };
   } catch (error) {
-    console.error('Error saving login tracking:', error);
-    return { success: false, error: error.message };
+    console.warn('Login telemetry not sent:', error.message);
   }
-};
\ No newline at end of file
+
+  if (pendingEvents.length > 0) flushLoginTelemetry();
+};
+
+// Queued attempts are sent before the page goes away
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', flushLoginTelemetry);
+}
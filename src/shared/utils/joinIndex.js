@@ -0,0 +1,160 @@
+/**
+ * Hash-indexed joins for client-side data stitching.
+ *
+ * Replaces `left.map(row => right.find(...))` loops (O(n·m)) with a Map
+ * built once over the right-hand dataset (O(n + m)). Indexes are memoized
+ * per dataset array and version, so repeated joins against the same rows
+ * reuse the existing index until the caller bumps the version.
+ */
+
+// rows array -> Map(key spec -> { [unique]: { version, index } })
+const indexCache = new WeakMap();
+
+/**
+ * Lower-case and collapse whitespace so "  John  Doe" matches "john doe"
+ */
+export const normalizeName = (value) =>
+  value == null ? '' : String(value).trim().replace(/\s+/g, ' ').toLowerCase();
+
+/**
+ * Reduce a phone number to its national digits: strips formatting, a
+ * leading +91 / 91 country code and a trunk 0 ("+91 98765-43210" -> "9876543210")
+ */
+export const normalizePhone = (value) => {
+  if (value == null) return '';
+  let digits = String(value).replace(/\D/g, '');
+  if (digits.length === 12 && digits.startsWith('91')) digits = digits.slice(2);
+  if (digits.length === 11 && digits.startsWith('0')) digits = digits.slice(1);
+  return digits;
+};
+
+/**
+ * Build a key function from a column name, a list of columns (composite
+ * key) or a custom function. Composite parts are joined with a unit
+ * separator so "ab"+"c" never collides with "a"+"bc".
+ */
+export const compositeKey = (spec, normalize = (value) => value) => {
+  if (typeof spec === 'function') return spec;
+  const columns = Array.isArray(spec) ? spec : [spec];
+  const normalizers = Array.isArray(normalize) ? normalize : columns.map(() => normalize);
+  if (columns.length === 1) {
+    const [column] = columns;
+    const [fn] = normalizers;
+    return (row) => fn(row?.[column]);
+  }
+  return (row) => {
+    let key = '';
+    for (let i = 0; i < columns.length; i++) {
+      key += (i === 0 ? '' : '\u001f') + (normalizers[i] || String)(row?.[columns[i]]);
+    }
+    return key;
+  };
+};
+
+const isMissingKey = (key) => key === undefined || key === null || key === '';
+
+/**
+ * Index rows by key. With `unique` (default) the first row per key wins,
+ * matching the semantics of Array.prototype.find; otherwise every key maps
+ * to an array of rows.
+ *
+ * @param {Array} rows - dataset to index
+ * @param {Function} keyOf - row -> key (see compositeKey)
+ * @param {Object} options
+ * @param {boolean} options.unique - keep only the first row per key
+ * @returns {Map}
+ */
+export function buildIndex(rows = [], keyOf, { unique = true } = {}) {
+  const index = new Map();
+  (rows || []).forEach(row => {
+    const key = keyOf(row);
+    if (isMissingKey(key)) return;
+    if (unique) {
+      if (!index.has(key)) index.set(key, row);
+    } else if (index.has(key)) {
+      index.get(key).push(row);
+    } else {
+      index.set(key, [row]);
+    }
+  });
+  return index;
+}
+
+/**
+ * Memoized buildIndex. The index is rebuilt only when a different array,
+ * key or version is passed; callers that mutate rows in place should bump
+ * `version` (e.g. a lastUpdated timestamp). Normalized or composite keys
+ * stay memoized when the key function is created once at module level
+ * with compositeKey.
+ *
+ * @param {Array} rows - dataset to index
+ * @param {string|string[]|Function} key - column, composite columns or key function
+ * @param {Object} options
+ * @param {*} options.version - dataset version, compared with ===
+ * @param {boolean} options.unique - keep only the first row per key
+ */
+export function getIndex(rows, key, { version = null, unique = true } = {}) {
+  if (!Array.isArray(rows)) return new Map();
+
+  let byKey = indexCache.get(rows);
+  if (!byKey) {
+    byKey = new Map();
+    indexCache.set(rows, byKey);
+  }
+
+  const slot = typeof key === 'function' ? key : JSON.stringify(key);
+  const variants = byKey.get(slot) || {};
+  const cached = variants[unique];
+  if (cached && cached.version === version) {
+    return cached.index;
+  }
+
+  const index = buildIndex(rows, compositeKey(key), { unique });
+  byKey.set(slot, { ...variants, [unique]: { version, index } });
+  return index;
+}
+
+const joinRows = (left, right, { leftKey, rightKey = leftKey, version, normalize, merge, inner }) => {
+  const leftKeyOf = compositeKey(leftKey, normalize);
+  // Inline normalizers produce a fresh key function per call, so the
+  // right side is only memoized for plain columns or module-level key functions
+  const index = normalize && typeof rightKey !== 'function'
+    ? buildIndex(right, compositeKey(rightKey, normalize))
+    : getIndex(right, rightKey, { version });
+
+  const result = [];
+  (left || []).forEach(row => {
+    const key = leftKeyOf(row);
+    const match = isMissingKey(key) ? undefined : index.get(key);
+    if (inner && match === undefined) return;
+    result.push(merge ? merge(row, match ?? null) : { ...(match || {}), ...row });
+  });
+  return result;
+};
+
+/**
+ * Left join: every left row is kept; `merge(left, rightOrNull)` shapes the
+ * output (defaults to a shallow merge where left fields win).
+ *
+ * @param {Array} left
+ * @param {Array} right
+ * @param {Object} options
+ * @param {string|string[]|Function} options.leftKey
+ * @param {string|string[]|Function} options.rightKey - defaults to leftKey
+ * @param {Function|Function[]} options.normalize - applied to both sides
+ * @param {*} options.version - version of the right dataset for index reuse
+ * @param {Function} options.merge
+ */
+export const leftJoin = (left, right, options) => joinRows(left, right, { ...options, inner: false });
+
+/**
+ * Inner join: only left rows with a match on the right are kept
+ */
+export const innerJoin = (left, right, options) => joinRows(left, right, { ...options, inner: true });
+
+/**
+ * Drop every memoized index for a dataset
+ */
+export const clearIndex = (rows) => {
+  if (Array.isArray(rows)) indexCache.delete(rows);
+};
@@ -4,6 +4,8 @@
  */
 
 import { isWithinInterval, parseISO, format } from 'date-fns';
+import { buildListQueryString } from '@/shared/lib/listQuery';
+import { authHeaders } from '@/api/authApi';
 
 /**
  * Apply filters to a dataset
@@ -97,6 +99,47 @@ export const applyFilters = (data, filters, options = {}) => {
   });
 };
 
+/**
+ * Translate AdvancedFilters state into list query contract params
+ * (see src/shared/lib/listQuery.js) so filtering happens in the database
+ * @param {Object} filters - The filter object from AdvancedFilters component
+ * @param {Object} options - Field mappings, same as applyFilters options
+ * @param {Array} sortCriteria - Optional sort object { field, direction } (first entry is used)
+ * @returns {Object} { filter, q, sort } params for fetchListPage / buildListQueryString
+ */
+export const toListQuery = (filters = {}, options = {}, sortCriteria = []) => {
+  const queryFilters = {};
+
+  if (filters.startDate && filters.endDate && options.dateField) {
+    queryFilters[options.dateField] = { gte: filters.startDate, lte: filters.endDate };
+  }
+
+  if (filters.department && filters.department !== 'all') {
+    queryFilters[options.departmentField || 'department'] = filters.department;
+  }
+
+  if (filters.role && filters.role !== 'all') {
+    queryFilters[options.roleField || 'role'] = { ilike: filters.role };
+  }
+
+  if (filters.status && filters.status !== 'all') {
+    queryFilters[options.statusField || 'status'] = filters.status;
+  }
+
+  Object.entries(filters.customFilters || {}).forEach(([key, value]) => {
+    if (!value || value === 'all' || value === '') return;
+    queryFilters[key] = value;
+  });
+
+  const [primarySort] = sortCriteria;
+
+  return {
+    filter: queryFilters,
+    q: filters.search?.trim() || undefined,
+    sort: primarySort ? `${primarySort.direction === 'desc' ? '-' : ''}${primarySort.field}` : undefined
+  };
+};
+
 /**
  * Get nested value from object using dot notation
  * @param {Object} obj - The object to search
@@ -286,6 +329,8 @@ export const calculateFilteredStats = (data, options = {}) => {
 
 /**
  * Export filtered data to CSV format
+ * For rows already loaded or derived in the page; whole tables go through
+ * exportFromServer instead.
  * @param {Array} data - The filtered data
  * @param {Array} columns - Column definitions
  * @param {string} filename - The filename for download
@@ -332,6 +377,107 @@ export const exportToCSV = (data, columns, filename = 'export.csv') => {
   }
 };
 
+// Write a CSV export link to a file the user picked, resuming dropped
+// connections from the last page boundary the server checkpointed
+const saveExportToFile = async (url, handle, maxResumes) => {
+  const writable = await handle.createWritable();
+  let received = 0;
+  let resumes = 0;
+
+  try {
+    let response = await fetch(url);
+    if (!response.ok) throw new Error(`Export failed (${response.status})`);
+
+    for (;;) {
+      try {
+        const reader = response.body.getReader();
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          await writable.write(value);
+          received += value.length;
+        }
+        break;
+      } catch (error) {
+        if (resumes >= maxResumes) throw error;
+        resumes++;
+
+        response = await fetch(`${url}?offset=${received}`);
+        if (!response.ok) throw error;
+
+        // The server restarts from a page boundary at or before what we have
+        received = Math.min(received, parseInt(response.headers.get('X-Export-Offset'), 10) || 0);
+        await writable.truncate(received);
+        await writable.seek(received);
+      }
+    }
+    await writable.close();
+  } catch (error) {
+    await writable.abort().catch(() => {});
+    throw error;
+  }
+
+  return { bytes: received, resumes };
+};
+
+/**
+ * Download a full dataset export streamed by the API server.
+ * Rows are read and encoded on the server a page at a time and the browser
+ * writes them straight to disk, so neither end holds the whole file.
+ *
+ * The export is registered with the session token first, since a plain
+ * download cannot carry it, and then fetched through its one-off link:
+ * - as a native download (<a download>) by default
+ * - for CSV where the File System Access API is available, into a file the
+ *   user picks, so a dropped connection resumes from the last page boundary
+ *   (see server/exportStream.js) instead of starting over
+ * @param {string} dataset - 'employees', 'clients' or 'submissions'
+ * @param {Object} params - list contract params (fields, filter, q, sort, after)
+ * @param {string} fileFormat - 'csv' or 'xlsx'
+ * @param {Object} options
+ * @param {number} options.maxResumes - reconnects before giving up
+ * @returns {Promise<{ bytes: number|null, resumes: number }|null>} bytes is
+ *   null for native downloads; null when the user cancels the save dialog
+ */
+export const exportFromServer = async (dataset, params = {}, fileFormat = 'csv', { maxResumes = 3 } = {}) => {
+  // Ask for the file first, while the click still counts as a user gesture
+  let handle = null;
+  if (fileFormat === 'csv' && typeof window.showSaveFilePicker === 'function') {
+    try {
+      handle = await window.showSaveFilePicker({
+        suggestedName: `${dataset}-${new Date().toISOString().slice(0, 10)}.csv`,
+        types: [{ description: 'CSV file', accept: { 'text/csv': ['.csv'] } }]
+      });
+    } catch (error) {
+      if (error.name === 'AbortError') return null;
+      // Picker refused (no user gesture, sandboxed frame): download natively
+    }
+  }
+
+  const query = buildListQueryString(params);
+  const response = await fetch(`/api/exports/${encodeURIComponent(dataset)}/links?format=${fileFormat}${query ? `&${query}` : ''}`, {
+    method: 'POST',
+    headers: authHeaders()
+  });
+  const body = await response.json().catch(() => ({}));
+  if (!response.ok) {
+    throw new Error(body.error || `Export failed (${response.status})`);
+  }
+
+  if (handle) {
+    return saveExportToFile(body.url, handle, maxResumes);
+  }
+
+  const link = document.createElement('a');
+  link.setAttribute('href', body.url);
+  link.setAttribute('download', '');
+  link.style.visibility = 'hidden';
+  document.body.appendChild(link);
+  link.click();
+  document.body.removeChild(link);
+  return { bytes: null, resumes: 0 };
+};
+
 /**
  * Get unique values for a field across dataset
  * @param {Array} data - The dataset
@@ -395,6 +541,7 @@ export const createFilterOptions = (data, fieldMappings = {}) => {
 
 export default {
   applyFilters,
+  toListQuery,
   getNestedValue,
   getItemDate,
   sortData,
@@ -1,204 +1,44 @@
-import { jsPDF } from 'jspdf';
-import * as XLSX from 'xlsx';
+import { pdfRenderService } from '../shared/services/pdfRenderService';
+import { loadPdfTemplates, loadXlsx } from '../shared/lib/vendorLoaders';
 
 /**
  * Comprehensive report generation utility for PDF and Excel exports
  */
 
 // PDF Generation Functions
+// Layouts live in shared/lib/pdfTemplates; jsPDF is loaded on first use so it
+// stays out of the initial bundle. exportReport renders through
+// pdfRenderService, which runs the same templates in a Web Worker.
+const renderPdfDocument = async (type, data) => {
+  const templates = await loadPdfTemplates();
+  return templates.renderPdfDocument(type, data);
+};
+
 export const generatePDF = {
   /**
    * Generate employee performance report PDF
    */
-  employeePerformance: async (data) => {
-    const doc = new jsPDF();
-    const pageWidth = doc.internal.pageSize.getWidth();
-    const margin = 20;
-    let yPosition = 30;
-
-    // Header
-    doc.setFontSize(20);
-    doc.setFont(undefined, 'bold');
-    doc.text('EMPLOYEE PERFORMANCE REPORT', pageWidth / 2, yPosition, { align: 'center' });
-    yPosition += 20;
-
-    // Employee Info
-    doc.setFontSize(14);
-    doc.setFont(undefined, 'bold');
-    doc.text('Employee Information', margin, yPosition);
-    yPosition += 10;
-
-    doc.setFontSize(11);
-    doc.setFont(undefined, 'normal');
-    doc.text(`Name: ${data.employeeName || 'N/A'}`, margin, yPosition);
-    yPosition += 6;
-    doc.text(`Department: ${data.department || 'N/A'}`, margin, yPosition);
-    yPosition += 6;
-    doc.text(`Period: ${data.period || 'N/A'}`, margin, yPosition);
-    yPosition += 15;
-
-    // Performance Metrics
-    if (data.metrics) {
-      doc.setFontSize(14);
-      doc.setFont(undefined, 'bold');
-      doc.text('Performance Metrics', margin, yPosition);
-      yPosition += 10;
-
-      doc.setFontSize(11);
-      doc.setFont(undefined, 'normal');
-      
-      Object.entries(data.metrics).forEach(([key, value]) => {
-        doc.text(`${key}: ${value}`, margin, yPosition);
-        yPosition += 6;
-      });
-      yPosition += 10;
-    }
-
-    // Summary
-    if (data.summary) {
-      doc.setFontSize(14);
-      doc.setFont(undefined, 'bold');
-      doc.text('Summary', margin, yPosition);
-      yPosition += 10;
-
-      doc.setFontSize(11);
-      doc.setFont(undefined, 'normal');
-      const summaryLines = doc.splitTextToSize(data.summary, pageWidth - 2 * margin);
-      summaryLines.forEach(line => {
-        doc.text(line, margin, yPosition);
-        yPosition += 6;
-      });
-    }
-
-    // Footer
-    const pageHeight = doc.internal.pageSize.getHeight();
-    doc.setFontSize(8);
-    doc.text(`Generated on: ${new Date().toLocaleDateString()}`, margin, pageHeight - 10);
-
-    return doc;
-  },
+  employeePerformance: (data) => renderPdfDocument('employeePerformance', data),
 
   /**
    * Generate monthly report PDF
    */
-  monthlyReport: async (data) => {
-    const doc = new jsPDF();
-    const pageWidth = doc.internal.pageSize.getWidth();
-    const margin = 20;
-    let yPosition = 30;
-
-    // Header
-    doc.setFontSize(20);
-    doc.setFont(undefined, 'bold');
-    doc.text('MONTHLY PERFORMANCE REPORT', pageWidth / 2, yPosition, { align: 'center' });
-    yPosition += 20;
-
-    // Report Info
-    doc.setFontSize(12);
-    doc.setFont(undefined, 'normal');
-    doc.text(`Month: ${data.month || 'N/A'}`, margin, yPosition);
-    yPosition += 8;
-    doc.text(`Generated by: ${data.generatedBy || 'System'}`, margin, yPosition);
-    yPosition += 15;
-
-    // Metrics Summary
-    if (data.metrics) {
-      doc.setFontSize(14);
-      doc.setFont(undefined, 'bold');
-      doc.text('Key Metrics', margin, yPosition);
-      yPosition += 10;
-
-      doc.setFontSize(11);
-      doc.setFont(undefined, 'normal');
-      
-      Object.entries(data.metrics).forEach(([key, value]) => {
-        doc.text(`${key}: ${value}`, margin, yPosition);
-        yPosition += 6;
-      });
-      yPosition += 10;
-    }
-
-    // Department Breakdown
-    if (data.departmentBreakdown && data.departmentBreakdown.length > 0) {
-      doc.setFontSize(14);
-      doc.setFont(undefined, 'bold');
-      doc.text('Department Performance', margin, yPosition);
-      yPosition += 10;
-
-      doc.setFontSize(11);
-      doc.setFont(undefined, 'normal');
-      
-      data.departmentBreakdown.forEach(dept => {
-        doc.text(`${dept.department}: ${dept.score || 'N/A'}`, margin, yPosition);
-        yPosition += 6;
-      });
-    }
-
-    return doc;
-  },
+  monthlyReport: (data) => renderPdfDocument('monthlyReport', data),
 
   /**
    * Generate incentive report PDF
    */
-  incentiveReport: async (data) => {
-    const doc = new jsPDF();
-    const pageWidth = doc.internal.pageSize.getWidth();
-    const margin = 20;
-    let yPosition = 30;
-
-    // Header
-    doc.setFontSize(20);
-    doc.setFont(undefined, 'bold');
-    doc.text('INCENTIVE DISBURSEMENT REPORT', pageWidth / 2, yPosition, { align: 'center' });
-    yPosition += 20;
-
-    // Report Period
-    doc.setFontSize(12);
-    doc.setFont(undefined, 'normal');
-    doc.text(`Period: ${data.period || 'N/A'}`, margin, yPosition);
-    yPosition += 8;
-    doc.text(`Total Applications: ${data.totalApplications || 0}`, margin, yPosition);
-    yPosition += 8;
-    doc.text(`Total Amount: ${data.totalAmount || 'N/A'}`, margin, yPosition);
-    yPosition += 15;
-
-    // Applications Table
-    if (data.applications && data.applications.length > 0) {
-      doc.setFontSize(14);
-      doc.setFont(undefined, 'bold');
-      doc.text('Incentive Applications', margin, yPosition);
-      yPosition += 10;
-
-      // Table headers
-      doc.setFontSize(10);
-      doc.setFont(undefined, 'bold');
-      doc.text('Employee', margin, yPosition);
-      doc.text('Type', margin + 60, yPosition);
-      doc.text('Amount', margin + 120, yPosition);
-      doc.text('Status', margin + 160, yPosition);
-      yPosition += 8;
-
-      // Table data
-      doc.setFont(undefined, 'normal');
-      data.applications.slice(0, 20).forEach(app => { // Limit to first 20 for space
-        doc.text(app.employeeName || 'N/A', margin, yPosition);
-        doc.text(app.incentiveType || 'N/A', margin + 60, yPosition);
-        doc.text(app.amount?.toString() || 'N/A', margin + 120, yPosition);
-        doc.text(app.status || 'N/A', margin + 160, yPosition);
-        yPosition += 6;
-      });
-    }
-
-    return doc;
-  }
+  incentiveReport: (data) => renderPdfDocument('incentiveReport', data)
 };
 
 // Excel Generation Functions
+// xlsx is loaded on first use, so these return promises
 export const generateExcel = {
   /**
    * Generate employee performance Excel report
    */
-  employeePerformance: (data) => {
+  employeePerformance: async (data) => {
+    const XLSX = await loadXlsx();
     const workbook = XLSX.utils.book_new();
     
     // Employee Info Sheet
@@ -232,7 +72,8 @@ export const generateExcel = {
   /**
    * Generate monthly report Excel
    */
-  monthlyReport: (data) => {
+  monthlyReport: async (data) => {
+    const XLSX = await loadXlsx();
     const workbook = XLSX.utils.book_new();
     
     // Summary Sheet
@@ -266,7 +107,8 @@ export const generateExcel = {
   /**
    * Generate incentive report Excel
    */
-  incentiveReport: (data) => {
+  incentiveReport: async (data) => {
+    const XLSX = await loadXlsx();
     const workbook = XLSX.utils.book_new();
     
     // Summary Sheet
@@ -293,7 +135,8 @@ export const generateExcel = {
   /**
    * Generate generic data export Excel
    */
-  genericData: (data, sheetName = 'Data') => {
+  genericData: async (data, sheetName = 'Data') => {
+    const XLSX = await loadXlsx();
     const workbook = XLSX.utils.book_new();
     
     if (Array.isArray(data)) {
@@ -319,10 +162,25 @@ export const downloadFile = {
     doc.save(`${filename}.pdf`);
   },
 
+  /**
+   * Download a rendered Blob (PDF from the render worker, ZIP from a batch)
+   */
+  blob: (blob, filename) => {
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = filename;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+    URL.revokeObjectURL(url);
+  },
+
   /**
    * Download Excel file
    */
-  excel: (workbook, filename) => {
+  excel: async (workbook, filename) => {
+    const XLSX = await loadXlsx();
     XLSX.writeFile(workbook, `${filename}.xlsx`);
   },
 
@@ -354,15 +212,7 @@ export const downloadFile = {
         .join('\n');
     }
     
-    const blob = new Blob([csvContent], { type: 'text/csv' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `${filename}.csv`;
-    document.body.appendChild(a);
-    a.click();
-    document.body.removeChild(a);
-    URL.revokeObjectURL(url);
+    downloadFile.blob(new Blob([csvContent], { type: 'text/csv' }), `${filename}.csv`);
   }
 };
 
@@ -413,6 +263,29 @@ export const reportUtils = {
   }
 };
 
+/**
+ * Render one PDF per item on the API server and download them as a ZIP,
+ * e.g. performance reports for every employee in a department
+ * @param {Array<{filename: string, data: Object}>} items - raw report data per file
+ * @param {string} type - PDF template name
+ * @param {string} filename - ZIP name without extension
+ */
+export const exportReportBatch = async (items, type, filename) => {
+  try {
+    const formattedItems = items.map(item => ({
+      filename: item.filename.endsWith('.pdf') ? item.filename : `${item.filename}.pdf`,
+      data: reportUtils.formatReportData(item.data, type)
+    }));
+    const zip = await pdfRenderService.renderBatch(type, formattedItems);
+    downloadFile.blob(zip, `${filename || reportUtils.generateFilename(`${type}_reports`)}.zip`);
+
+    return { success: true, message: `${items.length} PDF reports generated successfully` };
+  } catch (error) {
+    console.error('Error generating batch report:', error);
+    return { success: false, message: `Failed to generate reports: ${error.message}` };
+  }
+};
+
 // Main export function for easy use
 export const exportReport = async (data, format, type, filename) => {
   try {
@@ -421,14 +294,14 @@ export const exportReport = async (data, format, type, filename) => {
     
     switch (format.toLowerCase()) {
       case 'pdf':
-        const doc = await generatePDF[type](formattedData);
-        downloadFile.pdf(doc, baseFilename);
+        const pdf = await pdfRenderService.render(type, formattedData);
+        downloadFile.blob(pdf, `${baseFilename}.pdf`);
         break;
       
       case 'excel':
       case 'xlsx':
-        const workbook = generateExcel[type](formattedData);
-        downloadFile.excel(workbook, baseFilename);
+        const workbook = await generateExcel[type](formattedData);
+        await downloadFile.excel(workbook, baseFilename);
         break;
       
       case 'csv':
@@ -0,0 +1,12 @@
+import { renderPdf } from '../shared/lib/pdfTemplates';
+
+// Renders report PDFs for pdfRenderService off the main thread. The bytes are
+// transferred back rather than copied.
+self.onmessage = ({ data: { id, template, data } }) => {
+  try {
+    const buffer = renderPdf(template, data);
+    self.postMessage({ id, buffer }, [buffer]);
+  } catch (error) {
+    self.postMessage({ id, error: error.message });
+  }
+};
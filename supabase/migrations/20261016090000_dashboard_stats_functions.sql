@@ -0,0 +1,370 @@
+-- Migration: dashboard_stats_functions
+-- Timestamp: 20261016090000
+-- Description: Aggregate views and RPC functions backing the role dashboards.
+-- Each dashboard load calls one function and receives ready-made counts,
+-- averages and distributions instead of downloading whole tables.
+
+BEGIN;
+
+-- ============================================================================
+-- VIEWS
+-- ============================================================================
+
+-- Active users bucketed the same way liveDataService.getActiveUsers did it:
+-- intern > freelancer > manager/head/admin > employee.
+CREATE OR REPLACE VIEW public.dashboard_active_user_buckets AS
+WITH active_users AS (
+    SELECT
+        LOWER(COALESCE(user_category, '')) AS category,
+        LOWER(COALESCE(role::TEXT, '')) AS role
+    FROM public.unified_users
+    WHERE is_active = true
+),
+bucketed AS (
+    SELECT
+        CASE
+            WHEN category LIKE '%intern%' OR role LIKE '%intern%' THEN 'interns'
+            WHEN category LIKE '%freelancer%' OR role LIKE '%freelancer%' THEN 'freelancers'
+            WHEN category LIKE '%manager%' OR role LIKE '%manager%'
+              OR role LIKE '%head%' OR role LIKE '%admin%' THEN 'managers'
+            ELSE 'employees'
+        END AS bucket
+    FROM active_users
+)
+SELECT
+    COUNT(*) FILTER (WHERE bucket = 'employees')::INTEGER AS employees,
+    COUNT(*) FILTER (WHERE bucket = 'interns')::INTEGER AS interns,
+    COUNT(*) FILTER (WHERE bucket = 'freelancers')::INTEGER AS freelancers,
+    COUNT(*) FILTER (WHERE bucket = 'managers')::INTEGER AS managers,
+    COUNT(*)::INTEGER AS total
+FROM bucketed;
+
+-- Company-wide KPI report averages. Missing scores count as zero, matching
+-- the previous client-side averages.
+CREATE OR REPLACE VIEW public.dashboard_kpi_averages AS
+SELECT
+    COUNT(*)::INTEGER AS report_count,
+    COALESCE(AVG(COALESCE(overall_score, 0)), 0)::NUMERIC(10,2) AS avg_overall_score,
+    COALESCE(AVG(COALESCE(client_satisfaction_score, 0)), 0)::NUMERIC(10,2) AS avg_client_satisfaction
+FROM public.monthly_kpi_reports;
+
+-- ============================================================================
+-- ROLE DASHBOARD FUNCTIONS
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_super_admin_dashboard_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_employees', (SELECT total FROM public.dashboard_active_user_buckets),
+        'active_projects', (SELECT COUNT(*) FROM public.clients WHERE status = 'Active'),
+        'avg_overall_score', (SELECT avg_overall_score FROM public.dashboard_kpi_averages),
+        'avg_client_satisfaction', (SELECT avg_client_satisfaction FROM public.dashboard_kpi_averages)
+    );
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION public.get_hr_dashboard_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_employees', b.total,
+        'interns', b.interns,
+        'pending_reviews', (
+            SELECT COUNT(*) FROM public.employee_performance
+            WHERE performance_status = 'pending'
+        )
+    )
+    FROM public.dashboard_active_user_buckets b;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION public.get_manager_dashboard_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'team_size', (SELECT COUNT(*) FROM public.unified_users WHERE is_active = true),
+        'active_projects', (SELECT COUNT(*) FROM public.clients WHERE status = 'Active'),
+        'avg_overall_score', (SELECT avg_overall_score FROM public.dashboard_kpi_averages)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Averages over reports where both scores are present, plus the share of
+-- submissions in 'submitted' status (0-100).
+CREATE OR REPLACE FUNCTION public.get_dashboard_performance_summary()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'avg_overall_score', (
+            SELECT COALESCE(AVG(overall_score), 0)::NUMERIC(10,2)
+            FROM public.monthly_kpi_reports
+            WHERE overall_score IS NOT NULL AND client_satisfaction_score IS NOT NULL
+        ),
+        'avg_client_satisfaction', (
+            SELECT COALESCE(AVG(client_satisfaction_score), 0)::NUMERIC(10,2)
+            FROM public.monthly_kpi_reports
+            WHERE overall_score IS NOT NULL AND client_satisfaction_score IS NOT NULL
+        ),
+        'submission_rate', (
+            SELECT CASE WHEN COUNT(*) = 0 THEN 0
+                ELSE (COUNT(*) FILTER (WHERE status = 'submitted') * 100.0 / COUNT(*))::NUMERIC(5,2)
+            END
+            FROM public.submissions
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Distinct users with a session since each boundary. The caller passes the
+-- boundaries so "today" follows the browser's timezone.
+CREATE OR REPLACE FUNCTION public.get_dashboard_user_activity(
+    p_day_start TIMESTAMP WITH TIME ZONE,
+    p_week_start TIMESTAMP WITH TIME ZONE,
+    p_month_start TIMESTAMP WITH TIME ZONE
+)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_users', (SELECT COUNT(*) FROM public.unified_users WHERE is_active = true),
+        'daily_active_users', COUNT(DISTINCT user_id) FILTER (WHERE created_at >= p_day_start),
+        'weekly_active_users', COUNT(DISTINCT user_id) FILTER (WHERE created_at >= p_week_start),
+        'monthly_active_users', COUNT(DISTINCT user_id) FILTER (WHERE created_at >= p_month_start)
+    )
+    FROM public.user_sessions
+    WHERE created_at >= LEAST(p_day_start, p_week_start, p_month_start);
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- SUBMISSION SCORING
+-- ============================================================================
+
+-- Port of MonthlyReportService.extractPerformanceScore: the first positive
+-- score field wins, falling back to the average of the component scores.
+-- Scores at or below 10 are on a 10-point scale and are scaled to 100.
+CREATE OR REPLACE FUNCTION public.report_submission_score(p_form_data JSONB, p_row JSONB)
+RETURNS NUMERIC AS $$
+DECLARE
+    source JSONB;
+    field TEXT;
+    score NUMERIC;
+    scores NUMERIC[];
+BEGIN
+    FOREACH source IN ARRAY ARRAY[COALESCE(p_form_data, '{}'::JSONB), COALESCE(p_row, '{}'::JSONB)] LOOP
+        FOREACH field IN ARRAY ARRAY['overall_score', 'performance_score', 'total_score', 'kpi_score', 'average_score'] LOOP
+            IF jsonb_typeof(source -> field) = 'number' AND (source ->> field)::NUMERIC > 0 THEN
+                score := (source ->> field)::NUMERIC;
+                RETURN CASE WHEN score > 10 THEN score ELSE score * 10 END;
+            END IF;
+        END LOOP;
+    END LOOP;
+
+    SELECT ARRAY_AGG((COALESCE(p_form_data, '{}'::JSONB) ->> f)::NUMERIC) INTO scores
+    FROM UNNEST(ARRAY['kpi_score', 'learning_score', 'relationship_score', 'discipline_score']) f
+    WHERE jsonb_typeof(COALESCE(p_form_data, '{}'::JSONB) -> f) = 'number'
+      AND (COALESCE(p_form_data, '{}'::JSONB) ->> f)::NUMERIC > 0;
+
+    IF scores IS NULL THEN
+        SELECT ARRAY_AGG((COALESCE(p_row, '{}'::JSONB) ->> f)::NUMERIC) INTO scores
+        FROM UNNEST(ARRAY['kpi_score', 'learning_score', 'relationship_score', 'overall_score']) f
+        WHERE jsonb_typeof(COALESCE(p_row, '{}'::JSONB) -> f) = 'number'
+          AND (COALESCE(p_row, '{}'::JSONB) ->> f)::NUMERIC > 0;
+    END IF;
+
+    IF scores IS NULL THEN
+        RETURN 0;
+    END IF;
+
+    SELECT AVG(s) INTO score FROM UNNEST(scores) s;
+    RETURN CASE WHEN score > 10 THEN score ELSE score * 10 END;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- ============================================================================
+-- HR REPORTING
+-- ============================================================================
+
+-- Headcount, tenure, department and monthly performance distributions and the
+-- per-employee approved score average used by hrReportingService.getHRMetrics.
+-- Approved submissions are scored with report_submission_score (0-100).
+CREATE OR REPLACE FUNCTION public.get_hr_metrics_summary()
+RETURNS JSONB AS $$
+    WITH approved AS (
+        SELECT
+            s.user_id,
+            to_char(s.submission_month, 'YYYY-MM') AS month,
+            public.report_submission_score(s.form_data, NULL) AS month_score
+        FROM public.monthly_form_submissions s
+        WHERE s.status = 'approved'
+    ),
+    departments AS (
+        SELECT
+            COALESCE(u.department, 'Unknown') AS name,
+            COUNT(*) AS count,
+            COUNT(*) FILTER (WHERE u.status = 'active') AS active_count
+        FROM public.unified_users u
+        GROUP BY COALESCE(u.department, 'Unknown')
+    ),
+    department_scores AS (
+        SELECT COALESCE(u.department, 'Unknown') AS name, AVG(a.month_score) AS avg_score
+        FROM approved a
+        JOIN public.unified_users u ON u.id = a.user_id
+        GROUP BY COALESCE(u.department, 'Unknown')
+    ),
+    monthly AS (
+        SELECT month, AVG(month_score) AS average_score, COUNT(*) AS submission_count
+        FROM approved
+        WHERE month IS NOT NULL
+        GROUP BY month
+        ORDER BY month DESC
+        LIMIT 6
+    ),
+    employee_scores AS (
+        SELECT user_id, ROUND(AVG(month_score)::NUMERIC, 1) AS avg_score
+        FROM approved
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+    )
+    SELECT jsonb_build_object(
+        'total_employees', (SELECT COUNT(*) FROM public.unified_users),
+        'active_employees', (SELECT COUNT(*) FROM public.unified_users WHERE status = 'active'),
+        'new_hires', (
+            SELECT COUNT(*) FROM public.unified_users
+            WHERE created_at >= NOW() - INTERVAL '30 days'
+        ),
+        'departures', (
+            SELECT COUNT(*) FROM public.unified_users
+            WHERE status = 'inactive' AND created_at >= NOW() - INTERVAL '90 days'
+        ),
+        'avg_tenure_years', (
+            SELECT COALESCE(AVG(GREATEST(0, EXTRACT(EPOCH FROM (NOW() - created_at)) / (365 * 24 * 60 * 60))), 0)
+            FROM public.unified_users
+        ),
+        'approved_submissions', (SELECT COUNT(*) FROM approved),
+        'avg_approved_score', (SELECT COALESCE(AVG(month_score), 0) FROM approved),
+        'departments', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'name', d.name,
+                'count', d.count,
+                'active_count', d.active_count,
+                'avg_performance', COALESCE(ds.avg_score, 0)
+            ) ORDER BY d.name)
+            FROM departments d
+            LEFT JOIN department_scores ds ON ds.name = d.name
+        ), '[]'::JSONB),
+        'monthly', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'month', m.month,
+                'average_score', m.average_score,
+                'submission_count', m.submission_count
+            ) ORDER BY m.month DESC)
+            FROM monthly m
+        ), '[]'::JSONB),
+        'employee_scores', COALESCE((
+            SELECT jsonb_object_agg(user_id, avg_score) FROM employee_scores
+        ), '{}'::JSONB)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- MONTHLY REPORT
+-- ============================================================================
+
+-- Per-department and overall totals for one month ('YYYY-MM'), combining
+-- monthly_form_submissions with legacy submissions rows.
+CREATE OR REPLACE FUNCTION public.get_monthly_report_summary(p_month_key TEXT)
+RETURNS JSONB AS $$
+    WITH active_users AS (
+        SELECT id, COALESCE(department, 'Unknown') AS department
+        FROM public.unified_users
+        WHERE status = 'active'
+    ),
+    all_submissions AS (
+        SELECT
+            COALESCE(u.department, 'Unknown') AS department,
+            s.user_id::TEXT AS submitter,
+            public.report_submission_score(s.form_data, NULL) AS score
+        FROM public.monthly_form_submissions s
+        LEFT JOIN public.unified_users u ON u.id = s.user_id
+        WHERE s.submission_month = (p_month_key || '-01')::DATE
+        UNION ALL
+        SELECT
+            COALESCE(l.department, 'Unknown') AS department,
+            l.employee_name AS submitter,
+            public.report_submission_score(NULL, to_jsonb(l)) AS score
+        FROM public.submissions l
+        WHERE l.month_key = p_month_key
+    ),
+    department_users AS (
+        SELECT department, COUNT(*) AS employees
+        FROM active_users
+        GROUP BY department
+    ),
+    department_submissions AS (
+        SELECT
+            department,
+            COUNT(*) AS submissions,
+            COUNT(DISTINCT submitter) AS submitters,
+            COALESCE(SUM(score) FILTER (WHERE score > 0), 0) AS score_total,
+            COUNT(*) FILTER (WHERE score > 0) AS score_count
+        FROM all_submissions
+        GROUP BY department
+    )
+    SELECT jsonb_build_object(
+        'totals', (
+            SELECT jsonb_build_object(
+                'employees', (SELECT COUNT(*) FROM active_users),
+                'submissions', COUNT(*),
+                'submitters', COUNT(DISTINCT submitter),
+                'score_total', COALESCE(SUM(score) FILTER (WHERE score > 0), 0),
+                'score_count', COUNT(*) FILTER (WHERE score > 0)
+            )
+            FROM all_submissions
+        ),
+        'departments', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'department', du.department,
+                'employees', du.employees,
+                'submissions', COALESCE(ds.submissions, 0),
+                'submitters', COALESCE(ds.submitters, 0),
+                'score_total', COALESCE(ds.score_total, 0),
+                'score_count', COALESCE(ds.score_count, 0)
+            ) ORDER BY du.department)
+            FROM department_users du
+            LEFT JOIN department_submissions ds ON ds.department = du.department
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_monthly_form_submissions_status_user
+    ON public.monthly_form_submissions(status, user_id);
+CREATE INDEX IF NOT EXISTS idx_monthly_form_submissions_submission_month
+    ON public.monthly_form_submissions(submission_month);
+CREATE INDEX IF NOT EXISTS idx_submissions_month_key ON public.submissions(month_key);
+CREATE INDEX IF NOT EXISTS idx_user_sessions_created_at ON public.user_sessions(created_at);
+CREATE INDEX IF NOT EXISTS idx_employee_performance_status ON public.employee_performance(performance_status);
+
+-- ============================================================================
+-- PERMISSIONS
+-- ============================================================================
+
+GRANT SELECT ON public.dashboard_active_user_buckets TO authenticated;
+GRANT SELECT ON public.dashboard_kpi_averages TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_super_admin_dashboard_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_hr_dashboard_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_manager_dashboard_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_dashboard_performance_summary() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_dashboard_user_activity(TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_hr_metrics_summary() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.report_submission_score(JSONB, JSONB) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_monthly_report_summary(TEXT) TO authenticated;
+
+COMMENT ON VIEW public.dashboard_active_user_buckets IS 'Active user counts by dashboard category';
+COMMENT ON VIEW public.dashboard_kpi_averages IS 'Company-wide monthly KPI report averages';
+COMMENT ON FUNCTION public.get_super_admin_dashboard_stats() IS 'Super Admin dashboard counts and averages';
+COMMENT ON FUNCTION public.get_hr_dashboard_stats() IS 'HR dashboard counts';
+COMMENT ON FUNCTION public.get_manager_dashboard_stats() IS 'Manager dashboard counts and averages';
+COMMENT ON FUNCTION public.get_dashboard_performance_summary() IS 'KPI averages and submission rate for general dashboards';
+COMMENT ON FUNCTION public.get_dashboard_user_activity(TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE) IS 'Daily, weekly and monthly active user counts';
+COMMENT ON FUNCTION public.get_hr_metrics_summary() IS 'Headcount, department and performance distributions for HR reporting';
+COMMENT ON FUNCTION public.get_monthly_report_summary(TEXT) IS 'Per-department submission totals for the monthly report';
+
+COMMIT;
+
+-- Success message
+SELECT 'Dashboard stats functions created successfully!' as result;
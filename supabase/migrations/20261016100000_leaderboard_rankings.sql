@@ -0,0 +1,392 @@
+-- Migration: leaderboard_rankings
+-- Timestamp: 20261016100000
+-- Description: Materialized employee leaderboard ranked per month, overall and
+-- per department. Triggers keep it in step with monthly_kpi_reports by
+-- re-ranking only the rows a score change actually moves past.
+
+BEGIN;
+
+-- ============================================================================
+-- TABLE
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_rankings (
+    month_key VARCHAR(7) NOT NULL, -- Format: YYYY-MM
+    employee_id TEXT NOT NULL,
+    name TEXT,
+    role TEXT,
+    department TEXT NOT NULL DEFAULT 'Unknown',
+    score NUMERIC(10,2) NOT NULL,
+    growth_percentage NUMERIC(10,2) DEFAULT 0,
+    tasks_completed INTEGER DEFAULT 0,
+    learning_hours NUMERIC(10,2) DEFAULT 0,
+    overall_rank INTEGER NOT NULL,
+    department_rank INTEGER NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (month_key, employee_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rankings_overall
+    ON public.leaderboard_rankings(month_key, overall_rank);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rankings_department
+    ON public.leaderboard_rankings(month_key, department, department_rank);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rankings_score
+    ON public.leaderboard_rankings(month_key, score DESC);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rankings_department_score
+    ON public.leaderboard_rankings(month_key, department, score DESC);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_rankings_employee
+    ON public.leaderboard_rankings(employee_id);
+
+-- ============================================================================
+-- INCREMENTAL REFRESH
+-- ============================================================================
+
+-- Ranks use RANK() semantics: 1 + number of rows with a higher score. When one
+-- employee's score moves from old to new, only rows whose score lies between
+-- the two change rank, by exactly one. Everything else is left untouched.
+CREATE OR REPLACE FUNCTION public.leaderboard_sync_employee(p_month_key TEXT, p_employee_id TEXT)
+RETURNS VOID AS $$
+DECLARE
+    old_row public.leaderboard_rankings%ROWTYPE;
+    report RECORD;
+    member RECORD;
+    new_department TEXT;
+BEGIN
+    IF p_month_key IS NULL OR p_employee_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Serialize re-ranking within a month
+    PERFORM pg_advisory_xact_lock(hashtext('leaderboard:' || p_month_key));
+
+    SELECT * INTO old_row
+    FROM public.leaderboard_rankings
+    WHERE month_key = p_month_key AND employee_id = p_employee_id;
+
+    SELECT overall_score, growth_percentage, tasks_completed, learning_hours INTO report
+    FROM public.monthly_kpi_reports
+    WHERE month_year = p_month_key
+      AND employee_id::TEXT = p_employee_id
+      AND overall_score IS NOT NULL
+    LIMIT 1;
+
+    IF FOUND THEN
+        SELECT name, role::TEXT AS role, COALESCE(department, 'Unknown') AS department INTO member
+        FROM public.unified_users
+        WHERE id::TEXT = p_employee_id;
+        new_department := COALESCE(member.department, 'Unknown');
+    END IF;
+
+    IF old_row.employee_id IS NOT NULL THEN
+        DELETE FROM public.leaderboard_rankings
+        WHERE month_key = p_month_key AND employee_id = p_employee_id;
+    END IF;
+
+    -- Overall ranks
+    IF old_row.employee_id IS NOT NULL AND report.overall_score IS NOT NULL THEN
+        IF report.overall_score > old_row.score THEN
+            UPDATE public.leaderboard_rankings SET overall_rank = overall_rank + 1
+            WHERE month_key = p_month_key
+              AND score >= old_row.score AND score < report.overall_score;
+        ELSIF report.overall_score < old_row.score THEN
+            UPDATE public.leaderboard_rankings SET overall_rank = overall_rank - 1
+            WHERE month_key = p_month_key
+              AND score >= report.overall_score AND score < old_row.score;
+        END IF;
+    ELSIF old_row.employee_id IS NOT NULL THEN
+        UPDATE public.leaderboard_rankings SET overall_rank = overall_rank - 1
+        WHERE month_key = p_month_key AND score < old_row.score;
+    ELSIF report.overall_score IS NOT NULL THEN
+        UPDATE public.leaderboard_rankings SET overall_rank = overall_rank + 1
+        WHERE month_key = p_month_key AND score < report.overall_score;
+    END IF;
+
+    -- Department ranks
+    IF old_row.employee_id IS NOT NULL AND report.overall_score IS NOT NULL
+       AND old_row.department = new_department THEN
+        IF report.overall_score > old_row.score THEN
+            UPDATE public.leaderboard_rankings SET department_rank = department_rank + 1
+            WHERE month_key = p_month_key AND department = new_department
+              AND score >= old_row.score AND score < report.overall_score;
+        ELSIF report.overall_score < old_row.score THEN
+            UPDATE public.leaderboard_rankings SET department_rank = department_rank - 1
+            WHERE month_key = p_month_key AND department = new_department
+              AND score >= report.overall_score AND score < old_row.score;
+        END IF;
+    ELSE
+        IF old_row.employee_id IS NOT NULL THEN
+            UPDATE public.leaderboard_rankings SET department_rank = department_rank - 1
+            WHERE month_key = p_month_key AND department = old_row.department
+              AND score < old_row.score;
+        END IF;
+        IF report.overall_score IS NOT NULL THEN
+            UPDATE public.leaderboard_rankings SET department_rank = department_rank + 1
+            WHERE month_key = p_month_key AND department = new_department
+              AND score < report.overall_score;
+        END IF;
+    END IF;
+
+    IF report.overall_score IS NOT NULL THEN
+        INSERT INTO public.leaderboard_rankings (
+            month_key, employee_id, name, role, department, score,
+            growth_percentage, tasks_completed, learning_hours,
+            overall_rank, department_rank, updated_at
+        ) VALUES (
+            p_month_key, p_employee_id, member.name, member.role, new_department,
+            report.overall_score, COALESCE(report.growth_percentage, 0),
+            COALESCE(report.tasks_completed, 0), COALESCE(report.learning_hours, 0),
+            1 + (SELECT COUNT(*) FROM public.leaderboard_rankings
+                 WHERE month_key = p_month_key AND score > report.overall_score),
+            1 + (SELECT COUNT(*) FROM public.leaderboard_rankings
+                 WHERE month_key = p_month_key AND department = new_department
+                   AND score > report.overall_score),
+            NOW()
+        );
+    END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public, pg_temp;
+
+-- Full rebuild of one month, or of every month when p_month_key is NULL.
+-- Used for backfills and as a repair tool; day-to-day changes go through
+-- leaderboard_sync_employee.
+CREATE OR REPLACE FUNCTION public.refresh_leaderboard(p_month_key TEXT DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    inserted INTEGER;
+    locked_month TEXT;
+BEGIN
+    -- Take the same per-month locks as leaderboard_sync_employee, in a fixed
+    -- order, so a trigger cannot re-rank a month while it is being rebuilt
+    FOR locked_month IN
+        SELECT month_year FROM public.monthly_kpi_reports
+        WHERE p_month_key IS NULL OR month_year = p_month_key
+        UNION
+        SELECT month_key FROM public.leaderboard_rankings
+        WHERE p_month_key IS NULL OR month_key = p_month_key
+        UNION
+        SELECT p_month_key WHERE p_month_key IS NOT NULL
+        ORDER BY 1
+    LOOP
+        CONTINUE WHEN locked_month IS NULL;
+        PERFORM pg_advisory_xact_lock(hashtext('leaderboard:' || locked_month));
+    END LOOP;
+
+    DELETE FROM public.leaderboard_rankings
+    WHERE p_month_key IS NULL OR month_key = p_month_key;
+
+    INSERT INTO public.leaderboard_rankings (
+        month_key, employee_id, name, role, department, score,
+        growth_percentage, tasks_completed, learning_hours,
+        overall_rank, department_rank, updated_at
+    )
+    SELECT
+        r.month_year,
+        r.employee_id::TEXT,
+        u.name,
+        u.role::TEXT,
+        COALESCE(u.department, 'Unknown'),
+        r.overall_score,
+        COALESCE(r.growth_percentage, 0),
+        COALESCE(r.tasks_completed, 0),
+        COALESCE(r.learning_hours, 0),
+        RANK() OVER (PARTITION BY r.month_year ORDER BY r.overall_score DESC),
+        RANK() OVER (PARTITION BY r.month_year, COALESCE(u.department, 'Unknown') ORDER BY r.overall_score DESC),
+        NOW()
+    FROM public.monthly_kpi_reports r
+    LEFT JOIN public.unified_users u ON u.id::TEXT = r.employee_id::TEXT
+    WHERE r.overall_score IS NOT NULL
+      AND (p_month_key IS NULL OR r.month_year = p_month_key);
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    RETURN inserted;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public, pg_temp;
+
+-- ============================================================================
+-- TRIGGERS
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.leaderboard_on_kpi_report_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.leaderboard_sync_employee(OLD.month_year, OLD.employee_id::TEXT);
+    END IF;
+
+    IF TG_OP = 'INSERT' OR (
+        TG_OP = 'UPDATE' AND (
+            OLD.month_year IS DISTINCT FROM NEW.month_year
+            OR OLD.employee_id IS DISTINCT FROM NEW.employee_id
+        )
+    ) THEN
+        PERFORM public.leaderboard_sync_employee(NEW.month_year, NEW.employee_id::TEXT);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public, pg_temp;
+
+DROP TRIGGER IF EXISTS trigger_leaderboard_kpi_report_change ON public.monthly_kpi_reports;
+CREATE TRIGGER trigger_leaderboard_kpi_report_change
+    AFTER INSERT OR DELETE OR UPDATE OF employee_id, month_year, overall_score,
+        growth_percentage, tasks_completed, learning_hours
+    ON public.monthly_kpi_reports
+    FOR EACH ROW
+    EXECUTE FUNCTION public.leaderboard_on_kpi_report_change();
+
+-- Name and role are copied as-is; a department change moves the employee
+-- between department partitions in every month they are ranked in.
+CREATE OR REPLACE FUNCTION public.leaderboard_on_user_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    ranked_month TEXT;
+BEGIN
+    IF OLD.department IS DISTINCT FROM NEW.department THEN
+        FOR ranked_month IN
+            SELECT month_key FROM public.leaderboard_rankings WHERE employee_id = NEW.id::TEXT
+        LOOP
+            PERFORM public.leaderboard_sync_employee(ranked_month, NEW.id::TEXT);
+        END LOOP;
+    ELSE
+        UPDATE public.leaderboard_rankings
+        SET name = NEW.name, role = NEW.role::TEXT, updated_at = NOW()
+        WHERE employee_id = NEW.id::TEXT;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public, pg_temp;
+
+DROP TRIGGER IF EXISTS trigger_leaderboard_user_change ON public.unified_users;
+CREATE TRIGGER trigger_leaderboard_user_change
+    AFTER UPDATE OF name, role, department ON public.unified_users
+    FOR EACH ROW
+    EXECUTE FUNCTION public.leaderboard_on_user_change();
+
+-- ============================================================================
+-- QUERIES
+-- ============================================================================
+
+-- Top N for a month (latest ranked month when NULL), company-wide or within a
+-- department. "rank" is the overall or department rank accordingly.
+CREATE OR REPLACE FUNCTION public.get_leaderboard_top(
+    p_month_key TEXT DEFAULT NULL,
+    p_department TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 10
+)
+RETURNS TABLE(
+    month_key VARCHAR(7),
+    employee_id TEXT,
+    name TEXT,
+    role TEXT,
+    department TEXT,
+    score NUMERIC(10,2),
+    growth_percentage NUMERIC(10,2),
+    tasks_completed INTEGER,
+    learning_hours NUMERIC(10,2),
+    rank INTEGER,
+    overall_rank INTEGER,
+    department_rank INTEGER
+) AS $$
+    WITH target AS (
+        SELECT COALESCE(p_month_key, (SELECT MAX(l.month_key) FROM public.leaderboard_rankings l)) AS month_key
+    )
+    SELECT
+        l.month_key, l.employee_id, l.name, l.role, l.department, l.score,
+        l.growth_percentage, l.tasks_completed, l.learning_hours,
+        CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END,
+        l.overall_rank, l.department_rank
+    FROM public.leaderboard_rankings l, target t
+    WHERE l.month_key = t.month_key
+      AND (p_department IS NULL OR l.department = p_department)
+    ORDER BY
+        CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END,
+        l.name
+    LIMIT LEAST(GREATEST(COALESCE(p_limit, 10), 1), 100);
+$$ LANGUAGE sql STABLE;
+
+-- One employee's rank plus up to p_radius rows either side of it.
+CREATE OR REPLACE FUNCTION public.get_leaderboard_neighbours(
+    p_employee_id TEXT,
+    p_month_key TEXT DEFAULT NULL,
+    p_department TEXT DEFAULT NULL,
+    p_radius INTEGER DEFAULT 2
+)
+RETURNS TABLE(
+    month_key VARCHAR(7),
+    employee_id TEXT,
+    name TEXT,
+    role TEXT,
+    department TEXT,
+    score NUMERIC(10,2),
+    growth_percentage NUMERIC(10,2),
+    tasks_completed INTEGER,
+    learning_hours NUMERIC(10,2),
+    rank INTEGER,
+    overall_rank INTEGER,
+    department_rank INTEGER
+) AS $$
+    WITH target AS (
+        SELECT COALESCE(p_month_key, (SELECT MAX(l.month_key) FROM public.leaderboard_rankings l)) AS month_key
+    ),
+    me AS (
+        SELECT l.month_key, l.department,
+            CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END AS rank
+        FROM public.leaderboard_rankings l, target t
+        WHERE l.month_key = t.month_key
+          AND l.employee_id = p_employee_id
+          AND (p_department IS NULL OR l.department = p_department)
+    ),
+    window_rows AS (
+        SELECT
+            l.*,
+            CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END AS ranked
+        FROM public.leaderboard_rankings l, me
+        WHERE l.month_key = me.month_key
+          AND (p_department IS NULL OR l.department = me.department)
+          AND CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END
+              BETWEEN me.rank - GREATEST(p_radius, 0) AND me.rank + GREATEST(p_radius, 0)
+        ORDER BY
+            (l.employee_id = p_employee_id) DESC,
+            ABS((CASE WHEN p_department IS NULL THEN l.overall_rank ELSE l.department_rank END) - me.rank)
+        LIMIT 2 * GREATEST(p_radius, 0) + 1
+    )
+    SELECT
+        w.month_key, w.employee_id, w.name, w.role, w.department, w.score,
+        w.growth_percentage, w.tasks_completed, w.learning_hours,
+        w.ranked, w.overall_rank, w.department_rank
+    FROM window_rows w
+    ORDER BY w.ranked, w.name;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- ROW LEVEL SECURITY & PERMISSIONS
+-- ============================================================================
+
+ALTER TABLE public.leaderboard_rankings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can view leaderboard" ON public.leaderboard_rankings
+    FOR SELECT TO authenticated USING (true);
+
+GRANT SELECT ON public.leaderboard_rankings TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_leaderboard_top(TEXT, TEXT, INTEGER) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_leaderboard_neighbours(TEXT, TEXT, TEXT, INTEGER) TO authenticated;
+
+COMMENT ON TABLE public.leaderboard_rankings IS 'Materialized monthly leaderboard with overall and department ranks';
+COMMENT ON FUNCTION public.leaderboard_sync_employee(TEXT, TEXT) IS 'Re-ranks one employee for one month from monthly_kpi_reports';
+COMMENT ON FUNCTION public.refresh_leaderboard(TEXT) IS 'Rebuilds the leaderboard for one month or for all months';
+COMMENT ON FUNCTION public.get_leaderboard_top(TEXT, TEXT, INTEGER) IS 'Top N leaderboard rows for a month and optional department';
+COMMENT ON FUNCTION public.get_leaderboard_neighbours(TEXT, TEXT, TEXT, INTEGER) IS 'An employee''s leaderboard row with its neighbours';
+
+-- Backfill existing reports
+SELECT public.refresh_leaderboard();
+
+COMMIT;
+
+-- Success message
+SELECT 'Leaderboard rankings created successfully!' as result;
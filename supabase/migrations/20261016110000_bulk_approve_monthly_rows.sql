@@ -0,0 +1,93 @@
+-- Migration: bulk_approve_monthly_rows
+-- Timestamp: 20261016110000
+-- Description: Set-based bulk approval for monthly rows. Validates, approves and
+-- audits every requested row in one statement and reports an outcome per row.
+
+BEGIN;
+
+-- Outcomes:
+--   approved          - row moved from submitted to approved by this call
+--   already_approved  - row was already approved by this manager (safe retry)
+--   not_found         - no monthly row with this id
+--   forbidden         - caller is not the employee's assigned manager
+--   invalid_status    - row is not in submitted status
+CREATE OR REPLACE FUNCTION public.bulk_approve_monthly_rows(
+    p_row_ids UUID[],
+    p_manager_id UUID,
+    p_review_notes TEXT DEFAULT ''
+)
+RETURNS TABLE(row_id UUID, outcome TEXT, message TEXT) AS $$
+BEGIN
+    RETURN QUERY
+    WITH requested AS (
+        SELECT DISTINCT id FROM UNNEST(p_row_ids) AS id
+    ),
+    checked AS (
+        SELECT
+            req.id,
+            CASE
+                WHEN r.id IS NULL THEN 'not_found'
+                WHEN u.manager_id IS DISTINCT FROM p_manager_id THEN 'forbidden'
+                WHEN r.status = 'approved' AND r.reviewer = p_manager_id THEN 'already_approved'
+                WHEN r.status <> 'submitted' THEN 'invalid_status'
+                ELSE 'eligible'
+            END AS check_result
+        FROM requested req
+        LEFT JOIN public.monthly_rows r ON r.id = req.id
+        LEFT JOIN public.users u ON u.id = r.user_id
+    ),
+    updated AS (
+        -- The status guard keeps concurrent or repeated calls from approving twice
+        UPDATE public.monthly_rows r
+        SET status = 'approved',
+            reviewer = p_manager_id,
+            review_notes = p_review_notes,
+            approved_at = NOW(),
+            updated_at = NOW()
+        FROM checked c
+        WHERE r.id = c.id
+          AND c.check_result = 'eligible'
+          AND r.status = 'submitted'
+        RETURNING r.id
+    ),
+    -- Data-modifying CTEs always run, so the audit batch is written even unreferenced
+    audited AS (
+        INSERT INTO public.change_audit (
+            table_name, record_id, field_name, old_value, new_value,
+            changed_by, change_reason, changed_at
+        )
+        SELECT
+            'monthly_rows', up.id, 'status', 'submitted', 'approved',
+            p_manager_id,
+            'Row approved' || CASE WHEN COALESCE(p_review_notes, '') <> '' THEN ': ' || p_review_notes ELSE '' END,
+            NOW()
+        FROM updated up
+        RETURNING record_id
+    )
+    SELECT
+        c.id,
+        CASE
+            WHEN up.id IS NOT NULL THEN 'approved'
+            WHEN c.check_result = 'eligible' THEN 'invalid_status'
+            ELSE c.check_result
+        END,
+        CASE
+            WHEN up.id IS NOT NULL THEN NULL
+            WHEN c.check_result = 'not_found' THEN 'Monthly row not found'
+            WHEN c.check_result = 'forbidden' THEN 'Only the assigned manager can approve this row'
+            WHEN c.check_result = 'already_approved' THEN 'Row is already approved'
+            ELSE 'Only submitted rows can be approved'
+        END
+    FROM checked c
+    LEFT JOIN updated up ON up.id = c.id;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.bulk_approve_monthly_rows(UUID[], UUID, TEXT) TO authenticated;
+
+COMMENT ON FUNCTION public.bulk_approve_monthly_rows(UUID[], UUID, TEXT) IS 'Approves submitted monthly rows in bulk with one audit batch and a per-row outcome';
+
+COMMIT;
+
+-- Success message
+SELECT 'Bulk approval function created successfully!' as result;
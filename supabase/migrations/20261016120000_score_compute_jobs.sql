@@ -0,0 +1,97 @@
+-- Migration: score_compute_jobs
+-- Timestamp: 20261016120000
+-- Description: Persisted month-close scoring jobs. Each job records per-user
+-- status so an interrupted batch recompute resumes where it stopped, and the
+-- manager UI can poll progress.
+
+BEGIN;
+
+-- ============================================================================
+-- TABLES
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.score_compute_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    month INTEGER NOT NULL CHECK (month BETWEEN 1 AND 12),
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'completed', 'completed_with_errors', 'failed')),
+    total_users INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_by UUID,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS public.score_compute_job_items (
+    job_id UUID NOT NULL REFERENCES public.score_compute_jobs(id) ON DELETE CASCADE,
+    user_id UUID NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'running', 'succeeded', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (job_id, user_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_score_compute_jobs_period
+    ON public.score_compute_jobs(year, month, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_score_compute_job_items_status
+    ON public.score_compute_job_items(job_id, status);
+
+-- ============================================================================
+-- PROGRESS
+-- ============================================================================
+
+-- One round trip for the polling UI: job row plus item counts by status
+CREATE OR REPLACE FUNCTION public.get_score_compute_job_progress(p_job_id UUID)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'job_id', j.id,
+        'month', j.month,
+        'year', j.year,
+        'status', j.status,
+        'total_users', j.total_users,
+        'pending', COUNT(i.user_id) FILTER (WHERE i.status = 'pending'),
+        'running', COUNT(i.user_id) FILTER (WHERE i.status = 'running'),
+        'succeeded', COUNT(i.user_id) FILTER (WHERE i.status = 'succeeded'),
+        'failed', COUNT(i.user_id) FILTER (WHERE i.status = 'failed'),
+        'last_error', j.last_error,
+        'started_at', j.started_at,
+        'finished_at', j.finished_at,
+        'updated_at', j.updated_at
+    )
+    FROM public.score_compute_jobs j
+    LEFT JOIN public.score_compute_job_items i ON i.job_id = j.id
+    WHERE j.id = p_job_id
+    GROUP BY j.id;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================================================
+-- ROW LEVEL SECURITY & PERMISSIONS
+-- ============================================================================
+
+ALTER TABLE public.score_compute_jobs ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.score_compute_job_items ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Authenticated users can manage score compute jobs" ON public.score_compute_jobs
+    FOR ALL TO authenticated USING (true) WITH CHECK (true);
+
+CREATE POLICY "Authenticated users can manage score compute job items" ON public.score_compute_job_items
+    FOR ALL TO authenticated USING (true) WITH CHECK (true);
+
+GRANT SELECT, INSERT, UPDATE ON public.score_compute_jobs TO authenticated;
+GRANT SELECT, INSERT, UPDATE ON public.score_compute_job_items TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_score_compute_job_progress(UUID) TO authenticated;
+
+COMMENT ON TABLE public.score_compute_jobs IS 'Month-close batch score recompute jobs';
+COMMENT ON TABLE public.score_compute_job_items IS 'Per-user status of a score compute job, used to resume interrupted runs';
+COMMENT ON FUNCTION public.get_score_compute_job_progress(UUID) IS 'Score compute job status with per-status item counts';
+
+COMMIT;
+
+-- Success message
+SELECT 'Score compute jobs created successfully!' as result;
@@ -0,0 +1,20 @@
+-- Migration: growth_report_cache
+-- Timestamp: 20261016130000
+-- Description: Key stored growth reports by the version of the data they were
+-- built from, so repeat views reuse the stored report instead of rebuilding.
+
+BEGIN;
+
+ALTER TABLE public.growth_reports
+    ADD COLUMN IF NOT EXISTS data_version TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_growth_reports_cache_lookup
+    ON public.growth_reports(user_id, report_type, period, data_version, created_at DESC)
+    WHERE data_version IS NOT NULL;
+
+COMMENT ON COLUMN public.growth_reports.data_version IS 'Fingerprint of the KPI and submission rows the report was built from';
+
+COMMIT;
+
+-- Success message
+SELECT 'Growth report cache column created successfully!' as result;
@@ -0,0 +1,84 @@
+-- Migration: form_drafts
+-- Timestamp: 20261016140000
+-- Description: Server copy of in-progress form drafts, saved as field-level
+-- patches. Each field records the draft version that last wrote it, so a patch
+-- based on an older version only conflicts when it touches a field that was
+-- saved since.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.form_drafts (
+    form_id TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    field_versions JSONB NOT NULL DEFAULT '{}'::jsonb,
+    version INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (form_id, owner)
+);
+
+CREATE INDEX IF NOT EXISTS idx_form_drafts_updated_at ON public.form_drafts(updated_at);
+
+COMMENT ON COLUMN public.form_drafts.field_versions IS 'Top-level field -> draft version that last wrote it';
+
+-- Apply a patch (changed fields merged in, removed fields dropped) in one statement.
+-- Returns { applied, version, conflicts } and, when a field in the patch was saved
+-- after p_base_version, applies nothing and also returns the current data so the
+-- caller can rebase and resend.
+CREATE OR REPLACE FUNCTION public.patch_form_draft(
+    p_form_id TEXT,
+    p_owner TEXT,
+    p_base_version INTEGER,
+    p_changed JSONB DEFAULT '{}'::jsonb,
+    p_removed TEXT[] DEFAULT '{}'
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_draft public.form_drafts%ROWTYPE;
+    v_fields TEXT[];
+    v_conflicts TEXT[];
+BEGIN
+    INSERT INTO public.form_drafts (form_id, owner)
+    VALUES (p_form_id, p_owner)
+    ON CONFLICT (form_id, owner) DO NOTHING;
+
+    SELECT * INTO v_draft
+    FROM public.form_drafts
+    WHERE form_id = p_form_id AND owner = p_owner
+    FOR UPDATE;
+
+    v_fields := ARRAY(SELECT jsonb_object_keys(COALESCE(p_changed, '{}'::jsonb))) || COALESCE(p_removed, '{}');
+
+    SELECT COALESCE(array_agg(f), '{}') INTO v_conflicts
+    FROM UNNEST(v_fields) AS f
+    WHERE COALESCE((v_draft.field_versions ->> f)::INTEGER, 0) > COALESCE(p_base_version, 0);
+
+    IF cardinality(v_conflicts) > 0 THEN
+        RETURN jsonb_build_object(
+            'applied', false,
+            'version', v_draft.version,
+            'data', v_draft.data,
+            'conflicts', to_jsonb(v_conflicts)
+        );
+    END IF;
+
+    UPDATE public.form_drafts
+    SET data = (data || COALESCE(p_changed, '{}'::jsonb)) - COALESCE(p_removed, '{}'),
+        field_versions = field_versions || COALESCE(
+            (SELECT jsonb_object_agg(f, v_draft.version + 1) FROM UNNEST(v_fields) AS f),
+            '{}'::jsonb
+        ),
+        version = v_draft.version + 1,
+        updated_at = NOW()
+    WHERE form_id = p_form_id AND owner = p_owner
+    RETURNING * INTO v_draft;
+
+    RETURN jsonb_build_object('applied', true, 'version', v_draft.version, 'conflicts', '[]'::jsonb);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
+
+-- Success message
+SELECT 'Form drafts table and patch function created successfully!' as result;
@@ -0,0 +1,175 @@
+-- Migration: phone_login_lookup
+-- Timestamp: 20261016150000
+-- Description: Indexed first-name + phone login. unified_users gets a stored,
+-- normalized copy of the phone number (same rules as normalizePhoneNumber in
+-- api-server.js) with a unique index, plus a first-name expression index, and
+-- authenticate_unified_user gains a phone branch that resolves a login with a
+-- single-row index lookup instead of an ILIKE scan over every active user.
+
+BEGIN;
+
+-- Mirrors normalizePhoneNumber: drop a +91 prefix, separators and a leading 0
+CREATE OR REPLACE FUNCTION public.normalize_login_phone(p_phone TEXT)
+RETURNS TEXT AS $$
+    SELECT NULLIF(
+        regexp_replace(
+            regexp_replace(
+                regexp_replace(COALESCE(p_phone, ''), '^\+91-?', ''),
+                '[\s\-\(\)]', '', 'g'
+            ),
+            '^0', ''
+        ),
+        ''
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+ALTER TABLE public.unified_users
+    ADD COLUMN IF NOT EXISTS phone_normalized TEXT
+    GENERATED ALWAYS AS (public.normalize_login_phone(phone)) STORED;
+
+-- phone is already UNIQUE, but two spellings of one number ("+91 98765 43210"
+-- and "09876543210") are not; fall back to a plain index if such rows exist so
+-- the migration still applies, and report them for cleanup.
+DO $$
+DECLARE
+    v_duplicates INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO v_duplicates
+    FROM (
+        SELECT phone_normalized
+        FROM public.unified_users
+        WHERE phone_normalized IS NOT NULL
+        GROUP BY phone_normalized
+        HAVING COUNT(*) > 1
+    ) dup;
+
+    IF v_duplicates = 0 THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_unified_users_phone_normalized
+            ON public.unified_users(phone_normalized)
+            WHERE phone_normalized IS NOT NULL;
+    ELSE
+        RAISE NOTICE '% normalized phone numbers are shared by several users; creating a non-unique index', v_duplicates;
+        CREATE INDEX IF NOT EXISTS idx_unified_users_phone_normalized
+            ON public.unified_users(phone_normalized)
+            WHERE phone_normalized IS NOT NULL;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS idx_unified_users_first_name
+    ON public.unified_users(lower(split_part(name, ' ', 1)));
+
+-- The return type changes (phone is added), so the old signature is replaced
+DROP FUNCTION IF EXISTS public.authenticate_unified_user(TEXT, TEXT);
+
+-- Email/password logins behave as before. First-name + phone logins match on the
+-- indexed normalized phone and first name only and do not open a user_sessions
+-- row: the API issues the token for that path itself.
+CREATE OR REPLACE FUNCTION public.authenticate_unified_user(
+    login_email TEXT DEFAULT NULL,
+    login_password TEXT DEFAULT NULL,
+    login_first_name TEXT DEFAULT NULL,
+    login_phone TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    user_id UUID,
+    name TEXT,
+    email TEXT,
+    phone TEXT,
+    role TEXT,
+    user_category TEXT,
+    department TEXT,
+    permissions JSONB,
+    dashboard_access TEXT[],
+    authentication_success BOOLEAN
+) AS $$
+DECLARE
+    user_record RECORD;
+    session_token TEXT;
+BEGIN
+    IF login_phone IS NOT NULL THEN
+        SELECT * INTO user_record
+        FROM public.unified_users u
+        WHERE u.phone_normalized = public.normalize_login_phone(login_phone)
+        AND lower(split_part(u.name, ' ', 1)) = lower(btrim(login_first_name))
+        AND u.status = 'active'
+        LIMIT 1;
+
+        IF user_record.id IS NOT NULL THEN
+            RETURN QUERY SELECT
+                user_record.id,
+                user_record.name::TEXT,
+                user_record.email::TEXT,
+                user_record.phone::TEXT,
+                user_record.role::TEXT,
+                user_record.user_category::TEXT,
+                user_record.department::TEXT,
+                user_record.permissions,
+                user_record.dashboard_access,
+                TRUE;
+        END IF;
+        RETURN;
+    END IF;
+
+    -- Find user by email
+    SELECT * INTO user_record
+    FROM public.unified_users u
+    WHERE u.email = login_email
+    AND u.status = 'active'
+    AND u.account_locked = FALSE;
+
+    -- Check if user exists and password matches (simplified - in production use proper hashing)
+    IF user_record.id IS NOT NULL AND user_record.password_hash = login_password THEN
+        session_token := gen_random_uuid()::TEXT;
+
+        INSERT INTO public.user_sessions (user_id, session_token, expires_at)
+        VALUES (user_record.id, session_token, NOW() + INTERVAL '24 hours');
+
+        UPDATE public.unified_users
+        SET
+            last_login = NOW(),
+            login_attempts = 0,
+            updated_at = NOW()
+        WHERE id = user_record.id;
+
+        RETURN QUERY SELECT
+            user_record.id,
+            user_record.name::TEXT,
+            user_record.email::TEXT,
+            user_record.phone::TEXT,
+            user_record.role::TEXT,
+            user_record.user_category::TEXT,
+            user_record.department::TEXT,
+            user_record.permissions,
+            user_record.dashboard_access,
+            TRUE;
+    ELSE
+        IF user_record.id IS NOT NULL THEN
+            UPDATE public.unified_users
+            SET
+                login_attempts = login_attempts + 1,
+                account_locked = CASE WHEN login_attempts >= 4 THEN TRUE ELSE FALSE END,
+                updated_at = NOW()
+            WHERE id = user_record.id;
+        END IF;
+
+        RETURN QUERY SELECT
+            NULL::UUID,
+            NULL::TEXT,
+            NULL::TEXT,
+            NULL::TEXT,
+            NULL::TEXT,
+            NULL::TEXT,
+            NULL::TEXT,
+            NULL::JSONB,
+            NULL::TEXT[],
+            FALSE;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON COLUMN public.unified_users.phone_normalized IS 'Phone with +91, separators and leading 0 removed; used by phone logins';
+
+COMMIT;
+
+-- Success message
+SELECT 'Phone login lookup indexes and authenticate_unified_user phone branch created successfully!' as result;
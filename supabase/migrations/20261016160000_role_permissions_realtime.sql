@@ -0,0 +1,34 @@
+-- Migration: role_permissions_realtime
+-- Timestamp: 20261016160000
+-- Description: Clients compile role_permissions once per session and reload it
+-- when it changes, so the table is published to Supabase realtime. A unique
+-- (role, resource, action) index keeps one row per rule for the compiled table.
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime')
+       AND NOT EXISTS (
+           SELECT 1 FROM pg_publication_tables
+           WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = 'role_permissions'
+       ) THEN
+        ALTER PUBLICATION supabase_realtime ADD TABLE public.role_permissions;
+    END IF;
+END $$;
+
+-- Keep the newest row of any duplicated rule before adding the unique index
+DELETE FROM public.role_permissions rp
+USING public.role_permissions newer
+WHERE rp.role = newer.role
+AND rp.resource = newer.resource
+AND rp.action = newer.action
+AND (COALESCE(rp.created_at, '-infinity'), rp.id) < (COALESCE(newer.created_at, '-infinity'), newer.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_role_permissions_rule
+    ON public.role_permissions(role, resource, action);
+
+COMMIT;
+
+-- Success message
+SELECT 'role_permissions published to realtime successfully!' as result;
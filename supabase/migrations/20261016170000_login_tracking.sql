@@ -0,0 +1,36 @@
+-- Migration: login_tracking
+-- Timestamp: 20261016170000
+-- Description: Login telemetry written in batches by the API server
+-- (POST /api/telemetry/logins). The unified-auth migration dropped the old
+-- login_tracking table; this one keys users by text so fallback accounts can be
+-- recorded too, and keeps the resolved location and device details as JSONB.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS public.login_tracking (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id TEXT,
+    email TEXT,
+    identifier TEXT,
+    user_type TEXT NOT NULL DEFAULT 'employee',
+    ip_address INET,
+    user_agent TEXT,
+    location_data JSONB,
+    device_info JSONB,
+    login_status TEXT NOT NULL CHECK (login_status IN ('success', 'failed', 'blocked')),
+    failure_reason TEXT,
+    login_timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_login_tracking_user_id ON public.login_tracking(user_id, login_timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_login_tracking_ip ON public.login_tracking(ip_address);
+CREATE INDEX IF NOT EXISTS idx_login_tracking_timestamp ON public.login_tracking(login_timestamp);
+
+-- Written by the API with the service role only
+ALTER TABLE public.login_tracking ENABLE ROW LEVEL SECURITY;
+
+COMMIT;
+
+-- Success message
+SELECT 'Login tracking table created successfully!' as result;
@@ -0,0 +1,36 @@
+-- Migration: apply_monthly_row_scores
+-- Timestamp: 20261016180000
+-- Description: Set-based write of batch-computed month scores. Takes one entry
+-- per user ({row_ids, computed_scores}) and updates the existing monthly rows in
+-- one UPDATE ... FROM, so it needs only UPDATE rights under RLS and never
+-- re-creates rows deleted while a month close was running.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.apply_monthly_row_scores(
+    p_scores JSONB,
+    p_computed_at TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE public.monthly_rows r
+    SET computed_scores = s.computed_scores,
+        last_computed_at = p_computed_at
+    FROM jsonb_to_recordset(p_scores) AS s(row_ids UUID[], computed_scores JSONB)
+    WHERE r.id = ANY(s.row_ids);
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION public.apply_monthly_row_scores(JSONB, TIMESTAMPTZ) TO authenticated;
+
+COMMENT ON FUNCTION public.apply_monthly_row_scores(JSONB, TIMESTAMPTZ) IS 'Writes computed_scores to existing monthly rows in bulk; returns the number of rows updated';
+
+COMMIT;
+
+-- Success message
+SELECT 'Monthly row score writer created successfully!' as result;
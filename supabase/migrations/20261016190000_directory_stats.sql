@@ -0,0 +1,173 @@
+-- Migration: directory_stats
+-- Timestamp: 20261016190000
+-- Description: Server-side figures for the employee and client directories so
+-- they no longer download whole tables. Client category, handler and the
+-- placeholder satisfaction score used to be derived in the browser; they are
+-- now columns of client_directory_entries, which the directory pages query
+-- and filter through the list contract.
+
+BEGIN;
+
+-- ============================================================================
+-- CLIENT DERIVED FIELDS
+-- ============================================================================
+
+-- Display name, as mapOnboardingRecordToClient builds it
+CREATE OR REPLACE FUNCTION public.client_directory_name(p_record JSONB)
+RETURNS TEXT AS $$
+    SELECT COALESCE(NULLIF(p_record->>'company_name', ''), NULLIF(p_record->>'business_name', ''), 'Unnamed Client');
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Same rules as ClientDirectory's categorizeClient. Records are read as JSONB
+-- because older client_onboarding tables lack some of these columns.
+CREATE OR REPLACE FUNCTION public.client_directory_category(p_record JSONB)
+RETURNS TEXT AS $$
+    WITH fields AS (
+        SELECT
+            CASE jsonb_typeof(p_record->'services_selected')
+                WHEN 'array' THEN jsonb_array_length(p_record->'services_selected')
+                WHEN 'string' THEN CASE WHEN p_record->>'services_selected' = '' THEN 0 ELSE 1 END
+                WHEN 'number' THEN CASE WHEN (p_record->>'services_selected')::NUMERIC = 0 THEN 0 ELSE 1 END
+                WHEN 'boolean' THEN CASE WHEN (p_record->>'services_selected')::BOOLEAN THEN 1 ELSE 0 END
+                WHEN 'object' THEN 1
+                ELSE 0
+            END AS services_count,
+            LOWER(COALESCE(NULLIF(p_record->>'business_type', ''), 'Standard')) AS type,
+            LOWER(public.client_directory_name(p_record)) AS name,
+            LOWER(COALESCE(NULLIF(p_record->>'business_description', ''), NULLIF(p_record->>'company_description', ''), 'No description available')) AS description
+    )
+    SELECT CASE
+        WHEN services_count > 3
+             AND (type LIKE '%corporate%' OR type LIKE '%hospital%' OR name LIKE '%hospital%' OR name LIKE '%corporate%')
+            THEN 'Enterprise'
+        WHEN services_count BETWEEN 2 AND 3 THEN 'Premium'
+        WHEN services_count = 1 THEN 'Standard'
+        WHEN name LIKE '%enterprise%' OR description LIKE '%enterprise%' THEN 'Enterprise'
+        WHEN name LIKE '%premium%' OR description LIKE '%premium%' THEN 'Premium'
+        ELSE 'Standard'
+    END
+    FROM fields;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Placeholder satisfaction score: the 32-bit string hash ClientDirectory
+-- computed from the client name, folded into 60-100
+CREATE OR REPLACE FUNCTION public.client_satisfaction_score(p_name TEXT)
+RETURNS INTEGER AS $$
+DECLARE
+    v_hash BIGINT := 0;
+    v_shifted BIGINT;
+    v_char TEXT;
+BEGIN
+    FOREACH v_char IN ARRAY regexp_split_to_array(COALESCE(p_name, ''), '')
+    LOOP
+        -- (hash << 5) wraps to 32 bits before the subtraction, as in JavaScript
+        v_shifted := ((v_hash * 32) % 4294967296 + 4294967296) % 4294967296;
+        IF v_shifted >= 2147483648 THEN v_shifted := v_shifted - 4294967296; END IF;
+        v_hash := ((v_shifted - v_hash + ASCII(v_char)) % 4294967296 + 4294967296) % 4294967296;
+        IF v_hash >= 2147483648 THEN v_hash := v_hash - 4294967296; END IF;
+    END LOOP;
+    RETURN ABS(v_hash % 41)::INTEGER + 60;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- client_onboarding rows with the fields the directory filters and charts on.
+-- security_invoker keeps the caller's row level security in force.
+CREATE OR REPLACE VIEW public.client_directory_entries
+WITH (security_invoker = true) AS
+SELECT
+    c.*,
+    public.client_directory_category(to_jsonb(c)) AS directory_category,
+    COALESCE(
+        (SELECT NULLIF(e.name, '') FROM public.employees e
+         WHERE e.id::TEXT = c.assigned_team OR e.name = c.assigned_team
+         ORDER BY e.created_at DESC
+         LIMIT 1),
+        NULLIF(c.assigned_team, ''),
+        'Unassigned'
+    ) AS directory_handler,
+    CASE WHEN c.submission_status = 'submitted' THEN 'active' ELSE 'pending' END AS directory_status,
+    public.client_satisfaction_score(public.client_directory_name(to_jsonb(c))) AS directory_satisfaction
+FROM public.client_onboarding c;
+
+-- ============================================================================
+-- DIRECTORY SUMMARIES
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_client_directory_stats()
+RETURNS JSONB AS $$
+    WITH entries AS (
+        SELECT
+            public.client_directory_name(to_jsonb(d)) AS name,
+            d.directory_category AS category,
+            d.directory_handler AS handler,
+            d.directory_status AS status,
+            d.directory_satisfaction AS satisfaction,
+            d.created_at
+        FROM public.client_directory_entries d
+    )
+    SELECT jsonb_build_object(
+        'total', (SELECT COUNT(*) FROM entries),
+        'active', (SELECT COUNT(*) FROM entries WHERE status = 'active'),
+        'avg_satisfaction', (SELECT COALESCE(ROUND(AVG(satisfaction)), 0) FROM entries),
+        'categories', (
+            SELECT jsonb_build_object(
+                'Enterprise', COUNT(*) FILTER (WHERE category = 'Enterprise'),
+                'Premium', COUNT(*) FILTER (WHERE category = 'Premium'),
+                'Marketing', COUNT(*) FILTER (WHERE category = 'Marketing'),
+                'Standard', COUNT(*) FILTER (WHERE category = 'Standard')
+            )
+            FROM entries
+        ),
+        'handlers', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('name', handler, 'count', total) ORDER BY latest DESC NULLS LAST)
+            FROM (
+                SELECT handler, COUNT(*) AS total, MAX(created_at) AS latest
+                FROM entries
+                GROUP BY handler
+            ) grouped
+        ), '[]'::JSONB),
+        'top_satisfaction', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('name', name, 'satisfaction', satisfaction, 'category', category))
+            FROM (
+                SELECT name, satisfaction, category
+                FROM entries
+                ORDER BY satisfaction DESC, created_at DESC NULLS LAST
+                LIMIT 10
+            ) top
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Cards and the department filter of the employee directory
+CREATE OR REPLACE FUNCTION public.get_employee_directory_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total', COUNT(*),
+        'with_phone', COUNT(*) FILTER (WHERE COALESCE(phone, '') <> ''),
+        'whatsapp_ready', COUNT(*) FILTER (WHERE LENGTH(phone) > 8),
+        'departments', COALESCE((
+            SELECT jsonb_agg(department ORDER BY department COLLATE "C")
+            FROM (
+                SELECT DISTINCT department FROM public.employees
+                WHERE COALESCE(department, '') <> ''
+            ) d
+        ), '[]'::JSONB)
+    )
+    FROM public.employees;
+$$ LANGUAGE sql STABLE;
+
+GRANT SELECT ON public.client_directory_entries TO authenticated;
+GRANT EXECUTE ON FUNCTION public.client_directory_category(JSONB) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.client_directory_name(JSONB) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.client_satisfaction_score(TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_client_directory_stats() TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_employee_directory_stats() TO authenticated;
+
+COMMENT ON VIEW public.client_directory_entries IS 'client_onboarding rows with the category, handler, status and satisfaction shown in the client directory';
+COMMENT ON FUNCTION public.get_client_directory_stats() IS 'Client directory cards and charts';
+COMMENT ON FUNCTION public.get_employee_directory_stats() IS 'Employee directory cards and department list';
+
+COMMIT;
+
+-- Success message
+SELECT 'Directory stats created successfully!' as result;
@@ -1,6 +1,8 @@
 // Test script to verify payment API validation
 const BASE_URL = 'http://localhost:8000';
 const submissionId = 'f1d77279-37db-49b9-bc56-dda5e8205b4a';
+// Session token of an Accounts, Operations Head or Super Admin user
+const AUTH_HEADER = { 'Authorization': `Bearer ${process.env.API_SESSION_TOKEN || ''}` };
 
 async function testPaymentAPIValidation() {
   console.log('🧪 Testing Payment API Validation\n');
@@ -11,7 +13,8 @@ async function testPaymentAPIValidation() {
     const response = await fetch(`${BASE_URL}/api/payments/${submissionId}`, {
       method: 'PUT',
       headers: {
-        'Content-Type': 'application/json'
+        'Content-Type': 'application/json',
+        ...AUTH_HEADER
       },
       body: JSON.stringify({
         paymentStatus: { 'client1': 'completed' }
@@ -38,7 +41,8 @@ async function testPaymentAPIValidation() {
     const response = await fetch(`${BASE_URL}/api/payments/${submissionId}`, {
       method: 'PUT',
       headers: {
-        'Content-Type': 'application/json'
+        'Content-Type': 'application/json',
+        ...AUTH_HEADER
       },
       body: JSON.stringify({
         paymentStatus: { 'client1': 'partial' },
@@ -65,7 +69,8 @@ async function testPaymentAPIValidation() {
     const response = await fetch(`${BASE_URL}/api/payments/${submissionId}`, {
       method: 'PUT',
       headers: {
-        'Content-Type': 'application/json'
+        'Content-Type': 'application/json',
+        ...AUTH_HEADER
       },
       body: JSON.stringify({
         paymentStatus: { 'client1': 'completed' },
@@ -95,7 +100,8 @@ async function testPaymentAPIValidation() {
     const response = await fetch(`${BASE_URL}/api/payments/${submissionId}`, {
       method: 'PUT',
       headers: {
-        'Content-Type': 'application/json'
+        'Content-Type': 'application/json',
+        ...AUTH_HEADER
       },
       body: JSON.stringify({
         paymentStatus: { 'client1': 'pending' }
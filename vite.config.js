@@ -2,6 +2,7 @@ import { defineConfig, loadEnv } from 'vite'
 import react from '@vitejs/plugin-react'
 import { fileURLToPath, URL } from 'node:url'
 import dotenv from 'dotenv'
+import { bundleBudget } from './scripts/bundleBudget.js'
 
 // Load environment variables
 dotenv.config()
@@ -12,7 +13,19 @@ export default defineConfig(({ mode }) => {
   const env = loadEnv(mode, process.cwd(), '')
   
   return {
-    plugins: [react()],
+    plugins: [
+      react(),
+      bundleBudget({
+        // Landing page per role, as routed by getDashboardPath in Router.jsx
+        roleEntries: {
+          'Super Admin': 'src/components/SuperAdminDashboard.jsx',
+          'Management / Admin': 'src/components/ManagerDashboard.jsx',
+          'Employee / Intern': 'src/components/EmployeeDashboard.jsx',
+          'Client': 'src/features/clients/components/ClientDashboardView.jsx',
+          'Public homepage': 'src/components/Homepage.jsx'
+        }
+      })
+    ],
     css: {
       postcss: './postcss.config.js',
       preprocessorOptions: {
@@ -51,40 +64,14 @@ export default defineConfig(({ mode }) => {
       rollupOptions: {
         output: {
           manualChunks: {
-            // Vendor chunks
+            // Vendor chunks. Pages are split per route by the lazy imports in
+            // src/components/routeModules.js, so they are not listed here.
             'react-vendor': ['react', 'react-dom'],
-            'supabase-vendor': ['@supabase/supabase-js'],
-            
-            // Dashboard chunks
-            'manager-dashboard': [
-              './src/components/ManagerDashboard.jsx',
-              './src/components/ManagerEditEmployee.jsx'
-            ],
-            'employee-dashboard': [
-              './src/components/EmployeePersonalDashboard.jsx',
-              './src/components/NewReportDashboard.jsx'
-            ],
-            'intern-dashboard': [
-              './src/components/InternDashboard.jsx'
-            ],
-            'agency-dashboard': [
-              './src/components/AgencyDashboard.jsx'
-            ],
-            'forms': [
-              './src/components/EmployeeForm.jsx',
-              './src/components/EmployeeForm/NewEmployeeForm.jsx'
-            ],
-
-
-            'auth': [
-              './src/features/auth/UnifiedAuthContext.jsx',
-              './src/features/auth/LoginForm.jsx'
-            ],
-
+            'supabase-vendor': ['@supabase/supabase-js']
           }
         }
       },
-      // Increase chunk size warning limit since we're intentionally splitting
+      // Chunk sizes are enforced by the bundle budget plugin instead
       chunkSizeWarningLimit: 1000
     },
     define: {